@@ -0,0 +1,90 @@
+"""fixtures for the benchmark suite, a seeded database and the data the hot paths chew on
+
+run it with `make benchmark`, see the Benchmarks section of the README"""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+import random
+from typing import Generator, List, Tuple
+from uuid import UUID
+
+import pytest
+import sqlmodel
+from sqlalchemy import Engine, func
+
+from chat_ui.datagen import DataGenSettings, generate_data
+from chat_ui.db import Jobs
+from chat_ui.fakebackend import VOCABULARY
+from chat_ui.models import JobStatus, RequestType
+
+# the seeded database, big enough that a missing index shows up
+SEED = DataGenSettings(users=500, seed=44)
+SEED_START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(count))
+
+
+def markdown_response(rng: random.Random, paragraphs: int) -> str:
+    """something that looks like what a model sends back, with headings, lists and code"""
+    parts = []
+    for index in range(paragraphs):
+        parts.append(f"## Part {index}\n\n{words(rng, 60)}\n")
+        parts.append("\n".join(f"- **{words(rng, 2)}** {words(rng, 8)}" for _ in range(4)))
+        parts.append(f"\n```python\ndef part_{index}():\n    return {index!r}\n```\n")
+    return "\n".join(parts)
+
+
+def make_job(rng: random.Random, userid: UUID, sessionid: UUID, created: datetime, response_words: int) -> Jobs:
+    return Jobs(
+        userid=userid,
+        sessionid=sessionid,
+        client_ip="127.0.0.1",
+        prompt=words(rng, 20),
+        response=words(rng, response_words),
+        request_type=RequestType.Plain,
+        status=JobStatus.Complete.value,
+        created=created,
+        updated=created + timedelta(seconds=5),
+        runtime=5.0,
+    )
+
+
+@pytest.fixture(name="seeded_engine", scope="session")
+def get_seeded_engine(tmp_path_factory: pytest.TempPathFactory) -> Generator[Tuple[Engine, UUID, UUID], None, None]:
+    """a generated sqlite file like the real one, and its busiest user and session"""
+    path: Path = tmp_path_factory.mktemp("benchmarks") / "chatui.sqlite3"
+    engine = sqlmodel.create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    generate_data(engine, SEED)
+    with sqlmodel.Session(engine) as session:
+        # the session with the most jobs, the one that'd be slowest to poll
+        userid, sessionid, _ = session.exec(
+            sqlmodel.select(Jobs.userid, Jobs.sessionid, func.count(Jobs.id))
+            .group_by(sqlmodel.col(Jobs.userid), sqlmodel.col(Jobs.sessionid))
+            .order_by(func.count(Jobs.id).desc())
+        ).first() or (None, None, 0)
+    assert userid is not None and sessionid is not None
+    yield engine, userid, sessionid
+    engine.dispose()
+
+
+@pytest.fixture(name="job_rows", scope="session")
+def get_job_rows() -> List[Jobs]:
+    """a session's worth of rows, more than anyone would scroll through"""
+    rng = random.Random(1)
+    userid, sessionid = UUID(int=1), UUID(int=2)
+    return [make_job(rng, userid, sessionid, SEED_START + timedelta(minutes=index), 50) for index in range(1000)]
+
+
+@pytest.fixture(name="long_history", scope="session")
+def get_long_history() -> List[Jobs]:
+    """a conversation that's well over the token limit, so check_history_tokens has to trim it"""
+    rng = random.Random(2)
+    userid, sessionid = UUID(int=1), UUID(int=2)
+    return [make_job(rng, userid, sessionid, SEED_START + timedelta(minutes=index), 300) for index in range(200)]
+
+
+@pytest.fixture(name="large_markdown", scope="session")
+def get_large_markdown() -> str:
+    return markdown_response(random.Random(3), 50)
@@ -0,0 +1,153 @@
+"""benchmark turning job rows into the JSON the list endpoints and websocket send
+
+compares the old path, where each row was validated into a Job, re-validated by FastAPI and
+dumped with json, with what the endpoints do now
+
+run it with `poetry run python benchmarks/serialization.py`
+"""
+
+from datetime import UTC, datetime
+import json
+import time
+from typing import Any, Callable, List
+from uuid import uuid4
+
+import click
+from pydantic import TypeAdapter
+
+from chat_ui.db import Jobs
+from chat_ui.models import Job, JobDetail, JobStatus, RequestType, WebSocketMessageType, WebSocketResponse
+from chat_ui.utils import FastJSONResponse
+
+
+def make_rows(count: int) -> List[Jobs]:
+    userid = uuid4()
+    sessionid = uuid4()
+    return [
+        Jobs(
+            userid=userid,
+            sessionid=sessionid,
+            client_ip="127.0.0.1",
+            prompt=f"prompt {index}",
+            response=f"response **{index}**",
+            request_type=RequestType.Plain,
+            status=JobStatus.Complete.value,
+            created=datetime.now(UTC),
+            updated=datetime.now(UTC),
+        )
+        for index in range(count)
+    ]
+
+
+def legacy_job(row: Jobs) -> Job:
+    """how Job.from_jobs used to build them"""
+    return Job(
+        **{
+            "id": row.id.hex,
+            "status": row.status,
+            "created": row.created,
+            "updated": row.updated,
+            "sessionid": row.sessionid,
+        }
+    )
+
+
+def legacy_job_detail(row: Jobs) -> JobDetail:
+    """how JobDetail.from_jobs used to build them"""
+    return JobDetail(
+        **{
+            "id": row.id.hex,
+            "userid": row.userid.hex,
+            "status": row.status,
+            "created": row.created,
+            "updated": row.updated,
+            "prompt": row.prompt,
+            "response": row.response,
+            "runtime": row.runtime,
+            "metadata": row.job_metadata,
+            "request_type": row.request_type,
+            "sessionid": row.sessionid,
+        }
+    )
+
+
+jobs_adapter = TypeAdapter(List[Job])
+job_details_adapter = TypeAdapter(List[JobDetail])
+
+
+def fastapi_json(adapter: TypeAdapter[Any], content: List[Any]) -> bytes:
+    """what FastAPI does with a List[...] return value and the default JSONResponse"""
+    validated = adapter.validate_python(content)
+    return json.dumps(
+        adapter.dump_python(validated, mode="json"),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def before_jobs(rows: List[Jobs]) -> bytes:
+    return fastapi_json(jobs_adapter, [legacy_job(row) for row in rows])
+
+
+def after_jobs(rows: List[Jobs]) -> bytes:
+    return bytes(FastJSONResponse([Job.dict_from_jobs(row) for row in rows]).body)
+
+
+def before_job_details(rows: List[Jobs]) -> bytes:
+    return fastapi_json(job_details_adapter, [legacy_job_detail(row) for row in rows])
+
+
+def after_job_details(rows: List[Jobs]) -> bytes:
+    return bytes(FastJSONResponse([JobDetail.from_jobs(row, None).model_dump() for row in rows]).body)
+
+
+def before_websocket(rows: List[Jobs]) -> bytes:
+    return WebSocketResponse(
+        message=WebSocketMessageType.Jobs.value, payload=[legacy_job(row) for row in rows]
+    ).model_dump_json().encode("utf-8")
+
+
+def after_websocket(rows: List[Jobs]) -> bytes:
+    return WebSocketResponse(
+        message=WebSocketMessageType.Jobs.value, payload=[Job.from_jobs(row, None) for row in rows]
+    ).as_message().encode("utf-8")
+
+
+def rows_per_second(func: Callable[[List[Jobs]], bytes], rows: List[Jobs], seconds: float) -> float:
+    func(rows)  # warm up
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        func(rows)
+        count += 1
+    return count * len(rows) / (time.perf_counter() - start)
+
+
+BENCHMARKS = {
+    "job list": (before_jobs, after_jobs),
+    "job detail list": (before_job_details, after_job_details),
+    "websocket jobs": (before_websocket, after_websocket),
+}
+
+
+@click.command()
+@click.option("--rows", default=1000, help="Rows in each response")
+@click.option("--seconds", default=2.0, help="How long to run each benchmark")
+def main(rows: int, seconds: float) -> None:
+    """print rows per second for each serialization path, before and after"""
+    job_rows = make_rows(rows)
+    for name, (before, after) in BENCHMARKS.items():
+        # they have to produce the same thing for the comparison to mean anything
+        assert json.loads(before(job_rows)) == json.loads(after(job_rows)), name
+        before_rate = rows_per_second(before, job_rows, seconds)
+        after_rate = rows_per_second(after, job_rows, seconds)
+        print(
+            f"{name:<16} before {before_rate:>12,.0f} rows/s  after {after_rate:>12,.0f} rows/s  "
+            f"{after_rate / before_rate:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""benchmarks for the code that runs on every request, every poll or every job"""
+
+import asyncio
+from datetime import UTC, datetime
+import json
+from typing import Any, Dict, Generator, List, Tuple
+from uuid import UUID
+
+from fastapi import WebSocket
+from fastapi.testclient import TestClient
+from loguru import logger
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy import Engine
+import sqlmodel
+
+from chat_ui import app, get_session
+from chat_ui.backgroundpoller import BackgroundJob, BackgroundPoller, rough_history_tokens
+from chat_ui.db import Jobs
+from chat_ui.logs import serialize
+from chat_ui.models import Job, JobDetail, WebSocketMessage, WebSocketMessageType, WebSocketResponse
+from chat_ui.utils import html_from_response
+from chat_ui.websocket_handlers import websocket_jobs
+
+
+def test_rough_history_tokens(benchmark: BenchmarkFixture, long_history: List[Jobs]) -> None:
+    tokens = benchmark(rough_history_tokens, long_history)
+    assert len(tokens) == len(long_history)
+
+
+def test_check_history_tokens(benchmark: BenchmarkFixture, long_history: List[Jobs]) -> None:
+    def check() -> int:
+        # it trims the history in place, so each round needs its own copy
+        job = BackgroundJob.from_jobs(long_history[-1])
+        job.history = list(long_history)
+        _, _, total = BackgroundPoller.check_history_tokens(job)
+        return total
+
+    assert benchmark(check) <= 2048
+
+
+def test_job_from_jobs(benchmark: BenchmarkFixture, job_rows: List[Jobs]) -> None:
+    jobs = benchmark(lambda: [Job.from_jobs(row, None) for row in job_rows])
+    assert len(jobs) == len(job_rows)
+
+
+def test_job_detail_from_jobs(benchmark: BenchmarkFixture, job_rows: List[Jobs]) -> None:
+    details = benchmark(lambda: [JobDetail.from_jobs(row, None) for row in job_rows])
+    assert len(details) == len(job_rows)
+
+
+def test_html_from_response(benchmark: BenchmarkFixture, large_markdown: str) -> None:
+    html = benchmark(html_from_response, large_markdown)
+    assert "<h2>" in html
+
+
+def test_websocket_response_as_message(benchmark: BenchmarkFixture, job_rows: List[Jobs]) -> None:
+    response = WebSocketResponse(
+        message=WebSocketMessageType.Jobs.value, payload=[Job.from_jobs(row, None) for row in job_rows]
+    )
+    message = benchmark(response.as_message)
+    assert len(json.loads(message)["payload"]) == len(job_rows)
+
+
+def test_logs_serialize(benchmark: BenchmarkFixture) -> None:
+    records: List[Dict[str, Any]] = []
+    handler = logger.add(lambda message: records.append(dict(message.record)), level="DEBUG")
+    try:
+        logger.bind(userid=UUID(int=1), job_id=UUID(int=2), history_tokens=[("a", 4)] * 20).debug("Job history")
+    finally:
+        logger.remove(handler)
+    result = benchmark(serialize, records[0])
+    assert json.loads(result)["message"] == "Job history"
+
+
+def test_websocket_jobs_query(benchmark: BenchmarkFixture, seeded_engine: Tuple[Engine, UUID, UUID]) -> None:
+    """the query behind the web UI's poll for a session's jobs"""
+    engine, userid, sessionid = seeded_engine
+    message = WebSocketMessage(
+        userid=userid,
+        message=WebSocketMessageType.Jobs.value,
+        payload=json.dumps({"sessionid": str(sessionid)}),
+    )
+    # it only looks at the websocket if something goes wrong
+    websocket: WebSocket = None  # type: ignore[assignment]
+    loop = asyncio.new_event_loop()
+
+    def poll() -> WebSocketResponse:
+        with sqlmodel.Session(engine) as session:
+            return loop.run_until_complete(websocket_jobs(message, session, websocket))
+
+    try:
+        response = benchmark(poll)
+    finally:
+        loop.close()
+    assert response.message == WebSocketMessageType.Jobs
+    assert isinstance(response.payload, list) and len(response.payload) > 0
+
+
+def test_jobs_endpoint(benchmark: BenchmarkFixture, seeded_engine: Tuple[Engine, UUID, UUID]) -> None:
+    """the whole /jobs request, query and serialization"""
+    engine, userid, sessionid = seeded_engine
+
+    def get_session_override() -> Generator[sqlmodel.Session, None, None]:
+        with sqlmodel.Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+    try:
+        res = benchmark(
+            client.get,
+            "/jobs",
+            params={
+                "userid": str(userid),
+                "sessionid": str(sessionid),
+                "since": datetime(2000, 1, 1, tzinfo=UTC).timestamp(),
+            },
+        )
+    finally:
+        app.dependency_overrides.clear()
+    assert res.status_code == 200
+    assert len(res.json()) > 0
@@ -1,35 +1,39 @@
 """chat emulator using fastapi"""
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, UTC
 import os
 import os.path
 import random
+import secrets
 import string
 from pathlib import Path
 import sys
 
 
-from typing import Annotated, Any, AsyncGenerator, Generator, List, Optional, Sequence
+from typing import Annotated, Any, AsyncGenerator, Dict, Generator, List, Optional, Sequence, Set, Union
 from uuid import UUID
 from fastapi import (
     Depends,
     FastAPI,
     HTTPException,
     Header,
+    Query,
     Request,
     WebSocket,
     WebSocketDisconnect,
 )
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import Response, StreamingResponse
 from fastapi.websockets import WebSocketState
 from loguru import logger
 
-from sqlmodel import Session, or_, select
+from sqlmodel import Session, col, or_, select
 import sqlmodel
 
-from sqlalchemy import func
+from sqlalchemy import ColumnElement, func
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import defer
 import sqlalchemy.engine
 from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
@@ -38,70 +42,89 @@ from opentelemetry import trace
 
 from chat_ui.backgroundpoller import BackgroundPoller
 from chat_ui.enums import Urls
+from chat_ui.jobevents import jobevents
 from chat_ui.websocket_handlers import (
-    websocket_delete,
-    websocket_feedback,
-    websocket_jobs,
-    websocket_resubmit,
-    websocket_waiting,
+    negotiate_protocol,
+    websocket_dispatch,
 )
 
-from .config import Config
-from .db import ChatUiDBSession, JobAnalysis, JobFeedback, Jobs, Users, migrate_database
-from .logs import sink
+from .config import get_config
+from .db import ChatUiDBSession, JobAnalysis, JobFeedback, Jobs, Users, migrate_database, requeue_jobs
+from .logs import configure_logging
 
 from .forms import SessionUpdateForm, NewJobForm, UserDetail, UserForm
 from chat_ui.models import (
     AnalyzeForm,
     Job,
     JobDetail,
+    JobEvent,
+    JobEventType,
     JobStatus,
     LogMessages,
     WebSocketMessage,
     WebSocketMessageType,
     WebSocketResponse,
+    WebSocketStats,
 )
-from chat_ui.utils import get_client_ip, get_model_name, html_from_response
+from chat_ui.utils import (
+    RENDERER_VERSION,
+    FastJSONResponse,
+    etag_matches,
+    get_client_ip,
+    get_model_name,
+    make_etag,
+    render_job_response,
+    response_html_cache,
+    sse_message,
+)
+from chat_ui.statics import StaticAssets
+from chat_ui.websocketmanager import WebSocketManager
 
-logger.remove()
-logger.add(sink=sink)
+configure_logging(get_config())
 
 if "pytest" in sys.modules:
     connect_args = {"check_same_thread": False}
 else:
     connect_args = {}
-sqlite_url = f"sqlite:///{Config().db_path}"
+sqlite_url = f"sqlite:///{get_config().db_path}"
 engine = sqlmodel.create_engine(sqlite_url, echo=False, connect_args=connect_args)
+websocketmanager = WebSocketManager.from_config(get_config())
+# these are read once, so changes to the files need a restart
+staticassets = StaticAssets(Path(os.path.dirname(__file__)))
+
+# most jobs you can ask for by id in one request
+JOB_DETAILS_MAX = 200
 
 
 def startup_check_outstanding_jobs(engine: sqlalchemy.engine.Engine) -> None:
-    logger.info("Checking for outstanding jobs on startup and setting them to error status")
+    """put the running jobs a dead poller left behind back in the queue
+
+    the ones other pollers still hold are left alone"""
+    logger.info("Checking for outstanding jobs on startup and requeueing abandoned ones")
     with Session(engine) as session:
-        jobs = session.exec(select(Jobs).where(Jobs.status == JobStatus.Running.value)).all()
-        for job in jobs:
-            logger.warning("Job was running, setting to error", job_id=job.id)
-            job.status = JobStatus.Error.value
-            job.response = "Server restarted, please try this again"
-            job.updated = datetime.now(UTC)
-            session.add(job)
-        session.commit()
+        requeue_jobs(session, max_attempts=get_config().job_max_attempts)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
     """runs the background poller as the app is running"""
 
-    if Config().enable_do_bad_things_mode == "1":
+    if get_config().enable_do_bad_things_mode == "1":
         logger.warning("Do bad things mode is enabled!")
 
+    poller: Optional[BackgroundPoller] = None
     if "pytest" not in sys.modules:
         # create all the tables
         sqlmodel.SQLModel.metadata.create_all(engine)
         migrate_database(engine)
-        startup_check_outstanding_jobs(engine)
 
-        t = BackgroundPoller(engine, get_model_name())
-        t.start()
+        # with it turned off, `chat-ui worker` processes run the jobs and own the ones that are running
+        if get_config().enable_background_poller:
+            startup_check_outstanding_jobs(engine)
+            poller = BackgroundPoller(engine, get_model_name())
+            poller.start()
+        else:
+            logger.info("Background poller is disabled, jobs need a chat-ui worker")
     logger.info("Prechecks done, starting app")
 
     # wait for FastAPI to do its thing
@@ -109,8 +132,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
 
     if "pytest" not in sys.modules:
         logger.info("Shutting down app")
-        t.message = "stop"
-        t.join()
+    if poller is not None:
+        poller.stop(get_config().shutdown_drain_timeout)
 
 
 app = FastAPI(lifespan=lifespan)
@@ -122,6 +145,16 @@ app.add_middleware(
 app.add_middleware(GZipMiddleware)
 
 
+def check_admin_password(admin_password: str) -> None:
+    """raises if the admin password isn't set or doesn't match"""
+    expected = get_config().admin_password
+    if expected is None:
+        raise HTTPException(500, "Admin password not available")
+
+    if not secrets.compare_digest(expected.encode("utf-8"), admin_password.encode("utf-8")):
+        raise HTTPException(403, "Admin password incorrect")
+
+
 def get_session() -> Generator[Session, None, None]:
     with Session(engine) as session:
         if "pytest" not in sys.modules:
@@ -129,30 +162,22 @@ def get_session() -> Generator[Session, None, None]:
         yield session
 
 
-async def staticfile(filename: str, path: str) -> FileResponse:
-    """returns a file from the path dir"""
-    filepath = Path(os.path.join(os.path.dirname(__file__), path, filename))
-    if not filepath.exists():
-        raise HTTPException(status_code=404, detail="Item not found")
-    return FileResponse(filepath)
-
-
 @app.get("/img/{filename}")
-async def img(filename: str) -> FileResponse:
-    """returns the contents of html/index.html as a HTMLResponse object"""
-    return await staticfile(filename, "img/")
+async def img(filename: str, request: Request) -> Response:
+    """returns a file from the img dir"""
+    return staticassets.response(request, f"/img/{filename}")
 
 
 @app.get("/css/{filename}")
-async def css(filename: str) -> FileResponse:
+async def css(filename: str, request: Request) -> Response:
     """returns a file from the css dir"""
-    return await staticfile(filename, "css/")
+    return staticassets.response(request, f"/css/{filename}")
 
 
 @app.get("/js/{filename}")
-async def js(filename: str) -> FileResponse:
+async def js(filename: str, request: Request) -> Response:
     """returns a file from the js dir"""
-    return await staticfile(filename, "js/")
+    return staticassets.response(request, f"/js/{filename}")
 
 
 @app.post(Urls.User)
@@ -215,78 +240,300 @@ async def create_job(
     return Job.from_jobs(newjob, None)
 
 
-@app.get(Urls.Jobs)
+@app.post(Urls.JobBulk, response_model=List[Job], response_class=FastJSONResponse)
+async def create_jobs(
+    jobs: List[NewJobForm],
+    request: Request,
+    session: Session = Depends(get_session),
+) -> FastJSONResponse:
+    """create a list of jobs in one transaction, either they're all created or none are"""
+    max_jobs = get_config().job_bulk_max
+    if len(jobs) > max_jobs:
+        raise HTTPException(status_code=422, detail=f"Too many jobs, the limit is {max_jobs}")
+    client_ip = get_client_ip(request)
+
+    newjobs = [Jobs.from_newjobform(job, client_ip=client_ip) for job in jobs]
+    session.add_all(newjobs)
+    session.commit()
+    # reload them all in one query rather than a refresh each, so they serialize the way create_job's does
+    session.exec(select(Jobs).where(col(Jobs.id).in_([newjob.id for newjob in newjobs]))).all()
+    result = [Job.dict_from_jobs(newjob) for newjob in newjobs]
+    for newjob in newjobs:
+        logger.info(LogMessages.JobNew, src_ip=client_ip, **newjob.model_dump(round_trip=False, warnings=False))
+    trace.get_current_span().set_attribute("jobs", len(newjobs))
+    return FastJSONResponse(result)
+
+
+@app.get(Urls.Jobs, response_model=List[Job], response_class=FastJSONResponse)
 async def jobs(
+    request: Request,
     userid: UUID,
     sessionid: UUID | None = None,
     since: float | None = None,
     session: Session = Depends(get_session),
-) -> List[Job]:
+) -> Response:
     """query the jobs for a given userid
 
     extra filters:
 
     - sessionid (a given chat session id)
     - since (a unix timestamp, only return jobs created/updated since this time)
+
+    send the ETag back in If-None-Match to get a 304 if nothing's changed
     """
 
     trace.get_current_span().set_attribute("userid", str(userid))
-    query = select(Jobs).where(Jobs.userid == userid)
+    filters: List[ColumnElement[bool]] = [col(Jobs.userid) == userid]
     if sessionid is not None:
-        query = query.where(Jobs.sessionid == sessionid)
+        filters.append(col(Jobs.sessionid) == sessionid)
     if since is not None:
-        query = query.where(
+        filters.append(
             or_(
                 (Jobs.updated is not None and Jobs.updated >= datetime.fromtimestamp(since, UTC)),
                 Jobs.created >= datetime.fromtimestamp(since, UTC),
             )
         )
-    return [Job.from_jobs(job, None) for job in session.exec(query).all()]
+    # every change to a job sets updated, so this changes whenever the list would
+    count, max_created, max_updated = session.exec(
+        select(func.count(col(Jobs.id)), func.max(Jobs.created), func.max(Jobs.updated)).where(*filters)
+    ).one()
+    etag = make_etag(Urls.Jobs, userid, sessionid, since, count, max_created, max_updated)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), {etag}):
+        return Response(status_code=304, headers=headers)
+    # the jobs are built straight from the rows, so there's no need for FastAPI to validate them again
+    return FastJSONResponse(
+        [Job.dict_from_jobs(job) for job in session.exec(select(Jobs).where(*filters)).all()], headers=headers
+    )
 
 
-@app.get(f"{Urls.Jobs}/{{userid}}/{{job_id}}")
-async def job_detail(
-    userid: UUID,
-    job_id: UUID,
-    session: Session = Depends(get_session),
-) -> JobDetail:
-    trace.get_current_span().set_attribute("userid", str(userid))
-    trace.get_current_span().set_attribute("job_id", str(job_id))
+def get_response_html(session: Session, job: Jobs) -> str:
+    """the job's response as HTML, from the cache, the database, or rendering it if we have to"""
+    html = response_html_cache.get(job)
+    if html is not None:
+        return html
+    if job.response_html is not None and job.response_html_version == RENDERER_VERSION:
+        html = job.response_html
+    else:
+        render_job_response(job)
+        html = job.response_html or ""
+        if job.status == JobStatus.Complete.value:
+            # backfill jobs that finished before we stored the HTML, or were rendered by an older version,
+            # the caller commits it if the session's dirty
+            session.add(job)
+    response_html_cache.put(job, html)
+    return html
+
+
+def get_job_detail(session: Session, userid: UUID, job_id: UUID) -> JobDetail:
+    """the rendered job and its feedback, raises a 404 if it's not there"""
     try:
-        query = select(Jobs).where(Jobs.userid == userid, Jobs.id == job_id)
+        # the stored HTML's only loaded if it's not in the in-memory cache
+        query = select(Jobs).where(Jobs.userid == userid, Jobs.id == job_id).options(defer(Jobs.response_html))  # type: ignore[arg-type]
         job = session.exec(query).one()
-        # convert the output into HTML
         # technically this'll be caught as an exception, but it doesn't hurt to be explicit
-        if job is not None:
-            if job.response is not None:
-                job.response = html_from_response(job.response)
-        else:
+        if job is None:
             raise HTTPException(404)
-        session.reset()
         feedback = JobFeedback.get_feedback(session, job_id)
-        return JobDetail.from_jobs(job, feedback)
+        detail = JobDetail.from_jobs(job, feedback)
+        if job.response is not None:
+            detail.response = get_response_html(session, job)
+        if session.dirty:
+            session.commit()
+        session.reset()
+        return detail
     except NoResultFound:
         raise HTTPException(status_code=404, detail="Item not found")
 
 
+@app.get(f"{Urls.Jobs}/{{userid}}", response_model=List[Dict[str, Any]], response_class=FastJSONResponse)
+async def job_details(
+    userid: UUID,
+    job_ids: Annotated[Optional[List[UUID]], Query(max_length=JOB_DETAILS_MAX)] = None,
+    sessionid: Optional[UUID] = None,
+    fields: Optional[str] = None,
+    session: Session = Depends(get_session),
+) -> FastJSONResponse:
+    """the JobDetail for a list of job_ids or a whole chat session, oldest first
+
+    fields is an optional comma-separated list of the JobDetail fields to return, id's always included
+    """
+    trace.get_current_span().set_attribute("userid", str(userid))
+    if not job_ids and sessionid is None:
+        raise HTTPException(status_code=422, detail="Specify job_ids or a sessionid")
+    include: Optional[Set[str]] = None
+    if fields is not None:
+        include = {field.strip() for field in fields.split(",") if field.strip()} | {"id"}
+        unknown = include - set(JobDetail.model_fields)
+        if unknown:
+            raise HTTPException(status_code=422, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    # one query for the jobs and their feedback
+    query = (
+        select(Jobs, JobFeedback)
+        .join(JobFeedback, JobFeedback.jobid == Jobs.id, isouter=True)
+        .where(Jobs.userid == userid)
+        .options(defer(Jobs.response_html))  # type: ignore[arg-type]
+        .order_by(Jobs.created)  # type: ignore[arg-type]
+    )
+    if job_ids:
+        query = query.where(col(Jobs.id).in_(job_ids))
+    if sessionid is not None:
+        query = query.where(Jobs.sessionid == sessionid)
+
+    results: Dict[UUID, JobDetail] = {}
+    for job, feedback in session.exec(query).all():
+        if job.id in results:
+            continue
+        detail = JobDetail.from_jobs(job, feedback)
+        if job.response is not None and (include is None or "response" in include):
+            detail.response = get_response_html(session, job)
+        results[job.id] = detail
+    if session.dirty:
+        session.commit()
+    session.reset()
+    return FastJSONResponse([detail.model_dump(include=include) for detail in results.values()])
+
+
+def get_job_detail_etag(session: Session, userid: UUID, job_id: UUID) -> Optional[str]:
+    """the validator for a job's detail, without loading it, None if the job doesn't exist"""
+    row = session.exec(
+        select(Jobs.status, Jobs.updated, func.max(JobFeedback.created))
+        .join(JobFeedback, JobFeedback.jobid == Jobs.id, isouter=True)
+        .where(Jobs.userid == userid, Jobs.id == job_id)
+        .group_by(Jobs.id)
+    ).first()
+    if row is None:
+        return None
+    return make_etag("job", userid, job_id, RENDERER_VERSION, *row)
+
+
+@app.get(f"{Urls.Jobs}/{{userid}}/{{job_id}}", response_model=JobDetail)
+async def job_detail(
+    request: Request,
+    response: Response,
+    userid: UUID,
+    job_id: UUID,
+    session: Session = Depends(get_session),
+) -> Union[JobDetail, Response]:
+    trace.get_current_span().set_attribute("userid", str(userid))
+    trace.get_current_span().set_attribute("job_id", str(job_id))
+    etag = get_job_detail_etag(session, userid, job_id)
+    if etag is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), {etag}):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return get_job_detail(session, userid, job_id)
+
+
+@app.get(f"{Urls.Jobs}/{{userid}}/{{job_id}}/wait")
+async def job_wait(
+    userid: UUID,
+    job_id: UUID,
+    timeout: Annotated[float, Query(ge=0)] = 30.0,
+    session: Session = Depends(get_session),
+) -> JobDetail:
+    """long-poll for a job, returns as soon as it's finished or after timeout seconds with whatever state it's in"""
+    trace.get_current_span().set_attribute("userid", str(userid))
+    trace.get_current_span().set_attribute("job_id", str(job_id))
+    config = get_config()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + min(timeout, config.job_wait_max_timeout)
+    # subscribe before looking, so we can't miss an update between the read and the wait
+    with jobevents.subscription(job_id) as events:
+        detail = get_job_detail(session, userid, job_id)
+        recheck = loop.time() + config.job_wait_recheck_interval
+        while not JobStatus(detail.status).is_terminal():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return detail
+            try:
+                event = await asyncio.wait_for(events.get(), timeout=min(remaining, recheck - loop.time()))
+                # tokens and the job starting don't change what we'd send back, so they're not worth a read
+                if event.status is None or not JobStatus(event.status).is_terminal():
+                    continue
+            except asyncio.TimeoutError:
+                pass
+            # it's finished, or it's time to check whether another process changed it
+            detail = get_job_detail(session, userid, job_id)
+            recheck = loop.time() + config.job_wait_recheck_interval
+        return detail
+
+
+async def job_event_stream(
+    bind: Union[sqlalchemy.engine.Engine, sqlalchemy.engine.Connection], userid: UUID, job_id: UUID
+) -> AsyncGenerator[str, None]:
+    """the server-sent events for a job, finishing with the rendered job once it's done
+
+    it has its own session, the request's one is closed once the response starts"""
+    config = get_config()
+    with Session(bind) as session, jobevents.subscription(job_id) as events:
+        detail = get_job_detail(session, userid, job_id)
+        status = detail.status
+        event = JobEvent(event=JobEventType.Status, job_id=job_id, status=status)
+        yield sse_message(JobEventType.Status, event.model_dump_json())
+        while not JobStatus(status).is_terminal():
+            try:
+                event = await asyncio.wait_for(events.get(), timeout=config.job_wait_recheck_interval)
+            except asyncio.TimeoutError:
+                # check whether another process changed it, and keep the connection alive through proxies
+                detail = get_job_detail(session, userid, job_id)
+                if detail.status == status:
+                    yield ": keepalive\n\n"
+                    continue
+                event = JobEvent(event=JobEventType.Status, job_id=job_id, status=detail.status)
+            if event.event == JobEventType.Status and event.status is not None:
+                status = event.status
+            yield sse_message(event.event, event.model_dump_json())
+        detail = get_job_detail(session, userid, job_id)
+    yield sse_message(JobEventType.Complete, detail.model_dump_json())
+
+
+@app.get(f"{Urls.Jobs}/{{userid}}/{{job_id}}/events")
+async def job_events(
+    userid: UUID,
+    job_id: UUID,
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    """stream a job's status changes (and tokens, if the backend's streaming) as server-sent events"""
+    trace.get_current_span().set_attribute("userid", str(userid))
+    trace.get_current_span().set_attribute("job_id", str(job_id))
+    # 404 now, rather than halfway through a stream
+    get_job_detail(session, userid, job_id)
+    return StreamingResponse(
+        job_event_stream(session.get_bind(), userid, job_id),
+        media_type="text/event-stream",
+        # an explicit content-encoding stops GZipMiddleware buffering the stream, and X-Accel-Buffering stops nginx
+        headers={"Cache-Control": "no-cache", "Content-Encoding": "identity", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(
     websocket: WebSocket,
     session: Session = Depends(get_session),
 ) -> None:
-    # await websocketmanager.connect(websocket)
-    await websocket.accept()
+    protocol = negotiate_protocol(websocket)
+    connection = await websocketmanager.connect(websocket, protocol)
+    if connection is None:
+        return
 
     if websocket.client is None:
+        websocketmanager.disconnect(connection)
         raise HTTPException(status_code=500, detail="Failed to accept websocket")
     logger.debug("New websocket connection", src_ip=get_client_ip(websocket))
+    heartbeat = asyncio.create_task(websocketmanager.heartbeat(connection))
     try:
         while websocket.client_state == WebSocketState.CONNECTED:
             try:
-                raw_msg = "<empty>"
-                raw_msg = await websocket.receive_json()
-                response = WebSocketResponse(message=WebSocketMessageType.Error.value, payload="unknown message")
-                data = WebSocketMessage.model_validate(raw_msg)
+                raw_msg: Any = "<empty>"
+                raw_msg = await websocket.receive()
+                if raw_msg["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(raw_msg.get("code", 1000))
+                connection.touch()
+                data = WebSocketMessage.from_frame(raw_msg)
             except WebSocketDisconnect:
                 logger.debug(LogMessages.WebsocketDisconnected, src_ip=get_client_ip(websocket))
                 return
@@ -299,20 +546,32 @@ async def websocket_endpoint(
                 )
                 return
 
-            if data.message == WebSocketMessageType.Jobs.value:
-                response = await websocket_jobs(data, session, websocket)
-            elif data.message == WebSocketMessageType.Delete.value:
-                response = await websocket_delete(data, session, websocket)
-            elif data.message == WebSocketMessageType.Resubmit.value:
-                response = await websocket_resubmit(data, session, websocket)
-            elif data.message == WebSocketMessageType.Waiting.value:
-                response = await websocket_waiting(data, session, websocket)
-            elif data.message == WebSocketMessageType.Feedback.value:
-                response = await websocket_feedback(data, session, websocket)
-            await websocket.send_text(response.as_message())
+            if not websocketmanager.identify(connection, data.userid):
+                await connection.send(
+                    WebSocketResponse(
+                        message=WebSocketMessageType.Error.value,
+                        payload="Too many connections for this user, please close some tabs!",
+                    )
+                )
+                await websocket.close(code=1008)
+                return
+            if data.message == WebSocketMessageType.Pong.value:
+                # the client's answering our heartbeat, nothing to send back
+                continue
+            response = await websocket_dispatch(data, session, websocket)
+            await connection.send(response)
     except WebSocketDisconnect:
         logger.debug(LogMessages.WebsocketDisconnected, src_ip=get_client_ip(websocket))
         return
+    except asyncio.CancelledError:
+        # the websocket manager cancels us when it evicts the connection, anything else should carry on up
+        if not connection.evicted:
+            raise
+        # we're swallowing the eviction's cancel, so take it off the task's count
+        task = asyncio.current_task()
+        if task is not None:
+            task.uncancel()
+        return
     except RuntimeError as error:
         if "Unexpected ASGI message 'websocket.send', after sending 'websocket.close'" in str(error):
             logger.debug(
@@ -326,6 +585,9 @@ async def websocket_endpoint(
     except Exception as error:
         logger.error(LogMessages.WebsocketError, error=error)
         return
+    finally:
+        heartbeat.cancel()
+        websocketmanager.disconnect(connection)
 
 
 @app.get(Urls.HealthCheck)
@@ -416,6 +678,7 @@ async def session_update(
     except NoResultFound:
         raise HTTPException(status_code=404, detail="Session not found")
     chatsession.name = form.name
+    chatsession.updated = datetime.now(UTC)
     session.add(chatsession)
     session.commit()
     session.refresh(chatsession)
@@ -428,10 +691,14 @@ async def session_update(
     return chatsession
 
 
-@app.get(f"{Urls.Sessions}/{{userid}}")
+@app.get(f"{Urls.Sessions}/{{userid}}", response_model=Sequence[ChatUiDBSession])
 async def get_user_sessions(
-    userid: UUID, create: bool = True, session: Session = Depends(get_session)
-) -> Sequence[ChatUiDBSession]:
+    request: Request,
+    response: Response,
+    userid: UUID,
+    create: bool = True,
+    session: Session = Depends(get_session),
+) -> Union[Sequence[ChatUiDBSession], Response]:
     # check the user exists first
 
     trace.get_current_span().set_attribute("userid", str(userid))
@@ -441,6 +708,21 @@ async def get_user_sessions(
         logger.info("User not found when asking for sessions", userid=userid)
         raise HTTPException(status_code=404, detail="User not found")
 
+    count, max_created, max_updated = session.exec(
+        select(
+            func.count(col(ChatUiDBSession.sessionid)),
+            func.max(ChatUiDBSession.created),
+            func.max(ChatUiDBSession.updated),
+        ).where(ChatUiDBSession.userid == userid)
+    ).one()
+    # if there aren't any we might be about to make one, so there's nothing to compare
+    if count > 0:
+        etag = make_etag(Urls.Sessions, userid, count, max_created, max_updated)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), {etag}):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+
     try:
         query = (
             select(ChatUiDBSession).where(ChatUiDBSession.userid == userid).order_by(ChatUiDBSession.created.desc())  # type: ignore
@@ -499,14 +781,9 @@ async def admin_sessions(
     - userid (a given userid)
 
     """
-    config = Config()
     if userid is not None:
         trace.get_current_span().set_attribute("userid", str(userid))
-    if config.admin_password is None:
-        raise HTTPException(500, "Admin password not available")
-
-    if config.admin_password != admin_password:
-        raise HTTPException(403, "Admin password incorrect")
+    check_admin_password(admin_password)
 
     query = select(ChatUiDBSession)
     if userid is not None:
@@ -514,13 +791,13 @@ async def admin_sessions(
     return [item for item in session.exec(query).all()]
 
 
-@app.get(Urls.AdminJobs)
+@app.get(Urls.AdminJobs, response_model=List[Job], response_class=FastJSONResponse)
 async def admin_jobs(
     admin_password: Annotated[str, Header()],
     userid: Optional[UUID] = None,
     sessionid: Optional[UUID] = None,
     session: Session = Depends(get_session),
-) -> List[Job]:
+) -> FastJSONResponse:
     """
     *** Requires the admin password to be set in config ***
 
@@ -531,25 +808,19 @@ async def admin_jobs(
     - userid (a given userid)
     - sessionid (a given chat session id)
     """
-    config = Config()
-
     if userid is not None:
         trace.get_current_span().set_attribute("userid", str(userid))
     if sessionid is not None:
         trace.get_current_span().set_attribute("sessionid", str(sessionid))
 
-    if config.admin_password is None:
-        raise HTTPException(500, "Admin password not available")
-
-    if config.admin_password != admin_password:
-        raise HTTPException(403, "Admin password incorrect")
+    check_admin_password(admin_password)
 
     query = select(Jobs)
     if userid is not None:
         query = query.where(Jobs.userid == userid)
     if sessionid is not None:
         query = query.where(Jobs.sessionid == sessionid)
-    return [Job.from_jobs(job, None) for job in session.exec(query).all()]
+    return FastJSONResponse([Job.dict_from_jobs(job) for job in session.exec(query).all()])
 
 
 @app.get(Urls.AdminUsers)
@@ -565,16 +836,10 @@ async def admin_users(
 
 
     """
-    config = Config()
-
     if userid is not None:
         trace.get_current_span().set_attribute("userid", str(userid))
 
-    if config.admin_password is None:
-        raise HTTPException(500, "Admin password not available")
-
-    if config.admin_password != admin_password:
-        raise HTTPException(403, "Admin password incorrect")
+    check_admin_password(admin_password)
 
     query = select(Users)
     if userid is not None:
@@ -600,13 +865,7 @@ async def admin_analyses(
         trace.get_current_span().set_attribute("userid", str(userid))
     if analysisid is not None:
         trace.get_current_span().set_attribute("analysisid", str(analysisid))
-    config = Config()
-
-    if config.admin_password is None:
-        raise HTTPException(500, "Admin password not available")
-
-    if config.admin_password != admin_password:
-        raise HTTPException(403, "Admin password incorrect")
+    check_admin_password(admin_password)
 
     query = select(JobAnalysis)
     if userid is not None:
@@ -616,7 +875,23 @@ async def admin_analyses(
     return [item for item in session.exec(query).all()]
 
 
+@app.get(Urls.AdminWebsockets)
+async def admin_websockets(
+    admin_password: Annotated[str, Header()],
+) -> WebSocketStats:
+    """
+    *** Requires the admin password to be set in config ***
+
+    Counts of the websockets connected to the worker process that handles the request.
+
+
+    """
+    check_admin_password(admin_password)
+
+    return websocketmanager.stats()
+
+
 @app.get("/")
-async def index() -> HTMLResponse:
-    """returns the contents of html/index.html as a HTMLResponse object"""
-    return HTMLResponse(Path(os.path.join(os.path.dirname(__file__), "html/index.html")).read_bytes())
+async def index(request: Request) -> Response:
+    """returns html/index.html, with versioned URLs for the static assets"""
+    return staticassets.index.response(request, immutable=False)
@@ -3,14 +3,22 @@
 import click
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option("--host", default="127.0.0.1")
 @click.option("--reload", is_flag=True, help="Auto-reload for testing", default=False)
 @click.option(
     "--jsonlogs", is_flag=True, help="Output logs in JSON format", default=True
 )
-def main(reload: bool = False, host: str = "127.0.0.1", jsonlogs: bool = True) -> None:
-    """main function"""
+@click.pass_context
+def main(
+    ctx: click.Context,
+    reload: bool = False,
+    host: str = "127.0.0.1",
+    jsonlogs: bool = True,
+) -> None:
+    """runs the web server, or one of the commands below"""
+    if ctx.invoked_subcommand is not None:
+        return
 
     import uvicorn
 
@@ -35,5 +43,16 @@ def main(reload: bool = False, host: str = "127.0.0.1", jsonlogs: bool = True) -
     uvicorn.run("chat_ui:app", **options)  # type: ignore
 
 
+@main.command()
+def worker() -> None:
+    """run the job and analysis poller without the web server
+
+    set enable_background_poller to false on the web servers so they leave the jobs to the workers
+    """
+    from chat_ui.worker import run_worker
+
+    run_worker()
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,341 @@
+""" asyncio version of the ChatUIClient, for scripts that need lots of requests in flight at once """
+
+import asyncio
+import time
+from types import TracebackType
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
+from uuid import UUID
+
+import httpx
+from loguru import logger
+
+from chat_ui.client import DEFAULT_ETAG_CACHE_SIZE, JOB_BULK_CHUNK, JOB_WAIT_CHUNK, ETagCache, make_url
+from chat_ui.db import ChatUiDBSession, JobAnalysis, Users
+from chat_ui.enums import Urls
+from chat_ui.forms import NewJobForm, SessionUpdateForm, UserForm
+from chat_ui.models import (
+    AnalysisType,
+    AnalyzeForm,
+    Job,
+    JobDetail,
+    JobEvent,
+    JobEventType,
+    JobStatus,
+    RequestType,
+)
+
+T = TypeVar("T")
+ItemType = TypeVar("ItemType")
+
+# how many requests can be in flight at once, across everything using the client
+DEFAULT_MAX_CONCURRENCY = 100
+# long-polls and event streams have their own limit, so a pile of them waiting on jobs can't hold up everything else
+DEFAULT_MAX_WAITERS = 100
+DEFAULT_TIMEOUT = 60.0
+
+
+class AsyncChatUIClient:
+    """the same calls as ChatUIClient, on a pooled httpx client
+
+    one instance can be shared by thousands of tasks, the connection pool and a semaphore keep the
+    number of requests actually in flight at max_concurrency. Use it as an async context manager,
+    or call aclose() when you're done with it."""
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        skip_tls: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_waiters: int = DEFAULT_MAX_WAITERS,
+        http2: bool = True,
+        timeout: float = DEFAULT_TIMEOUT,
+        client: Optional[httpx.AsyncClient] = None,
+        etag_cache_size: int = DEFAULT_ETAG_CACHE_SIZE,
+    ) -> None:
+        self.base_url = make_url(hostname, port, skip_tls)
+        self.hostname = hostname
+        self.port = port
+        self.skip_tls = skip_tls
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_waiters = max_waiters
+        self.wait_semaphore = asyncio.Semaphore(max_waiters)
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=http2,
+                verify=not skip_tls,
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=max_concurrency + max_waiters,
+                    max_keepalive_connections=max_concurrency,
+                ),
+            )
+        self.client = client
+        self.etag_cache = ETagCache(etag_cache_size)
+
+    async def __aenter__(self) -> "AsyncChatUIClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def request(self, method: str, url: str, waiting: bool = False, **kwargs: Any) -> httpx.Response:
+        """send a request once there's room under max_concurrency, or max_waiters if it's waiting on a job"""
+        async with self.wait_semaphore if waiting else self.semaphore:
+            return await self.client.request(method, f"{self.base_url}{url}", **kwargs)
+
+    async def _get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[httpx.Response, Any]:
+        """GET some JSON, sending the ETag from last time so an unchanged response comes from the cache,
+        the body's None if the request failed"""
+        headers = dict(headers or {})
+        key = str(httpx.URL(f"{self.base_url}{url}", params=params))
+        cached = self.etag_cache.get(key)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+        res = await self.request("GET", url, params=params, headers=headers)
+        if res.status_code == 304 and cached is not None:
+            return res, cached[1]
+        if res.status_code != 200:
+            return res, None
+        data = res.json()
+        etag = res.headers.get("ETag")
+        if etag is not None:
+            self.etag_cache.put(key, etag, data)
+        return res, data
+
+    async def gather(self, awaitables: Iterable[Awaitable[T]]) -> List[T]:
+        """run them all at once, the client's semaphore limits how many requests are really in flight"""
+        return list(await asyncio.gather(*awaitables))
+
+    async def fan_out(self, func: Callable[[ItemType], Awaitable[T]], items: Iterable[ItemType]) -> List[T]:
+        """call func on every item concurrently, results are in the same order as the items"""
+        return await self.gather(func(item) for item in items)
+
+    async def get_jobs(
+        self,
+        userid: Optional[UUID] = None,
+        sessionid: Optional[UUID] = None,
+        admin_password: Optional[str] = None,
+    ) -> List[Job]:
+        """get jobs"""
+        params = {}
+        if userid is not None:
+            params["userid"] = userid.hex
+        if sessionid is not None:
+            params["sessionid"] = sessionid.hex
+        headers = {}
+        if admin_password is None:
+            url = str(Urls.Jobs)
+            if not params:
+                raise ValueError("You need to specify a userid or admin password!")
+        else:
+            url = str(Urls.AdminJobs)
+            headers = self._admin_header(admin_password)
+        res, data = await self._get_json(url, params=params, headers=headers)
+        if data is None:
+            logger.error("Failed to get jobs: {}", res.text)
+            return []
+        return [Job.model_validate(job) for job in data]
+
+    async def get_job(self, userid: UUID, jobid: UUID) -> JobDetail:
+        """get an individual job"""
+        res, data = await self._get_json(f"{Urls.Jobs}/{userid}/{jobid}")
+        if data is None:
+            res.raise_for_status()
+        return JobDetail.model_validate(data)
+
+    async def wait_for_job(self, userid: UUID, jobid: UUID, timeout: float = 30.0) -> JobDetail:
+        """wait for a job to finish, returns the job as it is after timeout seconds if it hasn't"""
+        deadline = time.monotonic() + timeout
+        while True:
+            # the server caps how long a single request can wait, so ask in chunks
+            remaining = max(0.0, deadline - time.monotonic())
+            wait = min(remaining, JOB_WAIT_CHUNK)
+            res = await self.request(
+                "GET",
+                f"{Urls.Jobs}/{userid}/{jobid}/wait",
+                waiting=True,
+                params={"timeout": wait},
+                timeout=wait + 30,
+            )
+            res.raise_for_status()
+            job = JobDetail.model_validate(res.json())
+            if JobStatus(job.status).is_terminal() or remaining <= wait:
+                return job
+
+    async def stream_job(self, userid: UUID, jobid: UUID) -> AsyncGenerator[Union[JobEvent, JobDetail], None]:
+        """follow a job's server-sent events, yields JobEvents as they happen then the finished JobDetail,
+        the stream counts against max_waiters until it's done"""
+        async with self.wait_semaphore:
+            async with self.client.stream(
+                "GET",
+                f"{self.base_url}{Urls.Jobs}/{userid}/{jobid}/events",
+                headers={"Accept": "text/event-stream"},
+                timeout=None,
+            ) as res:
+                res.raise_for_status()
+                event: Optional[str] = None
+                async for line in res.aiter_lines():
+                    if line.startswith("event:"):
+                        event = line.removeprefix("event:").strip()
+                    elif line.startswith("data:") and event is not None:
+                        data = line.removeprefix("data:").strip()
+                        if event == JobEventType.Complete:
+                            yield JobDetail.model_validate_json(data)
+                            return
+                        yield JobEvent.model_validate_json(data)
+                    elif not line:
+                        event = None
+
+    async def create_or_update_user(self, userid: UUID, name: Optional[str] = None) -> Dict[str, Any]:
+        """create or update a user"""
+        payload = UserForm(userid=userid, name=name)
+        res = await self.request("POST", Urls.User, json=payload.model_dump(mode="json"))
+        res.raise_for_status()
+        result: Dict[str, Any] = res.json()
+        return result
+
+    async def create_session(self, userid: UUID) -> Optional[ChatUiDBSession]:
+        """create a session"""
+        res = await self.request("POST", f"/session/new/{userid}")
+        if res.status_code != 200:
+            logger.error("Failed to create new session: {}", res.text)
+            raise Exception("Failed to create new session")
+        if len(res.json()) == 0:
+            return None
+        return ChatUiDBSession.model_validate(res.json())
+
+    async def update_session(self, name: str, sessionid: UUID, userid: UUID) -> Optional[ChatUiDBSession]:
+        """update a session"""
+        payload = SessionUpdateForm(name=name)
+        res = await self.request("POST", f"/session/{userid}/{sessionid}", json=payload.model_dump(mode="json"))
+        if res.status_code != 200:
+            logger.error("Failed to update session: {}", res.text)
+            return None
+        return ChatUiDBSession.model_validate(res.json())
+
+    async def get_sessions(
+        self,
+        userid: Optional[UUID] = None,
+        admin_password: Optional[str] = None,
+    ) -> List[ChatUiDBSession]:
+        """get sessions"""
+        headers = {}
+        if admin_password is None:
+            if userid is None:
+                raise ValueError("You need to specify a userid or admin password!")
+            url = f"{Urls.Sessions}/{userid}"
+            params = {"create": "False"}
+        else:
+            url = str(Urls.AdminSessions)
+            params = {"userid": userid.hex} if userid is not None else {}
+            headers = self._admin_header(admin_password)
+
+        res, data = await self._get_json(url, params=params, headers=headers)
+        if data is None:
+            logger.error("Failed to get sessions: {}", res.text)
+            return []
+        return [ChatUiDBSession.model_validate(session) for session in data]
+
+    async def create_job(
+        self,
+        prompt: str,
+        sessionid: UUID,
+        userid: UUID,
+        request_type: RequestType = RequestType.Plain,
+    ) -> Optional[Job]:
+        """push a job"""
+        payload = NewJobForm(
+            prompt=prompt,
+            sessionid=sessionid,
+            userid=userid,
+            request_type=request_type,
+        )
+        res = await self.request("POST", Urls.Job, json=payload.model_dump(mode="json"))
+        if res.status_code != 200:
+            logger.error("Failed to create job: {}", res.text)
+            return None
+        return Job.model_validate(res.json())
+
+    async def create_jobs(self, jobs: List[NewJobForm], chunk_size: int = JOB_BULK_CHUNK) -> List[Job]:
+        """push lots of jobs, chunk_size at a time, raises if any of the chunks fail"""
+
+        async def create_chunk(chunk: List[NewJobForm]) -> List[Job]:
+            res = await self.request("POST", Urls.JobBulk, json=[job.model_dump(mode="json") for job in chunk])
+            if res.status_code != 200:
+                logger.error("Failed to create jobs: {}", res.text)
+                res.raise_for_status()
+            return [Job.model_validate(job) for job in res.json()]
+
+        chunks = [jobs[start : start + chunk_size] for start in range(0, len(jobs), chunk_size)]
+        return [job for created in await self.fan_out(create_chunk, chunks) for job in created]
+
+    async def get_users(self, admin_password: str, userid: Optional[UUID] = None) -> List[Users]:
+        """gets the users from the system, is an admin-only endpoint currently"""
+        params = {"userid": userid.hex} if userid is not None else {}
+        res = await self.request("GET", Urls.AdminUsers, headers=self._admin_header(admin_password), params=params)
+        if res.status_code != 200:
+            logger.error("Failed to get users: {}", res.text)
+            return []
+        return [Users.model_validate(user) for user in res.json()]
+
+    async def get_analyses(
+        self,
+        admin_password: Optional[str] = None,
+        analysisid: Optional[UUID] = None,
+        userid: Optional[UUID] = None,
+    ) -> List[JobAnalysis]:
+        """Get the analyses, pass the admin password if you want to get everything"""
+        params = {}
+        if userid is not None:
+            params["userid"] = userid.hex
+        if analysisid is not None:
+            params["analysisid"] = analysisid.hex
+
+        headers: Dict[str, str] = {}
+        if admin_password is None:
+            url = str(Urls.Analyses)
+            if not params:
+                raise ValueError("You need to specify a userid or analysisid to get analyses as a non-admin!")
+        else:
+            url = str(Urls.AdminAnalyses)
+            headers = self._admin_header(admin_password)
+
+        res = await self.request("GET", url, headers=headers, params=params)
+        if res.status_code != 200:
+            logger.error("Failed to get analyses: {}", res.text)
+            return []
+        return [JobAnalysis.model_validate(analysis) for analysis in res.json()]
+
+    async def create_analysis(
+        self,
+        userid: UUID,
+        jobid: UUID,
+        analysis_type: AnalysisType,
+        preprompt: str,
+    ) -> JobAnalysis:
+        """create an analysis job in the backend"""
+        payload = AnalyzeForm(jobid=jobid, userid=userid, analysis_type=analysis_type, preprompt=preprompt)
+        res = await self.request("POST", Urls.Analyse, json=payload.model_dump(mode="json"))
+        res.raise_for_status()
+        return JobAnalysis.model_validate(res.json())
+
+    @classmethod
+    def _admin_header(cls, admin_password: str) -> Dict[str, str]:
+        """return an admin header"""
+        return {"admin-password": admin_password}
+
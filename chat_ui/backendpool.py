@@ -0,0 +1,301 @@
+""" spreads the backend calls over several llama.cpp servers, sending each one to the least busy healthy server """
+
+import asyncio
+from contextlib import contextmanager
+import hashlib
+import math
+import os
+import random
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Literal, Optional, Set, TypeVar
+
+from loguru import logger
+from openai import AsyncOpenAI
+from opentelemetry.metrics import get_meter_provider
+from pydantic import BaseModel
+
+from chat_ui.config import BackendConfig, Config
+from chat_ui.models import LogMessages
+from chat_ui.resilience import (
+    BackendResilience,
+    BackendUnavailable,
+    CircuitBreaker,
+    CircuitState,
+    RetryPolicy,
+    is_transient,
+)
+from chat_ui.utils import get_backend_client, get_backend_models
+
+T = TypeVar("T")
+
+# the backend call, given the client and the extra_body to send with the request
+BackendCall = Callable[[AsyncOpenAI, Dict[str, Any]], Awaitable[T]]
+Routing = Literal["least_outstanding", "session_affinity"]
+
+# how long a call waits before looking again when every healthy backend's full
+SLOT_WAIT = 0.05
+
+meter = get_meter_provider().get_meter("chat_ui", os.getenv("CHATUI_APP_VERSION", "latest"))
+request_duration = meter.create_histogram(
+    "chatui.backend.request_duration",
+    unit="s",
+    description="How long each backend call took, by backend and outcome",
+)
+request_errors = meter.create_counter(
+    "chatui.backend.errors",
+    description="Backend calls that failed, by backend",
+)
+outstanding_requests = meter.create_up_down_counter(
+    "chatui.backend.outstanding",
+    description="Calls in flight to each backend",
+)
+
+
+class BackendStats(BaseModel):
+    """how one backend's doing, from this process's point of view"""
+
+    name: str
+    url: str
+    state: CircuitState
+    outstanding: int
+    max_concurrency: int
+    requests: int
+    errors: int
+    mean_seconds: Optional[float] = None
+
+
+def affinity_hash(*parts: str) -> int:
+    """a stable 64 bit hash, python's hash() changes between processes"""
+    return int.from_bytes(hashlib.blake2b(":".join(parts).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class Backend:
+    """one server in the pool, with its own circuit breaker so a dead one's taken out of rotation"""
+
+    def __init__(self, settings: BackendConfig, config: Config) -> None:
+        self.settings = settings
+        self.name = settings.name or settings.url
+        # the pool does the retrying, across all the backends, so this only keeps track of whether it's up
+        self.resilience = BackendResilience(
+            policy=RetryPolicy(attempts=1),
+            breaker=CircuitBreaker(
+                failure_threshold=config.backend_circuit_failure_threshold,
+                reset_timeout=config.backend_circuit_reset_timeout,
+                name=self.name,
+            ),
+            probe=lambda: get_backend_models(timeout=5.0, base_url=settings.url),
+        )
+        self.outstanding = 0
+        self.requests = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.attributes = {"backend": self.name}
+        # a client's connections belong to the event loop that made them, and each prompt thread has its own,
+        # so close_client has to be awaited before the loop ends
+        self.clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = weakref.WeakKeyDictionary()
+        self.lock = threading.Lock()
+        # the llama.cpp slots our calls are pinned to right now
+        self.busy_slots: Set[int] = set()
+
+    def has_room(self) -> bool:
+        return self.outstanding < self.settings.max_concurrency
+
+    def load(self) -> float:
+        """what the least-outstanding routing compares, weighted so bigger servers get more"""
+        return (self.outstanding + 1) / self.settings.weight
+
+    def affinity_score(self, affinity: str) -> float:
+        """weighted rendezvous hashing, the highest scoring backend gets the session
+
+        a session always scores the same against a backend, so taking one out only moves its own sessions"""
+        unit = (affinity_hash(affinity, self.name) + 1) / (2**64 + 1)
+        return -self.settings.weight / math.log(unit)
+
+    @contextmanager
+    def extra_body(self, affinity: Optional[str]) -> Iterator[Dict[str, Any]]:
+        """pins the session to one of llama.cpp's slots, so the conversation so far is still in its prompt cache
+
+        llama.cpp makes a call wait for the slot it asks for, so when another of our calls has it this one
+        takes whichever slot's free instead"""
+        if affinity is None or self.settings.slots is None:
+            yield {}
+            return
+        slot = affinity_hash(affinity, self.name, "slot") % self.settings.slots
+        with self.lock:
+            pinned = slot not in self.busy_slots
+            if pinned:
+                self.busy_slots.add(slot)
+        try:
+            yield {"cache_prompt": True, "id_slot": slot if pinned else -1}
+        finally:
+            if pinned:
+                with self.lock:
+                    self.busy_slots.discard(slot)
+
+    def client(self) -> AsyncOpenAI:
+        """the client for the running event loop, making one is slow enough to hold up the loop"""
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            client = self.clients.get(loop)
+            if client is None:
+                client = get_backend_client(base_url=self.settings.url, api_key=self.settings.api_key)
+                self.clients[loop] = client
+        return client
+
+    async def close_client(self) -> None:
+        """close the running event loop's client, its connections don't outlive the loop"""
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            client = self.clients.pop(loop, None)
+        if client is not None:
+            await client.close()
+
+    async def call(self, func: BackendCall[T], affinity: Optional[str] = None) -> T:
+        """one try at func with this backend's client, keeping the metrics"""
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            with self.extra_body(affinity) as extra_body:
+                return await self.resilience.call(lambda: func(self.client(), extra_body))
+        except Exception:
+            outcome = "error"
+            # every prompt thread calls this, so the counts are only touched under the lock
+            with self.lock:
+                self.errors += 1
+            request_errors.add(1, attributes=self.attributes)
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            with self.lock:
+                self.requests += 1
+                self.total_seconds += seconds
+            request_duration.record(seconds, attributes={**self.attributes, "outcome": outcome})
+
+    def stats(self) -> BackendStats:
+        with self.lock:
+            requests, errors, total_seconds = self.requests, self.errors, self.total_seconds
+        return BackendStats(
+            name=self.name,
+            url=self.settings.url,
+            state=self.resilience.breaker.state,
+            outstanding=self.outstanding,
+            max_concurrency=self.settings.max_concurrency,
+            requests=requests,
+            errors=errors,
+            mean_seconds=total_seconds / requests if requests else None,
+        )
+
+
+class BackendPool:
+    """routes each call to the healthy backend with the fewest outstanding requests for its weight
+
+    with session_affinity routing, calls for a session go to the same backend every time while it's healthy
+    and has room, so it can reuse the prompt it's already read. a backend that keeps failing is ejected by
+    its circuit breaker, and let back in once it answers /models"""
+
+    def __init__(
+        self, backends: List[Backend], policy: Optional[RetryPolicy] = None, routing: Routing = "least_outstanding"
+    ) -> None:
+        self.backends = backends
+        self.policy = policy or RetryPolicy()
+        self.routing = routing
+        self.rng = random.Random()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Config) -> "BackendPool":
+        return cls(
+            [Backend(settings, config) for settings in config.backend_pool()],
+            RetryPolicy(
+                attempts=config.backend_retry_attempts,
+                base_delay=config.backend_retry_base_delay,
+                max_delay=config.backend_retry_max_delay,
+            ),
+            config.backend_routing,
+        )
+
+    def capacity(self) -> int:
+        """how many calls the healthy backends can take at once, probing the ejected ones that are due a check"""
+        return sum(backend.settings.max_concurrency for backend in self.backends if backend.resilience.ready())
+
+    def ready(self) -> bool:
+        return self.capacity() > 0
+
+    def acquire(self, tried: Set[str], affinity: Optional[str] = None) -> Optional[Backend]:
+        """take a slot on the least loaded backend with room, preferring ones this call hasn't tried yet
+
+        with session affinity it's the backend the session hashes to, or the next one along if that's full"""
+        with self.lock:
+            available = [
+                backend
+                for backend in self.backends
+                if backend.has_room() and backend.resilience.breaker.allow_request()
+            ]
+            untried = [backend for backend in available if backend.name not in tried]
+            candidates = untried or available
+            if not candidates:
+                return None
+            if affinity is not None and self.routing == "session_affinity":
+                backend = max(candidates, key=lambda backend: backend.affinity_score(affinity))
+            else:
+                backend = min(candidates, key=lambda backend: backend.load())
+            backend.outstanding += 1
+        outstanding_requests.add(1, attributes=backend.attributes)
+        return backend
+
+    def release(self, backend: Backend) -> None:
+        with self.lock:
+            backend.outstanding -= 1
+        outstanding_requests.add(-1, attributes=backend.attributes)
+
+    async def call(
+        self,
+        func: BackendCall[T],
+        retryable: Callable[[], bool] = lambda: True,
+        affinity: Optional[str] = None,
+        **log_fields: object,
+    ) -> T:
+        """await func with a backend's client, moving on to another backend with backoff if it fails transiently
+
+        retryable says whether it's still safe to try again, for when func's already sent something on.
+        affinity is what session affinity routing hashes, calls with the same one share a backend"""
+        if self.routing != "session_affinity":
+            affinity = None
+        retry = 0
+        tried: Set[str] = set()
+        while True:
+            backend = self.acquire(tried, affinity)
+            if backend is None:
+                if not any(other.resilience.breaker.allow_request() for other in self.backends):
+                    raise BackendUnavailable("All the backends are unavailable")
+                await asyncio.sleep(SLOT_WAIT)
+                continue
+            try:
+                return await backend.call(func, affinity)
+            except Exception as error:
+                retry += 1
+                if not is_transient(error) or retry >= self.policy.attempts or not retryable():
+                    raise
+                tried.add(backend.name)
+                delay = self.policy.delay(retry - 1, self.rng)
+                logger.warning(
+                    LogMessages.BackendRetrying,
+                    backend=backend.name,
+                    error=str(error),
+                    retry=retry,
+                    delay=round(delay, 3),
+                    **log_fields,
+                )
+            finally:
+                self.release(backend)
+            await asyncio.sleep(delay)
+
+    async def close_clients(self) -> None:
+        """close the clients the running event loop made, before the loop's done with"""
+        for backend in self.backends:
+            await backend.close_client()
+
+    def stats(self) -> List[BackendStats]:
+        return [backend.stats() for backend in self.backends]
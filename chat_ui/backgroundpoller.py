@@ -1,26 +1,36 @@
 """ This polls the backend to check if it is up and running """
 
 import asyncio
+from bisect import bisect_left
+from contextlib import contextmanager
+from itertools import accumulate
 from datetime import datetime, UTC
 import json
+import math
 import os
+import socket
 import threading
 import time
-from typing import List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import UUID, uuid4
 
 from loguru import logger
 from pydantic import BaseModel, Field
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from sqlalchemy import Engine
-from sqlalchemy.exc import MultipleResultsFound, NoResultFound
-from chat_ui.config import Config
-from chat_ui.db import JobAnalysis, Jobs
+from sqlalchemy.exc import NoResultFound
+from chat_ui.backendpool import BackendPool
+from chat_ui.config import get_config
+from chat_ui.db import JobAnalysis, Jobs, requeue_jobs, too_many_attempts
+from chat_ui.jobevents import jobevents
+from chat_ui.logs import log_enabled, log_payload, payload_fields
 from chat_ui.models import JobStatus, LogMessages, AnalysisType
-from chat_ui.utils import get_backend_client
+from chat_ui.resilience import is_transient
+from chat_ui.utils import render_job_response
 
+from openai import AsyncOpenAI
 from openai.types.chat import (
     ChatCompletionUserMessageParam,
     ChatCompletionAssistantMessageParam,
@@ -50,6 +60,62 @@ usage_meters = {
         description="Total token usage for a prompt",
     ),
 }
+phase_meter = meter.create_histogram(
+    "chatui.job.phase_duration",
+    unit="s",
+    description="Time spent in each part of handling a job, by phase",
+)
+
+
+# the most history that's sent with a prompt, by rough_history_tokens' count
+HISTORY_TOKEN_LIMIT = 2048
+# the history's cut at fixed points this far apart, so the start of it only moves every so often,
+# it's sent with somewhere between the limit less the step and the limit
+HISTORY_TRIM_STEP = HISTORY_TOKEN_LIMIT // 2
+
+# the poller's hold on a job, handle_job's copy of the job doesn't have them
+CLAIM_FIELDS = ("attempts", "claimed_by", "lease_expires")
+
+
+class JobTimer:
+    """times the parts of handling a job, so we can tell if it was queueing or the backend
+
+    the phases are queue_wait (created until it was picked up), claim (marking it
+    running), history_load, token_budget, time_to_first_token, generation (the rest of
+    the backend's time), render, db_write and notify"""
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, float] = {}
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """time the with block as this phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def as_metadata(self) -> Dict[str, float]:
+        """the timings rounded to the microsecond, for storing with the job"""
+        return {phase: round(seconds, 6) for phase, seconds in self.timings.items()}
+
+    def observe(self) -> None:
+        """send them to the histograms and the current span"""
+        span = trace.get_current_span()
+        for phase, seconds in self.timings.items():
+            phase_meter.record(seconds, attributes={"phase": phase})
+            span.set_attribute(f"timing.{phase}", seconds)
+
+
+def queue_wait(created: datetime) -> float:
+    """seconds since the job was created, naive datetimes from sqlite are really UTC"""
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=UTC)
+    return max((datetime.now(UTC) - created).total_seconds(), 0.0)
 
 
 class BackgroundJob(BaseModel):
@@ -57,7 +123,7 @@ class BackgroundJob(BaseModel):
     client_ip: str
     userid: UUID
     status: str
-    created: datetime = Field(datetime.now(UTC))
+    created: datetime = Field(default_factory=lambda: datetime.now(UTC))
     updated: Optional[datetime] = None
     prompt: str
     response: Optional[str] = None
@@ -152,45 +218,124 @@ def sort_by_updated_or_created(objects: List[Jobs]) -> List[Jobs]:
 
 class BackgroundPoller(threading.Thread):
     def __init__(self, engine: Engine, model_name: str):
-        super().__init__()
-        self.config = Config()
+        # a daemon so a job that won't finish can't hold the process open, stop() requeues it
+        super().__init__(daemon=True)
         self.model_name = model_name
         self.message = "run"
         self.engine = engine
         self.event_loop = asyncio.new_event_loop()
+        # what this poller's claims are recorded under, unique across hosts and restarts
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+        self.last_requeue_check = 0.0
+        self.pool = BackendPool.from_config(get_config())
+        # the threads running prompts, there's one for each backend slot that's in use
+        self.workers: List[threading.Thread] = []
 
     @classmethod
     def check_history_tokens(
         cls,
         job: BackgroundJob,
     ) -> Tuple[BackgroundJob, list[tuple[str, int]], int]:
-        """checks the history tokens and removes the oldest until we're under the token limit"""
+        """checks the history tokens and removes the oldest until we're under the token limit
+
+        it's only ever cut at the first job past a multiple of HISTORY_TRIM_STEP tokens into the
+        session, which doesn't change as the session grows, so the next prompt starts with the same
+        jobs as this one and the backend can reuse the prompt it's cached"""
         history_tokens = rough_history_tokens(job.history)
-        total_history_tokens = sum([t[1] for t in history_tokens])
-        while total_history_tokens > 2048:
-            job.history.pop(0)
-            history_tokens = rough_history_tokens(job.history)
-            total_history_tokens = sum([t[1] for t in history_tokens])
-        return (job, history_tokens, total_history_tokens)
+        # starts[index] is how many tokens there are before job index
+        starts = [0, *accumulate(tokens for _, tokens in history_tokens)]
+        excess = starts[-1] - HISTORY_TOKEN_LIMIT
+        if excess <= 0:
+            return (job, history_tokens, starts[-1])
+        cut_at = math.ceil(excess / HISTORY_TRIM_STEP) * HISTORY_TRIM_STEP
+        cut = min(bisect_left(starts, cut_at), len(job.history))
+        job.history = job.history[cut:]
+        return (job, history_tokens[cut:], starts[-1] - starts[cut])
+
+    async def stream_completion(
+        self,
+        job: BackgroundJob,
+        history: List[
+            Union[ChatCompletionUserMessageParam, ChatCompletionAssistantMessageParam]
+        ],
+        timer: JobTimer,
+    ) -> Tuple[str, Optional[str], Dict[str, Any]]:
+        """get the completion as a stream, publishing each chunk as a token event,
+        returns the model, the full response and the usage"""
+        start = time.perf_counter()
+        first_token: Optional[float] = None
+        model = self.model_name
+        chunks: List[str] = []
+        usage: Dict[str, Any] = {}
+
+        async def consume(llm_client: AsyncOpenAI, extra_body: Dict[str, Any]) -> None:
+            nonlocal first_token, model, usage
+            stream = await llm_client.chat.completions.create(
+                model=self.model_name,
+                messages=history,
+                temperature=0.7,
+                stream=True,
+                stream_options={"include_usage": True},
+                extra_body=extra_body,
+            )
+            async for chunk in stream:
+                model = chunk.model
+                if chunk.usage is not None:
+                    usage = chunk.usage.model_dump()
+                for choice in chunk.choices:
+                    if choice.delta.content:
+                        if first_token is None:
+                            first_token = time.perf_counter()
+                        chunks.append(choice.delta.content)
+                        jobevents.publish_token(job.id, choice.delta.content)
+
+        # the backend's busy until the stream's done, and once tokens have gone out it's too late to retry
+        await self.pool.call(
+            consume,
+            retryable=lambda: not chunks,
+            affinity=str(job.sessionid),
+            job_id=job.id,
+        )
+        response = "".join(chunks)
+        end = time.perf_counter()
+        if first_token is None:
+            first_token = end
+        timer.record("time_to_first_token", first_token - start)
+        timer.record("generation", end - first_token)
+        if log_enabled("DEBUG"):
+            logger.debug(
+                LogMessages.JobCompletionOutput,
+                userid=job.userid,
+                job_id=job.id,
+                model=model,
+                usage=usage,
+                **payload_fields(response=response),
+            )
+        return model, response, usage
 
     @trace.get_tracer(__name__).start_as_current_span("handle_job")
-    async def handle_job(self, job: BackgroundJob) -> Jobs:
+    async def handle_job(
+        self, job: BackgroundJob, timer: Optional[JobTimer] = None
+    ) -> Jobs:
         """handles a prompt job"""
+        if timer is None:
+            timer = JobTimer()
         start_time = datetime.now(UTC).timestamp()
-        llm_client = get_backend_client()
-        job, history_tokens, total_history_tokens = self.check_history_tokens(job)
-        history = job.get_history()
-        logger.debug(
-            LogMessages.JobHistory,
-            userid=job.userid,
-            id=job.id,
-            history=history,
-            history_length=len([]),
-            history_tokens=history_tokens,
-            total_history_tokens=total_history_tokens,
-        )
+        with timer.phase("token_budget"):
+            job, history_tokens, total_history_tokens = self.check_history_tokens(job)
+            history = job.get_history()
+        if log_enabled("DEBUG"):
+            logger.debug(
+                LogMessages.JobHistory,
+                userid=job.userid,
+                id=job.id,
+                history_length=len(history),
+                history_tokens=history_tokens,
+                total_history_tokens=total_history_tokens,
+                **payload_fields(history=history),
+            )
 
-        if Config().enable_do_bad_things_mode == "1":
+        if get_config().enable_do_bad_things_mode == "1":
             if "do bad things" in job.prompt:
                 from httpx import AsyncClient
 
@@ -198,33 +343,51 @@ class BackgroundPoller(threading.Thread):
                 async with AsyncClient() as httpx_client:
                     await httpx_client.get("https://example.com")
 
-        completion = await llm_client.chat.completions.create(
-            model=self.model_name,
-            messages=history,
-            temperature=0.7,
-            stream=False,
-        )
-
-        logger.debug(
-            LogMessages.JobCompletionOutput,
-            userid=job.userid,
-            job_id=job.id,
-            **completion.model_dump(),
-        )
-        if completion.usage is not None:
-            usage = completion.usage.model_dump()
+        if get_config().backend_stream:
+            model, response, usage = await self.stream_completion(job, history, timer)
         else:
-            usage = {}
+            # without streaming there's no first token time, so it's all generation
+            with timer.phase("generation"):
+                completion = await self.pool.call(
+                    lambda llm_client, extra_body: llm_client.chat.completions.create(
+                        model=self.model_name,
+                        messages=history,
+                        temperature=0.7,
+                        stream=False,
+                        extra_body=extra_body,
+                    ),
+                    affinity=str(job.sessionid),
+                    job_id=job.id,
+                )
+
+            if log_enabled("DEBUG"):
+                completion_fields = completion.model_dump()
+                choices = completion_fields.pop("choices")
+                logger.debug(
+                    LogMessages.JobCompletionOutput,
+                    userid=job.userid,
+                    job_id=job.id,
+                    **completion_fields,
+                    **payload_fields(choices=choices),
+                )
+            model = completion.model
+            response = completion.choices[0].message.content
+            if completion.usage is not None:
+                usage = completion.usage.model_dump()
+            else:
+                usage = {}
 
         trace.get_current_span().set_attribute("job_id", job.id.hex)
         trace.get_current_span().add_event("job_started", {"job_id": job.id.hex})
 
         job.runtime = datetime.now(UTC).timestamp() - start_time
-        job.response = completion.choices[0].message.content
+        job.response = response
         job.job_metadata = json.dumps(
             {
-                "model": completion.model,
+                "model": model,
                 "usage": usage,
+                # render, db_write and notify come later, they're in the metrics and logs
+                "timings": timer.as_metadata(),
             },
             default=str,
         )
@@ -254,17 +417,23 @@ class BackgroundPoller(threading.Thread):
 
         trace.get_current_span().set_status(JobStatus.Complete.to_otel_status())
 
-        logger.info(LogMessages.JobCompleted, **job.model_dump(exclude={"history"}))
+        logger.info(
+            LogMessages.JobCompleted, **log_payload(job.model_dump(exclude={"history"}))
+        )
         return Jobs.from_backgroundjob(job)
 
     def add_related_jobs(self, session: Session, backgroundjob: BackgroundJob) -> None:
-        """get related jobs"""
+        """get the earlier jobs in the session, oldest first so the prompt's the same up to the new job"""
         try:
-            query = select(Jobs).where(
-                Jobs.userid == backgroundjob.userid,
-                Jobs.status == JobStatus.Complete.value,
+            query = (
+                select(Jobs)
+                .where(
+                    Jobs.sessionid == backgroundjob.sessionid,
+                    Jobs.status == JobStatus.Complete.value,
+                    Jobs.created < backgroundjob.created,
+                )
+                .order_by(col(Jobs.created), col(Jobs.id))
             )
-            # TODO: sort the history by "created" field
             backgroundjob.history = [job for job in session.exec(query).all()]
         except Exception as error:
             logger.error(
@@ -274,47 +443,133 @@ class BackgroundPoller(threading.Thread):
                 id=backgroundjob.id,
             )
 
+    async def handle_claimed_job(
+        self, job_id: UUID, job: BackgroundJob, timer: JobTimer
+    ) -> Jobs:
+        """handle_job, renewing our lease while it runs so a slow job isn't requeued"""
+        renewal = asyncio.create_task(self.keep_lease(job_id))
+        try:
+            return await self.handle_job(job, timer)
+        finally:
+            renewal.cancel()
+            # the job's event loop ends with it, so its backend clients go too
+            await self.pool.close_clients()
+
+    async def keep_lease(self, job_id: UUID) -> None:
+        """renew the lease on job_id every third of the lease timeout until we lose it"""
+        lease_timeout = get_config().job_lease_timeout
+        while True:
+            await asyncio.sleep(lease_timeout / 3)
+            if not await asyncio.to_thread(self.renew_lease, job_id, lease_timeout):
+                logger.warning(LogMessages.JobLostClaim, job_id=job_id)
+                return
+
+    def renew_lease(self, job_id: UUID, lease_timeout: float) -> bool:
+        """push our lease on job_id out, in a session of its own"""
+        with Session(self.engine) as session:
+            job = session.get(Jobs, job_id)
+            return job is not None and job.renew_lease(
+                session, self.worker_id, lease_timeout
+            )
+
     @trace.get_tracer(__name__).start_as_current_span("process_prompt")
     def process_prompt(self, job: Jobs, session: Session) -> None:
         """handle the prompt processing"""
-        # update the job to say we're doing the thing
-        job.mark_running(session)
-
-        backgroundjob = BackgroundJob.from_jobs(job)
-        self.add_related_jobs(session, backgroundjob)
+        timer = JobTimer()
+        timer.record("queue_wait", queue_wait(job.created))
+        # update the job to say we're doing the thing, unless another poller beat us to it
+        with timer.phase("claim"):
+            lease_timeout = get_config().job_lease_timeout
+            if not job.claim(session, self.worker_id, lease_timeout):
+                logger.debug(LogMessages.JobClaimedElsewhere, job_id=job.id)
+                return
+            jobevents.publish_status(job.id, job.status)
+
+        with timer.phase("history_load"):
+            backgroundjob = BackgroundJob.from_jobs(job)
+            self.add_related_jobs(session, backgroundjob)
 
         try:
-            start_log_entry = {**backgroundjob.model_dump()}
-            history = start_log_entry.pop(
-                "history"
-            )  # need to strip this off because it's just huge
-            logger.debug("job history", id=job.id, userid=job.userid, history=history)
-
-            logger.info(LogMessages.JobStarted, **start_log_entry)
+            if log_enabled("DEBUG"):
+                logger.debug(
+                    "job history",
+                    id=job.id,
+                    userid=job.userid,
+                    **payload_fields(
+                        history=backgroundjob.model_dump(include={"history"})["history"]
+                    ),
+                )
+            # the history's just huge, so it's only in the debug record
+            logger.info(
+                LogMessages.JobStarted,
+                **log_payload(backgroundjob.model_dump(exclude={"history"})),
+            )
             # here's where we pass it to the backend
-            background_job_result = self.event_loop.run_until_complete(
-                self.handle_job(backgroundjob)
+            # prompts run in their own threads, so each gets its own event loop
+            background_job_result = asyncio.run(
+                self.handle_claimed_job(job.id, backgroundjob, timer)
             )
             job.updated = datetime.now(UTC)
             background_job_result.model_dump(exclude_unset=False, exclude_none=False)
             for key in background_job_result.model_fields.keys():
-                if key in job.model_fields:
+                if key in job.model_fields and key not in CLAIM_FIELDS:
                     setattr(job, key, getattr(background_job_result, key))
-            logger.debug("Saving job: {}", job.model_dump())
-            session.add(job)
-            session.commit()
-            session.refresh(job)
+            if job.status == JobStatus.Complete.value:
+                with timer.phase("render"):
+                    render_job_response(job)
+            logger.opt(lazy=True).debug(
+                "Saving job: {}", lambda: log_payload(job.model_dump())
+            )
+            with timer.phase("db_write"):
+                # it was requeued while we were working on it, whoever has it now gets to save it
+                if not job.hold_claim(session, self.worker_id):
+                    logger.warning(LogMessages.JobLostClaim, job_id=job.id)
+                    return
+                session.add(job)
+                session.commit()
+                session.refresh(job)
+            with timer.phase("notify"):
+                jobevents.publish_status(job.id, job.status)
+            timer.observe()
+            logger.info(
+                LogMessages.JobTimings,
+                job_id=job.id,
+                userid=job.userid,
+                **timer.as_metadata(),
+            )
         # something went wrong, set it to error status
         except Exception as error:
             # clear out the existing cache of objects
+            session.rollback()
             session.expire_all()
+            # the backend's having a moment, so wait it out in the queue rather than fail
+            if is_transient(error):
+                logger.warning(
+                    LogMessages.JobRequeuedBackendUnavailable,
+                    job_id=job.id,
+                    error=str(error),
+                )
+                # only this job, the others this poller's running are still going fine
+                requeue_jobs(
+                    session,
+                    owner=self.worker_id,
+                    max_attempts=get_config().job_max_attempts,
+                    job_id=job.id,
+                )
+                jobevents.publish_status(job.id, session.get_one(Jobs, job.id).status)
+                return
             job = session.exec(select(Jobs).where(Jobs.id == job.id)).one()
+            if not job.hold_claim(session, self.worker_id):
+                logger.warning(
+                    LogMessages.JobLostClaim, job_id=job.id, error=str(error)
+                )
+                return
             job.status = JobStatus.Error.value
             trace.get_current_span().set_status(JobStatus.Error.to_otel_status())
             if "Connection error" in str(error):
                 logger.error(
                     "Failed to connect to backend!",
-                    **job.model_dump(),
+                    **log_payload(job.model_dump()),
                 )
                 job.response = "Failed to connect to backend, try again please!"
 
@@ -323,40 +578,67 @@ class BackgroundPoller(threading.Thread):
                 logger.error(
                     "error processing job",
                     error=job.response,
-                    **job.model_dump(),
+                    **log_payload(job.model_dump()),
                 )
 
             job.updated = datetime.now(UTC)
             session.add(job)
             session.commit()
+            jobevents.publish_status(job.id, job.status)
+
+    def process_outstanding_prompts(self, session: Session, wait: bool = True) -> None:
+        """start as many waiting prompts as the backends have room for, each in its own thread
+
+        with wait it returns once they're all done, the run loop doesn't wait so it can
+        keep every backend busy"""
+        self.workers = [worker for worker in self.workers if worker.is_alive()]
+        # nothing gets claimed while the backends are down
+        room = self.pool.capacity() - len(self.workers)
+        if room > 0:
+            jobs = session.exec(
+                select(Jobs)
+                .where(Jobs.status == JobStatus.Created.value)
+                .order_by(col(Jobs.created))
+                .limit(room)
+            ).all()
+            for job in jobs:
+                worker = threading.Thread(
+                    target=self.process_prompt_by_id,
+                    args=(job.id,),
+                    name=f"chatui-prompt-{job.id}",
+                    # like the poller, so stop() can give up on them
+                    daemon=True,
+                )
+                worker.start()
+                self.workers.append(worker)
+        if wait:
+            for worker in self.workers:
+                worker.join()
+        # don't just infinispin
+        time.sleep(0.1)
 
-    def process_outstanding_prompts(self, session: Session) -> None:
-        """process any outstanding prompt requests"""
-        try:
-            # get any new prompt requests
-            job = session.exec(
-                select(Jobs).where(Jobs.status == JobStatus.Created.value)
-            ).first()
+    def process_prompt_by_id(self, job_id: UUID) -> None:
+        """run a prompt in a worker thread, with its own database session"""
+        with Session(self.engine) as session:
+            job = session.get(Jobs, job_id)
             if job is not None:
                 self.process_prompt(job, session)
-        except MultipleResultsFound as error:
-            logger.error("Somehow found multiple duplicate results? error: {}", error)
-
-        except NoResultFound:
-            # logger.debug(LogMessages.NoJobs)
-            pass
-        # don't just infinispin
-        time.sleep(0.1)
 
     async def process_outstanding_analyses(self, session: Session) -> Optional[UUID]:
         """if there's an outstanding analysis request, let's handle that
 
         returns the UUID processed, or None if nothing was processed"""
+        if not self.pool.ready():
+            return None
         query = select(JobAnalysis).where(JobAnalysis.status == JobStatus.Created.value)
 
-        try:
-            analysis_job = session.exec(query).one()
-        except NoResultFound:
+        analysis_job = session.exec(query).first()
+        if analysis_job is None:
+            return None
+        if not analysis_job.claim(session):
+            logger.debug(
+                LogMessages.JobClaimedElsewhere, analysisid=analysis_job.analysisid
+            )
             return None
 
         job_query = select(Jobs).where(Jobs.id == analysis_job.jobid)
@@ -409,8 +691,6 @@ class BackgroundPoller(threading.Thread):
         # now we hand it to the LLM to process
         start_time = datetime.now(UTC).timestamp()
 
-        client = get_backend_client()
-
         # build the prompt for the thingie
         message = f"{analysis_job.preprompt}\n"
         if analysis_job.analysis_type in [
@@ -433,16 +713,40 @@ class BackgroundPoller(threading.Thread):
         logger.info(
             LogMessages.AnalysisJobStarting,
             start_time=start_time,
-            full_prompt=message,
-            **analysis_job.model_dump(mode="json"),
+            full_prompt=log_payload(message),
+            **log_payload(analysis_job.model_dump(mode="json")),
         )
 
-        completion = await client.chat.completions.create(
-            model=self.model_name,
-            messages=history,
-            temperature=0.7,
-            stream=False,
-        )
+        try:
+            completion = await self.pool.call(
+                lambda client, extra_body: client.chat.completions.create(
+                    model=self.model_name,
+                    messages=history,
+                    temperature=0.7,
+                    stream=False,
+                    extra_body=extra_body,
+                ),
+                analysisid=analysis_job.analysisid,
+            )
+        except Exception as error:
+            if not is_transient(error):
+                raise
+            logger.warning(
+                LogMessages.JobRequeuedBackendUnavailable,
+                analysisid=analysis_job.analysisid,
+                error=str(error),
+            )
+            max_attempts = get_config().job_max_attempts
+            if (analysis_job.attempts or 0) >= max_attempts:
+                logger.warning(
+                    LogMessages.JobAbandoned,
+                    analysisid=analysis_job.analysisid,
+                    max_attempts=max_attempts,
+                )
+                analysis_job.mark_error(session, too_many_attempts(max_attempts))
+                return None
+            analysis_job.mark_running(session, JobStatus.Created)
+            return None
 
         if completion.usage is not None:
             usage = completion.usage.model_dump()
@@ -462,7 +766,7 @@ class BackgroundPoller(threading.Thread):
         logger.info(
             LogMessages.AnalysisJobCompletionOutput,
             start_time=start_time,
-            **analysis_job.model_dump(mode="json"),
+            **log_payload(analysis_job.model_dump(mode="json")),
         )
 
         # # so it's slightly easier to parse in the logs
@@ -480,14 +784,42 @@ class BackgroundPoller(threading.Thread):
         session.refresh(analysis_job)
         return analysis_job.analysisid
 
+    def requeue_abandoned_jobs(self, session: Session) -> None:
+        """every so often, put back running jobs whose poller's gone away without finishing them"""
+        config = get_config()
+        if time.monotonic() - self.last_requeue_check < config.job_lease_check_interval:
+            return
+        self.last_requeue_check = time.monotonic()
+        requeue_jobs(session, max_attempts=config.job_max_attempts)
+
     def run(self) -> None:
         """polls for jobs to run"""
         while self.message == "run":
             with Session(self.engine) as session:
-                # do the prompts
-                self.process_outstanding_prompts(session)
+                self.requeue_abandoned_jobs(session)
+                # start the prompts, they run while we go round again
+                self.process_outstanding_prompts(session, wait=False)
                 # do the prompt analysis
                 self.event_loop.run_until_complete(
                     self.process_outstanding_analyses(session)
                 )
+        # let the prompts that are running finish, stop() decides how long that can take
+        for worker in self.workers:
+            worker.join()
+        self.event_loop.run_until_complete(self.pool.close_clients())
         logger.info(LogMessages.BackgroundPollerShutdown)
+
+    def stop(self, timeout: float) -> None:
+        """stop picking up jobs, give the ones that are running timeout seconds to finish, then requeue them"""
+        self.message = "stop"
+        if self.is_alive():
+            self.join(timeout)
+        if self.is_alive():
+            logger.warning(
+                LogMessages.BackgroundPollerDrainTimeout,
+                worker_id=self.worker_id,
+                timeout=timeout,
+            )
+        # anything that's still running under our name won't be finished by us now
+        with Session(self.engine) as session:
+            requeue_jobs(session, owner=self.worker_id)
@@ -1,8 +1,11 @@
+import asyncio
+from collections import OrderedDict
 from enum import StrEnum
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, Generator, List, Optional, TextIO, Tuple, Union
 from uuid import UUID
 import click
 from loguru import logger
@@ -11,13 +14,29 @@ import requests
 from chat_ui.db import ChatUiDBSession, JobAnalysis, Users
 from chat_ui.enums import Urls
 from chat_ui.forms import NewJobForm, SessionUpdateForm, UserForm
-from chat_ui.models import AnalysisType, AnalyzeForm, Job, JobDetail, RequestType
+from chat_ui.models import (
+    AnalysisType,
+    AnalyzeForm,
+    Job,
+    JobDetail,
+    JobEvent,
+    JobEventType,
+    JobStatus,
+    RequestType,
+)
 
 # Usage:
 # Environment variables
 # CHATUI_TOOL_HOSTNAME: The hostname of the server
 # CHATUI_TOOL_PORT: The port of the server
 
+# how long a single long-poll request asks the server to wait
+JOB_WAIT_CHUNK = 30.0
+# how many jobs to send in each bulk request, the server's limit is Config.job_bulk_max
+JOB_BULK_CHUNK = 500
+# how many responses a client keeps for If-None-Match
+DEFAULT_ETAG_CACHE_SIZE = 1024
+
 
 def make_url(hostname: str, port: int | str, skip_tls: bool) -> str:
     """create a url from the hostname and port"""
@@ -26,6 +45,31 @@ def make_url(hostname: str, port: int | str, skip_tls: bool) -> str:
     return f"https://{hostname}:{port}"
 
 
+class ETagCache:
+    """url -> (etag, parsed body), so polling unchanged things gets a 304
+
+    it's an LRU, so a long-running client that fetches lots of urls doesn't keep them all"""
+
+    def __init__(self, maxsize: int = DEFAULT_ETAG_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._items: OrderedDict[str, Tuple[str, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Tuple[str, Any]]:
+        cached = self._items.get(key)
+        if cached is not None:
+            self._items.move_to_end(key)
+        return cached
+
+    def put(self, key: str, etag: str, data: Any) -> None:
+        self._items[key] = (etag, data)
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 class ChatUIClient:
 
     def __init__(
@@ -34,12 +78,14 @@ class ChatUIClient:
         port: int,
         skip_tls: bool = False,
         session: Optional[requests.Session] = None,
+        etag_cache_size: int = DEFAULT_ETAG_CACHE_SIZE,
     ):
         self.base_url = make_url(hostname, port, skip_tls)
         self.hostname = hostname
         self.port = port
         self.skip_tls = skip_tls
         self.session: Optional[requests.Session] = session
+        self.etag_cache = ETagCache(etag_cache_size)
 
     def _get_session(self) -> requests.Session:
         """get a requests session"""
@@ -51,6 +97,31 @@ class ChatUIClient:
         self.session = session
         return session
 
+    def _get_json(
+        self,
+        session: requests.Session,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[requests.Response, Any]:
+        """GET some JSON, sending the ETag from last time so an unchanged response comes from the cache,
+        the body's None if the request failed"""
+        headers = dict(headers or {})
+        key = requests.Request("GET", url, params=params).prepare().url or url
+        cached = self.etag_cache.get(key)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+        res = session.get(url, params=params, headers=headers)
+        if res.status_code == 304 and cached is not None:
+            return res, cached[1]
+        if res.status_code != 200:
+            return res, None
+        data = res.json()
+        etag = res.headers.get("ETag")
+        if etag is not None:
+            self.etag_cache.put(key, etag, data)
+        return res, data
+
     def get_jobs(
         self,
         userid: Optional[UUID] = None,
@@ -74,12 +145,12 @@ class ChatUIClient:
         else:
             url = f"{self.base_url}{Urls.AdminJobs}"
             headers = self._admin_header(admin_password)
-        res = session.get(url, params=params, headers=headers)
-        if res.status_code != 200:
+        res, data = self._get_json(session, url, params=params, headers=headers)
+        if data is None:
             logger.error(f"Failed to get jobs: {res.text}")
             return []
         else:
-            return [Job.model_validate(job) for job in res.json()]
+            return [Job.model_validate(job) for job in data]
 
     def get_job(
         self, userid: UUID, jobid: UUID, session: Optional[requests.Session] = None
@@ -88,9 +159,63 @@ class ChatUIClient:
         if session is None:
             session = self._get_session()
 
-        res = session.get(f"{self.base_url}{Urls.Jobs}/{userid}/{jobid}")
-        res.raise_for_status()
-        return JobDetail.model_validate(res.json())
+        res, data = self._get_json(session, f"{self.base_url}{Urls.Jobs}/{userid}/{jobid}")
+        if data is None:
+            res.raise_for_status()
+        return JobDetail.model_validate(data)
+
+    def wait_for_job(
+        self,
+        userid: UUID,
+        jobid: UUID,
+        timeout: float = 30.0,
+        session: Optional[requests.Session] = None,
+    ) -> JobDetail:
+        """wait for a job to finish, returns the job as it is after timeout seconds if it hasn't"""
+        if session is None:
+            session = self._get_session()
+        deadline = time.monotonic() + timeout
+        while True:
+            # the server caps how long a single request can wait, so ask in chunks
+            remaining = max(0.0, deadline - time.monotonic())
+            wait = min(remaining, JOB_WAIT_CHUNK)
+            res = session.get(
+                f"{self.base_url}{Urls.Jobs}/{userid}/{jobid}/wait",
+                params={"timeout": wait},
+                timeout=wait + 30,
+            )
+            res.raise_for_status()
+            job = JobDetail.model_validate(res.json())
+            if JobStatus(job.status).is_terminal() or remaining <= wait:
+                return job
+
+    def stream_job(
+        self,
+        userid: UUID,
+        jobid: UUID,
+        session: Optional[requests.Session] = None,
+    ) -> Generator[Union[JobEvent, JobDetail], None, None]:
+        """follow a job's server-sent events, yields JobEvents as they happen then the finished JobDetail"""
+        if session is None:
+            session = self._get_session()
+        with session.get(
+            f"{self.base_url}{Urls.Jobs}/{userid}/{jobid}/events",
+            headers={"Accept": "text/event-stream"},
+            stream=True,
+        ) as res:
+            res.raise_for_status()
+            event: Optional[str] = None
+            for line in res.iter_lines(decode_unicode=True):
+                if line.startswith("event:"):
+                    event = line.removeprefix("event:").strip()
+                elif line.startswith("data:") and event is not None:
+                    data = line.removeprefix("data:").strip()
+                    if event == JobEventType.Complete:
+                        yield JobDetail.model_validate_json(data)
+                        return
+                    yield JobEvent.model_validate_json(data)
+                elif not line:
+                    event = None
 
     def create_or_update_user(
         self,
@@ -181,24 +306,18 @@ class ChatUIClient:
             params = {"userid": userid.hex} if userid is not None else {}
             headers = self._admin_header(admin_password)
 
-        res = session.get(
-            url,
-            headers=headers,
-            params=params,
-        )
+        res, data = self._get_json(session, url, params=params, headers=headers)
 
-        if res.status_code != 200:
+        if data is None:
             logger.error(f"Failed to get sessions: {res.text}")
             return []
         else:
-            if len(res.json()) == 0:
+            if len(data) == 0:
                 logger.warning("No sessions found", file=sys.stderr)
                 return []
             else:
 
-                return [
-                    ChatUiDBSession.model_validate(session) for session in res.json()
-                ]
+                return [ChatUiDBSession.model_validate(session) for session in data]
 
     def create_job(
         self,
@@ -229,6 +348,27 @@ class ChatUIClient:
 
         return Job.model_validate(res.json())
 
+    def create_jobs(
+        self,
+        jobs: List[NewJobForm],
+        session: Optional[requests.Session] = None,
+        chunk_size: int = JOB_BULK_CHUNK,
+    ) -> List[Job]:
+        """push lots of jobs, chunk_size at a time, raises if any of the chunks fail"""
+        if session is None:
+            session = self._get_session()
+
+        result: List[Job] = []
+        for start in range(0, len(jobs), chunk_size):
+            payload = [job.model_dump(mode="json") for job in jobs[start : start + chunk_size]]
+            res = session.post(f"{self.base_url}{Urls.JobBulk}", json=payload)
+            if res.status_code != 200:
+                logger.error("Failed to create jobs: {}", res.text)
+                res.raise_for_status()
+            result.extend(Job.model_validate(job) for job in res.json())
+        logger.success("Successfully created {} jobs!", len(result))
+        return result
+
     def get_users(
         self,
         admin_password: str,
@@ -427,6 +567,7 @@ def session(
 class JobCommands(StrEnum):
     Get = "get"
     Create = "create"
+    Bulk = "bulk"
 
 
 @cli.command()
@@ -443,6 +584,13 @@ class JobCommands(StrEnum):
 @click.option("--skip-tls", "-S", is_flag=True, help="Connect to HTTP")
 @click.option("--prompt", help="The prompt for the job")
 @click.option("--sessionid", help="The sessionid for the job")
+@click.option(
+    "--file",
+    "filename",
+    type=click.File("r"),
+    default="-",
+    help="NDJSON of jobs for bulk, one object per line with a prompt and optionally sessionid/userid/request_type",
+)
 def job(
     userid: UUID,
     skip_tls: bool = False,
@@ -451,6 +599,7 @@ def job(
     hostname: str = os.getenv("CHATUI_TOOL_HOSTNAME", "localhost"),
     prompt: Optional[str] = None,
     sessionid: Optional[str] = None,
+    filename: Optional[TextIO] = None,
 ) -> None:
     """jobs management"""
 
@@ -496,6 +645,185 @@ def job(
             request_type=RequestType.Plain,
         )
         print(json.dumps(result, indent=4))
+    elif command == JobCommands.Bulk:
+        if filename is None:
+            click.echo("You must provide a file of jobs", err=True)
+            sys.exit(1)
+        defaults = {"userid": userid, "request_type": RequestType.Plain.value}
+        if sessionid is not None:
+            defaults["sessionid"] = sessionid
+        try:
+            jobs = [
+                NewJobForm.model_validate({**defaults, **json.loads(line)})
+                for line in filename
+                if line.strip()
+            ]
+        except ValueError as error:
+            click.echo(f"Invalid job in file: {error}", err=True)
+            sys.exit(1)
+
+        click.echo(f"Creating {len(jobs)} jobs", err=True)
+        for created in client.create_jobs(jobs):
+            print(created.model_dump_json())
+
+
+@cli.command()
+@click.option(
+    "--hostname",
+    default=os.getenv("CHATUI_TOOL_HOSTNAME", "localhost"),
+    help="The hostname of the server",
+)
+@click.option(
+    "--port",
+    default=os.getenv("CHATUI_TOOL_PORT", "9195"),
+    help="The port of the server",
+)
+@click.option("--skip-tls", "-S", is_flag=True, help="Connect to HTTP")
+@click.option("--users", default=10, show_default=True, help="How many simulated users")
+@click.option("--jobs-per-user", default=5, show_default=True, help="How many jobs each user submits")
+@click.option(
+    "--think-time", default=1.0, show_default=True, help="Mean seconds each user waits between jobs"
+)
+@click.option(
+    "--mode",
+    type=click.Choice(["http", "websocket", "mixed"]),
+    default="mixed",
+    show_default=True,
+    help="Follow jobs with server-sent events, websocket polling like the web UI, or half and half",
+)
+@click.option("--prompt", help="The prompt every job sends")
+@click.option(
+    "--job-timeout", default=300.0, show_default=True, help="Seconds before a job counts as failed"
+)
+@click.option(
+    "--max-concurrency", default=1000, show_default=True, help="Most HTTP requests in flight at once"
+)
+@click.option(
+    "--output", "-o", type=click.File("w"), help="Write the JSON report here, for comparing runs"
+)
+def loadtest(
+    hostname: str,
+    port: str,
+    skip_tls: bool,
+    users: int,
+    jobs_per_user: int,
+    think_time: float,
+    mode: str,
+    prompt: Optional[str],
+    job_timeout: float,
+    max_concurrency: int,
+    output: Optional[TextIO],
+) -> None:
+    """simulate users submitting jobs and waiting for them, then report the latencies"""
+    # imported here because the load test imports this module for the client
+    from chat_ui.loadtest import LoadTestMode, LoadTestSettings, run_loadtest
+
+    settings = LoadTestSettings(
+        users=users,
+        jobs_per_user=jobs_per_user,
+        think_time=think_time,
+        mode=LoadTestMode(mode),
+        job_timeout=job_timeout,
+        max_concurrency=max_concurrency,
+    )
+    if prompt is not None:
+        settings.prompt = prompt
+    report = asyncio.run(run_loadtest(hostname, int(port), settings, skip_tls=skip_tls))
+    click.echo(report.summary(), err=True)
+    if output is not None:
+        output.write(report.model_dump_json(indent=2))
+    else:
+        print(report.model_dump_json(indent=2))
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", default=9196, show_default=True, help="The port llama.cpp would be on")
+@click.option("--time-to-first-token", default=0.05, show_default=True, help="Seconds before the first token")
+@click.option("--tokens-per-second", default=100.0, show_default=True)
+@click.option("--response-tokens", default=32, show_default=True, help="Tokens in each response")
+@click.option("--slots", default=4, show_default=True, help="Completions that run at once")
+@click.option("--error-rate", default=0.0, show_default=True, help="Fraction of completions that fail")
+@click.option(
+    "--timeout-rate", default=0.0, show_default=True, help="Fraction of completions that hang for --hang-seconds"
+)
+@click.option("--hang-seconds", default=30.0, show_default=True)
+@click.option("--seed", default=0, show_default=True)
+def fakebackend(
+    host: str,
+    port: int,
+    time_to_first_token: float,
+    tokens_per_second: float,
+    response_tokens: int,
+    slots: int,
+    error_rate: float,
+    timeout_rate: float,
+    hang_seconds: float,
+    seed: int,
+) -> None:
+    """run a fake OpenAI-compatible backend with predictable timings, instead of llama.cpp"""
+    import uvicorn
+
+    from chat_ui.fakebackend import FakeBackend, FakeBackendSettings
+
+    backend = FakeBackend(
+        FakeBackendSettings(
+            time_to_first_token=time_to_first_token,
+            tokens_per_second=tokens_per_second,
+            response_tokens=response_tokens,
+            slots=slots,
+            error_rate=error_rate,
+            timeout_rate=timeout_rate,
+            hang_seconds=hang_seconds,
+            seed=seed,
+        )
+    )
+    uvicorn.run(backend.app, host=host, port=port)
+
+
+@cli.command()
+@click.option(
+    "--db-path",
+    required=True,
+    type=click.Path(dir_okay=False),
+    help="The sqlite database to fill, don't point it at a real one",
+)
+@click.option("--users", default=1000, show_default=True)
+@click.option("--sessions-per-user", default=3.0, show_default=True, help="Mean sessions per user")
+@click.option("--jobs-per-session", default=10.0, show_default=True, help="Mean jobs per session")
+@click.option("--feedback-rate", default=0.1, show_default=True, help="Fraction of jobs with feedback")
+@click.option("--analysis-rate", default=0.02, show_default=True, help="Fraction of jobs with an analysis")
+@click.option("--pending-jobs", default=10, show_default=True, help="Jobs left waiting for the poller")
+@click.option("--seed", default=0, show_default=True)
+def datagen(
+    db_path: str,
+    users: int,
+    sessions_per_user: float,
+    jobs_per_session: float,
+    feedback_rate: float,
+    analysis_rate: float,
+    pending_jobs: int,
+    seed: int,
+) -> None:
+    """fill a database with generated users, sessions and jobs, for testing how things scale"""
+    import sqlmodel
+
+    from chat_ui.datagen import DataGenSettings, generate_data
+
+    engine = sqlmodel.create_engine(f"sqlite:///{os.path.expanduser(db_path)}")
+    stats = generate_data(
+        engine,
+        DataGenSettings(
+            users=users,
+            sessions_per_user=sessions_per_user,
+            jobs_per_session=jobs_per_session,
+            feedback_rate=feedback_rate,
+            analysis_rate=analysis_rate,
+            pending_jobs=pending_jobs,
+            seed=seed,
+        ),
+    )
+    print(stats.model_dump_json(indent=2))
 
 
 if __name__ == "__main__":
@@ -2,8 +2,10 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Type
-from pydantic import Field
+import threading
+import time
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type
+from pydantic import BaseModel, Field
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
@@ -12,6 +14,20 @@ from pydantic_settings import (
 from pydantic.fields import FieldInfo
 
 CONFIG_FILENAME = "~/.config/chat-ui.json"
+ENV_PREFIX = "CHATUI_"
+
+
+def load_config_file() -> Optional[Dict[str, Any]]:
+    """the contents of the config file, None if it's missing or broken"""
+    try:
+        with Path(CONFIG_FILENAME).expanduser().open(encoding="utf-8") as file_handle:
+            content = json.load(file_handle)
+        if isinstance(content, dict):
+            return content
+        logging.debug("Config file %s doesn't hold an object", CONFIG_FILENAME)
+    except Exception as error:
+        logging.debug("Failed to load config file %s: %s", CONFIG_FILENAME, error)
+    return None
 
 
 class JsonConfigSettingsSource(PydanticBaseSettingsSource):
@@ -20,14 +36,15 @@ class JsonConfigSettingsSource(PydanticBaseSettingsSource):
     at the project's root.
     """
 
+    def __init__(self, settings_cls: Type[BaseSettings]) -> None:
+        super().__init__(settings_cls)
+        # read the file once for all the fields, not once per field
+        self.file_content = load_config_file()
+
     def get_field_value(self, field: FieldInfo, field_name: str) -> Tuple[Any, str, bool]:
-        try:
-            file_content_json = json.load(Path(CONFIG_FILENAME).expanduser().open(encoding="utf-8"))
-            field_value = file_content_json.get(field_name)
-            return field_value, field_name, False
-        except Exception as error:
-            logging.debug("Failed to load config file %s: %s", CONFIG_FILENAME, error)
-        return (None, "", False)
+        if self.file_content is None:
+            return (None, "", False)
+        return self.file_content.get(field_name), field_name, False
 
     def prepare_field_value(self, field_name: str, field: FieldInfo, value: Any, value_is_complex: bool) -> Any:
         return value
@@ -44,6 +61,24 @@ class JsonConfigSettingsSource(PydanticBaseSettingsSource):
         return d
 
 
+class BackendConfig(BaseModel):
+    """one llama.cpp server in the pool"""
+
+    url: str
+    # falls back to backend_api_key
+    api_key: Optional[str] = None
+    # a backend with twice the weight gets about twice the requests when they're all busy
+    weight: float = Field(1.0, gt=0)
+    # how many requests each process sends it at once, so with several web workers or `chat-ui worker`
+    # processes sharing a backend, divide llama.cpp's --parallel between them
+    max_concurrency: int = Field(1, ge=1)
+    # what it's called in the logs and metrics, defaults to the url
+    name: Optional[str] = None
+    # llama.cpp's --parallel, with session affinity each session's pinned to one of them with id_slot and
+    # cache_prompt, leave it unset for servers that don't take those
+    slots: Optional[int] = Field(None, ge=1)
+
+
 class Config(BaseSettings):
     """Configuration object for the chat_ui application"""
 
@@ -55,13 +90,100 @@ class Config(BaseSettings):
         "You are an intelligent assistant. You always provide well-reasoned answers that are both correct and helpful."
     )
     backend_temperature: float = 0.7
+    backend_stream: bool = Field(False, description="Stream completions from the backend so clients get tokens early")
+    # set backends to spread jobs over several servers, otherwise it's just backend_url
+    backends: List[BackendConfig] = Field(
+        default_factory=list, description="The backend servers to send jobs to, instead of backend_url"
+    )
+    backend_max_concurrency: int = Field(1, description="How many requests each process sends backend_url at once")
+    backend_slots: Optional[int] = Field(None, description="llama.cpp's --parallel for backend_url, see BackendConfig")
+    # session_affinity keeps each session on the same backend and slot, so it can reuse its prompt cache
+    backend_routing: Literal["least_outstanding", "session_affinity"] = Field(
+        "least_outstanding", description="How jobs are spread over the backends"
+    )
+    # transient backend errors are retried, and enough of them in a row stop the pollers claiming jobs for a while
+    backend_retry_attempts: int = Field(3, description="Tries for each backend call, including the first")
+    backend_retry_base_delay: float = Field(0.5, description="Seconds before the first retry, doubling each time")
+    backend_retry_max_delay: float = Field(10.0, description="Longest wait between retries")
+    backend_circuit_failure_threshold: int = Field(
+        5, description="Backend failures in a row before pollers stop sending it work"
+    )
+    backend_circuit_reset_timeout: float = Field(
+        30.0, description="Seconds to leave the backend alone before checking if it's back"
+    )
 
-    model_config = SettingsConfigDict(env_prefix="CHATUI_")
+    model_config = SettingsConfigDict(env_prefix=ENV_PREFIX)
 
     admin_password: Optional[str] = None
 
     enable_do_bad_things_mode: str = Field("false", description="Enable bad things mode")
 
+    # websocket limits, these apply to each web worker process
+    websocket_max_connections: int = Field(5000, description="Maximum open websockets")
+    websocket_max_per_user: int = Field(8, description="Maximum open websockets for a single userid")
+    websocket_heartbeat_interval: float = Field(30.0, description="Seconds between pings to each websocket")
+    websocket_idle_timeout: float = Field(
+        90.0, description="Seconds without hearing from a websocket client before it's disconnected"
+    )
+
+    # turn this off on the web servers when `chat-ui worker` processes are running the jobs
+    enable_background_poller: bool = Field(
+        True, description="Run the job and analysis poller inside each web worker process"
+    )
+    # a poller holds a job for job_lease_timeout and renews it while the job runs,
+    # once it stops renewing another poller can take the job back off it
+    job_lease_timeout: float = Field(
+        600.0, description="Seconds a running job is held by its poller before it's treated as abandoned"
+    )
+    job_lease_check_interval: float = Field(30.0, description="Seconds between checks for abandoned running jobs")
+    job_max_attempts: int = Field(
+        3, description="How many times a job or analysis is tried before it's given up on and set to error"
+    )
+    shutdown_drain_timeout: float = Field(
+        30.0, description="Seconds to let the running job finish on shutdown before it's put back in the queue"
+    )
+
+    job_bulk_max: int = Field(1000, description="Most jobs that can be created in one bulk request")
+    response_html_cache_size: int = Field(1024, description="How many rendered job responses to keep in memory")
+
+    log_level: str = Field("DEBUG", description="Lowest level of log records to write")
+    log_max_field_length: int = Field(
+        2000, description="Longest prompt, response or history text to put in a debug record, 0 for no limit"
+    )
+    # the info job records are the data record, so they're kept whole unless this is set
+    log_job_record_max_length: int = Field(
+        0, description="Longest prompt or response to put in the job start, complete and error records, 0 for no limit"
+    )
+    log_payload_sample_rate: float = Field(
+        1.0, description="Fraction of debug records that include the conversation history and completion"
+    )
+    # logs go to a writer thread, so a slow stdout can't hold up requests
+    log_queue_size: int = Field(10000, description="Most log records waiting to be written")
+    log_queue_full: Literal["drop", "block"] = Field(
+        "drop", description="What to do with log records when the queue's full, drop them or wait for space"
+    )
+    log_batch_size: int = Field(256, description="Most log records written at once")
+
+    config_reload_interval: float = Field(
+        5.0, description="Seconds between checks for changes to the config file, 0 turns off reloading"
+    )
+
+    # long-polling for job updates
+    job_wait_max_timeout: float = Field(60.0, description="Longest a client can wait on a job in one request")
+    job_wait_recheck_interval: float = Field(
+        5.0, description="Seconds between database checks while waiting on a job, for changes made by other processes"
+    )
+
+    def backend_pool(self) -> List[BackendConfig]:
+        """the backends to use, backends if it's set or otherwise backend_url on its own"""
+        if self.backends:
+            return self.backends
+        if self.backend_url is None:
+            return []
+        return [
+            BackendConfig(url=self.backend_url, max_concurrency=self.backend_max_concurrency, slots=self.backend_slots)
+        ]
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -77,3 +199,66 @@ class Config(BaseSettings):
             env_settings,
             file_secret_settings,
         )
+
+
+def config_file_mtime() -> Optional[int]:
+    try:
+        return Path(CONFIG_FILENAME).expanduser().stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def config_environment() -> Tuple[Tuple[str, str], ...]:
+    """the environment variables that can change the config"""
+    return tuple(sorted((key, value) for key, value in os.environ.items() if key.startswith(ENV_PREFIX)))
+
+
+class ConfigCache:
+    """a process-wide Config, so hot paths don't re-read the config file
+
+    it's rebuilt when the CHATUI_ environment variables change, or when the config file's mtime
+    changes, which is only checked every config_reload_interval seconds"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._config: Optional[Config] = None
+        self._environment: Tuple[Tuple[str, str], ...] = ()
+        self._mtime: Optional[int] = None
+        self._next_check = 0.0
+
+    def get(self) -> Config:
+        config = self._config
+        environment = config_environment()
+        now = time.monotonic()
+        if config is not None and environment == self._environment:
+            if config.config_reload_interval <= 0 or now < self._next_check:
+                return config
+        with self._lock:
+            if self._config is None or environment != self._environment:
+                self._load(environment)
+            elif self._config.config_reload_interval > 0 and now >= self._next_check:
+                if config_file_mtime() != self._mtime:
+                    logging.info("Config file %s changed, reloading it", CONFIG_FILENAME)
+                    self._load(environment)
+            assert self._config is not None
+            self._next_check = now + self._config.config_reload_interval
+            return self._config
+
+    def _load(self, environment: Tuple[Tuple[str, str], ...]) -> None:
+        # stat before reading, so a write that lands in between gets picked up next time
+        self._mtime = config_file_mtime()
+        self._environment = environment
+        self._config = Config()
+
+    def clear(self) -> None:
+        """forget the current config, the next get() builds a new one"""
+        with self._lock:
+            self._config = None
+
+
+config_cache = ConfigCache()
+
+
+def get_config() -> Config:
+    """the current config, don't modify it since it's shared"""
+    return config_cache.get()
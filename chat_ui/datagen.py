@@ -0,0 +1,207 @@
+""" fills a database with made-up users, sessions, jobs, feedback and analyses, shaped like a busy production one """
+
+from datetime import UTC, datetime, timedelta
+import math
+import random
+import time
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from loguru import logger
+from pydantic import BaseModel
+import sqlalchemy
+import sqlmodel
+
+from chat_ui.fakebackend import VOCABULARY
+from chat_ui.models import AnalysisType, JobStatus, RequestType
+
+# rows per insert statement
+INSERT_BATCH = 5000
+
+
+class DataGenSettings(BaseModel):
+    users: int = 1000
+    # mean sessions per user, most people have one or two and a few have dozens
+    sessions_per_user: float = 3.0
+    # mean jobs per session, heavy-tailed so there are some very long conversations
+    jobs_per_session: float = 10.0
+    max_jobs_per_session: int = 2000
+    # the fraction of finished jobs that errored or were hidden
+    error_rate: float = 0.03
+    hidden_rate: float = 0.05
+    # the fraction of jobs with feedback, and with an analysis
+    feedback_rate: float = 0.1
+    analysis_rate: float = 0.02
+    # jobs still waiting for the poller, spread across random users
+    pending_jobs: int = 10
+    # how far back the history goes
+    days: int = 365
+    # mean words in a prompt and a response, both are log-normal
+    prompt_words: int = 20
+    response_words: int = 150
+    seed: int = 0
+
+
+class DataGenStats(BaseModel):
+    users: int = 0
+    sessions: int = 0
+    jobs: int = 0
+    feedback: int = 0
+    analyses: int = 0
+    seconds: float = 0.0
+
+
+class DataGenerator:
+    """writes the rows straight to the tables in big batches, the ORM's far too slow for millions of rows"""
+
+    def __init__(self, engine: sqlalchemy.engine.Engine, settings: Optional[DataGenSettings] = None) -> None:
+        self.engine = engine
+        self.settings = settings or DataGenSettings()
+        self.rng = random.Random(self.settings.seed)
+        self.now = datetime.now(UTC)
+        self.stats = DataGenStats()
+        self.pending: Dict[str, List[Dict[str, Any]]] = {}
+
+    def uuid(self) -> UUID:
+        return UUID(int=self.rng.getrandbits(128), version=4)
+
+    def words(self, mean: int) -> str:
+        # log-normal with the given mean, sigma 0.8 gives a long tail of big ones
+        count = max(1, int(self.rng.lognormvariate(math.log(mean) - 0.32, 0.8)))
+        return " ".join(self.rng.choices(VOCABULARY, k=count))
+
+    def heavy_tailed(self, mean: float, cap: int) -> int:
+        """pareto with the given mean, at least 1"""
+        alpha = 1.5
+        scale = mean * (alpha - 1) / alpha
+        return max(1, min(cap, int(scale * self.rng.paretovariate(alpha))))
+
+    def when(self, after: datetime) -> datetime:
+        """somewhere between after and now, biased towards recent"""
+        span = (self.now - after).total_seconds()
+        return after + timedelta(seconds=span * (1 - self.rng.random() ** 2))
+
+    def add(self, table: str, row: Dict[str, Any]) -> None:
+        """queue a row for the named table"""
+        rows = self.pending.setdefault(table, [])
+        rows.append(row)
+        if len(rows) >= INSERT_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        """write everything that's waiting, parents first so the foreign keys are there"""
+        with self.engine.begin() as connection:
+            for table in sqlmodel.SQLModel.metadata.sorted_tables:
+                rows = self.pending.pop(table.name, [])
+                if rows:
+                    connection.execute(table.insert(), rows)
+
+    def job_status(self) -> str:
+        roll = self.rng.random()
+        if roll < self.settings.error_rate:
+            return JobStatus.Error.value
+        if roll < self.settings.error_rate + self.settings.hidden_rate:
+            return JobStatus.Hidden.value
+        return JobStatus.Complete.value
+
+    def add_job(self, userid: UUID, sessionid: UUID, created: datetime, status: str) -> None:
+        jobid = self.uuid()
+        finished = status != JobStatus.Created.value
+        runtime = self.rng.lognormvariate(1.5, 0.6) if finished else None
+        self.add(
+            "jobs",
+            {
+                "id": jobid,
+                "client_ip": f"10.{self.rng.randrange(256)}.{self.rng.randrange(256)}.{self.rng.randrange(1, 255)}",
+                "userid": userid,
+                "status": status,
+                "created": created,
+                "updated": created + timedelta(seconds=runtime) if runtime is not None else None,
+                "prompt": self.words(self.settings.prompt_words),
+                "response": self.words(self.settings.response_words) if finished else None,
+                "request_type": RequestType.Plain.value,
+                "runtime": runtime,
+                "job_metadata": None,
+                "sessionid": sessionid,
+            },
+        )
+        self.stats.jobs += 1
+        if not finished:
+            return
+        if self.rng.random() < self.settings.feedback_rate:
+            self.add(
+                "jobfeedback",
+                {
+                    "id": self.uuid(),
+                    "jobid": jobid,
+                    "success": self.rng.choice((-1, 0, 1)),
+                    "comment": self.words(8),
+                    "src_ip": "127.0.0.1",
+                    "created": created + timedelta(minutes=1),
+                },
+            )
+            self.stats.feedback += 1
+        if self.rng.random() < self.settings.analysis_rate:
+            self.add(
+                "jobanalysis",
+                {
+                    "analysisid": self.uuid(),
+                    "jobid": jobid,
+                    "userid": userid,
+                    "preprompt": "Analyse this",
+                    "response": self.words(self.settings.response_words),
+                    "analysis_type": self.rng.choice(list(AnalysisType)),
+                    "time": created + timedelta(minutes=2),
+                    "updated": created + timedelta(minutes=3),
+                    "status": JobStatus.Complete,
+                    "job_metadata": None,
+                },
+            )
+            self.stats.analyses += 1
+
+    def generate(self) -> DataGenStats:
+        start = time.perf_counter()
+        settings = self.settings
+        oldest = self.now - timedelta(days=settings.days)
+        sessions = []
+        for user_number in range(settings.users):
+            userid = self.uuid()
+            user_created = self.when(oldest)
+            self.add(
+                "users",
+                {"userid": userid, "name": f"user-{user_number}", "created": user_created, "updated": None},
+            )
+            self.stats.users += 1
+            for _ in range(self.heavy_tailed(settings.sessions_per_user, 1000)):
+                sessionid = self.uuid()
+                session_created = self.when(user_created)
+                self.add(
+                    "session",
+                    {
+                        "sessionid": sessionid,
+                        "name": session_created.isoformat(),
+                        "userid": userid,
+                        "created": session_created,
+                        "updated": None,
+                    },
+                )
+                self.stats.sessions += 1
+                sessions.append((userid, sessionid))
+                created = session_created
+                for _ in range(self.heavy_tailed(settings.jobs_per_session, settings.max_jobs_per_session)):
+                    created += timedelta(seconds=self.rng.expovariate(1 / 120))
+                    self.add_job(userid, sessionid, created, self.job_status())
+            if user_number % 1000 == 999:
+                logger.info("Generated users", **self.stats.model_dump())
+        for _ in range(settings.pending_jobs if sessions else 0):
+            userid, sessionid = self.rng.choice(sessions)
+            self.add_job(userid, sessionid, self.now, JobStatus.Created.value)
+        self.flush()
+        self.stats.seconds = time.perf_counter() - start
+        return self.stats
+
+
+def generate_data(engine: sqlalchemy.engine.Engine, settings: Optional[DataGenSettings] = None) -> DataGenStats:
+    """create the tables if they're not there and fill them up"""
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    return DataGenerator(engine, settings).generate()
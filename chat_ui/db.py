@@ -1,4 +1,4 @@
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 from enum import IntEnum
 import sys
 
@@ -15,7 +15,8 @@ from sqlmodel._compat import SQLModelConfig
 
 
 from sqlalchemy.exc import NoResultFound
-from chat_ui.models import AnalyzeForm, JobStatus, AnalysisType
+from chat_ui.logs import log_payload
+from chat_ui.models import AnalyzeForm, JobStatus, AnalysisType, LogMessages
 
 sqlmodel.SQLModel.__table_args__ = {"extend_existing": True}
 
@@ -41,17 +42,25 @@ class Jobs(sqlmodel.SQLModel, table=True):
     userid: UUID = sqlmodel.Field(
         foreign_key="users.userid", index=True, sa_type=UUIDType(binary=False)
     )
-    status: str = sqlmodel.Field(JobStatus.Created.value)
-    created: datetime = sqlmodel.Field(datetime.now(UTC))
+    # the poller and the waiting count look jobs up by status
+    status: str = sqlmodel.Field(JobStatus.Created.value, index=True)
+    created: datetime = sqlmodel.Field(default_factory=lambda: datetime.now(UTC))
     updated: Optional[datetime] = None
     prompt: str
     response: Optional[str] = None
+    # the response rendered to HTML, and the renderer version that did it, see chat_ui.utils.RENDERER_VERSION
+    response_html: Optional[str] = None
+    response_html_version: Optional[int] = None
     request_type: str
     runtime: Optional[float] = None
     job_metadata: Optional[str] = None
+    # how many times a poller's picked it up, and which poller has it until when
+    attempts: Optional[int] = None
+    claimed_by: Optional[str] = None
+    lease_expires: Optional[datetime] = None
 
     sessionid: UUID = sqlmodel.Field(
-        foreign_key="session.sessionid", sa_type=UUIDType(binary=False)
+        foreign_key="session.sessionid", index=True, sa_type=UUIDType(binary=False)
     )
     model_config = SQLModelConfig(arbitrary_types_allowed=True)
 
@@ -97,6 +106,71 @@ class Jobs(sqlmodel.SQLModel, table=True):
         session.commit()
         session.refresh(self)
 
+    def claim(
+        self, session: sqlmodel.Session, owner: str, lease_timeout: float
+    ) -> bool:
+        """mark the job as running if it's still waiting, in one UPDATE so two pollers can't both get it
+
+        owner holds it for lease_timeout seconds, returns False if something else claimed it first"""
+        # a job that's not been saved yet goes in as created, so it can be claimed like any other
+        session.add(self)
+        session.flush()
+        now = datetime.now(UTC)
+        result = session.execute(
+            sqlalchemy.update(Jobs)
+            .where(
+                sqlmodel.col(Jobs.id) == self.id,
+                sqlmodel.col(Jobs.status) == JobStatus.Created.value,
+            )
+            .values(
+                status=JobStatus.Running.value,
+                updated=now,
+                attempts=sqlalchemy.func.coalesce(sqlmodel.col(Jobs.attempts), 0) + 1,
+                claimed_by=owner,
+                lease_expires=now + timedelta(seconds=lease_timeout),
+            )
+        )
+        session.commit()
+        session.refresh(self)
+        return result.rowcount == 1  # type: ignore[attr-defined,no-any-return]
+
+    def hold_claim(self, session: sqlmodel.Session, owner: str) -> bool:
+        """check owner still has the job before saving what it did, False if it's been requeued
+
+        this writes to the job, so on sqlite nothing else can requeue it until the session commits"""
+        session.flush()
+        result = session.execute(
+            sqlalchemy.update(Jobs)
+            .where(
+                sqlmodel.col(Jobs.id) == self.id,
+                sqlmodel.col(Jobs.claimed_by) == owner,
+            )
+            .values(claimed_by=None, lease_expires=None)
+        )
+        if result.rowcount != 1:  # type: ignore[attr-defined]
+            session.rollback()
+            return False
+        self.claimed_by = None
+        self.lease_expires = None
+        return True
+
+    def renew_lease(
+        self, session: sqlmodel.Session, owner: str, lease_timeout: float
+    ) -> bool:
+        """push owner's lease on the job out another lease_timeout seconds,
+        returns False if it's not owner's any more"""
+        result = session.execute(
+            sqlalchemy.update(Jobs)
+            .where(
+                sqlmodel.col(Jobs.id) == self.id,
+                sqlmodel.col(Jobs.claimed_by) == owner,
+            )
+            .execution_options(synchronize_session=False)
+            .values(lease_expires=datetime.now(UTC) + timedelta(seconds=lease_timeout))
+        )
+        session.commit()
+        return result.rowcount == 1  # type: ignore[attr-defined,no-any-return]
+
     def mark_error(self, session: sqlmodel.Session, error_message: str) -> None:
         """set the job to error status"""
         self.status = JobStatus.Error.value
@@ -127,11 +201,11 @@ class JobFeedback(sqlmodel.SQLModel, table=True):
     id: UUID = sqlmodel.Field(
         primary_key=True, default_factory=uuid4, sa_type=UUIDType(binary=False)
     )
-    jobid: UUID = sqlmodel.Field(foreign_key="jobs.id")
+    jobid: UUID = sqlmodel.Field(foreign_key="jobs.id", index=True)
     success: int  # See FeedbackSuccess for the values, but it's 1, 0, -1
     comment: str
     src_ip: str
-    created: datetime = sqlmodel.Field(datetime.now(UTC))
+    created: datetime = sqlmodel.Field(default_factory=lambda: datetime.now(UTC))
     model_config = SQLModelConfig(arbitrary_types_allowed=True)
 
     @classmethod
@@ -162,8 +236,10 @@ class ChatUiDBSession(sqlmodel.SQLModel, table=True):
     sessionid: UUID = sqlmodel.Field(primary_key=True, default_factory=lambda: uuid4())
     name: str = sqlmodel.Field(default_factory=lambda: datetime.now(UTC).isoformat())
 
-    userid: UUID = sqlmodel.Field(foreign_key="users.userid")
+    userid: UUID = sqlmodel.Field(foreign_key="users.userid", index=True)
     created: datetime = sqlmodel.Field(default_factory=lambda: datetime.now(UTC))
+    # set when it's renamed, so clients polling the session list can tell it's changed
+    updated: Optional[datetime] = None
 
 
 class JobAnalysis(sqlmodel.SQLModel, table=True):
@@ -185,12 +261,14 @@ class JobAnalysis(sqlmodel.SQLModel, table=True):
     analysis_type: AnalysisType
     time: datetime = sqlmodel.Field(default_factory=lambda: datetime.now(UTC))
     updated: Optional[datetime] = None
-    status: JobStatus = JobStatus.Created
+    status: JobStatus = sqlmodel.Field(JobStatus.Created, index=True)
     job_metadata: Optional[str] = None
+    # how many times a poller's picked it up
+    attempts: Optional[int] = None
 
     def log(self) -> None:
         """log the entry"""
-        logger.info(*self.model_dump(mode="json"))
+        logger.info(LogMessages.AnalysisJob, **log_payload(self.model_dump(mode="json")))
 
     @classmethod
     def from_analyzeform(cls, analyze_form: AnalyzeForm) -> "JobAnalysis":
@@ -210,6 +288,25 @@ class JobAnalysis(sqlmodel.SQLModel, table=True):
         self.status = status
         self._save(session)
 
+    def claim(self, session: sqlmodel.Session) -> bool:
+        """mark the analysis as running if it's still waiting, returns False if something else claimed it first"""
+        result = session.execute(
+            sqlalchemy.update(JobAnalysis)
+            .where(
+                sqlmodel.col(JobAnalysis.analysisid) == self.analysisid,
+                sqlmodel.col(JobAnalysis.status) == JobStatus.Created,
+            )
+            .values(
+                status=JobStatus.Running,
+                updated=datetime.now(UTC),
+                attempts=sqlalchemy.func.coalesce(sqlmodel.col(JobAnalysis.attempts), 0)
+                + 1,
+            )
+        )
+        session.commit()
+        session.refresh(self)
+        return result.rowcount == 1  # type: ignore[attr-defined,no-any-return]
+
     def mark_error(self, session: sqlmodel.Session, error_message: str) -> None:
         """set the job to error status"""
         self.status = JobStatus.Error
@@ -223,8 +320,119 @@ class JobAnalysis(sqlmodel.SQLModel, table=True):
         session.refresh(self)
 
 
+def too_many_attempts(max_attempts: int) -> str:
+    """what the user's told when we've given up on their job"""
+    return f"This failed {max_attempts} times, please try this again"
+
+
+def requeue_jobs(
+    session: sqlmodel.Session,
+    owner: Optional[str] = None,
+    max_attempts: Optional[int] = None,
+    job_id: Optional[UUID] = None,
+) -> int:
+    """put running jobs back in the queue so a poller picks them up again
+
+    with an owner it's that poller's jobs, otherwise it's the ones whose lease has run
+    out (or never had one, from before leases), with a job_id it's only that job, jobs
+    that have already been tried max_attempts times are set to error instead, returns
+    how many were requeued"""
+    now = datetime.now(UTC)
+    running: list[sqlalchemy.ColumnElement[bool]] = [
+        sqlmodel.col(Jobs.status) == JobStatus.Running.value
+    ]
+    if job_id is not None:
+        running.append(sqlmodel.col(Jobs.id) == job_id)
+    if owner is not None:
+        running.append(sqlmodel.col(Jobs.claimed_by) == owner)
+    else:
+        running.append(
+            sqlalchemy.or_(
+                sqlmodel.col(Jobs.lease_expires).is_(None),
+                sqlmodel.col(Jobs.lease_expires) < now,
+            )
+        )
+    released = {"claimed_by": None, "lease_expires": None, "updated": now}
+    if max_attempts is not None:
+        attempts = sqlalchemy.func.coalesce(sqlmodel.col(Jobs.attempts), 0)
+        failed = session.execute(
+            sqlalchemy.update(Jobs)
+            .where(*running, attempts >= max_attempts)
+            .execution_options(synchronize_session=False)
+            .values(
+                status=JobStatus.Error.value,
+                response=too_many_attempts(max_attempts),
+                **released,
+            )
+        )
+        if failed.rowcount:  # type: ignore[attr-defined]
+            logger.warning(
+                LogMessages.JobAbandoned,
+                jobs=failed.rowcount,  # type: ignore[attr-defined]
+                max_attempts=max_attempts,
+            )
+    requeued = session.execute(
+        sqlalchemy.update(Jobs)
+        .where(*running)
+        .execution_options(synchronize_session=False)
+        .values(status=JobStatus.Created.value, **released)
+    )
+    session.commit()
+    count: int = requeued.rowcount  # type: ignore[attr-defined]
+    if count:
+        logger.warning(LogMessages.JobRequeued, jobs=count, owner=owner)
+    return count
+
+
+def add_missing_columns(engine: sqlalchemy.engine.Engine) -> None:
+    """add any nullable columns that are in the models but not the database tables"""
+    inspector = sqlalchemy.inspect(engine)
+    existing_tables = inspector.get_table_names()
+    with engine.begin() as connection:
+        for table in sqlmodel.SQLModel.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                if not column.nullable:
+                    # these need a value for the existing rows, so they get their own migration
+                    logger.debug(
+                        "Skipping non-nullable missing column",
+                        table=table.name,
+                        column=column.name,
+                    )
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                logger.info("Adding missing column", table=table.name, column=column.name)
+                connection.execute(
+                    sqlalchemy.text(
+                        f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+                    )
+                )
+
+
+def add_missing_indexes(engine: sqlalchemy.engine.Engine) -> None:
+    """create any indexes that are in the models but not the database, create_all only makes them with the table"""
+    inspector = sqlalchemy.inspect(engine)
+    existing_tables = inspector.get_table_names()
+    for table in sqlmodel.SQLModel.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            # this can take a while on a big table, but it only happens once
+            logger.info("Adding missing index", table=table.name, index=index.name)
+            index.create(engine)
+
+
 def migrate_database(engine: sqlalchemy.engine.Engine) -> None:
     """migrate the database"""
+    add_missing_columns(engine)
+    add_missing_indexes(engine)
     # backfill any chats that don't have sessions assigned after making sure the table exists
     with sqlmodel.Session(engine) as session:
         try:
@@ -7,9 +7,11 @@ class Urls(StrEnum):
     AdminAnalyses = "/admin/analyses"
     AdminJobs = "/admin/jobs"
     AdminUsers = "/admin/users"
+    AdminWebsockets = "/admin/websockets"
     Analyse = "/analyse"
     Analyses = "/analyses"
     HealthCheck = "/healthcheck"
     Job = "/job"
+    JobBulk = "/job/bulk"
     Jobs = "/jobs"
     User = "/user"
@@ -0,0 +1,385 @@
+""" a stand-in for the llama.cpp server, with predictable timings, for benchmarks and tests """
+
+import asyncio
+from contextlib import asynccontextmanager
+import random
+import socket
+import threading
+import time
+from types import TracebackType
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Type
+import zlib
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from loguru import logger
+from pydantic import BaseModel
+import uvicorn
+
+from chat_ui.models import dump_json
+
+# the words the fake responses are made of, each one counts as a token
+VOCABULARY = (
+    "the quick brown fox jumps over lazy dog while a model thinks about tokens and "
+    "latency in the queue because every benchmark needs words that look like text"
+).split()
+
+
+class FakeBackendSettings(BaseModel):
+    """how the fake backend behaves, it can be changed while it's running"""
+
+    model_name: str = "fake-model"
+    # seconds between getting a slot and sending the first token
+    time_to_first_token: float = 0.05
+    # how fast the rest of the tokens come out
+    tokens_per_second: float = 100.0
+    # how many tokens each response has, unless the request asks for fewer
+    response_tokens: int = 32
+    # how many completions run at once, the rest wait for a slot like llama.cpp's --parallel
+    slots: int = 4
+    # how fast the prompt's read before the first token, 0 makes it free, the tokens a slot has cached are skipped
+    prompt_tokens_per_second: float = 0.0
+    # fraction of completions that fail with a 500
+    error_rate: float = 0.0
+    # fraction of completions that hang for hang_seconds before answering, to trip client timeouts
+    timeout_rate: float = 0.0
+    hang_seconds: float = 30.0
+    # makes the injected errors and the responses the same every run
+    seed: int = 0
+
+
+class FakeBackendStats(BaseModel):
+    """what the fake backend's been asked to do"""
+
+    requests: int = 0
+    completions: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    tokens_generated: int = 0
+    prompt_tokens_processed: int = 0
+    prompt_tokens_cached: int = 0
+
+
+class FakeTokenizeRequest(BaseModel):
+    input: str
+
+
+def fake_tokenize(text: str) -> List[int]:
+    """a token per whitespace-separated word, the ids are stable across runs"""
+    return [zlib.crc32(word.encode("utf-8")) % 32000 for word in text.split()]
+
+
+def fake_response_tokens(prompt: str, count: int, seed: int) -> List[str]:
+    """the same prompt always gets the same response"""
+    rng = random.Random(zlib.crc32(prompt.encode("utf-8")) ^ seed)
+    return [rng.choice(VOCABULARY) for _ in range(count)]
+
+
+def message_text(messages: List[Dict[str, Any]]) -> str:
+    """all the text in the messages, content can be a string or a list of parts"""
+    texts = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            texts.append(content)
+        elif isinstance(content, list):
+            texts.extend(part.get("text", "") for part in content if isinstance(part, dict))
+    return "\n".join(texts)
+
+
+class FakeBackend:
+    """the state behind the fake backend's app"""
+
+    def __init__(self, settings: Optional[FakeBackendSettings] = None) -> None:
+        self.settings = settings or FakeBackendSettings()
+        self.stats = FakeBackendStats()
+        self.rng = random.Random(self.settings.seed)
+        # the slots that are running a completion, and what waits on one coming free
+        self.busy_slots: Set[int] = set()
+        self.slot_freed = asyncio.Condition()
+        # the last prompt each slot saw, what llama.cpp's prompt cache keeps
+        self.slot_prompts: Dict[int, List[int]] = {}
+        self.app = self.create_app()
+
+    def reset(self, settings: Optional[FakeBackendSettings] = None) -> None:
+        """start again, optionally with new settings"""
+        if settings is not None:
+            self.settings = settings
+        self.stats = FakeBackendStats()
+        self.rng = random.Random(self.settings.seed)
+        self.busy_slots = set()
+        self.slot_freed = asyncio.Condition()
+        self.slot_prompts = {}
+
+    def create_app(self) -> FastAPI:
+        app = FastAPI(title="chat-ui fake backend")
+        app.add_api_route("/v1/models", self.models, methods=["GET"])
+        app.add_api_route("/v1/chat/completions", self.chat_completions, methods=["POST"], response_model=None)
+        # llama-cpp-python's tokenizer endpoints
+        app.add_api_route("/extras/tokenize", self.tokenize, methods=["POST"])
+        app.add_api_route("/extras/tokenize/count", self.tokenize_count, methods=["POST"])
+        app.add_api_route("/fake/stats", self.get_stats, methods=["GET"])
+        return app
+
+    async def models(self) -> Dict[str, Any]:
+        return {
+            "object": "list",
+            "data": [{"id": self.settings.model_name, "object": "model", "owned_by": "chat-ui", "created": 0}],
+        }
+
+    async def tokenize(self, request: FakeTokenizeRequest) -> Dict[str, List[int]]:
+        return {"tokens": fake_tokenize(request.input)}
+
+    async def tokenize_count(self, request: FakeTokenizeRequest) -> Dict[str, int]:
+        return {"count": len(fake_tokenize(request.input))}
+
+    async def get_stats(self) -> FakeBackendStats:
+        return self.stats
+
+    def requested_slot(self, body: Dict[str, Any]) -> Optional[int]:
+        """the slot id_slot asks for, anything else (like llama.cpp's -1) takes whichever's free"""
+        slot = body.get("id_slot")
+        if isinstance(slot, int) and 0 <= slot < self.settings.slots:
+            return slot
+        return None
+
+    def free_slot(self, busy: Set[int], requested: Optional[int]) -> Optional[int]:
+        """the slot a completion can have now, if any, the free ones go round in turn"""
+        if requested is not None:
+            return None if requested in busy else requested
+        for offset in range(self.settings.slots):
+            slot = (self.stats.requests + offset) % self.settings.slots
+            if slot not in busy:
+                return slot
+        return None
+
+    @asynccontextmanager
+    async def slot(self, requested: Optional[int]) -> AsyncGenerator[int, None]:
+        """wait for one of the parallel slots and keep count of who's waiting and running
+
+        like llama.cpp, a completion that asks for a slot waits for that one even if others are free"""
+        # reset() can swap these out while we're holding a slot
+        busy, slot_freed = self.busy_slots, self.slot_freed
+        self.stats.waiting += 1
+        self.stats.max_waiting = max(self.stats.max_waiting, self.stats.waiting)
+        try:
+            async with slot_freed:
+                await slot_freed.wait_for(lambda: self.free_slot(busy, requested) is not None)
+                slot = self.free_slot(busy, requested)
+                assert slot is not None
+                busy.add(slot)
+        finally:
+            self.stats.waiting -= 1
+        self.stats.in_flight += 1
+        self.stats.max_in_flight = max(self.stats.max_in_flight, self.stats.in_flight)
+        try:
+            yield slot
+        finally:
+            self.stats.in_flight -= 1
+            async with slot_freed:
+                busy.discard(slot)
+                slot_freed.notify_all()
+
+    def read_prompt(self, slot: int, body: Dict[str, Any], prompt_tokens: List[int]) -> Dict[str, int]:
+        """like llama.cpp, only the part of the prompt after what the slot has cached needs reading
+
+        nothing's cached without cache_prompt"""
+        cached = 0
+        if body.get("cache_prompt"):
+            for previous, token in zip(self.slot_prompts.get(slot, []), prompt_tokens):
+                if previous != token:
+                    break
+                cached += 1
+        self.slot_prompts[slot] = prompt_tokens
+        self.stats.prompt_tokens_cached += cached
+        self.stats.prompt_tokens_processed += len(prompt_tokens) - cached
+        return {"id_slot": slot, "cache_n": cached, "prompt_n": len(prompt_tokens) - cached}
+
+    def prompt_time(self, timings: Dict[str, int]) -> float:
+        if self.settings.prompt_tokens_per_second <= 0:
+            return 0.0
+        return timings["prompt_n"] / self.settings.prompt_tokens_per_second
+
+    async def chat_completions(self, request: Request) -> Response:
+        body: Dict[str, Any] = await request.json()
+        self.stats.requests += 1
+        settings = self.settings
+
+        # decide up front, so the same seed fails the same requests
+        roll = self.rng.random()
+        if roll < settings.error_rate:
+            self.stats.errors += 1
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"message": "injected error", "type": "server_error", "code": 500}},
+            )
+        if roll < settings.error_rate + settings.timeout_rate:
+            self.stats.timeouts += 1
+            await asyncio.sleep(settings.hang_seconds)
+
+        prompt = message_text(body.get("messages", []))
+        count = settings.response_tokens
+        max_tokens = body.get("max_tokens")
+        if isinstance(max_tokens, int) and max_tokens > 0:
+            count = min(count, max_tokens)
+        tokens = fake_response_tokens(prompt, count, settings.seed)
+        prompt_tokens = fake_tokenize(prompt)
+        usage = {
+            "prompt_tokens": len(prompt_tokens),
+            "completion_tokens": len(tokens),
+            "total_tokens": len(prompt_tokens) + len(tokens),
+        }
+        completion_id = f"chatcmpl-fake-{self.stats.requests}"
+        created = int(time.time())
+
+        if body.get("stream"):
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            return StreamingResponse(
+                self.stream(body, prompt_tokens, completion_id, created, tokens, usage if include_usage else None),
+                media_type="text/event-stream",
+            )
+
+        async with self.slot(self.requested_slot(body)) as slot:
+            timings = self.read_prompt(slot, body, prompt_tokens)
+            await asyncio.sleep(
+                self.prompt_time(timings) + settings.time_to_first_token + self.generation_time(len(tokens))
+            )
+            self.stats.completions += 1
+            self.stats.tokens_generated += len(tokens)
+        return Response(
+            content=dump_json(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": settings.model_name,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": " ".join(tokens)},
+                            "finish_reason": "length",
+                        }
+                    ],
+                    "usage": usage,
+                    "timings": timings,
+                }
+            ),
+            media_type="application/json",
+        )
+
+    def generation_time(self, tokens: int) -> float:
+        """how long the tokens after the first one take"""
+        if self.settings.tokens_per_second <= 0 or tokens <= 1:
+            return 0.0
+        return (tokens - 1) / self.settings.tokens_per_second
+
+    async def stream(
+        self,
+        body: Dict[str, Any],
+        prompt_tokens: List[int],
+        completion_id: str,
+        created: int,
+        tokens: List[str],
+        usage: Optional[Dict[str, int]],
+    ) -> AsyncGenerator[bytes, None]:
+        settings = self.settings
+
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> bytes:
+            return self.sse_chunk(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": settings.model_name,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                }
+            )
+
+        async with self.slot(self.requested_slot(body)) as slot:
+            timings = self.read_prompt(slot, body, prompt_tokens)
+            await asyncio.sleep(self.prompt_time(timings) + settings.time_to_first_token)
+            for index, token in enumerate(tokens):
+                if index > 0 and settings.tokens_per_second > 0:
+                    await asyncio.sleep(1 / settings.tokens_per_second)
+                delta = {"content": token if index == 0 else f" {token}"}
+                if index == 0:
+                    delta["role"] = "assistant"
+                yield chunk(delta)
+            yield chunk({}, "length")
+            self.stats.completions += 1
+            self.stats.tokens_generated += len(tokens)
+        if usage is not None:
+            yield self.sse_chunk(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": settings.model_name,
+                    "choices": [],
+                    "usage": usage,
+                }
+            )
+        yield b"data: [DONE]\n\n"
+
+    @staticmethod
+    def sse_chunk(data: Dict[str, Any]) -> bytes:
+        return b"data: " + dump_json(data) + b"\n\n"
+
+
+def free_port(host: str = "127.0.0.1") -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+class FakeBackendServer:
+    """runs a fake backend with uvicorn in a thread, so tests and benchmarks can point the app at it
+
+    use it as a context manager, base_url is what CHATUI_BACKEND_URL should be set to"""
+
+    def __init__(
+        self, settings: Optional[FakeBackendSettings] = None, host: str = "127.0.0.1", port: Optional[int] = None
+    ) -> None:
+        self.backend = FakeBackend(settings)
+        self.host = host
+        self.port = port or free_port(host)
+        self.server = uvicorn.Server(
+            uvicorn.Config(self.backend.app, host=self.host, port=self.port, log_level="warning", lifespan="off")
+        )
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    def start(self, timeout: float = 10.0) -> None:
+        self.thread = threading.Thread(target=self.server.run, name="fake-backend", daemon=True)
+        self.thread.start()
+        deadline = time.monotonic() + timeout
+        while not self.server.started:
+            if time.monotonic() > deadline or not self.thread.is_alive():
+                raise RuntimeError(f"Fake backend didn't start on {self.host}:{self.port}")
+            time.sleep(0.01)
+        logger.debug("Fake backend started", base_url=self.base_url)
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        if self.thread is not None:
+            self.thread.join(10)
+
+    def __enter__(self) -> "FakeBackendServer":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
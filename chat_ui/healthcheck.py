@@ -8,8 +8,16 @@ import requests
 
 if __name__ == "__main__":
     config = Config()
-    res = requests.get(f"{config.backend_url}/models")
-    if res.status_code != 200:
-        logger.error("Failed to check {}", config.backend_url)
-        sys.exit(1)
-    sys.exit(0)
+    # healthy as long as one of the backends is, the pool routes around the others
+    healthy = 0
+    for backend in config.backend_pool():
+        try:
+            res = requests.get(f"{backend.url}/models", timeout=10)
+        except requests.RequestException as error:
+            logger.error("Failed to check {}: {}", backend.url, error)
+            continue
+        if res.status_code != 200:
+            logger.error("Failed to check {}", backend.url)
+            continue
+        healthy += 1
+    sys.exit(0 if healthy else 1)
@@ -0,0 +1,83 @@
+""" in-process notifications about jobs changing, so requests can wait on a job without polling the database """
+
+import asyncio
+from contextlib import contextmanager
+import threading
+from typing import Dict, Iterator, List, Tuple
+from uuid import UUID
+
+from loguru import logger
+
+from chat_ui.models import JobEvent, JobEventType
+
+
+class JobEventBroker:
+    """hands job events from wherever they happen (including the background poller thread) to
+    the asyncio tasks waiting on them
+
+    this only knows about events published in this process, so anything waiting should still
+    check the database every so often in case another process changed the job"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: Dict[
+            UUID, List[Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[JobEvent]"]]
+        ] = {}
+
+    def subscribe(self, job_id: UUID) -> "asyncio.Queue[JobEvent]":
+        """get a queue of events for a job, has to be called from the event loop that reads it"""
+        queue: "asyncio.Queue[JobEvent]" = asyncio.Queue()
+        with self._lock:
+            self._subscribers.setdefault(job_id, []).append(
+                (asyncio.get_running_loop(), queue)
+            )
+        return queue
+
+    def unsubscribe(self, job_id: UUID, queue: "asyncio.Queue[JobEvent]") -> None:
+        with self._lock:
+            subscribers = [
+                subscriber
+                for subscriber in self._subscribers.get(job_id, [])
+                if subscriber[1] is not queue
+            ]
+            if subscribers:
+                self._subscribers[job_id] = subscribers
+            else:
+                self._subscribers.pop(job_id, None)
+
+    @contextmanager
+    def subscription(self, job_id: UUID) -> Iterator["asyncio.Queue[JobEvent]"]:
+        """subscribe for the duration of a with block"""
+        queue = self.subscribe(job_id)
+        try:
+            yield queue
+        finally:
+            self.unsubscribe(job_id, queue)
+
+    def publish(self, event: JobEvent) -> None:
+        """send an event to everything waiting on the job, safe to call from any thread"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(event.job_id, []))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError as error:
+                # the loop's gone away, the subscriber will never read it anyway
+                logger.debug(
+                    "Failed to publish job event", job_id=event.job_id, error=str(error)
+                )
+
+    def publish_status(self, job_id: UUID, status: str) -> None:
+        """let everyone know the job's status changed"""
+        self.publish(JobEvent(event=JobEventType.Status, job_id=job_id, status=status))
+
+    def publish_token(self, job_id: UUID, text: str) -> None:
+        """a chunk of a streamed response"""
+        self.publish(JobEvent(event=JobEventType.Token, job_id=job_id, text=text))
+
+    def subscriber_count(self, job_id: UUID) -> int:
+        with self._lock:
+            return len(self._subscribers.get(job_id, []))
+
+
+jobevents = JobEventBroker()
@@ -2,6 +2,132 @@
 const { createApp } = Vue
 const jobPollIntervalMs = 2500;
 const defaultNextRunMs = 500;
+// keep this under JOB_DETAILS_MAX in chat_ui/__init__.py
+const jobDetailsBatchSize = 100;
+// in order of preference, the server picks the first one it supports
+const websocketProtocols = ["chatui.msgpack", "chatui.json"];
+const msgpackExtUUID = 1;
+const msgpackExtTimestamp = -1;
+
+// the naive ISO timestamps the JSON encoder produces, down to the microsecond, so the two encodings compare equally
+function msgpackTimestamp(seconds, nanoseconds) {
+    const iso = new Date(seconds * 1000).toISOString().slice(0, 19);
+    const microseconds = Math.floor(nanoseconds / 1000);
+    return microseconds ? `${iso}.${String(microseconds).padStart(6, "0")}` : iso;
+}
+
+function msgpackUUID(bytes) {
+    const hex = Array.from(bytes, (byte) => byte.toString(16).padStart(2, "0")).join("");
+    return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-${hex.slice(12, 16)}-${hex.slice(16, 20)}-${hex.slice(20)}`;
+}
+
+// decodes the subset of msgpack the server sends, see WebSocketResponse.as_msgpack
+function decodeMsgpack(buffer) {
+    const view = new DataView(buffer);
+    const bytes = new Uint8Array(buffer);
+    const textDecoder = new TextDecoder();
+    let offset = 0;
+
+    const readStr = (length) => {
+        const value = textDecoder.decode(bytes.subarray(offset, offset + length));
+        offset += length;
+        return value;
+    };
+    const readBin = (length) => {
+        const value = bytes.slice(offset, offset + length);
+        offset += length;
+        return value;
+    };
+    const readArray = (length) => {
+        const value = [];
+        for (let i = 0; i < length; i++) {
+            value.push(readValue());
+        }
+        return value;
+    };
+    const readMap = (length) => {
+        const value = {};
+        for (let i = 0; i < length; i++) {
+            const key = readValue();
+            value[key] = readValue();
+        }
+        return value;
+    };
+    const readExt = (length) => {
+        const type = view.getInt8(offset);
+        offset += 1;
+        if (type === msgpackExtUUID) {
+            return msgpackUUID(readBin(length));
+        }
+        if (type === msgpackExtTimestamp) {
+            let value;
+            if (length === 4) {
+                value = msgpackTimestamp(view.getUint32(offset), 0);
+            } else if (length === 8) {
+                const high = view.getUint32(offset);
+                const low = view.getUint32(offset + 4);
+                value = msgpackTimestamp((high & 0x3) * 0x100000000 + low, high >>> 2);
+            } else {
+                value = msgpackTimestamp(Number(view.getBigInt64(offset + 4)), view.getUint32(offset));
+            }
+            offset += length;
+            return value;
+        }
+        return readBin(length);
+    };
+    const readValue = () => {
+        const byte = bytes[offset];
+        offset += 1;
+        let value;
+        if (byte <= 0x7f) {
+            return byte;
+        } else if (byte <= 0x8f) {
+            return readMap(byte & 0x0f);
+        } else if (byte <= 0x9f) {
+            return readArray(byte & 0x0f);
+        } else if (byte <= 0xbf) {
+            return readStr(byte & 0x1f);
+        } else if (byte >= 0xe0) {
+            return byte - 0x100;
+        }
+        switch (byte) {
+            case 0xc0: return null;
+            case 0xc2: return false;
+            case 0xc3: return true;
+            case 0xc4: value = view.getUint8(offset); offset += 1; return readBin(value);
+            case 0xc5: value = view.getUint16(offset); offset += 2; return readBin(value);
+            case 0xc6: value = view.getUint32(offset); offset += 4; return readBin(value);
+            case 0xc7: value = view.getUint8(offset); offset += 1; return readExt(value);
+            case 0xc8: value = view.getUint16(offset); offset += 2; return readExt(value);
+            case 0xc9: value = view.getUint32(offset); offset += 4; return readExt(value);
+            case 0xca: value = view.getFloat32(offset); offset += 4; return value;
+            case 0xcb: value = view.getFloat64(offset); offset += 8; return value;
+            case 0xcc: value = view.getUint8(offset); offset += 1; return value;
+            case 0xcd: value = view.getUint16(offset); offset += 2; return value;
+            case 0xce: value = view.getUint32(offset); offset += 4; return value;
+            case 0xcf: value = Number(view.getBigUint64(offset)); offset += 8; return value;
+            case 0xd0: value = view.getInt8(offset); offset += 1; return value;
+            case 0xd1: value = view.getInt16(offset); offset += 2; return value;
+            case 0xd2: value = view.getInt32(offset); offset += 4; return value;
+            case 0xd3: value = Number(view.getBigInt64(offset)); offset += 8; return value;
+            case 0xd4: return readExt(1);
+            case 0xd5: return readExt(2);
+            case 0xd6: return readExt(4);
+            case 0xd7: return readExt(8);
+            case 0xd8: return readExt(16);
+            case 0xd9: value = view.getUint8(offset); offset += 1; return readStr(value);
+            case 0xda: value = view.getUint16(offset); offset += 2; return readStr(value);
+            case 0xdb: value = view.getUint32(offset); offset += 4; return readStr(value);
+            case 0xdc: value = view.getUint16(offset); offset += 2; return readArray(value);
+            case 0xdd: value = view.getUint32(offset); offset += 4; return readArray(value);
+            case 0xde: value = view.getUint16(offset); offset += 2; return readMap(value);
+            case 0xdf: value = view.getUint32(offset); offset += 4; return readMap(value);
+            default:
+                throw new Error(`Unsupported msgpack type 0x${byte.toString(16)}`);
+        }
+    };
+    return readValue();
+}
 
 /* TODO: implement "session name" thingie */
 
@@ -20,7 +146,6 @@ createApp({
             poller: null,
             ws: null,
             waitingJobs: null,
-            waitingPoller: null,
             initialLoad: true,
             // are we showing the prompt details modal?
             showPromptDetails: false,
@@ -73,8 +198,8 @@ createApp({
     },
     created() {
         this.getNewWebSocket();
-        this.poller = setInterval(this.updateJobs, jobPollIntervalMs);
-        this.waitingPoller = setInterval(this.updateWaiting, jobPollIntervalMs);
+        // jobs and the waiting count go in one batch message each tick
+        this.poller = setInterval(this.pollServer, jobPollIntervalMs);
         this.sessionPoller = setInterval(this.getSessions, jobPollIntervalMs);
         setTimeout(() => {
             // ensures the user's in the DB
@@ -82,7 +207,7 @@ createApp({
             // ensures a session exists
             this.getSessions();
             // check for jobs.
-            this.updateJobs();
+            this.pollServer();
         }, defaultNextRunMs);
     },
     computed: {
@@ -151,12 +276,20 @@ createApp({
             }
             return "btn-secondary";
         },
-        updateWaiting: function () {
-            const payload = { "userid": this.userid, "message": "waiting" };
+        pollServer: function () {
+            const operations = [{ "message": "waiting" }];
+            const jobsOperation = this.jobsOperation();
+            if (jobsOperation !== null) {
+                operations.unshift(jobsOperation);
+            }
+            const payload = {
+                "userid": this.userid, "message": "batch", "payload": JSON.stringify(operations),
+            };
             this.checkForWebSocket();
-            // it's OK to drop this if we don't have it going already
+            // it's OK to drop this if we don't have it going already, we'll try again soon
             if (this.ws.readyState === WebSocket.OPEN) {
                 this.ws.send(JSON.stringify(payload));
+                this.lastJobsCheck = new Date().getTime() / 1000;
             }
         },
         checkForWebSocket: function () {
@@ -182,10 +315,12 @@ createApp({
         },
         // handle the "jobs" response from the websocket
         fromWebSocketJobs: function (response) {
+            // collect the jobs that need their details, so they're fetched in one request
+            const changedJobs = [];
             response.payload.forEach((newJob) => {
                 if (!(newJob.id in this.jobs)) {
                     this.jobs[newJob.id] = newJob;
-                    this.getJobData(newJob);
+                    changedJobs.push(newJob);
                 } else {
                     const existingJob = this.jobs[newJob.id];
 
@@ -196,19 +331,55 @@ createApp({
                     if (newJob.status != existingJob.status
                     ) {
                         console.debug(`Updating job id=${newJob.id} because status ${existingJob.status} != ${newJob.status}`);
-                        this.getJobData(newJob);
+                        changedJobs.push(newJob);
                     }
                     else if (newDate !== existingDate
                     ) {
                         console.debug(`Updating job id=${newJob.id} because 'updated' ${existingDate} != ${newDate}`);
-                        this.getJobData(newJob);
+                        changedJobs.push(newJob);
                     }
                 }
 
             })
+            this.getJobsData(changedJobs);
+        },
+        handleWebSocketResponse: function (response) {
+            switch (response.message) {
+                case "jobs":
+                    this.fromWebSocketJobs(response);
+                    this.initialLoad = false;
+                    break;
+                case "delete":
+                    console.debug("Removing job", response.payload);
+                    delete this.jobs[response.payload.id];
+                    break;
+                case "error":
+                    console.error("Error response from server", response.payload);
+                    break;
+                case "resubmit":
+                    setTimeout(this.updateJobs, defaultNextRunMs);
+                    break;
+                case "waiting":
+                    this.waitingJobs = response.payload;
+                    break;
+                case "feedback":
+                    console.debug("Feedback received", response.payload);
+                    break;
+                case "batch":
+                    response.payload.forEach(this.handleWebSocketResponse);
+                    break;
+                case "ping":
+                    // the server drops connections it doesn't hear from
+                    if (this.ws !== null && this.ws.readyState === WebSocket.OPEN) {
+                        this.ws.send(JSON.stringify({ "userid": this.userid, "message": "pong" }));
+                    }
+                    break;
+                default:
+                    console.error("Unknown message", response.message);
+            }
         },
         getNewWebSocket: function () {
-            if (this.ws !== null && !(ws.readyState === WebSocket.CLOSED || ws.readyState === WebSocket.CLOSING)) {
+            if (this.ws !== null && !(this.ws.readyState === WebSocket.CLOSED || this.ws.readyState === WebSocket.CLOSING)) {
                 console.debug("Already have a working websocket!");
                 return;
             }
@@ -224,35 +395,17 @@ createApp({
             websocket_uri += "/ws";
 
 
-            let ws = new WebSocket(websocket_uri);
+            let ws = new WebSocket(websocket_uri, websocketProtocols);
+            // msgpack responses come through as binary frames
+            ws.binaryType = "arraybuffer";
             ws.addEventListener("message", (event) => {
-                const response = JSON.parse(event.data);
-                switch (response.message) {
-                    case "jobs":
-                        this.fromWebSocketJobs(response);
-                        this.initialLoad = false;
-                        break;
-                    case "delete":
-                        console.debug("Removing job", response.payload);
-                        delete this.jobs[response.payload.id];
-                        break;
-                    case "error":
-                        console.error("Error response from server", response.payload);
-                        break;
-                    case "resubmit":
-                        setTimeout(this.updateJobs, defaultNextRunMs);
-                        break;
-                    case "waiting":
-                        this.waitingJobs = response.payload;
-                        break;
-                    case "feedback":
-                        console.debug("Feedback received", response.payload);
-                        break;
-                    default:
-                        console.error("Unknown message", response.message);
+                let response;
+                if (event.data instanceof ArrayBuffer) {
+                    response = decodeMsgpack(event.data);
+                } else {
+                    response = JSON.parse(event.data);
                 }
-
-
+                this.handleWebSocketResponse(response);
             });
 
             ws.addEventListener("error", (event) => {
@@ -292,7 +445,7 @@ createApp({
         },
         startPoller: function () {
             this.stopPoller();
-            this.poller = setInterval(this.updateJobs, jobPollIntervalMs);
+            this.poller = setInterval(this.pollServer, jobPollIntervalMs);
             console.debug("Started polling again...");
         },
         stopPoller: function () {
@@ -300,19 +453,26 @@ createApp({
             console.debug("Stopped poller");
             this.ws = null;
         },
-        updateJobs: function () {
+        jobsOperation: function () {
             if (this.currentSessionid === null) {
                 console.debug("Not updating jobs because currentSessionid is null, asking for a new session!");
-                return
+                return null
             }
-
-            const payload = {
-                "userid": this.userid, "message": "jobs", "payload": JSON.stringify({
+            return {
+                "message": "jobs", "payload": JSON.stringify({
                     // since we're filtering on sessionid, just ask for everything
                     // "since": this.lastJobsCheck,
                     "sessionid": this.currentSessionid,
                 })
             };
+        },
+        updateJobs: function () {
+            const operation = this.jobsOperation();
+            if (operation === null) {
+                return
+            }
+
+            const payload = { "userid": this.userid, ...operation };
 
             this.checkForWebSocket();
             // it's OK to drop this if we don't have it going already, we'll try again soon
@@ -446,37 +606,46 @@ createApp({
                 setTimeout(() => { this.resubmitJob(jobid) }, 1000);
             }
         },
-        getJobData: function (job) {
-            fetch(`/jobs/${this.userid}/${job.id}`, {
-                method: 'GET',
-                headers: {
-                    'Content-Type': 'application/json'
-                }
-            }).then(response => {
-                if (response.ok) {
-                    return response.json();
-                }
-                throw new Error('Failed to fetch job data');
-            }).then(responseData => {
-                if (!(responseData.id in this.jobs)) {
-                    if (responseData.status != "hidden") {
-                        this.jobs[responseData.id] = responseData;
+        getJobsData: function (jobs) {
+            // the server limits how many jobs you can ask for at once
+            for (let start = 0; start < jobs.length; start += jobDetailsBatchSize) {
+                const params = new URLSearchParams();
+                jobs.slice(start, start + jobDetailsBatchSize).forEach((job) => {
+                    params.append("job_ids", job.id);
+                });
+                fetch(`/jobs/${this.userid}?${params.toString()}`, {
+                    method: 'GET',
+                    headers: {
+                        'Content-Type': 'application/json'
                     }
-                } else {
-                    if (responseData.status == "hidden") {
-                        delete this.jobs[responseData.id];
-                    } else {
-                        // update the existing job
-                        Object.keys(responseData).forEach((key) => {
-                            this.jobs[responseData.id][key] = responseData[key];
-                        });
-
+                }).then(response => {
+                    if (response.ok) {
+                        return response.json();
                     }
+                    throw new Error('Failed to fetch job data');
+                }).then(responseData => {
+                    responseData.forEach(this.updateJobData);
+                }).catch(err => {
+                    console.error(`failed to fetch job data: ${err}`);
+                });
+            }
+        },
+        updateJobData: function (responseData) {
+            if (!(responseData.id in this.jobs)) {
+                if (responseData.status != "hidden") {
+                    this.jobs[responseData.id] = responseData;
                 }
+            } else {
+                if (responseData.status == "hidden") {
+                    delete this.jobs[responseData.id];
+                } else {
+                    // update the existing job
+                    Object.keys(responseData).forEach((key) => {
+                        this.jobs[responseData.id][key] = responseData[key];
+                    });
 
-            }).catch(err => {
-                console.error(`failed to fetch job data: ${err}`);
-            });
+                }
+            }
         },
         sendPromptFeedback: function () {
             if (this.selectedJob === null) {
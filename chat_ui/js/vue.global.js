@@ -1,5 +1,5 @@
 /**
-* vue v3.4.26
+* vue v3.4.38
 * (c) 2018-present Yuxi (Evan) You and Vue contributors
 * @license MIT
 **/
@@ -79,9 +79,9 @@ var Vue = (function (exports) {
     return s;
   });
   const hasChanged = (value, oldValue) => !Object.is(value, oldValue);
-  const invokeArrayFns = (fns, arg) => {
+  const invokeArrayFns = (fns, ...arg) => {
     for (let i = 0; i < fns.length; i++) {
-      fns[i](arg);
+      fns[i](...arg);
     }
   };
   const def = (obj, key, value, writable = false) => {
@@ -133,6 +133,9 @@ var Vue = (function (exports) {
 
   const range = 2;
   function generateCodeFrame(source, start = 0, end = source.length) {
+    start = Math.max(0, Math.min(start, source.length));
+    end = Math.max(0, Math.min(end, source.length));
+    if (start > end) return "";
     let lines = source.split(/(\r?\n)/);
     const newlineSequences = lines.filter((_, idx) => idx % 2 === 1);
     lines = lines.filter((_, idx) => idx % 2 === 0);
@@ -142,8 +145,7 @@ var Vue = (function (exports) {
       count += lines[i].length + (newlineSequences[i] && newlineSequences[i].length || 0);
       if (count >= start) {
         for (let j = i - range; j <= i + range || end > count; j++) {
-          if (j < 0 || j >= lines.length)
-            continue;
+          if (j < 0 || j >= lines.length) continue;
           const line = j + 1;
           res.push(
             `${line}${" ".repeat(Math.max(3 - String(line).length, 0))}|  ${lines[j]}`
@@ -208,8 +210,8 @@ var Vue = (function (exports) {
     }
     for (const key in styles) {
       const value = styles[key];
-      const normalizedKey = key.startsWith(`--`) ? key : hyphenate(key);
       if (isString(value) || typeof value === "number") {
+        const normalizedKey = key.startsWith(`--`) ? key : hyphenate(key);
         ret += `${normalizedKey}:${value};`;
       }
     }
@@ -236,8 +238,7 @@ var Vue = (function (exports) {
     return res.trim();
   }
   function normalizeProps(props) {
-    if (!props)
-      return null;
+    if (!props) return null;
     let { class: klass, style } = props;
     if (klass && !isString(klass)) {
       props.class = normalizeClass(klass);
@@ -280,8 +281,7 @@ var Vue = (function (exports) {
   }
 
   function looseCompareArrays(a, b) {
-    if (a.length !== b.length)
-      return false;
+    if (a.length !== b.length) return false;
     let equal = true;
     for (let i = 0; equal && i < a.length; i++) {
       equal = looseEqual(a[i], b[i]);
@@ -289,8 +289,7 @@ var Vue = (function (exports) {
     return equal;
   }
   function looseEqual(a, b) {
-    if (a === b)
-      return true;
+    if (a === b) return true;
     let aValidType = isDate(a);
     let bValidType = isDate(b);
     if (aValidType || bValidType) {
@@ -331,11 +330,14 @@ var Vue = (function (exports) {
     return arr.findIndex((item) => looseEqual(item, val));
   }
 
+  const isRef$1 = (val) => {
+    return !!(val && val.__v_isRef === true);
+  };
   const toDisplayString = (val) => {
-    return isString(val) ? val : val == null ? "" : isArray(val) || isObject(val) && (val.toString === objectToString || !isFunction(val.toString)) ? JSON.stringify(val, replacer, 2) : String(val);
+    return isString(val) ? val : val == null ? "" : isArray(val) || isObject(val) && (val.toString === objectToString || !isFunction(val.toString)) ? isRef$1(val) ? toDisplayString(val.value) : JSON.stringify(val, replacer, 2) : String(val);
   };
   const replacer = (_key, val) => {
-    if (val && val.__v_isRef) {
+    if (isRef$1(val)) {
       return replacer(_key, val.value);
     } else if (isMap(val)) {
       return {
@@ -588,8 +590,7 @@ var Vue = (function (exports) {
     });
     if (options) {
       extend(_effect, options);
-      if (options.scope)
-        recordEffectScope(_effect, options.scope);
+      if (options.scope) recordEffectScope(_effect, options.scope);
     }
     if (!options || !options.lazy) {
       _effect.run();
@@ -799,8 +800,7 @@ var Vue = (function (exports) {
     return instrumentations;
   }
   function hasOwnProperty(key) {
-    if (!isSymbol(key))
-      key = String(key);
+    if (!isSymbol(key)) key = String(key);
     const obj = toRaw(this);
     track(obj, "has", key);
     return obj.hasOwnProperty(key);
@@ -820,7 +820,7 @@ var Vue = (function (exports) {
         return isShallow2;
       } else if (key === "__v_raw") {
         if (receiver === (isReadonly2 ? isShallow2 ? shallowReadonlyMap : readonlyMap : isShallow2 ? shallowReactiveMap : reactiveMap).get(target) || // receiver is not the reactive proxy, but has the same prototype
-        // this means the reciever is a user proxy of the reactive proxy
+        // this means the receiver is a user proxy of the reactive proxy
         Object.getPrototypeOf(target) === Object.getPrototypeOf(receiver)) {
           return target;
         }
@@ -943,18 +943,18 @@ var Vue = (function (exports) {
 
   const toShallow = (value) => value;
   const getProto = (v) => Reflect.getPrototypeOf(v);
-  function get(target, key, isReadonly = false, isShallow = false) {
+  function get(target, key, isReadonly2 = false, isShallow2 = false) {
     target = target["__v_raw"];
     const rawTarget = toRaw(target);
     const rawKey = toRaw(key);
-    if (!isReadonly) {
+    if (!isReadonly2) {
       if (hasChanged(key, rawKey)) {
         track(rawTarget, "get", key);
       }
       track(rawTarget, "get", rawKey);
     }
     const { has: has2 } = getProto(rawTarget);
-    const wrap = isShallow ? toShallow : isReadonly ? toReadonly : toReactive;
+    const wrap = isShallow2 ? toShallow : isReadonly2 ? toReadonly : toReactive;
     if (has2.call(rawTarget, key)) {
       return wrap(target.get(key));
     } else if (has2.call(rawTarget, rawKey)) {
@@ -963,11 +963,11 @@ var Vue = (function (exports) {
       target.get(key);
     }
   }
-  function has(key, isReadonly = false) {
+  function has(key, isReadonly2 = false) {
     const target = this["__v_raw"];
     const rawTarget = toRaw(target);
     const rawKey = toRaw(key);
-    if (!isReadonly) {
+    if (!isReadonly2) {
       if (hasChanged(key, rawKey)) {
         track(rawTarget, "has", key);
       }
@@ -975,13 +975,15 @@ var Vue = (function (exports) {
     }
     return key === rawKey ? target.has(key) : target.has(key) || target.has(rawKey);
   }
-  function size(target, isReadonly = false) {
+  function size(target, isReadonly2 = false) {
     target = target["__v_raw"];
-    !isReadonly && track(toRaw(target), "iterate", ITERATE_KEY);
+    !isReadonly2 && track(toRaw(target), "iterate", ITERATE_KEY);
     return Reflect.get(target, "size", target);
   }
-  function add(value) {
-    value = toRaw(value);
+  function add(value, _isShallow = false) {
+    if (!_isShallow && !isShallow(value) && !isReadonly(value)) {
+      value = toRaw(value);
+    }
     const target = toRaw(this);
     const proto = getProto(target);
     const hadKey = proto.has.call(target, value);
@@ -991,8 +993,10 @@ var Vue = (function (exports) {
     }
     return this;
   }
-  function set(key, value) {
-    value = toRaw(value);
+  function set(key, value, _isShallow = false) {
+    if (!_isShallow && !isShallow(value) && !isReadonly(value)) {
+      value = toRaw(value);
+    }
     const target = toRaw(this);
     const { has: has2, get: get2 } = getProto(target);
     let hadKey = has2.call(target, key);
@@ -1038,19 +1042,19 @@ var Vue = (function (exports) {
     }
     return result;
   }
-  function createForEach(isReadonly, isShallow) {
+  function createForEach(isReadonly2, isShallow2) {
     return function forEach(callback, thisArg) {
       const observed = this;
       const target = observed["__v_raw"];
       const rawTarget = toRaw(target);
-      const wrap = isShallow ? toShallow : isReadonly ? toReadonly : toReactive;
-      !isReadonly && track(rawTarget, "iterate", ITERATE_KEY);
+      const wrap = isShallow2 ? toShallow : isReadonly2 ? toReadonly : toReactive;
+      !isReadonly2 && track(rawTarget, "iterate", ITERATE_KEY);
       return target.forEach((value, key) => {
         return callback.call(thisArg, wrap(value), wrap(key), observed);
       });
     };
   }
-  function createIterableMethod(method, isReadonly, isShallow) {
+  function createIterableMethod(method, isReadonly2, isShallow2) {
     return function(...args) {
       const target = this["__v_raw"];
       const rawTarget = toRaw(target);
@@ -1058,8 +1062,8 @@ var Vue = (function (exports) {
       const isPair = method === "entries" || method === Symbol.iterator && targetIsMap;
       const isKeyOnly = method === "keys" && targetIsMap;
       const innerIterator = target[method](...args);
-      const wrap = isShallow ? toShallow : isReadonly ? toReadonly : toReactive;
-      !isReadonly && track(
+      const wrap = isShallow2 ? toShallow : isReadonly2 ? toReadonly : toReactive;
+      !isReadonly2 && track(
         rawTarget,
         "iterate",
         isKeyOnly ? MAP_KEY_ITERATE_KEY : ITERATE_KEY
@@ -1115,8 +1119,12 @@ var Vue = (function (exports) {
         return size(this);
       },
       has,
-      add,
-      set,
+      add(value) {
+        return add.call(this, value, true);
+      },
+      set(key, value) {
+        return set.call(this, key, value, true);
+      },
       delete: deleteEntry,
       clear,
       forEach: createForEach(false, true)
@@ -1182,13 +1190,13 @@ var Vue = (function (exports) {
     shallowInstrumentations,
     shallowReadonlyInstrumentations
   ] = /* @__PURE__ */ createInstrumentations();
-  function createInstrumentationGetter(isReadonly, shallow) {
-    const instrumentations = shallow ? isReadonly ? shallowReadonlyInstrumentations : shallowInstrumentations : isReadonly ? readonlyInstrumentations : mutableInstrumentations;
+  function createInstrumentationGetter(isReadonly2, shallow) {
+    const instrumentations = shallow ? isReadonly2 ? shallowReadonlyInstrumentations : shallowInstrumentations : isReadonly2 ? readonlyInstrumentations : mutableInstrumentations;
     return (target, key, receiver) => {
       if (key === "__v_isReactive") {
-        return !isReadonly;
+        return !isReadonly2;
       } else if (key === "__v_isReadonly") {
-        return isReadonly;
+        return isReadonly2;
       } else if (key === "__v_raw") {
         return target;
       }
@@ -1284,7 +1292,11 @@ var Vue = (function (exports) {
   function createReactiveObject(target, isReadonly2, baseHandlers, collectionHandlers, proxyMap) {
     if (!isObject(target)) {
       {
-        warn$2(`value cannot be made reactive: ${String(target)}`);
+        warn$2(
+          `value cannot be made ${isReadonly2 ? "readonly" : "reactive"}: ${String(
+          target
+        )}`
+        );
       }
       return target;
     }
@@ -1420,7 +1432,7 @@ getter: `, this.getter);
       );
     }
   }
-  function triggerRefValue(ref2, dirtyLevel = 4, newVal) {
+  function triggerRefValue(ref2, dirtyLevel = 4, newVal, oldVal) {
     ref2 = toRaw(ref2);
     const dep = ref2.dep;
     if (dep) {
@@ -1431,7 +1443,8 @@ getter: `, this.getter);
           target: ref2,
           type: "set",
           key: "value",
-          newValue: newVal
+          newValue: newVal,
+          oldValue: oldVal
         } 
       );
     }
@@ -1467,9 +1480,10 @@ getter: `, this.getter);
       const useDirectValue = this.__v_isShallow || isShallow(newVal) || isReadonly(newVal);
       newVal = useDirectValue ? newVal : toRaw(newVal);
       if (hasChanged(newVal, this._rawValue)) {
+        const oldVal = this._rawValue;
         this._rawValue = newVal;
         this._value = useDirectValue ? newVal : toReactive(newVal);
-        triggerRefValue(this, 4, newVal);
+        triggerRefValue(this, 4, newVal, oldVal);
       }
     }
   }
@@ -1591,7 +1605,10 @@ getter: `, this.getter);
   function popWarningContext() {
     stack$1.pop();
   }
+  let isWarning = false;
   function warn$1(msg, ...args) {
+    if (isWarning) return;
+    isWarning = true;
     pauseTracking();
     const instance = stack$1.length ? stack$1[stack$1.length - 1].component : null;
     const appWarnHandler = instance && instance.appContext.config.warnHandler;
@@ -1602,6 +1619,7 @@ getter: `, this.getter);
         instance,
         11,
         [
+          // eslint-disable-next-line no-restricted-syntax
           msg + args.map((a) => {
             var _a, _b;
             return (_b = (_a = a.toString) == null ? void 0 : _a.call(a)) != null ? _b : JSON.stringify(a);
@@ -1623,6 +1641,7 @@ getter: `, this.getter);
       console.warn(...warnArgs);
     }
     resetTracking();
+    isWarning = false;
   }
   function getComponentTrace() {
     let currentVNode = stack$1[stack$1.length - 1];
@@ -1731,7 +1750,9 @@ getter: `, this.getter);
     "ASYNC_COMPONENT_LOADER": 13,
     "13": "ASYNC_COMPONENT_LOADER",
     "SCHEDULER": 14,
-    "14": "SCHEDULER"
+    "14": "SCHEDULER",
+    "COMPONENT_UPDATE": 15,
+    "15": "COMPONENT_UPDATE"
   };
   const ErrorTypeStrings$1 = {
     ["sp"]: "serverPrefetch hook",
@@ -1762,7 +1783,8 @@ getter: `, this.getter);
     [11]: "app warnHandler",
     [12]: "ref function",
     [13]: "async component loader",
-    [14]: "scheduler flush. This is likely a Vue internals bug. Please open an issue at https://github.com/vuejs/core ."
+    [14]: "scheduler flush",
+    [15]: "component update"
   };
   function callWithErrorHandling(fn, instance, type, args) {
     try {
@@ -1944,10 +1966,11 @@ getter: `, this.getter);
         seen = seen || /* @__PURE__ */ new Map();
       }
       for (postFlushIndex = 0; postFlushIndex < activePostFlushCbs.length; postFlushIndex++) {
-        if (checkRecursiveUpdates(seen, activePostFlushCbs[postFlushIndex])) {
+        const cb = activePostFlushCbs[postFlushIndex];
+        if (checkRecursiveUpdates(seen, cb)) {
           continue;
         }
-        activePostFlushCbs[postFlushIndex]();
+        if (cb.active !== false) cb();
       }
       activePostFlushCbs = null;
       postFlushIndex = 0;
@@ -1957,10 +1980,8 @@ getter: `, this.getter);
   const comparator = (a, b) => {
     const diff = getId(a) - getId(b);
     if (diff === 0) {
-      if (a.pre && !b.pre)
-        return -1;
-      if (b.pre && !a.pre)
-        return 1;
+      if (a.pre && !b.pre) return -1;
+      if (b.pre && !a.pre) return 1;
     }
     return diff;
   };
@@ -1979,7 +2000,11 @@ getter: `, this.getter);
           if (check(job)) {
             continue;
           }
-          callWithErrorHandling(job, null, 14);
+          callWithErrorHandling(
+            job,
+            job.i,
+            job.i ? 15 : 14
+          );
         }
       }
     } finally {
@@ -1999,7 +2024,7 @@ getter: `, this.getter);
     } else {
       const count = seen.get(fn);
       if (count > RECURSION_LIMIT) {
-        const instance = fn.ownerInstance;
+        const instance = fn.i;
         const componentName = instance && getComponentName(instance.type);
         handleError(
           `Maximum recursive updates exceeded${componentName ? ` in component <${componentName}>` : ``}. This means you have a reactive effect that is mutating its own dependencies and thus recursively triggering itself. Possible sources include component template, render function, updated hook or watcher source function.`,
@@ -2014,7 +2039,7 @@ getter: `, this.getter);
   }
 
   let isHmrUpdating = false;
-  const hmrDirtyComponents = /* @__PURE__ */ new Set();
+  const hmrDirtyComponents = /* @__PURE__ */ new Map();
   {
     getGlobalThis().__VUE_HMR_RUNTIME__ = {
       createRecord: tryWrap(createRecord),
@@ -2068,29 +2093,34 @@ getter: `, this.getter);
   }
   function reload(id, newComp) {
     const record = map.get(id);
-    if (!record)
-      return;
+    if (!record) return;
     newComp = normalizeClassComponent(newComp);
     updateComponentDef(record.initialDef, newComp);
     const instances = [...record.instances];
-    for (const instance of instances) {
+    for (let i = 0; i < instances.length; i++) {
+      const instance = instances[i];
       const oldComp = normalizeClassComponent(instance.type);
-      if (!hmrDirtyComponents.has(oldComp)) {
+      let dirtyInstances = hmrDirtyComponents.get(oldComp);
+      if (!dirtyInstances) {
         if (oldComp !== record.initialDef) {
           updateComponentDef(oldComp, newComp);
         }
-        hmrDirtyComponents.add(oldComp);
+        hmrDirtyComponents.set(oldComp, dirtyInstances = /* @__PURE__ */ new Set());
       }
+      dirtyInstances.add(instance);
       instance.appContext.propsCache.delete(instance.type);
       instance.appContext.emitsCache.delete(instance.type);
       instance.appContext.optionsCache.delete(instance.type);
       if (instance.ceReload) {
-        hmrDirtyComponents.add(oldComp);
+        dirtyInstances.add(instance);
         instance.ceReload(newComp.styles);
-        hmrDirtyComponents.delete(oldComp);
+        dirtyInstances.delete(instance);
       } else if (instance.parent) {
         instance.parent.effect.dirty = true;
-        queueJob(instance.parent.update);
+        queueJob(() => {
+          instance.parent.update();
+          dirtyInstances.delete(instance);
+        });
       } else if (instance.appContext.reload) {
         instance.appContext.reload();
       } else if (typeof window !== "undefined") {
@@ -2102,11 +2132,7 @@ getter: `, this.getter);
       }
     }
     queuePostFlushCb(() => {
-      for (const instance of instances) {
-        hmrDirtyComponents.delete(
-          normalizeClassComponent(instance.type)
-        );
-      }
+      hmrDirtyComponents.clear();
     });
   }
   function updateComponentDef(oldComp, newComp) {
@@ -2153,6 +2179,7 @@ getter: `, this.getter);
       // (#4815)
       typeof window !== "undefined" && // some envs mock window but not fully
       window.HTMLElement && // also exclude jsdom
+      // eslint-disable-next-line no-restricted-syntax
       !((_b = (_a = window.navigator) == null ? void 0 : _a.userAgent) == null ? void 0 : _b.includes("jsdom"))
     ) {
       const replay = target.__VUE_DEVTOOLS_HOOK_REPLAY__ = target.__VUE_DEVTOOLS_HOOK_REPLAY__ || [];
@@ -2229,145 +2256,6 @@ getter: `, this.getter);
     );
   }
 
-  function emit(instance, event, ...rawArgs) {
-    if (instance.isUnmounted)
-      return;
-    const props = instance.vnode.props || EMPTY_OBJ;
-    {
-      const {
-        emitsOptions,
-        propsOptions: [propsOptions]
-      } = instance;
-      if (emitsOptions) {
-        if (!(event in emitsOptions) && true) {
-          if (!propsOptions || !(toHandlerKey(event) in propsOptions)) {
-            warn$1(
-              `Component emitted event "${event}" but it is neither declared in the emits option nor as an "${toHandlerKey(event)}" prop.`
-            );
-          }
-        } else {
-          const validator = emitsOptions[event];
-          if (isFunction(validator)) {
-            const isValid = validator(...rawArgs);
-            if (!isValid) {
-              warn$1(
-                `Invalid event arguments: event validation failed for event "${event}".`
-              );
-            }
-          }
-        }
-      }
-    }
-    let args = rawArgs;
-    const isModelListener = event.startsWith("update:");
-    const modelArg = isModelListener && event.slice(7);
-    if (modelArg && modelArg in props) {
-      const modifiersKey = `${modelArg === "modelValue" ? "model" : modelArg}Modifiers`;
-      const { number, trim } = props[modifiersKey] || EMPTY_OBJ;
-      if (trim) {
-        args = rawArgs.map((a) => isString(a) ? a.trim() : a);
-      }
-      if (number) {
-        args = rawArgs.map(looseToNumber);
-      }
-    }
-    {
-      devtoolsComponentEmit(instance, event, args);
-    }
-    {
-      const lowerCaseEvent = event.toLowerCase();
-      if (lowerCaseEvent !== event && props[toHandlerKey(lowerCaseEvent)]) {
-        warn$1(
-          `Event "${lowerCaseEvent}" is emitted in component ${formatComponentName(
-          instance,
-          instance.type
-        )} but the handler is registered for "${event}". Note that HTML attributes are case-insensitive and you cannot use v-on to listen to camelCase events when using in-DOM templates. You should probably use "${hyphenate(
-          event
-        )}" instead of "${event}".`
-        );
-      }
-    }
-    let handlerName;
-    let handler = props[handlerName = toHandlerKey(event)] || // also try camelCase event handler (#2249)
-    props[handlerName = toHandlerKey(camelize(event))];
-    if (!handler && isModelListener) {
-      handler = props[handlerName = toHandlerKey(hyphenate(event))];
-    }
-    if (handler) {
-      callWithAsyncErrorHandling(
-        handler,
-        instance,
-        6,
-        args
-      );
-    }
-    const onceHandler = props[handlerName + `Once`];
-    if (onceHandler) {
-      if (!instance.emitted) {
-        instance.emitted = {};
-      } else if (instance.emitted[handlerName]) {
-        return;
-      }
-      instance.emitted[handlerName] = true;
-      callWithAsyncErrorHandling(
-        onceHandler,
-        instance,
-        6,
-        args
-      );
-    }
-  }
-  function normalizeEmitsOptions(comp, appContext, asMixin = false) {
-    const cache = appContext.emitsCache;
-    const cached = cache.get(comp);
-    if (cached !== void 0) {
-      return cached;
-    }
-    const raw = comp.emits;
-    let normalized = {};
-    let hasExtends = false;
-    if (!isFunction(comp)) {
-      const extendEmits = (raw2) => {
-        const normalizedFromExtend = normalizeEmitsOptions(raw2, appContext, true);
-        if (normalizedFromExtend) {
-          hasExtends = true;
-          extend(normalized, normalizedFromExtend);
-        }
-      };
-      if (!asMixin && appContext.mixins.length) {
-        appContext.mixins.forEach(extendEmits);
-      }
-      if (comp.extends) {
-        extendEmits(comp.extends);
-      }
-      if (comp.mixins) {
-        comp.mixins.forEach(extendEmits);
-      }
-    }
-    if (!raw && !hasExtends) {
-      if (isObject(comp)) {
-        cache.set(comp, null);
-      }
-      return null;
-    }
-    if (isArray(raw)) {
-      raw.forEach((key) => normalized[key] = null);
-    } else {
-      extend(normalized, raw);
-    }
-    if (isObject(comp)) {
-      cache.set(comp, normalized);
-    }
-    return normalized;
-  }
-  function isEmitListener(options, key) {
-    if (!options || !isOn(key)) {
-      return false;
-    }
-    key = key.slice(2).replace(/Once$/, "");
-    return hasOwn(options, key[0].toLowerCase() + key.slice(1)) || hasOwn(options, hyphenate(key)) || hasOwn(options, key);
-  }
-
   let currentRenderingInstance = null;
   let currentScopeId = null;
   function setCurrentRenderingInstance(instance) {
@@ -2384,8 +2272,7 @@ getter: `, this.getter);
   }
   const withScopeId = (_id) => withCtx;
   function withCtx(fn, ctx = currentRenderingInstance, isNonScopedSlot) {
-    if (!ctx)
-      return fn;
+    if (!ctx) return fn;
     if (fn._n) {
       return fn;
     }
@@ -2414,4427 +2301,4555 @@ getter: `, this.getter);
     return renderFnWithContext;
   }
 
-  let accessedAttrs = false;
-  function markAttrsAccessed() {
-    accessedAttrs = true;
+  function validateDirectiveName(name) {
+    if (isBuiltInDirective(name)) {
+      warn$1("Do not use built-in directive ids as custom directive id: " + name);
+    }
   }
-  function renderComponentRoot(instance) {
-    const {
-      type: Component,
-      vnode,
-      proxy,
-      withProxy,
-      propsOptions: [propsOptions],
-      slots,
-      attrs,
-      emit,
-      render,
-      renderCache,
-      props,
-      data,
-      setupState,
-      ctx,
-      inheritAttrs
-    } = instance;
-    const prev = setCurrentRenderingInstance(instance);
-    let result;
-    let fallthroughAttrs;
-    {
-      accessedAttrs = false;
+  function withDirectives(vnode, directives) {
+    if (currentRenderingInstance === null) {
+      warn$1(`withDirectives can only be used inside render functions.`);
+      return vnode;
     }
-    try {
-      if (vnode.shapeFlag & 4) {
-        const proxyToUse = withProxy || proxy;
-        const thisProxy = setupState.__isScriptSetup ? new Proxy(proxyToUse, {
-          get(target, key, receiver) {
-            warn$1(
-              `Property '${String(
-              key
-            )}' was accessed via 'this'. Avoid using 'this' in templates.`
-            );
-            return Reflect.get(target, key, receiver);
-          }
-        }) : proxyToUse;
-        result = normalizeVNode(
-          render.call(
-            thisProxy,
-            proxyToUse,
-            renderCache,
-            true ? shallowReadonly(props) : props,
-            setupState,
-            data,
-            ctx
-          )
-        );
-        fallthroughAttrs = attrs;
-      } else {
-        const render2 = Component;
-        if (attrs === props) {
-          markAttrsAccessed();
-        }
-        result = normalizeVNode(
-          render2.length > 1 ? render2(
-            true ? shallowReadonly(props) : props,
-            true ? {
-              get attrs() {
-                markAttrsAccessed();
-                return shallowReadonly(attrs);
-              },
-              slots,
-              emit
-            } : { attrs, slots, emit }
-          ) : render2(
-            true ? shallowReadonly(props) : props,
-            null
-          )
-        );
-        fallthroughAttrs = Component.props ? attrs : getFunctionalFallthrough(attrs);
-      }
-    } catch (err) {
-      blockStack.length = 0;
-      handleError(err, instance, 1);
-      result = createVNode(Comment);
-    }
-    let root = result;
-    let setRoot = void 0;
-    if (result.patchFlag > 0 && result.patchFlag & 2048) {
-      [root, setRoot] = getChildRoot(result);
-    }
-    if (fallthroughAttrs && inheritAttrs !== false) {
-      const keys = Object.keys(fallthroughAttrs);
-      const { shapeFlag } = root;
-      if (keys.length) {
-        if (shapeFlag & (1 | 6)) {
-          if (propsOptions && keys.some(isModelListener)) {
-            fallthroughAttrs = filterModelListeners(
-              fallthroughAttrs,
-              propsOptions
-            );
-          }
-          root = cloneVNode(root, fallthroughAttrs, false, true);
-        } else if (!accessedAttrs && root.type !== Comment) {
-          const allAttrs = Object.keys(attrs);
-          const eventAttrs = [];
-          const extraAttrs = [];
-          for (let i = 0, l = allAttrs.length; i < l; i++) {
-            const key = allAttrs[i];
-            if (isOn(key)) {
-              if (!isModelListener(key)) {
-                eventAttrs.push(key[2].toLowerCase() + key.slice(3));
-              }
-            } else {
-              extraAttrs.push(key);
-            }
-          }
-          if (extraAttrs.length) {
-            warn$1(
-              `Extraneous non-props attributes (${extraAttrs.join(", ")}) were passed to component but could not be automatically inherited because component renders fragment or text root nodes.`
-            );
-          }
-          if (eventAttrs.length) {
-            warn$1(
-              `Extraneous non-emits event listeners (${eventAttrs.join(", ")}) were passed to component but could not be automatically inherited because component renders fragment or text root nodes. If the listener is intended to be a component custom event listener only, declare it using the "emits" option.`
-            );
-          }
+    const instance = getComponentPublicInstance(currentRenderingInstance);
+    const bindings = vnode.dirs || (vnode.dirs = []);
+    for (let i = 0; i < directives.length; i++) {
+      let [dir, value, arg, modifiers = EMPTY_OBJ] = directives[i];
+      if (dir) {
+        if (isFunction(dir)) {
+          dir = {
+            mounted: dir,
+            updated: dir
+          };
         }
+        if (dir.deep) {
+          traverse(value);
+        }
+        bindings.push({
+          dir,
+          instance,
+          value,
+          oldValue: void 0,
+          arg,
+          modifiers
+        });
       }
     }
-    if (vnode.dirs) {
-      if (!isElementRoot(root)) {
-        warn$1(
-          `Runtime directive used on component with non-element root node. The directives will not function as intended.`
-        );
+    return vnode;
+  }
+  function invokeDirectiveHook(vnode, prevVNode, instance, name) {
+    const bindings = vnode.dirs;
+    const oldBindings = prevVNode && prevVNode.dirs;
+    for (let i = 0; i < bindings.length; i++) {
+      const binding = bindings[i];
+      if (oldBindings) {
+        binding.oldValue = oldBindings[i].value;
       }
-      root = cloneVNode(root, null, false, true);
-      root.dirs = root.dirs ? root.dirs.concat(vnode.dirs) : vnode.dirs;
-    }
-    if (vnode.transition) {
-      if (!isElementRoot(root)) {
-        warn$1(
-          `Component inside <Transition> renders non-element root node that cannot be animated.`
-        );
+      let hook = binding.dir[name];
+      if (hook) {
+        pauseTracking();
+        callWithAsyncErrorHandling(hook, instance, 8, [
+          vnode.el,
+          binding,
+          vnode,
+          prevVNode
+        ]);
+        resetTracking();
       }
-      root.transition = vnode.transition;
-    }
-    if (setRoot) {
-      setRoot(root);
-    } else {
-      result = root;
     }
-    setCurrentRenderingInstance(prev);
-    return result;
   }
-  const getChildRoot = (vnode) => {
-    const rawChildren = vnode.children;
-    const dynamicChildren = vnode.dynamicChildren;
-    const childRoot = filterSingleRoot(rawChildren, false);
-    if (!childRoot) {
-      return [vnode, void 0];
-    } else if (childRoot.patchFlag > 0 && childRoot.patchFlag & 2048) {
-      return getChildRoot(childRoot);
-    }
-    const index = rawChildren.indexOf(childRoot);
-    const dynamicIndex = dynamicChildren ? dynamicChildren.indexOf(childRoot) : -1;
-    const setRoot = (updatedRoot) => {
-      rawChildren[index] = updatedRoot;
-      if (dynamicChildren) {
-        if (dynamicIndex > -1) {
-          dynamicChildren[dynamicIndex] = updatedRoot;
-        } else if (updatedRoot.patchFlag > 0) {
-          vnode.dynamicChildren = [...dynamicChildren, updatedRoot];
-        }
-      }
+
+  const leaveCbKey = Symbol("_leaveCb");
+  const enterCbKey$1 = Symbol("_enterCb");
+  function useTransitionState() {
+    const state = {
+      isMounted: false,
+      isLeaving: false,
+      isUnmounting: false,
+      leavingVNodes: /* @__PURE__ */ new Map()
     };
-    return [normalizeVNode(childRoot), setRoot];
-  };
-  function filterSingleRoot(children, recurse = true) {
-    let singleRoot;
-    for (let i = 0; i < children.length; i++) {
-      const child = children[i];
-      if (isVNode(child)) {
-        if (child.type !== Comment || child.children === "v-if") {
-          if (singleRoot) {
-            return;
-          } else {
-            singleRoot = child;
-            if (recurse && singleRoot.patchFlag > 0 && singleRoot.patchFlag & 2048) {
-              return filterSingleRoot(singleRoot.children);
-            }
-          }
-        }
-      } else {
-        return;
-      }
-    }
-    return singleRoot;
+    onMounted(() => {
+      state.isMounted = true;
+    });
+    onBeforeUnmount(() => {
+      state.isUnmounting = true;
+    });
+    return state;
   }
-  const getFunctionalFallthrough = (attrs) => {
-    let res;
-    for (const key in attrs) {
-      if (key === "class" || key === "style" || isOn(key)) {
-        (res || (res = {}))[key] = attrs[key];
-      }
-    }
-    return res;
-  };
-  const filterModelListeners = (attrs, props) => {
-    const res = {};
-    for (const key in attrs) {
-      if (!isModelListener(key) || !(key.slice(9) in props)) {
-        res[key] = attrs[key];
-      }
-    }
-    return res;
+  const TransitionHookValidator = [Function, Array];
+  const BaseTransitionPropsValidators = {
+    mode: String,
+    appear: Boolean,
+    persisted: Boolean,
+    // enter
+    onBeforeEnter: TransitionHookValidator,
+    onEnter: TransitionHookValidator,
+    onAfterEnter: TransitionHookValidator,
+    onEnterCancelled: TransitionHookValidator,
+    // leave
+    onBeforeLeave: TransitionHookValidator,
+    onLeave: TransitionHookValidator,
+    onAfterLeave: TransitionHookValidator,
+    onLeaveCancelled: TransitionHookValidator,
+    // appear
+    onBeforeAppear: TransitionHookValidator,
+    onAppear: TransitionHookValidator,
+    onAfterAppear: TransitionHookValidator,
+    onAppearCancelled: TransitionHookValidator
   };
-  const isElementRoot = (vnode) => {
-    return vnode.shapeFlag & (6 | 1) || vnode.type === Comment;
+  const recursiveGetSubtree = (instance) => {
+    const subTree = instance.subTree;
+    return subTree.component ? recursiveGetSubtree(subTree.component) : subTree;
   };
-  function shouldUpdateComponent(prevVNode, nextVNode, optimized) {
-    const { props: prevProps, children: prevChildren, component } = prevVNode;
-    const { props: nextProps, children: nextChildren, patchFlag } = nextVNode;
-    const emits = component.emitsOptions;
-    if ((prevChildren || nextChildren) && isHmrUpdating) {
-      return true;
-    }
-    if (nextVNode.dirs || nextVNode.transition) {
-      return true;
-    }
-    if (optimized && patchFlag >= 0) {
-      if (patchFlag & 1024) {
-        return true;
-      }
-      if (patchFlag & 16) {
-        if (!prevProps) {
-          return !!nextProps;
+  const BaseTransitionImpl = {
+    name: `BaseTransition`,
+    props: BaseTransitionPropsValidators,
+    setup(props, { slots }) {
+      const instance = getCurrentInstance();
+      const state = useTransitionState();
+      return () => {
+        const children = slots.default && getTransitionRawChildren(slots.default(), true);
+        if (!children || !children.length) {
+          return;
         }
-        return hasPropsChanged(prevProps, nextProps, emits);
-      } else if (patchFlag & 8) {
-        const dynamicProps = nextVNode.dynamicProps;
-        for (let i = 0; i < dynamicProps.length; i++) {
-          const key = dynamicProps[i];
-          if (nextProps[key] !== prevProps[key] && !isEmitListener(emits, key)) {
-            return true;
+        let child = children[0];
+        if (children.length > 1) {
+          let hasFound = false;
+          for (const c of children) {
+            if (c.type !== Comment) {
+              if (hasFound) {
+                warn$1(
+                  "<transition> can only be used on a single element or component. Use <transition-group> for lists."
+                );
+                break;
+              }
+              child = c;
+              hasFound = true;
+            }
           }
         }
-      }
-    } else {
-      if (prevChildren || nextChildren) {
-        if (!nextChildren || !nextChildren.$stable) {
-          return true;
+        const rawProps = toRaw(props);
+        const { mode } = rawProps;
+        if (mode && mode !== "in-out" && mode !== "out-in" && mode !== "default") {
+          warn$1(`invalid <transition> mode: ${mode}`);
         }
-      }
-      if (prevProps === nextProps) {
-        return false;
-      }
-      if (!prevProps) {
-        return !!nextProps;
-      }
-      if (!nextProps) {
-        return true;
-      }
-      return hasPropsChanged(prevProps, nextProps, emits);
-    }
-    return false;
-  }
-  function hasPropsChanged(prevProps, nextProps, emitsOptions) {
-    const nextKeys = Object.keys(nextProps);
-    if (nextKeys.length !== Object.keys(prevProps).length) {
-      return true;
+        if (state.isLeaving) {
+          return emptyPlaceholder(child);
+        }
+        const innerChild = getKeepAliveChild(child);
+        if (!innerChild) {
+          return emptyPlaceholder(child);
+        }
+        let enterHooks = resolveTransitionHooks(
+          innerChild,
+          rawProps,
+          state,
+          instance,
+          // #11061, ensure enterHooks is fresh after clone
+          (hooks) => enterHooks = hooks
+        );
+        setTransitionHooks(innerChild, enterHooks);
+        const oldChild = instance.subTree;
+        const oldInnerChild = oldChild && getKeepAliveChild(oldChild);
+        if (oldInnerChild && oldInnerChild.type !== Comment && !isSameVNodeType(innerChild, oldInnerChild) && recursiveGetSubtree(instance).type !== Comment) {
+          const leavingHooks = resolveTransitionHooks(
+            oldInnerChild,
+            rawProps,
+            state,
+            instance
+          );
+          setTransitionHooks(oldInnerChild, leavingHooks);
+          if (mode === "out-in" && innerChild.type !== Comment) {
+            state.isLeaving = true;
+            leavingHooks.afterLeave = () => {
+              state.isLeaving = false;
+              if (instance.update.active !== false) {
+                instance.effect.dirty = true;
+                instance.update();
+              }
+            };
+            return emptyPlaceholder(child);
+          } else if (mode === "in-out" && innerChild.type !== Comment) {
+            leavingHooks.delayLeave = (el, earlyRemove, delayedLeave) => {
+              const leavingVNodesCache = getLeavingNodesForType(
+                state,
+                oldInnerChild
+              );
+              leavingVNodesCache[String(oldInnerChild.key)] = oldInnerChild;
+              el[leaveCbKey] = () => {
+                earlyRemove();
+                el[leaveCbKey] = void 0;
+                delete enterHooks.delayedLeave;
+              };
+              enterHooks.delayedLeave = delayedLeave;
+            };
+          }
+        }
+        return child;
+      };
     }
-    for (let i = 0; i < nextKeys.length; i++) {
-      const key = nextKeys[i];
-      if (nextProps[key] !== prevProps[key] && !isEmitListener(emitsOptions, key)) {
-        return true;
-      }
+  };
+  const BaseTransition = BaseTransitionImpl;
+  function getLeavingNodesForType(state, vnode) {
+    const { leavingVNodes } = state;
+    let leavingVNodesCache = leavingVNodes.get(vnode.type);
+    if (!leavingVNodesCache) {
+      leavingVNodesCache = /* @__PURE__ */ Object.create(null);
+      leavingVNodes.set(vnode.type, leavingVNodesCache);
     }
-    return false;
+    return leavingVNodesCache;
   }
-  function updateHOCHostEl({ vnode, parent }, el) {
-    while (parent) {
-      const root = parent.subTree;
-      if (root.suspense && root.suspense.activeBranch === vnode) {
-        root.el = vnode.el;
+  function resolveTransitionHooks(vnode, props, state, instance, postClone) {
+    const {
+      appear,
+      mode,
+      persisted = false,
+      onBeforeEnter,
+      onEnter,
+      onAfterEnter,
+      onEnterCancelled,
+      onBeforeLeave,
+      onLeave,
+      onAfterLeave,
+      onLeaveCancelled,
+      onBeforeAppear,
+      onAppear,
+      onAfterAppear,
+      onAppearCancelled
+    } = props;
+    const key = String(vnode.key);
+    const leavingVNodesCache = getLeavingNodesForType(state, vnode);
+    const callHook = (hook, args) => {
+      hook && callWithAsyncErrorHandling(
+        hook,
+        instance,
+        9,
+        args
+      );
+    };
+    const callAsyncHook = (hook, args) => {
+      const done = args[1];
+      callHook(hook, args);
+      if (isArray(hook)) {
+        if (hook.every((hook2) => hook2.length <= 1)) done();
+      } else if (hook.length <= 1) {
+        done();
       }
-      if (root === vnode) {
-        (vnode = parent.vnode).el = el;
-        parent = parent.parent;
-      } else {
-        break;
+    };
+    const hooks = {
+      mode,
+      persisted,
+      beforeEnter(el) {
+        let hook = onBeforeEnter;
+        if (!state.isMounted) {
+          if (appear) {
+            hook = onBeforeAppear || onBeforeEnter;
+          } else {
+            return;
+          }
+        }
+        if (el[leaveCbKey]) {
+          el[leaveCbKey](
+            true
+            /* cancelled */
+          );
+        }
+        const leavingVNode = leavingVNodesCache[key];
+        if (leavingVNode && isSameVNodeType(vnode, leavingVNode) && leavingVNode.el[leaveCbKey]) {
+          leavingVNode.el[leaveCbKey]();
+        }
+        callHook(hook, [el]);
+      },
+      enter(el) {
+        let hook = onEnter;
+        let afterHook = onAfterEnter;
+        let cancelHook = onEnterCancelled;
+        if (!state.isMounted) {
+          if (appear) {
+            hook = onAppear || onEnter;
+            afterHook = onAfterAppear || onAfterEnter;
+            cancelHook = onAppearCancelled || onEnterCancelled;
+          } else {
+            return;
+          }
+        }
+        let called = false;
+        const done = el[enterCbKey$1] = (cancelled) => {
+          if (called) return;
+          called = true;
+          if (cancelled) {
+            callHook(cancelHook, [el]);
+          } else {
+            callHook(afterHook, [el]);
+          }
+          if (hooks.delayedLeave) {
+            hooks.delayedLeave();
+          }
+          el[enterCbKey$1] = void 0;
+        };
+        if (hook) {
+          callAsyncHook(hook, [el, done]);
+        } else {
+          done();
+        }
+      },
+      leave(el, remove) {
+        const key2 = String(vnode.key);
+        if (el[enterCbKey$1]) {
+          el[enterCbKey$1](
+            true
+            /* cancelled */
+          );
+        }
+        if (state.isUnmounting) {
+          return remove();
+        }
+        callHook(onBeforeLeave, [el]);
+        let called = false;
+        const done = el[leaveCbKey] = (cancelled) => {
+          if (called) return;
+          called = true;
+          remove();
+          if (cancelled) {
+            callHook(onLeaveCancelled, [el]);
+          } else {
+            callHook(onAfterLeave, [el]);
+          }
+          el[leaveCbKey] = void 0;
+          if (leavingVNodesCache[key2] === vnode) {
+            delete leavingVNodesCache[key2];
+          }
+        };
+        leavingVNodesCache[key2] = vnode;
+        if (onLeave) {
+          callAsyncHook(onLeave, [el, done]);
+        } else {
+          done();
+        }
+      },
+      clone(vnode2) {
+        const hooks2 = resolveTransitionHooks(
+          vnode2,
+          props,
+          state,
+          instance,
+          postClone
+        );
+        if (postClone) postClone(hooks2);
+        return hooks2;
       }
+    };
+    return hooks;
+  }
+  function emptyPlaceholder(vnode) {
+    if (isKeepAlive(vnode)) {
+      vnode = cloneVNode(vnode);
+      vnode.children = null;
+      return vnode;
     }
   }
-
-  const COMPONENTS = "components";
-  const DIRECTIVES = "directives";
-  function resolveComponent(name, maybeSelfReference) {
-    return resolveAsset(COMPONENTS, name, true, maybeSelfReference) || name;
+  function getKeepAliveChild(vnode) {
+    if (!isKeepAlive(vnode)) {
+      return vnode;
+    }
+    if (vnode.component) {
+      return vnode.component.subTree;
+    }
+    const { shapeFlag, children } = vnode;
+    if (children) {
+      if (shapeFlag & 16) {
+        return children[0];
+      }
+      if (shapeFlag & 32 && isFunction(children.default)) {
+        return children.default();
+      }
+    }
   }
-  const NULL_DYNAMIC_COMPONENT = Symbol.for("v-ndc");
-  function resolveDynamicComponent(component) {
-    if (isString(component)) {
-      return resolveAsset(COMPONENTS, component, false) || component;
+  function setTransitionHooks(vnode, hooks) {
+    if (vnode.shapeFlag & 6 && vnode.component) {
+      setTransitionHooks(vnode.component.subTree, hooks);
+    } else if (vnode.shapeFlag & 128) {
+      vnode.ssContent.transition = hooks.clone(vnode.ssContent);
+      vnode.ssFallback.transition = hooks.clone(vnode.ssFallback);
     } else {
-      return component || NULL_DYNAMIC_COMPONENT;
+      vnode.transition = hooks;
     }
   }
-  function resolveDirective(name) {
-    return resolveAsset(DIRECTIVES, name);
-  }
-  function resolveAsset(type, name, warnMissing = true, maybeSelfReference = false) {
-    const instance = currentRenderingInstance || currentInstance;
-    if (instance) {
-      const Component = instance.type;
-      if (type === COMPONENTS) {
-        const selfName = getComponentName(
-          Component,
-          false
+  function getTransitionRawChildren(children, keepComment = false, parentKey) {
+    let ret = [];
+    let keyedFragmentCount = 0;
+    for (let i = 0; i < children.length; i++) {
+      let child = children[i];
+      const key = parentKey == null ? child.key : String(parentKey) + String(child.key != null ? child.key : i);
+      if (child.type === Fragment) {
+        if (child.patchFlag & 128) keyedFragmentCount++;
+        ret = ret.concat(
+          getTransitionRawChildren(child.children, keepComment, key)
         );
-        if (selfName && (selfName === name || selfName === camelize(name) || selfName === capitalize(camelize(name)))) {
-          return Component;
-        }
-      }
-      const res = (
-        // local registration
-        // check instance[type] first which is resolved for options API
-        resolve(instance[type] || Component[type], name) || // global registration
-        resolve(instance.appContext[type], name)
-      );
-      if (!res && maybeSelfReference) {
-        return Component;
+      } else if (keepComment || child.type !== Comment) {
+        ret.push(key != null ? cloneVNode(child, { key }) : child);
       }
-      if (warnMissing && !res) {
-        const extra = type === COMPONENTS ? `
-If this is a native custom element, make sure to exclude it from component resolution via compilerOptions.isCustomElement.` : ``;
-        warn$1(`Failed to resolve ${type.slice(0, -1)}: ${name}${extra}`);
+    }
+    if (keyedFragmentCount > 1) {
+      for (let i = 0; i < ret.length; i++) {
+        ret[i].patchFlag = -2;
       }
-      return res;
-    } else {
-      warn$1(
-        `resolve${capitalize(type.slice(0, -1))} can only be used in render() or setup().`
-      );
     }
+    return ret;
   }
-  function resolve(registry, name) {
-    return registry && (registry[name] || registry[camelize(name)] || registry[capitalize(camelize(name))]);
+
+  /*! #__NO_SIDE_EFFECTS__ */
+  // @__NO_SIDE_EFFECTS__
+  function defineComponent(options, extraOptions) {
+    return isFunction(options) ? (
+      // #8326: extend call and options.name access are considered side-effects
+      // by Rollup, so we have to wrap it in a pure-annotated IIFE.
+      /* @__PURE__ */ (() => extend({ name: options.name }, extraOptions, { setup: options }))()
+    ) : options;
   }
 
-  const isSuspense = (type) => type.__isSuspense;
-  let suspenseId = 0;
-  const SuspenseImpl = {
-    name: "Suspense",
-    // In order to make Suspense tree-shakable, we need to avoid importing it
-    // directly in the renderer. The renderer checks for the __isSuspense flag
-    // on a vnode's type and calls the `process` method, passing in renderer
-    // internals.
-    __isSuspense: true,
-    process(n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized, rendererInternals) {
-      if (n1 == null) {
-        mountSuspense(
-          n2,
-          container,
-          anchor,
-          parentComponent,
-          parentSuspense,
-          namespace,
-          slotScopeIds,
-          optimized,
-          rendererInternals
-        );
-      } else {
-        if (parentSuspense && parentSuspense.deps > 0 && !n1.suspense.isInFallback) {
-          n2.suspense = n1.suspense;
-          n2.suspense.vnode = n2;
-          n2.el = n1.el;
-          return;
-        }
-        patchSuspense(
-          n1,
-          n2,
-          container,
-          anchor,
-          parentComponent,
-          namespace,
-          slotScopeIds,
-          optimized,
-          rendererInternals
-        );
-      }
-    },
-    hydrate: hydrateSuspense,
-    create: createSuspenseBoundary,
-    normalize: normalizeSuspenseChildren
-  };
-  const Suspense = SuspenseImpl ;
-  function triggerEvent(vnode, name) {
-    const eventListener = vnode.props && vnode.props[name];
-    if (isFunction(eventListener)) {
-      eventListener();
+  const isAsyncWrapper = (i) => !!i.type.__asyncLoader;
+  /*! #__NO_SIDE_EFFECTS__ */
+  // @__NO_SIDE_EFFECTS__
+  function defineAsyncComponent(source) {
+    if (isFunction(source)) {
+      source = { loader: source };
     }
-  }
-  function mountSuspense(vnode, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized, rendererInternals) {
     const {
-      p: patch,
-      o: { createElement }
-    } = rendererInternals;
-    const hiddenContainer = createElement("div");
-    const suspense = vnode.suspense = createSuspenseBoundary(
-      vnode,
-      parentSuspense,
-      parentComponent,
-      container,
-      hiddenContainer,
-      anchor,
-      namespace,
-      slotScopeIds,
-      optimized,
-      rendererInternals
-    );
-    patch(
-      null,
-      suspense.pendingBranch = vnode.ssContent,
-      hiddenContainer,
-      null,
-      parentComponent,
-      suspense,
-      namespace,
-      slotScopeIds
-    );
-    if (suspense.deps > 0) {
-      triggerEvent(vnode, "onPending");
-      triggerEvent(vnode, "onFallback");
-      patch(
-        null,
-        vnode.ssFallback,
-        container,
-        anchor,
-        parentComponent,
-        null,
-        // fallback tree will not have suspense context
-        namespace,
-        slotScopeIds
-      );
-      setActiveBranch(suspense, vnode.ssFallback);
-    } else {
-      suspense.resolve(false, true);
-    }
-  }
-  function patchSuspense(n1, n2, container, anchor, parentComponent, namespace, slotScopeIds, optimized, { p: patch, um: unmount, o: { createElement } }) {
-    const suspense = n2.suspense = n1.suspense;
-    suspense.vnode = n2;
-    n2.el = n1.el;
-    const newBranch = n2.ssContent;
-    const newFallback = n2.ssFallback;
-    const { activeBranch, pendingBranch, isInFallback, isHydrating } = suspense;
-    if (pendingBranch) {
-      suspense.pendingBranch = newBranch;
-      if (isSameVNodeType(newBranch, pendingBranch)) {
-        patch(
-          pendingBranch,
-          newBranch,
-          suspense.hiddenContainer,
-          null,
-          parentComponent,
-          suspense,
-          namespace,
-          slotScopeIds,
-          optimized
-        );
-        if (suspense.deps <= 0) {
-          suspense.resolve();
-        } else if (isInFallback) {
-          if (!isHydrating) {
-            patch(
-              activeBranch,
-              newFallback,
-              container,
-              anchor,
-              parentComponent,
-              null,
-              // fallback tree will not have suspense context
-              namespace,
-              slotScopeIds,
-              optimized
-            );
-            setActiveBranch(suspense, newFallback);
-          }
-        }
-      } else {
-        suspense.pendingId = suspenseId++;
-        if (isHydrating) {
-          suspense.isHydrating = false;
-          suspense.activeBranch = pendingBranch;
+      loader,
+      loadingComponent,
+      errorComponent,
+      delay = 200,
+      timeout,
+      // undefined = never times out
+      suspensible = true,
+      onError: userOnError
+    } = source;
+    let pendingRequest = null;
+    let resolvedComp;
+    let retries = 0;
+    const retry = () => {
+      retries++;
+      pendingRequest = null;
+      return load();
+    };
+    const load = () => {
+      let thisRequest;
+      return pendingRequest || (thisRequest = pendingRequest = loader().catch((err) => {
+        err = err instanceof Error ? err : new Error(String(err));
+        if (userOnError) {
+          return new Promise((resolve, reject) => {
+            const userRetry = () => resolve(retry());
+            const userFail = () => reject(err);
+            userOnError(err, userRetry, userFail, retries + 1);
+          });
         } else {
-          unmount(pendingBranch, parentComponent, suspense);
+          throw err;
         }
-        suspense.deps = 0;
-        suspense.effects.length = 0;
-        suspense.hiddenContainer = createElement("div");
-        if (isInFallback) {
-          patch(
-            null,
-            newBranch,
-            suspense.hiddenContainer,
-            null,
-            parentComponent,
-            suspense,
-            namespace,
-            slotScopeIds,
-            optimized
+      }).then((comp) => {
+        if (thisRequest !== pendingRequest && pendingRequest) {
+          return pendingRequest;
+        }
+        if (!comp) {
+          warn$1(
+            `Async component loader resolved to undefined. If you are using retry(), make sure to return its return value.`
           );
-          if (suspense.deps <= 0) {
-            suspense.resolve();
-          } else {
-            patch(
-              activeBranch,
-              newFallback,
-              container,
-              anchor,
-              parentComponent,
-              null,
-              // fallback tree will not have suspense context
-              namespace,
-              slotScopeIds,
-              optimized
-            );
-            setActiveBranch(suspense, newFallback);
-          }
-        } else if (activeBranch && isSameVNodeType(newBranch, activeBranch)) {
-          patch(
-            activeBranch,
-            newBranch,
-            container,
-            anchor,
-            parentComponent,
-            suspense,
-            namespace,
-            slotScopeIds,
-            optimized
-          );
-          suspense.resolve(true);
-        } else {
-          patch(
-            null,
-            newBranch,
-            suspense.hiddenContainer,
-            null,
-            parentComponent,
-            suspense,
-            namespace,
-            slotScopeIds,
-            optimized
+        }
+        if (comp && (comp.__esModule || comp[Symbol.toStringTag] === "Module")) {
+          comp = comp.default;
+        }
+        if (comp && !isObject(comp) && !isFunction(comp)) {
+          throw new Error(`Invalid async component load result: ${comp}`);
+        }
+        resolvedComp = comp;
+        return comp;
+      }));
+    };
+    return defineComponent({
+      name: "AsyncComponentWrapper",
+      __asyncLoader: load,
+      get __asyncResolved() {
+        return resolvedComp;
+      },
+      setup() {
+        const instance = currentInstance;
+        if (resolvedComp) {
+          return () => createInnerComp(resolvedComp, instance);
+        }
+        const onError = (err) => {
+          pendingRequest = null;
+          handleError(
+            err,
+            instance,
+            13,
+            !errorComponent
           );
-          if (suspense.deps <= 0) {
-            suspense.resolve();
-          }
+        };
+        if (suspensible && instance.suspense || false) {
+          return load().then((comp) => {
+            return () => createInnerComp(comp, instance);
+          }).catch((err) => {
+            onError(err);
+            return () => errorComponent ? createVNode(errorComponent, {
+              error: err
+            }) : null;
+          });
+        }
+        const loaded = ref(false);
+        const error = ref();
+        const delayed = ref(!!delay);
+        if (delay) {
+          setTimeout(() => {
+            delayed.value = false;
+          }, delay);
+        }
+        if (timeout != null) {
+          setTimeout(() => {
+            if (!loaded.value && !error.value) {
+              const err = new Error(
+                `Async component timed out after ${timeout}ms.`
+              );
+              onError(err);
+              error.value = err;
+            }
+          }, timeout);
         }
+        load().then(() => {
+          loaded.value = true;
+          if (instance.parent && isKeepAlive(instance.parent.vnode)) {
+            instance.parent.effect.dirty = true;
+            queueJob(instance.parent.update);
+          }
+        }).catch((err) => {
+          onError(err);
+          error.value = err;
+        });
+        return () => {
+          if (loaded.value && resolvedComp) {
+            return createInnerComp(resolvedComp, instance);
+          } else if (error.value && errorComponent) {
+            return createVNode(errorComponent, {
+              error: error.value
+            });
+          } else if (loadingComponent && !delayed.value) {
+            return createVNode(loadingComponent);
+          }
+        };
       }
-    } else {
-      if (activeBranch && isSameVNodeType(newBranch, activeBranch)) {
+    });
+  }
+  function createInnerComp(comp, parent) {
+    const { ref: ref2, props, children, ce } = parent.vnode;
+    const vnode = createVNode(comp, props, children);
+    vnode.ref = ref2;
+    vnode.ce = ce;
+    delete parent.vnode.ce;
+    return vnode;
+  }
+
+  const isKeepAlive = (vnode) => vnode.type.__isKeepAlive;
+  const KeepAliveImpl = {
+    name: `KeepAlive`,
+    // Marker for special handling inside the renderer. We are not using a ===
+    // check directly on KeepAlive in the renderer, because importing it directly
+    // would prevent it from being tree-shaken.
+    __isKeepAlive: true,
+    props: {
+      include: [String, RegExp, Array],
+      exclude: [String, RegExp, Array],
+      max: [String, Number]
+    },
+    setup(props, { slots }) {
+      const instance = getCurrentInstance();
+      const sharedContext = instance.ctx;
+      const cache = /* @__PURE__ */ new Map();
+      const keys = /* @__PURE__ */ new Set();
+      let current = null;
+      {
+        instance.__v_cache = cache;
+      }
+      const parentSuspense = instance.suspense;
+      const {
+        renderer: {
+          p: patch,
+          m: move,
+          um: _unmount,
+          o: { createElement }
+        }
+      } = sharedContext;
+      const storageContainer = createElement("div");
+      sharedContext.activate = (vnode, container, anchor, namespace, optimized) => {
+        const instance2 = vnode.component;
+        move(vnode, container, anchor, 0, parentSuspense);
         patch(
-          activeBranch,
-          newBranch,
+          instance2.vnode,
+          vnode,
           container,
           anchor,
-          parentComponent,
-          suspense,
+          instance2,
+          parentSuspense,
           namespace,
-          slotScopeIds,
+          vnode.slotScopeIds,
           optimized
         );
-        setActiveBranch(suspense, newBranch);
-      } else {
-        triggerEvent(n2, "onPending");
-        suspense.pendingBranch = newBranch;
-        if (newBranch.shapeFlag & 512) {
-          suspense.pendingId = newBranch.component.suspenseId;
-        } else {
-          suspense.pendingId = suspenseId++;
+        queuePostRenderEffect(() => {
+          instance2.isDeactivated = false;
+          if (instance2.a) {
+            invokeArrayFns(instance2.a);
+          }
+          const vnodeHook = vnode.props && vnode.props.onVnodeMounted;
+          if (vnodeHook) {
+            invokeVNodeHook(vnodeHook, instance2.parent, vnode);
+          }
+        }, parentSuspense);
+        {
+          devtoolsComponentAdded(instance2);
         }
-        patch(
-          null,
-          newBranch,
-          suspense.hiddenContainer,
-          null,
-          parentComponent,
-          suspense,
-          namespace,
-          slotScopeIds,
-          optimized
-        );
-        if (suspense.deps <= 0) {
-          suspense.resolve();
-        } else {
-          const { timeout, pendingId } = suspense;
-          if (timeout > 0) {
-            setTimeout(() => {
-              if (suspense.pendingId === pendingId) {
-                suspense.fallback(newFallback);
-              }
-            }, timeout);
-          } else if (timeout === 0) {
-            suspense.fallback(newFallback);
+      };
+      sharedContext.deactivate = (vnode) => {
+        const instance2 = vnode.component;
+        invalidateMount(instance2.m);
+        invalidateMount(instance2.a);
+        move(vnode, storageContainer, null, 1, parentSuspense);
+        queuePostRenderEffect(() => {
+          if (instance2.da) {
+            invokeArrayFns(instance2.da);
+          }
+          const vnodeHook = vnode.props && vnode.props.onVnodeUnmounted;
+          if (vnodeHook) {
+            invokeVNodeHook(vnodeHook, instance2.parent, vnode);
           }
+          instance2.isDeactivated = true;
+        }, parentSuspense);
+        {
+          devtoolsComponentAdded(instance2);
         }
+      };
+      function unmount(vnode) {
+        resetShapeFlag(vnode);
+        _unmount(vnode, instance, parentSuspense, true);
       }
-    }
-  }
-  let hasWarned = false;
-  function createSuspenseBoundary(vnode, parentSuspense, parentComponent, container, hiddenContainer, anchor, namespace, slotScopeIds, optimized, rendererInternals, isHydrating = false) {
-    if (!hasWarned) {
-      hasWarned = true;
-      console[console.info ? "info" : "log"](
-        `<Suspense> is an experimental feature and its API will likely change.`
-      );
-    }
-    const {
-      p: patch,
-      m: move,
-      um: unmount,
-      n: next,
-      o: { parentNode, remove }
-    } = rendererInternals;
-    let parentSuspenseId;
-    const isSuspensible = isVNodeSuspensible(vnode);
-    if (isSuspensible) {
-      if (parentSuspense && parentSuspense.pendingBranch) {
-        parentSuspenseId = parentSuspense.pendingId;
-        parentSuspense.deps++;
-      }
-    }
-    const timeout = vnode.props ? toNumber(vnode.props.timeout) : void 0;
-    {
-      assertNumber(timeout, `Suspense timeout`);
-    }
-    const initialAnchor = anchor;
-    const suspense = {
-      vnode,
-      parent: parentSuspense,
-      parentComponent,
-      namespace,
-      container,
-      hiddenContainer,
-      deps: 0,
-      pendingId: suspenseId++,
-      timeout: typeof timeout === "number" ? timeout : -1,
-      activeBranch: null,
-      pendingBranch: null,
-      isInFallback: !isHydrating,
-      isHydrating,
-      isUnmounted: false,
-      effects: [],
-      resolve(resume = false, sync = false) {
-        {
-          if (!resume && !suspense.pendingBranch) {
-            throw new Error(
-              `suspense.resolve() is called without a pending branch.`
-            );
-          }
-          if (suspense.isUnmounted) {
-            throw new Error(
-              `suspense.resolve() is called on an already unmounted suspense boundary.`
-            );
+      function pruneCache(filter) {
+        cache.forEach((vnode, key) => {
+          const name = getComponentName(vnode.type);
+          if (name && (!filter || !filter(name))) {
+            pruneCacheEntry(key);
           }
+        });
+      }
+      function pruneCacheEntry(key) {
+        const cached = cache.get(key);
+        if (cached && (!current || !isSameVNodeType(cached, current))) {
+          unmount(cached);
+        } else if (current) {
+          resetShapeFlag(current);
         }
-        const {
-          vnode: vnode2,
-          activeBranch,
-          pendingBranch,
-          pendingId,
-          effects,
-          parentComponent: parentComponent2,
-          container: container2
-        } = suspense;
-        let delayEnter = false;
-        if (suspense.isHydrating) {
-          suspense.isHydrating = false;
-        } else if (!resume) {
-          delayEnter = activeBranch && pendingBranch.transition && pendingBranch.transition.mode === "out-in";
-          if (delayEnter) {
-            activeBranch.transition.afterLeave = () => {
-              if (pendingId === suspense.pendingId) {
-                move(
-                  pendingBranch,
-                  container2,
-                  anchor === initialAnchor ? next(activeBranch) : anchor,
-                  0
-                );
-                queuePostFlushCb(effects);
-              }
-            };
-          }
-          if (activeBranch) {
-            if (parentNode(activeBranch.el) !== suspense.hiddenContainer) {
-              anchor = next(activeBranch);
-            }
-            unmount(activeBranch, parentComponent2, suspense, true);
-          }
-          if (!delayEnter) {
-            move(pendingBranch, container2, anchor, 0);
+        cache.delete(key);
+        keys.delete(key);
+      }
+      watch(
+        () => [props.include, props.exclude],
+        ([include, exclude]) => {
+          include && pruneCache((name) => matches(include, name));
+          exclude && pruneCache((name) => !matches(exclude, name));
+        },
+        // prune post-render after `current` has been updated
+        { flush: "post", deep: true }
+      );
+      let pendingCacheKey = null;
+      const cacheSubtree = () => {
+        if (pendingCacheKey != null) {
+          if (isSuspense(instance.subTree.type)) {
+            queuePostRenderEffect(() => {
+              cache.set(pendingCacheKey, getInnerChild(instance.subTree));
+            }, instance.subTree.suspense);
+          } else {
+            cache.set(pendingCacheKey, getInnerChild(instance.subTree));
           }
         }
-        setActiveBranch(suspense, pendingBranch);
-        suspense.pendingBranch = null;
-        suspense.isInFallback = false;
-        let parent = suspense.parent;
-        let hasUnresolvedAncestor = false;
-        while (parent) {
-          if (parent.pendingBranch) {
-            parent.effects.push(...effects);
-            hasUnresolvedAncestor = true;
-            break;
+      };
+      onMounted(cacheSubtree);
+      onUpdated(cacheSubtree);
+      onBeforeUnmount(() => {
+        cache.forEach((cached) => {
+          const { subTree, suspense } = instance;
+          const vnode = getInnerChild(subTree);
+          if (cached.type === vnode.type && cached.key === vnode.key) {
+            resetShapeFlag(vnode);
+            const da = vnode.component.da;
+            da && queuePostRenderEffect(da, suspense);
+            return;
           }
-          parent = parent.parent;
-        }
-        if (!hasUnresolvedAncestor && !delayEnter) {
-          queuePostFlushCb(effects);
+          unmount(cached);
+        });
+      });
+      return () => {
+        pendingCacheKey = null;
+        if (!slots.default) {
+          return null;
         }
-        suspense.effects = [];
-        if (isSuspensible) {
-          if (parentSuspense && parentSuspense.pendingBranch && parentSuspenseId === parentSuspense.pendingId) {
-            parentSuspense.deps--;
-            if (parentSuspense.deps === 0 && !sync) {
-              parentSuspense.resolve();
-            }
+        const children = slots.default();
+        const rawVNode = children[0];
+        if (children.length > 1) {
+          {
+            warn$1(`KeepAlive should contain exactly one component child.`);
           }
+          current = null;
+          return children;
+        } else if (!isVNode(rawVNode) || !(rawVNode.shapeFlag & 4) && !(rawVNode.shapeFlag & 128)) {
+          current = null;
+          return rawVNode;
         }
-        triggerEvent(vnode2, "onResolve");
-      },
-      fallback(fallbackVNode) {
-        if (!suspense.pendingBranch) {
-          return;
-        }
-        const { vnode: vnode2, activeBranch, parentComponent: parentComponent2, container: container2, namespace: namespace2 } = suspense;
-        triggerEvent(vnode2, "onFallback");
-        const anchor2 = next(activeBranch);
-        const mountFallback = () => {
-          if (!suspense.isInFallback) {
-            return;
-          }
-          patch(
-            null,
-            fallbackVNode,
-            container2,
-            anchor2,
-            parentComponent2,
-            null,
-            // fallback tree will not have suspense context
-            namespace2,
-            slotScopeIds,
-            optimized
-          );
-          setActiveBranch(suspense, fallbackVNode);
-        };
-        const delayEnter = fallbackVNode.transition && fallbackVNode.transition.mode === "out-in";
-        if (delayEnter) {
-          activeBranch.transition.afterLeave = mountFallback;
+        let vnode = getInnerChild(rawVNode);
+        if (vnode.type === Comment) {
+          current = null;
+          return vnode;
         }
-        suspense.isInFallback = true;
-        unmount(
-          activeBranch,
-          parentComponent2,
-          null,
-          // no suspense so unmount hooks fire now
-          true
-          // shouldRemove
+        const comp = vnode.type;
+        const name = getComponentName(
+          isAsyncWrapper(vnode) ? vnode.type.__asyncResolved || {} : comp
         );
-        if (!delayEnter) {
-          mountFallback();
-        }
-      },
-      move(container2, anchor2, type) {
-        suspense.activeBranch && move(suspense.activeBranch, container2, anchor2, type);
-        suspense.container = container2;
-      },
-      next() {
-        return suspense.activeBranch && next(suspense.activeBranch);
-      },
-      registerDep(instance, setupRenderEffect) {
-        const isInPendingSuspense = !!suspense.pendingBranch;
-        if (isInPendingSuspense) {
-          suspense.deps++;
+        const { include, exclude, max } = props;
+        if (include && (!name || !matches(include, name)) || exclude && name && matches(exclude, name)) {
+          current = vnode;
+          return rawVNode;
         }
-        const hydratedEl = instance.vnode.el;
-        instance.asyncDep.catch((err) => {
-          handleError(err, instance, 0);
-        }).then((asyncSetupResult) => {
-          if (instance.isUnmounted || suspense.isUnmounted || suspense.pendingId !== instance.suspenseId) {
-            return;
+        const key = vnode.key == null ? comp : vnode.key;
+        const cachedVNode = cache.get(key);
+        if (vnode.el) {
+          vnode = cloneVNode(vnode);
+          if (rawVNode.shapeFlag & 128) {
+            rawVNode.ssContent = vnode;
           }
-          instance.asyncResolved = true;
-          const { vnode: vnode2 } = instance;
-          {
-            pushWarningContext(vnode2);
+        }
+        pendingCacheKey = key;
+        if (cachedVNode) {
+          vnode.el = cachedVNode.el;
+          vnode.component = cachedVNode.component;
+          if (vnode.transition) {
+            setTransitionHooks(vnode, vnode.transition);
           }
-          handleSetupResult(instance, asyncSetupResult, false);
-          if (hydratedEl) {
-            vnode2.el = hydratedEl;
+          vnode.shapeFlag |= 512;
+          keys.delete(key);
+          keys.add(key);
+        } else {
+          keys.add(key);
+          if (max && keys.size > parseInt(max, 10)) {
+            pruneCacheEntry(keys.values().next().value);
           }
-          const placeholder = !hydratedEl && instance.subTree.el;
-          setupRenderEffect(
-            instance,
-            vnode2,
-            // component may have been moved before resolve.
-            // if this is not a hydration, instance.subTree will be the comment
-            // placeholder.
-            parentNode(hydratedEl || instance.subTree.el),
-            // anchor will not be used if this is hydration, so only need to
-            // consider the comment placeholder case.
-            hydratedEl ? null : next(instance.subTree),
-            suspense,
-            namespace,
-            optimized
-          );
-          if (placeholder) {
-            remove(placeholder);
-          }
-          updateHOCHostEl(instance, vnode2.el);
-          {
-            popWarningContext();
-          }
-          if (isInPendingSuspense && --suspense.deps === 0) {
-            suspense.resolve();
-          }
-        });
-      },
-      unmount(parentSuspense2, doRemove) {
-        suspense.isUnmounted = true;
-        if (suspense.activeBranch) {
-          unmount(
-            suspense.activeBranch,
-            parentComponent,
-            parentSuspense2,
-            doRemove
-          );
         }
-        if (suspense.pendingBranch) {
-          unmount(
-            suspense.pendingBranch,
-            parentComponent,
-            parentSuspense2,
-            doRemove
-          );
+        vnode.shapeFlag |= 256;
+        current = vnode;
+        return isSuspense(rawVNode.type) ? rawVNode : vnode;
+      };
+    }
+  };
+  const KeepAlive = KeepAliveImpl;
+  function matches(pattern, name) {
+    if (isArray(pattern)) {
+      return pattern.some((p) => matches(p, name));
+    } else if (isString(pattern)) {
+      return pattern.split(",").includes(name);
+    } else if (isRegExp(pattern)) {
+      return pattern.test(name);
+    }
+    return false;
+  }
+  function onActivated(hook, target) {
+    registerKeepAliveHook(hook, "a", target);
+  }
+  function onDeactivated(hook, target) {
+    registerKeepAliveHook(hook, "da", target);
+  }
+  function registerKeepAliveHook(hook, type, target = currentInstance) {
+    const wrappedHook = hook.__wdc || (hook.__wdc = () => {
+      let current = target;
+      while (current) {
+        if (current.isDeactivated) {
+          return;
         }
+        current = current.parent;
       }
-    };
-    return suspense;
+      return hook();
+    });
+    injectHook(type, wrappedHook, target);
+    if (target) {
+      let current = target.parent;
+      while (current && current.parent) {
+        if (isKeepAlive(current.parent.vnode)) {
+          injectToKeepAliveRoot(wrappedHook, type, target, current);
+        }
+        current = current.parent;
+      }
+    }
   }
-  function hydrateSuspense(node, vnode, parentComponent, parentSuspense, namespace, slotScopeIds, optimized, rendererInternals, hydrateNode) {
-    const suspense = vnode.suspense = createSuspenseBoundary(
-      vnode,
-      parentSuspense,
-      parentComponent,
-      node.parentNode,
-      // eslint-disable-next-line no-restricted-globals
-      document.createElement("div"),
-      null,
-      namespace,
-      slotScopeIds,
-      optimized,
-      rendererInternals,
+  function injectToKeepAliveRoot(hook, type, target, keepAliveRoot) {
+    const injected = injectHook(
+      type,
+      hook,
+      keepAliveRoot,
       true
+      /* prepend */
     );
-    const result = hydrateNode(
-      node,
-      suspense.pendingBranch = vnode.ssContent,
-      parentComponent,
-      suspense,
-      slotScopeIds,
-      optimized
-    );
-    if (suspense.deps === 0) {
-      suspense.resolve(false, true);
-    }
-    return result;
+    onUnmounted(() => {
+      remove(keepAliveRoot[type], injected);
+    }, target);
   }
-  function normalizeSuspenseChildren(vnode) {
-    const { shapeFlag, children } = vnode;
-    const isSlotChildren = shapeFlag & 32;
-    vnode.ssContent = normalizeSuspenseSlot(
-      isSlotChildren ? children.default : children
-    );
-    vnode.ssFallback = isSlotChildren ? normalizeSuspenseSlot(children.fallback) : createVNode(Comment);
+  function resetShapeFlag(vnode) {
+    vnode.shapeFlag &= ~256;
+    vnode.shapeFlag &= ~512;
   }
-  function normalizeSuspenseSlot(s) {
-    let block;
-    if (isFunction(s)) {
-      const trackBlock = isBlockTreeEnabled && s._c;
-      if (trackBlock) {
-        s._d = false;
-        openBlock();
-      }
-      s = s();
-      if (trackBlock) {
-        s._d = true;
-        block = currentBlock;
-        closeBlock();
-      }
-    }
-    if (isArray(s)) {
-      const singleChild = filterSingleRoot(s);
-      if (!singleChild && s.filter((child) => child !== NULL_DYNAMIC_COMPONENT).length > 0) {
-        warn$1(`<Suspense> slots expect a single root node.`);
-      }
-      s = singleChild;
-    }
-    s = normalizeVNode(s);
-    if (block && !s.dynamicChildren) {
-      s.dynamicChildren = block.filter((c) => c !== s);
-    }
-    return s;
+  function getInnerChild(vnode) {
+    return vnode.shapeFlag & 128 ? vnode.ssContent : vnode;
   }
-  function queueEffectWithSuspense(fn, suspense) {
-    if (suspense && suspense.pendingBranch) {
-      if (isArray(fn)) {
-        suspense.effects.push(...fn);
+
+  function injectHook(type, hook, target = currentInstance, prepend = false) {
+    if (target) {
+      const hooks = target[type] || (target[type] = []);
+      const wrappedHook = hook.__weh || (hook.__weh = (...args) => {
+        pauseTracking();
+        const reset = setCurrentInstance(target);
+        const res = callWithAsyncErrorHandling(hook, target, type, args);
+        reset();
+        resetTracking();
+        return res;
+      });
+      if (prepend) {
+        hooks.unshift(wrappedHook);
       } else {
-        suspense.effects.push(fn);
+        hooks.push(wrappedHook);
       }
+      return wrappedHook;
     } else {
-      queuePostFlushCb(fn);
-    }
-  }
-  function setActiveBranch(suspense, branch) {
-    suspense.activeBranch = branch;
-    const { vnode, parentComponent } = suspense;
-    let el = branch.el;
-    while (!el && branch.component) {
-      branch = branch.component.subTree;
-      el = branch.el;
-    }
-    vnode.el = el;
-    if (parentComponent && parentComponent.subTree === vnode) {
-      parentComponent.vnode.el = el;
-      updateHOCHostEl(parentComponent, el);
+      const apiName = toHandlerKey(ErrorTypeStrings$1[type].replace(/ hook$/, ""));
+      warn$1(
+        `${apiName} is called when there is no active component instance to be associated with. Lifecycle injection APIs can only be used during execution of setup().` + (` If you are using async setup(), make sure to register lifecycle hooks before the first await statement.` )
+      );
     }
   }
-  function isVNodeSuspensible(vnode) {
-    const suspensible = vnode.props && vnode.props.suspensible;
-    return suspensible != null && suspensible !== false;
-  }
-
-  const ssrContextKey = Symbol.for("v-scx");
-  const useSSRContext = () => {
-    {
-      warn$1(`useSSRContext() is not supported in the global build.`);
+  const createHook = (lifecycle) => (hook, target = currentInstance) => {
+    if (!isInSSRComponentSetup || lifecycle === "sp") {
+      injectHook(lifecycle, (...args) => hook(...args), target);
     }
   };
-
-  function watchEffect(effect, options) {
-    return doWatch(effect, null, options);
-  }
-  function watchPostEffect(effect, options) {
-    return doWatch(
-      effect,
-      null,
-      extend({}, options, { flush: "post" }) 
-    );
+  const onBeforeMount = createHook("bm");
+  const onMounted = createHook("m");
+  const onBeforeUpdate = createHook("bu");
+  const onUpdated = createHook("u");
+  const onBeforeUnmount = createHook("bum");
+  const onUnmounted = createHook("um");
+  const onServerPrefetch = createHook("sp");
+  const onRenderTriggered = createHook(
+    "rtg"
+  );
+  const onRenderTracked = createHook(
+    "rtc"
+  );
+  function onErrorCaptured(hook, target = currentInstance) {
+    injectHook("ec", hook, target);
   }
-  function watchSyncEffect(effect, options) {
-    return doWatch(
-      effect,
-      null,
-      extend({}, options, { flush: "sync" }) 
-    );
+
+  const COMPONENTS = "components";
+  const DIRECTIVES = "directives";
+  function resolveComponent(name, maybeSelfReference) {
+    return resolveAsset(COMPONENTS, name, true, maybeSelfReference) || name;
   }
-  const INITIAL_WATCHER_VALUE = {};
-  function watch(source, cb, options) {
-    if (!isFunction(cb)) {
-      warn$1(
-        `\`watch(fn, options?)\` signature has been moved to a separate API. Use \`watchEffect(fn, options?)\` instead. \`watch\` now only supports \`watch(source, cb, options?) signature.`
-      );
+  const NULL_DYNAMIC_COMPONENT = Symbol.for("v-ndc");
+  function resolveDynamicComponent(component) {
+    if (isString(component)) {
+      return resolveAsset(COMPONENTS, component, false) || component;
+    } else {
+      return component || NULL_DYNAMIC_COMPONENT;
     }
-    return doWatch(source, cb, options);
   }
-  function doWatch(source, cb, {
-    immediate,
-    deep,
-    flush,
-    once,
-    onTrack,
-    onTrigger
-  } = EMPTY_OBJ) {
-    if (cb && once) {
-      const _cb = cb;
-      cb = (...args) => {
-        _cb(...args);
-        unwatch();
-      };
-    }
-    if (deep !== void 0 && typeof deep === "number") {
-      warn$1(
-        `watch() "deep" option with number value will be used as watch depth in future versions. Please use a boolean instead to avoid potential breakage.`
-      );
-    }
-    if (!cb) {
-      if (immediate !== void 0) {
-        warn$1(
-          `watch() "immediate" option is only respected when using the watch(source, callback, options?) signature.`
+  function resolveDirective(name) {
+    return resolveAsset(DIRECTIVES, name);
+  }
+  function resolveAsset(type, name, warnMissing = true, maybeSelfReference = false) {
+    const instance = currentRenderingInstance || currentInstance;
+    if (instance) {
+      const Component = instance.type;
+      if (type === COMPONENTS) {
+        const selfName = getComponentName(
+          Component,
+          false
         );
+        if (selfName && (selfName === name || selfName === camelize(name) || selfName === capitalize(camelize(name)))) {
+          return Component;
+        }
       }
-      if (deep !== void 0) {
-        warn$1(
-          `watch() "deep" option is only respected when using the watch(source, callback, options?) signature.`
-        );
+      const res = (
+        // local registration
+        // check instance[type] first which is resolved for options API
+        resolve(instance[type] || Component[type], name) || // global registration
+        resolve(instance.appContext[type], name)
+      );
+      if (!res && maybeSelfReference) {
+        return Component;
       }
-      if (once !== void 0) {
-        warn$1(
-          `watch() "once" option is only respected when using the watch(source, callback, options?) signature.`
-        );
+      if (warnMissing && !res) {
+        const extra = type === COMPONENTS ? `
+If this is a native custom element, make sure to exclude it from component resolution via compilerOptions.isCustomElement.` : ``;
+        warn$1(`Failed to resolve ${type.slice(0, -1)}: ${name}${extra}`);
       }
-    }
-    const warnInvalidSource = (s) => {
+      return res;
+    } else {
       warn$1(
-        `Invalid watch source: `,
-        s,
-        `A watch source can only be a getter/effect function, a ref, a reactive object, or an array of these types.`
+        `resolve${capitalize(type.slice(0, -1))} can only be used in render() or setup().`
       );
-    };
-    const instance = currentInstance;
-    const reactiveGetter = (source2) => deep === true ? source2 : (
-      // for deep: false, only traverse root-level properties
-      traverse(source2, deep === false ? 1 : void 0)
-    );
-    let getter;
-    let forceTrigger = false;
-    let isMultiSource = false;
-    if (isRef(source)) {
-      getter = () => source.value;
-      forceTrigger = isShallow(source);
-    } else if (isReactive(source)) {
-      getter = () => reactiveGetter(source);
-      forceTrigger = true;
-    } else if (isArray(source)) {
-      isMultiSource = true;
-      forceTrigger = source.some((s) => isReactive(s) || isShallow(s));
-      getter = () => source.map((s) => {
-        if (isRef(s)) {
-          return s.value;
-        } else if (isReactive(s)) {
-          return reactiveGetter(s);
-        } else if (isFunction(s)) {
-          return callWithErrorHandling(s, instance, 2);
-        } else {
-          warnInvalidSource(s);
-        }
-      });
-    } else if (isFunction(source)) {
-      if (cb) {
-        getter = () => callWithErrorHandling(source, instance, 2);
-      } else {
-        getter = () => {
-          if (cleanup) {
-            cleanup();
-          }
-          return callWithAsyncErrorHandling(
-            source,
-            instance,
-            3,
-            [onCleanup]
-          );
-        };
-      }
-    } else {
-      getter = NOOP;
-      warnInvalidSource(source);
-    }
-    if (cb && deep) {
-      const baseGetter = getter;
-      getter = () => traverse(baseGetter());
     }
-    let cleanup;
-    let onCleanup = (fn) => {
-      cleanup = effect.onStop = () => {
-        callWithErrorHandling(fn, instance, 4);
-        cleanup = effect.onStop = void 0;
-      };
-    };
-    let oldValue = isMultiSource ? new Array(source.length).fill(INITIAL_WATCHER_VALUE) : INITIAL_WATCHER_VALUE;
-    const job = () => {
-      if (!effect.active || !effect.dirty) {
-        return;
+  }
+  function resolve(registry, name) {
+    return registry && (registry[name] || registry[camelize(name)] || registry[capitalize(camelize(name))]);
+  }
+
+  function renderList(source, renderItem, cache, index) {
+    let ret;
+    const cached = cache && cache[index];
+    if (isArray(source) || isString(source)) {
+      ret = new Array(source.length);
+      for (let i = 0, l = source.length; i < l; i++) {
+        ret[i] = renderItem(source[i], i, void 0, cached && cached[i]);
       }
-      if (cb) {
-        const newValue = effect.run();
-        if (deep || forceTrigger || (isMultiSource ? newValue.some((v, i) => hasChanged(v, oldValue[i])) : hasChanged(newValue, oldValue)) || false) {
-          if (cleanup) {
-            cleanup();
-          }
-          callWithAsyncErrorHandling(cb, instance, 3, [
-            newValue,
-            // pass undefined as the old value when it's changed for the first time
-            oldValue === INITIAL_WATCHER_VALUE ? void 0 : isMultiSource && oldValue[0] === INITIAL_WATCHER_VALUE ? [] : oldValue,
-            onCleanup
-          ]);
-          oldValue = newValue;
-        }
-      } else {
-        effect.run();
+    } else if (typeof source === "number") {
+      if (!Number.isInteger(source)) {
+        warn$1(`The v-for range expect an integer value but got ${source}.`);
       }
-    };
-    job.allowRecurse = !!cb;
-    let scheduler;
-    if (flush === "sync") {
-      scheduler = job;
-    } else if (flush === "post") {
-      scheduler = () => queuePostRenderEffect(job, instance && instance.suspense);
-    } else {
-      job.pre = true;
-      if (instance)
-        job.id = instance.uid;
-      scheduler = () => queueJob(job);
-    }
-    const effect = new ReactiveEffect(getter, NOOP, scheduler);
-    const scope = getCurrentScope();
-    const unwatch = () => {
-      effect.stop();
-      if (scope) {
-        remove(scope.effects, effect);
+      ret = new Array(source);
+      for (let i = 0; i < source; i++) {
+        ret[i] = renderItem(i + 1, i, void 0, cached && cached[i]);
       }
-    };
-    {
-      effect.onTrack = onTrack;
-      effect.onTrigger = onTrigger;
-    }
-    if (cb) {
-      if (immediate) {
-        job();
+    } else if (isObject(source)) {
+      if (source[Symbol.iterator]) {
+        ret = Array.from(
+          source,
+          (item, i) => renderItem(item, i, void 0, cached && cached[i])
+        );
       } else {
-        oldValue = effect.run();
+        const keys = Object.keys(source);
+        ret = new Array(keys.length);
+        for (let i = 0, l = keys.length; i < l; i++) {
+          const key = keys[i];
+          ret[i] = renderItem(source[key], key, i, cached && cached[i]);
+        }
       }
-    } else if (flush === "post") {
-      queuePostRenderEffect(
-        effect.run.bind(effect),
-        instance && instance.suspense
-      );
     } else {
-      effect.run();
+      ret = [];
     }
-    return unwatch;
-  }
-  function instanceWatch(source, value, options) {
-    const publicThis = this.proxy;
-    const getter = isString(source) ? source.includes(".") ? createPathGetter(publicThis, source) : () => publicThis[source] : source.bind(publicThis, publicThis);
-    let cb;
-    if (isFunction(value)) {
-      cb = value;
-    } else {
-      cb = value.handler;
-      options = value;
+    if (cache) {
+      cache[index] = ret;
     }
-    const reset = setCurrentInstance(this);
-    const res = doWatch(getter, cb.bind(publicThis), options);
-    reset();
-    return res;
+    return ret;
   }
-  function createPathGetter(ctx, path) {
-    const segments = path.split(".");
-    return () => {
-      let cur = ctx;
-      for (let i = 0; i < segments.length && cur; i++) {
-        cur = cur[segments[i]];
+
+  function createSlots(slots, dynamicSlots) {
+    for (let i = 0; i < dynamicSlots.length; i++) {
+      const slot = dynamicSlots[i];
+      if (isArray(slot)) {
+        for (let j = 0; j < slot.length; j++) {
+          slots[slot[j].name] = slot[j].fn;
+        }
+      } else if (slot) {
+        slots[slot.name] = slot.key ? (...args) => {
+          const res = slot.fn(...args);
+          if (res) res.key = slot.key;
+          return res;
+        } : slot.fn;
       }
-      return cur;
-    };
+    }
+    return slots;
   }
-  function traverse(value, depth = Infinity, seen) {
-    if (depth <= 0 || !isObject(value) || value["__v_skip"]) {
-      return value;
+
+  function renderSlot(slots, name, props = {}, fallback, noSlotted) {
+    if (currentRenderingInstance.isCE || currentRenderingInstance.parent && isAsyncWrapper(currentRenderingInstance.parent) && currentRenderingInstance.parent.isCE) {
+      if (name !== "default") props.name = name;
+      return createVNode("slot", props, fallback && fallback());
     }
-    seen = seen || /* @__PURE__ */ new Set();
-    if (seen.has(value)) {
-      return value;
+    let slot = slots[name];
+    if (slot && slot.length > 1) {
+      warn$1(
+        `SSR-optimized slot function detected in a non-SSR-optimized render function. You need to mark this component with $dynamic-slots in the parent template.`
+      );
+      slot = () => [];
     }
-    seen.add(value);
-    depth--;
-    if (isRef(value)) {
-      traverse(value.value, depth, seen);
-    } else if (isArray(value)) {
-      for (let i = 0; i < value.length; i++) {
-        traverse(value[i], depth, seen);
-      }
-    } else if (isSet(value) || isMap(value)) {
-      value.forEach((v) => {
-        traverse(v, depth, seen);
-      });
-    } else if (isPlainObject(value)) {
-      for (const key in value) {
-        traverse(value[key], depth, seen);
-      }
-    }
-    return value;
-  }
-
-  function validateDirectiveName(name) {
-    if (isBuiltInDirective(name)) {
-      warn$1("Do not use built-in directive ids as custom directive id: " + name);
+    if (slot && slot._c) {
+      slot._d = false;
     }
-  }
-  function withDirectives(vnode, directives) {
-    if (currentRenderingInstance === null) {
-      warn$1(`withDirectives can only be used inside render functions.`);
-      return vnode;
+    openBlock();
+    const validSlotContent = slot && ensureValidVNode(slot(props));
+    const rendered = createBlock(
+      Fragment,
+      {
+        key: (props.key || // slot content array of a dynamic conditional slot may have a branch
+        // key attached in the `createSlots` helper, respect that
+        validSlotContent && validSlotContent.key || `_${name}`) + // #7256 force differentiate fallback content from actual content
+        (!validSlotContent && fallback ? "_fb" : "")
+      },
+      validSlotContent || (fallback ? fallback() : []),
+      validSlotContent && slots._ === 1 ? 64 : -2
+    );
+    if (!noSlotted && rendered.scopeId) {
+      rendered.slotScopeIds = [rendered.scopeId + "-s"];
     }
-    const instance = getExposeProxy(currentRenderingInstance) || currentRenderingInstance.proxy;
-    const bindings = vnode.dirs || (vnode.dirs = []);
-    for (let i = 0; i < directives.length; i++) {
-      let [dir, value, arg, modifiers = EMPTY_OBJ] = directives[i];
-      if (dir) {
-        if (isFunction(dir)) {
-          dir = {
-            mounted: dir,
-            updated: dir
-          };
-        }
-        if (dir.deep) {
-          traverse(value);
-        }
-        bindings.push({
-          dir,
-          instance,
-          value,
-          oldValue: void 0,
-          arg,
-          modifiers
-        });
-      }
+    if (slot && slot._c) {
+      slot._d = true;
     }
-    return vnode;
+    return rendered;
   }
-  function invokeDirectiveHook(vnode, prevVNode, instance, name) {
-    const bindings = vnode.dirs;
-    const oldBindings = prevVNode && prevVNode.dirs;
-    for (let i = 0; i < bindings.length; i++) {
-      const binding = bindings[i];
-      if (oldBindings) {
-        binding.oldValue = oldBindings[i].value;
-      }
-      let hook = binding.dir[name];
-      if (hook) {
-        pauseTracking();
-        callWithAsyncErrorHandling(hook, instance, 8, [
-          vnode.el,
-          binding,
-          vnode,
-          prevVNode
-        ]);
-        resetTracking();
-      }
-    }
+  function ensureValidVNode(vnodes) {
+    return vnodes.some((child) => {
+      if (!isVNode(child)) return true;
+      if (child.type === Comment) return false;
+      if (child.type === Fragment && !ensureValidVNode(child.children))
+        return false;
+      return true;
+    }) ? vnodes : null;
   }
 
-  const leaveCbKey = Symbol("_leaveCb");
-  const enterCbKey$1 = Symbol("_enterCb");
-  function useTransitionState() {
-    const state = {
-      isMounted: false,
-      isLeaving: false,
-      isUnmounting: false,
-      leavingVNodes: /* @__PURE__ */ new Map()
-    };
-    onMounted(() => {
-      state.isMounted = true;
-    });
-    onBeforeUnmount(() => {
-      state.isUnmounting = true;
-    });
-    return state;
+  function toHandlers(obj, preserveCaseIfNecessary) {
+    const ret = {};
+    if (!isObject(obj)) {
+      warn$1(`v-on with no argument expects an object value.`);
+      return ret;
+    }
+    for (const key in obj) {
+      ret[preserveCaseIfNecessary && /[A-Z]/.test(key) ? `on:${key}` : toHandlerKey(key)] = obj[key];
+    }
+    return ret;
   }
-  const TransitionHookValidator = [Function, Array];
-  const BaseTransitionPropsValidators = {
-    mode: String,
-    appear: Boolean,
-    persisted: Boolean,
-    // enter
-    onBeforeEnter: TransitionHookValidator,
-    onEnter: TransitionHookValidator,
-    onAfterEnter: TransitionHookValidator,
-    onEnterCancelled: TransitionHookValidator,
-    // leave
-    onBeforeLeave: TransitionHookValidator,
-    onLeave: TransitionHookValidator,
-    onAfterLeave: TransitionHookValidator,
-    onLeaveCancelled: TransitionHookValidator,
-    // appear
-    onBeforeAppear: TransitionHookValidator,
-    onAppear: TransitionHookValidator,
-    onAfterAppear: TransitionHookValidator,
-    onAppearCancelled: TransitionHookValidator
+
+  const getPublicInstance = (i) => {
+    if (!i) return null;
+    if (isStatefulComponent(i)) return getComponentPublicInstance(i);
+    return getPublicInstance(i.parent);
   };
-  const BaseTransitionImpl = {
-    name: `BaseTransition`,
-    props: BaseTransitionPropsValidators,
-    setup(props, { slots }) {
-      const instance = getCurrentInstance();
-      const state = useTransitionState();
-      return () => {
-        const children = slots.default && getTransitionRawChildren(slots.default(), true);
-        if (!children || !children.length) {
-          return;
-        }
-        let child = children[0];
-        if (children.length > 1) {
-          let hasFound = false;
-          for (const c of children) {
-            if (c.type !== Comment) {
-              if (hasFound) {
-                warn$1(
-                  "<transition> can only be used on a single element or component. Use <transition-group> for lists."
-                );
-                break;
-              }
-              child = c;
-              hasFound = true;
-            }
+  const publicPropertiesMap = (
+    // Move PURE marker to new line to workaround compiler discarding it
+    // due to type annotation
+    /* @__PURE__ */ extend(/* @__PURE__ */ Object.create(null), {
+      $: (i) => i,
+      $el: (i) => i.vnode.el,
+      $data: (i) => i.data,
+      $props: (i) => shallowReadonly(i.props) ,
+      $attrs: (i) => shallowReadonly(i.attrs) ,
+      $slots: (i) => shallowReadonly(i.slots) ,
+      $refs: (i) => shallowReadonly(i.refs) ,
+      $parent: (i) => getPublicInstance(i.parent),
+      $root: (i) => getPublicInstance(i.root),
+      $emit: (i) => i.emit,
+      $options: (i) => resolveMergedOptions(i) ,
+      $forceUpdate: (i) => i.f || (i.f = () => {
+        i.effect.dirty = true;
+        queueJob(i.update);
+      }),
+      $nextTick: (i) => i.n || (i.n = nextTick.bind(i.proxy)),
+      $watch: (i) => instanceWatch.bind(i) 
+    })
+  );
+  const isReservedPrefix = (key) => key === "_" || key === "$";
+  const hasSetupBinding = (state, key) => state !== EMPTY_OBJ && !state.__isScriptSetup && hasOwn(state, key);
+  const PublicInstanceProxyHandlers = {
+    get({ _: instance }, key) {
+      if (key === "__v_skip") {
+        return true;
+      }
+      const { ctx, setupState, data, props, accessCache, type, appContext } = instance;
+      if (key === "__isVue") {
+        return true;
+      }
+      let normalizedProps;
+      if (key[0] !== "$") {
+        const n = accessCache[key];
+        if (n !== void 0) {
+          switch (n) {
+            case 1 /* SETUP */:
+              return setupState[key];
+            case 2 /* DATA */:
+              return data[key];
+            case 4 /* CONTEXT */:
+              return ctx[key];
+            case 3 /* PROPS */:
+              return props[key];
           }
+        } else if (hasSetupBinding(setupState, key)) {
+          accessCache[key] = 1 /* SETUP */;
+          return setupState[key];
+        } else if (data !== EMPTY_OBJ && hasOwn(data, key)) {
+          accessCache[key] = 2 /* DATA */;
+          return data[key];
+        } else if (
+          // only cache other properties when instance has declared (thus stable)
+          // props
+          (normalizedProps = instance.propsOptions[0]) && hasOwn(normalizedProps, key)
+        ) {
+          accessCache[key] = 3 /* PROPS */;
+          return props[key];
+        } else if (ctx !== EMPTY_OBJ && hasOwn(ctx, key)) {
+          accessCache[key] = 4 /* CONTEXT */;
+          return ctx[key];
+        } else if (shouldCacheAccess) {
+          accessCache[key] = 0 /* OTHER */;
         }
-        const rawProps = toRaw(props);
-        const { mode } = rawProps;
-        if (mode && mode !== "in-out" && mode !== "out-in" && mode !== "default") {
-          warn$1(`invalid <transition> mode: ${mode}`);
-        }
-        if (state.isLeaving) {
-          return emptyPlaceholder(child);
-        }
-        const innerChild = getKeepAliveChild(child);
-        if (!innerChild) {
-          return emptyPlaceholder(child);
+      }
+      const publicGetter = publicPropertiesMap[key];
+      let cssModule, globalProperties;
+      if (publicGetter) {
+        if (key === "$attrs") {
+          track(instance.attrs, "get", "");
+          markAttrsAccessed();
+        } else if (key === "$slots") {
+          track(instance, "get", key);
         }
-        const enterHooks = resolveTransitionHooks(
-          innerChild,
-          rawProps,
-          state,
-          instance
-        );
-        setTransitionHooks(innerChild, enterHooks);
-        const oldChild = instance.subTree;
-        const oldInnerChild = oldChild && getKeepAliveChild(oldChild);
-        if (oldInnerChild && oldInnerChild.type !== Comment && !isSameVNodeType(innerChild, oldInnerChild)) {
-          const leavingHooks = resolveTransitionHooks(
-            oldInnerChild,
-            rawProps,
-            state,
-            instance
+        return publicGetter(instance);
+      } else if (
+        // css module (injected by vue-loader)
+        (cssModule = type.__cssModules) && (cssModule = cssModule[key])
+      ) {
+        return cssModule;
+      } else if (ctx !== EMPTY_OBJ && hasOwn(ctx, key)) {
+        accessCache[key] = 4 /* CONTEXT */;
+        return ctx[key];
+      } else if (
+        // global properties
+        globalProperties = appContext.config.globalProperties, hasOwn(globalProperties, key)
+      ) {
+        {
+          return globalProperties[key];
+        }
+      } else if (currentRenderingInstance && (!isString(key) || // #1091 avoid internal isRef/isVNode checks on component instance leading
+      // to infinite warning loop
+      key.indexOf("__v") !== 0)) {
+        if (data !== EMPTY_OBJ && isReservedPrefix(key[0]) && hasOwn(data, key)) {
+          warn$1(
+            `Property ${JSON.stringify(
+            key
+          )} must be accessed via $data because it starts with a reserved character ("$" or "_") and is not proxied on the render context.`
+          );
+        } else if (instance === currentRenderingInstance) {
+          warn$1(
+            `Property ${JSON.stringify(key)} was accessed during render but is not defined on instance.`
           );
-          setTransitionHooks(oldInnerChild, leavingHooks);
-          if (mode === "out-in" && innerChild.type !== Comment) {
-            state.isLeaving = true;
-            leavingHooks.afterLeave = () => {
-              state.isLeaving = false;
-              if (instance.update.active !== false) {
-                instance.effect.dirty = true;
-                instance.update();
-              }
-            };
-            return emptyPlaceholder(child);
-          } else if (mode === "in-out" && innerChild.type !== Comment) {
-            leavingHooks.delayLeave = (el, earlyRemove, delayedLeave) => {
-              const leavingVNodesCache = getLeavingNodesForType(
-                state,
-                oldInnerChild
-              );
-              leavingVNodesCache[String(oldInnerChild.key)] = oldInnerChild;
-              el[leaveCbKey] = () => {
-                earlyRemove();
-                el[leaveCbKey] = void 0;
-                delete enterHooks.delayedLeave;
-              };
-              enterHooks.delayedLeave = delayedLeave;
-            };
-          }
         }
-        return child;
-      };
+      }
+    },
+    set({ _: instance }, key, value) {
+      const { data, setupState, ctx } = instance;
+      if (hasSetupBinding(setupState, key)) {
+        setupState[key] = value;
+        return true;
+      } else if (setupState.__isScriptSetup && hasOwn(setupState, key)) {
+        warn$1(`Cannot mutate <script setup> binding "${key}" from Options API.`);
+        return false;
+      } else if (data !== EMPTY_OBJ && hasOwn(data, key)) {
+        data[key] = value;
+        return true;
+      } else if (hasOwn(instance.props, key)) {
+        warn$1(`Attempting to mutate prop "${key}". Props are readonly.`);
+        return false;
+      }
+      if (key[0] === "$" && key.slice(1) in instance) {
+        warn$1(
+          `Attempting to mutate public property "${key}". Properties starting with $ are reserved and readonly.`
+        );
+        return false;
+      } else {
+        if (key in instance.appContext.config.globalProperties) {
+          Object.defineProperty(ctx, key, {
+            enumerable: true,
+            configurable: true,
+            value
+          });
+        } else {
+          ctx[key] = value;
+        }
+      }
+      return true;
+    },
+    has({
+      _: { data, setupState, accessCache, ctx, appContext, propsOptions }
+    }, key) {
+      let normalizedProps;
+      return !!accessCache[key] || data !== EMPTY_OBJ && hasOwn(data, key) || hasSetupBinding(setupState, key) || (normalizedProps = propsOptions[0]) && hasOwn(normalizedProps, key) || hasOwn(ctx, key) || hasOwn(publicPropertiesMap, key) || hasOwn(appContext.config.globalProperties, key);
+    },
+    defineProperty(target, key, descriptor) {
+      if (descriptor.get != null) {
+        target._.accessCache[key] = 0;
+      } else if (hasOwn(descriptor, "value")) {
+        this.set(target, key, descriptor.value, null);
+      }
+      return Reflect.defineProperty(target, key, descriptor);
     }
   };
-  const BaseTransition = BaseTransitionImpl;
-  function getLeavingNodesForType(state, vnode) {
-    const { leavingVNodes } = state;
-    let leavingVNodesCache = leavingVNodes.get(vnode.type);
-    if (!leavingVNodesCache) {
-      leavingVNodesCache = /* @__PURE__ */ Object.create(null);
-      leavingVNodes.set(vnode.type, leavingVNodesCache);
-    }
-    return leavingVNodesCache;
-  }
-  function resolveTransitionHooks(vnode, props, state, instance) {
-    const {
-      appear,
-      mode,
-      persisted = false,
-      onBeforeEnter,
-      onEnter,
-      onAfterEnter,
-      onEnterCancelled,
-      onBeforeLeave,
-      onLeave,
-      onAfterLeave,
-      onLeaveCancelled,
-      onBeforeAppear,
-      onAppear,
-      onAfterAppear,
-      onAppearCancelled
-    } = props;
-    const key = String(vnode.key);
-    const leavingVNodesCache = getLeavingNodesForType(state, vnode);
-    const callHook = (hook, args) => {
-      hook && callWithAsyncErrorHandling(
-        hook,
-        instance,
-        9,
-        args
+  {
+    PublicInstanceProxyHandlers.ownKeys = (target) => {
+      warn$1(
+        `Avoid app logic that relies on enumerating keys on a component instance. The keys will be empty in production mode to avoid performance overhead.`
       );
+      return Reflect.ownKeys(target);
     };
-    const callAsyncHook = (hook, args) => {
-      const done = args[1];
-      callHook(hook, args);
-      if (isArray(hook)) {
-        if (hook.every((hook2) => hook2.length <= 1))
-          done();
-      } else if (hook.length <= 1) {
-        done();
-      }
-    };
-    const hooks = {
-      mode,
-      persisted,
-      beforeEnter(el) {
-        let hook = onBeforeEnter;
-        if (!state.isMounted) {
-          if (appear) {
-            hook = onBeforeAppear || onBeforeEnter;
-          } else {
-            return;
-          }
-        }
-        if (el[leaveCbKey]) {
-          el[leaveCbKey](
-            true
-            /* cancelled */
-          );
-        }
-        const leavingVNode = leavingVNodesCache[key];
-        if (leavingVNode && isSameVNodeType(vnode, leavingVNode) && leavingVNode.el[leaveCbKey]) {
-          leavingVNode.el[leaveCbKey]();
-        }
-        callHook(hook, [el]);
-      },
-      enter(el) {
-        let hook = onEnter;
-        let afterHook = onAfterEnter;
-        let cancelHook = onEnterCancelled;
-        if (!state.isMounted) {
-          if (appear) {
-            hook = onAppear || onEnter;
-            afterHook = onAfterAppear || onAfterEnter;
-            cancelHook = onAppearCancelled || onEnterCancelled;
-          } else {
-            return;
-          }
-        }
-        let called = false;
-        const done = el[enterCbKey$1] = (cancelled) => {
-          if (called)
-            return;
-          called = true;
-          if (cancelled) {
-            callHook(cancelHook, [el]);
-          } else {
-            callHook(afterHook, [el]);
-          }
-          if (hooks.delayedLeave) {
-            hooks.delayedLeave();
-          }
-          el[enterCbKey$1] = void 0;
-        };
-        if (hook) {
-          callAsyncHook(hook, [el, done]);
-        } else {
-          done();
+  }
+  const RuntimeCompiledPublicInstanceProxyHandlers = /* @__PURE__ */ extend(
+    {},
+    PublicInstanceProxyHandlers,
+    {
+      get(target, key) {
+        if (key === Symbol.unscopables) {
+          return;
         }
+        return PublicInstanceProxyHandlers.get(target, key, target);
       },
-      leave(el, remove) {
-        const key2 = String(vnode.key);
-        if (el[enterCbKey$1]) {
-          el[enterCbKey$1](
-            true
-            /* cancelled */
+      has(_, key) {
+        const has = key[0] !== "_" && !isGloballyAllowed(key);
+        if (!has && PublicInstanceProxyHandlers.has(_, key)) {
+          warn$1(
+            `Property ${JSON.stringify(
+            key
+          )} should not start with _ which is a reserved prefix for Vue internals.`
           );
         }
-        if (state.isUnmounting) {
-          return remove();
-        }
-        callHook(onBeforeLeave, [el]);
-        let called = false;
-        const done = el[leaveCbKey] = (cancelled) => {
-          if (called)
-            return;
-          called = true;
-          remove();
-          if (cancelled) {
-            callHook(onLeaveCancelled, [el]);
-          } else {
-            callHook(onAfterLeave, [el]);
-          }
-          el[leaveCbKey] = void 0;
-          if (leavingVNodesCache[key2] === vnode) {
-            delete leavingVNodesCache[key2];
-          }
-        };
-        leavingVNodesCache[key2] = vnode;
-        if (onLeave) {
-          callAsyncHook(onLeave, [el, done]);
-        } else {
-          done();
+        return has;
+      }
+    }
+  );
+  function createDevRenderContext(instance) {
+    const target = {};
+    Object.defineProperty(target, `_`, {
+      configurable: true,
+      enumerable: false,
+      get: () => instance
+    });
+    Object.keys(publicPropertiesMap).forEach((key) => {
+      Object.defineProperty(target, key, {
+        configurable: true,
+        enumerable: false,
+        get: () => publicPropertiesMap[key](instance),
+        // intercepted by the proxy so no need for implementation,
+        // but needed to prevent set errors
+        set: NOOP
+      });
+    });
+    return target;
+  }
+  function exposePropsOnRenderContext(instance) {
+    const {
+      ctx,
+      propsOptions: [propsOptions]
+    } = instance;
+    if (propsOptions) {
+      Object.keys(propsOptions).forEach((key) => {
+        Object.defineProperty(ctx, key, {
+          enumerable: true,
+          configurable: true,
+          get: () => instance.props[key],
+          set: NOOP
+        });
+      });
+    }
+  }
+  function exposeSetupStateOnRenderContext(instance) {
+    const { ctx, setupState } = instance;
+    Object.keys(toRaw(setupState)).forEach((key) => {
+      if (!setupState.__isScriptSetup) {
+        if (isReservedPrefix(key[0])) {
+          warn$1(
+            `setup() return property ${JSON.stringify(
+            key
+          )} should not start with "$" or "_" which are reserved prefixes for Vue internals.`
+          );
+          return;
         }
-      },
-      clone(vnode2) {
-        return resolveTransitionHooks(vnode2, props, state, instance);
+        Object.defineProperty(ctx, key, {
+          enumerable: true,
+          configurable: true,
+          get: () => setupState[key],
+          set: NOOP
+        });
       }
-    };
-    return hooks;
+    });
   }
-  function emptyPlaceholder(vnode) {
-    if (isKeepAlive(vnode)) {
-      vnode = cloneVNode(vnode);
-      vnode.children = null;
-      return vnode;
+
+  const warnRuntimeUsage = (method) => warn$1(
+    `${method}() is a compiler-hint helper that is only usable inside <script setup> of a single file component. Its arguments should be compiled away and passing it at runtime has no effect.`
+  );
+  function defineProps() {
+    {
+      warnRuntimeUsage(`defineProps`);
     }
+    return null;
   }
-  function getKeepAliveChild(vnode) {
-    if (!isKeepAlive(vnode)) {
-      return vnode;
+  function defineEmits() {
+    {
+      warnRuntimeUsage(`defineEmits`);
     }
-    if (vnode.component) {
-      return vnode.component.subTree;
+    return null;
+  }
+  function defineExpose(exposed) {
+    {
+      warnRuntimeUsage(`defineExpose`);
     }
-    const { shapeFlag, children } = vnode;
-    if (children) {
-      if (shapeFlag & 16) {
-        return children[0];
-      }
-      if (shapeFlag & 32 && isFunction(children.default)) {
-        return children.default();
-      }
+  }
+  function defineOptions(options) {
+    {
+      warnRuntimeUsage(`defineOptions`);
     }
   }
-  function setTransitionHooks(vnode, hooks) {
-    if (vnode.shapeFlag & 6 && vnode.component) {
-      setTransitionHooks(vnode.component.subTree, hooks);
-    } else if (vnode.shapeFlag & 128) {
-      vnode.ssContent.transition = hooks.clone(vnode.ssContent);
-      vnode.ssFallback.transition = hooks.clone(vnode.ssFallback);
-    } else {
-      vnode.transition = hooks;
+  function defineSlots() {
+    {
+      warnRuntimeUsage(`defineSlots`);
     }
+    return null;
   }
-  function getTransitionRawChildren(children, keepComment = false, parentKey) {
-    let ret = [];
-    let keyedFragmentCount = 0;
-    for (let i = 0; i < children.length; i++) {
-      let child = children[i];
-      const key = parentKey == null ? child.key : String(parentKey) + String(child.key != null ? child.key : i);
-      if (child.type === Fragment) {
-        if (child.patchFlag & 128)
-          keyedFragmentCount++;
-        ret = ret.concat(
-          getTransitionRawChildren(child.children, keepComment, key)
-        );
-      } else if (keepComment || child.type !== Comment) {
-        ret.push(key != null ? cloneVNode(child, { key }) : child);
+  function defineModel() {
+    {
+      warnRuntimeUsage("defineModel");
+    }
+  }
+  function withDefaults(props, defaults) {
+    {
+      warnRuntimeUsage(`withDefaults`);
+    }
+    return null;
+  }
+  function useSlots() {
+    return getContext().slots;
+  }
+  function useAttrs() {
+    return getContext().attrs;
+  }
+  function getContext() {
+    const i = getCurrentInstance();
+    if (!i) {
+      warn$1(`useContext() called without active instance.`);
+    }
+    return i.setupContext || (i.setupContext = createSetupContext(i));
+  }
+  function normalizePropsOrEmits(props) {
+    return isArray(props) ? props.reduce(
+      (normalized, p) => (normalized[p] = null, normalized),
+      {}
+    ) : props;
+  }
+  function mergeDefaults(raw, defaults) {
+    const props = normalizePropsOrEmits(raw);
+    for (const key in defaults) {
+      if (key.startsWith("__skip")) continue;
+      let opt = props[key];
+      if (opt) {
+        if (isArray(opt) || isFunction(opt)) {
+          opt = props[key] = { type: opt, default: defaults[key] };
+        } else {
+          opt.default = defaults[key];
+        }
+      } else if (opt === null) {
+        opt = props[key] = { default: defaults[key] };
+      } else {
+        warn$1(`props default key "${key}" has no corresponding declaration.`);
+      }
+      if (opt && defaults[`__skip_${key}`]) {
+        opt.skipFactory = true;
       }
     }
-    if (keyedFragmentCount > 1) {
-      for (let i = 0; i < ret.length; i++) {
-        ret[i].patchFlag = -2;
+    return props;
+  }
+  function mergeModels(a, b) {
+    if (!a || !b) return a || b;
+    if (isArray(a) && isArray(b)) return a.concat(b);
+    return extend({}, normalizePropsOrEmits(a), normalizePropsOrEmits(b));
+  }
+  function createPropsRestProxy(props, excludedKeys) {
+    const ret = {};
+    for (const key in props) {
+      if (!excludedKeys.includes(key)) {
+        Object.defineProperty(ret, key, {
+          enumerable: true,
+          get: () => props[key]
+        });
       }
     }
     return ret;
   }
-
-  /*! #__NO_SIDE_EFFECTS__ */
-  // @__NO_SIDE_EFFECTS__
-  function defineComponent(options, extraOptions) {
-    return isFunction(options) ? (
-      // #8326: extend call and options.name access are considered side-effects
-      // by Rollup, so we have to wrap it in a pure-annotated IIFE.
-      /* @__PURE__ */ (() => extend({ name: options.name }, extraOptions, { setup: options }))()
-    ) : options;
+  function withAsyncContext(getAwaitable) {
+    const ctx = getCurrentInstance();
+    if (!ctx) {
+      warn$1(
+        `withAsyncContext called without active current instance. This is likely a bug.`
+      );
+    }
+    let awaitable = getAwaitable();
+    unsetCurrentInstance();
+    if (isPromise(awaitable)) {
+      awaitable = awaitable.catch((e) => {
+        setCurrentInstance(ctx);
+        throw e;
+      });
+    }
+    return [awaitable, () => setCurrentInstance(ctx)];
   }
 
-  const isAsyncWrapper = (i) => !!i.type.__asyncLoader;
-  /*! #__NO_SIDE_EFFECTS__ */
-  // @__NO_SIDE_EFFECTS__
-  function defineAsyncComponent(source) {
-    if (isFunction(source)) {
-      source = { loader: source };
+  function createDuplicateChecker() {
+    const cache = /* @__PURE__ */ Object.create(null);
+    return (type, key) => {
+      if (cache[key]) {
+        warn$1(`${type} property "${key}" is already defined in ${cache[key]}.`);
+      } else {
+        cache[key] = type;
+      }
+    };
+  }
+  let shouldCacheAccess = true;
+  function applyOptions(instance) {
+    const options = resolveMergedOptions(instance);
+    const publicThis = instance.proxy;
+    const ctx = instance.ctx;
+    shouldCacheAccess = false;
+    if (options.beforeCreate) {
+      callHook$1(options.beforeCreate, instance, "bc");
     }
     const {
-      loader,
-      loadingComponent,
-      errorComponent,
-      delay = 200,
-      timeout,
-      // undefined = never times out
-      suspensible = true,
-      onError: userOnError
-    } = source;
-    let pendingRequest = null;
-    let resolvedComp;
-    let retries = 0;
-    const retry = () => {
-      retries++;
-      pendingRequest = null;
-      return load();
-    };
-    const load = () => {
-      let thisRequest;
-      return pendingRequest || (thisRequest = pendingRequest = loader().catch((err) => {
-        err = err instanceof Error ? err : new Error(String(err));
-        if (userOnError) {
-          return new Promise((resolve, reject) => {
-            const userRetry = () => resolve(retry());
-            const userFail = () => reject(err);
-            userOnError(err, userRetry, userFail, retries + 1);
-          });
-        } else {
-          throw err;
-        }
-      }).then((comp) => {
-        if (thisRequest !== pendingRequest && pendingRequest) {
-          return pendingRequest;
+      // state
+      data: dataOptions,
+      computed: computedOptions,
+      methods,
+      watch: watchOptions,
+      provide: provideOptions,
+      inject: injectOptions,
+      // lifecycle
+      created,
+      beforeMount,
+      mounted,
+      beforeUpdate,
+      updated,
+      activated,
+      deactivated,
+      beforeDestroy,
+      beforeUnmount,
+      destroyed,
+      unmounted,
+      render,
+      renderTracked,
+      renderTriggered,
+      errorCaptured,
+      serverPrefetch,
+      // public API
+      expose,
+      inheritAttrs,
+      // assets
+      components,
+      directives,
+      filters
+    } = options;
+    const checkDuplicateProperties = createDuplicateChecker() ;
+    {
+      const [propsOptions] = instance.propsOptions;
+      if (propsOptions) {
+        for (const key in propsOptions) {
+          checkDuplicateProperties("Props" /* PROPS */, key);
         }
-        if (!comp) {
+      }
+    }
+    if (injectOptions) {
+      resolveInjections(injectOptions, ctx, checkDuplicateProperties);
+    }
+    if (methods) {
+      for (const key in methods) {
+        const methodHandler = methods[key];
+        if (isFunction(methodHandler)) {
+          {
+            Object.defineProperty(ctx, key, {
+              value: methodHandler.bind(publicThis),
+              configurable: true,
+              enumerable: true,
+              writable: true
+            });
+          }
+          {
+            checkDuplicateProperties("Methods" /* METHODS */, key);
+          }
+        } else {
           warn$1(
-            `Async component loader resolved to undefined. If you are using retry(), make sure to return its return value.`
+            `Method "${key}" has type "${typeof methodHandler}" in the component definition. Did you reference the function correctly?`
           );
         }
-        if (comp && (comp.__esModule || comp[Symbol.toStringTag] === "Module")) {
-          comp = comp.default;
-        }
-        if (comp && !isObject(comp) && !isFunction(comp)) {
-          throw new Error(`Invalid async component load result: ${comp}`);
+      }
+    }
+    if (dataOptions) {
+      if (!isFunction(dataOptions)) {
+        warn$1(
+          `The data option must be a function. Plain object usage is no longer supported.`
+        );
+      }
+      const data = dataOptions.call(publicThis, publicThis);
+      if (isPromise(data)) {
+        warn$1(
+          `data() returned a Promise - note data() cannot be async; If you intend to perform data fetching before component renders, use async setup() + <Suspense>.`
+        );
+      }
+      if (!isObject(data)) {
+        warn$1(`data() should return an object.`);
+      } else {
+        instance.data = reactive(data);
+        {
+          for (const key in data) {
+            checkDuplicateProperties("Data" /* DATA */, key);
+            if (!isReservedPrefix(key[0])) {
+              Object.defineProperty(ctx, key, {
+                configurable: true,
+                enumerable: true,
+                get: () => data[key],
+                set: NOOP
+              });
+            }
+          }
         }
-        resolvedComp = comp;
-        return comp;
-      }));
-    };
-    return defineComponent({
-      name: "AsyncComponentWrapper",
-      __asyncLoader: load,
-      get __asyncResolved() {
-        return resolvedComp;
-      },
-      setup() {
-        const instance = currentInstance;
-        if (resolvedComp) {
-          return () => createInnerComp(resolvedComp, instance);
+      }
+    }
+    shouldCacheAccess = true;
+    if (computedOptions) {
+      for (const key in computedOptions) {
+        const opt = computedOptions[key];
+        const get = isFunction(opt) ? opt.bind(publicThis, publicThis) : isFunction(opt.get) ? opt.get.bind(publicThis, publicThis) : NOOP;
+        if (get === NOOP) {
+          warn$1(`Computed property "${key}" has no getter.`);
         }
-        const onError = (err) => {
-          pendingRequest = null;
-          handleError(
-            err,
-            instance,
-            13,
-            !errorComponent
+        const set = !isFunction(opt) && isFunction(opt.set) ? opt.set.bind(publicThis) : () => {
+          warn$1(
+            `Write operation failed: computed property "${key}" is readonly.`
           );
-        };
-        if (suspensible && instance.suspense || false) {
-          return load().then((comp) => {
-            return () => createInnerComp(comp, instance);
-          }).catch((err) => {
-            onError(err);
-            return () => errorComponent ? createVNode(errorComponent, {
-              error: err
-            }) : null;
-          });
-        }
-        const loaded = ref(false);
-        const error = ref();
-        const delayed = ref(!!delay);
-        if (delay) {
-          setTimeout(() => {
-            delayed.value = false;
-          }, delay);
-        }
-        if (timeout != null) {
-          setTimeout(() => {
-            if (!loaded.value && !error.value) {
-              const err = new Error(
-                `Async component timed out after ${timeout}ms.`
-              );
-              onError(err);
-              error.value = err;
-            }
-          }, timeout);
-        }
-        load().then(() => {
-          loaded.value = true;
-          if (instance.parent && isKeepAlive(instance.parent.vnode)) {
-            instance.parent.effect.dirty = true;
-            queueJob(instance.parent.update);
-          }
-        }).catch((err) => {
-          onError(err);
-          error.value = err;
+        } ;
+        const c = computed({
+          get,
+          set
         });
-        return () => {
-          if (loaded.value && resolvedComp) {
-            return createInnerComp(resolvedComp, instance);
-          } else if (error.value && errorComponent) {
-            return createVNode(errorComponent, {
-              error: error.value
-            });
-          } else if (loadingComponent && !delayed.value) {
-            return createVNode(loadingComponent);
-          }
-        };
+        Object.defineProperty(ctx, key, {
+          enumerable: true,
+          configurable: true,
+          get: () => c.value,
+          set: (v) => c.value = v
+        });
+        {
+          checkDuplicateProperties("Computed" /* COMPUTED */, key);
+        }
       }
-    });
-  }
-  function createInnerComp(comp, parent) {
-    const { ref: ref2, props, children, ce } = parent.vnode;
-    const vnode = createVNode(comp, props, children);
-    vnode.ref = ref2;
-    vnode.ce = ce;
-    delete parent.vnode.ce;
-    return vnode;
-  }
-
-  const isKeepAlive = (vnode) => vnode.type.__isKeepAlive;
-  const KeepAliveImpl = {
-    name: `KeepAlive`,
-    // Marker for special handling inside the renderer. We are not using a ===
-    // check directly on KeepAlive in the renderer, because importing it directly
-    // would prevent it from being tree-shaken.
-    __isKeepAlive: true,
-    props: {
-      include: [String, RegExp, Array],
-      exclude: [String, RegExp, Array],
-      max: [String, Number]
-    },
-    setup(props, { slots }) {
-      const instance = getCurrentInstance();
-      const sharedContext = instance.ctx;
-      const cache = /* @__PURE__ */ new Map();
-      const keys = /* @__PURE__ */ new Set();
-      let current = null;
-      {
-        instance.__v_cache = cache;
+    }
+    if (watchOptions) {
+      for (const key in watchOptions) {
+        createWatcher(watchOptions[key], ctx, publicThis, key);
       }
-      const parentSuspense = instance.suspense;
-      const {
-        renderer: {
-          p: patch,
-          m: move,
-          um: _unmount,
-          o: { createElement }
-        }
-      } = sharedContext;
-      const storageContainer = createElement("div");
-      sharedContext.activate = (vnode, container, anchor, namespace, optimized) => {
-        const instance2 = vnode.component;
-        move(vnode, container, anchor, 0, parentSuspense);
-        patch(
-          instance2.vnode,
-          vnode,
-          container,
-          anchor,
-          instance2,
-          parentSuspense,
-          namespace,
-          vnode.slotScopeIds,
-          optimized
-        );
-        queuePostRenderEffect(() => {
-          instance2.isDeactivated = false;
-          if (instance2.a) {
-            invokeArrayFns(instance2.a);
-          }
-          const vnodeHook = vnode.props && vnode.props.onVnodeMounted;
-          if (vnodeHook) {
-            invokeVNodeHook(vnodeHook, instance2.parent, vnode);
-          }
-        }, parentSuspense);
-        {
-          devtoolsComponentAdded(instance2);
-        }
-      };
-      sharedContext.deactivate = (vnode) => {
-        const instance2 = vnode.component;
-        move(vnode, storageContainer, null, 1, parentSuspense);
-        queuePostRenderEffect(() => {
-          if (instance2.da) {
-            invokeArrayFns(instance2.da);
-          }
-          const vnodeHook = vnode.props && vnode.props.onVnodeUnmounted;
-          if (vnodeHook) {
-            invokeVNodeHook(vnodeHook, instance2.parent, vnode);
-          }
-          instance2.isDeactivated = true;
-        }, parentSuspense);
-        {
-          devtoolsComponentAdded(instance2);
-        }
-      };
-      function unmount(vnode) {
-        resetShapeFlag(vnode);
-        _unmount(vnode, instance, parentSuspense, true);
+    }
+    if (provideOptions) {
+      const provides = isFunction(provideOptions) ? provideOptions.call(publicThis) : provideOptions;
+      Reflect.ownKeys(provides).forEach((key) => {
+        provide(key, provides[key]);
+      });
+    }
+    if (created) {
+      callHook$1(created, instance, "c");
+    }
+    function registerLifecycleHook(register, hook) {
+      if (isArray(hook)) {
+        hook.forEach((_hook) => register(_hook.bind(publicThis)));
+      } else if (hook) {
+        register(hook.bind(publicThis));
       }
-      function pruneCache(filter) {
-        cache.forEach((vnode, key) => {
-          const name = getComponentName(vnode.type);
-          if (name && (!filter || !filter(name))) {
-            pruneCacheEntry(key);
-          }
+    }
+    registerLifecycleHook(onBeforeMount, beforeMount);
+    registerLifecycleHook(onMounted, mounted);
+    registerLifecycleHook(onBeforeUpdate, beforeUpdate);
+    registerLifecycleHook(onUpdated, updated);
+    registerLifecycleHook(onActivated, activated);
+    registerLifecycleHook(onDeactivated, deactivated);
+    registerLifecycleHook(onErrorCaptured, errorCaptured);
+    registerLifecycleHook(onRenderTracked, renderTracked);
+    registerLifecycleHook(onRenderTriggered, renderTriggered);
+    registerLifecycleHook(onBeforeUnmount, beforeUnmount);
+    registerLifecycleHook(onUnmounted, unmounted);
+    registerLifecycleHook(onServerPrefetch, serverPrefetch);
+    if (isArray(expose)) {
+      if (expose.length) {
+        const exposed = instance.exposed || (instance.exposed = {});
+        expose.forEach((key) => {
+          Object.defineProperty(exposed, key, {
+            get: () => publicThis[key],
+            set: (val) => publicThis[key] = val
+          });
         });
+      } else if (!instance.exposed) {
+        instance.exposed = {};
       }
-      function pruneCacheEntry(key) {
-        const cached = cache.get(key);
-        if (!current || !isSameVNodeType(cached, current)) {
-          unmount(cached);
-        } else if (current) {
-          resetShapeFlag(current);
-        }
-        cache.delete(key);
-        keys.delete(key);
-      }
-      watch(
-        () => [props.include, props.exclude],
-        ([include, exclude]) => {
-          include && pruneCache((name) => matches(include, name));
-          exclude && pruneCache((name) => !matches(exclude, name));
-        },
-        // prune post-render after `current` has been updated
-        { flush: "post", deep: true }
-      );
-      let pendingCacheKey = null;
-      const cacheSubtree = () => {
-        if (pendingCacheKey != null) {
-          cache.set(pendingCacheKey, getInnerChild(instance.subTree));
-        }
-      };
-      onMounted(cacheSubtree);
-      onUpdated(cacheSubtree);
-      onBeforeUnmount(() => {
-        cache.forEach((cached) => {
-          const { subTree, suspense } = instance;
-          const vnode = getInnerChild(subTree);
-          if (cached.type === vnode.type && cached.key === vnode.key) {
-            resetShapeFlag(vnode);
-            const da = vnode.component.da;
-            da && queuePostRenderEffect(da, suspense);
-            return;
-          }
-          unmount(cached);
-        });
-      });
-      return () => {
-        pendingCacheKey = null;
-        if (!slots.default) {
-          return null;
-        }
-        const children = slots.default();
-        const rawVNode = children[0];
-        if (children.length > 1) {
-          {
-            warn$1(`KeepAlive should contain exactly one component child.`);
-          }
-          current = null;
-          return children;
-        } else if (!isVNode(rawVNode) || !(rawVNode.shapeFlag & 4) && !(rawVNode.shapeFlag & 128)) {
-          current = null;
-          return rawVNode;
-        }
-        let vnode = getInnerChild(rawVNode);
-        const comp = vnode.type;
-        const name = getComponentName(
-          isAsyncWrapper(vnode) ? vnode.type.__asyncResolved || {} : comp
-        );
-        const { include, exclude, max } = props;
-        if (include && (!name || !matches(include, name)) || exclude && name && matches(exclude, name)) {
-          current = vnode;
-          return rawVNode;
-        }
-        const key = vnode.key == null ? comp : vnode.key;
-        const cachedVNode = cache.get(key);
-        if (vnode.el) {
-          vnode = cloneVNode(vnode);
-          if (rawVNode.shapeFlag & 128) {
-            rawVNode.ssContent = vnode;
-          }
-        }
-        pendingCacheKey = key;
-        if (cachedVNode) {
-          vnode.el = cachedVNode.el;
-          vnode.component = cachedVNode.component;
-          if (vnode.transition) {
-            setTransitionHooks(vnode, vnode.transition);
-          }
-          vnode.shapeFlag |= 512;
-          keys.delete(key);
-          keys.add(key);
-        } else {
-          keys.add(key);
-          if (max && keys.size > parseInt(max, 10)) {
-            pruneCacheEntry(keys.values().next().value);
-          }
-        }
-        vnode.shapeFlag |= 256;
-        current = vnode;
-        return isSuspense(rawVNode.type) ? rawVNode : vnode;
-      };
     }
-  };
-  const KeepAlive = KeepAliveImpl;
-  function matches(pattern, name) {
-    if (isArray(pattern)) {
-      return pattern.some((p) => matches(p, name));
-    } else if (isString(pattern)) {
-      return pattern.split(",").includes(name);
-    } else if (isRegExp(pattern)) {
-      return pattern.test(name);
+    if (render && instance.render === NOOP) {
+      instance.render = render;
     }
-    return false;
-  }
-  function onActivated(hook, target) {
-    registerKeepAliveHook(hook, "a", target);
-  }
-  function onDeactivated(hook, target) {
-    registerKeepAliveHook(hook, "da", target);
+    if (inheritAttrs != null) {
+      instance.inheritAttrs = inheritAttrs;
+    }
+    if (components) instance.components = components;
+    if (directives) instance.directives = directives;
   }
-  function registerKeepAliveHook(hook, type, target = currentInstance) {
-    const wrappedHook = hook.__wdc || (hook.__wdc = () => {
-      let current = target;
-      while (current) {
-        if (current.isDeactivated) {
-          return;
+  function resolveInjections(injectOptions, ctx, checkDuplicateProperties = NOOP) {
+    if (isArray(injectOptions)) {
+      injectOptions = normalizeInject(injectOptions);
+    }
+    for (const key in injectOptions) {
+      const opt = injectOptions[key];
+      let injected;
+      if (isObject(opt)) {
+        if ("default" in opt) {
+          injected = inject(
+            opt.from || key,
+            opt.default,
+            true
+          );
+        } else {
+          injected = inject(opt.from || key);
         }
-        current = current.parent;
+      } else {
+        injected = inject(opt);
       }
-      return hook();
-    });
-    injectHook(type, wrappedHook, target);
-    if (target) {
-      let current = target.parent;
-      while (current && current.parent) {
-        if (isKeepAlive(current.parent.vnode)) {
-          injectToKeepAliveRoot(wrappedHook, type, target, current);
-        }
-        current = current.parent;
+      if (isRef(injected)) {
+        Object.defineProperty(ctx, key, {
+          enumerable: true,
+          configurable: true,
+          get: () => injected.value,
+          set: (v) => injected.value = v
+        });
+      } else {
+        ctx[key] = injected;
+      }
+      {
+        checkDuplicateProperties("Inject" /* INJECT */, key);
       }
     }
   }
-  function injectToKeepAliveRoot(hook, type, target, keepAliveRoot) {
-    const injected = injectHook(
-      type,
-      hook,
-      keepAliveRoot,
-      true
-      /* prepend */
+  function callHook$1(hook, instance, type) {
+    callWithAsyncErrorHandling(
+      isArray(hook) ? hook.map((h) => h.bind(instance.proxy)) : hook.bind(instance.proxy),
+      instance,
+      type
     );
-    onUnmounted(() => {
-      remove(keepAliveRoot[type], injected);
-    }, target);
-  }
-  function resetShapeFlag(vnode) {
-    vnode.shapeFlag &= ~256;
-    vnode.shapeFlag &= ~512;
-  }
-  function getInnerChild(vnode) {
-    return vnode.shapeFlag & 128 ? vnode.ssContent : vnode;
   }
-
-  function injectHook(type, hook, target = currentInstance, prepend = false) {
-    if (target) {
-      const hooks = target[type] || (target[type] = []);
-      const wrappedHook = hook.__weh || (hook.__weh = (...args) => {
-        if (target.isUnmounted) {
-          return;
-        }
-        pauseTracking();
-        const reset = setCurrentInstance(target);
-        const res = callWithAsyncErrorHandling(hook, target, type, args);
-        reset();
-        resetTracking();
-        return res;
-      });
-      if (prepend) {
-        hooks.unshift(wrappedHook);
+  function createWatcher(raw, ctx, publicThis, key) {
+    const getter = key.includes(".") ? createPathGetter(publicThis, key) : () => publicThis[key];
+    if (isString(raw)) {
+      const handler = ctx[raw];
+      if (isFunction(handler)) {
+        watch(getter, handler);
       } else {
-        hooks.push(wrappedHook);
-      }
-      return wrappedHook;
-    } else {
-      const apiName = toHandlerKey(ErrorTypeStrings$1[type].replace(/ hook$/, ""));
-      warn$1(
-        `${apiName} is called when there is no active component instance to be associated with. Lifecycle injection APIs can only be used during execution of setup().` + (` If you are using async setup(), make sure to register lifecycle hooks before the first await statement.` )
-      );
-    }
-  }
-  const createHook = (lifecycle) => (hook, target = currentInstance) => (
-    // post-create lifecycle registrations are noops during SSR (except for serverPrefetch)
-    (!isInSSRComponentSetup || lifecycle === "sp") && injectHook(lifecycle, (...args) => hook(...args), target)
-  );
-  const onBeforeMount = createHook("bm");
-  const onMounted = createHook("m");
-  const onBeforeUpdate = createHook("bu");
-  const onUpdated = createHook("u");
-  const onBeforeUnmount = createHook("bum");
-  const onUnmounted = createHook("um");
-  const onServerPrefetch = createHook("sp");
-  const onRenderTriggered = createHook(
-    "rtg"
-  );
-  const onRenderTracked = createHook(
-    "rtc"
-  );
-  function onErrorCaptured(hook, target = currentInstance) {
-    injectHook("ec", hook, target);
-  }
-
-  function renderList(source, renderItem, cache, index) {
-    let ret;
-    const cached = cache && cache[index];
-    if (isArray(source) || isString(source)) {
-      ret = new Array(source.length);
-      for (let i = 0, l = source.length; i < l; i++) {
-        ret[i] = renderItem(source[i], i, void 0, cached && cached[i]);
-      }
-    } else if (typeof source === "number") {
-      if (!Number.isInteger(source)) {
-        warn$1(`The v-for range expect an integer value but got ${source}.`);
-      }
-      ret = new Array(source);
-      for (let i = 0; i < source; i++) {
-        ret[i] = renderItem(i + 1, i, void 0, cached && cached[i]);
+        warn$1(`Invalid watch handler specified by key "${raw}"`, handler);
       }
-    } else if (isObject(source)) {
-      if (source[Symbol.iterator]) {
-        ret = Array.from(
-          source,
-          (item, i) => renderItem(item, i, void 0, cached && cached[i])
-        );
+    } else if (isFunction(raw)) {
+      watch(getter, raw.bind(publicThis));
+    } else if (isObject(raw)) {
+      if (isArray(raw)) {
+        raw.forEach((r) => createWatcher(r, ctx, publicThis, key));
       } else {
-        const keys = Object.keys(source);
-        ret = new Array(keys.length);
-        for (let i = 0, l = keys.length; i < l; i++) {
-          const key = keys[i];
-          ret[i] = renderItem(source[key], key, i, cached && cached[i]);
+        const handler = isFunction(raw.handler) ? raw.handler.bind(publicThis) : ctx[raw.handler];
+        if (isFunction(handler)) {
+          watch(getter, handler, raw);
+        } else {
+          warn$1(`Invalid watch handler specified by key "${raw.handler}"`, handler);
         }
       }
     } else {
-      ret = [];
-    }
-    if (cache) {
-      cache[index] = ret;
+      warn$1(`Invalid watch option: "${key}"`, raw);
     }
-    return ret;
   }
-
-  function createSlots(slots, dynamicSlots) {
-    for (let i = 0; i < dynamicSlots.length; i++) {
-      const slot = dynamicSlots[i];
-      if (isArray(slot)) {
-        for (let j = 0; j < slot.length; j++) {
-          slots[slot[j].name] = slot[j].fn;
-        }
-      } else if (slot) {
-        slots[slot.name] = slot.key ? (...args) => {
-          const res = slot.fn(...args);
-          if (res)
-            res.key = slot.key;
-          return res;
-        } : slot.fn;
+  function resolveMergedOptions(instance) {
+    const base = instance.type;
+    const { mixins, extends: extendsOptions } = base;
+    const {
+      mixins: globalMixins,
+      optionsCache: cache,
+      config: { optionMergeStrategies }
+    } = instance.appContext;
+    const cached = cache.get(base);
+    let resolved;
+    if (cached) {
+      resolved = cached;
+    } else if (!globalMixins.length && !mixins && !extendsOptions) {
+      {
+        resolved = base;
+      }
+    } else {
+      resolved = {};
+      if (globalMixins.length) {
+        globalMixins.forEach(
+          (m) => mergeOptions(resolved, m, optionMergeStrategies, true)
+        );
       }
+      mergeOptions(resolved, base, optionMergeStrategies);
     }
-    return slots;
+    if (isObject(base)) {
+      cache.set(base, resolved);
+    }
+    return resolved;
   }
-
-  function renderSlot(slots, name, props = {}, fallback, noSlotted) {
-    if (currentRenderingInstance.isCE || currentRenderingInstance.parent && isAsyncWrapper(currentRenderingInstance.parent) && currentRenderingInstance.parent.isCE) {
-      if (name !== "default")
-        props.name = name;
-      return createVNode("slot", props, fallback && fallback());
+  function mergeOptions(to, from, strats, asMixin = false) {
+    const { mixins, extends: extendsOptions } = from;
+    if (extendsOptions) {
+      mergeOptions(to, extendsOptions, strats, true);
     }
-    let slot = slots[name];
-    if (slot && slot.length > 1) {
-      warn$1(
-        `SSR-optimized slot function detected in a non-SSR-optimized render function. You need to mark this component with $dynamic-slots in the parent template.`
+    if (mixins) {
+      mixins.forEach(
+        (m) => mergeOptions(to, m, strats, true)
       );
-      slot = () => [];
     }
-    if (slot && slot._c) {
-      slot._d = false;
+    for (const key in from) {
+      if (asMixin && key === "expose") {
+        warn$1(
+          `"expose" option is ignored when declared in mixins or extends. It should only be declared in the base component itself.`
+        );
+      } else {
+        const strat = internalOptionMergeStrats[key] || strats && strats[key];
+        to[key] = strat ? strat(to[key], from[key]) : from[key];
+      }
     }
-    openBlock();
-    const validSlotContent = slot && ensureValidVNode(slot(props));
-    const rendered = createBlock(
-      Fragment,
-      {
-        key: props.key || // slot content array of a dynamic conditional slot may have a branch
-        // key attached in the `createSlots` helper, respect that
-        validSlotContent && validSlotContent.key || `_${name}`
-      },
-      validSlotContent || (fallback ? fallback() : []),
-      validSlotContent && slots._ === 1 ? 64 : -2
-    );
-    if (!noSlotted && rendered.scopeId) {
-      rendered.slotScopeIds = [rendered.scopeId + "-s"];
+    return to;
+  }
+  const internalOptionMergeStrats = {
+    data: mergeDataFn,
+    props: mergeEmitsOrPropsOptions,
+    emits: mergeEmitsOrPropsOptions,
+    // objects
+    methods: mergeObjectOptions,
+    computed: mergeObjectOptions,
+    // lifecycle
+    beforeCreate: mergeAsArray$1,
+    created: mergeAsArray$1,
+    beforeMount: mergeAsArray$1,
+    mounted: mergeAsArray$1,
+    beforeUpdate: mergeAsArray$1,
+    updated: mergeAsArray$1,
+    beforeDestroy: mergeAsArray$1,
+    beforeUnmount: mergeAsArray$1,
+    destroyed: mergeAsArray$1,
+    unmounted: mergeAsArray$1,
+    activated: mergeAsArray$1,
+    deactivated: mergeAsArray$1,
+    errorCaptured: mergeAsArray$1,
+    serverPrefetch: mergeAsArray$1,
+    // assets
+    components: mergeObjectOptions,
+    directives: mergeObjectOptions,
+    // watch
+    watch: mergeWatchOptions,
+    // provide / inject
+    provide: mergeDataFn,
+    inject: mergeInject
+  };
+  function mergeDataFn(to, from) {
+    if (!from) {
+      return to;
     }
-    if (slot && slot._c) {
-      slot._d = true;
+    if (!to) {
+      return from;
     }
-    return rendered;
+    return function mergedDataFn() {
+      return (extend)(
+        isFunction(to) ? to.call(this, this) : to,
+        isFunction(from) ? from.call(this, this) : from
+      );
+    };
   }
-  function ensureValidVNode(vnodes) {
-    return vnodes.some((child) => {
-      if (!isVNode(child))
-        return true;
-      if (child.type === Comment)
-        return false;
-      if (child.type === Fragment && !ensureValidVNode(child.children))
-        return false;
-      return true;
-    }) ? vnodes : null;
+  function mergeInject(to, from) {
+    return mergeObjectOptions(normalizeInject(to), normalizeInject(from));
   }
-
-  function toHandlers(obj, preserveCaseIfNecessary) {
-    const ret = {};
-    if (!isObject(obj)) {
-      warn$1(`v-on with no argument expects an object value.`);
-      return ret;
-    }
-    for (const key in obj) {
-      ret[preserveCaseIfNecessary && /[A-Z]/.test(key) ? `on:${key}` : toHandlerKey(key)] = obj[key];
-    }
-    return ret;
-  }
-
-  const getPublicInstance = (i) => {
-    if (!i)
-      return null;
-    if (isStatefulComponent(i))
-      return getExposeProxy(i) || i.proxy;
-    return getPublicInstance(i.parent);
-  };
-  const publicPropertiesMap = (
-    // Move PURE marker to new line to workaround compiler discarding it
-    // due to type annotation
-    /* @__PURE__ */ extend(/* @__PURE__ */ Object.create(null), {
-      $: (i) => i,
-      $el: (i) => i.vnode.el,
-      $data: (i) => i.data,
-      $props: (i) => shallowReadonly(i.props) ,
-      $attrs: (i) => shallowReadonly(i.attrs) ,
-      $slots: (i) => shallowReadonly(i.slots) ,
-      $refs: (i) => shallowReadonly(i.refs) ,
-      $parent: (i) => getPublicInstance(i.parent),
-      $root: (i) => getPublicInstance(i.root),
-      $emit: (i) => i.emit,
-      $options: (i) => resolveMergedOptions(i) ,
-      $forceUpdate: (i) => i.f || (i.f = () => {
-        i.effect.dirty = true;
-        queueJob(i.update);
-      }),
-      $nextTick: (i) => i.n || (i.n = nextTick.bind(i.proxy)),
-      $watch: (i) => instanceWatch.bind(i) 
-    })
-  );
-  const isReservedPrefix = (key) => key === "_" || key === "$";
-  const hasSetupBinding = (state, key) => state !== EMPTY_OBJ && !state.__isScriptSetup && hasOwn(state, key);
-  const PublicInstanceProxyHandlers = {
-    get({ _: instance }, key) {
-      if (key === "__v_skip") {
-        return true;
-      }
-      const { ctx, setupState, data, props, accessCache, type, appContext } = instance;
-      if (key === "__isVue") {
-        return true;
-      }
-      let normalizedProps;
-      if (key[0] !== "$") {
-        const n = accessCache[key];
-        if (n !== void 0) {
-          switch (n) {
-            case 1 /* SETUP */:
-              return setupState[key];
-            case 2 /* DATA */:
-              return data[key];
-            case 4 /* CONTEXT */:
-              return ctx[key];
-            case 3 /* PROPS */:
-              return props[key];
-          }
-        } else if (hasSetupBinding(setupState, key)) {
-          accessCache[key] = 1 /* SETUP */;
-          return setupState[key];
-        } else if (data !== EMPTY_OBJ && hasOwn(data, key)) {
-          accessCache[key] = 2 /* DATA */;
-          return data[key];
-        } else if (
-          // only cache other properties when instance has declared (thus stable)
-          // props
-          (normalizedProps = instance.propsOptions[0]) && hasOwn(normalizedProps, key)
-        ) {
-          accessCache[key] = 3 /* PROPS */;
-          return props[key];
-        } else if (ctx !== EMPTY_OBJ && hasOwn(ctx, key)) {
-          accessCache[key] = 4 /* CONTEXT */;
-          return ctx[key];
-        } else if (shouldCacheAccess) {
-          accessCache[key] = 0 /* OTHER */;
-        }
-      }
-      const publicGetter = publicPropertiesMap[key];
-      let cssModule, globalProperties;
-      if (publicGetter) {
-        if (key === "$attrs") {
-          track(instance.attrs, "get", "");
-          markAttrsAccessed();
-        } else if (key === "$slots") {
-          track(instance, "get", key);
-        }
-        return publicGetter(instance);
-      } else if (
-        // css module (injected by vue-loader)
-        (cssModule = type.__cssModules) && (cssModule = cssModule[key])
-      ) {
-        return cssModule;
-      } else if (ctx !== EMPTY_OBJ && hasOwn(ctx, key)) {
-        accessCache[key] = 4 /* CONTEXT */;
-        return ctx[key];
-      } else if (
-        // global properties
-        globalProperties = appContext.config.globalProperties, hasOwn(globalProperties, key)
-      ) {
-        {
-          return globalProperties[key];
-        }
-      } else if (currentRenderingInstance && (!isString(key) || // #1091 avoid internal isRef/isVNode checks on component instance leading
-      // to infinite warning loop
-      key.indexOf("__v") !== 0)) {
-        if (data !== EMPTY_OBJ && isReservedPrefix(key[0]) && hasOwn(data, key)) {
-          warn$1(
-            `Property ${JSON.stringify(
-            key
-          )} must be accessed via $data because it starts with a reserved character ("$" or "_") and is not proxied on the render context.`
-          );
-        } else if (instance === currentRenderingInstance) {
-          warn$1(
-            `Property ${JSON.stringify(key)} was accessed during render but is not defined on instance.`
-          );
-        }
-      }
-    },
-    set({ _: instance }, key, value) {
-      const { data, setupState, ctx } = instance;
-      if (hasSetupBinding(setupState, key)) {
-        setupState[key] = value;
-        return true;
-      } else if (setupState.__isScriptSetup && hasOwn(setupState, key)) {
-        warn$1(`Cannot mutate <script setup> binding "${key}" from Options API.`);
-        return false;
-      } else if (data !== EMPTY_OBJ && hasOwn(data, key)) {
-        data[key] = value;
-        return true;
-      } else if (hasOwn(instance.props, key)) {
-        warn$1(`Attempting to mutate prop "${key}". Props are readonly.`);
-        return false;
-      }
-      if (key[0] === "$" && key.slice(1) in instance) {
-        warn$1(
-          `Attempting to mutate public property "${key}". Properties starting with $ are reserved and readonly.`
-        );
-        return false;
-      } else {
-        if (key in instance.appContext.config.globalProperties) {
-          Object.defineProperty(ctx, key, {
-            enumerable: true,
-            configurable: true,
-            value
-          });
-        } else {
-          ctx[key] = value;
-        }
-      }
-      return true;
-    },
-    has({
-      _: { data, setupState, accessCache, ctx, appContext, propsOptions }
-    }, key) {
-      let normalizedProps;
-      return !!accessCache[key] || data !== EMPTY_OBJ && hasOwn(data, key) || hasSetupBinding(setupState, key) || (normalizedProps = propsOptions[0]) && hasOwn(normalizedProps, key) || hasOwn(ctx, key) || hasOwn(publicPropertiesMap, key) || hasOwn(appContext.config.globalProperties, key);
-    },
-    defineProperty(target, key, descriptor) {
-      if (descriptor.get != null) {
-        target._.accessCache[key] = 0;
-      } else if (hasOwn(descriptor, "value")) {
-        this.set(target, key, descriptor.value, null);
+  function normalizeInject(raw) {
+    if (isArray(raw)) {
+      const res = {};
+      for (let i = 0; i < raw.length; i++) {
+        res[raw[i]] = raw[i];
       }
-      return Reflect.defineProperty(target, key, descriptor);
+      return res;
     }
-  };
-  {
-    PublicInstanceProxyHandlers.ownKeys = (target) => {
-      warn$1(
-        `Avoid app logic that relies on enumerating keys on a component instance. The keys will be empty in production mode to avoid performance overhead.`
-      );
-      return Reflect.ownKeys(target);
-    };
+    return raw;
   }
-  const RuntimeCompiledPublicInstanceProxyHandlers = /* @__PURE__ */ extend(
-    {},
-    PublicInstanceProxyHandlers,
-    {
-      get(target, key) {
-        if (key === Symbol.unscopables) {
-          return;
-        }
-        return PublicInstanceProxyHandlers.get(target, key, target);
-      },
-      has(_, key) {
-        const has = key[0] !== "_" && !isGloballyAllowed(key);
-        if (!has && PublicInstanceProxyHandlers.has(_, key)) {
-          warn$1(
-            `Property ${JSON.stringify(
-            key
-          )} should not start with _ which is a reserved prefix for Vue internals.`
-          );
-        }
-        return has;
+  function mergeAsArray$1(to, from) {
+    return to ? [...new Set([].concat(to, from))] : from;
+  }
+  function mergeObjectOptions(to, from) {
+    return to ? extend(/* @__PURE__ */ Object.create(null), to, from) : from;
+  }
+  function mergeEmitsOrPropsOptions(to, from) {
+    if (to) {
+      if (isArray(to) && isArray(from)) {
+        return [.../* @__PURE__ */ new Set([...to, ...from])];
       }
+      return extend(
+        /* @__PURE__ */ Object.create(null),
+        normalizePropsOrEmits(to),
+        normalizePropsOrEmits(from != null ? from : {})
+      );
+    } else {
+      return from;
     }
-  );
-  function createDevRenderContext(instance) {
-    const target = {};
-    Object.defineProperty(target, `_`, {
-      configurable: true,
-      enumerable: false,
-      get: () => instance
-    });
-    Object.keys(publicPropertiesMap).forEach((key) => {
-      Object.defineProperty(target, key, {
-        configurable: true,
-        enumerable: false,
-        get: () => publicPropertiesMap[key](instance),
-        // intercepted by the proxy so no need for implementation,
-        // but needed to prevent set errors
-        set: NOOP
-      });
-    });
-    return target;
   }
-  function exposePropsOnRenderContext(instance) {
-    const {
-      ctx,
-      propsOptions: [propsOptions]
-    } = instance;
-    if (propsOptions) {
-      Object.keys(propsOptions).forEach((key) => {
-        Object.defineProperty(ctx, key, {
-          enumerable: true,
-          configurable: true,
-          get: () => instance.props[key],
-          set: NOOP
-        });
-      });
+  function mergeWatchOptions(to, from) {
+    if (!to) return from;
+    if (!from) return to;
+    const merged = extend(/* @__PURE__ */ Object.create(null), to);
+    for (const key in from) {
+      merged[key] = mergeAsArray$1(to[key], from[key]);
     }
+    return merged;
   }
-  function exposeSetupStateOnRenderContext(instance) {
-    const { ctx, setupState } = instance;
-    Object.keys(toRaw(setupState)).forEach((key) => {
-      if (!setupState.__isScriptSetup) {
-        if (isReservedPrefix(key[0])) {
-          warn$1(
-            `setup() return property ${JSON.stringify(
-            key
-          )} should not start with "$" or "_" which are reserved prefixes for Vue internals.`
-          );
-          return;
-        }
-        Object.defineProperty(ctx, key, {
-          enumerable: true,
-          configurable: true,
-          get: () => setupState[key],
-          set: NOOP
-        });
+
+  function createAppContext() {
+    return {
+      app: null,
+      config: {
+        isNativeTag: NO,
+        performance: false,
+        globalProperties: {},
+        optionMergeStrategies: {},
+        errorHandler: void 0,
+        warnHandler: void 0,
+        compilerOptions: {}
+      },
+      mixins: [],
+      components: {},
+      directives: {},
+      provides: /* @__PURE__ */ Object.create(null),
+      optionsCache: /* @__PURE__ */ new WeakMap(),
+      propsCache: /* @__PURE__ */ new WeakMap(),
+      emitsCache: /* @__PURE__ */ new WeakMap()
+    };
+  }
+  let uid$1 = 0;
+  function createAppAPI(render, hydrate) {
+    return function createApp(rootComponent, rootProps = null) {
+      if (!isFunction(rootComponent)) {
+        rootComponent = extend({}, rootComponent);
       }
-    });
+      if (rootProps != null && !isObject(rootProps)) {
+        warn$1(`root props passed to app.mount() must be an object.`);
+        rootProps = null;
+      }
+      const context = createAppContext();
+      const installedPlugins = /* @__PURE__ */ new WeakSet();
+      let isMounted = false;
+      const app = context.app = {
+        _uid: uid$1++,
+        _component: rootComponent,
+        _props: rootProps,
+        _container: null,
+        _context: context,
+        _instance: null,
+        version,
+        get config() {
+          return context.config;
+        },
+        set config(v) {
+          {
+            warn$1(
+              `app.config cannot be replaced. Modify individual options instead.`
+            );
+          }
+        },
+        use(plugin, ...options) {
+          if (installedPlugins.has(plugin)) {
+            warn$1(`Plugin has already been applied to target app.`);
+          } else if (plugin && isFunction(plugin.install)) {
+            installedPlugins.add(plugin);
+            plugin.install(app, ...options);
+          } else if (isFunction(plugin)) {
+            installedPlugins.add(plugin);
+            plugin(app, ...options);
+          } else {
+            warn$1(
+              `A plugin must either be a function or an object with an "install" function.`
+            );
+          }
+          return app;
+        },
+        mixin(mixin) {
+          {
+            if (!context.mixins.includes(mixin)) {
+              context.mixins.push(mixin);
+            } else {
+              warn$1(
+                "Mixin has already been applied to target app" + (mixin.name ? `: ${mixin.name}` : "")
+              );
+            }
+          }
+          return app;
+        },
+        component(name, component) {
+          {
+            validateComponentName(name, context.config);
+          }
+          if (!component) {
+            return context.components[name];
+          }
+          if (context.components[name]) {
+            warn$1(`Component "${name}" has already been registered in target app.`);
+          }
+          context.components[name] = component;
+          return app;
+        },
+        directive(name, directive) {
+          {
+            validateDirectiveName(name);
+          }
+          if (!directive) {
+            return context.directives[name];
+          }
+          if (context.directives[name]) {
+            warn$1(`Directive "${name}" has already been registered in target app.`);
+          }
+          context.directives[name] = directive;
+          return app;
+        },
+        mount(rootContainer, isHydrate, namespace) {
+          if (!isMounted) {
+            if (rootContainer.__vue_app__) {
+              warn$1(
+                `There is already an app instance mounted on the host container.
+ If you want to mount another app on the same host container, you need to unmount the previous app by calling \`app.unmount()\` first.`
+              );
+            }
+            const vnode = createVNode(rootComponent, rootProps);
+            vnode.appContext = context;
+            if (namespace === true) {
+              namespace = "svg";
+            } else if (namespace === false) {
+              namespace = void 0;
+            }
+            {
+              context.reload = () => {
+                render(
+                  cloneVNode(vnode),
+                  rootContainer,
+                  namespace
+                );
+              };
+            }
+            if (isHydrate && hydrate) {
+              hydrate(vnode, rootContainer);
+            } else {
+              render(vnode, rootContainer, namespace);
+            }
+            isMounted = true;
+            app._container = rootContainer;
+            rootContainer.__vue_app__ = app;
+            {
+              app._instance = vnode.component;
+              devtoolsInitApp(app, version);
+            }
+            return getComponentPublicInstance(vnode.component);
+          } else {
+            warn$1(
+              `App has already been mounted.
+If you want to remount the same app, move your app creation logic into a factory function and create fresh app instances for each mount - e.g. \`const createMyApp = () => createApp(App)\``
+            );
+          }
+        },
+        unmount() {
+          if (isMounted) {
+            render(null, app._container);
+            {
+              app._instance = null;
+              devtoolsUnmountApp(app);
+            }
+            delete app._container.__vue_app__;
+          } else {
+            warn$1(`Cannot unmount an app that is not mounted.`);
+          }
+        },
+        provide(key, value) {
+          if (key in context.provides) {
+            warn$1(
+              `App already provides property with key "${String(key)}". It will be overwritten with the new value.`
+            );
+          }
+          context.provides[key] = value;
+          return app;
+        },
+        runWithContext(fn) {
+          const lastApp = currentApp;
+          currentApp = app;
+          try {
+            return fn();
+          } finally {
+            currentApp = lastApp;
+          }
+        }
+      };
+      return app;
+    };
   }
+  let currentApp = null;
 
-  const warnRuntimeUsage = (method) => warn$1(
-    `${method}() is a compiler-hint helper that is only usable inside <script setup> of a single file component. Its arguments should be compiled away and passing it at runtime has no effect.`
-  );
-  function defineProps() {
-    {
-      warnRuntimeUsage(`defineProps`);
+  function provide(key, value) {
+    if (!currentInstance) {
+      {
+        warn$1(`provide() can only be used inside setup().`);
+      }
+    } else {
+      let provides = currentInstance.provides;
+      const parentProvides = currentInstance.parent && currentInstance.parent.provides;
+      if (parentProvides === provides) {
+        provides = currentInstance.provides = Object.create(parentProvides);
+      }
+      provides[key] = value;
     }
-    return null;
   }
-  function defineEmits() {
-    {
-      warnRuntimeUsage(`defineEmits`);
+  function inject(key, defaultValue, treatDefaultAsFactory = false) {
+    const instance = currentInstance || currentRenderingInstance;
+    if (instance || currentApp) {
+      const provides = currentApp ? currentApp._context.provides : instance ? instance.parent == null ? instance.vnode.appContext && instance.vnode.appContext.provides : instance.parent.provides : void 0;
+      if (provides && key in provides) {
+        return provides[key];
+      } else if (arguments.length > 1) {
+        return treatDefaultAsFactory && isFunction(defaultValue) ? defaultValue.call(instance && instance.proxy) : defaultValue;
+      } else {
+        warn$1(`injection "${String(key)}" not found.`);
+      }
+    } else {
+      warn$1(`inject() can only be used inside setup() or functional components.`);
     }
-    return null;
   }
-  function defineExpose(exposed) {
-    {
-      warnRuntimeUsage(`defineExpose`);
-    }
+  function hasInjectionContext() {
+    return !!(currentInstance || currentRenderingInstance || currentApp);
   }
-  function defineOptions(options) {
+
+  const internalObjectProto = {};
+  const createInternalObject = () => Object.create(internalObjectProto);
+  const isInternalObject = (obj) => Object.getPrototypeOf(obj) === internalObjectProto;
+
+  function initProps(instance, rawProps, isStateful, isSSR = false) {
+    const props = {};
+    const attrs = createInternalObject();
+    instance.propsDefaults = /* @__PURE__ */ Object.create(null);
+    setFullProps(instance, rawProps, props, attrs);
+    for (const key in instance.propsOptions[0]) {
+      if (!(key in props)) {
+        props[key] = void 0;
+      }
+    }
     {
-      warnRuntimeUsage(`defineOptions`);
+      validateProps(rawProps || {}, props, instance);
     }
-  }
-  function defineSlots() {
-    {
-      warnRuntimeUsage(`defineSlots`);
+    if (isStateful) {
+      instance.props = isSSR ? props : shallowReactive(props);
+    } else {
+      if (!instance.type.props) {
+        instance.props = attrs;
+      } else {
+        instance.props = props;
+      }
     }
-    return null;
+    instance.attrs = attrs;
   }
-  function defineModel() {
-    {
-      warnRuntimeUsage("defineModel");
+  function isInHmrContext(instance) {
+    while (instance) {
+      if (instance.type.__hmrId) return true;
+      instance = instance.parent;
     }
   }
-  function withDefaults(props, defaults) {
+  function updateProps(instance, rawProps, rawPrevProps, optimized) {
+    const {
+      props,
+      attrs,
+      vnode: { patchFlag }
+    } = instance;
+    const rawCurrentProps = toRaw(props);
+    const [options] = instance.propsOptions;
+    let hasAttrsChanged = false;
+    if (
+      // always force full diff in dev
+      // - #1942 if hmr is enabled with sfc component
+      // - vite#872 non-sfc component used by sfc component
+      !isInHmrContext(instance) && (optimized || patchFlag > 0) && !(patchFlag & 16)
+    ) {
+      if (patchFlag & 8) {
+        const propsToUpdate = instance.vnode.dynamicProps;
+        for (let i = 0; i < propsToUpdate.length; i++) {
+          let key = propsToUpdate[i];
+          if (isEmitListener(instance.emitsOptions, key)) {
+            continue;
+          }
+          const value = rawProps[key];
+          if (options) {
+            if (hasOwn(attrs, key)) {
+              if (value !== attrs[key]) {
+                attrs[key] = value;
+                hasAttrsChanged = true;
+              }
+            } else {
+              const camelizedKey = camelize(key);
+              props[camelizedKey] = resolvePropValue(
+                options,
+                rawCurrentProps,
+                camelizedKey,
+                value,
+                instance,
+                false
+              );
+            }
+          } else {
+            if (value !== attrs[key]) {
+              attrs[key] = value;
+              hasAttrsChanged = true;
+            }
+          }
+        }
+      }
+    } else {
+      if (setFullProps(instance, rawProps, props, attrs)) {
+        hasAttrsChanged = true;
+      }
+      let kebabKey;
+      for (const key in rawCurrentProps) {
+        if (!rawProps || // for camelCase
+        !hasOwn(rawProps, key) && // it's possible the original props was passed in as kebab-case
+        // and converted to camelCase (#955)
+        ((kebabKey = hyphenate(key)) === key || !hasOwn(rawProps, kebabKey))) {
+          if (options) {
+            if (rawPrevProps && // for camelCase
+            (rawPrevProps[key] !== void 0 || // for kebab-case
+            rawPrevProps[kebabKey] !== void 0)) {
+              props[key] = resolvePropValue(
+                options,
+                rawCurrentProps,
+                key,
+                void 0,
+                instance,
+                true
+              );
+            }
+          } else {
+            delete props[key];
+          }
+        }
+      }
+      if (attrs !== rawCurrentProps) {
+        for (const key in attrs) {
+          if (!rawProps || !hasOwn(rawProps, key) && true) {
+            delete attrs[key];
+            hasAttrsChanged = true;
+          }
+        }
+      }
+    }
+    if (hasAttrsChanged) {
+      trigger(instance.attrs, "set", "");
+    }
     {
-      warnRuntimeUsage(`withDefaults`);
+      validateProps(rawProps || {}, props, instance);
     }
-    return null;
-  }
-  function useSlots() {
-    return getContext().slots;
-  }
-  function useAttrs() {
-    return getContext().attrs;
   }
-  function getContext() {
-    const i = getCurrentInstance();
-    if (!i) {
-      warn$1(`useContext() called without active instance.`);
+  function setFullProps(instance, rawProps, props, attrs) {
+    const [options, needCastKeys] = instance.propsOptions;
+    let hasAttrsChanged = false;
+    let rawCastValues;
+    if (rawProps) {
+      for (let key in rawProps) {
+        if (isReservedProp(key)) {
+          continue;
+        }
+        const value = rawProps[key];
+        let camelKey;
+        if (options && hasOwn(options, camelKey = camelize(key))) {
+          if (!needCastKeys || !needCastKeys.includes(camelKey)) {
+            props[camelKey] = value;
+          } else {
+            (rawCastValues || (rawCastValues = {}))[camelKey] = value;
+          }
+        } else if (!isEmitListener(instance.emitsOptions, key)) {
+          if (!(key in attrs) || value !== attrs[key]) {
+            attrs[key] = value;
+            hasAttrsChanged = true;
+          }
+        }
+      }
     }
-    return i.setupContext || (i.setupContext = createSetupContext(i));
-  }
-  function normalizePropsOrEmits(props) {
-    return isArray(props) ? props.reduce(
-      (normalized, p) => (normalized[p] = null, normalized),
-      {}
-    ) : props;
+    if (needCastKeys) {
+      const rawCurrentProps = toRaw(props);
+      const castValues = rawCastValues || EMPTY_OBJ;
+      for (let i = 0; i < needCastKeys.length; i++) {
+        const key = needCastKeys[i];
+        props[key] = resolvePropValue(
+          options,
+          rawCurrentProps,
+          key,
+          castValues[key],
+          instance,
+          !hasOwn(castValues, key)
+        );
+      }
+    }
+    return hasAttrsChanged;
   }
-  function mergeDefaults(raw, defaults) {
-    const props = normalizePropsOrEmits(raw);
-    for (const key in defaults) {
-      if (key.startsWith("__skip"))
-        continue;
-      let opt = props[key];
-      if (opt) {
-        if (isArray(opt) || isFunction(opt)) {
-          opt = props[key] = { type: opt, default: defaults[key] };
+  function resolvePropValue(options, props, key, value, instance, isAbsent) {
+    const opt = options[key];
+    if (opt != null) {
+      const hasDefault = hasOwn(opt, "default");
+      if (hasDefault && value === void 0) {
+        const defaultValue = opt.default;
+        if (opt.type !== Function && !opt.skipFactory && isFunction(defaultValue)) {
+          const { propsDefaults } = instance;
+          if (key in propsDefaults) {
+            value = propsDefaults[key];
+          } else {
+            const reset = setCurrentInstance(instance);
+            value = propsDefaults[key] = defaultValue.call(
+              null,
+              props
+            );
+            reset();
+          }
         } else {
-          opt.default = defaults[key];
+          value = defaultValue;
         }
-      } else if (opt === null) {
-        opt = props[key] = { default: defaults[key] };
-      } else {
-        warn$1(`props default key "${key}" has no corresponding declaration.`);
       }
-      if (opt && defaults[`__skip_${key}`]) {
-        opt.skipFactory = true;
+      if (opt[0 /* shouldCast */]) {
+        if (isAbsent && !hasDefault) {
+          value = false;
+        } else if (opt[1 /* shouldCastTrue */] && (value === "" || value === hyphenate(key))) {
+          value = true;
+        }
       }
     }
-    return props;
-  }
-  function mergeModels(a, b) {
-    if (!a || !b)
-      return a || b;
-    if (isArray(a) && isArray(b))
-      return a.concat(b);
-    return extend({}, normalizePropsOrEmits(a), normalizePropsOrEmits(b));
+    return value;
   }
-  function createPropsRestProxy(props, excludedKeys) {
-    const ret = {};
-    for (const key in props) {
-      if (!excludedKeys.includes(key)) {
-        Object.defineProperty(ret, key, {
-          enumerable: true,
-          get: () => props[key]
-        });
-      }
+  const mixinPropsCache = /* @__PURE__ */ new WeakMap();
+  function normalizePropsOptions(comp, appContext, asMixin = false) {
+    const cache = asMixin ? mixinPropsCache : appContext.propsCache;
+    const cached = cache.get(comp);
+    if (cached) {
+      return cached;
     }
-    return ret;
-  }
-  function withAsyncContext(getAwaitable) {
-    const ctx = getCurrentInstance();
-    if (!ctx) {
-      warn$1(
-        `withAsyncContext called without active current instance. This is likely a bug.`
-      );
+    const raw = comp.props;
+    const normalized = {};
+    const needCastKeys = [];
+    let hasExtends = false;
+    if (!isFunction(comp)) {
+      const extendProps = (raw2) => {
+        hasExtends = true;
+        const [props, keys] = normalizePropsOptions(raw2, appContext, true);
+        extend(normalized, props);
+        if (keys) needCastKeys.push(...keys);
+      };
+      if (!asMixin && appContext.mixins.length) {
+        appContext.mixins.forEach(extendProps);
+      }
+      if (comp.extends) {
+        extendProps(comp.extends);
+      }
+      if (comp.mixins) {
+        comp.mixins.forEach(extendProps);
+      }
     }
-    let awaitable = getAwaitable();
-    unsetCurrentInstance();
-    if (isPromise(awaitable)) {
-      awaitable = awaitable.catch((e) => {
-        setCurrentInstance(ctx);
-        throw e;
-      });
-    }
-    return [awaitable, () => setCurrentInstance(ctx)];
-  }
-
-  function createDuplicateChecker() {
-    const cache = /* @__PURE__ */ Object.create(null);
-    return (type, key) => {
-      if (cache[key]) {
-        warn$1(`${type} property "${key}" is already defined in ${cache[key]}.`);
-      } else {
-        cache[key] = type;
+    if (!raw && !hasExtends) {
+      if (isObject(comp)) {
+        cache.set(comp, EMPTY_ARR);
       }
-    };
-  }
-  let shouldCacheAccess = true;
-  function applyOptions(instance) {
-    const options = resolveMergedOptions(instance);
-    const publicThis = instance.proxy;
-    const ctx = instance.ctx;
-    shouldCacheAccess = false;
-    if (options.beforeCreate) {
-      callHook$1(options.beforeCreate, instance, "bc");
+      return EMPTY_ARR;
     }
-    const {
-      // state
-      data: dataOptions,
-      computed: computedOptions,
-      methods,
-      watch: watchOptions,
-      provide: provideOptions,
-      inject: injectOptions,
-      // lifecycle
-      created,
-      beforeMount,
-      mounted,
-      beforeUpdate,
-      updated,
-      activated,
-      deactivated,
-      beforeDestroy,
-      beforeUnmount,
-      destroyed,
-      unmounted,
-      render,
-      renderTracked,
-      renderTriggered,
-      errorCaptured,
-      serverPrefetch,
-      // public API
-      expose,
-      inheritAttrs,
-      // assets
-      components,
-      directives,
-      filters
-    } = options;
-    const checkDuplicateProperties = createDuplicateChecker() ;
-    {
-      const [propsOptions] = instance.propsOptions;
-      if (propsOptions) {
-        for (const key in propsOptions) {
-          checkDuplicateProperties("Props" /* PROPS */, key);
+    if (isArray(raw)) {
+      for (let i = 0; i < raw.length; i++) {
+        if (!isString(raw[i])) {
+          warn$1(`props must be strings when using array syntax.`, raw[i]);
         }
-      }
-    }
-    if (injectOptions) {
-      resolveInjections(injectOptions, ctx, checkDuplicateProperties);
-    }
-    if (methods) {
-      for (const key in methods) {
-        const methodHandler = methods[key];
-        if (isFunction(methodHandler)) {
-          {
-            Object.defineProperty(ctx, key, {
-              value: methodHandler.bind(publicThis),
-              configurable: true,
-              enumerable: true,
-              writable: true
-            });
-          }
-          {
-            checkDuplicateProperties("Methods" /* METHODS */, key);
-          }
-        } else {
-          warn$1(
-            `Method "${key}" has type "${typeof methodHandler}" in the component definition. Did you reference the function correctly?`
-          );
+        const normalizedKey = camelize(raw[i]);
+        if (validatePropName(normalizedKey)) {
+          normalized[normalizedKey] = EMPTY_OBJ;
         }
       }
-    }
-    if (dataOptions) {
-      if (!isFunction(dataOptions)) {
-        warn$1(
-          `The data option must be a function. Plain object usage is no longer supported.`
-        );
-      }
-      const data = dataOptions.call(publicThis, publicThis);
-      if (isPromise(data)) {
-        warn$1(
-          `data() returned a Promise - note data() cannot be async; If you intend to perform data fetching before component renders, use async setup() + <Suspense>.`
-        );
+    } else if (raw) {
+      if (!isObject(raw)) {
+        warn$1(`invalid props options`, raw);
       }
-      if (!isObject(data)) {
-        warn$1(`data() should return an object.`);
-      } else {
-        instance.data = reactive(data);
-        {
-          for (const key in data) {
-            checkDuplicateProperties("Data" /* DATA */, key);
-            if (!isReservedPrefix(key[0])) {
-              Object.defineProperty(ctx, key, {
-                configurable: true,
-                enumerable: true,
-                get: () => data[key],
-                set: NOOP
-              });
+      for (const key in raw) {
+        const normalizedKey = camelize(key);
+        if (validatePropName(normalizedKey)) {
+          const opt = raw[key];
+          const prop = normalized[normalizedKey] = isArray(opt) || isFunction(opt) ? { type: opt } : extend({}, opt);
+          const propType = prop.type;
+          let shouldCast = false;
+          let shouldCastTrue = true;
+          if (isArray(propType)) {
+            for (let index = 0; index < propType.length; ++index) {
+              const type = propType[index];
+              const typeName = isFunction(type) && type.name;
+              if (typeName === "Boolean") {
+                shouldCast = true;
+                break;
+              } else if (typeName === "String") {
+                shouldCastTrue = false;
+              }
             }
+          } else {
+            shouldCast = isFunction(propType) && propType.name === "Boolean";
+          }
+          prop[0 /* shouldCast */] = shouldCast;
+          prop[1 /* shouldCastTrue */] = shouldCastTrue;
+          if (shouldCast || hasOwn(prop, "default")) {
+            needCastKeys.push(normalizedKey);
           }
         }
       }
     }
-    shouldCacheAccess = true;
-    if (computedOptions) {
-      for (const key in computedOptions) {
-        const opt = computedOptions[key];
-        const get = isFunction(opt) ? opt.bind(publicThis, publicThis) : isFunction(opt.get) ? opt.get.bind(publicThis, publicThis) : NOOP;
-        if (get === NOOP) {
-          warn$1(`Computed property "${key}" has no getter.`);
-        }
-        const set = !isFunction(opt) && isFunction(opt.set) ? opt.set.bind(publicThis) : () => {
-          warn$1(
-            `Write operation failed: computed property "${key}" is readonly.`
-          );
-        } ;
-        const c = computed({
-          get,
-          set
-        });
-        Object.defineProperty(ctx, key, {
-          enumerable: true,
-          configurable: true,
-          get: () => c.value,
-          set: (v) => c.value = v
-        });
-        {
-          checkDuplicateProperties("Computed" /* COMPUTED */, key);
-        }
-      }
-    }
-    if (watchOptions) {
-      for (const key in watchOptions) {
-        createWatcher(watchOptions[key], ctx, publicThis, key);
-      }
+    const res = [normalized, needCastKeys];
+    if (isObject(comp)) {
+      cache.set(comp, res);
     }
-    if (provideOptions) {
-      const provides = isFunction(provideOptions) ? provideOptions.call(publicThis) : provideOptions;
-      Reflect.ownKeys(provides).forEach((key) => {
-        provide(key, provides[key]);
-      });
+    return res;
+  }
+  function validatePropName(key) {
+    if (key[0] !== "$" && !isReservedProp(key)) {
+      return true;
+    } else {
+      warn$1(`Invalid prop name: "${key}" is a reserved property.`);
     }
-    if (created) {
-      callHook$1(created, instance, "c");
+    return false;
+  }
+  function getType(ctor) {
+    if (ctor === null) {
+      return "null";
     }
-    function registerLifecycleHook(register, hook) {
-      if (isArray(hook)) {
-        hook.forEach((_hook) => register(_hook.bind(publicThis)));
-      } else if (hook) {
-        register(hook.bind(publicThis));
-      }
+    if (typeof ctor === "function") {
+      return ctor.name || "";
+    } else if (typeof ctor === "object") {
+      const name = ctor.constructor && ctor.constructor.name;
+      return name || "";
     }
-    registerLifecycleHook(onBeforeMount, beforeMount);
-    registerLifecycleHook(onMounted, mounted);
-    registerLifecycleHook(onBeforeUpdate, beforeUpdate);
-    registerLifecycleHook(onUpdated, updated);
-    registerLifecycleHook(onActivated, activated);
-    registerLifecycleHook(onDeactivated, deactivated);
-    registerLifecycleHook(onErrorCaptured, errorCaptured);
-    registerLifecycleHook(onRenderTracked, renderTracked);
-    registerLifecycleHook(onRenderTriggered, renderTriggered);
-    registerLifecycleHook(onBeforeUnmount, beforeUnmount);
-    registerLifecycleHook(onUnmounted, unmounted);
-    registerLifecycleHook(onServerPrefetch, serverPrefetch);
-    if (isArray(expose)) {
-      if (expose.length) {
-        const exposed = instance.exposed || (instance.exposed = {});
-        expose.forEach((key) => {
-          Object.defineProperty(exposed, key, {
-            get: () => publicThis[key],
-            set: (val) => publicThis[key] = val
-          });
-        });
-      } else if (!instance.exposed) {
-        instance.exposed = {};
-      }
+    return "";
+  }
+  function validateProps(rawProps, props, instance) {
+    const resolvedValues = toRaw(props);
+    const options = instance.propsOptions[0];
+    for (const key in options) {
+      let opt = options[key];
+      if (opt == null) continue;
+      validateProp(
+        key,
+        resolvedValues[key],
+        opt,
+        shallowReadonly(resolvedValues) ,
+        !hasOwn(rawProps, key) && !hasOwn(rawProps, hyphenate(key))
+      );
     }
-    if (render && instance.render === NOOP) {
-      instance.render = render;
+  }
+  function validateProp(name, value, prop, props, isAbsent) {
+    const { type, required, validator, skipCheck } = prop;
+    if (required && isAbsent) {
+      warn$1('Missing required prop: "' + name + '"');
+      return;
     }
-    if (inheritAttrs != null) {
-      instance.inheritAttrs = inheritAttrs;
+    if (value == null && !required) {
+      return;
     }
-    if (components)
-      instance.components = components;
-    if (directives)
-      instance.directives = directives;
-  }
-  function resolveInjections(injectOptions, ctx, checkDuplicateProperties = NOOP) {
-    if (isArray(injectOptions)) {
-      injectOptions = normalizeInject(injectOptions);
-    }
-    for (const key in injectOptions) {
-      const opt = injectOptions[key];
-      let injected;
-      if (isObject(opt)) {
-        if ("default" in opt) {
-          injected = inject(
-            opt.from || key,
-            opt.default,
-            true
-          );
-        } else {
-          injected = inject(opt.from || key);
-        }
-      } else {
-        injected = inject(opt);
-      }
-      if (isRef(injected)) {
-        Object.defineProperty(ctx, key, {
-          enumerable: true,
-          configurable: true,
-          get: () => injected.value,
-          set: (v) => injected.value = v
-        });
-      } else {
-        ctx[key] = injected;
+    if (type != null && type !== true && !skipCheck) {
+      let isValid = false;
+      const types = isArray(type) ? type : [type];
+      const expectedTypes = [];
+      for (let i = 0; i < types.length && !isValid; i++) {
+        const { valid, expectedType } = assertType(value, types[i]);
+        expectedTypes.push(expectedType || "");
+        isValid = valid;
       }
-      {
-        checkDuplicateProperties("Inject" /* INJECT */, key);
+      if (!isValid) {
+        warn$1(getInvalidTypeMessage(name, value, expectedTypes));
+        return;
       }
     }
+    if (validator && !validator(value, props)) {
+      warn$1('Invalid prop: custom validator check failed for prop "' + name + '".');
+    }
   }
-  function callHook$1(hook, instance, type) {
-    callWithAsyncErrorHandling(
-      isArray(hook) ? hook.map((h) => h.bind(instance.proxy)) : hook.bind(instance.proxy),
-      instance,
-      type
-    );
-  }
-  function createWatcher(raw, ctx, publicThis, key) {
-    const getter = key.includes(".") ? createPathGetter(publicThis, key) : () => publicThis[key];
-    if (isString(raw)) {
-      const handler = ctx[raw];
-      if (isFunction(handler)) {
-        watch(getter, handler);
-      } else {
-        warn$1(`Invalid watch handler specified by key "${raw}"`, handler);
-      }
-    } else if (isFunction(raw)) {
-      watch(getter, raw.bind(publicThis));
-    } else if (isObject(raw)) {
-      if (isArray(raw)) {
-        raw.forEach((r) => createWatcher(r, ctx, publicThis, key));
-      } else {
-        const handler = isFunction(raw.handler) ? raw.handler.bind(publicThis) : ctx[raw.handler];
-        if (isFunction(handler)) {
-          watch(getter, handler, raw);
-        } else {
-          warn$1(`Invalid watch handler specified by key "${raw.handler}"`, handler);
-        }
+  const isSimpleType = /* @__PURE__ */ makeMap(
+    "String,Number,Boolean,Function,Symbol,BigInt"
+  );
+  function assertType(value, type) {
+    let valid;
+    const expectedType = getType(type);
+    if (isSimpleType(expectedType)) {
+      const t = typeof value;
+      valid = t === expectedType.toLowerCase();
+      if (!valid && t === "object") {
+        valid = value instanceof type;
       }
+    } else if (expectedType === "Object") {
+      valid = isObject(value);
+    } else if (expectedType === "Array") {
+      valid = isArray(value);
+    } else if (expectedType === "null") {
+      valid = value === null;
     } else {
-      warn$1(`Invalid watch option: "${key}"`, raw);
+      valid = value instanceof type;
     }
+    return {
+      valid,
+      expectedType
+    };
   }
-  function resolveMergedOptions(instance) {
-    const base = instance.type;
-    const { mixins, extends: extendsOptions } = base;
-    const {
-      mixins: globalMixins,
-      optionsCache: cache,
-      config: { optionMergeStrategies }
-    } = instance.appContext;
-    const cached = cache.get(base);
-    let resolved;
-    if (cached) {
-      resolved = cached;
-    } else if (!globalMixins.length && !mixins && !extendsOptions) {
-      {
-        resolved = base;
-      }
-    } else {
-      resolved = {};
-      if (globalMixins.length) {
-        globalMixins.forEach(
-          (m) => mergeOptions(resolved, m, optionMergeStrategies, true)
-        );
-      }
-      mergeOptions(resolved, base, optionMergeStrategies);
+  function getInvalidTypeMessage(name, value, expectedTypes) {
+    if (expectedTypes.length === 0) {
+      return `Prop type [] for prop "${name}" won't match anything. Did you mean to use type Array instead?`;
     }
-    if (isObject(base)) {
-      cache.set(base, resolved);
+    let message = `Invalid prop: type check failed for prop "${name}". Expected ${expectedTypes.map(capitalize).join(" | ")}`;
+    const expectedType = expectedTypes[0];
+    const receivedType = toRawType(value);
+    const expectedValue = styleValue(value, expectedType);
+    const receivedValue = styleValue(value, receivedType);
+    if (expectedTypes.length === 1 && isExplicable(expectedType) && !isBoolean(expectedType, receivedType)) {
+      message += ` with value ${expectedValue}`;
     }
-    return resolved;
+    message += `, got ${receivedType} `;
+    if (isExplicable(receivedType)) {
+      message += `with value ${receivedValue}.`;
+    }
+    return message;
   }
-  function mergeOptions(to, from, strats, asMixin = false) {
-    const { mixins, extends: extendsOptions } = from;
-    if (extendsOptions) {
-      mergeOptions(to, extendsOptions, strats, true);
+  function styleValue(value, type) {
+    if (type === "String") {
+      return `"${value}"`;
+    } else if (type === "Number") {
+      return `${Number(value)}`;
+    } else {
+      return `${value}`;
     }
-    if (mixins) {
-      mixins.forEach(
-        (m) => mergeOptions(to, m, strats, true)
-      );
+  }
+  function isExplicable(type) {
+    const explicitTypes = ["string", "number", "boolean"];
+    return explicitTypes.some((elem) => type.toLowerCase() === elem);
+  }
+  function isBoolean(...args) {
+    return args.some((elem) => elem.toLowerCase() === "boolean");
+  }
+
+  const isInternalKey = (key) => key[0] === "_" || key === "$stable";
+  const normalizeSlotValue = (value) => isArray(value) ? value.map(normalizeVNode) : [normalizeVNode(value)];
+  const normalizeSlot = (key, rawSlot, ctx) => {
+    if (rawSlot._n) {
+      return rawSlot;
     }
-    for (const key in from) {
-      if (asMixin && key === "expose") {
+    const normalized = withCtx((...args) => {
+      if (currentInstance && (!ctx || ctx.root === currentInstance.root)) {
         warn$1(
-          `"expose" option is ignored when declared in mixins or extends. It should only be declared in the base component itself.`
+          `Slot "${key}" invoked outside of the render function: this will not track dependencies used in the slot. Invoke the slot function inside the render function instead.`
         );
-      } else {
-        const strat = internalOptionMergeStrats[key] || strats && strats[key];
-        to[key] = strat ? strat(to[key], from[key]) : from[key];
       }
-    }
-    return to;
-  }
-  const internalOptionMergeStrats = {
-    data: mergeDataFn,
-    props: mergeEmitsOrPropsOptions,
-    emits: mergeEmitsOrPropsOptions,
-    // objects
-    methods: mergeObjectOptions,
-    computed: mergeObjectOptions,
-    // lifecycle
-    beforeCreate: mergeAsArray$1,
-    created: mergeAsArray$1,
-    beforeMount: mergeAsArray$1,
-    mounted: mergeAsArray$1,
-    beforeUpdate: mergeAsArray$1,
-    updated: mergeAsArray$1,
-    beforeDestroy: mergeAsArray$1,
-    beforeUnmount: mergeAsArray$1,
-    destroyed: mergeAsArray$1,
-    unmounted: mergeAsArray$1,
-    activated: mergeAsArray$1,
-    deactivated: mergeAsArray$1,
-    errorCaptured: mergeAsArray$1,
-    serverPrefetch: mergeAsArray$1,
-    // assets
-    components: mergeObjectOptions,
-    directives: mergeObjectOptions,
-    // watch
-    watch: mergeWatchOptions,
-    // provide / inject
-    provide: mergeDataFn,
-    inject: mergeInject
+      return normalizeSlotValue(rawSlot(...args));
+    }, ctx);
+    normalized._c = false;
+    return normalized;
   };
-  function mergeDataFn(to, from) {
-    if (!from) {
-      return to;
-    }
-    if (!to) {
-      return from;
+  const normalizeObjectSlots = (rawSlots, slots, instance) => {
+    const ctx = rawSlots._ctx;
+    for (const key in rawSlots) {
+      if (isInternalKey(key)) continue;
+      const value = rawSlots[key];
+      if (isFunction(value)) {
+        slots[key] = normalizeSlot(key, value, ctx);
+      } else if (value != null) {
+        {
+          warn$1(
+            `Non-function value encountered for slot "${key}". Prefer function slots for better performance.`
+          );
+        }
+        const normalized = normalizeSlotValue(value);
+        slots[key] = () => normalized;
+      }
     }
-    return function mergedDataFn() {
-      return (extend)(
-        isFunction(to) ? to.call(this, this) : to,
-        isFunction(from) ? from.call(this, this) : from
+  };
+  const normalizeVNodeSlots = (instance, children) => {
+    if (!isKeepAlive(instance.vnode) && true) {
+      warn$1(
+        `Non-function value encountered for default slot. Prefer function slots for better performance.`
       );
-    };
-  }
-  function mergeInject(to, from) {
-    return mergeObjectOptions(normalizeInject(to), normalizeInject(from));
-  }
-  function normalizeInject(raw) {
-    if (isArray(raw)) {
-      const res = {};
-      for (let i = 0; i < raw.length; i++) {
-        res[raw[i]] = raw[i];
-      }
-      return res;
     }
-    return raw;
-  }
-  function mergeAsArray$1(to, from) {
-    return to ? [...new Set([].concat(to, from))] : from;
-  }
-  function mergeObjectOptions(to, from) {
-    return to ? extend(/* @__PURE__ */ Object.create(null), to, from) : from;
-  }
-  function mergeEmitsOrPropsOptions(to, from) {
-    if (to) {
-      if (isArray(to) && isArray(from)) {
-        return [.../* @__PURE__ */ new Set([...to, ...from])];
+    const normalized = normalizeSlotValue(children);
+    instance.slots.default = () => normalized;
+  };
+  const assignSlots = (slots, children, optimized) => {
+    for (const key in children) {
+      if (optimized || key !== "_") {
+        slots[key] = children[key];
       }
-      return extend(
-        /* @__PURE__ */ Object.create(null),
-        normalizePropsOrEmits(to),
-        normalizePropsOrEmits(from != null ? from : {})
+    }
+  };
+  const initSlots = (instance, children, optimized) => {
+    const slots = instance.slots = createInternalObject();
+    if (instance.vnode.shapeFlag & 32) {
+      const type = children._;
+      if (type) {
+        assignSlots(slots, children, optimized);
+        if (optimized) {
+          def(slots, "_", type, true);
+        }
+      } else {
+        normalizeObjectSlots(children, slots);
+      }
+    } else if (children) {
+      normalizeVNodeSlots(instance, children);
+    }
+  };
+  const updateSlots = (instance, children, optimized) => {
+    const { vnode, slots } = instance;
+    let needDeletionCheck = true;
+    let deletionComparisonTarget = EMPTY_OBJ;
+    if (vnode.shapeFlag & 32) {
+      const type = children._;
+      if (type) {
+        if (isHmrUpdating) {
+          assignSlots(slots, children, optimized);
+          trigger(instance, "set", "$slots");
+        } else if (optimized && type === 1) {
+          needDeletionCheck = false;
+        } else {
+          assignSlots(slots, children, optimized);
+        }
+      } else {
+        needDeletionCheck = !children.$stable;
+        normalizeObjectSlots(children, slots);
+      }
+      deletionComparisonTarget = children;
+    } else if (children) {
+      normalizeVNodeSlots(instance, children);
+      deletionComparisonTarget = { default: 1 };
+    }
+    if (needDeletionCheck) {
+      for (const key in slots) {
+        if (!isInternalKey(key) && deletionComparisonTarget[key] == null) {
+          delete slots[key];
+        }
+      }
+    }
+  };
+
+  function setRef(rawRef, oldRawRef, parentSuspense, vnode, isUnmount = false) {
+    if (isArray(rawRef)) {
+      rawRef.forEach(
+        (r, i) => setRef(
+          r,
+          oldRawRef && (isArray(oldRawRef) ? oldRawRef[i] : oldRawRef),
+          parentSuspense,
+          vnode,
+          isUnmount
+        )
       );
-    } else {
-      return from;
+      return;
     }
-  }
-  function mergeWatchOptions(to, from) {
-    if (!to)
-      return from;
-    if (!from)
-      return to;
-    const merged = extend(/* @__PURE__ */ Object.create(null), to);
-    for (const key in from) {
-      merged[key] = mergeAsArray$1(to[key], from[key]);
+    if (isAsyncWrapper(vnode) && !isUnmount) {
+      return;
+    }
+    const refValue = vnode.shapeFlag & 4 ? getComponentPublicInstance(vnode.component) : vnode.el;
+    const value = isUnmount ? null : refValue;
+    const { i: owner, r: ref } = rawRef;
+    if (!owner) {
+      warn$1(
+        `Missing ref owner context. ref cannot be used on hoisted vnodes. A vnode with ref must be created inside the render function.`
+      );
+      return;
+    }
+    const oldRef = oldRawRef && oldRawRef.r;
+    const refs = owner.refs === EMPTY_OBJ ? owner.refs = {} : owner.refs;
+    const setupState = owner.setupState;
+    if (oldRef != null && oldRef !== ref) {
+      if (isString(oldRef)) {
+        refs[oldRef] = null;
+        if (hasOwn(setupState, oldRef)) {
+          setupState[oldRef] = null;
+        }
+      } else if (isRef(oldRef)) {
+        oldRef.value = null;
+      }
+    }
+    if (isFunction(ref)) {
+      callWithErrorHandling(ref, owner, 12, [value, refs]);
+    } else {
+      const _isString = isString(ref);
+      const _isRef = isRef(ref);
+      if (_isString || _isRef) {
+        const doSet = () => {
+          if (rawRef.f) {
+            const existing = _isString ? hasOwn(setupState, ref) ? setupState[ref] : refs[ref] : ref.value;
+            if (isUnmount) {
+              isArray(existing) && remove(existing, refValue);
+            } else {
+              if (!isArray(existing)) {
+                if (_isString) {
+                  refs[ref] = [refValue];
+                  if (hasOwn(setupState, ref)) {
+                    setupState[ref] = refs[ref];
+                  }
+                } else {
+                  ref.value = [refValue];
+                  if (rawRef.k) refs[rawRef.k] = ref.value;
+                }
+              } else if (!existing.includes(refValue)) {
+                existing.push(refValue);
+              }
+            }
+          } else if (_isString) {
+            refs[ref] = value;
+            if (hasOwn(setupState, ref)) {
+              setupState[ref] = value;
+            }
+          } else if (_isRef) {
+            ref.value = value;
+            if (rawRef.k) refs[rawRef.k] = value;
+          } else {
+            warn$1("Invalid template ref type:", ref, `(${typeof ref})`);
+          }
+        };
+        if (value) {
+          doSet.id = -1;
+          queuePostRenderEffect(doSet, parentSuspense);
+        } else {
+          doSet();
+        }
+      } else {
+        warn$1("Invalid template ref type:", ref, `(${typeof ref})`);
+      }
     }
-    return merged;
   }
 
-  function createAppContext() {
-    return {
-      app: null,
-      config: {
-        isNativeTag: NO,
-        performance: false,
-        globalProperties: {},
-        optionMergeStrategies: {},
-        errorHandler: void 0,
-        warnHandler: void 0,
-        compilerOptions: {}
-      },
-      mixins: [],
-      components: {},
-      directives: {},
-      provides: /* @__PURE__ */ Object.create(null),
-      optionsCache: /* @__PURE__ */ new WeakMap(),
-      propsCache: /* @__PURE__ */ new WeakMap(),
-      emitsCache: /* @__PURE__ */ new WeakMap()
-    };
-  }
-  let uid$1 = 0;
-  function createAppAPI(render, hydrate) {
-    return function createApp(rootComponent, rootProps = null) {
-      if (!isFunction(rootComponent)) {
-        rootComponent = extend({}, rootComponent);
+  const TeleportEndKey = Symbol("_vte");
+  const isTeleport = (type) => type.__isTeleport;
+  const isTeleportDisabled = (props) => props && (props.disabled || props.disabled === "");
+  const isTargetSVG = (target) => typeof SVGElement !== "undefined" && target instanceof SVGElement;
+  const isTargetMathML = (target) => typeof MathMLElement === "function" && target instanceof MathMLElement;
+  const resolveTarget = (props, select) => {
+    const targetSelector = props && props.to;
+    if (isString(targetSelector)) {
+      if (!select) {
+        warn$1(
+          `Current renderer does not support string target for Teleports. (missing querySelector renderer option)`
+        );
+        return null;
+      } else {
+        const target = select(targetSelector);
+        if (!target && !isTeleportDisabled(props)) {
+          warn$1(
+            `Failed to locate Teleport target with selector "${targetSelector}". Note the target element must exist before the component is mounted - i.e. the target cannot be rendered by the component itself, and ideally should be outside of the entire Vue component tree.`
+          );
+        }
+        return target;
       }
-      if (rootProps != null && !isObject(rootProps)) {
-        warn$1(`root props passed to app.mount() must be an object.`);
-        rootProps = null;
+    } else {
+      if (!targetSelector && !isTeleportDisabled(props)) {
+        warn$1(`Invalid Teleport target: ${targetSelector}`);
       }
-      const context = createAppContext();
-      const installedPlugins = /* @__PURE__ */ new WeakSet();
-      let isMounted = false;
-      const app = context.app = {
-        _uid: uid$1++,
-        _component: rootComponent,
-        _props: rootProps,
-        _container: null,
-        _context: context,
-        _instance: null,
-        version,
-        get config() {
-          return context.config;
-        },
-        set config(v) {
-          {
-            warn$1(
-              `app.config cannot be replaced. Modify individual options instead.`
-            );
+      return targetSelector;
+    }
+  };
+  const TeleportImpl = {
+    name: "Teleport",
+    __isTeleport: true,
+    process(n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized, internals) {
+      const {
+        mc: mountChildren,
+        pc: patchChildren,
+        pbc: patchBlockChildren,
+        o: { insert, querySelector, createText, createComment }
+      } = internals;
+      const disabled = isTeleportDisabled(n2.props);
+      let { shapeFlag, children, dynamicChildren } = n2;
+      if (isHmrUpdating) {
+        optimized = false;
+        dynamicChildren = null;
+      }
+      if (n1 == null) {
+        const placeholder = n2.el = createComment("teleport start") ;
+        const mainAnchor = n2.anchor = createComment("teleport end") ;
+        insert(placeholder, container, anchor);
+        insert(mainAnchor, container, anchor);
+        const target = n2.target = resolveTarget(n2.props, querySelector);
+        const targetAnchor = prepareAnchor(target, n2, createText, insert);
+        if (target) {
+          if (namespace === "svg" || isTargetSVG(target)) {
+            namespace = "svg";
+          } else if (namespace === "mathml" || isTargetMathML(target)) {
+            namespace = "mathml";
           }
-        },
-        use(plugin, ...options) {
-          if (installedPlugins.has(plugin)) {
-            warn$1(`Plugin has already been applied to target app.`);
-          } else if (plugin && isFunction(plugin.install)) {
-            installedPlugins.add(plugin);
-            plugin.install(app, ...options);
-          } else if (isFunction(plugin)) {
-            installedPlugins.add(plugin);
-            plugin(app, ...options);
-          } else {
-            warn$1(
-              `A plugin must either be a function or an object with an "install" function.`
+        } else if (!disabled) {
+          warn$1("Invalid Teleport target on mount:", target, `(${typeof target})`);
+        }
+        const mount = (container2, anchor2) => {
+          if (shapeFlag & 16) {
+            mountChildren(
+              children,
+              container2,
+              anchor2,
+              parentComponent,
+              parentSuspense,
+              namespace,
+              slotScopeIds,
+              optimized
             );
           }
-          return app;
-        },
-        mixin(mixin) {
-          {
-            if (!context.mixins.includes(mixin)) {
-              context.mixins.push(mixin);
-            } else {
-              warn$1(
-                "Mixin has already been applied to target app" + (mixin.name ? `: ${mixin.name}` : "")
-              );
+        };
+        if (disabled) {
+          mount(container, mainAnchor);
+        } else if (target) {
+          mount(target, targetAnchor);
+        }
+      } else {
+        n2.el = n1.el;
+        n2.targetStart = n1.targetStart;
+        const mainAnchor = n2.anchor = n1.anchor;
+        const target = n2.target = n1.target;
+        const targetAnchor = n2.targetAnchor = n1.targetAnchor;
+        const wasDisabled = isTeleportDisabled(n1.props);
+        const currentContainer = wasDisabled ? container : target;
+        const currentAnchor = wasDisabled ? mainAnchor : targetAnchor;
+        if (namespace === "svg" || isTargetSVG(target)) {
+          namespace = "svg";
+        } else if (namespace === "mathml" || isTargetMathML(target)) {
+          namespace = "mathml";
+        }
+        if (dynamicChildren) {
+          patchBlockChildren(
+            n1.dynamicChildren,
+            dynamicChildren,
+            currentContainer,
+            parentComponent,
+            parentSuspense,
+            namespace,
+            slotScopeIds
+          );
+          traverseStaticChildren(n1, n2, true);
+        } else if (!optimized) {
+          patchChildren(
+            n1,
+            n2,
+            currentContainer,
+            currentAnchor,
+            parentComponent,
+            parentSuspense,
+            namespace,
+            slotScopeIds,
+            false
+          );
+        }
+        if (disabled) {
+          if (!wasDisabled) {
+            moveTeleport(
+              n2,
+              container,
+              mainAnchor,
+              internals,
+              1
+            );
+          } else {
+            if (n2.props && n1.props && n2.props.to !== n1.props.to) {
+              n2.props.to = n1.props.to;
             }
           }
-          return app;
-        },
-        component(name, component) {
-          {
-            validateComponentName(name, context.config);
-          }
-          if (!component) {
-            return context.components[name];
-          }
-          if (context.components[name]) {
-            warn$1(`Component "${name}" has already been registered in target app.`);
-          }
-          context.components[name] = component;
-          return app;
-        },
-        directive(name, directive) {
-          {
-            validateDirectiveName(name);
-          }
-          if (!directive) {
-            return context.directives[name];
-          }
-          if (context.directives[name]) {
-            warn$1(`Directive "${name}" has already been registered in target app.`);
-          }
-          context.directives[name] = directive;
-          return app;
-        },
-        mount(rootContainer, isHydrate, namespace) {
-          if (!isMounted) {
-            if (rootContainer.__vue_app__) {
-              warn$1(
-                `There is already an app instance mounted on the host container.
- If you want to mount another app on the same host container, you need to unmount the previous app by calling \`app.unmount()\` first.`
+        } else {
+          if ((n2.props && n2.props.to) !== (n1.props && n1.props.to)) {
+            const nextTarget = n2.target = resolveTarget(
+              n2.props,
+              querySelector
+            );
+            if (nextTarget) {
+              moveTeleport(
+                n2,
+                nextTarget,
+                null,
+                internals,
+                0
               );
-            }
-            const vnode = createVNode(rootComponent, rootProps);
-            vnode.appContext = context;
-            if (namespace === true) {
-              namespace = "svg";
-            } else if (namespace === false) {
-              namespace = void 0;
-            }
-            {
-              context.reload = () => {
-                render(
-                  cloneVNode(vnode),
-                  rootContainer,
-                  namespace
-                );
-              };
-            }
-            if (isHydrate && hydrate) {
-              hydrate(vnode, rootContainer);
             } else {
-              render(vnode, rootContainer, namespace);
-            }
-            isMounted = true;
-            app._container = rootContainer;
-            rootContainer.__vue_app__ = app;
-            {
-              app._instance = vnode.component;
-              devtoolsInitApp(app, version);
-            }
-            return getExposeProxy(vnode.component) || vnode.component.proxy;
-          } else {
-            warn$1(
-              `App has already been mounted.
-If you want to remount the same app, move your app creation logic into a factory function and create fresh app instances for each mount - e.g. \`const createMyApp = () => createApp(App)\``
-            );
-          }
-        },
-        unmount() {
-          if (isMounted) {
-            render(null, app._container);
-            {
-              app._instance = null;
-              devtoolsUnmountApp(app);
+              warn$1(
+                "Invalid Teleport target on update:",
+                target,
+                `(${typeof target})`
+              );
             }
-            delete app._container.__vue_app__;
-          } else {
-            warn$1(`Cannot unmount an app that is not mounted.`);
-          }
-        },
-        provide(key, value) {
-          if (key in context.provides) {
-            warn$1(
-              `App already provides property with key "${String(key)}". It will be overwritten with the new value.`
+          } else if (wasDisabled) {
+            moveTeleport(
+              n2,
+              target,
+              targetAnchor,
+              internals,
+              1
             );
           }
-          context.provides[key] = value;
-          return app;
-        },
-        runWithContext(fn) {
-          const lastApp = currentApp;
-          currentApp = app;
-          try {
-            return fn();
-          } finally {
-            currentApp = lastApp;
-          }
         }
-      };
-      return app;
-    };
-  }
-  let currentApp = null;
-
-  function provide(key, value) {
-    if (!currentInstance) {
-      {
-        warn$1(`provide() can only be used inside setup().`);
-      }
-    } else {
-      let provides = currentInstance.provides;
-      const parentProvides = currentInstance.parent && currentInstance.parent.provides;
-      if (parentProvides === provides) {
-        provides = currentInstance.provides = Object.create(parentProvides);
       }
-      provides[key] = value;
-    }
-  }
-  function inject(key, defaultValue, treatDefaultAsFactory = false) {
-    const instance = currentInstance || currentRenderingInstance;
-    if (instance || currentApp) {
-      const provides = instance ? instance.parent == null ? instance.vnode.appContext && instance.vnode.appContext.provides : instance.parent.provides : currentApp._context.provides;
-      if (provides && key in provides) {
-        return provides[key];
-      } else if (arguments.length > 1) {
-        return treatDefaultAsFactory && isFunction(defaultValue) ? defaultValue.call(instance && instance.proxy) : defaultValue;
-      } else {
-        warn$1(`injection "${String(key)}" not found.`);
+      updateCssVars(n2);
+    },
+    remove(vnode, parentComponent, parentSuspense, { um: unmount, o: { remove: hostRemove } }, doRemove) {
+      const {
+        shapeFlag,
+        children,
+        anchor,
+        targetStart,
+        targetAnchor,
+        target,
+        props
+      } = vnode;
+      if (target) {
+        hostRemove(targetStart);
+        hostRemove(targetAnchor);
       }
-    } else {
-      warn$1(`inject() can only be used inside setup() or functional components.`);
-    }
-  }
-  function hasInjectionContext() {
-    return !!(currentInstance || currentRenderingInstance || currentApp);
-  }
-
-  const internalObjectProto = {};
-  const createInternalObject = () => Object.create(internalObjectProto);
-  const isInternalObject = (obj) => Object.getPrototypeOf(obj) === internalObjectProto;
-
-  function initProps(instance, rawProps, isStateful, isSSR = false) {
-    const props = {};
-    const attrs = createInternalObject();
-    instance.propsDefaults = /* @__PURE__ */ Object.create(null);
-    setFullProps(instance, rawProps, props, attrs);
-    for (const key in instance.propsOptions[0]) {
-      if (!(key in props)) {
-        props[key] = void 0;
+      doRemove && hostRemove(anchor);
+      if (shapeFlag & 16) {
+        const shouldRemove = doRemove || !isTeleportDisabled(props);
+        for (let i = 0; i < children.length; i++) {
+          const child = children[i];
+          unmount(
+            child,
+            parentComponent,
+            parentSuspense,
+            shouldRemove,
+            !!child.dynamicChildren
+          );
+        }
       }
+    },
+    move: moveTeleport,
+    hydrate: hydrateTeleport
+  };
+  function moveTeleport(vnode, container, parentAnchor, { o: { insert }, m: move }, moveType = 2) {
+    if (moveType === 0) {
+      insert(vnode.targetAnchor, container, parentAnchor);
     }
-    {
-      validateProps(rawProps || {}, props, instance);
+    const { el, anchor, shapeFlag, children, props } = vnode;
+    const isReorder = moveType === 2;
+    if (isReorder) {
+      insert(el, container, parentAnchor);
     }
-    if (isStateful) {
-      instance.props = isSSR ? props : shallowReactive(props);
-    } else {
-      if (!instance.type.props) {
-        instance.props = attrs;
-      } else {
-        instance.props = props;
+    if (!isReorder || isTeleportDisabled(props)) {
+      if (shapeFlag & 16) {
+        for (let i = 0; i < children.length; i++) {
+          move(
+            children[i],
+            container,
+            parentAnchor,
+            2
+          );
+        }
       }
     }
-    instance.attrs = attrs;
-  }
-  function isInHmrContext(instance) {
-    while (instance) {
-      if (instance.type.__hmrId)
-        return true;
-      instance = instance.parent;
+    if (isReorder) {
+      insert(anchor, container, parentAnchor);
     }
   }
-  function updateProps(instance, rawProps, rawPrevProps, optimized) {
-    const {
-      props,
-      attrs,
-      vnode: { patchFlag }
-    } = instance;
-    const rawCurrentProps = toRaw(props);
-    const [options] = instance.propsOptions;
-    let hasAttrsChanged = false;
-    if (
-      // always force full diff in dev
-      // - #1942 if hmr is enabled with sfc component
-      // - vite#872 non-sfc component used by sfc component
-      !isInHmrContext(instance) && (optimized || patchFlag > 0) && !(patchFlag & 16)
-    ) {
-      if (patchFlag & 8) {
-        const propsToUpdate = instance.vnode.dynamicProps;
-        for (let i = 0; i < propsToUpdate.length; i++) {
-          let key = propsToUpdate[i];
-          if (isEmitListener(instance.emitsOptions, key)) {
-            continue;
-          }
-          const value = rawProps[key];
-          if (options) {
-            if (hasOwn(attrs, key)) {
-              if (value !== attrs[key]) {
-                attrs[key] = value;
-                hasAttrsChanged = true;
+  function hydrateTeleport(node, vnode, parentComponent, parentSuspense, slotScopeIds, optimized, {
+    o: { nextSibling, parentNode, querySelector, insert, createText }
+  }, hydrateChildren) {
+    const target = vnode.target = resolveTarget(
+      vnode.props,
+      querySelector
+    );
+    if (target) {
+      const targetNode = target._lpa || target.firstChild;
+      if (vnode.shapeFlag & 16) {
+        if (isTeleportDisabled(vnode.props)) {
+          vnode.anchor = hydrateChildren(
+            nextSibling(node),
+            vnode,
+            parentNode(node),
+            parentComponent,
+            parentSuspense,
+            slotScopeIds,
+            optimized
+          );
+          vnode.targetStart = targetNode;
+          vnode.targetAnchor = targetNode && nextSibling(targetNode);
+        } else {
+          vnode.anchor = nextSibling(node);
+          let targetAnchor = targetNode;
+          while (targetAnchor) {
+            if (targetAnchor && targetAnchor.nodeType === 8) {
+              if (targetAnchor.data === "teleport start anchor") {
+                vnode.targetStart = targetAnchor;
+              } else if (targetAnchor.data === "teleport anchor") {
+                vnode.targetAnchor = targetAnchor;
+                target._lpa = vnode.targetAnchor && nextSibling(vnode.targetAnchor);
+                break;
               }
-            } else {
-              const camelizedKey = camelize(key);
-              props[camelizedKey] = resolvePropValue(
-                options,
-                rawCurrentProps,
-                camelizedKey,
-                value,
-                instance,
-                false
-              );
-            }
-          } else {
-            if (value !== attrs[key]) {
-              attrs[key] = value;
-              hasAttrsChanged = true;
-            }
-          }
-        }
-      }
-    } else {
-      if (setFullProps(instance, rawProps, props, attrs)) {
-        hasAttrsChanged = true;
-      }
-      let kebabKey;
-      for (const key in rawCurrentProps) {
-        if (!rawProps || // for camelCase
-        !hasOwn(rawProps, key) && // it's possible the original props was passed in as kebab-case
-        // and converted to camelCase (#955)
-        ((kebabKey = hyphenate(key)) === key || !hasOwn(rawProps, kebabKey))) {
-          if (options) {
-            if (rawPrevProps && // for camelCase
-            (rawPrevProps[key] !== void 0 || // for kebab-case
-            rawPrevProps[kebabKey] !== void 0)) {
-              props[key] = resolvePropValue(
-                options,
-                rawCurrentProps,
-                key,
-                void 0,
-                instance,
-                true
-              );
             }
-          } else {
-            delete props[key];
+            targetAnchor = nextSibling(targetAnchor);
           }
-        }
-      }
-      if (attrs !== rawCurrentProps) {
-        for (const key in attrs) {
-          if (!rawProps || !hasOwn(rawProps, key) && true) {
-            delete attrs[key];
-            hasAttrsChanged = true;
+          if (!vnode.targetAnchor) {
+            prepareAnchor(target, vnode, createText, insert);
           }
+          hydrateChildren(
+            targetNode && nextSibling(targetNode),
+            vnode,
+            target,
+            parentComponent,
+            parentSuspense,
+            slotScopeIds,
+            optimized
+          );
         }
       }
+      updateCssVars(vnode);
     }
-    if (hasAttrsChanged) {
-      trigger(instance.attrs, "set", "");
-    }
-    {
-      validateProps(rawProps || {}, props, instance);
-    }
+    return vnode.anchor && nextSibling(vnode.anchor);
   }
-  function setFullProps(instance, rawProps, props, attrs) {
-    const [options, needCastKeys] = instance.propsOptions;
-    let hasAttrsChanged = false;
-    let rawCastValues;
-    if (rawProps) {
-      for (let key in rawProps) {
-        if (isReservedProp(key)) {
-          continue;
-        }
-        const value = rawProps[key];
-        let camelKey;
-        if (options && hasOwn(options, camelKey = camelize(key))) {
-          if (!needCastKeys || !needCastKeys.includes(camelKey)) {
-            props[camelKey] = value;
-          } else {
-            (rawCastValues || (rawCastValues = {}))[camelKey] = value;
-          }
-        } else if (!isEmitListener(instance.emitsOptions, key)) {
-          if (!(key in attrs) || value !== attrs[key]) {
-            attrs[key] = value;
-            hasAttrsChanged = true;
-          }
-        }
+  const Teleport = TeleportImpl;
+  function updateCssVars(vnode) {
+    const ctx = vnode.ctx;
+    if (ctx && ctx.ut) {
+      let node = vnode.children[0].el;
+      while (node && node !== vnode.targetAnchor) {
+        if (node.nodeType === 1) node.setAttribute("data-v-owner", ctx.uid);
+        node = node.nextSibling;
       }
+      ctx.ut();
     }
-    if (needCastKeys) {
-      const rawCurrentProps = toRaw(props);
-      const castValues = rawCastValues || EMPTY_OBJ;
-      for (let i = 0; i < needCastKeys.length; i++) {
-        const key = needCastKeys[i];
-        props[key] = resolvePropValue(
-          options,
-          rawCurrentProps,
-          key,
-          castValues[key],
-          instance,
-          !hasOwn(castValues, key)
-        );
-      }
+  }
+  function prepareAnchor(target, vnode, createText, insert) {
+    const targetStart = vnode.targetStart = createText("");
+    const targetAnchor = vnode.targetAnchor = createText("");
+    targetStart[TeleportEndKey] = targetAnchor;
+    if (target) {
+      insert(targetStart, target);
+      insert(targetAnchor, target);
     }
-    return hasAttrsChanged;
+    return targetAnchor;
   }
-  function resolvePropValue(options, props, key, value, instance, isAbsent) {
-    const opt = options[key];
-    if (opt != null) {
-      const hasDefault = hasOwn(opt, "default");
-      if (hasDefault && value === void 0) {
-        const defaultValue = opt.default;
-        if (opt.type !== Function && !opt.skipFactory && isFunction(defaultValue)) {
-          const { propsDefaults } = instance;
-          if (key in propsDefaults) {
-            value = propsDefaults[key];
-          } else {
-            const reset = setCurrentInstance(instance);
-            value = propsDefaults[key] = defaultValue.call(
-              null,
-              props
-            );
-            reset();
-          }
-        } else {
-          value = defaultValue;
-        }
-      }
-      if (opt[0 /* shouldCast */]) {
-        if (isAbsent && !hasDefault) {
-          value = false;
-        } else if (opt[1 /* shouldCastTrue */] && (value === "" || value === hyphenate(key))) {
-          value = true;
-        }
-      }
-    }
-    return value;
-  }
-  function normalizePropsOptions(comp, appContext, asMixin = false) {
-    const cache = appContext.propsCache;
-    const cached = cache.get(comp);
-    if (cached) {
-      return cached;
+
+  let hasLoggedMismatchError = false;
+  const logMismatchError = () => {
+    if (hasLoggedMismatchError) {
+      return;
     }
-    const raw = comp.props;
-    const normalized = {};
-    const needCastKeys = [];
-    let hasExtends = false;
-    if (!isFunction(comp)) {
-      const extendProps = (raw2) => {
-        hasExtends = true;
-        const [props, keys] = normalizePropsOptions(raw2, appContext, true);
-        extend(normalized, props);
-        if (keys)
-          needCastKeys.push(...keys);
-      };
-      if (!asMixin && appContext.mixins.length) {
-        appContext.mixins.forEach(extendProps);
-      }
-      if (comp.extends) {
-        extendProps(comp.extends);
-      }
-      if (comp.mixins) {
-        comp.mixins.forEach(extendProps);
+    console.error("Hydration completed but contains mismatches.");
+    hasLoggedMismatchError = true;
+  };
+  const isSVGContainer = (container) => container.namespaceURI.includes("svg") && container.tagName !== "foreignObject";
+  const isMathMLContainer = (container) => container.namespaceURI.includes("MathML");
+  const getContainerType = (container) => {
+    if (isSVGContainer(container)) return "svg";
+    if (isMathMLContainer(container)) return "mathml";
+    return void 0;
+  };
+  const isComment = (node) => node.nodeType === 8 /* COMMENT */;
+  function createHydrationFunctions(rendererInternals) {
+    const {
+      mt: mountComponent,
+      p: patch,
+      o: {
+        patchProp,
+        createText,
+        nextSibling,
+        parentNode,
+        remove,
+        insert,
+        createComment
       }
-    }
-    if (!raw && !hasExtends) {
-      if (isObject(comp)) {
-        cache.set(comp, EMPTY_ARR);
+    } = rendererInternals;
+    const hydrate = (vnode, container) => {
+      if (!container.hasChildNodes()) {
+        warn$1(
+          `Attempting to hydrate existing markup but container is empty. Performing full mount instead.`
+        );
+        patch(null, vnode, container);
+        flushPostFlushCbs();
+        container._vnode = vnode;
+        return;
       }
-      return EMPTY_ARR;
-    }
-    if (isArray(raw)) {
-      for (let i = 0; i < raw.length; i++) {
-        if (!isString(raw[i])) {
-          warn$1(`props must be strings when using array syntax.`, raw[i]);
-        }
-        const normalizedKey = camelize(raw[i]);
-        if (validatePropName(normalizedKey)) {
-          normalized[normalizedKey] = EMPTY_OBJ;
-        }
+      hydrateNode(container.firstChild, vnode, null, null, null);
+      flushPostFlushCbs();
+      container._vnode = vnode;
+    };
+    const hydrateNode = (node, vnode, parentComponent, parentSuspense, slotScopeIds, optimized = false) => {
+      optimized = optimized || !!vnode.dynamicChildren;
+      const isFragmentStart = isComment(node) && node.data === "[";
+      const onMismatch = () => handleMismatch(
+        node,
+        vnode,
+        parentComponent,
+        parentSuspense,
+        slotScopeIds,
+        isFragmentStart
+      );
+      const { type, ref, shapeFlag, patchFlag } = vnode;
+      let domType = node.nodeType;
+      vnode.el = node;
+      {
+        def(node, "__vnode", vnode, true);
+        def(node, "__vueParentComponent", parentComponent, true);
       }
-    } else if (raw) {
-      if (!isObject(raw)) {
-        warn$1(`invalid props options`, raw);
+      if (patchFlag === -2) {
+        optimized = false;
+        vnode.dynamicChildren = null;
       }
-      for (const key in raw) {
-        const normalizedKey = camelize(key);
-        if (validatePropName(normalizedKey)) {
-          const opt = raw[key];
-          const prop = normalized[normalizedKey] = isArray(opt) || isFunction(opt) ? { type: opt } : extend({}, opt);
-          if (prop) {
-            const booleanIndex = getTypeIndex(Boolean, prop.type);
-            const stringIndex = getTypeIndex(String, prop.type);
-            prop[0 /* shouldCast */] = booleanIndex > -1;
-            prop[1 /* shouldCastTrue */] = stringIndex < 0 || booleanIndex < stringIndex;
-            if (booleanIndex > -1 || hasOwn(prop, "default")) {
-              needCastKeys.push(normalizedKey);
+      let nextNode = null;
+      switch (type) {
+        case Text:
+          if (domType !== 3 /* TEXT */) {
+            if (vnode.children === "") {
+              insert(vnode.el = createText(""), parentNode(node), node);
+              nextNode = node;
+            } else {
+              nextNode = onMismatch();
+            }
+          } else {
+            if (node.data !== vnode.children) {
+              warn$1(
+                `Hydration text mismatch in`,
+                node.parentNode,
+                `
+  - rendered on server: ${JSON.stringify(
+                node.data
+              )}
+  - expected on client: ${JSON.stringify(vnode.children)}`
+              );
+              logMismatchError();
+              node.data = vnode.children;
             }
+            nextNode = nextSibling(node);
+          }
+          break;
+        case Comment:
+          if (isTemplateNode(node)) {
+            nextNode = nextSibling(node);
+            replaceNode(
+              vnode.el = node.content.firstChild,
+              node,
+              parentComponent
+            );
+          } else if (domType !== 8 /* COMMENT */ || isFragmentStart) {
+            nextNode = onMismatch();
+          } else {
+            nextNode = nextSibling(node);
+          }
+          break;
+        case Static:
+          if (isFragmentStart) {
+            node = nextSibling(node);
+            domType = node.nodeType;
+          }
+          if (domType === 1 /* ELEMENT */ || domType === 3 /* TEXT */) {
+            nextNode = node;
+            const needToAdoptContent = !vnode.children.length;
+            for (let i = 0; i < vnode.staticCount; i++) {
+              if (needToAdoptContent)
+                vnode.children += nextNode.nodeType === 1 /* ELEMENT */ ? nextNode.outerHTML : nextNode.data;
+              if (i === vnode.staticCount - 1) {
+                vnode.anchor = nextNode;
+              }
+              nextNode = nextSibling(nextNode);
+            }
+            return isFragmentStart ? nextSibling(nextNode) : nextNode;
+          } else {
+            onMismatch();
+          }
+          break;
+        case Fragment:
+          if (!isFragmentStart) {
+            nextNode = onMismatch();
+          } else {
+            nextNode = hydrateFragment(
+              node,
+              vnode,
+              parentComponent,
+              parentSuspense,
+              slotScopeIds,
+              optimized
+            );
+          }
+          break;
+        default:
+          if (shapeFlag & 1) {
+            if ((domType !== 1 /* ELEMENT */ || vnode.type.toLowerCase() !== node.tagName.toLowerCase()) && !isTemplateNode(node)) {
+              nextNode = onMismatch();
+            } else {
+              nextNode = hydrateElement(
+                node,
+                vnode,
+                parentComponent,
+                parentSuspense,
+                slotScopeIds,
+                optimized
+              );
+            }
+          } else if (shapeFlag & 6) {
+            vnode.slotScopeIds = slotScopeIds;
+            const container = parentNode(node);
+            if (isFragmentStart) {
+              nextNode = locateClosingAnchor(node);
+            } else if (isComment(node) && node.data === "teleport start") {
+              nextNode = locateClosingAnchor(node, node.data, "teleport end");
+            } else {
+              nextNode = nextSibling(node);
+            }
+            mountComponent(
+              vnode,
+              container,
+              null,
+              parentComponent,
+              parentSuspense,
+              getContainerType(container),
+              optimized
+            );
+            if (isAsyncWrapper(vnode)) {
+              let subTree;
+              if (isFragmentStart) {
+                subTree = createVNode(Fragment);
+                subTree.anchor = nextNode ? nextNode.previousSibling : container.lastChild;
+              } else {
+                subTree = node.nodeType === 3 ? createTextVNode("") : createVNode("div");
+              }
+              subTree.el = node;
+              vnode.component.subTree = subTree;
+            }
+          } else if (shapeFlag & 64) {
+            if (domType !== 8 /* COMMENT */) {
+              nextNode = onMismatch();
+            } else {
+              nextNode = vnode.type.hydrate(
+                node,
+                vnode,
+                parentComponent,
+                parentSuspense,
+                slotScopeIds,
+                optimized,
+                rendererInternals,
+                hydrateChildren
+              );
+            }
+          } else if (shapeFlag & 128) {
+            nextNode = vnode.type.hydrate(
+              node,
+              vnode,
+              parentComponent,
+              parentSuspense,
+              getContainerType(parentNode(node)),
+              slotScopeIds,
+              optimized,
+              rendererInternals,
+              hydrateNode
+            );
+          } else {
+            warn$1("Invalid HostVNode type:", type, `(${typeof type})`);
           }
-        }
+      }
+      if (ref != null) {
+        setRef(ref, null, parentSuspense, vnode);
+      }
+      return nextNode;
+    };
+    const hydrateElement = (el, vnode, parentComponent, parentSuspense, slotScopeIds, optimized) => {
+      optimized = optimized || !!vnode.dynamicChildren;
+      const { type, props, patchFlag, shapeFlag, dirs, transition } = vnode;
+      const forcePatch = type === "input" || type === "option";
+      {
+        if (dirs) {
+          invokeDirectiveHook(vnode, null, parentComponent, "created");
+        }
+        let needCallTransitionHooks = false;
+        if (isTemplateNode(el)) {
+          needCallTransitionHooks = needTransition(parentSuspense, transition) && parentComponent && parentComponent.vnode.props && parentComponent.vnode.props.appear;
+          const content = el.content.firstChild;
+          if (needCallTransitionHooks) {
+            transition.beforeEnter(content);
+          }
+          replaceNode(content, el, parentComponent);
+          vnode.el = el = content;
+        }
+        if (shapeFlag & 16 && // skip if element has innerHTML / textContent
+        !(props && (props.innerHTML || props.textContent))) {
+          let next = hydrateChildren(
+            el.firstChild,
+            vnode,
+            el,
+            parentComponent,
+            parentSuspense,
+            slotScopeIds,
+            optimized
+          );
+          let hasWarned = false;
+          while (next) {
+            if (!hasWarned) {
+              warn$1(
+                `Hydration children mismatch on`,
+                el,
+                `
+Server rendered element contains more child nodes than client vdom.`
+              );
+              hasWarned = true;
+            }
+            logMismatchError();
+            const cur = next;
+            next = next.nextSibling;
+            remove(cur);
+          }
+        } else if (shapeFlag & 8) {
+          if (el.textContent !== vnode.children) {
+            warn$1(
+              `Hydration text content mismatch on`,
+              el,
+              `
+  - rendered on server: ${el.textContent}
+  - expected on client: ${vnode.children}`
+            );
+            logMismatchError();
+            el.textContent = vnode.children;
+          }
+        }
+        if (props) {
+          {
+            const isCustomElement = el.tagName.includes("-");
+            for (const key in props) {
+              if (// #11189 skip if this node has directives that have created hooks
+              // as it could have mutated the DOM in any possible way
+              !(dirs && dirs.some((d) => d.dir.created)) && propHasMismatch(el, key, props[key], vnode, parentComponent)) {
+                logMismatchError();
+              }
+              if (forcePatch && (key.endsWith("value") || key === "indeterminate") || isOn(key) && !isReservedProp(key) || // force hydrate v-bind with .prop modifiers
+              key[0] === "." || isCustomElement) {
+                patchProp(el, key, null, props[key], void 0, parentComponent);
+              }
+            }
+          }
+        }
+        let vnodeHooks;
+        if (vnodeHooks = props && props.onVnodeBeforeMount) {
+          invokeVNodeHook(vnodeHooks, parentComponent, vnode);
+        }
+        if (dirs) {
+          invokeDirectiveHook(vnode, null, parentComponent, "beforeMount");
+        }
+        if ((vnodeHooks = props && props.onVnodeMounted) || dirs || needCallTransitionHooks) {
+          queueEffectWithSuspense(() => {
+            vnodeHooks && invokeVNodeHook(vnodeHooks, parentComponent, vnode);
+            needCallTransitionHooks && transition.enter(el);
+            dirs && invokeDirectiveHook(vnode, null, parentComponent, "mounted");
+          }, parentSuspense);
+        }
+      }
+      return el.nextSibling;
+    };
+    const hydrateChildren = (node, parentVNode, container, parentComponent, parentSuspense, slotScopeIds, optimized) => {
+      optimized = optimized || !!parentVNode.dynamicChildren;
+      const children = parentVNode.children;
+      const l = children.length;
+      let hasWarned = false;
+      for (let i = 0; i < l; i++) {
+        const vnode = optimized ? children[i] : children[i] = normalizeVNode(children[i]);
+        const isText = vnode.type === Text;
+        if (node) {
+          if (isText && !optimized) {
+            let next = children[i + 1];
+            if (next && (next = normalizeVNode(next)).type === Text) {
+              insert(
+                createText(
+                  node.data.slice(vnode.children.length)
+                ),
+                container,
+                nextSibling(node)
+              );
+              node.data = vnode.children;
+            }
+          }
+          node = hydrateNode(
+            node,
+            vnode,
+            parentComponent,
+            parentSuspense,
+            slotScopeIds,
+            optimized
+          );
+        } else if (isText && !vnode.children) {
+          insert(vnode.el = createText(""), container);
+        } else {
+          if (!hasWarned) {
+            warn$1(
+              `Hydration children mismatch on`,
+              container,
+              `
+Server rendered element contains fewer child nodes than client vdom.`
+            );
+            hasWarned = true;
+          }
+          logMismatchError();
+          patch(
+            null,
+            vnode,
+            container,
+            null,
+            parentComponent,
+            parentSuspense,
+            getContainerType(container),
+            slotScopeIds
+          );
+        }
+      }
+      return node;
+    };
+    const hydrateFragment = (node, vnode, parentComponent, parentSuspense, slotScopeIds, optimized) => {
+      const { slotScopeIds: fragmentSlotScopeIds } = vnode;
+      if (fragmentSlotScopeIds) {
+        slotScopeIds = slotScopeIds ? slotScopeIds.concat(fragmentSlotScopeIds) : fragmentSlotScopeIds;
+      }
+      const container = parentNode(node);
+      const next = hydrateChildren(
+        nextSibling(node),
+        vnode,
+        container,
+        parentComponent,
+        parentSuspense,
+        slotScopeIds,
+        optimized
+      );
+      if (next && isComment(next) && next.data === "]") {
+        return nextSibling(vnode.anchor = next);
+      } else {
+        logMismatchError();
+        insert(vnode.anchor = createComment(`]`), container, next);
+        return next;
+      }
+    };
+    const handleMismatch = (node, vnode, parentComponent, parentSuspense, slotScopeIds, isFragment) => {
+      warn$1(
+        `Hydration node mismatch:
+- rendered on server:`,
+        node,
+        node.nodeType === 3 /* TEXT */ ? `(text)` : isComment(node) && node.data === "[" ? `(start of fragment)` : ``,
+        `
+- expected on client:`,
+        vnode.type
+      );
+      logMismatchError();
+      vnode.el = null;
+      if (isFragment) {
+        const end = locateClosingAnchor(node);
+        while (true) {
+          const next2 = nextSibling(node);
+          if (next2 && next2 !== end) {
+            remove(next2);
+          } else {
+            break;
+          }
+        }
+      }
+      const next = nextSibling(node);
+      const container = parentNode(node);
+      remove(node);
+      patch(
+        null,
+        vnode,
+        container,
+        next,
+        parentComponent,
+        parentSuspense,
+        getContainerType(container),
+        slotScopeIds
+      );
+      return next;
+    };
+    const locateClosingAnchor = (node, open = "[", close = "]") => {
+      let match = 0;
+      while (node) {
+        node = nextSibling(node);
+        if (node && isComment(node)) {
+          if (node.data === open) match++;
+          if (node.data === close) {
+            if (match === 0) {
+              return nextSibling(node);
+            } else {
+              match--;
+            }
+          }
+        }
+      }
+      return node;
+    };
+    const replaceNode = (newNode, oldNode, parentComponent) => {
+      const parentNode2 = oldNode.parentNode;
+      if (parentNode2) {
+        parentNode2.replaceChild(newNode, oldNode);
+      }
+      let parent = parentComponent;
+      while (parent) {
+        if (parent.vnode.el === oldNode) {
+          parent.vnode.el = parent.subTree.el = newNode;
+        }
+        parent = parent.parent;
+      }
+    };
+    const isTemplateNode = (node) => {
+      return node.nodeType === 1 /* ELEMENT */ && node.tagName.toLowerCase() === "template";
+    };
+    return [hydrate, hydrateNode];
+  }
+  function propHasMismatch(el, key, clientValue, vnode, instance) {
+    let mismatchType;
+    let mismatchKey;
+    let actual;
+    let expected;
+    if (key === "class") {
+      actual = el.getAttribute("class");
+      expected = normalizeClass(clientValue);
+      if (!isSetEqual(toClassSet(actual || ""), toClassSet(expected))) {
+        mismatchType = mismatchKey = `class`;
+      }
+    } else if (key === "style") {
+      actual = el.getAttribute("style") || "";
+      expected = isString(clientValue) ? clientValue : stringifyStyle(normalizeStyle(clientValue));
+      const actualMap = toStyleMap(actual);
+      const expectedMap = toStyleMap(expected);
+      if (vnode.dirs) {
+        for (const { dir, value } of vnode.dirs) {
+          if (dir.name === "show" && !value) {
+            expectedMap.set("display", "none");
+          }
+        }
+      }
+      if (instance) {
+        resolveCssVars(instance, vnode, expectedMap);
+      }
+      if (!isMapEqual(actualMap, expectedMap)) {
+        mismatchType = mismatchKey = "style";
+      }
+    } else if (el instanceof SVGElement && isKnownSvgAttr(key) || el instanceof HTMLElement && (isBooleanAttr(key) || isKnownHtmlAttr(key))) {
+      if (isBooleanAttr(key)) {
+        actual = el.hasAttribute(key);
+        expected = includeBooleanAttr(clientValue);
+      } else if (clientValue == null) {
+        actual = el.hasAttribute(key);
+        expected = false;
+      } else {
+        if (el.hasAttribute(key)) {
+          actual = el.getAttribute(key);
+        } else if (key === "value" && el.tagName === "TEXTAREA") {
+          actual = el.value;
+        } else {
+          actual = false;
+        }
+        expected = isRenderableAttrValue(clientValue) ? String(clientValue) : false;
+      }
+      if (actual !== expected) {
+        mismatchType = `attribute`;
+        mismatchKey = key;
+      }
+    }
+    if (mismatchType) {
+      const format = (v) => v === false ? `(not rendered)` : `${mismatchKey}="${v}"`;
+      const preSegment = `Hydration ${mismatchType} mismatch on`;
+      const postSegment = `
+  - rendered on server: ${format(actual)}
+  - expected on client: ${format(expected)}
+  Note: this mismatch is check-only. The DOM will not be rectified in production due to performance overhead.
+  You should fix the source of the mismatch.`;
+      {
+        warn$1(preSegment, el, postSegment);
+      }
+      return true;
+    }
+    return false;
+  }
+  function toClassSet(str) {
+    return new Set(str.trim().split(/\s+/));
+  }
+  function isSetEqual(a, b) {
+    if (a.size !== b.size) {
+      return false;
+    }
+    for (const s of a) {
+      if (!b.has(s)) {
+        return false;
+      }
+    }
+    return true;
+  }
+  function toStyleMap(str) {
+    const styleMap = /* @__PURE__ */ new Map();
+    for (const item of str.split(";")) {
+      let [key, value] = item.split(":");
+      key = key.trim();
+      value = value && value.trim();
+      if (key && value) {
+        styleMap.set(key, value);
       }
     }
-    const res = [normalized, needCastKeys];
-    if (isObject(comp)) {
-      cache.set(comp, res);
-    }
-    return res;
+    return styleMap;
   }
-  function validatePropName(key) {
-    if (key[0] !== "$" && !isReservedProp(key)) {
-      return true;
-    } else {
-      warn$1(`Invalid prop name: "${key}" is a reserved property.`);
+  function isMapEqual(a, b) {
+    if (a.size !== b.size) {
+      return false;
     }
-    return false;
+    for (const [key, value] of a) {
+      if (value !== b.get(key)) {
+        return false;
+      }
+    }
+    return true;
   }
-  function getType(ctor) {
-    if (ctor === null) {
-      return "null";
+  function resolveCssVars(instance, vnode, expectedMap) {
+    const root = instance.subTree;
+    if (instance.getCssVars && (vnode === root || root && root.type === Fragment && root.children.includes(vnode))) {
+      const cssVars = instance.getCssVars();
+      for (const key in cssVars) {
+        expectedMap.set(`--${key}`, String(cssVars[key]));
+      }
     }
-    if (typeof ctor === "function") {
-      return ctor.name || "";
-    } else if (typeof ctor === "object") {
-      const name = ctor.constructor && ctor.constructor.name;
-      return name || "";
+    if (vnode === root && instance.parent) {
+      resolveCssVars(instance.parent, instance.vnode, expectedMap);
     }
-    return "";
   }
-  function isSameType(a, b) {
-    return getType(a) === getType(b);
+
+  let supported;
+  let perf;
+  function startMeasure(instance, type) {
+    if (instance.appContext.config.performance && isSupported()) {
+      perf.mark(`vue-${type}-${instance.uid}`);
+    }
+    {
+      devtoolsPerfStart(instance, type, isSupported() ? perf.now() : Date.now());
+    }
   }
-  function getTypeIndex(type, expectedTypes) {
-    if (isArray(expectedTypes)) {
-      return expectedTypes.findIndex((t) => isSameType(t, type));
-    } else if (isFunction(expectedTypes)) {
-      return isSameType(expectedTypes, type) ? 0 : -1;
+  function endMeasure(instance, type) {
+    if (instance.appContext.config.performance && isSupported()) {
+      const startTag = `vue-${type}-${instance.uid}`;
+      const endTag = startTag + `:end`;
+      perf.mark(endTag);
+      perf.measure(
+        `<${formatComponentName(instance, instance.type)}> ${type}`,
+        startTag,
+        endTag
+      );
+      perf.clearMarks(startTag);
+      perf.clearMarks(endTag);
+    }
+    {
+      devtoolsPerfEnd(instance, type, isSupported() ? perf.now() : Date.now());
     }
-    return -1;
   }
-  function validateProps(rawProps, props, instance) {
-    const resolvedValues = toRaw(props);
-    const options = instance.propsOptions[0];
-    for (const key in options) {
-      let opt = options[key];
-      if (opt == null)
-        continue;
-      validateProp(
-        key,
-        resolvedValues[key],
-        opt,
-        shallowReadonly(resolvedValues) ,
-        !hasOwn(rawProps, key) && !hasOwn(rawProps, hyphenate(key))
+  function isSupported() {
+    if (supported !== void 0) {
+      return supported;
+    }
+    if (typeof window !== "undefined" && window.performance) {
+      supported = true;
+      perf = window.performance;
+    } else {
+      supported = false;
+    }
+    return supported;
+  }
+
+  const queuePostRenderEffect = queueEffectWithSuspense ;
+  function createRenderer(options) {
+    return baseCreateRenderer(options);
+  }
+  function createHydrationRenderer(options) {
+    return baseCreateRenderer(options, createHydrationFunctions);
+  }
+  function baseCreateRenderer(options, createHydrationFns) {
+    const target = getGlobalThis();
+    target.__VUE__ = true;
+    {
+      setDevtoolsHook$1(target.__VUE_DEVTOOLS_GLOBAL_HOOK__, target);
+    }
+    const {
+      insert: hostInsert,
+      remove: hostRemove,
+      patchProp: hostPatchProp,
+      createElement: hostCreateElement,
+      createText: hostCreateText,
+      createComment: hostCreateComment,
+      setText: hostSetText,
+      setElementText: hostSetElementText,
+      parentNode: hostParentNode,
+      nextSibling: hostNextSibling,
+      setScopeId: hostSetScopeId = NOOP,
+      insertStaticContent: hostInsertStaticContent
+    } = options;
+    const patch = (n1, n2, container, anchor = null, parentComponent = null, parentSuspense = null, namespace = void 0, slotScopeIds = null, optimized = isHmrUpdating ? false : !!n2.dynamicChildren) => {
+      if (n1 === n2) {
+        return;
+      }
+      if (n1 && !isSameVNodeType(n1, n2)) {
+        anchor = getNextHostNode(n1);
+        unmount(n1, parentComponent, parentSuspense, true);
+        n1 = null;
+      }
+      if (n2.patchFlag === -2) {
+        optimized = false;
+        n2.dynamicChildren = null;
+      }
+      const { type, ref, shapeFlag } = n2;
+      switch (type) {
+        case Text:
+          processText(n1, n2, container, anchor);
+          break;
+        case Comment:
+          processCommentNode(n1, n2, container, anchor);
+          break;
+        case Static:
+          if (n1 == null) {
+            mountStaticNode(n2, container, anchor, namespace);
+          } else {
+            patchStaticNode(n1, n2, container, namespace);
+          }
+          break;
+        case Fragment:
+          processFragment(
+            n1,
+            n2,
+            container,
+            anchor,
+            parentComponent,
+            parentSuspense,
+            namespace,
+            slotScopeIds,
+            optimized
+          );
+          break;
+        default:
+          if (shapeFlag & 1) {
+            processElement(
+              n1,
+              n2,
+              container,
+              anchor,
+              parentComponent,
+              parentSuspense,
+              namespace,
+              slotScopeIds,
+              optimized
+            );
+          } else if (shapeFlag & 6) {
+            processComponent(
+              n1,
+              n2,
+              container,
+              anchor,
+              parentComponent,
+              parentSuspense,
+              namespace,
+              slotScopeIds,
+              optimized
+            );
+          } else if (shapeFlag & 64) {
+            type.process(
+              n1,
+              n2,
+              container,
+              anchor,
+              parentComponent,
+              parentSuspense,
+              namespace,
+              slotScopeIds,
+              optimized,
+              internals
+            );
+          } else if (shapeFlag & 128) {
+            type.process(
+              n1,
+              n2,
+              container,
+              anchor,
+              parentComponent,
+              parentSuspense,
+              namespace,
+              slotScopeIds,
+              optimized,
+              internals
+            );
+          } else {
+            warn$1("Invalid VNode type:", type, `(${typeof type})`);
+          }
+      }
+      if (ref != null && parentComponent) {
+        setRef(ref, n1 && n1.ref, parentSuspense, n2 || n1, !n2);
+      }
+    };
+    const processText = (n1, n2, container, anchor) => {
+      if (n1 == null) {
+        hostInsert(
+          n2.el = hostCreateText(n2.children),
+          container,
+          anchor
+        );
+      } else {
+        const el = n2.el = n1.el;
+        if (n2.children !== n1.children) {
+          hostSetText(el, n2.children);
+        }
+      }
+    };
+    const processCommentNode = (n1, n2, container, anchor) => {
+      if (n1 == null) {
+        hostInsert(
+          n2.el = hostCreateComment(n2.children || ""),
+          container,
+          anchor
+        );
+      } else {
+        n2.el = n1.el;
+      }
+    };
+    const mountStaticNode = (n2, container, anchor, namespace) => {
+      [n2.el, n2.anchor] = hostInsertStaticContent(
+        n2.children,
+        container,
+        anchor,
+        namespace,
+        n2.el,
+        n2.anchor
+      );
+    };
+    const patchStaticNode = (n1, n2, container, namespace) => {
+      if (n2.children !== n1.children) {
+        const anchor = hostNextSibling(n1.anchor);
+        removeStaticNode(n1);
+        [n2.el, n2.anchor] = hostInsertStaticContent(
+          n2.children,
+          container,
+          anchor,
+          namespace
+        );
+      } else {
+        n2.el = n1.el;
+        n2.anchor = n1.anchor;
+      }
+    };
+    const moveStaticNode = ({ el, anchor }, container, nextSibling) => {
+      let next;
+      while (el && el !== anchor) {
+        next = hostNextSibling(el);
+        hostInsert(el, container, nextSibling);
+        el = next;
+      }
+      hostInsert(anchor, container, nextSibling);
+    };
+    const removeStaticNode = ({ el, anchor }) => {
+      let next;
+      while (el && el !== anchor) {
+        next = hostNextSibling(el);
+        hostRemove(el);
+        el = next;
+      }
+      hostRemove(anchor);
+    };
+    const processElement = (n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
+      if (n2.type === "svg") {
+        namespace = "svg";
+      } else if (n2.type === "math") {
+        namespace = "mathml";
+      }
+      if (n1 == null) {
+        mountElement(
+          n2,
+          container,
+          anchor,
+          parentComponent,
+          parentSuspense,
+          namespace,
+          slotScopeIds,
+          optimized
+        );
+      } else {
+        patchElement(
+          n1,
+          n2,
+          parentComponent,
+          parentSuspense,
+          namespace,
+          slotScopeIds,
+          optimized
+        );
+      }
+    };
+    const mountElement = (vnode, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
+      let el;
+      let vnodeHook;
+      const { props, shapeFlag, transition, dirs } = vnode;
+      el = vnode.el = hostCreateElement(
+        vnode.type,
+        namespace,
+        props && props.is,
+        props
       );
-    }
-  }
-  function validateProp(name, value, prop, props, isAbsent) {
-    const { type, required, validator, skipCheck } = prop;
-    if (required && isAbsent) {
-      warn$1('Missing required prop: "' + name + '"');
-      return;
-    }
-    if (value == null && !required) {
-      return;
-    }
-    if (type != null && type !== true && !skipCheck) {
-      let isValid = false;
-      const types = isArray(type) ? type : [type];
-      const expectedTypes = [];
-      for (let i = 0; i < types.length && !isValid; i++) {
-        const { valid, expectedType } = assertType(value, types[i]);
-        expectedTypes.push(expectedType || "");
-        isValid = valid;
+      if (shapeFlag & 8) {
+        hostSetElementText(el, vnode.children);
+      } else if (shapeFlag & 16) {
+        mountChildren(
+          vnode.children,
+          el,
+          null,
+          parentComponent,
+          parentSuspense,
+          resolveChildrenNamespace(vnode, namespace),
+          slotScopeIds,
+          optimized
+        );
       }
-      if (!isValid) {
-        warn$1(getInvalidTypeMessage(name, value, expectedTypes));
-        return;
+      if (dirs) {
+        invokeDirectiveHook(vnode, null, parentComponent, "created");
       }
-    }
-    if (validator && !validator(value, props)) {
-      warn$1('Invalid prop: custom validator check failed for prop "' + name + '".');
-    }
-  }
-  const isSimpleType = /* @__PURE__ */ makeMap(
-    "String,Number,Boolean,Function,Symbol,BigInt"
-  );
-  function assertType(value, type) {
-    let valid;
-    const expectedType = getType(type);
-    if (isSimpleType(expectedType)) {
-      const t = typeof value;
-      valid = t === expectedType.toLowerCase();
-      if (!valid && t === "object") {
-        valid = value instanceof type;
+      setScopeId(el, vnode, vnode.scopeId, slotScopeIds, parentComponent);
+      if (props) {
+        for (const key in props) {
+          if (key !== "value" && !isReservedProp(key)) {
+            hostPatchProp(el, key, null, props[key], namespace, parentComponent);
+          }
+        }
+        if ("value" in props) {
+          hostPatchProp(el, "value", null, props.value, namespace);
+        }
+        if (vnodeHook = props.onVnodeBeforeMount) {
+          invokeVNodeHook(vnodeHook, parentComponent, vnode);
+        }
+      }
+      {
+        def(el, "__vnode", vnode, true);
+        def(el, "__vueParentComponent", parentComponent, true);
+      }
+      if (dirs) {
+        invokeDirectiveHook(vnode, null, parentComponent, "beforeMount");
+      }
+      const needCallTransitionHooks = needTransition(parentSuspense, transition);
+      if (needCallTransitionHooks) {
+        transition.beforeEnter(el);
+      }
+      hostInsert(el, container, anchor);
+      if ((vnodeHook = props && props.onVnodeMounted) || needCallTransitionHooks || dirs) {
+        queuePostRenderEffect(() => {
+          vnodeHook && invokeVNodeHook(vnodeHook, parentComponent, vnode);
+          needCallTransitionHooks && transition.enter(el);
+          dirs && invokeDirectiveHook(vnode, null, parentComponent, "mounted");
+        }, parentSuspense);
       }
-    } else if (expectedType === "Object") {
-      valid = isObject(value);
-    } else if (expectedType === "Array") {
-      valid = isArray(value);
-    } else if (expectedType === "null") {
-      valid = value === null;
-    } else {
-      valid = value instanceof type;
-    }
-    return {
-      valid,
-      expectedType
     };
-  }
-  function getInvalidTypeMessage(name, value, expectedTypes) {
-    if (expectedTypes.length === 0) {
-      return `Prop type [] for prop "${name}" won't match anything. Did you mean to use type Array instead?`;
-    }
-    let message = `Invalid prop: type check failed for prop "${name}". Expected ${expectedTypes.map(capitalize).join(" | ")}`;
-    const expectedType = expectedTypes[0];
-    const receivedType = toRawType(value);
-    const expectedValue = styleValue(value, expectedType);
-    const receivedValue = styleValue(value, receivedType);
-    if (expectedTypes.length === 1 && isExplicable(expectedType) && !isBoolean(expectedType, receivedType)) {
-      message += ` with value ${expectedValue}`;
-    }
-    message += `, got ${receivedType} `;
-    if (isExplicable(receivedType)) {
-      message += `with value ${receivedValue}.`;
-    }
-    return message;
-  }
-  function styleValue(value, type) {
-    if (type === "String") {
-      return `"${value}"`;
-    } else if (type === "Number") {
-      return `${Number(value)}`;
-    } else {
-      return `${value}`;
-    }
-  }
-  function isExplicable(type) {
-    const explicitTypes = ["string", "number", "boolean"];
-    return explicitTypes.some((elem) => type.toLowerCase() === elem);
-  }
-  function isBoolean(...args) {
-    return args.some((elem) => elem.toLowerCase() === "boolean");
-  }
-
-  const isInternalKey = (key) => key[0] === "_" || key === "$stable";
-  const normalizeSlotValue = (value) => isArray(value) ? value.map(normalizeVNode) : [normalizeVNode(value)];
-  const normalizeSlot = (key, rawSlot, ctx) => {
-    if (rawSlot._n) {
-      return rawSlot;
-    }
-    const normalized = withCtx((...args) => {
-      if (currentInstance && (!ctx || ctx.root === currentInstance.root)) {
-        warn$1(
-          `Slot "${key}" invoked outside of the render function: this will not track dependencies used in the slot. Invoke the slot function inside the render function instead.`
+    const setScopeId = (el, vnode, scopeId, slotScopeIds, parentComponent) => {
+      if (scopeId) {
+        hostSetScopeId(el, scopeId);
+      }
+      if (slotScopeIds) {
+        for (let i = 0; i < slotScopeIds.length; i++) {
+          hostSetScopeId(el, slotScopeIds[i]);
+        }
+      }
+      if (parentComponent) {
+        let subTree = parentComponent.subTree;
+        if (subTree.patchFlag > 0 && subTree.patchFlag & 2048) {
+          subTree = filterSingleRoot(subTree.children) || subTree;
+        }
+        if (vnode === subTree) {
+          const parentVNode = parentComponent.vnode;
+          setScopeId(
+            el,
+            parentVNode,
+            parentVNode.scopeId,
+            parentVNode.slotScopeIds,
+            parentComponent.parent
+          );
+        }
+      }
+    };
+    const mountChildren = (children, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized, start = 0) => {
+      for (let i = start; i < children.length; i++) {
+        const child = children[i] = optimized ? cloneIfMounted(children[i]) : normalizeVNode(children[i]);
+        patch(
+          null,
+          child,
+          container,
+          anchor,
+          parentComponent,
+          parentSuspense,
+          namespace,
+          slotScopeIds,
+          optimized
         );
       }
-      return normalizeSlotValue(rawSlot(...args));
-    }, ctx);
-    normalized._c = false;
-    return normalized;
-  };
-  const normalizeObjectSlots = (rawSlots, slots, instance) => {
-    const ctx = rawSlots._ctx;
-    for (const key in rawSlots) {
-      if (isInternalKey(key))
-        continue;
-      const value = rawSlots[key];
-      if (isFunction(value)) {
-        slots[key] = normalizeSlot(key, value, ctx);
-      } else if (value != null) {
+    };
+    const patchElement = (n1, n2, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
+      const el = n2.el = n1.el;
+      {
+        el.__vnode = n2;
+      }
+      let { patchFlag, dynamicChildren, dirs } = n2;
+      patchFlag |= n1.patchFlag & 16;
+      const oldProps = n1.props || EMPTY_OBJ;
+      const newProps = n2.props || EMPTY_OBJ;
+      let vnodeHook;
+      parentComponent && toggleRecurse(parentComponent, false);
+      if (vnodeHook = newProps.onVnodeBeforeUpdate) {
+        invokeVNodeHook(vnodeHook, parentComponent, n2, n1);
+      }
+      if (dirs) {
+        invokeDirectiveHook(n2, n1, parentComponent, "beforeUpdate");
+      }
+      parentComponent && toggleRecurse(parentComponent, true);
+      if (isHmrUpdating) {
+        patchFlag = 0;
+        optimized = false;
+        dynamicChildren = null;
+      }
+      if (oldProps.innerHTML && newProps.innerHTML == null || oldProps.textContent && newProps.textContent == null) {
+        hostSetElementText(el, "");
+      }
+      if (dynamicChildren) {
+        patchBlockChildren(
+          n1.dynamicChildren,
+          dynamicChildren,
+          el,
+          parentComponent,
+          parentSuspense,
+          resolveChildrenNamespace(n2, namespace),
+          slotScopeIds
+        );
         {
-          warn$1(
-            `Non-function value encountered for slot "${key}". Prefer function slots for better performance.`
-          );
+          traverseStaticChildren(n1, n2);
         }
-        const normalized = normalizeSlotValue(value);
-        slots[key] = () => normalized;
-      }
-    }
-  };
-  const normalizeVNodeSlots = (instance, children) => {
-    if (!isKeepAlive(instance.vnode) && true) {
-      warn$1(
-        `Non-function value encountered for default slot. Prefer function slots for better performance.`
-      );
-    }
-    const normalized = normalizeSlotValue(children);
-    instance.slots.default = () => normalized;
-  };
-  const initSlots = (instance, children) => {
-    const slots = instance.slots = createInternalObject();
-    if (instance.vnode.shapeFlag & 32) {
-      const type = children._;
-      if (type) {
-        extend(slots, children);
-        def(slots, "_", type, true);
-      } else {
-        normalizeObjectSlots(children, slots);
+      } else if (!optimized) {
+        patchChildren(
+          n1,
+          n2,
+          el,
+          null,
+          parentComponent,
+          parentSuspense,
+          resolveChildrenNamespace(n2, namespace),
+          slotScopeIds,
+          false
+        );
       }
-    } else if (children) {
-      normalizeVNodeSlots(instance, children);
-    }
-  };
-  const updateSlots = (instance, children, optimized) => {
-    const { vnode, slots } = instance;
-    let needDeletionCheck = true;
-    let deletionComparisonTarget = EMPTY_OBJ;
-    if (vnode.shapeFlag & 32) {
-      const type = children._;
-      if (type) {
-        if (isHmrUpdating) {
-          extend(slots, children);
-          trigger(instance, "set", "$slots");
-        } else if (optimized && type === 1) {
-          needDeletionCheck = false;
+      if (patchFlag > 0) {
+        if (patchFlag & 16) {
+          patchProps(el, oldProps, newProps, parentComponent, namespace);
         } else {
-          extend(slots, children);
-          if (!optimized && type === 1) {
-            delete slots._;
+          if (patchFlag & 2) {
+            if (oldProps.class !== newProps.class) {
+              hostPatchProp(el, "class", null, newProps.class, namespace);
+            }
+          }
+          if (patchFlag & 4) {
+            hostPatchProp(el, "style", oldProps.style, newProps.style, namespace);
+          }
+          if (patchFlag & 8) {
+            const propsToUpdate = n2.dynamicProps;
+            for (let i = 0; i < propsToUpdate.length; i++) {
+              const key = propsToUpdate[i];
+              const prev = oldProps[key];
+              const next = newProps[key];
+              if (next !== prev || key === "value") {
+                hostPatchProp(el, key, prev, next, namespace, parentComponent);
+              }
+            }
           }
         }
-      } else {
-        needDeletionCheck = !children.$stable;
-        normalizeObjectSlots(children, slots);
+        if (patchFlag & 1) {
+          if (n1.children !== n2.children) {
+            hostSetElementText(el, n2.children);
+          }
+        }
+      } else if (!optimized && dynamicChildren == null) {
+        patchProps(el, oldProps, newProps, parentComponent, namespace);
       }
-      deletionComparisonTarget = children;
-    } else if (children) {
-      normalizeVNodeSlots(instance, children);
-      deletionComparisonTarget = { default: 1 };
-    }
-    if (needDeletionCheck) {
-      for (const key in slots) {
-        if (!isInternalKey(key) && deletionComparisonTarget[key] == null) {
-          delete slots[key];
+      if ((vnodeHook = newProps.onVnodeUpdated) || dirs) {
+        queuePostRenderEffect(() => {
+          vnodeHook && invokeVNodeHook(vnodeHook, parentComponent, n2, n1);
+          dirs && invokeDirectiveHook(n2, n1, parentComponent, "updated");
+        }, parentSuspense);
+      }
+    };
+    const patchBlockChildren = (oldChildren, newChildren, fallbackContainer, parentComponent, parentSuspense, namespace, slotScopeIds) => {
+      for (let i = 0; i < newChildren.length; i++) {
+        const oldVNode = oldChildren[i];
+        const newVNode = newChildren[i];
+        const container = (
+          // oldVNode may be an errored async setup() component inside Suspense
+          // which will not have a mounted element
+          oldVNode.el && // - In the case of a Fragment, we need to provide the actual parent
+          // of the Fragment itself so it can move its children.
+          (oldVNode.type === Fragment || // - In the case of different nodes, there is going to be a replacement
+          // which also requires the correct parent container
+          !isSameVNodeType(oldVNode, newVNode) || // - In the case of a component, it could contain anything.
+          oldVNode.shapeFlag & (6 | 64)) ? hostParentNode(oldVNode.el) : (
+            // In other cases, the parent container is not actually used so we
+            // just pass the block element here to avoid a DOM parentNode call.
+            fallbackContainer
+          )
+        );
+        patch(
+          oldVNode,
+          newVNode,
+          container,
+          null,
+          parentComponent,
+          parentSuspense,
+          namespace,
+          slotScopeIds,
+          true
+        );
+      }
+    };
+    const patchProps = (el, oldProps, newProps, parentComponent, namespace) => {
+      if (oldProps !== newProps) {
+        if (oldProps !== EMPTY_OBJ) {
+          for (const key in oldProps) {
+            if (!isReservedProp(key) && !(key in newProps)) {
+              hostPatchProp(
+                el,
+                key,
+                oldProps[key],
+                null,
+                namespace,
+                parentComponent
+              );
+            }
+          }
+        }
+        for (const key in newProps) {
+          if (isReservedProp(key)) continue;
+          const next = newProps[key];
+          const prev = oldProps[key];
+          if (next !== prev && key !== "value") {
+            hostPatchProp(el, key, prev, next, namespace, parentComponent);
+          }
+        }
+        if ("value" in newProps) {
+          hostPatchProp(el, "value", oldProps.value, newProps.value, namespace);
         }
       }
-    }
-  };
-
-  function setRef(rawRef, oldRawRef, parentSuspense, vnode, isUnmount = false) {
-    if (isArray(rawRef)) {
-      rawRef.forEach(
-        (r, i) => setRef(
-          r,
-          oldRawRef && (isArray(oldRawRef) ? oldRawRef[i] : oldRawRef),
+    };
+    const processFragment = (n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
+      const fragmentStartAnchor = n2.el = n1 ? n1.el : hostCreateText("");
+      const fragmentEndAnchor = n2.anchor = n1 ? n1.anchor : hostCreateText("");
+      let { patchFlag, dynamicChildren, slotScopeIds: fragmentSlotScopeIds } = n2;
+      if (
+        // #5523 dev root fragment may inherit directives
+        isHmrUpdating || patchFlag & 2048
+      ) {
+        patchFlag = 0;
+        optimized = false;
+        dynamicChildren = null;
+      }
+      if (fragmentSlotScopeIds) {
+        slotScopeIds = slotScopeIds ? slotScopeIds.concat(fragmentSlotScopeIds) : fragmentSlotScopeIds;
+      }
+      if (n1 == null) {
+        hostInsert(fragmentStartAnchor, container, anchor);
+        hostInsert(fragmentEndAnchor, container, anchor);
+        mountChildren(
+          // #10007
+          // such fragment like `<></>` will be compiled into
+          // a fragment which doesn't have a children.
+          // In this case fallback to an empty array
+          n2.children || [],
+          container,
+          fragmentEndAnchor,
+          parentComponent,
           parentSuspense,
-          vnode,
-          isUnmount
-        )
-      );
-      return;
-    }
-    if (isAsyncWrapper(vnode) && !isUnmount) {
-      return;
-    }
-    const refValue = vnode.shapeFlag & 4 ? getExposeProxy(vnode.component) || vnode.component.proxy : vnode.el;
-    const value = isUnmount ? null : refValue;
-    const { i: owner, r: ref } = rawRef;
-    if (!owner) {
-      warn$1(
-        `Missing ref owner context. ref cannot be used on hoisted vnodes. A vnode with ref must be created inside the render function.`
-      );
-      return;
-    }
-    const oldRef = oldRawRef && oldRawRef.r;
-    const refs = owner.refs === EMPTY_OBJ ? owner.refs = {} : owner.refs;
-    const setupState = owner.setupState;
-    if (oldRef != null && oldRef !== ref) {
-      if (isString(oldRef)) {
-        refs[oldRef] = null;
-        if (hasOwn(setupState, oldRef)) {
-          setupState[oldRef] = null;
+          namespace,
+          slotScopeIds,
+          optimized
+        );
+      } else {
+        if (patchFlag > 0 && patchFlag & 64 && dynamicChildren && // #2715 the previous fragment could've been a BAILed one as a result
+        // of renderSlot() with no valid children
+        n1.dynamicChildren) {
+          patchBlockChildren(
+            n1.dynamicChildren,
+            dynamicChildren,
+            container,
+            parentComponent,
+            parentSuspense,
+            namespace,
+            slotScopeIds
+          );
+          {
+            traverseStaticChildren(n1, n2);
+          }
+        } else {
+          patchChildren(
+            n1,
+            n2,
+            container,
+            fragmentEndAnchor,
+            parentComponent,
+            parentSuspense,
+            namespace,
+            slotScopeIds,
+            optimized
+          );
         }
-      } else if (isRef(oldRef)) {
-        oldRef.value = null;
       }
-    }
-    if (isFunction(ref)) {
-      callWithErrorHandling(ref, owner, 12, [value, refs]);
-    } else {
-      const _isString = isString(ref);
-      const _isRef = isRef(ref);
-      if (_isString || _isRef) {
-        const doSet = () => {
-          if (rawRef.f) {
-            const existing = _isString ? hasOwn(setupState, ref) ? setupState[ref] : refs[ref] : ref.value;
-            if (isUnmount) {
-              isArray(existing) && remove(existing, refValue);
-            } else {
-              if (!isArray(existing)) {
-                if (_isString) {
-                  refs[ref] = [refValue];
-                  if (hasOwn(setupState, ref)) {
-                    setupState[ref] = refs[ref];
-                  }
-                } else {
-                  ref.value = [refValue];
-                  if (rawRef.k)
-                    refs[rawRef.k] = ref.value;
-                }
-              } else if (!existing.includes(refValue)) {
-                existing.push(refValue);
-              }
-            }
-          } else if (_isString) {
-            refs[ref] = value;
-            if (hasOwn(setupState, ref)) {
-              setupState[ref] = value;
-            }
-          } else if (_isRef) {
-            ref.value = value;
-            if (rawRef.k)
-              refs[rawRef.k] = value;
-          } else {
-            warn$1("Invalid template ref type:", ref, `(${typeof ref})`);
-          }
-        };
-        if (value) {
-          doSet.id = -1;
-          queuePostRenderEffect(doSet, parentSuspense);
+    };
+    const processComponent = (n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
+      n2.slotScopeIds = slotScopeIds;
+      if (n1 == null) {
+        if (n2.shapeFlag & 512) {
+          parentComponent.ctx.activate(
+            n2,
+            container,
+            anchor,
+            namespace,
+            optimized
+          );
         } else {
-          doSet();
+          mountComponent(
+            n2,
+            container,
+            anchor,
+            parentComponent,
+            parentSuspense,
+            namespace,
+            optimized
+          );
         }
       } else {
-        warn$1("Invalid template ref type:", ref, `(${typeof ref})`);
+        updateComponent(n1, n2, optimized);
       }
-    }
-  }
-
-  let hasMismatch = false;
-  const isSVGContainer = (container) => container.namespaceURI.includes("svg") && container.tagName !== "foreignObject";
-  const isMathMLContainer = (container) => container.namespaceURI.includes("MathML");
-  const getContainerType = (container) => {
-    if (isSVGContainer(container))
-      return "svg";
-    if (isMathMLContainer(container))
-      return "mathml";
-    return void 0;
-  };
-  const isComment = (node) => node.nodeType === 8 /* COMMENT */;
-  function createHydrationFunctions(rendererInternals) {
-    const {
-      mt: mountComponent,
-      p: patch,
-      o: {
-        patchProp,
-        createText,
-        nextSibling,
-        parentNode,
-        remove,
-        insert,
-        createComment
+    };
+    const mountComponent = (initialVNode, container, anchor, parentComponent, parentSuspense, namespace, optimized) => {
+      const instance = (initialVNode.component = createComponentInstance(
+        initialVNode,
+        parentComponent,
+        parentSuspense
+      ));
+      if (instance.type.__hmrId) {
+        registerHMR(instance);
       }
-    } = rendererInternals;
-    const hydrate = (vnode, container) => {
-      if (!container.hasChildNodes()) {
-        warn$1(
-          `Attempting to hydrate existing markup but container is empty. Performing full mount instead.`
-        );
-        patch(null, vnode, container);
-        flushPostFlushCbs();
-        container._vnode = vnode;
-        return;
+      {
+        pushWarningContext(initialVNode);
+        startMeasure(instance, `mount`);
       }
-      hasMismatch = false;
-      hydrateNode(container.firstChild, vnode, null, null, null);
-      flushPostFlushCbs();
-      container._vnode = vnode;
-      if (hasMismatch && true) {
-        console.error(`Hydration completed but contains mismatches.`);
+      if (isKeepAlive(initialVNode)) {
+        instance.ctx.renderer = internals;
       }
-    };
-    const hydrateNode = (node, vnode, parentComponent, parentSuspense, slotScopeIds, optimized = false) => {
-      optimized = optimized || !!vnode.dynamicChildren;
-      const isFragmentStart = isComment(node) && node.data === "[";
-      const onMismatch = () => handleMismatch(
-        node,
-        vnode,
-        parentComponent,
-        parentSuspense,
-        slotScopeIds,
-        isFragmentStart
-      );
-      const { type, ref, shapeFlag, patchFlag } = vnode;
-      let domType = node.nodeType;
-      vnode.el = node;
       {
-        if (!("__vnode" in node)) {
-          Object.defineProperty(node, "__vnode", {
-            value: vnode,
-            enumerable: false
-          });
+        {
+          startMeasure(instance, `init`);
         }
-        if (!("__vueParentComponent" in node)) {
-          Object.defineProperty(node, "__vueParentComponent", {
-            value: parentComponent,
-            enumerable: false
-          });
+        setupComponent(instance, false, optimized);
+        {
+          endMeasure(instance, `init`);
         }
       }
-      if (patchFlag === -2) {
-        optimized = false;
-        vnode.dynamicChildren = null;
+      if (instance.asyncDep) {
+        parentSuspense && parentSuspense.registerDep(instance, setupRenderEffect, optimized);
+        if (!initialVNode.el) {
+          const placeholder = instance.subTree = createVNode(Comment);
+          processCommentNode(null, placeholder, container, anchor);
+        }
+      } else {
+        setupRenderEffect(
+          instance,
+          initialVNode,
+          container,
+          anchor,
+          parentSuspense,
+          namespace,
+          optimized
+        );
       }
-      let nextNode = null;
-      switch (type) {
-        case Text:
-          if (domType !== 3 /* TEXT */) {
-            if (vnode.children === "") {
-              insert(vnode.el = createText(""), parentNode(node), node);
-              nextNode = node;
-            } else {
-              nextNode = onMismatch();
-            }
-          } else {
-            if (node.data !== vnode.children) {
-              hasMismatch = true;
-              warn$1(
-                `Hydration text mismatch in`,
-                node.parentNode,
-                `
-  - rendered on server: ${JSON.stringify(
-                node.data
-              )}
-  - expected on client: ${JSON.stringify(vnode.children)}`
-              );
-              node.data = vnode.children;
-            }
-            nextNode = nextSibling(node);
-          }
-          break;
-        case Comment:
-          if (isTemplateNode(node)) {
-            nextNode = nextSibling(node);
-            replaceNode(
-              vnode.el = node.content.firstChild,
-              node,
-              parentComponent
-            );
-          } else if (domType !== 8 /* COMMENT */ || isFragmentStart) {
-            nextNode = onMismatch();
-          } else {
-            nextNode = nextSibling(node);
+      {
+        popWarningContext();
+        endMeasure(instance, `mount`);
+      }
+    };
+    const updateComponent = (n1, n2, optimized) => {
+      const instance = n2.component = n1.component;
+      if (shouldUpdateComponent(n1, n2, optimized)) {
+        if (instance.asyncDep && !instance.asyncResolved) {
+          {
+            pushWarningContext(n2);
           }
-          break;
-        case Static:
-          if (isFragmentStart) {
-            node = nextSibling(node);
-            domType = node.nodeType;
+          updateComponentPreRender(instance, n2, optimized);
+          {
+            popWarningContext();
           }
-          if (domType === 1 /* ELEMENT */ || domType === 3 /* TEXT */) {
-            nextNode = node;
-            const needToAdoptContent = !vnode.children.length;
-            for (let i = 0; i < vnode.staticCount; i++) {
-              if (needToAdoptContent)
-                vnode.children += nextNode.nodeType === 1 /* ELEMENT */ ? nextNode.outerHTML : nextNode.data;
-              if (i === vnode.staticCount - 1) {
-                vnode.anchor = nextNode;
-              }
-              nextNode = nextSibling(nextNode);
-            }
-            return isFragmentStart ? nextSibling(nextNode) : nextNode;
-          } else {
-            onMismatch();
+          return;
+        } else {
+          instance.next = n2;
+          invalidateJob(instance.update);
+          instance.effect.dirty = true;
+          instance.update();
+        }
+      } else {
+        n2.el = n1.el;
+        instance.vnode = n2;
+      }
+    };
+    const setupRenderEffect = (instance, initialVNode, container, anchor, parentSuspense, namespace, optimized) => {
+      const componentUpdateFn = () => {
+        if (!instance.isMounted) {
+          let vnodeHook;
+          const { el, props } = initialVNode;
+          const { bm, m, parent } = instance;
+          const isAsyncWrapperVNode = isAsyncWrapper(initialVNode);
+          toggleRecurse(instance, false);
+          if (bm) {
+            invokeArrayFns(bm);
           }
-          break;
-        case Fragment:
-          if (!isFragmentStart) {
-            nextNode = onMismatch();
-          } else {
-            nextNode = hydrateFragment(
-              node,
-              vnode,
-              parentComponent,
-              parentSuspense,
-              slotScopeIds,
-              optimized
-            );
+          if (!isAsyncWrapperVNode && (vnodeHook = props && props.onVnodeBeforeMount)) {
+            invokeVNodeHook(vnodeHook, parent, initialVNode);
           }
-          break;
-        default:
-          if (shapeFlag & 1) {
-            if ((domType !== 1 /* ELEMENT */ || vnode.type.toLowerCase() !== node.tagName.toLowerCase()) && !isTemplateNode(node)) {
-              nextNode = onMismatch();
-            } else {
-              nextNode = hydrateElement(
-                node,
-                vnode,
-                parentComponent,
+          toggleRecurse(instance, true);
+          if (el && hydrateNode) {
+            const hydrateSubTree = () => {
+              {
+                startMeasure(instance, `render`);
+              }
+              instance.subTree = renderComponentRoot(instance);
+              {
+                endMeasure(instance, `render`);
+              }
+              {
+                startMeasure(instance, `hydrate`);
+              }
+              hydrateNode(
+                el,
+                instance.subTree,
+                instance,
                 parentSuspense,
-                slotScopeIds,
-                optimized
+                null
+              );
+              {
+                endMeasure(instance, `hydrate`);
+              }
+            };
+            if (isAsyncWrapperVNode) {
+              initialVNode.type.__asyncLoader().then(
+                // note: we are moving the render call into an async callback,
+                // which means it won't track dependencies - but it's ok because
+                // a server-rendered async wrapper is already in resolved state
+                // and it will never need to change.
+                () => !instance.isUnmounted && hydrateSubTree()
               );
-            }
-          } else if (shapeFlag & 6) {
-            vnode.slotScopeIds = slotScopeIds;
-            const container = parentNode(node);
-            if (isFragmentStart) {
-              nextNode = locateClosingAnchor(node);
-            } else if (isComment(node) && node.data === "teleport start") {
-              nextNode = locateClosingAnchor(node, node.data, "teleport end");
             } else {
-              nextNode = nextSibling(node);
+              hydrateSubTree();
             }
-            mountComponent(
-              vnode,
-              container,
+          } else {
+            {
+              startMeasure(instance, `render`);
+            }
+            const subTree = instance.subTree = renderComponentRoot(instance);
+            {
+              endMeasure(instance, `render`);
+            }
+            {
+              startMeasure(instance, `patch`);
+            }
+            patch(
               null,
-              parentComponent,
+              subTree,
+              container,
+              anchor,
+              instance,
               parentSuspense,
-              getContainerType(container),
-              optimized
+              namespace
             );
-            if (isAsyncWrapper(vnode)) {
-              let subTree;
-              if (isFragmentStart) {
-                subTree = createVNode(Fragment);
-                subTree.anchor = nextNode ? nextNode.previousSibling : container.lastChild;
-              } else {
-                subTree = node.nodeType === 3 ? createTextVNode("") : createVNode("div");
-              }
-              subTree.el = node;
-              vnode.component.subTree = subTree;
-            }
-          } else if (shapeFlag & 64) {
-            if (domType !== 8 /* COMMENT */) {
-              nextNode = onMismatch();
-            } else {
-              nextNode = vnode.type.hydrate(
-                node,
-                vnode,
-                parentComponent,
-                parentSuspense,
-                slotScopeIds,
-                optimized,
-                rendererInternals,
-                hydrateChildren
-              );
+            {
+              endMeasure(instance, `patch`);
             }
-          } else if (shapeFlag & 128) {
-            nextNode = vnode.type.hydrate(
-              node,
-              vnode,
-              parentComponent,
-              parentSuspense,
-              getContainerType(parentNode(node)),
-              slotScopeIds,
-              optimized,
-              rendererInternals,
-              hydrateNode
+            initialVNode.el = subTree.el;
+          }
+          if (m) {
+            queuePostRenderEffect(m, parentSuspense);
+          }
+          if (!isAsyncWrapperVNode && (vnodeHook = props && props.onVnodeMounted)) {
+            const scopedInitialVNode = initialVNode;
+            queuePostRenderEffect(
+              () => invokeVNodeHook(vnodeHook, parent, scopedInitialVNode),
+              parentSuspense
             );
+          }
+          if (initialVNode.shapeFlag & 256 || parent && isAsyncWrapper(parent.vnode) && parent.vnode.shapeFlag & 256) {
+            instance.a && queuePostRenderEffect(instance.a, parentSuspense);
+          }
+          instance.isMounted = true;
+          {
+            devtoolsComponentAdded(instance);
+          }
+          initialVNode = container = anchor = null;
+        } else {
+          let { next, bu, u, parent, vnode } = instance;
+          {
+            const nonHydratedAsyncRoot = locateNonHydratedAsyncRoot(instance);
+            if (nonHydratedAsyncRoot) {
+              if (next) {
+                next.el = vnode.el;
+                updateComponentPreRender(instance, next, optimized);
+              }
+              nonHydratedAsyncRoot.asyncDep.then(() => {
+                if (!instance.isUnmounted) {
+                  componentUpdateFn();
+                }
+              });
+              return;
+            }
+          }
+          let originNext = next;
+          let vnodeHook;
+          {
+            pushWarningContext(next || instance.vnode);
+          }
+          toggleRecurse(instance, false);
+          if (next) {
+            next.el = vnode.el;
+            updateComponentPreRender(instance, next, optimized);
           } else {
-            warn$1("Invalid HostVNode type:", type, `(${typeof type})`);
+            next = vnode;
           }
-      }
-      if (ref != null) {
-        setRef(ref, null, parentSuspense, vnode);
-      }
-      return nextNode;
-    };
-    const hydrateElement = (el, vnode, parentComponent, parentSuspense, slotScopeIds, optimized) => {
-      optimized = optimized || !!vnode.dynamicChildren;
-      const { type, props, patchFlag, shapeFlag, dirs, transition } = vnode;
-      const forcePatch = type === "input" || type === "option";
-      {
-        if (dirs) {
-          invokeDirectiveHook(vnode, null, parentComponent, "created");
-        }
-        let needCallTransitionHooks = false;
-        if (isTemplateNode(el)) {
-          needCallTransitionHooks = needTransition(parentSuspense, transition) && parentComponent && parentComponent.vnode.props && parentComponent.vnode.props.appear;
-          const content = el.content.firstChild;
-          if (needCallTransitionHooks) {
-            transition.beforeEnter(content);
+          if (bu) {
+            invokeArrayFns(bu);
           }
-          replaceNode(content, el, parentComponent);
-          vnode.el = el = content;
-        }
-        if (shapeFlag & 16 && // skip if element has innerHTML / textContent
-        !(props && (props.innerHTML || props.textContent))) {
-          let next = hydrateChildren(
-            el.firstChild,
-            vnode,
-            el,
-            parentComponent,
+          if (vnodeHook = next.props && next.props.onVnodeBeforeUpdate) {
+            invokeVNodeHook(vnodeHook, parent, next, vnode);
+          }
+          toggleRecurse(instance, true);
+          {
+            startMeasure(instance, `render`);
+          }
+          const nextTree = renderComponentRoot(instance);
+          {
+            endMeasure(instance, `render`);
+          }
+          const prevTree = instance.subTree;
+          instance.subTree = nextTree;
+          {
+            startMeasure(instance, `patch`);
+          }
+          patch(
+            prevTree,
+            nextTree,
+            // parent may have changed if it's in a teleport
+            hostParentNode(prevTree.el),
+            // anchor may have changed if it's in a fragment
+            getNextHostNode(prevTree),
+            instance,
             parentSuspense,
-            slotScopeIds,
-            optimized
+            namespace
           );
-          let hasWarned = false;
-          while (next) {
-            hasMismatch = true;
-            if (!hasWarned) {
-              warn$1(
-                `Hydration children mismatch on`,
-                el,
-                `
-Server rendered element contains more child nodes than client vdom.`
-              );
-              hasWarned = true;
-            }
-            const cur = next;
-            next = next.nextSibling;
-            remove(cur);
+          {
+            endMeasure(instance, `patch`);
+          }
+          next.el = nextTree.el;
+          if (originNext === null) {
+            updateHOCHostEl(instance, nextTree.el);
           }
-        } else if (shapeFlag & 8) {
-          if (el.textContent !== vnode.children) {
-            hasMismatch = true;
-            warn$1(
-              `Hydration text content mismatch on`,
-              el,
-              `
-  - rendered on server: ${el.textContent}
-  - expected on client: ${vnode.children}`
+          if (u) {
+            queuePostRenderEffect(u, parentSuspense);
+          }
+          if (vnodeHook = next.props && next.props.onVnodeUpdated) {
+            queuePostRenderEffect(
+              () => invokeVNodeHook(vnodeHook, parent, next, vnode),
+              parentSuspense
             );
-            el.textContent = vnode.children;
           }
-        }
-        if (props) {
           {
-            for (const key in props) {
-              if (propHasMismatch(el, key, props[key], vnode, parentComponent)) {
-                hasMismatch = true;
-              }
-              if (forcePatch && (key.endsWith("value") || key === "indeterminate") || isOn(key) && !isReservedProp(key) || // force hydrate v-bind with .prop modifiers
-              key[0] === ".") {
-                patchProp(
-                  el,
-                  key,
-                  null,
-                  props[key],
-                  void 0,
-                  void 0,
-                  parentComponent
-                );
-              }
-            }
+            devtoolsComponentUpdated(instance);
+          }
+          {
+            popWarningContext();
           }
         }
-        let vnodeHooks;
-        if (vnodeHooks = props && props.onVnodeBeforeMount) {
-          invokeVNodeHook(vnodeHooks, parentComponent, vnode);
-        }
-        if (dirs) {
-          invokeDirectiveHook(vnode, null, parentComponent, "beforeMount");
-        }
-        if ((vnodeHooks = props && props.onVnodeMounted) || dirs || needCallTransitionHooks) {
-          queueEffectWithSuspense(() => {
-            vnodeHooks && invokeVNodeHook(vnodeHooks, parentComponent, vnode);
-            needCallTransitionHooks && transition.enter(el);
-            dirs && invokeDirectiveHook(vnode, null, parentComponent, "mounted");
-          }, parentSuspense);
+      };
+      const effect = instance.effect = new ReactiveEffect(
+        componentUpdateFn,
+        NOOP,
+        () => queueJob(update),
+        instance.scope
+        // track it in component's effect scope
+      );
+      const update = instance.update = () => {
+        if (effect.dirty) {
+          effect.run();
         }
+      };
+      update.i = instance;
+      update.id = instance.uid;
+      toggleRecurse(instance, true);
+      {
+        effect.onTrack = instance.rtc ? (e) => invokeArrayFns(instance.rtc, e) : void 0;
+        effect.onTrigger = instance.rtg ? (e) => invokeArrayFns(instance.rtg, e) : void 0;
       }
-      return el.nextSibling;
+      update();
     };
-    const hydrateChildren = (node, parentVNode, container, parentComponent, parentSuspense, slotScopeIds, optimized) => {
-      optimized = optimized || !!parentVNode.dynamicChildren;
-      const children = parentVNode.children;
-      const l = children.length;
-      let hasWarned = false;
-      for (let i = 0; i < l; i++) {
-        const vnode = optimized ? children[i] : children[i] = normalizeVNode(children[i]);
-        if (node) {
-          node = hydrateNode(
-            node,
-            vnode,
+    const updateComponentPreRender = (instance, nextVNode, optimized) => {
+      nextVNode.component = instance;
+      const prevProps = instance.vnode.props;
+      instance.vnode = nextVNode;
+      instance.next = null;
+      updateProps(instance, nextVNode.props, prevProps, optimized);
+      updateSlots(instance, nextVNode.children, optimized);
+      pauseTracking();
+      flushPreFlushCbs(instance);
+      resetTracking();
+    };
+    const patchChildren = (n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized = false) => {
+      const c1 = n1 && n1.children;
+      const prevShapeFlag = n1 ? n1.shapeFlag : 0;
+      const c2 = n2.children;
+      const { patchFlag, shapeFlag } = n2;
+      if (patchFlag > 0) {
+        if (patchFlag & 128) {
+          patchKeyedChildren(
+            c1,
+            c2,
+            container,
+            anchor,
             parentComponent,
             parentSuspense,
+            namespace,
             slotScopeIds,
             optimized
           );
-        } else if (vnode.type === Text && !vnode.children) {
-          continue;
-        } else {
-          hasMismatch = true;
-          if (!hasWarned) {
-            warn$1(
-              `Hydration children mismatch on`,
-              container,
-              `
-Server rendered element contains fewer child nodes than client vdom.`
-            );
-            hasWarned = true;
-          }
-          patch(
-            null,
-            vnode,
+          return;
+        } else if (patchFlag & 256) {
+          patchUnkeyedChildren(
+            c1,
+            c2,
             container,
-            null,
+            anchor,
             parentComponent,
             parentSuspense,
-            getContainerType(container),
-            slotScopeIds
+            namespace,
+            slotScopeIds,
+            optimized
           );
+          return;
         }
       }
-      return node;
-    };
-    const hydrateFragment = (node, vnode, parentComponent, parentSuspense, slotScopeIds, optimized) => {
-      const { slotScopeIds: fragmentSlotScopeIds } = vnode;
-      if (fragmentSlotScopeIds) {
-        slotScopeIds = slotScopeIds ? slotScopeIds.concat(fragmentSlotScopeIds) : fragmentSlotScopeIds;
-      }
-      const container = parentNode(node);
-      const next = hydrateChildren(
-        nextSibling(node),
-        vnode,
-        container,
-        parentComponent,
-        parentSuspense,
-        slotScopeIds,
-        optimized
-      );
-      if (next && isComment(next) && next.data === "]") {
-        return nextSibling(vnode.anchor = next);
-      } else {
-        hasMismatch = true;
-        insert(vnode.anchor = createComment(`]`), container, next);
-        return next;
-      }
-    };
-    const handleMismatch = (node, vnode, parentComponent, parentSuspense, slotScopeIds, isFragment) => {
-      hasMismatch = true;
-      warn$1(
-        `Hydration node mismatch:
-- rendered on server:`,
-        node,
-        node.nodeType === 3 /* TEXT */ ? `(text)` : isComment(node) && node.data === "[" ? `(start of fragment)` : ``,
-        `
-- expected on client:`,
-        vnode.type
-      );
-      vnode.el = null;
-      if (isFragment) {
-        const end = locateClosingAnchor(node);
-        while (true) {
-          const next2 = nextSibling(node);
-          if (next2 && next2 !== end) {
-            remove(next2);
-          } else {
-            break;
-          }
-        }
-      }
-      const next = nextSibling(node);
-      const container = parentNode(node);
-      remove(node);
-      patch(
-        null,
-        vnode,
-        container,
-        next,
-        parentComponent,
-        parentSuspense,
-        getContainerType(container),
-        slotScopeIds
-      );
-      return next;
-    };
-    const locateClosingAnchor = (node, open = "[", close = "]") => {
-      let match = 0;
-      while (node) {
-        node = nextSibling(node);
-        if (node && isComment(node)) {
-          if (node.data === open)
-            match++;
-          if (node.data === close) {
-            if (match === 0) {
-              return nextSibling(node);
-            } else {
-              match--;
-            }
-          }
-        }
-      }
-      return node;
-    };
-    const replaceNode = (newNode, oldNode, parentComponent) => {
-      const parentNode2 = oldNode.parentNode;
-      if (parentNode2) {
-        parentNode2.replaceChild(newNode, oldNode);
-      }
-      let parent = parentComponent;
-      while (parent) {
-        if (parent.vnode.el === oldNode) {
-          parent.vnode.el = parent.subTree.el = newNode;
-        }
-        parent = parent.parent;
-      }
-    };
-    const isTemplateNode = (node) => {
-      return node.nodeType === 1 /* ELEMENT */ && node.tagName.toLowerCase() === "template";
-    };
-    return [hydrate, hydrateNode];
-  }
-  function propHasMismatch(el, key, clientValue, vnode, instance) {
-    var _a;
-    let mismatchType;
-    let mismatchKey;
-    let actual;
-    let expected;
-    if (key === "class") {
-      actual = el.getAttribute("class");
-      expected = normalizeClass(clientValue);
-      if (!isSetEqual(toClassSet(actual || ""), toClassSet(expected))) {
-        mismatchType = mismatchKey = `class`;
-      }
-    } else if (key === "style") {
-      actual = el.getAttribute("style");
-      expected = isString(clientValue) ? clientValue : stringifyStyle(normalizeStyle(clientValue));
-      const actualMap = toStyleMap(actual);
-      const expectedMap = toStyleMap(expected);
-      if (vnode.dirs) {
-        for (const { dir, value } of vnode.dirs) {
-          if (dir.name === "show" && !value) {
-            expectedMap.set("display", "none");
-          }
-        }
-      }
-      const root = instance == null ? void 0 : instance.subTree;
-      if (vnode === root || (root == null ? void 0 : root.type) === Fragment && root.children.includes(vnode)) {
-        const cssVars = (_a = instance == null ? void 0 : instance.getCssVars) == null ? void 0 : _a.call(instance);
-        for (const key2 in cssVars) {
-          expectedMap.set(`--${key2}`, String(cssVars[key2]));
-        }
-      }
-      if (!isMapEqual(actualMap, expectedMap)) {
-        mismatchType = mismatchKey = "style";
-      }
-    } else if (el instanceof SVGElement && isKnownSvgAttr(key) || el instanceof HTMLElement && (isBooleanAttr(key) || isKnownHtmlAttr(key))) {
-      if (isBooleanAttr(key)) {
-        actual = el.hasAttribute(key);
-        expected = includeBooleanAttr(clientValue);
-      } else if (clientValue == null) {
-        actual = el.hasAttribute(key);
-        expected = false;
+      if (shapeFlag & 8) {
+        if (prevShapeFlag & 16) {
+          unmountChildren(c1, parentComponent, parentSuspense);
+        }
+        if (c2 !== c1) {
+          hostSetElementText(container, c2);
+        }
       } else {
-        if (el.hasAttribute(key)) {
-          actual = el.getAttribute(key);
-        } else if (key === "value" && el.tagName === "TEXTAREA") {
-          actual = el.value;
+        if (prevShapeFlag & 16) {
+          if (shapeFlag & 16) {
+            patchKeyedChildren(
+              c1,
+              c2,
+              container,
+              anchor,
+              parentComponent,
+              parentSuspense,
+              namespace,
+              slotScopeIds,
+              optimized
+            );
+          } else {
+            unmountChildren(c1, parentComponent, parentSuspense, true);
+          }
         } else {
-          actual = false;
+          if (prevShapeFlag & 8) {
+            hostSetElementText(container, "");
+          }
+          if (shapeFlag & 16) {
+            mountChildren(
+              c2,
+              container,
+              anchor,
+              parentComponent,
+              parentSuspense,
+              namespace,
+              slotScopeIds,
+              optimized
+            );
+          }
         }
-        expected = isRenderableAttrValue(clientValue) ? String(clientValue) : false;
-      }
-      if (actual !== expected) {
-        mismatchType = `attribute`;
-        mismatchKey = key;
-      }
-    }
-    if (mismatchType) {
-      const format = (v) => v === false ? `(not rendered)` : `${mismatchKey}="${v}"`;
-      const preSegment = `Hydration ${mismatchType} mismatch on`;
-      const postSegment = `
-  - rendered on server: ${format(actual)}
-  - expected on client: ${format(expected)}
-  Note: this mismatch is check-only. The DOM will not be rectified in production due to performance overhead.
-  You should fix the source of the mismatch.`;
-      {
-        warn$1(preSegment, el, postSegment);
-      }
-      return true;
-    }
-    return false;
-  }
-  function toClassSet(str) {
-    return new Set(str.trim().split(/\s+/));
-  }
-  function isSetEqual(a, b) {
-    if (a.size !== b.size) {
-      return false;
-    }
-    for (const s of a) {
-      if (!b.has(s)) {
-        return false;
-      }
-    }
-    return true;
-  }
-  function toStyleMap(str) {
-    const styleMap = /* @__PURE__ */ new Map();
-    for (const item of str.split(";")) {
-      let [key, value] = item.split(":");
-      key = key == null ? void 0 : key.trim();
-      value = value == null ? void 0 : value.trim();
-      if (key && value) {
-        styleMap.set(key, value);
-      }
-    }
-    return styleMap;
-  }
-  function isMapEqual(a, b) {
-    if (a.size !== b.size) {
-      return false;
-    }
-    for (const [key, value] of a) {
-      if (value !== b.get(key)) {
-        return false;
-      }
-    }
-    return true;
-  }
-
-  let supported;
-  let perf;
-  function startMeasure(instance, type) {
-    if (instance.appContext.config.performance && isSupported()) {
-      perf.mark(`vue-${type}-${instance.uid}`);
-    }
-    {
-      devtoolsPerfStart(instance, type, isSupported() ? perf.now() : Date.now());
-    }
-  }
-  function endMeasure(instance, type) {
-    if (instance.appContext.config.performance && isSupported()) {
-      const startTag = `vue-${type}-${instance.uid}`;
-      const endTag = startTag + `:end`;
-      perf.mark(endTag);
-      perf.measure(
-        `<${formatComponentName(instance, instance.type)}> ${type}`,
-        startTag,
-        endTag
-      );
-      perf.clearMarks(startTag);
-      perf.clearMarks(endTag);
-    }
-    {
-      devtoolsPerfEnd(instance, type, isSupported() ? perf.now() : Date.now());
-    }
-  }
-  function isSupported() {
-    if (supported !== void 0) {
-      return supported;
-    }
-    if (typeof window !== "undefined" && window.performance) {
-      supported = true;
-      perf = window.performance;
-    } else {
-      supported = false;
-    }
-    return supported;
-  }
-
-  const queuePostRenderEffect = queueEffectWithSuspense ;
-  function createRenderer(options) {
-    return baseCreateRenderer(options);
-  }
-  function createHydrationRenderer(options) {
-    return baseCreateRenderer(options, createHydrationFunctions);
-  }
-  function baseCreateRenderer(options, createHydrationFns) {
-    const target = getGlobalThis();
-    target.__VUE__ = true;
-    {
-      setDevtoolsHook$1(target.__VUE_DEVTOOLS_GLOBAL_HOOK__, target);
-    }
-    const {
-      insert: hostInsert,
-      remove: hostRemove,
-      patchProp: hostPatchProp,
-      createElement: hostCreateElement,
-      createText: hostCreateText,
-      createComment: hostCreateComment,
-      setText: hostSetText,
-      setElementText: hostSetElementText,
-      parentNode: hostParentNode,
-      nextSibling: hostNextSibling,
-      setScopeId: hostSetScopeId = NOOP,
-      insertStaticContent: hostInsertStaticContent
-    } = options;
-    const patch = (n1, n2, container, anchor = null, parentComponent = null, parentSuspense = null, namespace = void 0, slotScopeIds = null, optimized = isHmrUpdating ? false : !!n2.dynamicChildren) => {
-      if (n1 === n2) {
-        return;
       }
-      if (n1 && !isSameVNodeType(n1, n2)) {
-        anchor = getNextHostNode(n1);
-        unmount(n1, parentComponent, parentSuspense, true);
-        n1 = null;
+    };
+    const patchUnkeyedChildren = (c1, c2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
+      c1 = c1 || EMPTY_ARR;
+      c2 = c2 || EMPTY_ARR;
+      const oldLength = c1.length;
+      const newLength = c2.length;
+      const commonLength = Math.min(oldLength, newLength);
+      let i;
+      for (i = 0; i < commonLength; i++) {
+        const nextChild = c2[i] = optimized ? cloneIfMounted(c2[i]) : normalizeVNode(c2[i]);
+        patch(
+          c1[i],
+          nextChild,
+          container,
+          null,
+          parentComponent,
+          parentSuspense,
+          namespace,
+          slotScopeIds,
+          optimized
+        );
       }
-      if (n2.patchFlag === -2) {
-        optimized = false;
-        n2.dynamicChildren = null;
+      if (oldLength > newLength) {
+        unmountChildren(
+          c1,
+          parentComponent,
+          parentSuspense,
+          true,
+          false,
+          commonLength
+        );
+      } else {
+        mountChildren(
+          c2,
+          container,
+          anchor,
+          parentComponent,
+          parentSuspense,
+          namespace,
+          slotScopeIds,
+          optimized,
+          commonLength
+        );
       }
-      const { type, ref, shapeFlag } = n2;
-      switch (type) {
-        case Text:
-          processText(n1, n2, container, anchor);
-          break;
-        case Comment:
-          processCommentNode(n1, n2, container, anchor);
-          break;
-        case Static:
-          if (n1 == null) {
-            mountStaticNode(n2, container, anchor, namespace);
-          } else {
-            patchStaticNode(n1, n2, container, namespace);
-          }
+    };
+    const patchKeyedChildren = (c1, c2, container, parentAnchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
+      let i = 0;
+      const l2 = c2.length;
+      let e1 = c1.length - 1;
+      let e2 = l2 - 1;
+      while (i <= e1 && i <= e2) {
+        const n1 = c1[i];
+        const n2 = c2[i] = optimized ? cloneIfMounted(c2[i]) : normalizeVNode(c2[i]);
+        if (isSameVNodeType(n1, n2)) {
+          patch(
+            n1,
+            n2,
+            container,
+            null,
+            parentComponent,
+            parentSuspense,
+            namespace,
+            slotScopeIds,
+            optimized
+          );
+        } else {
           break;
-        case Fragment:
-          processFragment(
+        }
+        i++;
+      }
+      while (i <= e1 && i <= e2) {
+        const n1 = c1[e1];
+        const n2 = c2[e2] = optimized ? cloneIfMounted(c2[e2]) : normalizeVNode(c2[e2]);
+        if (isSameVNodeType(n1, n2)) {
+          patch(
             n1,
             n2,
             container,
-            anchor,
+            null,
             parentComponent,
             parentSuspense,
             namespace,
             slotScopeIds,
             optimized
           );
+        } else {
           break;
-        default:
-          if (shapeFlag & 1) {
-            processElement(
-              n1,
-              n2,
+        }
+        e1--;
+        e2--;
+      }
+      if (i > e1) {
+        if (i <= e2) {
+          const nextPos = e2 + 1;
+          const anchor = nextPos < l2 ? c2[nextPos].el : parentAnchor;
+          while (i <= e2) {
+            patch(
+              null,
+              c2[i] = optimized ? cloneIfMounted(c2[i]) : normalizeVNode(c2[i]),
               container,
               anchor,
               parentComponent,
@@ -6843,1716 +6858,1807 @@ Server rendered element contains fewer child nodes than client vdom.`
               slotScopeIds,
               optimized
             );
-          } else if (shapeFlag & 6) {
-            processComponent(
-              n1,
-              n2,
+            i++;
+          }
+        }
+      } else if (i > e2) {
+        while (i <= e1) {
+          unmount(c1[i], parentComponent, parentSuspense, true);
+          i++;
+        }
+      } else {
+        const s1 = i;
+        const s2 = i;
+        const keyToNewIndexMap = /* @__PURE__ */ new Map();
+        for (i = s2; i <= e2; i++) {
+          const nextChild = c2[i] = optimized ? cloneIfMounted(c2[i]) : normalizeVNode(c2[i]);
+          if (nextChild.key != null) {
+            if (keyToNewIndexMap.has(nextChild.key)) {
+              warn$1(
+                `Duplicate keys found during update:`,
+                JSON.stringify(nextChild.key),
+                `Make sure keys are unique.`
+              );
+            }
+            keyToNewIndexMap.set(nextChild.key, i);
+          }
+        }
+        let j;
+        let patched = 0;
+        const toBePatched = e2 - s2 + 1;
+        let moved = false;
+        let maxNewIndexSoFar = 0;
+        const newIndexToOldIndexMap = new Array(toBePatched);
+        for (i = 0; i < toBePatched; i++) newIndexToOldIndexMap[i] = 0;
+        for (i = s1; i <= e1; i++) {
+          const prevChild = c1[i];
+          if (patched >= toBePatched) {
+            unmount(prevChild, parentComponent, parentSuspense, true);
+            continue;
+          }
+          let newIndex;
+          if (prevChild.key != null) {
+            newIndex = keyToNewIndexMap.get(prevChild.key);
+          } else {
+            for (j = s2; j <= e2; j++) {
+              if (newIndexToOldIndexMap[j - s2] === 0 && isSameVNodeType(prevChild, c2[j])) {
+                newIndex = j;
+                break;
+              }
+            }
+          }
+          if (newIndex === void 0) {
+            unmount(prevChild, parentComponent, parentSuspense, true);
+          } else {
+            newIndexToOldIndexMap[newIndex - s2] = i + 1;
+            if (newIndex >= maxNewIndexSoFar) {
+              maxNewIndexSoFar = newIndex;
+            } else {
+              moved = true;
+            }
+            patch(
+              prevChild,
+              c2[newIndex],
               container,
-              anchor,
+              null,
               parentComponent,
               parentSuspense,
               namespace,
               slotScopeIds,
               optimized
             );
-          } else if (shapeFlag & 64) {
-            type.process(
-              n1,
-              n2,
-              container,
-              anchor,
-              parentComponent,
-              parentSuspense,
-              namespace,
-              slotScopeIds,
-              optimized,
-              internals
-            );
-          } else if (shapeFlag & 128) {
-            type.process(
-              n1,
-              n2,
-              container,
-              anchor,
-              parentComponent,
-              parentSuspense,
-              namespace,
-              slotScopeIds,
-              optimized,
-              internals
-            );
-          } else {
-            warn$1("Invalid VNode type:", type, `(${typeof type})`);
+            patched++;
           }
-      }
-      if (ref != null && parentComponent) {
-        setRef(ref, n1 && n1.ref, parentSuspense, n2 || n1, !n2);
-      }
-    };
-    const processText = (n1, n2, container, anchor) => {
-      if (n1 == null) {
-        hostInsert(
-          n2.el = hostCreateText(n2.children),
-          container,
-          anchor
-        );
-      } else {
-        const el = n2.el = n1.el;
-        if (n2.children !== n1.children) {
-          hostSetText(el, n2.children);
         }
-      }
-    };
-    const processCommentNode = (n1, n2, container, anchor) => {
-      if (n1 == null) {
-        hostInsert(
-          n2.el = hostCreateComment(n2.children || ""),
-          container,
-          anchor
-        );
-      } else {
-        n2.el = n1.el;
-      }
-    };
-    const mountStaticNode = (n2, container, anchor, namespace) => {
-      [n2.el, n2.anchor] = hostInsertStaticContent(
-        n2.children,
-        container,
-        anchor,
-        namespace,
-        n2.el,
-        n2.anchor
-      );
-    };
-    const patchStaticNode = (n1, n2, container, namespace) => {
-      if (n2.children !== n1.children) {
-        const anchor = hostNextSibling(n1.anchor);
-        removeStaticNode(n1);
-        [n2.el, n2.anchor] = hostInsertStaticContent(
-          n2.children,
-          container,
-          anchor,
-          namespace
-        );
-      } else {
-        n2.el = n1.el;
-        n2.anchor = n1.anchor;
-      }
-    };
-    const moveStaticNode = ({ el, anchor }, container, nextSibling) => {
-      let next;
-      while (el && el !== anchor) {
-        next = hostNextSibling(el);
-        hostInsert(el, container, nextSibling);
-        el = next;
-      }
-      hostInsert(anchor, container, nextSibling);
-    };
-    const removeStaticNode = ({ el, anchor }) => {
-      let next;
-      while (el && el !== anchor) {
-        next = hostNextSibling(el);
-        hostRemove(el);
-        el = next;
-      }
-      hostRemove(anchor);
-    };
-    const processElement = (n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
-      if (n2.type === "svg") {
-        namespace = "svg";
-      } else if (n2.type === "math") {
-        namespace = "mathml";
-      }
-      if (n1 == null) {
-        mountElement(
-          n2,
-          container,
-          anchor,
-          parentComponent,
-          parentSuspense,
-          namespace,
-          slotScopeIds,
-          optimized
-        );
-      } else {
-        patchElement(
-          n1,
-          n2,
-          parentComponent,
-          parentSuspense,
-          namespace,
-          slotScopeIds,
-          optimized
-        );
-      }
-    };
-    const mountElement = (vnode, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
-      let el;
-      let vnodeHook;
-      const { props, shapeFlag, transition, dirs } = vnode;
-      el = vnode.el = hostCreateElement(
-        vnode.type,
-        namespace,
-        props && props.is,
-        props
-      );
-      if (shapeFlag & 8) {
-        hostSetElementText(el, vnode.children);
-      } else if (shapeFlag & 16) {
-        mountChildren(
-          vnode.children,
-          el,
-          null,
-          parentComponent,
-          parentSuspense,
-          resolveChildrenNamespace(vnode, namespace),
-          slotScopeIds,
-          optimized
-        );
-      }
-      if (dirs) {
-        invokeDirectiveHook(vnode, null, parentComponent, "created");
-      }
-      setScopeId(el, vnode, vnode.scopeId, slotScopeIds, parentComponent);
-      if (props) {
-        for (const key in props) {
-          if (key !== "value" && !isReservedProp(key)) {
-            hostPatchProp(
-              el,
-              key,
+        const increasingNewIndexSequence = moved ? getSequence(newIndexToOldIndexMap) : EMPTY_ARR;
+        j = increasingNewIndexSequence.length - 1;
+        for (i = toBePatched - 1; i >= 0; i--) {
+          const nextIndex = s2 + i;
+          const nextChild = c2[nextIndex];
+          const anchor = nextIndex + 1 < l2 ? c2[nextIndex + 1].el : parentAnchor;
+          if (newIndexToOldIndexMap[i] === 0) {
+            patch(
               null,
-              props[key],
-              namespace,
-              vnode.children,
+              nextChild,
+              container,
+              anchor,
               parentComponent,
               parentSuspense,
-              unmountChildren
+              namespace,
+              slotScopeIds,
+              optimized
             );
+          } else if (moved) {
+            if (j < 0 || i !== increasingNewIndexSequence[j]) {
+              move(nextChild, container, anchor, 2);
+            } else {
+              j--;
+            }
           }
         }
-        if ("value" in props) {
-          hostPatchProp(el, "value", null, props.value, namespace);
-        }
-        if (vnodeHook = props.onVnodeBeforeMount) {
-          invokeVNodeHook(vnodeHook, parentComponent, vnode);
-        }
-      }
-      {
-        Object.defineProperty(el, "__vnode", {
-          value: vnode,
-          enumerable: false
-        });
-        Object.defineProperty(el, "__vueParentComponent", {
-          value: parentComponent,
-          enumerable: false
-        });
-      }
-      if (dirs) {
-        invokeDirectiveHook(vnode, null, parentComponent, "beforeMount");
       }
-      const needCallTransitionHooks = needTransition(parentSuspense, transition);
-      if (needCallTransitionHooks) {
-        transition.beforeEnter(el);
+    };
+    const move = (vnode, container, anchor, moveType, parentSuspense = null) => {
+      const { el, type, transition, children, shapeFlag } = vnode;
+      if (shapeFlag & 6) {
+        move(vnode.component.subTree, container, anchor, moveType);
+        return;
       }
-      hostInsert(el, container, anchor);
-      if ((vnodeHook = props && props.onVnodeMounted) || needCallTransitionHooks || dirs) {
-        queuePostRenderEffect(() => {
-          vnodeHook && invokeVNodeHook(vnodeHook, parentComponent, vnode);
-          needCallTransitionHooks && transition.enter(el);
-          dirs && invokeDirectiveHook(vnode, null, parentComponent, "mounted");
-        }, parentSuspense);
+      if (shapeFlag & 128) {
+        vnode.suspense.move(container, anchor, moveType);
+        return;
       }
-    };
-    const setScopeId = (el, vnode, scopeId, slotScopeIds, parentComponent) => {
-      if (scopeId) {
-        hostSetScopeId(el, scopeId);
+      if (shapeFlag & 64) {
+        type.move(vnode, container, anchor, internals);
+        return;
       }
-      if (slotScopeIds) {
-        for (let i = 0; i < slotScopeIds.length; i++) {
-          hostSetScopeId(el, slotScopeIds[i]);
+      if (type === Fragment) {
+        hostInsert(el, container, anchor);
+        for (let i = 0; i < children.length; i++) {
+          move(children[i], container, anchor, moveType);
         }
+        hostInsert(vnode.anchor, container, anchor);
+        return;
       }
-      if (parentComponent) {
-        let subTree = parentComponent.subTree;
-        if (subTree.patchFlag > 0 && subTree.patchFlag & 2048) {
-          subTree = filterSingleRoot(subTree.children) || subTree;
-        }
-        if (vnode === subTree) {
-          const parentVNode = parentComponent.vnode;
-          setScopeId(
-            el,
-            parentVNode,
-            parentVNode.scopeId,
-            parentVNode.slotScopeIds,
-            parentComponent.parent
-          );
+      if (type === Static) {
+        moveStaticNode(vnode, container, anchor);
+        return;
+      }
+      const needTransition2 = moveType !== 2 && shapeFlag & 1 && transition;
+      if (needTransition2) {
+        if (moveType === 0) {
+          transition.beforeEnter(el);
+          hostInsert(el, container, anchor);
+          queuePostRenderEffect(() => transition.enter(el), parentSuspense);
+        } else {
+          const { leave, delayLeave, afterLeave } = transition;
+          const remove2 = () => hostInsert(el, container, anchor);
+          const performLeave = () => {
+            leave(el, () => {
+              remove2();
+              afterLeave && afterLeave();
+            });
+          };
+          if (delayLeave) {
+            delayLeave(el, remove2, performLeave);
+          } else {
+            performLeave();
+          }
         }
+      } else {
+        hostInsert(el, container, anchor);
       }
     };
-    const mountChildren = (children, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized, start = 0) => {
-      for (let i = start; i < children.length; i++) {
-        const child = children[i] = optimized ? cloneIfMounted(children[i]) : normalizeVNode(children[i]);
-        patch(
-          null,
-          child,
-          container,
-          anchor,
-          parentComponent,
-          parentSuspense,
-          namespace,
-          slotScopeIds,
-          optimized
-        );
+    const unmount = (vnode, parentComponent, parentSuspense, doRemove = false, optimized = false) => {
+      const {
+        type,
+        props,
+        ref,
+        children,
+        dynamicChildren,
+        shapeFlag,
+        patchFlag,
+        dirs,
+        cacheIndex
+      } = vnode;
+      if (patchFlag === -2) {
+        optimized = false;
       }
-    };
-    const patchElement = (n1, n2, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
-      const el = n2.el = n1.el;
-      let { patchFlag, dynamicChildren, dirs } = n2;
-      patchFlag |= n1.patchFlag & 16;
-      const oldProps = n1.props || EMPTY_OBJ;
-      const newProps = n2.props || EMPTY_OBJ;
-      let vnodeHook;
-      parentComponent && toggleRecurse(parentComponent, false);
-      if (vnodeHook = newProps.onVnodeBeforeUpdate) {
-        invokeVNodeHook(vnodeHook, parentComponent, n2, n1);
+      if (ref != null) {
+        setRef(ref, null, parentSuspense, vnode, true);
       }
-      if (dirs) {
-        invokeDirectiveHook(n2, n1, parentComponent, "beforeUpdate");
+      if (cacheIndex != null) {
+        parentComponent.renderCache[cacheIndex] = void 0;
       }
-      parentComponent && toggleRecurse(parentComponent, true);
-      if (isHmrUpdating) {
-        patchFlag = 0;
-        optimized = false;
-        dynamicChildren = null;
+      if (shapeFlag & 256) {
+        parentComponent.ctx.deactivate(vnode);
+        return;
       }
-      if (dynamicChildren) {
-        patchBlockChildren(
-          n1.dynamicChildren,
-          dynamicChildren,
-          el,
-          parentComponent,
-          parentSuspense,
-          resolveChildrenNamespace(n2, namespace),
-          slotScopeIds
-        );
-        {
-          traverseStaticChildren(n1, n2);
-        }
-      } else if (!optimized) {
-        patchChildren(
-          n1,
-          n2,
-          el,
-          null,
-          parentComponent,
-          parentSuspense,
-          resolveChildrenNamespace(n2, namespace),
-          slotScopeIds,
-          false
-        );
+      const shouldInvokeDirs = shapeFlag & 1 && dirs;
+      const shouldInvokeVnodeHook = !isAsyncWrapper(vnode);
+      let vnodeHook;
+      if (shouldInvokeVnodeHook && (vnodeHook = props && props.onVnodeBeforeUnmount)) {
+        invokeVNodeHook(vnodeHook, parentComponent, vnode);
       }
-      if (patchFlag > 0) {
-        if (patchFlag & 16) {
-          patchProps(
-            el,
-            n2,
-            oldProps,
-            newProps,
+      if (shapeFlag & 6) {
+        unmountComponent(vnode.component, parentSuspense, doRemove);
+      } else {
+        if (shapeFlag & 128) {
+          vnode.suspense.unmount(parentSuspense, doRemove);
+          return;
+        }
+        if (shouldInvokeDirs) {
+          invokeDirectiveHook(vnode, null, parentComponent, "beforeUnmount");
+        }
+        if (shapeFlag & 64) {
+          vnode.type.remove(
+            vnode,
             parentComponent,
             parentSuspense,
-            namespace
+            internals,
+            doRemove
           );
-        } else {
-          if (patchFlag & 2) {
-            if (oldProps.class !== newProps.class) {
-              hostPatchProp(el, "class", null, newProps.class, namespace);
-            }
-          }
-          if (patchFlag & 4) {
-            hostPatchProp(el, "style", oldProps.style, newProps.style, namespace);
-          }
-          if (patchFlag & 8) {
-            const propsToUpdate = n2.dynamicProps;
-            for (let i = 0; i < propsToUpdate.length; i++) {
-              const key = propsToUpdate[i];
-              const prev = oldProps[key];
-              const next = newProps[key];
-              if (next !== prev || key === "value") {
-                hostPatchProp(
-                  el,
-                  key,
-                  prev,
-                  next,
-                  namespace,
-                  n1.children,
-                  parentComponent,
-                  parentSuspense,
-                  unmountChildren
-                );
-              }
+        } else if (dynamicChildren && // #5154
+        // when v-once is used inside a block, setBlockTracking(-1) marks the
+        // parent block with hasOnce: true
+        // so that it doesn't take the fast path during unmount - otherwise
+        // components nested in v-once are never unmounted.
+        !dynamicChildren.hasOnce && // #1153: fast path should not be taken for non-stable (v-for) fragments
+        (type !== Fragment || patchFlag > 0 && patchFlag & 64)) {
+          unmountChildren(
+            dynamicChildren,
+            parentComponent,
+            parentSuspense,
+            false,
+            true
+          );
+        } else if (type === Fragment && patchFlag & (128 | 256) || !optimized && shapeFlag & 16) {
+          unmountChildren(children, parentComponent, parentSuspense);
+        }
+        if (doRemove) {
+          remove(vnode);
+        }
+      }
+      if (shouldInvokeVnodeHook && (vnodeHook = props && props.onVnodeUnmounted) || shouldInvokeDirs) {
+        queuePostRenderEffect(() => {
+          vnodeHook && invokeVNodeHook(vnodeHook, parentComponent, vnode);
+          shouldInvokeDirs && invokeDirectiveHook(vnode, null, parentComponent, "unmounted");
+        }, parentSuspense);
+      }
+    };
+    const remove = (vnode) => {
+      const { type, el, anchor, transition } = vnode;
+      if (type === Fragment) {
+        if (vnode.patchFlag > 0 && vnode.patchFlag & 2048 && transition && !transition.persisted) {
+          vnode.children.forEach((child) => {
+            if (child.type === Comment) {
+              hostRemove(child.el);
+            } else {
+              remove(child);
             }
-          }
+          });
+        } else {
+          removeFragment(el, anchor);
         }
-        if (patchFlag & 1) {
-          if (n1.children !== n2.children) {
-            hostSetElementText(el, n2.children);
-          }
+        return;
+      }
+      if (type === Static) {
+        removeStaticNode(vnode);
+        return;
+      }
+      const performRemove = () => {
+        hostRemove(el);
+        if (transition && !transition.persisted && transition.afterLeave) {
+          transition.afterLeave();
         }
-      } else if (!optimized && dynamicChildren == null) {
-        patchProps(
-          el,
-          n2,
-          oldProps,
-          newProps,
-          parentComponent,
-          parentSuspense,
-          namespace
-        );
+      };
+      if (vnode.shapeFlag & 1 && transition && !transition.persisted) {
+        const { leave, delayLeave } = transition;
+        const performLeave = () => leave(el, performRemove);
+        if (delayLeave) {
+          delayLeave(vnode.el, performRemove, performLeave);
+        } else {
+          performLeave();
+        }
+      } else {
+        performRemove();
       }
-      if ((vnodeHook = newProps.onVnodeUpdated) || dirs) {
-        queuePostRenderEffect(() => {
-          vnodeHook && invokeVNodeHook(vnodeHook, parentComponent, n2, n1);
-          dirs && invokeDirectiveHook(n2, n1, parentComponent, "updated");
-        }, parentSuspense);
+    };
+    const removeFragment = (cur, end) => {
+      let next;
+      while (cur !== end) {
+        next = hostNextSibling(cur);
+        hostRemove(cur);
+        cur = next;
       }
+      hostRemove(end);
     };
-    const patchBlockChildren = (oldChildren, newChildren, fallbackContainer, parentComponent, parentSuspense, namespace, slotScopeIds) => {
-      for (let i = 0; i < newChildren.length; i++) {
-        const oldVNode = oldChildren[i];
-        const newVNode = newChildren[i];
-        const container = (
-          // oldVNode may be an errored async setup() component inside Suspense
-          // which will not have a mounted element
-          oldVNode.el && // - In the case of a Fragment, we need to provide the actual parent
-          // of the Fragment itself so it can move its children.
-          (oldVNode.type === Fragment || // - In the case of different nodes, there is going to be a replacement
-          // which also requires the correct parent container
-          !isSameVNodeType(oldVNode, newVNode) || // - In the case of a component, it could contain anything.
-          oldVNode.shapeFlag & (6 | 64)) ? hostParentNode(oldVNode.el) : (
-            // In other cases, the parent container is not actually used so we
-            // just pass the block element here to avoid a DOM parentNode call.
-            fallbackContainer
-          )
-        );
+    const unmountComponent = (instance, parentSuspense, doRemove) => {
+      if (instance.type.__hmrId) {
+        unregisterHMR(instance);
+      }
+      const { bum, scope, update, subTree, um, m, a } = instance;
+      invalidateMount(m);
+      invalidateMount(a);
+      if (bum) {
+        invokeArrayFns(bum);
+      }
+      scope.stop();
+      if (update) {
+        update.active = false;
+        unmount(subTree, instance, parentSuspense, doRemove);
+      }
+      if (um) {
+        queuePostRenderEffect(um, parentSuspense);
+      }
+      queuePostRenderEffect(() => {
+        instance.isUnmounted = true;
+      }, parentSuspense);
+      if (parentSuspense && parentSuspense.pendingBranch && !parentSuspense.isUnmounted && instance.asyncDep && !instance.asyncResolved && instance.suspenseId === parentSuspense.pendingId) {
+        parentSuspense.deps--;
+        if (parentSuspense.deps === 0) {
+          parentSuspense.resolve();
+        }
+      }
+      {
+        devtoolsComponentRemoved(instance);
+      }
+    };
+    const unmountChildren = (children, parentComponent, parentSuspense, doRemove = false, optimized = false, start = 0) => {
+      for (let i = start; i < children.length; i++) {
+        unmount(children[i], parentComponent, parentSuspense, doRemove, optimized);
+      }
+    };
+    const getNextHostNode = (vnode) => {
+      if (vnode.shapeFlag & 6) {
+        return getNextHostNode(vnode.component.subTree);
+      }
+      if (vnode.shapeFlag & 128) {
+        return vnode.suspense.next();
+      }
+      const el = hostNextSibling(vnode.anchor || vnode.el);
+      const teleportEnd = el && el[TeleportEndKey];
+      return teleportEnd ? hostNextSibling(teleportEnd) : el;
+    };
+    let isFlushing = false;
+    const render = (vnode, container, namespace) => {
+      if (vnode == null) {
+        if (container._vnode) {
+          unmount(container._vnode, null, null, true);
+        }
+      } else {
         patch(
-          oldVNode,
-          newVNode,
+          container._vnode || null,
+          vnode,
           container,
           null,
-          parentComponent,
-          parentSuspense,
-          namespace,
-          slotScopeIds,
-          true
+          null,
+          null,
+          namespace
         );
       }
+      container._vnode = vnode;
+      if (!isFlushing) {
+        isFlushing = true;
+        flushPreFlushCbs();
+        flushPostFlushCbs();
+        isFlushing = false;
+      }
     };
-    const patchProps = (el, vnode, oldProps, newProps, parentComponent, parentSuspense, namespace) => {
-      if (oldProps !== newProps) {
-        if (oldProps !== EMPTY_OBJ) {
-          for (const key in oldProps) {
-            if (!isReservedProp(key) && !(key in newProps)) {
-              hostPatchProp(
-                el,
-                key,
-                oldProps[key],
-                null,
-                namespace,
-                vnode.children,
-                parentComponent,
-                parentSuspense,
-                unmountChildren
-              );
-            }
+    const internals = {
+      p: patch,
+      um: unmount,
+      m: move,
+      r: remove,
+      mt: mountComponent,
+      mc: mountChildren,
+      pc: patchChildren,
+      pbc: patchBlockChildren,
+      n: getNextHostNode,
+      o: options
+    };
+    let hydrate;
+    let hydrateNode;
+    if (createHydrationFns) {
+      [hydrate, hydrateNode] = createHydrationFns(
+        internals
+      );
+    }
+    return {
+      render,
+      hydrate,
+      createApp: createAppAPI(render, hydrate)
+    };
+  }
+  function resolveChildrenNamespace({ type, props }, currentNamespace) {
+    return currentNamespace === "svg" && type === "foreignObject" || currentNamespace === "mathml" && type === "annotation-xml" && props && props.encoding && props.encoding.includes("html") ? void 0 : currentNamespace;
+  }
+  function toggleRecurse({ effect, update }, allowed) {
+    effect.allowRecurse = update.allowRecurse = allowed;
+  }
+  function needTransition(parentSuspense, transition) {
+    return (!parentSuspense || parentSuspense && !parentSuspense.pendingBranch) && transition && !transition.persisted;
+  }
+  function traverseStaticChildren(n1, n2, shallow = false) {
+    const ch1 = n1.children;
+    const ch2 = n2.children;
+    if (isArray(ch1) && isArray(ch2)) {
+      for (let i = 0; i < ch1.length; i++) {
+        const c1 = ch1[i];
+        let c2 = ch2[i];
+        if (c2.shapeFlag & 1 && !c2.dynamicChildren) {
+          if (c2.patchFlag <= 0 || c2.patchFlag === 32) {
+            c2 = ch2[i] = cloneIfMounted(ch2[i]);
+            c2.el = c1.el;
           }
+          if (!shallow && c2.patchFlag !== -2)
+            traverseStaticChildren(c1, c2);
         }
-        for (const key in newProps) {
-          if (isReservedProp(key))
-            continue;
-          const next = newProps[key];
-          const prev = oldProps[key];
-          if (next !== prev && key !== "value") {
-            hostPatchProp(
-              el,
-              key,
-              prev,
-              next,
-              namespace,
-              vnode.children,
-              parentComponent,
-              parentSuspense,
-              unmountChildren
-            );
+        if (c2.type === Text) {
+          c2.el = c1.el;
+        }
+        if (c2.type === Comment && !c2.el) {
+          c2.el = c1.el;
+        }
+      }
+    }
+  }
+  function getSequence(arr) {
+    const p = arr.slice();
+    const result = [0];
+    let i, j, u, v, c;
+    const len = arr.length;
+    for (i = 0; i < len; i++) {
+      const arrI = arr[i];
+      if (arrI !== 0) {
+        j = result[result.length - 1];
+        if (arr[j] < arrI) {
+          p[i] = j;
+          result.push(i);
+          continue;
+        }
+        u = 0;
+        v = result.length - 1;
+        while (u < v) {
+          c = u + v >> 1;
+          if (arr[result[c]] < arrI) {
+            u = c + 1;
+          } else {
+            v = c;
           }
         }
-        if ("value" in newProps) {
-          hostPatchProp(el, "value", oldProps.value, newProps.value, namespace);
+        if (arrI < arr[result[u]]) {
+          if (u > 0) {
+            p[i] = result[u - 1];
+          }
+          result[u] = i;
         }
       }
-    };
-    const processFragment = (n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
-      const fragmentStartAnchor = n2.el = n1 ? n1.el : hostCreateText("");
-      const fragmentEndAnchor = n2.anchor = n1 ? n1.anchor : hostCreateText("");
-      let { patchFlag, dynamicChildren, slotScopeIds: fragmentSlotScopeIds } = n2;
-      if (
-        // #5523 dev root fragment may inherit directives
-        isHmrUpdating || patchFlag & 2048
-      ) {
-        patchFlag = 0;
-        optimized = false;
-        dynamicChildren = null;
+    }
+    u = result.length;
+    v = result[u - 1];
+    while (u-- > 0) {
+      result[u] = v;
+      v = p[v];
+    }
+    return result;
+  }
+  function locateNonHydratedAsyncRoot(instance) {
+    const subComponent = instance.subTree.component;
+    if (subComponent) {
+      if (subComponent.asyncDep && !subComponent.asyncResolved) {
+        return subComponent;
+      } else {
+        return locateNonHydratedAsyncRoot(subComponent);
+      }
+    }
+  }
+  function invalidateMount(hooks) {
+    if (hooks) {
+      for (let i = 0; i < hooks.length; i++) hooks[i].active = false;
+    }
+  }
+
+  const ssrContextKey = Symbol.for("v-scx");
+  const useSSRContext = () => {
+    {
+      warn$1(`useSSRContext() is not supported in the global build.`);
+    }
+  };
+
+  function watchEffect(effect, options) {
+    return doWatch(effect, null, options);
+  }
+  function watchPostEffect(effect, options) {
+    return doWatch(
+      effect,
+      null,
+      extend({}, options, { flush: "post" }) 
+    );
+  }
+  function watchSyncEffect(effect, options) {
+    return doWatch(
+      effect,
+      null,
+      extend({}, options, { flush: "sync" }) 
+    );
+  }
+  const INITIAL_WATCHER_VALUE = {};
+  function watch(source, cb, options) {
+    if (!isFunction(cb)) {
+      warn$1(
+        `\`watch(fn, options?)\` signature has been moved to a separate API. Use \`watchEffect(fn, options?)\` instead. \`watch\` now only supports \`watch(source, cb, options?) signature.`
+      );
+    }
+    return doWatch(source, cb, options);
+  }
+  function doWatch(source, cb, {
+    immediate,
+    deep,
+    flush,
+    once,
+    onTrack,
+    onTrigger
+  } = EMPTY_OBJ) {
+    if (cb && once) {
+      const _cb = cb;
+      cb = (...args) => {
+        _cb(...args);
+        unwatch();
+      };
+    }
+    if (deep !== void 0 && typeof deep === "number") {
+      warn$1(
+        `watch() "deep" option with number value will be used as watch depth in future versions. Please use a boolean instead to avoid potential breakage.`
+      );
+    }
+    if (!cb) {
+      if (immediate !== void 0) {
+        warn$1(
+          `watch() "immediate" option is only respected when using the watch(source, callback, options?) signature.`
+        );
       }
-      if (fragmentSlotScopeIds) {
-        slotScopeIds = slotScopeIds ? slotScopeIds.concat(fragmentSlotScopeIds) : fragmentSlotScopeIds;
+      if (deep !== void 0) {
+        warn$1(
+          `watch() "deep" option is only respected when using the watch(source, callback, options?) signature.`
+        );
       }
-      if (n1 == null) {
-        hostInsert(fragmentStartAnchor, container, anchor);
-        hostInsert(fragmentEndAnchor, container, anchor);
-        mountChildren(
-          // #10007
-          // such fragment like `<></>` will be compiled into
-          // a fragment which doesn't have a children.
-          // In this case fallback to an empty array
-          n2.children || [],
-          container,
-          fragmentEndAnchor,
-          parentComponent,
-          parentSuspense,
-          namespace,
-          slotScopeIds,
-          optimized
+      if (once !== void 0) {
+        warn$1(
+          `watch() "once" option is only respected when using the watch(source, callback, options?) signature.`
         );
-      } else {
-        if (patchFlag > 0 && patchFlag & 64 && dynamicChildren && // #2715 the previous fragment could've been a BAILed one as a result
-        // of renderSlot() with no valid children
-        n1.dynamicChildren) {
-          patchBlockChildren(
-            n1.dynamicChildren,
-            dynamicChildren,
-            container,
-            parentComponent,
-            parentSuspense,
-            namespace,
-            slotScopeIds
-          );
-          {
-            traverseStaticChildren(n1, n2);
-          }
-        } else {
-          patchChildren(
-            n1,
-            n2,
-            container,
-            fragmentEndAnchor,
-            parentComponent,
-            parentSuspense,
-            namespace,
-            slotScopeIds,
-            optimized
-          );
-        }
       }
+    }
+    const warnInvalidSource = (s) => {
+      warn$1(
+        `Invalid watch source: `,
+        s,
+        `A watch source can only be a getter/effect function, a ref, a reactive object, or an array of these types.`
+      );
     };
-    const processComponent = (n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
-      n2.slotScopeIds = slotScopeIds;
-      if (n1 == null) {
-        if (n2.shapeFlag & 512) {
-          parentComponent.ctx.activate(
-            n2,
-            container,
-            anchor,
-            namespace,
-            optimized
-          );
+    const instance = currentInstance;
+    const reactiveGetter = (source2) => deep === true ? source2 : (
+      // for deep: false, only traverse root-level properties
+      traverse(source2, deep === false ? 1 : void 0)
+    );
+    let getter;
+    let forceTrigger = false;
+    let isMultiSource = false;
+    if (isRef(source)) {
+      getter = () => source.value;
+      forceTrigger = isShallow(source);
+    } else if (isReactive(source)) {
+      getter = () => reactiveGetter(source);
+      forceTrigger = true;
+    } else if (isArray(source)) {
+      isMultiSource = true;
+      forceTrigger = source.some((s) => isReactive(s) || isShallow(s));
+      getter = () => source.map((s) => {
+        if (isRef(s)) {
+          return s.value;
+        } else if (isReactive(s)) {
+          return reactiveGetter(s);
+        } else if (isFunction(s)) {
+          return callWithErrorHandling(s, instance, 2);
         } else {
-          mountComponent(
-            n2,
-            container,
-            anchor,
-            parentComponent,
-            parentSuspense,
-            namespace,
-            optimized
-          );
+          warnInvalidSource(s);
         }
+      });
+    } else if (isFunction(source)) {
+      if (cb) {
+        getter = () => callWithErrorHandling(source, instance, 2);
       } else {
-        updateComponent(n1, n2, optimized);
+        getter = () => {
+          if (cleanup) {
+            cleanup();
+          }
+          return callWithAsyncErrorHandling(
+            source,
+            instance,
+            3,
+            [onCleanup]
+          );
+        };
       }
+    } else {
+      getter = NOOP;
+      warnInvalidSource(source);
+    }
+    if (cb && deep) {
+      const baseGetter = getter;
+      getter = () => traverse(baseGetter());
+    }
+    let cleanup;
+    let onCleanup = (fn) => {
+      cleanup = effect.onStop = () => {
+        callWithErrorHandling(fn, instance, 4);
+        cleanup = effect.onStop = void 0;
+      };
     };
-    const mountComponent = (initialVNode, container, anchor, parentComponent, parentSuspense, namespace, optimized) => {
-      const instance = (initialVNode.component = createComponentInstance(
-        initialVNode,
-        parentComponent,
-        parentSuspense
-      ));
-      if (instance.type.__hmrId) {
-        registerHMR(instance);
-      }
-      {
-        pushWarningContext(initialVNode);
-        startMeasure(instance, `mount`);
-      }
-      if (isKeepAlive(initialVNode)) {
-        instance.ctx.renderer = internals;
-      }
-      {
-        {
-          startMeasure(instance, `init`);
-        }
-        setupComponent(instance);
-        {
-          endMeasure(instance, `init`);
-        }
+    let oldValue = isMultiSource ? new Array(source.length).fill(INITIAL_WATCHER_VALUE) : INITIAL_WATCHER_VALUE;
+    const job = () => {
+      if (!effect.active || !effect.dirty) {
+        return;
       }
-      if (instance.asyncDep) {
-        parentSuspense && parentSuspense.registerDep(instance, setupRenderEffect);
-        if (!initialVNode.el) {
-          const placeholder = instance.subTree = createVNode(Comment);
-          processCommentNode(null, placeholder, container, anchor);
+      if (cb) {
+        const newValue = effect.run();
+        if (deep || forceTrigger || (isMultiSource ? newValue.some((v, i) => hasChanged(v, oldValue[i])) : hasChanged(newValue, oldValue)) || false) {
+          if (cleanup) {
+            cleanup();
+          }
+          callWithAsyncErrorHandling(cb, instance, 3, [
+            newValue,
+            // pass undefined as the old value when it's changed for the first time
+            oldValue === INITIAL_WATCHER_VALUE ? void 0 : isMultiSource && oldValue[0] === INITIAL_WATCHER_VALUE ? [] : oldValue,
+            onCleanup
+          ]);
+          oldValue = newValue;
         }
       } else {
-        setupRenderEffect(
-          instance,
-          initialVNode,
-          container,
-          anchor,
-          parentSuspense,
-          namespace,
-          optimized
-        );
+        effect.run();
       }
-      {
-        popWarningContext();
-        endMeasure(instance, `mount`);
+    };
+    job.allowRecurse = !!cb;
+    let scheduler;
+    if (flush === "sync") {
+      scheduler = job;
+    } else if (flush === "post") {
+      scheduler = () => queuePostRenderEffect(job, instance && instance.suspense);
+    } else {
+      job.pre = true;
+      if (instance) job.id = instance.uid;
+      scheduler = () => queueJob(job);
+    }
+    const effect = new ReactiveEffect(getter, NOOP, scheduler);
+    const scope = getCurrentScope();
+    const unwatch = () => {
+      effect.stop();
+      if (scope) {
+        remove(scope.effects, effect);
       }
     };
-    const updateComponent = (n1, n2, optimized) => {
-      const instance = n2.component = n1.component;
-      if (shouldUpdateComponent(n1, n2, optimized)) {
-        if (instance.asyncDep && !instance.asyncResolved) {
-          {
-            pushWarningContext(n2);
-          }
-          updateComponentPreRender(instance, n2, optimized);
-          {
-            popWarningContext();
-          }
-          return;
-        } else {
-          instance.next = n2;
-          invalidateJob(instance.update);
-          instance.effect.dirty = true;
-          instance.update();
-        }
+    {
+      effect.onTrack = onTrack;
+      effect.onTrigger = onTrigger;
+    }
+    if (cb) {
+      if (immediate) {
+        job();
       } else {
-        n2.el = n1.el;
-        instance.vnode = n2;
+        oldValue = effect.run();
+      }
+    } else if (flush === "post") {
+      queuePostRenderEffect(
+        effect.run.bind(effect),
+        instance && instance.suspense
+      );
+    } else {
+      effect.run();
+    }
+    return unwatch;
+  }
+  function instanceWatch(source, value, options) {
+    const publicThis = this.proxy;
+    const getter = isString(source) ? source.includes(".") ? createPathGetter(publicThis, source) : () => publicThis[source] : source.bind(publicThis, publicThis);
+    let cb;
+    if (isFunction(value)) {
+      cb = value;
+    } else {
+      cb = value.handler;
+      options = value;
+    }
+    const reset = setCurrentInstance(this);
+    const res = doWatch(getter, cb.bind(publicThis), options);
+    reset();
+    return res;
+  }
+  function createPathGetter(ctx, path) {
+    const segments = path.split(".");
+    return () => {
+      let cur = ctx;
+      for (let i = 0; i < segments.length && cur; i++) {
+        cur = cur[segments[i]];
       }
+      return cur;
     };
-    const setupRenderEffect = (instance, initialVNode, container, anchor, parentSuspense, namespace, optimized) => {
-      const componentUpdateFn = () => {
-        if (!instance.isMounted) {
-          let vnodeHook;
-          const { el, props } = initialVNode;
-          const { bm, m, parent } = instance;
-          const isAsyncWrapperVNode = isAsyncWrapper(initialVNode);
-          toggleRecurse(instance, false);
-          if (bm) {
-            invokeArrayFns(bm);
-          }
-          if (!isAsyncWrapperVNode && (vnodeHook = props && props.onVnodeBeforeMount)) {
-            invokeVNodeHook(vnodeHook, parent, initialVNode);
-          }
-          toggleRecurse(instance, true);
-          if (el && hydrateNode) {
-            const hydrateSubTree = () => {
-              {
-                startMeasure(instance, `render`);
-              }
-              instance.subTree = renderComponentRoot(instance);
-              {
-                endMeasure(instance, `render`);
-              }
-              {
-                startMeasure(instance, `hydrate`);
-              }
-              hydrateNode(
-                el,
-                instance.subTree,
-                instance,
-                parentSuspense,
-                null
-              );
-              {
-                endMeasure(instance, `hydrate`);
-              }
-            };
-            if (isAsyncWrapperVNode) {
-              initialVNode.type.__asyncLoader().then(
-                // note: we are moving the render call into an async callback,
-                // which means it won't track dependencies - but it's ok because
-                // a server-rendered async wrapper is already in resolved state
-                // and it will never need to change.
-                () => !instance.isUnmounted && hydrateSubTree()
-              );
-            } else {
-              hydrateSubTree();
-            }
-          } else {
-            {
-              startMeasure(instance, `render`);
-            }
-            const subTree = instance.subTree = renderComponentRoot(instance);
-            {
-              endMeasure(instance, `render`);
-            }
-            {
-              startMeasure(instance, `patch`);
-            }
-            patch(
-              null,
-              subTree,
-              container,
-              anchor,
-              instance,
-              parentSuspense,
-              namespace
-            );
-            {
-              endMeasure(instance, `patch`);
-            }
-            initialVNode.el = subTree.el;
-          }
-          if (m) {
-            queuePostRenderEffect(m, parentSuspense);
-          }
-          if (!isAsyncWrapperVNode && (vnodeHook = props && props.onVnodeMounted)) {
-            const scopedInitialVNode = initialVNode;
-            queuePostRenderEffect(
-              () => invokeVNodeHook(vnodeHook, parent, scopedInitialVNode),
-              parentSuspense
-            );
-          }
-          if (initialVNode.shapeFlag & 256 || parent && isAsyncWrapper(parent.vnode) && parent.vnode.shapeFlag & 256) {
-            instance.a && queuePostRenderEffect(instance.a, parentSuspense);
-          }
-          instance.isMounted = true;
-          {
-            devtoolsComponentAdded(instance);
-          }
-          initialVNode = container = anchor = null;
-        } else {
-          let { next, bu, u, parent, vnode } = instance;
-          {
-            const nonHydratedAsyncRoot = locateNonHydratedAsyncRoot(instance);
-            if (nonHydratedAsyncRoot) {
-              if (next) {
-                next.el = vnode.el;
-                updateComponentPreRender(instance, next, optimized);
-              }
-              nonHydratedAsyncRoot.asyncDep.then(() => {
-                if (!instance.isUnmounted) {
-                  componentUpdateFn();
-                }
-              });
-              return;
-            }
-          }
-          let originNext = next;
-          let vnodeHook;
-          {
-            pushWarningContext(next || instance.vnode);
-          }
-          toggleRecurse(instance, false);
-          if (next) {
-            next.el = vnode.el;
-            updateComponentPreRender(instance, next, optimized);
-          } else {
-            next = vnode;
+  }
+  function traverse(value, depth = Infinity, seen) {
+    if (depth <= 0 || !isObject(value) || value["__v_skip"]) {
+      return value;
+    }
+    seen = seen || /* @__PURE__ */ new Set();
+    if (seen.has(value)) {
+      return value;
+    }
+    seen.add(value);
+    depth--;
+    if (isRef(value)) {
+      traverse(value.value, depth, seen);
+    } else if (isArray(value)) {
+      for (let i = 0; i < value.length; i++) {
+        traverse(value[i], depth, seen);
+      }
+    } else if (isSet(value) || isMap(value)) {
+      value.forEach((v) => {
+        traverse(v, depth, seen);
+      });
+    } else if (isPlainObject(value)) {
+      for (const key in value) {
+        traverse(value[key], depth, seen);
+      }
+      for (const key of Object.getOwnPropertySymbols(value)) {
+        if (Object.prototype.propertyIsEnumerable.call(value, key)) {
+          traverse(value[key], depth, seen);
+        }
+      }
+    }
+    return value;
+  }
+
+  function useModel(props, name, options = EMPTY_OBJ) {
+    const i = getCurrentInstance();
+    if (!i) {
+      warn$1(`useModel() called without active instance.`);
+      return ref();
+    }
+    if (!i.propsOptions[0][name]) {
+      warn$1(`useModel() called with prop "${name}" which is not declared.`);
+      return ref();
+    }
+    const camelizedName = camelize(name);
+    const hyphenatedName = hyphenate(name);
+    const modifiers = getModelModifiers(props, name);
+    const res = customRef((track, trigger) => {
+      let localValue;
+      let prevSetValue = EMPTY_OBJ;
+      let prevEmittedValue;
+      watchSyncEffect(() => {
+        const propValue = props[name];
+        if (hasChanged(localValue, propValue)) {
+          localValue = propValue;
+          trigger();
+        }
+      });
+      return {
+        get() {
+          track();
+          return options.get ? options.get(localValue) : localValue;
+        },
+        set(value) {
+          const emittedValue = options.set ? options.set(value) : value;
+          if (!hasChanged(emittedValue, localValue) && !(prevSetValue !== EMPTY_OBJ && hasChanged(value, prevSetValue))) {
+            return;
           }
-          if (bu) {
-            invokeArrayFns(bu);
+          const rawProps = i.vnode.props;
+          if (!(rawProps && // check if parent has passed v-model
+          (name in rawProps || camelizedName in rawProps || hyphenatedName in rawProps) && (`onUpdate:${name}` in rawProps || `onUpdate:${camelizedName}` in rawProps || `onUpdate:${hyphenatedName}` in rawProps))) {
+            localValue = value;
+            trigger();
           }
-          if (vnodeHook = next.props && next.props.onVnodeBeforeUpdate) {
-            invokeVNodeHook(vnodeHook, parent, next, vnode);
+          i.emit(`update:${name}`, emittedValue);
+          if (hasChanged(value, emittedValue) && hasChanged(value, prevSetValue) && !hasChanged(emittedValue, prevEmittedValue)) {
+            trigger();
           }
-          toggleRecurse(instance, true);
-          {
-            startMeasure(instance, `render`);
+          prevSetValue = value;
+          prevEmittedValue = emittedValue;
+        }
+      };
+    });
+    res[Symbol.iterator] = () => {
+      let i2 = 0;
+      return {
+        next() {
+          if (i2 < 2) {
+            return { value: i2++ ? modifiers || EMPTY_OBJ : res, done: false };
+          } else {
+            return { done: true };
           }
-          const nextTree = renderComponentRoot(instance);
-          {
-            endMeasure(instance, `render`);
+        }
+      };
+    };
+    return res;
+  }
+  const getModelModifiers = (props, modelName) => {
+    return modelName === "modelValue" || modelName === "model-value" ? props.modelModifiers : props[`${modelName}Modifiers`] || props[`${camelize(modelName)}Modifiers`] || props[`${hyphenate(modelName)}Modifiers`];
+  };
+
+  function emit(instance, event, ...rawArgs) {
+    if (instance.isUnmounted) return;
+    const props = instance.vnode.props || EMPTY_OBJ;
+    {
+      const {
+        emitsOptions,
+        propsOptions: [propsOptions]
+      } = instance;
+      if (emitsOptions) {
+        if (!(event in emitsOptions) && true) {
+          if (!propsOptions || !(toHandlerKey(camelize(event)) in propsOptions)) {
+            warn$1(
+              `Component emitted event "${event}" but it is neither declared in the emits option nor as an "${toHandlerKey(camelize(event))}" prop.`
+            );
           }
-          const prevTree = instance.subTree;
-          instance.subTree = nextTree;
-          {
-            startMeasure(instance, `patch`);
+        } else {
+          const validator = emitsOptions[event];
+          if (isFunction(validator)) {
+            const isValid = validator(...rawArgs);
+            if (!isValid) {
+              warn$1(
+                `Invalid event arguments: event validation failed for event "${event}".`
+              );
+            }
           }
-          patch(
-            prevTree,
-            nextTree,
-            // parent may have changed if it's in a teleport
-            hostParentNode(prevTree.el),
-            // anchor may have changed if it's in a fragment
-            getNextHostNode(prevTree),
-            instance,
-            parentSuspense,
-            namespace
-          );
-          {
-            endMeasure(instance, `patch`);
+        }
+      }
+    }
+    let args = rawArgs;
+    const isModelListener = event.startsWith("update:");
+    const modifiers = isModelListener && getModelModifiers(props, event.slice(7));
+    if (modifiers) {
+      if (modifiers.trim) {
+        args = rawArgs.map((a) => isString(a) ? a.trim() : a);
+      }
+      if (modifiers.number) {
+        args = rawArgs.map(looseToNumber);
+      }
+    }
+    {
+      devtoolsComponentEmit(instance, event, args);
+    }
+    {
+      const lowerCaseEvent = event.toLowerCase();
+      if (lowerCaseEvent !== event && props[toHandlerKey(lowerCaseEvent)]) {
+        warn$1(
+          `Event "${lowerCaseEvent}" is emitted in component ${formatComponentName(
+          instance,
+          instance.type
+        )} but the handler is registered for "${event}". Note that HTML attributes are case-insensitive and you cannot use v-on to listen to camelCase events when using in-DOM templates. You should probably use "${hyphenate(
+          event
+        )}" instead of "${event}".`
+        );
+      }
+    }
+    let handlerName;
+    let handler = props[handlerName = toHandlerKey(event)] || // also try camelCase event handler (#2249)
+    props[handlerName = toHandlerKey(camelize(event))];
+    if (!handler && isModelListener) {
+      handler = props[handlerName = toHandlerKey(hyphenate(event))];
+    }
+    if (handler) {
+      callWithAsyncErrorHandling(
+        handler,
+        instance,
+        6,
+        args
+      );
+    }
+    const onceHandler = props[handlerName + `Once`];
+    if (onceHandler) {
+      if (!instance.emitted) {
+        instance.emitted = {};
+      } else if (instance.emitted[handlerName]) {
+        return;
+      }
+      instance.emitted[handlerName] = true;
+      callWithAsyncErrorHandling(
+        onceHandler,
+        instance,
+        6,
+        args
+      );
+    }
+  }
+  function normalizeEmitsOptions(comp, appContext, asMixin = false) {
+    const cache = appContext.emitsCache;
+    const cached = cache.get(comp);
+    if (cached !== void 0) {
+      return cached;
+    }
+    const raw = comp.emits;
+    let normalized = {};
+    let hasExtends = false;
+    if (!isFunction(comp)) {
+      const extendEmits = (raw2) => {
+        const normalizedFromExtend = normalizeEmitsOptions(raw2, appContext, true);
+        if (normalizedFromExtend) {
+          hasExtends = true;
+          extend(normalized, normalizedFromExtend);
+        }
+      };
+      if (!asMixin && appContext.mixins.length) {
+        appContext.mixins.forEach(extendEmits);
+      }
+      if (comp.extends) {
+        extendEmits(comp.extends);
+      }
+      if (comp.mixins) {
+        comp.mixins.forEach(extendEmits);
+      }
+    }
+    if (!raw && !hasExtends) {
+      if (isObject(comp)) {
+        cache.set(comp, null);
+      }
+      return null;
+    }
+    if (isArray(raw)) {
+      raw.forEach((key) => normalized[key] = null);
+    } else {
+      extend(normalized, raw);
+    }
+    if (isObject(comp)) {
+      cache.set(comp, normalized);
+    }
+    return normalized;
+  }
+  function isEmitListener(options, key) {
+    if (!options || !isOn(key)) {
+      return false;
+    }
+    key = key.slice(2).replace(/Once$/, "");
+    return hasOwn(options, key[0].toLowerCase() + key.slice(1)) || hasOwn(options, hyphenate(key)) || hasOwn(options, key);
+  }
+
+  let accessedAttrs = false;
+  function markAttrsAccessed() {
+    accessedAttrs = true;
+  }
+  function renderComponentRoot(instance) {
+    const {
+      type: Component,
+      vnode,
+      proxy,
+      withProxy,
+      propsOptions: [propsOptions],
+      slots,
+      attrs,
+      emit,
+      render,
+      renderCache,
+      props,
+      data,
+      setupState,
+      ctx,
+      inheritAttrs
+    } = instance;
+    const prev = setCurrentRenderingInstance(instance);
+    let result;
+    let fallthroughAttrs;
+    {
+      accessedAttrs = false;
+    }
+    try {
+      if (vnode.shapeFlag & 4) {
+        const proxyToUse = withProxy || proxy;
+        const thisProxy = setupState.__isScriptSetup ? new Proxy(proxyToUse, {
+          get(target, key, receiver) {
+            warn$1(
+              `Property '${String(
+              key
+            )}' was accessed via 'this'. Avoid using 'this' in templates.`
+            );
+            return Reflect.get(target, key, receiver);
           }
-          next.el = nextTree.el;
-          if (originNext === null) {
-            updateHOCHostEl(instance, nextTree.el);
+        }) : proxyToUse;
+        result = normalizeVNode(
+          render.call(
+            thisProxy,
+            proxyToUse,
+            renderCache,
+            true ? shallowReadonly(props) : props,
+            setupState,
+            data,
+            ctx
+          )
+        );
+        fallthroughAttrs = attrs;
+      } else {
+        const render2 = Component;
+        if (attrs === props) {
+          markAttrsAccessed();
+        }
+        result = normalizeVNode(
+          render2.length > 1 ? render2(
+            true ? shallowReadonly(props) : props,
+            true ? {
+              get attrs() {
+                markAttrsAccessed();
+                return shallowReadonly(attrs);
+              },
+              slots,
+              emit
+            } : { attrs, slots, emit }
+          ) : render2(
+            true ? shallowReadonly(props) : props,
+            null
+          )
+        );
+        fallthroughAttrs = Component.props ? attrs : getFunctionalFallthrough(attrs);
+      }
+    } catch (err) {
+      blockStack.length = 0;
+      handleError(err, instance, 1);
+      result = createVNode(Comment);
+    }
+    let root = result;
+    let setRoot = void 0;
+    if (result.patchFlag > 0 && result.patchFlag & 2048) {
+      [root, setRoot] = getChildRoot(result);
+    }
+    if (fallthroughAttrs && inheritAttrs !== false) {
+      const keys = Object.keys(fallthroughAttrs);
+      const { shapeFlag } = root;
+      if (keys.length) {
+        if (shapeFlag & (1 | 6)) {
+          if (propsOptions && keys.some(isModelListener)) {
+            fallthroughAttrs = filterModelListeners(
+              fallthroughAttrs,
+              propsOptions
+            );
           }
-          if (u) {
-            queuePostRenderEffect(u, parentSuspense);
+          root = cloneVNode(root, fallthroughAttrs, false, true);
+        } else if (!accessedAttrs && root.type !== Comment) {
+          const allAttrs = Object.keys(attrs);
+          const eventAttrs = [];
+          const extraAttrs = [];
+          for (let i = 0, l = allAttrs.length; i < l; i++) {
+            const key = allAttrs[i];
+            if (isOn(key)) {
+              if (!isModelListener(key)) {
+                eventAttrs.push(key[2].toLowerCase() + key.slice(3));
+              }
+            } else {
+              extraAttrs.push(key);
+            }
           }
-          if (vnodeHook = next.props && next.props.onVnodeUpdated) {
-            queuePostRenderEffect(
-              () => invokeVNodeHook(vnodeHook, parent, next, vnode),
-              parentSuspense
+          if (extraAttrs.length) {
+            warn$1(
+              `Extraneous non-props attributes (${extraAttrs.join(", ")}) were passed to component but could not be automatically inherited because component renders fragment or text root nodes.`
             );
           }
-          {
-            devtoolsComponentUpdated(instance);
-          }
-          {
-            popWarningContext();
+          if (eventAttrs.length) {
+            warn$1(
+              `Extraneous non-emits event listeners (${eventAttrs.join(", ")}) were passed to component but could not be automatically inherited because component renders fragment or text root nodes. If the listener is intended to be a component custom event listener only, declare it using the "emits" option.`
+            );
           }
         }
-      };
-      const effect = instance.effect = new ReactiveEffect(
-        componentUpdateFn,
-        NOOP,
-        () => queueJob(update),
-        instance.scope
-        // track it in component's effect scope
-      );
-      const update = instance.update = () => {
-        if (effect.dirty) {
-          effect.run();
-        }
-      };
-      update.id = instance.uid;
-      toggleRecurse(instance, true);
-      {
-        effect.onTrack = instance.rtc ? (e) => invokeArrayFns(instance.rtc, e) : void 0;
-        effect.onTrigger = instance.rtg ? (e) => invokeArrayFns(instance.rtg, e) : void 0;
-        update.ownerInstance = instance;
       }
-      update();
-    };
-    const updateComponentPreRender = (instance, nextVNode, optimized) => {
-      nextVNode.component = instance;
-      const prevProps = instance.vnode.props;
-      instance.vnode = nextVNode;
-      instance.next = null;
-      updateProps(instance, nextVNode.props, prevProps, optimized);
-      updateSlots(instance, nextVNode.children, optimized);
-      pauseTracking();
-      flushPreFlushCbs(instance);
-      resetTracking();
-    };
-    const patchChildren = (n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized = false) => {
-      const c1 = n1 && n1.children;
-      const prevShapeFlag = n1 ? n1.shapeFlag : 0;
-      const c2 = n2.children;
-      const { patchFlag, shapeFlag } = n2;
-      if (patchFlag > 0) {
-        if (patchFlag & 128) {
-          patchKeyedChildren(
-            c1,
-            c2,
-            container,
-            anchor,
-            parentComponent,
-            parentSuspense,
-            namespace,
-            slotScopeIds,
-            optimized
-          );
-          return;
-        } else if (patchFlag & 256) {
-          patchUnkeyedChildren(
-            c1,
-            c2,
-            container,
-            anchor,
-            parentComponent,
-            parentSuspense,
-            namespace,
-            slotScopeIds,
-            optimized
-          );
-          return;
-        }
+    }
+    if (vnode.dirs) {
+      if (!isElementRoot(root)) {
+        warn$1(
+          `Runtime directive used on component with non-element root node. The directives will not function as intended.`
+        );
       }
-      if (shapeFlag & 8) {
-        if (prevShapeFlag & 16) {
-          unmountChildren(c1, parentComponent, parentSuspense);
-        }
-        if (c2 !== c1) {
-          hostSetElementText(container, c2);
+      root = cloneVNode(root, null, false, true);
+      root.dirs = root.dirs ? root.dirs.concat(vnode.dirs) : vnode.dirs;
+    }
+    if (vnode.transition) {
+      if (!isElementRoot(root)) {
+        warn$1(
+          `Component inside <Transition> renders non-element root node that cannot be animated.`
+        );
+      }
+      root.transition = vnode.transition;
+    }
+    if (setRoot) {
+      setRoot(root);
+    } else {
+      result = root;
+    }
+    setCurrentRenderingInstance(prev);
+    return result;
+  }
+  const getChildRoot = (vnode) => {
+    const rawChildren = vnode.children;
+    const dynamicChildren = vnode.dynamicChildren;
+    const childRoot = filterSingleRoot(rawChildren, false);
+    if (!childRoot) {
+      return [vnode, void 0];
+    } else if (childRoot.patchFlag > 0 && childRoot.patchFlag & 2048) {
+      return getChildRoot(childRoot);
+    }
+    const index = rawChildren.indexOf(childRoot);
+    const dynamicIndex = dynamicChildren ? dynamicChildren.indexOf(childRoot) : -1;
+    const setRoot = (updatedRoot) => {
+      rawChildren[index] = updatedRoot;
+      if (dynamicChildren) {
+        if (dynamicIndex > -1) {
+          dynamicChildren[dynamicIndex] = updatedRoot;
+        } else if (updatedRoot.patchFlag > 0) {
+          vnode.dynamicChildren = [...dynamicChildren, updatedRoot];
         }
-      } else {
-        if (prevShapeFlag & 16) {
-          if (shapeFlag & 16) {
-            patchKeyedChildren(
-              c1,
-              c2,
-              container,
-              anchor,
-              parentComponent,
-              parentSuspense,
-              namespace,
-              slotScopeIds,
-              optimized
-            );
+      }
+    };
+    return [normalizeVNode(childRoot), setRoot];
+  };
+  function filterSingleRoot(children, recurse = true) {
+    let singleRoot;
+    for (let i = 0; i < children.length; i++) {
+      const child = children[i];
+      if (isVNode(child)) {
+        if (child.type !== Comment || child.children === "v-if") {
+          if (singleRoot) {
+            return;
           } else {
-            unmountChildren(c1, parentComponent, parentSuspense, true);
-          }
-        } else {
-          if (prevShapeFlag & 8) {
-            hostSetElementText(container, "");
+            singleRoot = child;
+            if (recurse && singleRoot.patchFlag > 0 && singleRoot.patchFlag & 2048) {
+              return filterSingleRoot(singleRoot.children);
+            }
           }
-          if (shapeFlag & 16) {
-            mountChildren(
-              c2,
-              container,
-              anchor,
-              parentComponent,
-              parentSuspense,
-              namespace,
-              slotScopeIds,
-              optimized
-            );
+        }
+      } else {
+        return;
+      }
+    }
+    return singleRoot;
+  }
+  const getFunctionalFallthrough = (attrs) => {
+    let res;
+    for (const key in attrs) {
+      if (key === "class" || key === "style" || isOn(key)) {
+        (res || (res = {}))[key] = attrs[key];
+      }
+    }
+    return res;
+  };
+  const filterModelListeners = (attrs, props) => {
+    const res = {};
+    for (const key in attrs) {
+      if (!isModelListener(key) || !(key.slice(9) in props)) {
+        res[key] = attrs[key];
+      }
+    }
+    return res;
+  };
+  const isElementRoot = (vnode) => {
+    return vnode.shapeFlag & (6 | 1) || vnode.type === Comment;
+  };
+  function shouldUpdateComponent(prevVNode, nextVNode, optimized) {
+    const { props: prevProps, children: prevChildren, component } = prevVNode;
+    const { props: nextProps, children: nextChildren, patchFlag } = nextVNode;
+    const emits = component.emitsOptions;
+    if ((prevChildren || nextChildren) && isHmrUpdating) {
+      return true;
+    }
+    if (nextVNode.dirs || nextVNode.transition) {
+      return true;
+    }
+    if (optimized && patchFlag >= 0) {
+      if (patchFlag & 1024) {
+        return true;
+      }
+      if (patchFlag & 16) {
+        if (!prevProps) {
+          return !!nextProps;
+        }
+        return hasPropsChanged(prevProps, nextProps, emits);
+      } else if (patchFlag & 8) {
+        const dynamicProps = nextVNode.dynamicProps;
+        for (let i = 0; i < dynamicProps.length; i++) {
+          const key = dynamicProps[i];
+          if (nextProps[key] !== prevProps[key] && !isEmitListener(emits, key)) {
+            return true;
           }
         }
       }
-    };
-    const patchUnkeyedChildren = (c1, c2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
-      c1 = c1 || EMPTY_ARR;
-      c2 = c2 || EMPTY_ARR;
-      const oldLength = c1.length;
-      const newLength = c2.length;
-      const commonLength = Math.min(oldLength, newLength);
-      let i;
-      for (i = 0; i < commonLength; i++) {
-        const nextChild = c2[i] = optimized ? cloneIfMounted(c2[i]) : normalizeVNode(c2[i]);
-        patch(
-          c1[i],
-          nextChild,
+    } else {
+      if (prevChildren || nextChildren) {
+        if (!nextChildren || !nextChildren.$stable) {
+          return true;
+        }
+      }
+      if (prevProps === nextProps) {
+        return false;
+      }
+      if (!prevProps) {
+        return !!nextProps;
+      }
+      if (!nextProps) {
+        return true;
+      }
+      return hasPropsChanged(prevProps, nextProps, emits);
+    }
+    return false;
+  }
+  function hasPropsChanged(prevProps, nextProps, emitsOptions) {
+    const nextKeys = Object.keys(nextProps);
+    if (nextKeys.length !== Object.keys(prevProps).length) {
+      return true;
+    }
+    for (let i = 0; i < nextKeys.length; i++) {
+      const key = nextKeys[i];
+      if (nextProps[key] !== prevProps[key] && !isEmitListener(emitsOptions, key)) {
+        return true;
+      }
+    }
+    return false;
+  }
+  function updateHOCHostEl({ vnode, parent }, el) {
+    while (parent) {
+      const root = parent.subTree;
+      if (root.suspense && root.suspense.activeBranch === vnode) {
+        root.el = vnode.el;
+      }
+      if (root === vnode) {
+        (vnode = parent.vnode).el = el;
+        parent = parent.parent;
+      } else {
+        break;
+      }
+    }
+  }
+
+  const isSuspense = (type) => type.__isSuspense;
+  let suspenseId = 0;
+  const SuspenseImpl = {
+    name: "Suspense",
+    // In order to make Suspense tree-shakable, we need to avoid importing it
+    // directly in the renderer. The renderer checks for the __isSuspense flag
+    // on a vnode's type and calls the `process` method, passing in renderer
+    // internals.
+    __isSuspense: true,
+    process(n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized, rendererInternals) {
+      if (n1 == null) {
+        mountSuspense(
+          n2,
           container,
-          null,
+          anchor,
           parentComponent,
           parentSuspense,
           namespace,
           slotScopeIds,
-          optimized
-        );
-      }
-      if (oldLength > newLength) {
-        unmountChildren(
-          c1,
-          parentComponent,
-          parentSuspense,
-          true,
-          false,
-          commonLength
+          optimized,
+          rendererInternals
         );
       } else {
-        mountChildren(
-          c2,
+        if (parentSuspense && parentSuspense.deps > 0 && !n1.suspense.isInFallback) {
+          n2.suspense = n1.suspense;
+          n2.suspense.vnode = n2;
+          n2.el = n1.el;
+          return;
+        }
+        patchSuspense(
+          n1,
+          n2,
           container,
           anchor,
           parentComponent,
-          parentSuspense,
           namespace,
           slotScopeIds,
           optimized,
-          commonLength
+          rendererInternals
         );
       }
-    };
-    const patchKeyedChildren = (c1, c2, container, parentAnchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized) => {
-      let i = 0;
-      const l2 = c2.length;
-      let e1 = c1.length - 1;
-      let e2 = l2 - 1;
-      while (i <= e1 && i <= e2) {
-        const n1 = c1[i];
-        const n2 = c2[i] = optimized ? cloneIfMounted(c2[i]) : normalizeVNode(c2[i]);
-        if (isSameVNodeType(n1, n2)) {
-          patch(
-            n1,
-            n2,
-            container,
-            null,
-            parentComponent,
-            parentSuspense,
-            namespace,
-            slotScopeIds,
-            optimized
-          );
-        } else {
-          break;
-        }
-        i++;
-      }
-      while (i <= e1 && i <= e2) {
-        const n1 = c1[e1];
-        const n2 = c2[e2] = optimized ? cloneIfMounted(c2[e2]) : normalizeVNode(c2[e2]);
-        if (isSameVNodeType(n1, n2)) {
-          patch(
-            n1,
-            n2,
-            container,
-            null,
-            parentComponent,
-            parentSuspense,
-            namespace,
-            slotScopeIds,
-            optimized
-          );
-        } else {
-          break;
-        }
-        e1--;
-        e2--;
-      }
-      if (i > e1) {
-        if (i <= e2) {
-          const nextPos = e2 + 1;
-          const anchor = nextPos < l2 ? c2[nextPos].el : parentAnchor;
-          while (i <= e2) {
+    },
+    hydrate: hydrateSuspense,
+    normalize: normalizeSuspenseChildren
+  };
+  const Suspense = SuspenseImpl ;
+  function triggerEvent(vnode, name) {
+    const eventListener = vnode.props && vnode.props[name];
+    if (isFunction(eventListener)) {
+      eventListener();
+    }
+  }
+  function mountSuspense(vnode, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized, rendererInternals) {
+    const {
+      p: patch,
+      o: { createElement }
+    } = rendererInternals;
+    const hiddenContainer = createElement("div");
+    const suspense = vnode.suspense = createSuspenseBoundary(
+      vnode,
+      parentSuspense,
+      parentComponent,
+      container,
+      hiddenContainer,
+      anchor,
+      namespace,
+      slotScopeIds,
+      optimized,
+      rendererInternals
+    );
+    patch(
+      null,
+      suspense.pendingBranch = vnode.ssContent,
+      hiddenContainer,
+      null,
+      parentComponent,
+      suspense,
+      namespace,
+      slotScopeIds
+    );
+    if (suspense.deps > 0) {
+      triggerEvent(vnode, "onPending");
+      triggerEvent(vnode, "onFallback");
+      patch(
+        null,
+        vnode.ssFallback,
+        container,
+        anchor,
+        parentComponent,
+        null,
+        // fallback tree will not have suspense context
+        namespace,
+        slotScopeIds
+      );
+      setActiveBranch(suspense, vnode.ssFallback);
+    } else {
+      suspense.resolve(false, true);
+    }
+  }
+  function patchSuspense(n1, n2, container, anchor, parentComponent, namespace, slotScopeIds, optimized, { p: patch, um: unmount, o: { createElement } }) {
+    const suspense = n2.suspense = n1.suspense;
+    suspense.vnode = n2;
+    n2.el = n1.el;
+    const newBranch = n2.ssContent;
+    const newFallback = n2.ssFallback;
+    const { activeBranch, pendingBranch, isInFallback, isHydrating } = suspense;
+    if (pendingBranch) {
+      suspense.pendingBranch = newBranch;
+      if (isSameVNodeType(newBranch, pendingBranch)) {
+        patch(
+          pendingBranch,
+          newBranch,
+          suspense.hiddenContainer,
+          null,
+          parentComponent,
+          suspense,
+          namespace,
+          slotScopeIds,
+          optimized
+        );
+        if (suspense.deps <= 0) {
+          suspense.resolve();
+        } else if (isInFallback) {
+          if (!isHydrating) {
             patch(
-              null,
-              c2[i] = optimized ? cloneIfMounted(c2[i]) : normalizeVNode(c2[i]),
+              activeBranch,
+              newFallback,
               container,
               anchor,
               parentComponent,
-              parentSuspense,
+              null,
+              // fallback tree will not have suspense context
               namespace,
               slotScopeIds,
               optimized
             );
-            i++;
+            setActiveBranch(suspense, newFallback);
           }
         }
-      } else if (i > e2) {
-        while (i <= e1) {
-          unmount(c1[i], parentComponent, parentSuspense, true);
-          i++;
-        }
       } else {
-        const s1 = i;
-        const s2 = i;
-        const keyToNewIndexMap = /* @__PURE__ */ new Map();
-        for (i = s2; i <= e2; i++) {
-          const nextChild = c2[i] = optimized ? cloneIfMounted(c2[i]) : normalizeVNode(c2[i]);
-          if (nextChild.key != null) {
-            if (keyToNewIndexMap.has(nextChild.key)) {
-              warn$1(
-                `Duplicate keys found during update:`,
-                JSON.stringify(nextChild.key),
-                `Make sure keys are unique.`
-              );
-            }
-            keyToNewIndexMap.set(nextChild.key, i);
-          }
+        suspense.pendingId = suspenseId++;
+        if (isHydrating) {
+          suspense.isHydrating = false;
+          suspense.activeBranch = pendingBranch;
+        } else {
+          unmount(pendingBranch, parentComponent, suspense);
         }
-        let j;
-        let patched = 0;
-        const toBePatched = e2 - s2 + 1;
-        let moved = false;
-        let maxNewIndexSoFar = 0;
-        const newIndexToOldIndexMap = new Array(toBePatched);
-        for (i = 0; i < toBePatched; i++)
-          newIndexToOldIndexMap[i] = 0;
-        for (i = s1; i <= e1; i++) {
-          const prevChild = c1[i];
-          if (patched >= toBePatched) {
-            unmount(prevChild, parentComponent, parentSuspense, true);
-            continue;
-          }
-          let newIndex;
-          if (prevChild.key != null) {
-            newIndex = keyToNewIndexMap.get(prevChild.key);
-          } else {
-            for (j = s2; j <= e2; j++) {
-              if (newIndexToOldIndexMap[j - s2] === 0 && isSameVNodeType(prevChild, c2[j])) {
-                newIndex = j;
-                break;
-              }
-            }
-          }
-          if (newIndex === void 0) {
-            unmount(prevChild, parentComponent, parentSuspense, true);
+        suspense.deps = 0;
+        suspense.effects.length = 0;
+        suspense.hiddenContainer = createElement("div");
+        if (isInFallback) {
+          patch(
+            null,
+            newBranch,
+            suspense.hiddenContainer,
+            null,
+            parentComponent,
+            suspense,
+            namespace,
+            slotScopeIds,
+            optimized
+          );
+          if (suspense.deps <= 0) {
+            suspense.resolve();
           } else {
-            newIndexToOldIndexMap[newIndex - s2] = i + 1;
-            if (newIndex >= maxNewIndexSoFar) {
-              maxNewIndexSoFar = newIndex;
-            } else {
-              moved = true;
-            }
-            patch(
-              prevChild,
-              c2[newIndex],
-              container,
-              null,
-              parentComponent,
-              parentSuspense,
-              namespace,
-              slotScopeIds,
-              optimized
-            );
-            patched++;
-          }
-        }
-        const increasingNewIndexSequence = moved ? getSequence(newIndexToOldIndexMap) : EMPTY_ARR;
-        j = increasingNewIndexSequence.length - 1;
-        for (i = toBePatched - 1; i >= 0; i--) {
-          const nextIndex = s2 + i;
-          const nextChild = c2[nextIndex];
-          const anchor = nextIndex + 1 < l2 ? c2[nextIndex + 1].el : parentAnchor;
-          if (newIndexToOldIndexMap[i] === 0) {
             patch(
-              null,
-              nextChild,
+              activeBranch,
+              newFallback,
               container,
               anchor,
               parentComponent,
-              parentSuspense,
+              null,
+              // fallback tree will not have suspense context
               namespace,
               slotScopeIds,
               optimized
             );
-          } else if (moved) {
-            if (j < 0 || i !== increasingNewIndexSequence[j]) {
-              move(nextChild, container, anchor, 2);
-            } else {
-              j--;
-            }
-          }
-        }
-      }
-    };
-    const move = (vnode, container, anchor, moveType, parentSuspense = null) => {
-      const { el, type, transition, children, shapeFlag } = vnode;
-      if (shapeFlag & 6) {
-        move(vnode.component.subTree, container, anchor, moveType);
-        return;
-      }
-      if (shapeFlag & 128) {
-        vnode.suspense.move(container, anchor, moveType);
-        return;
-      }
-      if (shapeFlag & 64) {
-        type.move(vnode, container, anchor, internals);
-        return;
-      }
-      if (type === Fragment) {
-        hostInsert(el, container, anchor);
-        for (let i = 0; i < children.length; i++) {
-          move(children[i], container, anchor, moveType);
-        }
-        hostInsert(vnode.anchor, container, anchor);
-        return;
-      }
-      if (type === Static) {
-        moveStaticNode(vnode, container, anchor);
-        return;
-      }
-      const needTransition2 = moveType !== 2 && shapeFlag & 1 && transition;
-      if (needTransition2) {
-        if (moveType === 0) {
-          transition.beforeEnter(el);
-          hostInsert(el, container, anchor);
-          queuePostRenderEffect(() => transition.enter(el), parentSuspense);
-        } else {
-          const { leave, delayLeave, afterLeave } = transition;
-          const remove2 = () => hostInsert(el, container, anchor);
-          const performLeave = () => {
-            leave(el, () => {
-              remove2();
-              afterLeave && afterLeave();
-            });
-          };
-          if (delayLeave) {
-            delayLeave(el, remove2, performLeave);
-          } else {
-            performLeave();
+            setActiveBranch(suspense, newFallback);
           }
-        }
-      } else {
-        hostInsert(el, container, anchor);
-      }
-    };
-    const unmount = (vnode, parentComponent, parentSuspense, doRemove = false, optimized = false) => {
-      const {
-        type,
-        props,
-        ref,
-        children,
-        dynamicChildren,
-        shapeFlag,
-        patchFlag,
-        dirs
-      } = vnode;
-      if (ref != null) {
-        setRef(ref, null, parentSuspense, vnode, true);
-      }
-      if (shapeFlag & 256) {
-        parentComponent.ctx.deactivate(vnode);
-        return;
-      }
-      const shouldInvokeDirs = shapeFlag & 1 && dirs;
-      const shouldInvokeVnodeHook = !isAsyncWrapper(vnode);
-      let vnodeHook;
-      if (shouldInvokeVnodeHook && (vnodeHook = props && props.onVnodeBeforeUnmount)) {
-        invokeVNodeHook(vnodeHook, parentComponent, vnode);
-      }
-      if (shapeFlag & 6) {
-        unmountComponent(vnode.component, parentSuspense, doRemove);
-      } else {
-        if (shapeFlag & 128) {
-          vnode.suspense.unmount(parentSuspense, doRemove);
-          return;
-        }
-        if (shouldInvokeDirs) {
-          invokeDirectiveHook(vnode, null, parentComponent, "beforeUnmount");
-        }
-        if (shapeFlag & 64) {
-          vnode.type.remove(
-            vnode,
-            parentComponent,
-            parentSuspense,
-            optimized,
-            internals,
-            doRemove
-          );
-        } else if (dynamicChildren && // #1153: fast path should not be taken for non-stable (v-for) fragments
-        (type !== Fragment || patchFlag > 0 && patchFlag & 64)) {
-          unmountChildren(
-            dynamicChildren,
-            parentComponent,
-            parentSuspense,
-            false,
-            true
-          );
-        } else if (type === Fragment && patchFlag & (128 | 256) || !optimized && shapeFlag & 16) {
-          unmountChildren(children, parentComponent, parentSuspense);
-        }
-        if (doRemove) {
-          remove(vnode);
-        }
-      }
-      if (shouldInvokeVnodeHook && (vnodeHook = props && props.onVnodeUnmounted) || shouldInvokeDirs) {
-        queuePostRenderEffect(() => {
-          vnodeHook && invokeVNodeHook(vnodeHook, parentComponent, vnode);
-          shouldInvokeDirs && invokeDirectiveHook(vnode, null, parentComponent, "unmounted");
-        }, parentSuspense);
-      }
-    };
-    const remove = (vnode) => {
-      const { type, el, anchor, transition } = vnode;
-      if (type === Fragment) {
-        if (vnode.patchFlag > 0 && vnode.patchFlag & 2048 && transition && !transition.persisted) {
-          vnode.children.forEach((child) => {
-            if (child.type === Comment) {
-              hostRemove(child.el);
-            } else {
-              remove(child);
-            }
-          });
+        } else if (activeBranch && isSameVNodeType(newBranch, activeBranch)) {
+          patch(
+            activeBranch,
+            newBranch,
+            container,
+            anchor,
+            parentComponent,
+            suspense,
+            namespace,
+            slotScopeIds,
+            optimized
+          );
+          suspense.resolve(true);
         } else {
-          removeFragment(el, anchor);
+          patch(
+            null,
+            newBranch,
+            suspense.hiddenContainer,
+            null,
+            parentComponent,
+            suspense,
+            namespace,
+            slotScopeIds,
+            optimized
+          );
+          if (suspense.deps <= 0) {
+            suspense.resolve();
+          }
         }
-        return;
       }
-      if (type === Static) {
-        removeStaticNode(vnode);
-        return;
-      }
-      const performRemove = () => {
-        hostRemove(el);
-        if (transition && !transition.persisted && transition.afterLeave) {
-          transition.afterLeave();
-        }
-      };
-      if (vnode.shapeFlag & 1 && transition && !transition.persisted) {
-        const { leave, delayLeave } = transition;
-        const performLeave = () => leave(el, performRemove);
-        if (delayLeave) {
-          delayLeave(vnode.el, performRemove, performLeave);
-        } else {
-          performLeave();
-        }
+    } else {
+      if (activeBranch && isSameVNodeType(newBranch, activeBranch)) {
+        patch(
+          activeBranch,
+          newBranch,
+          container,
+          anchor,
+          parentComponent,
+          suspense,
+          namespace,
+          slotScopeIds,
+          optimized
+        );
+        setActiveBranch(suspense, newBranch);
       } else {
-        performRemove();
-      }
-    };
-    const removeFragment = (cur, end) => {
-      let next;
-      while (cur !== end) {
-        next = hostNextSibling(cur);
-        hostRemove(cur);
-        cur = next;
-      }
-      hostRemove(end);
-    };
-    const unmountComponent = (instance, parentSuspense, doRemove) => {
-      if (instance.type.__hmrId) {
-        unregisterHMR(instance);
-      }
-      const { bum, scope, update, subTree, um } = instance;
-      if (bum) {
-        invokeArrayFns(bum);
-      }
-      scope.stop();
-      if (update) {
-        update.active = false;
-        unmount(subTree, instance, parentSuspense, doRemove);
-      }
-      if (um) {
-        queuePostRenderEffect(um, parentSuspense);
-      }
-      queuePostRenderEffect(() => {
-        instance.isUnmounted = true;
-      }, parentSuspense);
-      if (parentSuspense && parentSuspense.pendingBranch && !parentSuspense.isUnmounted && instance.asyncDep && !instance.asyncResolved && instance.suspenseId === parentSuspense.pendingId) {
-        parentSuspense.deps--;
-        if (parentSuspense.deps === 0) {
-          parentSuspense.resolve();
-        }
-      }
-      {
-        devtoolsComponentRemoved(instance);
-      }
-    };
-    const unmountChildren = (children, parentComponent, parentSuspense, doRemove = false, optimized = false, start = 0) => {
-      for (let i = start; i < children.length; i++) {
-        unmount(children[i], parentComponent, parentSuspense, doRemove, optimized);
-      }
-    };
-    const getNextHostNode = (vnode) => {
-      if (vnode.shapeFlag & 6) {
-        return getNextHostNode(vnode.component.subTree);
-      }
-      if (vnode.shapeFlag & 128) {
-        return vnode.suspense.next();
-      }
-      return hostNextSibling(vnode.anchor || vnode.el);
-    };
-    let isFlushing = false;
-    const render = (vnode, container, namespace) => {
-      if (vnode == null) {
-        if (container._vnode) {
-          unmount(container._vnode, null, null, true);
+        triggerEvent(n2, "onPending");
+        suspense.pendingBranch = newBranch;
+        if (newBranch.shapeFlag & 512) {
+          suspense.pendingId = newBranch.component.suspenseId;
+        } else {
+          suspense.pendingId = suspenseId++;
         }
-      } else {
         patch(
-          container._vnode || null,
-          vnode,
-          container,
-          null,
           null,
+          newBranch,
+          suspense.hiddenContainer,
           null,
-          namespace
+          parentComponent,
+          suspense,
+          namespace,
+          slotScopeIds,
+          optimized
         );
-      }
-      if (!isFlushing) {
-        isFlushing = true;
-        flushPreFlushCbs();
-        flushPostFlushCbs();
-        isFlushing = false;
-      }
-      container._vnode = vnode;
-    };
-    const internals = {
-      p: patch,
-      um: unmount,
-      m: move,
-      r: remove,
-      mt: mountComponent,
-      mc: mountChildren,
-      pc: patchChildren,
-      pbc: patchBlockChildren,
-      n: getNextHostNode,
-      o: options
-    };
-    let hydrate;
-    let hydrateNode;
-    if (createHydrationFns) {
-      [hydrate, hydrateNode] = createHydrationFns(
-        internals
-      );
-    }
-    return {
-      render,
-      hydrate,
-      createApp: createAppAPI(render, hydrate)
-    };
-  }
-  function resolveChildrenNamespace({ type, props }, currentNamespace) {
-    return currentNamespace === "svg" && type === "foreignObject" || currentNamespace === "mathml" && type === "annotation-xml" && props && props.encoding && props.encoding.includes("html") ? void 0 : currentNamespace;
-  }
-  function toggleRecurse({ effect, update }, allowed) {
-    effect.allowRecurse = update.allowRecurse = allowed;
-  }
-  function needTransition(parentSuspense, transition) {
-    return (!parentSuspense || parentSuspense && !parentSuspense.pendingBranch) && transition && !transition.persisted;
-  }
-  function traverseStaticChildren(n1, n2, shallow = false) {
-    const ch1 = n1.children;
-    const ch2 = n2.children;
-    if (isArray(ch1) && isArray(ch2)) {
-      for (let i = 0; i < ch1.length; i++) {
-        const c1 = ch1[i];
-        let c2 = ch2[i];
-        if (c2.shapeFlag & 1 && !c2.dynamicChildren) {
-          if (c2.patchFlag <= 0 || c2.patchFlag === 32) {
-            c2 = ch2[i] = cloneIfMounted(ch2[i]);
-            c2.el = c1.el;
+        if (suspense.deps <= 0) {
+          suspense.resolve();
+        } else {
+          const { timeout, pendingId } = suspense;
+          if (timeout > 0) {
+            setTimeout(() => {
+              if (suspense.pendingId === pendingId) {
+                suspense.fallback(newFallback);
+              }
+            }, timeout);
+          } else if (timeout === 0) {
+            suspense.fallback(newFallback);
           }
-          if (!shallow)
-            traverseStaticChildren(c1, c2);
-        }
-        if (c2.type === Text) {
-          c2.el = c1.el;
-        }
-        if (c2.type === Comment && !c2.el) {
-          c2.el = c1.el;
         }
       }
     }
   }
-  function getSequence(arr) {
-    const p = arr.slice();
-    const result = [0];
-    let i, j, u, v, c;
-    const len = arr.length;
-    for (i = 0; i < len; i++) {
-      const arrI = arr[i];
-      if (arrI !== 0) {
-        j = result[result.length - 1];
-        if (arr[j] < arrI) {
-          p[i] = j;
-          result.push(i);
-          continue;
+  let hasWarned = false;
+  function createSuspenseBoundary(vnode, parentSuspense, parentComponent, container, hiddenContainer, anchor, namespace, slotScopeIds, optimized, rendererInternals, isHydrating = false) {
+    if (!hasWarned) {
+      hasWarned = true;
+      console[console.info ? "info" : "log"](
+        `<Suspense> is an experimental feature and its API will likely change.`
+      );
+    }
+    const {
+      p: patch,
+      m: move,
+      um: unmount,
+      n: next,
+      o: { parentNode, remove }
+    } = rendererInternals;
+    let parentSuspenseId;
+    const isSuspensible = isVNodeSuspensible(vnode);
+    if (isSuspensible) {
+      if (parentSuspense && parentSuspense.pendingBranch) {
+        parentSuspenseId = parentSuspense.pendingId;
+        parentSuspense.deps++;
+      }
+    }
+    const timeout = vnode.props ? toNumber(vnode.props.timeout) : void 0;
+    {
+      assertNumber(timeout, `Suspense timeout`);
+    }
+    const initialAnchor = anchor;
+    const suspense = {
+      vnode,
+      parent: parentSuspense,
+      parentComponent,
+      namespace,
+      container,
+      hiddenContainer,
+      deps: 0,
+      pendingId: suspenseId++,
+      timeout: typeof timeout === "number" ? timeout : -1,
+      activeBranch: null,
+      pendingBranch: null,
+      isInFallback: !isHydrating,
+      isHydrating,
+      isUnmounted: false,
+      effects: [],
+      resolve(resume = false, sync = false) {
+        {
+          if (!resume && !suspense.pendingBranch) {
+            throw new Error(
+              `suspense.resolve() is called without a pending branch.`
+            );
+          }
+          if (suspense.isUnmounted) {
+            throw new Error(
+              `suspense.resolve() is called on an already unmounted suspense boundary.`
+            );
+          }
         }
-        u = 0;
-        v = result.length - 1;
-        while (u < v) {
-          c = u + v >> 1;
-          if (arr[result[c]] < arrI) {
-            u = c + 1;
-          } else {
-            v = c;
+        const {
+          vnode: vnode2,
+          activeBranch,
+          pendingBranch,
+          pendingId,
+          effects,
+          parentComponent: parentComponent2,
+          container: container2
+        } = suspense;
+        let delayEnter = false;
+        if (suspense.isHydrating) {
+          suspense.isHydrating = false;
+        } else if (!resume) {
+          delayEnter = activeBranch && pendingBranch.transition && pendingBranch.transition.mode === "out-in";
+          if (delayEnter) {
+            activeBranch.transition.afterLeave = () => {
+              if (pendingId === suspense.pendingId) {
+                move(
+                  pendingBranch,
+                  container2,
+                  anchor === initialAnchor ? next(activeBranch) : anchor,
+                  0
+                );
+                queuePostFlushCb(effects);
+              }
+            };
+          }
+          if (activeBranch) {
+            if (parentNode(activeBranch.el) !== suspense.hiddenContainer) {
+              anchor = next(activeBranch);
+            }
+            unmount(activeBranch, parentComponent2, suspense, true);
+          }
+          if (!delayEnter) {
+            move(pendingBranch, container2, anchor, 0);
           }
         }
-        if (arrI < arr[result[u]]) {
-          if (u > 0) {
-            p[i] = result[u - 1];
+        setActiveBranch(suspense, pendingBranch);
+        suspense.pendingBranch = null;
+        suspense.isInFallback = false;
+        let parent = suspense.parent;
+        let hasUnresolvedAncestor = false;
+        while (parent) {
+          if (parent.pendingBranch) {
+            parent.effects.push(...effects);
+            hasUnresolvedAncestor = true;
+            break;
           }
-          result[u] = i;
+          parent = parent.parent;
         }
-      }
-    }
-    u = result.length;
-    v = result[u - 1];
-    while (u-- > 0) {
-      result[u] = v;
-      v = p[v];
-    }
-    return result;
-  }
-  function locateNonHydratedAsyncRoot(instance) {
-    const subComponent = instance.subTree.component;
-    if (subComponent) {
-      if (subComponent.asyncDep && !subComponent.asyncResolved) {
-        return subComponent;
-      } else {
-        return locateNonHydratedAsyncRoot(subComponent);
-      }
-    }
-  }
-
-  const isTeleport = (type) => type.__isTeleport;
-  const isTeleportDisabled = (props) => props && (props.disabled || props.disabled === "");
-  const isTargetSVG = (target) => typeof SVGElement !== "undefined" && target instanceof SVGElement;
-  const isTargetMathML = (target) => typeof MathMLElement === "function" && target instanceof MathMLElement;
-  const resolveTarget = (props, select) => {
-    const targetSelector = props && props.to;
-    if (isString(targetSelector)) {
-      if (!select) {
-        warn$1(
-          `Current renderer does not support string target for Teleports. (missing querySelector renderer option)`
-        );
-        return null;
-      } else {
-        const target = select(targetSelector);
-        if (!target) {
-          warn$1(
-            `Failed to locate Teleport target with selector "${targetSelector}". Note the target element must exist before the component is mounted - i.e. the target cannot be rendered by the component itself, and ideally should be outside of the entire Vue component tree.`
-          );
+        if (!hasUnresolvedAncestor && !delayEnter) {
+          queuePostFlushCb(effects);
         }
-        return target;
-      }
-    } else {
-      if (!targetSelector && !isTeleportDisabled(props)) {
-        warn$1(`Invalid Teleport target: ${targetSelector}`);
-      }
-      return targetSelector;
-    }
-  };
-  const TeleportImpl = {
-    name: "Teleport",
-    __isTeleport: true,
-    process(n1, n2, container, anchor, parentComponent, parentSuspense, namespace, slotScopeIds, optimized, internals) {
-      const {
-        mc: mountChildren,
-        pc: patchChildren,
-        pbc: patchBlockChildren,
-        o: { insert, querySelector, createText, createComment }
-      } = internals;
-      const disabled = isTeleportDisabled(n2.props);
-      let { shapeFlag, children, dynamicChildren } = n2;
-      if (isHmrUpdating) {
-        optimized = false;
-        dynamicChildren = null;
-      }
-      if (n1 == null) {
-        const placeholder = n2.el = createComment("teleport start") ;
-        const mainAnchor = n2.anchor = createComment("teleport end") ;
-        insert(placeholder, container, anchor);
-        insert(mainAnchor, container, anchor);
-        const target = n2.target = resolveTarget(n2.props, querySelector);
-        const targetAnchor = n2.targetAnchor = createText("");
-        if (target) {
-          insert(targetAnchor, target);
-          if (namespace === "svg" || isTargetSVG(target)) {
-            namespace = "svg";
-          } else if (namespace === "mathml" || isTargetMathML(target)) {
-            namespace = "mathml";
+        suspense.effects = [];
+        if (isSuspensible) {
+          if (parentSuspense && parentSuspense.pendingBranch && parentSuspenseId === parentSuspense.pendingId) {
+            parentSuspense.deps--;
+            if (parentSuspense.deps === 0 && !sync) {
+              parentSuspense.resolve();
+            }
           }
-        } else if (!disabled) {
-          warn$1("Invalid Teleport target on mount:", target, `(${typeof target})`);
         }
-        const mount = (container2, anchor2) => {
-          if (shapeFlag & 16) {
-            mountChildren(
-              children,
-              container2,
-              anchor2,
-              parentComponent,
-              parentSuspense,
-              namespace,
-              slotScopeIds,
-              optimized
-            );
+        triggerEvent(vnode2, "onResolve");
+      },
+      fallback(fallbackVNode) {
+        if (!suspense.pendingBranch) {
+          return;
+        }
+        const { vnode: vnode2, activeBranch, parentComponent: parentComponent2, container: container2, namespace: namespace2 } = suspense;
+        triggerEvent(vnode2, "onFallback");
+        const anchor2 = next(activeBranch);
+        const mountFallback = () => {
+          if (!suspense.isInFallback) {
+            return;
           }
+          patch(
+            null,
+            fallbackVNode,
+            container2,
+            anchor2,
+            parentComponent2,
+            null,
+            // fallback tree will not have suspense context
+            namespace2,
+            slotScopeIds,
+            optimized
+          );
+          setActiveBranch(suspense, fallbackVNode);
         };
-        if (disabled) {
-          mount(container, mainAnchor);
-        } else if (target) {
-          mount(target, targetAnchor);
+        const delayEnter = fallbackVNode.transition && fallbackVNode.transition.mode === "out-in";
+        if (delayEnter) {
+          activeBranch.transition.afterLeave = mountFallback;
         }
-      } else {
-        n2.el = n1.el;
-        const mainAnchor = n2.anchor = n1.anchor;
-        const target = n2.target = n1.target;
-        const targetAnchor = n2.targetAnchor = n1.targetAnchor;
-        const wasDisabled = isTeleportDisabled(n1.props);
-        const currentContainer = wasDisabled ? container : target;
-        const currentAnchor = wasDisabled ? mainAnchor : targetAnchor;
-        if (namespace === "svg" || isTargetSVG(target)) {
-          namespace = "svg";
-        } else if (namespace === "mathml" || isTargetMathML(target)) {
-          namespace = "mathml";
+        suspense.isInFallback = true;
+        unmount(
+          activeBranch,
+          parentComponent2,
+          null,
+          // no suspense so unmount hooks fire now
+          true
+          // shouldRemove
+        );
+        if (!delayEnter) {
+          mountFallback();
         }
-        if (dynamicChildren) {
-          patchBlockChildren(
-            n1.dynamicChildren,
-            dynamicChildren,
-            currentContainer,
-            parentComponent,
-            parentSuspense,
-            namespace,
-            slotScopeIds
-          );
-          traverseStaticChildren(n1, n2, true);
-        } else if (!optimized) {
-          patchChildren(
-            n1,
-            n2,
-            currentContainer,
-            currentAnchor,
-            parentComponent,
-            parentSuspense,
+      },
+      move(container2, anchor2, type) {
+        suspense.activeBranch && move(suspense.activeBranch, container2, anchor2, type);
+        suspense.container = container2;
+      },
+      next() {
+        return suspense.activeBranch && next(suspense.activeBranch);
+      },
+      registerDep(instance, setupRenderEffect, optimized2) {
+        const isInPendingSuspense = !!suspense.pendingBranch;
+        if (isInPendingSuspense) {
+          suspense.deps++;
+        }
+        const hydratedEl = instance.vnode.el;
+        instance.asyncDep.catch((err) => {
+          handleError(err, instance, 0);
+        }).then((asyncSetupResult) => {
+          if (instance.isUnmounted || suspense.isUnmounted || suspense.pendingId !== instance.suspenseId) {
+            return;
+          }
+          instance.asyncResolved = true;
+          const { vnode: vnode2 } = instance;
+          {
+            pushWarningContext(vnode2);
+          }
+          handleSetupResult(instance, asyncSetupResult, false);
+          if (hydratedEl) {
+            vnode2.el = hydratedEl;
+          }
+          const placeholder = !hydratedEl && instance.subTree.el;
+          setupRenderEffect(
+            instance,
+            vnode2,
+            // component may have been moved before resolve.
+            // if this is not a hydration, instance.subTree will be the comment
+            // placeholder.
+            parentNode(hydratedEl || instance.subTree.el),
+            // anchor will not be used if this is hydration, so only need to
+            // consider the comment placeholder case.
+            hydratedEl ? null : next(instance.subTree),
+            suspense,
             namespace,
-            slotScopeIds,
-            false
+            optimized2
           );
-        }
-        if (disabled) {
-          if (!wasDisabled) {
-            moveTeleport(
-              n2,
-              container,
-              mainAnchor,
-              internals,
-              1
-            );
-          } else {
-            if (n2.props && n1.props && n2.props.to !== n1.props.to) {
-              n2.props.to = n1.props.to;
-            }
+          if (placeholder) {
+            remove(placeholder);
           }
-        } else {
-          if ((n2.props && n2.props.to) !== (n1.props && n1.props.to)) {
-            const nextTarget = n2.target = resolveTarget(
-              n2.props,
-              querySelector
-            );
-            if (nextTarget) {
-              moveTeleport(
-                n2,
-                nextTarget,
-                null,
-                internals,
-                0
-              );
-            } else {
-              warn$1(
-                "Invalid Teleport target on update:",
-                target,
-                `(${typeof target})`
-              );
-            }
-          } else if (wasDisabled) {
-            moveTeleport(
-              n2,
-              target,
-              targetAnchor,
-              internals,
-              1
-            );
+          updateHOCHostEl(instance, vnode2.el);
+          {
+            popWarningContext();
+          }
+          if (isInPendingSuspense && --suspense.deps === 0) {
+            suspense.resolve();
           }
+        });
+      },
+      unmount(parentSuspense2, doRemove) {
+        suspense.isUnmounted = true;
+        if (suspense.activeBranch) {
+          unmount(
+            suspense.activeBranch,
+            parentComponent,
+            parentSuspense2,
+            doRemove
+          );
         }
-      }
-      updateCssVars(n2);
-    },
-    remove(vnode, parentComponent, parentSuspense, optimized, { um: unmount, o: { remove: hostRemove } }, doRemove) {
-      const { shapeFlag, children, anchor, targetAnchor, target, props } = vnode;
-      if (target) {
-        hostRemove(targetAnchor);
-      }
-      doRemove && hostRemove(anchor);
-      if (shapeFlag & 16) {
-        const shouldRemove = doRemove || !isTeleportDisabled(props);
-        for (let i = 0; i < children.length; i++) {
-          const child = children[i];
+        if (suspense.pendingBranch) {
           unmount(
-            child,
+            suspense.pendingBranch,
             parentComponent,
-            parentSuspense,
-            shouldRemove,
-            !!child.dynamicChildren
+            parentSuspense2,
+            doRemove
           );
         }
       }
-    },
-    move: moveTeleport,
-    hydrate: hydrateTeleport
-  };
-  function moveTeleport(vnode, container, parentAnchor, { o: { insert }, m: move }, moveType = 2) {
-    if (moveType === 0) {
-      insert(vnode.targetAnchor, container, parentAnchor);
+    };
+    return suspense;
+  }
+  function hydrateSuspense(node, vnode, parentComponent, parentSuspense, namespace, slotScopeIds, optimized, rendererInternals, hydrateNode) {
+    const suspense = vnode.suspense = createSuspenseBoundary(
+      vnode,
+      parentSuspense,
+      parentComponent,
+      node.parentNode,
+      // eslint-disable-next-line no-restricted-globals
+      document.createElement("div"),
+      null,
+      namespace,
+      slotScopeIds,
+      optimized,
+      rendererInternals,
+      true
+    );
+    const result = hydrateNode(
+      node,
+      suspense.pendingBranch = vnode.ssContent,
+      parentComponent,
+      suspense,
+      slotScopeIds,
+      optimized
+    );
+    if (suspense.deps === 0) {
+      suspense.resolve(false, true);
     }
-    const { el, anchor, shapeFlag, children, props } = vnode;
-    const isReorder = moveType === 2;
-    if (isReorder) {
-      insert(el, container, parentAnchor);
+    return result;
+  }
+  function normalizeSuspenseChildren(vnode) {
+    const { shapeFlag, children } = vnode;
+    const isSlotChildren = shapeFlag & 32;
+    vnode.ssContent = normalizeSuspenseSlot(
+      isSlotChildren ? children.default : children
+    );
+    vnode.ssFallback = isSlotChildren ? normalizeSuspenseSlot(children.fallback) : createVNode(Comment);
+  }
+  function normalizeSuspenseSlot(s) {
+    let block;
+    if (isFunction(s)) {
+      const trackBlock = isBlockTreeEnabled && s._c;
+      if (trackBlock) {
+        s._d = false;
+        openBlock();
+      }
+      s = s();
+      if (trackBlock) {
+        s._d = true;
+        block = currentBlock;
+        closeBlock();
+      }
     }
-    if (!isReorder || isTeleportDisabled(props)) {
-      if (shapeFlag & 16) {
-        for (let i = 0; i < children.length; i++) {
-          move(
-            children[i],
-            container,
-            parentAnchor,
-            2
-          );
-        }
+    if (isArray(s)) {
+      const singleChild = filterSingleRoot(s);
+      if (!singleChild && s.filter((child) => child !== NULL_DYNAMIC_COMPONENT).length > 0) {
+        warn$1(`<Suspense> slots expect a single root node.`);
       }
+      s = singleChild;
     }
-    if (isReorder) {
-      insert(anchor, container, parentAnchor);
+    s = normalizeVNode(s);
+    if (block && !s.dynamicChildren) {
+      s.dynamicChildren = block.filter((c) => c !== s);
     }
+    return s;
   }
-  function hydrateTeleport(node, vnode, parentComponent, parentSuspense, slotScopeIds, optimized, {
-    o: { nextSibling, parentNode, querySelector }
-  }, hydrateChildren) {
-    const target = vnode.target = resolveTarget(
-      vnode.props,
-      querySelector
-    );
-    if (target) {
-      const targetNode = target._lpa || target.firstChild;
-      if (vnode.shapeFlag & 16) {
-        if (isTeleportDisabled(vnode.props)) {
-          vnode.anchor = hydrateChildren(
-            nextSibling(node),
-            vnode,
-            parentNode(node),
-            parentComponent,
-            parentSuspense,
-            slotScopeIds,
-            optimized
-          );
-          vnode.targetAnchor = targetNode;
-        } else {
-          vnode.anchor = nextSibling(node);
-          let targetAnchor = targetNode;
-          while (targetAnchor) {
-            targetAnchor = nextSibling(targetAnchor);
-            if (targetAnchor && targetAnchor.nodeType === 8 && targetAnchor.data === "teleport anchor") {
-              vnode.targetAnchor = targetAnchor;
-              target._lpa = vnode.targetAnchor && nextSibling(vnode.targetAnchor);
-              break;
-            }
-          }
-          hydrateChildren(
-            targetNode,
-            vnode,
-            target,
-            parentComponent,
-            parentSuspense,
-            slotScopeIds,
-            optimized
-          );
-        }
+  function queueEffectWithSuspense(fn, suspense) {
+    if (suspense && suspense.pendingBranch) {
+      if (isArray(fn)) {
+        suspense.effects.push(...fn);
+      } else {
+        suspense.effects.push(fn);
       }
-      updateCssVars(vnode);
+    } else {
+      queuePostFlushCb(fn);
+    }
+  }
+  function setActiveBranch(suspense, branch) {
+    suspense.activeBranch = branch;
+    const { vnode, parentComponent } = suspense;
+    let el = branch.el;
+    while (!el && branch.component) {
+      branch = branch.component.subTree;
+      el = branch.el;
+    }
+    vnode.el = el;
+    if (parentComponent && parentComponent.subTree === vnode) {
+      parentComponent.vnode.el = el;
+      updateHOCHostEl(parentComponent, el);
     }
-    return vnode.anchor && nextSibling(vnode.anchor);
   }
-  const Teleport = TeleportImpl;
-  function updateCssVars(vnode) {
-    const ctx = vnode.ctx;
-    if (ctx && ctx.ut) {
-      let node = vnode.children[0].el;
-      while (node && node !== vnode.targetAnchor) {
-        if (node.nodeType === 1)
-          node.setAttribute("data-v-owner", ctx.uid);
-        node = node.nextSibling;
-      }
-      ctx.ut();
-    }
+  function isVNodeSuspensible(vnode) {
+    const suspensible = vnode.props && vnode.props.suspensible;
+    return suspensible != null && suspensible !== false;
   }
 
   const Fragment = Symbol.for("v-fgt");
@@ -8571,6 +8677,9 @@ Server rendered element contains fewer child nodes than client vdom.`
   let isBlockTreeEnabled = 1;
   function setBlockTracking(value) {
     isBlockTreeEnabled += value;
+    if (value < 0 && currentBlock) {
+      currentBlock.hasOnce = true;
+    }
   }
   function setupBlock(vnode) {
     vnode.dynamicChildren = isBlockTreeEnabled > 0 ? currentBlock || EMPTY_ARR : null;
@@ -8609,10 +8718,13 @@ Server rendered element contains fewer child nodes than client vdom.`
     return value ? value.__v_isVNode === true : false;
   }
   function isSameVNodeType(n1, n2) {
-    if (n2.shapeFlag & 6 && hmrDirtyComponents.has(n2.type)) {
-      n1.shapeFlag &= ~256;
-      n2.shapeFlag &= ~512;
-      return false;
+    if (n2.shapeFlag & 6 && n1.component) {
+      const dirtyInstances = hmrDirtyComponents.get(n2.type);
+      if (dirtyInstances && dirtyInstances.has(n1.component)) {
+        n1.shapeFlag &= ~256;
+        n2.shapeFlag &= ~512;
+        return false;
+      }
     }
     return n1.type === n2.type && n1.key === n2.key;
   }
@@ -8656,6 +8768,7 @@ Server rendered element contains fewer child nodes than client vdom.`
       el: null,
       anchor: null,
       target: null,
+      targetStart: null,
       targetAnchor: null,
       staticCount: 0,
       shapeFlag,
@@ -8714,7 +8827,7 @@ Server rendered element contains fewer child nodes than client vdom.`
           currentBlock.push(cloned);
         }
       }
-      cloned.patchFlag |= -2;
+      cloned.patchFlag = -2;
       return cloned;
     }
     if (isClassComponent(type)) {
@@ -8755,8 +8868,7 @@ Component that was made reactive: `,
     );
   }
   function guardReactiveProps(props) {
-    if (!props)
-      return null;
+    if (!props) return null;
     return isProxy(props) || isInternalObject(props) ? extend({}, props) : props;
   }
   function cloneVNode(vnode, extraProps, mergeRef = false, cloneTransition = false) {
@@ -8778,6 +8890,7 @@ Component that was made reactive: `,
       slotScopeIds: vnode.slotScopeIds,
       children: patchFlag === -1 && isArray(children) ? children.map(deepCloneVNode) : children,
       target: vnode.target,
+      targetStart: vnode.targetStart,
       targetAnchor: vnode.targetAnchor,
       staticCount: vnode.staticCount,
       shapeFlag: vnode.shapeFlag,
@@ -8805,7 +8918,10 @@ Component that was made reactive: `,
       ce: vnode.ce
     };
     if (transition && cloneTransition) {
-      cloned.transition = transition.clone(cloned);
+      setTransitionHooks(
+        cloned,
+        transition.clone(cloned)
+      );
     }
     return cloned;
   }
@@ -8976,8 +9092,6 @@ Component that was made reactive: `,
       refs: EMPTY_OBJ,
       setupState: EMPTY_OBJ,
       setupContext: null,
-      attrsProxy: null,
-      slotsProxy: null,
       // suspense related
       suspense,
       suspenseId: suspense ? suspense.pendingId : 0,
@@ -9050,12 +9164,12 @@ Component that was made reactive: `,
     return instance.vnode.shapeFlag & 4;
   }
   let isInSSRComponentSetup = false;
-  function setupComponent(instance, isSSR = false) {
+  function setupComponent(instance, isSSR = false, optimized = false) {
     isSSR && setInSSRSetupState(isSSR);
     const { props, children } = instance.vnode;
     const isStateful = isStatefulComponent(instance);
     initProps(instance, props, isStateful, isSSR);
-    initSlots(instance, children);
+    initSlots(instance, children, optimized);
     const setupResult = isStateful ? setupStatefulComponent(instance, isSSR) : void 0;
     isSSR && setInSSRSetupState(false);
     return setupResult;
@@ -9214,7 +9328,7 @@ Component that was made reactive: `,
           `Component provided template option but runtime compilation is not supported in this build of Vue.` + (` Use "vue.global.js" instead.` )
         );
       } else {
-        warn$1(`Component is missing template or render function.`);
+        warn$1(`Component is missing template or render function: `, Component);
       }
     }
   }
@@ -9234,12 +9348,12 @@ Component that was made reactive: `,
     }
   } ;
   function getSlotsProxy(instance) {
-    return instance.slotsProxy || (instance.slotsProxy = new Proxy(instance.slots, {
+    return new Proxy(instance.slots, {
       get(target, key) {
         track(instance, "get", "$slots");
         return target[key];
       }
-    }));
+    });
   }
   function createSetupContext(instance) {
     const expose = (exposed) => {
@@ -9267,12 +9381,13 @@ Component that was made reactive: `,
     };
     {
       let attrsProxy;
+      let slotsProxy;
       return Object.freeze({
         get attrs() {
           return attrsProxy || (attrsProxy = new Proxy(instance.attrs, attrsProxyHandlers));
         },
         get slots() {
-          return getSlotsProxy(instance);
+          return slotsProxy || (slotsProxy = getSlotsProxy(instance));
         },
         get emit() {
           return (event, ...args) => instance.emit(event, ...args);
@@ -9281,7 +9396,7 @@ Component that was made reactive: `,
       });
     }
   }
-  function getExposeProxy(instance) {
+  function getComponentPublicInstance(instance) {
     if (instance.exposed) {
       return instance.exposeProxy || (instance.exposeProxy = new Proxy(proxyRefs(markRaw(instance.exposed)), {
         get(target, key) {
@@ -9295,6 +9410,8 @@ Component that was made reactive: `,
           return key in target || key in publicPropertiesMap;
         }
       }));
+    } else {
+      return instance.proxy;
     }
   }
   const classifyRE = /(?:^|[-_])(\w)/g;
@@ -9339,59 +9456,6 @@ Component that was made reactive: `,
     return c;
   };
 
-  function useModel(props, name, options = EMPTY_OBJ) {
-    const i = getCurrentInstance();
-    if (!i) {
-      warn$1(`useModel() called without active instance.`);
-      return ref();
-    }
-    if (!i.propsOptions[0][name]) {
-      warn$1(`useModel() called with prop "${name}" which is not declared.`);
-      return ref();
-    }
-    const camelizedName = camelize(name);
-    const hyphenatedName = hyphenate(name);
-    const res = customRef((track, trigger) => {
-      let localValue;
-      watchSyncEffect(() => {
-        const propValue = props[name];
-        if (hasChanged(localValue, propValue)) {
-          localValue = propValue;
-          trigger();
-        }
-      });
-      return {
-        get() {
-          track();
-          return options.get ? options.get(localValue) : localValue;
-        },
-        set(value) {
-          const rawProps = i.vnode.props;
-          if (!(rawProps && // check if parent has passed v-model
-          (name in rawProps || camelizedName in rawProps || hyphenatedName in rawProps) && (`onUpdate:${name}` in rawProps || `onUpdate:${camelizedName}` in rawProps || `onUpdate:${hyphenatedName}` in rawProps)) && hasChanged(value, localValue)) {
-            localValue = value;
-            trigger();
-          }
-          i.emit(`update:${name}`, options.set ? options.set(value) : value);
-        }
-      };
-    });
-    const modifierKey = name === "modelValue" ? "modelModifiers" : `${name}Modifiers`;
-    res[Symbol.iterator] = () => {
-      let i2 = 0;
-      return {
-        next() {
-          if (i2 < 2) {
-            return { value: i2++ ? props[modifierKey] || {} : res, done: false };
-          } else {
-            return { done: true };
-          }
-        }
-      };
-    };
-    return res;
-  }
-
   function h(type, propsOrChildren, children) {
     const l = arguments.length;
     if (l === 2) {
@@ -9422,6 +9486,7 @@ Component that was made reactive: `,
     const stringStyle = { style: "color:#f5222d" };
     const keywordStyle = { style: "color:#eb2f96" };
     const formatter = {
+      __vue_custom_formatter: true,
       header(obj) {
         if (!isObject(obj)) {
           return null;
@@ -9596,6 +9661,7 @@ Component that was made reactive: `,
     }
     const ret = render();
     ret.memo = memo.slice();
+    ret.cacheIndex = index;
     return cache[index] = ret;
   }
   function isMemoSame(cached, memo) {
@@ -9614,7 +9680,7 @@ Component that was made reactive: `,
     return true;
   }
 
-  const version = "3.4.26";
+  const version = "3.4.38";
   const warn = warn$1 ;
   const ErrorTypeStrings = ErrorTypeStrings$1 ;
   const devtools = devtools$1 ;
@@ -9639,7 +9705,7 @@ Component that was made reactive: `,
       }
     },
     createElement: (tag, namespace, is, props) => {
-      const el = namespace === "svg" ? doc.createElementNS(svgNS, tag) : namespace === "mathml" ? doc.createElementNS(mathmlNS, tag) : doc.createElement(tag, is ? { is } : void 0);
+      const el = namespace === "svg" ? doc.createElementNS(svgNS, tag) : namespace === "mathml" ? doc.createElementNS(mathmlNS, tag) : is ? doc.createElement(tag, { is }) : doc.createElement(tag);
       if (tag === "select" && props && props.multiple != null) {
         el.setAttribute("multiple", props.multiple);
       }
@@ -9668,8 +9734,7 @@ Component that was made reactive: `,
       if (start && (start === end || start.nextSibling)) {
         while (true) {
           parent.insertBefore(start.cloneNode(true), anchor);
-          if (start === end || !(start = start.nextSibling))
-            break;
+          if (start === end || !(start = start.nextSibling)) break;
         }
       } else {
         templateContainer.innerHTML = namespace === "svg" ? `<svg>${content}</svg>` : namespace === "mathml" ? `<math>${content}</math>` : content;
@@ -9953,8 +10018,7 @@ Component that was made reactive: `,
     return Math.max(...durations.map((d, i) => toMs(d) + toMs(delays[i])));
   }
   function toMs(s) {
-    if (s === "auto")
-      return 0;
+    if (s === "auto") return 0;
     return Number(s.slice(0, -1).replace(",", ".")) * 1e3;
   }
   function forceReflow() {
@@ -9992,8 +10056,7 @@ Component that was made reactive: `,
       }
     },
     updated(el, { value, oldValue }, { transition }) {
-      if (!value === !oldValue)
-        return;
+      if (!value === !oldValue) return;
       if (transition) {
         if (value) {
           transition.beforeEnter(el);
@@ -10040,8 +10103,10 @@ Component that was made reactive: `,
       setVarsOnVNode(instance.subTree, vars);
       updateTeleports(vars);
     };
-    onMounted(() => {
+    onBeforeMount(() => {
       watchPostEffect(setVars);
+    });
+    onMounted(() => {
       const ob = new MutationObserver(setVars);
       ob.observe(instance.subTree.el.parentNode, { childList: true });
       onUnmounted(() => ob.disconnect());
@@ -10068,8 +10133,7 @@ Component that was made reactive: `,
       let { el, anchor } = vnode;
       while (el) {
         setVarsOnNode(el, vars);
-        if (el === anchor)
-          break;
+        if (el === anchor) break;
         el = el.nextSibling;
       }
     }
@@ -10141,8 +10205,7 @@ Component that was made reactive: `,
     if (isArray(val)) {
       val.forEach((v) => setStyle(style, name, v));
     } else {
-      if (val == null)
-        val = "";
+      if (val == null) val = "";
       {
         if (semicolonRE.test(val)) {
           warn(
@@ -10188,7 +10251,7 @@ Component that was made reactive: `,
   }
 
   const xlinkNS = "http://www.w3.org/1999/xlink";
-  function patchAttr(el, key, value, isSVG, instance) {
+  function patchAttr(el, key, value, isSVG, instance, isBoolean = isSpecialBooleanAttr(key)) {
     if (isSVG && key.startsWith("xlink:")) {
       if (value == null) {
         el.removeAttributeNS(xlinkNS, key.slice(6, key.length));
@@ -10196,28 +10259,28 @@ Component that was made reactive: `,
         el.setAttributeNS(xlinkNS, key, value);
       }
     } else {
-      const isBoolean = isSpecialBooleanAttr(key);
       if (value == null || isBoolean && !includeBooleanAttr(value)) {
         el.removeAttribute(key);
       } else {
-        el.setAttribute(key, isBoolean ? "" : value);
+        el.setAttribute(
+          key,
+          isBoolean ? "" : isSymbol(value) ? String(value) : value
+        );
       }
     }
   }
 
-  function patchDOMProp(el, key, value, prevChildren, parentComponent, parentSuspense, unmountChildren) {
+  function patchDOMProp(el, key, value, parentComponent) {
     if (key === "innerHTML" || key === "textContent") {
-      if (prevChildren) {
-        unmountChildren(prevChildren, parentComponent, parentSuspense);
-      }
-      el[key] = value == null ? "" : value;
+      if (value == null) return;
+      el[key] = value;
       return;
     }
     const tag = el.tagName;
     if (key === "value" && tag !== "PROGRESS" && // custom elements may use _value internally
     !tag.includes("-")) {
       const oldValue = tag === "OPTION" ? el.getAttribute("value") || "" : el.value;
-      const newValue = value == null ? "" : value;
+      const newValue = value == null ? "" : String(value);
       if (oldValue !== newValue || !("_value" in el)) {
         el.value = newValue;
       }
@@ -10341,7 +10404,7 @@ Expected function or array of functions, received type ${typeof value}.`
 
   const isNativeOn = (key) => key.charCodeAt(0) === 111 && key.charCodeAt(1) === 110 && // lowercase letter
   key.charCodeAt(2) > 96 && key.charCodeAt(2) < 123;
-  const patchProp = (el, key, prevValue, nextValue, namespace, prevChildren, parentComponent, parentSuspense, unmountChildren) => {
+  const patchProp = (el, key, prevValue, nextValue, namespace, parentComponent) => {
     const isSVG = namespace === "svg";
     if (key === "class") {
       patchClass(el, nextValue, isSVG);
@@ -10352,15 +10415,10 @@ Expected function or array of functions, received type ${typeof value}.`
         patchEvent(el, key, prevValue, nextValue, parentComponent);
       }
     } else if (key[0] === "." ? (key = key.slice(1), true) : key[0] === "^" ? (key = key.slice(1), false) : shouldSetAsProp(el, key, nextValue, isSVG)) {
-      patchDOMProp(
-        el,
-        key,
-        nextValue,
-        prevChildren,
-        parentComponent,
-        parentSuspense,
-        unmountChildren
-      );
+      patchDOMProp(el, key, nextValue);
+      if (!el.tagName.includes("-") && (key === "value" || key === "checked" || key === "selected")) {
+        patchAttr(el, key, nextValue, isSVG, parentComponent, key !== "value");
+      }
     } else {
       if (key === "true-value") {
         el._trueValue = nextValue;
@@ -10406,8 +10464,8 @@ Expected function or array of functions, received type ${typeof value}.`
 
   /*! #__NO_SIDE_EFFECTS__ */
   // @__NO_SIDE_EFFECTS__
-  function defineCustomElement(options, hydrate2) {
-    const Comp = defineComponent(options);
+  function defineCustomElement(options, extraOptions, hydrate2) {
+    const Comp = defineComponent(options, extraOptions);
     class VueCustomElement extends VueElement {
       constructor(initialProps) {
         super(Comp, initialProps, hydrate2);
@@ -10417,8 +10475,8 @@ Expected function or array of functions, received type ${typeof value}.`
     return VueCustomElement;
   }
   /*! #__NO_SIDE_EFFECTS__ */
-  const defineSSRCustomElement = /* @__NO_SIDE_EFFECTS__ */ (options) => {
-    return /* @__PURE__ */ defineCustomElement(options, hydrate);
+  const defineSSRCustomElement = /* @__NO_SIDE_EFFECTS__ */ (options, extraOptions) => {
+    return /* @__PURE__ */ defineCustomElement(options, extraOptions, hydrate);
   };
   const BaseClass = typeof HTMLElement !== "undefined" ? HTMLElement : class {
   };
@@ -10461,12 +10519,12 @@ Expected function or array of functions, received type ${typeof value}.`
     }
     disconnectedCallback() {
       this._connected = false;
-      if (this._ob) {
-        this._ob.disconnect();
-        this._ob = null;
-      }
       nextTick(() => {
         if (!this._connected) {
+          if (this._ob) {
+            this._ob.disconnect();
+            this._ob = null;
+          }
           render(null, this.shadowRoot);
           this._instance = null;
         }
@@ -10790,8 +10848,7 @@ Expected function or array of functions, received type ${typeof value}.`
       el[assignKey] = getModelAssigner(vnode);
       const castToNumber = number || vnode.props && vnode.props.type === "number";
       addEventListener(el, lazy ? "change" : "input", (e) => {
-        if (e.target.composing)
-          return;
+        if (e.target.composing) return;
         let domValue = el.value;
         if (trim) {
           domValue = domValue.trim();
@@ -10816,17 +10873,16 @@ Expected function or array of functions, received type ${typeof value}.`
     mounted(el, { value }) {
       el.value = value == null ? "" : value;
     },
-    beforeUpdate(el, { value, modifiers: { lazy, trim, number } }, vnode) {
+    beforeUpdate(el, { value, oldValue, modifiers: { lazy, trim, number } }, vnode) {
       el[assignKey] = getModelAssigner(vnode);
-      if (el.composing)
-        return;
+      if (el.composing) return;
       const elValue = (number || el.type === "number") && !/^0\d/.test(el.value) ? looseToNumber(el.value) : el.value;
       const newValue = value == null ? "" : value;
       if (elValue === newValue) {
         return;
       }
       if (document.activeElement === el && el.type !== "range") {
-        if (lazy) {
+        if (lazy && value === oldValue) {
           return;
         }
         if (trim && el.value.trim() === newValue) {
@@ -10958,8 +11014,7 @@ Expected function or array of functions, received type ${typeof value}.`
           option.selected = value.has(optionValue);
         }
       } else if (looseEqual(getValue(option), value)) {
-        if (el.selectedIndex !== i)
-          el.selectedIndex = i;
+        if (el.selectedIndex !== i) el.selectedIndex = i;
         return;
       }
     }
@@ -11034,8 +11089,7 @@ Expected function or array of functions, received type ${typeof value}.`
     return cache[cacheKey] || (cache[cacheKey] = (event, ...args) => {
       for (let i = 0; i < modifiers.length; i++) {
         const guard = modifierGuards[modifiers[i]];
-        if (guard && guard(event, modifiers))
-          return;
+        if (guard && guard(event, modifiers)) return;
       }
       return fn(event, ...args);
     });
@@ -11089,8 +11143,7 @@ Expected function or array of functions, received type ${typeof value}.`
     const { mount } = app;
     app.mount = (containerOrSelector) => {
       const container = normalizeContainer(containerOrSelector);
-      if (!container)
-        return;
+      if (!container) return;
       const component = app._component;
       if (!isFunction(component) && !component.render && !component.template) {
         component.template = container.innerHTML;
@@ -11395,12 +11448,12 @@ Make sure to use the production build (*.prod.js) when deploying for production.
       loc: locStub
     };
   }
-  function createCacheExpression(index, value, isVNode = false) {
+  function createCacheExpression(index, value, isVOnce = false) {
     return {
       type: 20,
       index,
       value,
-      isVNode,
+      isVOnce,
       loc: locStub
     };
   }
@@ -12323,13 +12376,14 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
         return BASE_TRANSITION;
     }
   }
-  const nonIdentifierRE = /^\d|[^\$\w]/;
+  const nonIdentifierRE = /^\d|[^\$\w\xA0-\uFFFF]/;
   const isSimpleIdentifier = (name) => !nonIdentifierRE.test(name);
   const validFirstIdentCharRE = /[A-Za-z_$\xA0-\uFFFF]/;
   const validIdentCharRE = /[\.\?\w$\xA0-\uFFFF]/;
   const whitespaceRE = /\s+[.[]\s*|\s*[.[]\s+/g;
-  const isMemberExpressionBrowser = (path) => {
-    path = path.trim().replace(whitespaceRE, (s) => s.trim());
+  const getExpSource = (exp) => exp.type === 4 ? exp.content : exp.loc.source;
+  const isMemberExpressionBrowser = (exp) => {
+    const path = getExpSource(exp).trim().replace(whitespaceRE, (s) => s.trim());
     let state = 0 /* inMemberExp */;
     let stateStack = [];
     let currentOpenBracketCount = 0;
@@ -12391,6 +12445,9 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     return !currentOpenBracketCount && !currentOpenParensCount;
   };
   const isMemberExpression = isMemberExpressionBrowser ;
+  const fnExpRE = /^\s*(async\s*)?(\([^)]*?\)|[\w$_]+)\s*(:[^=]+)?=>|^\s*(async\s+)?function(?:\s+[\w$]+)?\s*\(/;
+  const isFnExpressionBrowser = (exp) => fnExpRE.test(getExpSource(exp));
+  const isFnExpression = isFnExpressionBrowser ;
   function assert(condition, msg) {
     if (!condition) {
       throw new Error(msg || `unexpected compiler condition`);
@@ -12408,8 +12465,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     for (let i = 0; i < node.props.length; i++) {
       const p = node.props[i];
       if (p.type === 6) {
-        if (dynamicOnly)
-          continue;
+        if (dynamicOnly) continue;
         if (p.name === name && (p.value || allowEmpty)) {
           return p;
         }
@@ -12534,7 +12590,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
       return node;
     }
   }
-  const forAliasRE = /([\s\S]*?)\s+(?:in|of)\s+([\s\S]*)/;
+  const forAliasRE = /([\s\S]*?)\s+(?:in|of)\s+(\S[\s\S]*)/;
 
   const defaultParserOptions = {
     parseMode: "base",
@@ -12687,8 +12743,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
       }
     },
     ondirarg(start, end) {
-      if (start === end)
-        return;
+      if (start === end) return;
       const arg = getSlice(start, end);
       if (inVPre) {
         currentProp.name += arg;
@@ -12720,14 +12775,12 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     },
     onattribdata(start, end) {
       currentAttrValue += getSlice(start, end);
-      if (currentAttrStartIndex < 0)
-        currentAttrStartIndex = start;
+      if (currentAttrStartIndex < 0) currentAttrStartIndex = start;
       currentAttrEndIndex = end;
     },
     onattribentity(char, start, end) {
       currentAttrValue += char;
-      if (currentAttrStartIndex < 0)
-        currentAttrStartIndex = start;
+      if (currentAttrStartIndex < 0) currentAttrStartIndex = start;
       currentAttrEndIndex = end;
     },
     onattribnameend(end) {
@@ -12864,8 +12917,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     const loc = input.loc;
     const exp = input.content;
     const inMatch = exp.match(forAliasRE);
-    if (!inMatch)
-      return;
+    if (!inMatch) return;
     const [, LHS, RHS] = inMatch;
     const createAliasExpression = (content, offset, asParam = false) => {
       const start = loc.start.offset + offset;
@@ -13000,14 +13052,12 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
   }
   function lookAhead(index, c) {
     let i = index;
-    while (currentInput.charCodeAt(i) !== c && i < currentInput.length - 1)
-      i++;
+    while (currentInput.charCodeAt(i) !== c && i < currentInput.length - 1) i++;
     return i;
   }
   function backTrack(index, c) {
     let i = index;
-    while (currentInput.charCodeAt(i) !== c && i >= 0)
-      i--;
+    while (currentInput.charCodeAt(i) !== c && i >= 0) i--;
     return i;
   }
   const specialTemplateDir = /* @__PURE__ */ new Set(["if", "else", "else-if", "for", "slot"]);
@@ -13227,7 +13277,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
         const constantType = doNotHoistNode ? 0 : getConstantType(child, context);
         if (constantType > 0) {
           if (constantType >= 2) {
-            child.codegenNode.patchFlag = -1 + (` /* HOISTED */` );
+            child.codegenNode.patchFlag = -1;
             child.codegenNode = context.hoist(child.codegenNode);
             hoistedCount++;
             continue;
@@ -13235,8 +13285,8 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
         } else {
           const codegenNode = child.codegenNode;
           if (codegenNode.type === 13) {
-            const flag = getPatchFlag(codegenNode);
-            if ((!flag || flag === 512 || flag === 1) && getGeneratedPropsConstantType(child, context) >= 2) {
+            const flag = codegenNode.patchFlag;
+            if ((flag === void 0 || flag === 512 || flag === 1) && getGeneratedPropsConstantType(child, context) >= 2) {
               const props = getNodeProps(child);
               if (props) {
                 codegenNode.props = context.hoist(props);
@@ -13297,11 +13347,10 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
         if (codegenNode.type !== 13) {
           return 0;
         }
-        if (codegenNode.isBlock && node.tag !== "svg" && node.tag !== "foreignObject") {
+        if (codegenNode.isBlock && node.tag !== "svg" && node.tag !== "foreignObject" && node.tag !== "math") {
           return 0;
         }
-        const flag = getPatchFlag(codegenNode);
-        if (!flag) {
+        if (codegenNode.patchFlag === void 0) {
           let returnType2 = 3;
           const generatedPropsType = getGeneratedPropsConstantType(node, context);
           if (generatedPropsType === 0) {
@@ -13443,10 +13492,6 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
       return codegenNode.props;
     }
   }
-  function getPatchFlag(node) {
-    const flag = node.patchFlag;
-    return flag ? parseInt(flag, 10) : void 0;
-  }
 
   function createTransformContext(root, {
     filename = "",
@@ -13577,8 +13622,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
       removeIdentifiers(exp) {
       },
       hoist(exp) {
-        if (isString(exp))
-          exp = createSimpleExpression(exp);
+        if (isString(exp)) exp = createSimpleExpression(exp);
         context.hoists.push(exp);
         const identifier = createSimpleExpression(
           `_hoisted_${context.hoists.length}`,
@@ -13639,7 +13683,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
         helper(FRAGMENT),
         void 0,
         root.children,
-        patchFlag + (` /* ${patchFlagText} */` ),
+        patchFlag,
         void 0,
         void 0,
         true,
@@ -13655,8 +13699,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     };
     for (; i < parent.children.length; i++) {
       const child = parent.children[i];
-      if (isString(child))
-        continue;
+      if (isString(child)) continue;
       context.grandParent = context.parent;
       context.parent = parent;
       context.childIndex = i;
@@ -13727,8 +13770,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
             props.splice(i, 1);
             i--;
             const onExit = fn(node, prop, context);
-            if (onExit)
-              exitFns.push(onExit);
+            if (onExit) exitFns.push(onExit);
           }
         }
         return exitFns;
@@ -13800,8 +13842,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
   }
   function generate(ast, options = {}) {
     const context = createCodegenContext(ast, options);
-    if (options.onContextCreated)
-      options.onContextCreated(context);
+    if (options.onContextCreated) options.onContextCreated(context);
     const {
       mode,
       push,
@@ -14078,8 +14119,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
   }
   function genInterpolation(node, context) {
     const { push, helper, pure } = context;
-    if (pure)
-      push(PURE_ANNOTATION);
+    if (pure) push(PURE_ANNOTATION);
     push(`${helper(TO_DISPLAY_STRING)}(`);
     genNode(node.content, context);
     push(`)`);
@@ -14131,6 +14171,17 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
       disableTracking,
       isComponent
     } = node;
+    let patchFlagString;
+    if (patchFlag) {
+      {
+        if (patchFlag < 0) {
+          patchFlagString = patchFlag + ` /* ${PatchFlagNames[patchFlag]} */`;
+        } else {
+          const flagNames = Object.keys(PatchFlagNames).map(Number).filter((n) => n > 0 && patchFlag & n).map((n) => PatchFlagNames[n]).join(`, `);
+          patchFlagString = patchFlag + ` /* ${flagNames} */`;
+        }
+      }
+    }
     if (directives) {
       push(helper(WITH_DIRECTIVES) + `(`);
     }
@@ -14143,7 +14194,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     const callHelper = isBlock ? getVNodeBlockHelper(context.inSSR, isComponent) : getVNodeHelper(context.inSSR, isComponent);
     push(helper(callHelper) + `(`, -2 /* None */, node);
     genNodeList(
-      genNullableArgs([tag, props, children, patchFlag, dynamicProps]),
+      genNullableArgs([tag, props, children, patchFlagString, dynamicProps]),
       context
     );
     push(`)`);
@@ -14159,8 +14210,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
   function genNullableArgs(args) {
     let i = args.length;
     while (i--) {
-      if (args[i] != null)
-        break;
+      if (args[i] != null) break;
     }
     return args.slice(0, i + 1).map((arg) => arg || `null`);
   }
@@ -14275,15 +14325,16 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
   function genCacheExpression(node, context) {
     const { push, helper, indent, deindent, newline } = context;
     push(`_cache[${node.index}] || (`);
-    if (node.isVNode) {
+    if (node.isVOnce) {
       indent();
       push(`${helper(SET_BLOCK_TRACKING)}(-1),`);
       newline();
+      push(`(`);
     }
     push(`_cache[${node.index}] = `);
     genNode(node.value, context);
-    if (node.isVNode) {
-      push(`,`);
+    if (node.isVOnce) {
+      push(`).cacheIndex = ${node.index},`);
       newline();
       push(`${helper(SET_BLOCK_TRACKING)}(1),`);
       newline();
@@ -14458,8 +14509,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
           sibling.branches.push(branch);
           const onExit = processCodegen && processCodegen(sibling, branch, false);
           traverseNode(branch, context);
-          if (onExit)
-            onExit();
+          if (onExit) onExit();
           context.currentNode = null;
         } else {
           context.onError(
@@ -14528,7 +14578,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
           helper(FRAGMENT),
           createObjectExpression([keyProperty]),
           children,
-          patchFlag + (` /* ${patchFlagText} */` ),
+          patchFlag,
           void 0,
           void 0,
           true,
@@ -14581,6 +14631,80 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     }
   }
 
+  const transformBind = (dir, _node, context) => {
+    const { modifiers, loc } = dir;
+    const arg = dir.arg;
+    let { exp } = dir;
+    if (exp && exp.type === 4 && !exp.content.trim()) {
+      {
+        exp = void 0;
+      }
+    }
+    if (!exp) {
+      if (arg.type !== 4 || !arg.isStatic) {
+        context.onError(
+          createCompilerError(
+            52,
+            arg.loc
+          )
+        );
+        return {
+          props: [
+            createObjectProperty(arg, createSimpleExpression("", true, loc))
+          ]
+        };
+      }
+      transformBindShorthand(dir);
+      exp = dir.exp;
+    }
+    if (arg.type !== 4) {
+      arg.children.unshift(`(`);
+      arg.children.push(`) || ""`);
+    } else if (!arg.isStatic) {
+      arg.content = `${arg.content} || ""`;
+    }
+    if (modifiers.includes("camel")) {
+      if (arg.type === 4) {
+        if (arg.isStatic) {
+          arg.content = camelize(arg.content);
+        } else {
+          arg.content = `${context.helperString(CAMELIZE)}(${arg.content})`;
+        }
+      } else {
+        arg.children.unshift(`${context.helperString(CAMELIZE)}(`);
+        arg.children.push(`)`);
+      }
+    }
+    if (!context.inSSR) {
+      if (modifiers.includes("prop")) {
+        injectPrefix(arg, ".");
+      }
+      if (modifiers.includes("attr")) {
+        injectPrefix(arg, "^");
+      }
+    }
+    return {
+      props: [createObjectProperty(arg, exp)]
+    };
+  };
+  const transformBindShorthand = (dir, context) => {
+    const arg = dir.arg;
+    const propName = camelize(arg.content);
+    dir.exp = createSimpleExpression(propName, false, arg.loc);
+  };
+  const injectPrefix = (arg, prefix) => {
+    if (arg.type === 4) {
+      if (arg.isStatic) {
+        arg.content = prefix + arg.content;
+      } else {
+        arg.content = `\`${prefix}\${${arg.content}}\``;
+      }
+    } else {
+      arg.children.unshift(`'${prefix}' + (`);
+      arg.children.push(`)`);
+    }
+  };
+
   const transformFor = createStructuralDirectiveTransform(
     "for",
     (node, dir, context) => {
@@ -14591,9 +14715,12 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
         ]);
         const isTemplate = isTemplateNode(node);
         const memo = findDir(node, "memo");
-        const keyProp = findProp(node, `key`);
-        const keyExp = keyProp && (keyProp.type === 6 ? createSimpleExpression(keyProp.value.content, true) : keyProp.exp);
-        const keyProperty = keyProp ? createObjectProperty(`key`, keyExp) : null;
+        const keyProp = findProp(node, `key`, false, true);
+        if (keyProp && keyProp.type === 7 && !keyProp.exp) {
+          transformBindShorthand(keyProp);
+        }
+        const keyExp = keyProp && (keyProp.type === 6 ? keyProp.value ? createSimpleExpression(keyProp.value.content, true) : void 0 : keyProp.exp);
+        const keyProperty = keyProp && keyExp ? createObjectProperty(`key`, keyExp) : null;
         const isStableFragment = forNode.source.type === 4 && forNode.source.constType > 0;
         const fragmentFlag = isStableFragment ? 64 : keyProp ? 128 : 256;
         forNode.codegenNode = createVNodeCall(
@@ -14601,7 +14728,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
           helper(FRAGMENT),
           void 0,
           renderExp,
-          fragmentFlag + (` /* ${PatchFlagNames[fragmentFlag]} */` ),
+          fragmentFlag,
           void 0,
           void 0,
           true,
@@ -14641,7 +14768,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
               helper(FRAGMENT),
               keyProperty ? createObjectExpression([keyProperty]) : void 0,
               node.children,
-              64 + (` /* ${PatchFlagNames[64]} */` ),
+              64,
               void 0,
               void 0,
               true,
@@ -14742,13 +14869,11 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     const onExit = processCodegen && processCodegen(forNode);
     return () => {
       scopes.vFor--;
-      if (onExit)
-        onExit();
+      if (onExit) onExit();
     };
   }
   function finalizeForParseResult(result, context) {
-    if (result.finalized)
-      return;
+    if (result.finalized) return;
     {
       validateBrowserExpression(result.source, context);
       if (result.key) {
@@ -14781,8 +14906,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
   function createParamsList(args) {
     let i = args.length;
     while (i--) {
-      if (args[i])
-        break;
+      if (args[i]) break;
     }
     return args.slice(0, i + 1).map((arg, i2) => arg || createSimpleExpression(`_`.repeat(i2 + 1), false));
   }
@@ -14886,9 +15010,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
             break;
           }
         }
-        if (prev && isTemplateNode(prev) && findDir(prev, "if")) {
-          children.splice(i, 1);
-          i--;
+        if (prev && isTemplateNode(prev) && findDir(prev, /^(else-)?if$/)) {
           let conditional = dynamicSlots[dynamicSlots.length - 1];
           while (conditional.alternate.type === 19) {
             conditional = conditional.alternate;
@@ -15022,13 +15144,11 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
           }
           break;
         case 9:
-          if (hasForwardedSlots(child.branches))
-            return true;
+          if (hasForwardedSlots(child.branches)) return true;
           break;
         case 10:
         case 11:
-          if (hasForwardedSlots(child.children))
-            return true;
+          if (hasForwardedSlots(child.children)) return true;
           break;
       }
     }
@@ -15053,7 +15173,6 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
       const isDynamicComponent = isObject(vnodeTag) && vnodeTag.callee === RESOLVE_DYNAMIC_COMPONENT;
       let vnodeProps;
       let vnodeChildren;
-      let vnodePatchFlag;
       let patchFlag = 0;
       let vnodeDynamicProps;
       let dynamicPropNames;
@@ -15064,7 +15183,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
         // updates inside get proper isSVG flag at runtime. (#639, #643)
         // This is technically web-specific, but splitting the logic out of core
         // leads to too much unnecessary complexity.
-        (tag === "svg" || tag === "foreignObject")
+        (tag === "svg" || tag === "foreignObject" || tag === "math")
       );
       if (props.length > 0) {
         const propsBuildResult = buildProps(
@@ -15124,25 +15243,15 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
           vnodeChildren = node.children;
         }
       }
-      if (patchFlag !== 0) {
-        {
-          if (patchFlag < 0) {
-            vnodePatchFlag = patchFlag + ` /* ${PatchFlagNames[patchFlag]} */`;
-          } else {
-            const flagNames = Object.keys(PatchFlagNames).map(Number).filter((n) => n > 0 && patchFlag & n).map((n) => PatchFlagNames[n]).join(`, `);
-            vnodePatchFlag = patchFlag + ` /* ${flagNames} */`;
-          }
-        }
-        if (dynamicPropNames && dynamicPropNames.length) {
-          vnodeDynamicProps = stringifyDynamicPropNames(dynamicPropNames);
-        }
+      if (dynamicPropNames && dynamicPropNames.length) {
+        vnodeDynamicProps = stringifyDynamicPropNames(dynamicPropNames);
       }
       node.codegenNode = createVNodeCall(
         context,
         vnodeTag,
         vnodeProps,
         vnodeChildren,
-        vnodePatchFlag,
+        patchFlag === 0 ? void 0 : patchFlag,
         vnodeDynamicProps,
         vnodeDirectives,
         !!shouldUseBlock,
@@ -15170,7 +15279,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
         } else {
           exp = isProp.exp;
           if (!exp) {
-            exp = createSimpleExpression(`is`, false, isProp.loc);
+            exp = createSimpleExpression(`is`, false, isProp.arg.loc);
           }
         }
         if (exp) {
@@ -15184,8 +15293,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     }
     const builtIn = isCoreComponent(tag) || context.isBuiltInComponent(tag);
     if (builtIn) {
-      if (!ssr)
-        context.helper(builtIn);
+      if (!ssr) context.helper(builtIn);
       return builtIn;
     }
     context.helper(RESOLVE_COMPONENT);
@@ -15214,8 +15322,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
         );
         properties = [];
       }
-      if (arg)
-        mergeArgs.push(arg);
+      if (arg) mergeArgs.push(arg);
     };
     const pushRefVForMarker = () => {
       if (context.scopes.vFor > 0) {
@@ -15516,8 +15623,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
       }
     }
     const { loc } = dir;
-    if (dir.exp)
-      dirArgs.push(dir.exp);
+    if (dir.exp) dirArgs.push(dir.exp);
     if (dir.arg) {
       if (!dir.exp) {
         dirArgs.push(`void 0`);
@@ -15547,8 +15653,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     let propsNamesString = `[`;
     for (let i = 0, l = props.length; i < l; i++) {
       propsNamesString += JSON.stringify(props[i]);
-      if (i < l - 1)
-        propsNamesString += ", ";
+      if (i < l - 1) propsNamesString += ", ";
     }
     return propsNamesString + `]`;
   }
@@ -15642,7 +15747,6 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     };
   }
 
-  const fnExpRE = /^\s*([\w$_]+|(async\s*)?\([^)]*?\))\s*(:[^=]+)?=>|^\s*(async\s+)?function(?:\s+[\w$]+)?\s*\(/;
   const transformOn$1 = (dir, node, context, augmentor) => {
     const { loc, modifiers, arg } = dir;
     if (!dir.exp && !modifiers.length) {
@@ -15686,8 +15790,8 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     }
     let shouldCache = context.cacheHandlers && !exp && !context.inVOnce;
     if (exp) {
-      const isMemberExp = isMemberExpression(exp.content);
-      const isInlineStatement = !(isMemberExp || fnExpRE.test(exp.content));
+      const isMemberExp = isMemberExpression(exp);
+      const isInlineStatement = !(isMemberExp || isFnExpression(exp));
       const hasMultipleStatements = exp.content.includes(`;`);
       {
         validateBrowserExpression(
@@ -15723,75 +15827,6 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
     return ret;
   };
 
-  const transformBind = (dir, _node, context) => {
-    const { modifiers, loc } = dir;
-    const arg = dir.arg;
-    let { exp } = dir;
-    if (exp && exp.type === 4 && !exp.content.trim()) {
-      {
-        exp = void 0;
-      }
-    }
-    if (!exp) {
-      if (arg.type !== 4 || !arg.isStatic) {
-        context.onError(
-          createCompilerError(
-            52,
-            arg.loc
-          )
-        );
-        return {
-          props: [
-            createObjectProperty(arg, createSimpleExpression("", true, loc))
-          ]
-        };
-      }
-      const propName = camelize(arg.content);
-      exp = dir.exp = createSimpleExpression(propName, false, arg.loc);
-    }
-    if (arg.type !== 4) {
-      arg.children.unshift(`(`);
-      arg.children.push(`) || ""`);
-    } else if (!arg.isStatic) {
-      arg.content = `${arg.content} || ""`;
-    }
-    if (modifiers.includes("camel")) {
-      if (arg.type === 4) {
-        if (arg.isStatic) {
-          arg.content = camelize(arg.content);
-        } else {
-          arg.content = `${context.helperString(CAMELIZE)}(${arg.content})`;
-        }
-      } else {
-        arg.children.unshift(`${context.helperString(CAMELIZE)}(`);
-        arg.children.push(`)`);
-      }
-    }
-    if (!context.inSSR) {
-      if (modifiers.includes("prop")) {
-        injectPrefix(arg, ".");
-      }
-      if (modifiers.includes("attr")) {
-        injectPrefix(arg, "^");
-      }
-    }
-    return {
-      props: [createObjectProperty(arg, exp)]
-    };
-  };
-  const injectPrefix = (arg, prefix) => {
-    if (arg.type === 4) {
-      if (arg.isStatic) {
-        arg.content = prefix + arg.content;
-      } else {
-        arg.content = `\`${prefix}\${${arg.content}}\``;
-      }
-    } else {
-      arg.children.unshift(`'${prefix}' + (`);
-      arg.children.push(`)`);
-    }
-  };
-
   const transformText = (node, context) => {
     if (node.type === 0 || node.type === 1 || node.type === 11 || node.type === 10) {
       return () => {
@@ -15904,7 +15939,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
       return createTransformProps();
     }
     const maybeRef = false;
-    if (!expString.trim() || !isMemberExpression(expString) && !maybeRef) {
+    if (!expString.trim() || !isMemberExpression(exp) && !maybeRef) {
       context.onError(
         createCompilerError(42, exp.loc)
       );
@@ -16358,8 +16393,7 @@ Use a v-bind binding combined with a v-on listener that emits update:x event ins
   const transformOn = (dir, node, context) => {
     return transformOn$1(dir, node, context, (baseResult) => {
       const { modifiers } = dir;
-      if (!modifiers.length)
-        return baseResult;
+      if (!modifiers.length) return baseResult;
       let { key, value: handlerExp } = baseResult.props[0];
       const { keyModifiers, nonKeyModifiers, eventOptionModifiers } = resolveModifiers(key, modifiers, context, dir.loc);
       if (nonKeyModifiers.includes("right")) {
@@ -0,0 +1,9 @@
+/**
+* vue v3.4.38
+* (c) 2018-present Yuxi (Evan) You and Vue contributors
+* @license MIT
+**/var Vue=function(e){"use strict";let t,n,r,i,l,s,o,a,c;/*! #__NO_SIDE_EFFECTS__ */function u(e,t){let n=new Set(e.split(","));return t?e=>n.has(e.toLowerCase()):e=>n.has(e)}let d={},p=[],h=()=>{},f=()=>!1,m=e=>111===e.charCodeAt(0)&&110===e.charCodeAt(1)&&(e.charCodeAt(2)>122||97>e.charCodeAt(2)),g=e=>e.startsWith("onUpdate:"),y=Object.assign,b=(e,t)=>{let n=e.indexOf(t);n>-1&&e.splice(n,1)},_=Object.prototype.hasOwnProperty,S=(e,t)=>_.call(e,t),x=Array.isArray,C=e=>"[object Map]"===L(e),k=e=>"[object Set]"===L(e),T=e=>"[object Date]"===L(e),w=e=>"[object RegExp]"===L(e),E=e=>"function"==typeof e,A=e=>"string"==typeof e,N=e=>"symbol"==typeof e,I=e=>null!==e&&"object"==typeof e,R=e=>(I(e)||E(e))&&E(e.then)&&E(e.catch),O=Object.prototype.toString,L=e=>O.call(e),M=e=>L(e).slice(8,-1),$=e=>"[object Object]"===L(e),P=e=>A(e)&&"NaN"!==e&&"-"!==e[0]&&""+parseInt(e,10)===e,F=u(",key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted"),D=u("bind,cloak,else-if,else,for,html,if,model,on,once,pre,show,slot,text,memo"),V=e=>{let t=Object.create(null);return n=>t[n]||(t[n]=e(n))},B=/-(\w)/g,U=V(e=>e.replace(B,(e,t)=>t?t.toUpperCase():"")),j=/\B([A-Z])/g,H=V(e=>e.replace(j,"-$1").toLowerCase()),q=V(e=>e.charAt(0).toUpperCase()+e.slice(1)),W=V(e=>e?`on${q(e)}`:""),K=(e,t)=>!Object.is(e,t),z=(e,...t)=>{for(let n=0;n<e.length;n++)e[n](...t)},G=(e,t,n,r=!1)=>{Object.defineProperty(e,t,{configurable:!0,enumerable:!1,writable:r,value:n})},J=e=>{let t=parseFloat(e);return isNaN(t)?e:t},X=e=>{let t=A(e)?Number(e):NaN;return isNaN(t)?e:t},Q=()=>t||(t="undefined"!=typeof globalThis?globalThis:"undefined"!=typeof self?self:"undefined"!=typeof window?window:"undefined"!=typeof global?global:{}),Z=u("Infinity,undefined,NaN,isFinite,isNaN,parseFloat,parseInt,decodeURI,decodeURIComponent,encodeURI,encodeURIComponent,Math,Number,Date,Array,Object,Boolean,String,RegExp,Map,Set,JSON,Intl,BigInt,console,Error");function Y(e){if(x(e)){let t={};for(let n=0;n<e.length;n++){let r=e[n],i=A(r)?er(r):Y(r);if(i)for(let e in i)t[e]=i[e]}return t}if(A(e)||I(e))return e}let ee=/;(?![^(]*\))/g,et=/:([^]+)/,en=/\/\*[^]*?\*\//g;function er(e){let t={};return e.replace(en,"").split(ee).forEach(e=>{if(e){let n=e.split(et);n.length>1&&(t[n[0].trim()]=n[1].trim())}}),t}function ei(e){let t="";if(A(e))t=e;else if(x(e))for(let n=0;n<e.length;n++){let r=ei(e[n]);r&&(t+=r+" ")}else if(I(e))for(let n in e)e[n]&&(t+=n+" ");return t.trim()}let el=u("html,body,base,head,link,meta,style,title,address,article,aside,footer,header,hgroup,h1,h2,h3,h4,h5,h6,nav,section,div,dd,dl,dt,figcaption,figure,picture,hr,img,li,main,ol,p,pre,ul,a,b,abbr,bdi,bdo,br,cite,code,data,dfn,em,i,kbd,mark,q,rp,rt,ruby,s,samp,small,span,strong,sub,sup,time,u,var,wbr,area,audio,map,track,video,embed,object,param,source,canvas,script,noscript,del,ins,caption,col,colgroup,table,thead,tbody,td,th,tr,button,datalist,fieldset,form,input,label,legend,meter,optgroup,option,output,progress,select,textarea,details,dialog,menu,summary,template,blockquote,iframe,tfoot"),es=u("svg,animate,animateMotion,animateTransform,circle,clipPath,color-profile,defs,desc,discard,ellipse,feBlend,feColorMatrix,feComponentTransfer,feComposite,feConvolveMatrix,feDiffuseLighting,feDisplacementMap,feDistantLight,feDropShadow,feFlood,feFuncA,feFuncB,feFuncG,feFuncR,feGaussianBlur,feImage,feMerge,feMergeNode,feMorphology,feOffset,fePointLight,feSpecularLighting,feSpotLight,feTile,feTurbulence,filter,foreignObject,g,hatch,hatchpath,image,line,linearGradient,marker,mask,mesh,meshgradient,meshpatch,meshrow,metadata,mpath,path,pattern,polygon,polyline,radialGradient,rect,set,solidcolor,stop,switch,symbol,text,textPath,title,tspan,unknown,use,view"),eo=u("annotation,annotation-xml,maction,maligngroup,malignmark,math,menclose,merror,mfenced,mfrac,mfraction,mglyph,mi,mlabeledtr,mlongdiv,mmultiscripts,mn,mo,mover,mpadded,mphantom,mprescripts,mroot,mrow,ms,mscarries,mscarry,msgroup,msline,mspace,msqrt,msrow,mstack,mstyle,msub,msubsup,msup,mtable,mtd,mtext,mtr,munder,munderover,none,semantics"),ea=u("area,base,br,col,embed,hr,img,input,link,meta,param,source,track,wbr"),ec=u("itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly");function eu(e,t){if(e===t)return!0;let n=T(e),r=T(t);if(n||r)return!!n&&!!r&&e.getTime()===t.getTime();if(n=N(e),r=N(t),n||r)return e===t;if(n=x(e),r=x(t),n||r)return!!n&&!!r&&function(e,t){if(e.length!==t.length)return!1;let n=!0;for(let r=0;n&&r<e.length;r++)n=eu(e[r],t[r]);return n}(e,t);if(n=I(e),r=I(t),n||r){if(!n||!r||Object.keys(e).length!==Object.keys(t).length)return!1;for(let n in e){let r=e.hasOwnProperty(n),i=t.hasOwnProperty(n);if(r&&!i||!r&&i||!eu(e[n],t[n]))return!1}}return String(e)===String(t)}function ed(e,t){return e.findIndex(e=>eu(e,t))}let ep=e=>!!(e&&!0===e.__v_isRef),eh=e=>A(e)?e:null==e?"":x(e)||I(e)&&(e.toString===O||!E(e.toString))?ep(e)?eh(e.value):JSON.stringify(e,ef,2):String(e),ef=(e,t)=>ep(t)?ef(e,t.value):C(t)?{[`Map(${t.size})`]:[...t.entries()].reduce((e,[t,n],r)=>(e[em(t,r)+" =>"]=n,e),{})}:k(t)?{[`Set(${t.size})`]:[...t.values()].map(e=>em(e))}:N(t)?em(t):!I(t)||x(t)||$(t)?t:String(t),em=(e,t="")=>{var n;return N(e)?`Symbol(${null!=(n=e.description)?n:t})`:e};class eg{constructor(e=!1){this.detached=e,this._active=!0,this.effects=[],this.cleanups=[],this.parent=n,!e&&n&&(this.index=(n.scopes||(n.scopes=[])).push(this)-1)}get active(){return this._active}run(e){if(this._active){let t=n;try{return n=this,e()}finally{n=t}}}on(){n=this}off(){n=this.parent}stop(e){if(this._active){let t,n;for(t=0,n=this.effects.length;t<n;t++)this.effects[t].stop();for(t=0,n=this.cleanups.length;t<n;t++)this.cleanups[t]();if(this.scopes)for(t=0,n=this.scopes.length;t<n;t++)this.scopes[t].stop(!0);if(!this.detached&&this.parent&&!e){let e=this.parent.scopes.pop();e&&e!==this&&(this.parent.scopes[this.index]=e,e.index=this.index)}this.parent=void 0,this._active=!1}}}function ey(e,t=n){t&&t.active&&t.effects.push(e)}class ev{constructor(e,t,n,r){this.fn=e,this.trigger=t,this.scheduler=n,this.active=!0,this.deps=[],this._dirtyLevel=4,this._trackId=0,this._runnings=0,this._shouldSchedule=!1,this._depsLength=0,ey(this,r)}get dirty(){if(2===this._dirtyLevel||3===this._dirtyLevel){this._dirtyLevel=1,eT();for(let e=0;e<this._depsLength;e++){let t=this.deps[e];if(t.computed&&(t.computed.value,this._dirtyLevel>=4))break}1===this._dirtyLevel&&(this._dirtyLevel=0),ew()}return this._dirtyLevel>=4}set dirty(e){this._dirtyLevel=e?4:0}run(){if(this._dirtyLevel=0,!this.active)return this.fn();let e=ex,t=r;try{return ex=!0,r=this,this._runnings++,eb(this),this.fn()}finally{e_(this),this._runnings--,r=t,ex=e}}stop(){this.active&&(eb(this),e_(this),this.onStop&&this.onStop(),this.active=!1)}}function eb(e){e._trackId++,e._depsLength=0}function e_(e){if(e.deps.length>e._depsLength){for(let t=e._depsLength;t<e.deps.length;t++)eS(e.deps[t],e);e.deps.length=e._depsLength}}function eS(e,t){let n=e.get(t);void 0!==n&&t._trackId!==n&&(e.delete(t),0===e.size&&e.cleanup())}let ex=!0,eC=0,ek=[];function eT(){ek.push(ex),ex=!1}function ew(){let e=ek.pop();ex=void 0===e||e}function eE(){for(eC--;!eC&&eN.length;)eN.shift()()}function eA(e,t,n){if(t.get(e)!==e._trackId){t.set(e,e._trackId);let n=e.deps[e._depsLength];n!==t?(n&&eS(n,e),e.deps[e._depsLength++]=t):e._depsLength++}}let eN=[];function eI(e,t,n){for(let n of(eC++,e.keys())){let r;n._dirtyLevel<t&&(null!=r?r:r=e.get(n)===n._trackId)&&(n._shouldSchedule||(n._shouldSchedule=0===n._dirtyLevel),n._dirtyLevel=t),n._shouldSchedule&&(null!=r?r:r=e.get(n)===n._trackId)&&(n.trigger(),(!n._runnings||n.allowRecurse)&&2!==n._dirtyLevel&&(n._shouldSchedule=!1,n.scheduler&&eN.push(n.scheduler)))}eE()}let eR=(e,t)=>{let n=new Map;return n.cleanup=e,n.computed=t,n},eO=new WeakMap,eL=Symbol(""),eM=Symbol("");function e$(e,t,n){if(ex&&r){let t=eO.get(e);t||eO.set(e,t=new Map);let i=t.get(n);i||t.set(n,i=eR(()=>t.delete(n))),eA(r,i)}}function eP(e,t,n,r,i,l){let s=eO.get(e);if(!s)return;let o=[];if("clear"===t)o=[...s.values()];else if("length"===n&&x(e)){let e=Number(r);s.forEach((t,n)=>{("length"===n||!N(n)&&n>=e)&&o.push(t)})}else switch(void 0!==n&&o.push(s.get(n)),t){case"add":x(e)?P(n)&&o.push(s.get("length")):(o.push(s.get(eL)),C(e)&&o.push(s.get(eM)));break;case"delete":!x(e)&&(o.push(s.get(eL)),C(e)&&o.push(s.get(eM)));break;case"set":C(e)&&o.push(s.get(eL))}for(let e of(eC++,o))e&&eI(e,4);eE()}let eF=u("__proto__,__v_isRef,__isVue"),eD=new Set(Object.getOwnPropertyNames(Symbol).filter(e=>"arguments"!==e&&"caller"!==e).map(e=>Symbol[e]).filter(N)),eV=function(){let e={};return["includes","indexOf","lastIndexOf"].forEach(t=>{e[t]=function(...e){let n=ty(this);for(let e=0,t=this.length;e<t;e++)e$(n,"get",e+"");let r=n[t](...e);return -1===r||!1===r?n[t](...e.map(ty)):r}}),["push","pop","shift","unshift","splice"].forEach(t=>{e[t]=function(...e){eT(),eC++;let n=ty(this)[t].apply(this,e);return eE(),ew(),n}}),e}();function eB(e){N(e)||(e=String(e));let t=ty(this);return e$(t,"has",e),t.hasOwnProperty(e)}class eU{constructor(e=!1,t=!1){this._isReadonly=e,this._isShallow=t}get(e,t,n){let r=this._isReadonly,i=this._isShallow;if("__v_isReactive"===t)return!r;if("__v_isReadonly"===t)return r;if("__v_isShallow"===t)return i;if("__v_raw"===t)return n===(r?i?ta:to:i?ts:tl).get(e)||Object.getPrototypeOf(e)===Object.getPrototypeOf(n)?e:void 0;let l=x(e);if(!r){if(l&&S(eV,t))return Reflect.get(eV,t,n);if("hasOwnProperty"===t)return eB}let s=Reflect.get(e,t,n);return(N(t)?eD.has(t):eF(t))?s:(r||e$(e,"get",t),i)?s:tk(s)?l&&P(t)?s:s.value:I(s)?r?td(s):tc(s):s}}class ej extends eU{constructor(e=!1){super(!1,e)}set(e,t,n,r){let i=e[t];if(!this._isShallow){let t=tf(i);if(tm(n)||tf(n)||(i=ty(i),n=ty(n)),!x(e)&&tk(i)&&!tk(n))return!t&&(i.value=n,!0)}let l=x(e)&&P(t)?Number(t)<e.length:S(e,t),s=Reflect.set(e,t,n,r);return e===ty(r)&&(l?K(n,i)&&eP(e,"set",t,n):eP(e,"add",t,n)),s}deleteProperty(e,t){let n=S(e,t);e[t];let r=Reflect.deleteProperty(e,t);return r&&n&&eP(e,"delete",t,void 0),r}has(e,t){let n=Reflect.has(e,t);return N(t)&&eD.has(t)||e$(e,"has",t),n}ownKeys(e){return e$(e,"iterate",x(e)?"length":eL),Reflect.ownKeys(e)}}class eH extends eU{constructor(e=!1){super(!0,e)}set(e,t){return!0}deleteProperty(e,t){return!0}}let eq=new ej,eW=new eH,eK=new ej(!0),ez=new eH(!0),eG=e=>e,eJ=e=>Reflect.getPrototypeOf(e);function eX(e,t,n=!1,r=!1){let i=ty(e=e.__v_raw),l=ty(t);n||(K(t,l)&&e$(i,"get",t),e$(i,"get",l));let{has:s}=eJ(i),o=r?eG:n?t_:tb;return s.call(i,t)?o(e.get(t)):s.call(i,l)?o(e.get(l)):void(e!==i&&e.get(t))}function eQ(e,t=!1){let n=this.__v_raw,r=ty(n),i=ty(e);return t||(K(e,i)&&e$(r,"has",e),e$(r,"has",i)),e===i?n.has(e):n.has(e)||n.has(i)}function eZ(e,t=!1){return e=e.__v_raw,t||e$(ty(e),"iterate",eL),Reflect.get(e,"size",e)}function eY(e,t=!1){t||tm(e)||tf(e)||(e=ty(e));let n=ty(this);return eJ(n).has.call(n,e)||(n.add(e),eP(n,"add",e,e)),this}function e0(e,t,n=!1){n||tm(t)||tf(t)||(t=ty(t));let r=ty(this),{has:i,get:l}=eJ(r),s=i.call(r,e);s||(e=ty(e),s=i.call(r,e));let o=l.call(r,e);return r.set(e,t),s?K(t,o)&&eP(r,"set",e,t):eP(r,"add",e,t),this}function e1(e){let t=ty(this),{has:n,get:r}=eJ(t),i=n.call(t,e);i||(e=ty(e),i=n.call(t,e)),r&&r.call(t,e);let l=t.delete(e);return i&&eP(t,"delete",e,void 0),l}function e2(){let e=ty(this),t=0!==e.size,n=e.clear();return t&&eP(e,"clear",void 0,void 0),n}function e3(e,t){return function(n,r){let i=this,l=i.__v_raw,s=ty(l),o=t?eG:e?t_:tb;return e||e$(s,"iterate",eL),l.forEach((e,t)=>n.call(r,o(e),o(t),i))}}function e6(e,t,n){return function(...r){let i=this.__v_raw,l=ty(i),s=C(l),o="entries"===e||e===Symbol.iterator&&s,a=i[e](...r),c=n?eG:t?t_:tb;return t||e$(l,"iterate","keys"===e&&s?eM:eL),{next(){let{value:e,done:t}=a.next();return t?{value:e,done:t}:{value:o?[c(e[0]),c(e[1])]:c(e),done:t}},[Symbol.iterator](){return this}}}}function e4(e){return function(...t){return"delete"!==e&&("clear"===e?void 0:this)}}let[e8,e5,e9,e7]=function(){let e={get(e){return eX(this,e)},get size(){return eZ(this)},has:eQ,add:eY,set:e0,delete:e1,clear:e2,forEach:e3(!1,!1)},t={get(e){return eX(this,e,!1,!0)},get size(){return eZ(this)},has:eQ,add(e){return eY.call(this,e,!0)},set(e,t){return e0.call(this,e,t,!0)},delete:e1,clear:e2,forEach:e3(!1,!0)},n={get(e){return eX(this,e,!0)},get size(){return eZ(this,!0)},has(e){return eQ.call(this,e,!0)},add:e4("add"),set:e4("set"),delete:e4("delete"),clear:e4("clear"),forEach:e3(!0,!1)},r={get(e){return eX(this,e,!0,!0)},get size(){return eZ(this,!0)},has(e){return eQ.call(this,e,!0)},add:e4("add"),set:e4("set"),delete:e4("delete"),clear:e4("clear"),forEach:e3(!0,!0)};return["keys","values","entries",Symbol.iterator].forEach(i=>{e[i]=e6(i,!1,!1),n[i]=e6(i,!0,!1),t[i]=e6(i,!1,!0),r[i]=e6(i,!0,!0)}),[e,n,t,r]}();function te(e,t){let n=t?e?e7:e9:e?e5:e8;return(t,r,i)=>"__v_isReactive"===r?!e:"__v_isReadonly"===r?e:"__v_raw"===r?t:Reflect.get(S(n,r)&&r in t?n:t,r,i)}let tt={get:te(!1,!1)},tn={get:te(!1,!0)},tr={get:te(!0,!1)},ti={get:te(!0,!0)},tl=new WeakMap,ts=new WeakMap,to=new WeakMap,ta=new WeakMap;function tc(e){return tf(e)?e:tp(e,!1,eq,tt,tl)}function tu(e){return tp(e,!1,eK,tn,ts)}function td(e){return tp(e,!0,eW,tr,to)}function tp(e,t,n,r,i){if(!I(e)||e.__v_raw&&!(t&&e.__v_isReactive))return e;let l=i.get(e);if(l)return l;let s=e.__v_skip||!Object.isExtensible(e)?0:function(e){switch(e){case"Object":case"Array":return 1;case"Map":case"Set":case"WeakMap":case"WeakSet":return 2;default:return 0}}(M(e));if(0===s)return e;let o=new Proxy(e,2===s?r:n);return i.set(e,o),o}function th(e){return tf(e)?th(e.__v_raw):!!(e&&e.__v_isReactive)}function tf(e){return!!(e&&e.__v_isReadonly)}function tm(e){return!!(e&&e.__v_isShallow)}function tg(e){return!!e&&!!e.__v_raw}function ty(e){let t=e&&e.__v_raw;return t?ty(t):e}function tv(e){return Object.isExtensible(e)&&G(e,"__v_skip",!0),e}let tb=e=>I(e)?tc(e):e,t_=e=>I(e)?td(e):e;class tS{constructor(e,t,n,r){this.getter=e,this._setter=t,this.dep=void 0,this.__v_isRef=!0,this.__v_isReadonly=!1,this.effect=new ev(()=>e(this._value),()=>tC(this,2===this.effect._dirtyLevel?2:3)),this.effect.computed=this,this.effect.active=this._cacheable=!r,this.__v_isReadonly=n}get value(){let e=ty(this);return(!e._cacheable||e.effect.dirty)&&K(e._value,e._value=e.effect.run())&&tC(e,4),tx(e),e.effect._dirtyLevel>=2&&tC(e,2),e._value}set value(e){this._setter(e)}get _dirty(){return this.effect.dirty}set _dirty(e){this.effect.dirty=e}}function tx(e){var t;ex&&r&&(e=ty(e),eA(r,null!=(t=e.dep)?t:e.dep=eR(()=>e.dep=void 0,e instanceof tS?e:void 0)))}function tC(e,t=4,n,r){let i=(e=ty(e)).dep;i&&eI(i,t)}function tk(e){return!!(e&&!0===e.__v_isRef)}function tT(e){return tw(e,!1)}function tw(e,t){return tk(e)?e:new tE(e,t)}class tE{constructor(e,t){this.__v_isShallow=t,this.dep=void 0,this.__v_isRef=!0,this._rawValue=t?e:ty(e),this._value=t?e:tb(e)}get value(){return tx(this),this._value}set value(e){let t=this.__v_isShallow||tm(e)||tf(e);K(e=t?e:ty(e),this._rawValue)&&(this._rawValue,this._rawValue=e,this._value=t?e:tb(e),tC(this,4))}}function tA(e){return tk(e)?e.value:e}let tN={get:(e,t,n)=>tA(Reflect.get(e,t,n)),set:(e,t,n,r)=>{let i=e[t];return tk(i)&&!tk(n)?(i.value=n,!0):Reflect.set(e,t,n,r)}};function tI(e){return th(e)?e:new Proxy(e,tN)}class tR{constructor(e){this.dep=void 0,this.__v_isRef=!0;let{get:t,set:n}=e(()=>tx(this),()=>tC(this));this._get=t,this._set=n}get value(){return this._get()}set value(e){this._set(e)}}function tO(e){return new tR(e)}class tL{constructor(e,t,n){this._object=e,this._key=t,this._defaultValue=n,this.__v_isRef=!0}get value(){let e=this._object[this._key];return void 0===e?this._defaultValue:e}set value(e){this._object[this._key]=e}get dep(){return function(e,t){let n=eO.get(e);return n&&n.get(t)}(ty(this._object),this._key)}}class tM{constructor(e){this._getter=e,this.__v_isRef=!0,this.__v_isReadonly=!0}get value(){return this._getter()}}function t$(e,t,n){let r=e[t];return tk(r)?r:new tL(e,t,n)}function tP(e,t,n,r){try{return r?e(...r):e()}catch(e){tD(e,t,n)}}function tF(e,t,n,r){if(E(e)){let i=tP(e,t,n,r);return i&&R(i)&&i.catch(e=>{tD(e,t,n)}),i}if(x(e)){let i=[];for(let l=0;l<e.length;l++)i.push(tF(e[l],t,n,r));return i}}function tD(e,t,n,r=!0){if(t&&t.vnode,t){let r=t.parent,i=t.proxy,l=`https://vuejs.org/error-reference/#runtime-${n}`;for(;r;){let t=r.ec;if(t){for(let n=0;n<t.length;n++)if(!1===t[n](e,i,l))return}r=r.parent}let s=t.appContext.config.errorHandler;if(s){eT(),tP(s,null,10,[e,i,l]),ew();return}}!function(e,t,n,r=!0){console.error(e)}(e,0,0,r)}let tV=!1,tB=!1,tU=[],tj=0,tH=[],tq=null,tW=0,tK=Promise.resolve(),tz=null;function tG(e){let t=tz||tK;return e?t.then(this?e.bind(this):e):t}function tJ(e){tU.length&&tU.includes(e,tV&&e.allowRecurse?tj+1:tj)||(null==e.id?tU.push(e):tU.splice(function(e){let t=tj+1,n=tU.length;for(;t<n;){let r=t+n>>>1,i=tU[r],l=t0(i);l<e||l===e&&i.pre?t=r+1:n=r}return t}(e.id),0,e),tX())}function tX(){tV||tB||(tB=!0,tz=tK.then(function e(t){tB=!1,tV=!0,tU.sort(t1);try{for(tj=0;tj<tU.length;tj++){let e=tU[tj];e&&!1!==e.active&&tP(e,e.i,e.i?15:14)}}finally{tj=0,tU.length=0,tY(),tV=!1,tz=null,(tU.length||tH.length)&&e()}}))}function tQ(e){x(e)?tH.push(...e):tq&&tq.includes(e,e.allowRecurse?tW+1:tW)||tH.push(e),tX()}function tZ(e,t,n=tV?tj+1:0){for(;n<tU.length;n++){let t=tU[n];if(t&&t.pre){if(e&&t.id!==e.uid)continue;tU.splice(n,1),n--,t()}}}function tY(e){if(tH.length){let e=[...new Set(tH)].sort((e,t)=>t0(e)-t0(t));if(tH.length=0,tq){tq.push(...e);return}for(tW=0,tq=e;tW<tq.length;tW++){let e=tq[tW];!1!==e.active&&e()}tq=null,tW=0}}let t0=e=>null==e.id?1/0:e.id,t1=(e,t)=>{let n=t0(e)-t0(t);if(0===n){if(e.pre&&!t.pre)return -1;if(t.pre&&!e.pre)return 1}return n},t2=null,t3=null;function t6(e){let t=t2;return t2=e,t3=e&&e.type.__scopeId||null,t}function t4(e,t=t2,n){if(!t||e._n)return e;let r=(...n)=>{let i;r._d&&ir(-1);let l=t6(t);try{i=e(...n)}finally{t6(l),r._d&&ir(1)}return i};return r._n=!0,r._c=!0,r._d=!0,r}function t8(e,t,n,r){let i=e.dirs,l=t&&t.dirs;for(let s=0;s<i.length;s++){let o=i[s];l&&(o.oldValue=l[s].value);let a=o.dir[r];a&&(eT(),tF(a,n,8,[e.el,o,e,t]),ew())}}let t5=Symbol("_leaveCb"),t9=Symbol("_enterCb");function t7(){let e={isMounted:!1,isLeaving:!1,isUnmounting:!1,leavingVNodes:new Map};return nC(()=>{e.isMounted=!0}),nw(()=>{e.isUnmounting=!0}),e}let ne=[Function,Array],nt={mode:String,appear:Boolean,persisted:Boolean,onBeforeEnter:ne,onEnter:ne,onAfterEnter:ne,onEnterCancelled:ne,onBeforeLeave:ne,onLeave:ne,onAfterLeave:ne,onLeaveCancelled:ne,onBeforeAppear:ne,onAppear:ne,onAfterAppear:ne,onAppearCancelled:ne},nn=e=>{let t=e.subTree;return t.component?nn(t.component):t},nr={name:"BaseTransition",props:nt,setup(e,{slots:t}){let n=ik(),r=t7();return()=>{let i=t.default&&nc(t.default(),!0);if(!i||!i.length)return;let l=i[0];if(i.length>1){for(let e of i)if(e.type!==r4){l=e;break}}let s=ty(e),{mode:o}=s;if(r.isLeaving)return ns(l);let a=no(l);if(!a)return ns(l);let c=nl(a,s,r,n,e=>c=e);na(a,c);let u=n.subTree,d=u&&no(u);if(d&&d.type!==r4&&!io(a,d)&&nn(n).type!==r4){let e=nl(d,s,r,n);if(na(d,e),"out-in"===o&&a.type!==r4)return r.isLeaving=!0,e.afterLeave=()=>{r.isLeaving=!1,!1!==n.update.active&&(n.effect.dirty=!0,n.update())},ns(l);"in-out"===o&&a.type!==r4&&(e.delayLeave=(e,t,n)=>{ni(r,d)[String(d.key)]=d,e[t5]=()=>{t(),e[t5]=void 0,delete c.delayedLeave},c.delayedLeave=n})}return l}}};function ni(e,t){let{leavingVNodes:n}=e,r=n.get(t.type);return r||(r=Object.create(null),n.set(t.type,r)),r}function nl(e,t,n,r,i){let{appear:l,mode:s,persisted:o=!1,onBeforeEnter:a,onEnter:c,onAfterEnter:u,onEnterCancelled:d,onBeforeLeave:p,onLeave:h,onAfterLeave:f,onLeaveCancelled:m,onBeforeAppear:g,onAppear:y,onAfterAppear:b,onAppearCancelled:_}=t,S=String(e.key),C=ni(n,e),k=(e,t)=>{e&&tF(e,r,9,t)},T=(e,t)=>{let n=t[1];k(e,t),x(e)?e.every(e=>e.length<=1)&&n():e.length<=1&&n()},w={mode:s,persisted:o,beforeEnter(t){let r=a;if(!n.isMounted){if(!l)return;r=g||a}t[t5]&&t[t5](!0);let i=C[S];i&&io(e,i)&&i.el[t5]&&i.el[t5](),k(r,[t])},enter(e){let t=c,r=u,i=d;if(!n.isMounted){if(!l)return;t=y||c,r=b||u,i=_||d}let s=!1,o=e[t9]=t=>{s||(s=!0,t?k(i,[e]):k(r,[e]),w.delayedLeave&&w.delayedLeave(),e[t9]=void 0)};t?T(t,[e,o]):o()},leave(t,r){let i=String(e.key);if(t[t9]&&t[t9](!0),n.isUnmounting)return r();k(p,[t]);let l=!1,s=t[t5]=n=>{l||(l=!0,r(),n?k(m,[t]):k(f,[t]),t[t5]=void 0,C[i]!==e||delete C[i])};C[i]=e,h?T(h,[t,s]):s()},clone(e){let l=nl(e,t,n,r,i);return i&&i(l),l}};return w}function ns(e){if(nh(e))return(e=ih(e)).children=null,e}function no(e){if(!nh(e))return e;let{shapeFlag:t,children:n}=e;if(n){if(16&t)return n[0];if(32&t&&E(n.default))return n.default()}}function na(e,t){6&e.shapeFlag&&e.component?na(e.component.subTree,t):128&e.shapeFlag?(e.ssContent.transition=t.clone(e.ssContent),e.ssFallback.transition=t.clone(e.ssFallback)):e.transition=t}function nc(e,t=!1,n){let r=[],i=0;for(let l=0;l<e.length;l++){let s=e[l],o=null==n?s.key:String(n)+String(null!=s.key?s.key:l);s.type===r3?(128&s.patchFlag&&i++,r=r.concat(nc(s.children,t,o))):(t||s.type!==r4)&&r.push(null!=o?ih(s,{key:o}):s)}if(i>1)for(let e=0;e<r.length;e++)r[e].patchFlag=-2;return r}/*! #__NO_SIDE_EFFECTS__ */function nu(e,t){return E(e)?y({name:e.name},t,{setup:e}):e}let nd=e=>!!e.type.__asyncLoader;function np(e,t){let{ref:n,props:r,children:i,ce:l}=t.vnode,s=id(e,r,i);return s.ref=n,s.ce=l,delete t.vnode.ce,s}let nh=e=>e.type.__isKeepAlive;function nf(e,t){return x(e)?e.some(e=>nf(e,t)):A(e)?e.split(",").includes(t):!!w(e)&&e.test(t)}function nm(e,t){ny(e,"a",t)}function ng(e,t){ny(e,"da",t)}function ny(e,t,n=iC){let r=e.__wdc||(e.__wdc=()=>{let t=n;for(;t;){if(t.isDeactivated)return;t=t.parent}return e()});if(n_(t,r,n),n){let e=n.parent;for(;e&&e.parent;)nh(e.parent.vnode)&&function(e,t,n,r){let i=n_(t,e,r,!0);nE(()=>{b(r[t],i)},n)}(r,t,n,e),e=e.parent}}function nv(e){e.shapeFlag&=-257,e.shapeFlag&=-513}function nb(e){return 128&e.shapeFlag?e.ssContent:e}function n_(e,t,n=iC,r=!1){if(n){let i=n[e]||(n[e]=[]),l=t.__weh||(t.__weh=(...r)=>{eT();let i=iT(n),l=tF(t,n,e,r);return i(),ew(),l});return r?i.unshift(l):i.push(l),l}}let nS=e=>(t,n=iC)=>{iA&&"sp"!==e||n_(e,(...e)=>t(...e),n)},nx=nS("bm"),nC=nS("m"),nk=nS("bu"),nT=nS("u"),nw=nS("bum"),nE=nS("um"),nA=nS("sp"),nN=nS("rtg"),nI=nS("rtc");function nR(e,t=iC){n_("ec",e,t)}let nO="components",nL=Symbol.for("v-ndc");function nM(e,t,n=!0,r=!1){let i=t2||iC;if(i){let n=i.type;if(e===nO){let e=i$(n,!1);if(e&&(e===t||e===U(t)||e===q(U(t))))return n}let l=n$(i[e]||n[e],t)||n$(i.appContext[e],t);return!l&&r?n:l}}function n$(e,t){return e&&(e[t]||e[U(t)]||e[q(U(t))])}let nP=e=>e?iE(e)?iM(e):nP(e.parent):null,nF=y(Object.create(null),{$:e=>e,$el:e=>e.vnode.el,$data:e=>e.data,$props:e=>e.props,$attrs:e=>e.attrs,$slots:e=>e.slots,$refs:e=>e.refs,$parent:e=>nP(e.parent),$root:e=>nP(e.root),$emit:e=>e.emit,$options:e=>nW(e),$forceUpdate:e=>e.f||(e.f=()=>{e.effect.dirty=!0,tJ(e.update)}),$nextTick:e=>e.n||(e.n=tG.bind(e.proxy)),$watch:e=>rV.bind(e)}),nD=(e,t)=>e!==d&&!e.__isScriptSetup&&S(e,t),nV={get({_:e},t){let n,r,i;if("__v_skip"===t)return!0;let{ctx:l,setupState:s,data:o,props:a,accessCache:c,type:u,appContext:p}=e;if("$"!==t[0]){let r=c[t];if(void 0!==r)switch(r){case 1:return s[t];case 2:return o[t];case 4:return l[t];case 3:return a[t]}else{if(nD(s,t))return c[t]=1,s[t];if(o!==d&&S(o,t))return c[t]=2,o[t];if((n=e.propsOptions[0])&&S(n,t))return c[t]=3,a[t];if(l!==d&&S(l,t))return c[t]=4,l[t];nH&&(c[t]=0)}}let h=nF[t];return h?("$attrs"===t&&e$(e.attrs,"get",""),h(e)):(r=u.__cssModules)&&(r=r[t])?r:l!==d&&S(l,t)?(c[t]=4,l[t]):S(i=p.config.globalProperties,t)?i[t]:void 0},set({_:e},t,n){let{data:r,setupState:i,ctx:l}=e;return nD(i,t)?(i[t]=n,!0):r!==d&&S(r,t)?(r[t]=n,!0):!S(e.props,t)&&!("$"===t[0]&&t.slice(1) in e)&&(l[t]=n,!0)},has({_:{data:e,setupState:t,accessCache:n,ctx:r,appContext:i,propsOptions:l}},s){let o;return!!n[s]||e!==d&&S(e,s)||nD(t,s)||(o=l[0])&&S(o,s)||S(r,s)||S(nF,s)||S(i.config.globalProperties,s)},defineProperty(e,t,n){return null!=n.get?e._.accessCache[t]=0:S(n,"value")&&this.set(e,t,n.value,null),Reflect.defineProperty(e,t,n)}},nB=y({},nV,{get(e,t){if(t!==Symbol.unscopables)return nV.get(e,t,e)},has:(e,t)=>"_"!==t[0]&&!Z(t)});function nU(){let e=ik();return e.setupContext||(e.setupContext=iL(e))}function nj(e){return x(e)?e.reduce((e,t)=>(e[t]=null,e),{}):e}let nH=!0;function nq(e,t,n){tF(x(e)?e.map(e=>e.bind(t.proxy)):e.bind(t.proxy),t,n)}function nW(e){let t;let n=e.type,{mixins:r,extends:i}=n,{mixins:l,optionsCache:s,config:{optionMergeStrategies:o}}=e.appContext,a=s.get(n);return a?t=a:l.length||r||i?(t={},l.length&&l.forEach(e=>nK(t,e,o,!0)),nK(t,n,o)):t=n,I(n)&&s.set(n,t),t}function nK(e,t,n,r=!1){let{mixins:i,extends:l}=t;for(let s in l&&nK(e,l,n,!0),i&&i.forEach(t=>nK(e,t,n,!0)),t)if(r&&"expose"===s);else{let r=nz[s]||n&&n[s];e[s]=r?r(e[s],t[s]):t[s]}return e}let nz={data:nG,props:nZ,emits:nZ,methods:nQ,computed:nQ,beforeCreate:nX,created:nX,beforeMount:nX,mounted:nX,beforeUpdate:nX,updated:nX,beforeDestroy:nX,beforeUnmount:nX,destroyed:nX,unmounted:nX,activated:nX,deactivated:nX,errorCaptured:nX,serverPrefetch:nX,components:nQ,directives:nQ,watch:function(e,t){if(!e)return t;if(!t)return e;let n=y(Object.create(null),e);for(let r in t)n[r]=nX(e[r],t[r]);return n},provide:nG,inject:function(e,t){return nQ(nJ(e),nJ(t))}};function nG(e,t){return t?e?function(){return y(E(e)?e.call(this,this):e,E(t)?t.call(this,this):t)}:t:e}function nJ(e){if(x(e)){let t={};for(let n=0;n<e.length;n++)t[e[n]]=e[n];return t}return e}function nX(e,t){return e?[...new Set([].concat(e,t))]:t}function nQ(e,t){return e?y(Object.create(null),e,t):t}function nZ(e,t){return e?x(e)&&x(t)?[...new Set([...e,...t])]:y(Object.create(null),nj(e),nj(null!=t?t:{})):t}function nY(){return{app:null,config:{isNativeTag:f,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}let n0=0,n1=null;function n2(e,t){if(iC){let n=iC.provides,r=iC.parent&&iC.parent.provides;r===n&&(n=iC.provides=Object.create(r)),n[e]=t}}function n3(e,t,n=!1){let r=iC||t2;if(r||n1){let i=n1?n1._context.provides:r?null==r.parent?r.vnode.appContext&&r.vnode.appContext.provides:r.parent.provides:void 0;if(i&&e in i)return i[e];if(arguments.length>1)return n&&E(t)?t.call(r&&r.proxy):t}}let n6={},n4=()=>Object.create(n6),n8=e=>Object.getPrototypeOf(e)===n6;function n5(e,t,n,r){let i;let[l,s]=e.propsOptions,o=!1;if(t)for(let a in t){let c;if(F(a))continue;let u=t[a];l&&S(l,c=U(a))?s&&s.includes(c)?(i||(i={}))[c]=u:n[c]=u:rq(e.emitsOptions,a)||a in r&&u===r[a]||(r[a]=u,o=!0)}if(s){let t=ty(n),r=i||d;for(let i=0;i<s.length;i++){let o=s[i];n[o]=n9(l,t,o,r[o],e,!S(r,o))}}return o}function n9(e,t,n,r,i,l){let s=e[n];if(null!=s){let e=S(s,"default");if(e&&void 0===r){let e=s.default;if(s.type!==Function&&!s.skipFactory&&E(e)){let{propsDefaults:l}=i;if(n in l)r=l[n];else{let s=iT(i);r=l[n]=e.call(null,t),s()}}else r=e}s[0]&&(l&&!e?r=!1:s[1]&&(""===r||r===H(n))&&(r=!0))}return r}let n7=new WeakMap;function re(e){return!("$"===e[0]||F(e))}let rt=e=>"_"===e[0]||"$stable"===e,rn=e=>x(e)?e.map(ig):[ig(e)],rr=(e,t,n)=>{if(t._n)return t;let r=t4((...e)=>rn(t(...e)),n);return r._c=!1,r},ri=(e,t,n)=>{let r=e._ctx;for(let n in e){if(rt(n))continue;let i=e[n];if(E(i))t[n]=rr(n,i,r);else if(null!=i){let e=rn(i);t[n]=()=>e}}},rl=(e,t)=>{let n=rn(t);e.slots.default=()=>n},rs=(e,t,n)=>{for(let r in t)(n||"_"!==r)&&(e[r]=t[r])},ro=(e,t,n)=>{let r=e.slots=n4();if(32&e.vnode.shapeFlag){let e=t._;e?(rs(r,t,n),n&&G(r,"_",e,!0)):ri(t,r)}else t&&rl(e,t)},ra=(e,t,n)=>{let{vnode:r,slots:i}=e,l=!0,s=d;if(32&r.shapeFlag){let e=t._;e?n&&1===e?l=!1:rs(i,t,n):(l=!t.$stable,ri(t,i)),s=t}else t&&(rl(e,t),s={default:1});if(l)for(let e in i)rt(e)||null!=s[e]||delete i[e]};function rc(e,t,n,r,i=!1){if(x(e)){e.forEach((e,l)=>rc(e,t&&(x(t)?t[l]:t),n,r,i));return}if(nd(r)&&!i)return;let l=4&r.shapeFlag?iM(r.component):r.el,s=i?null:l,{i:o,r:a}=e,c=t&&t.r,u=o.refs===d?o.refs={}:o.refs,p=o.setupState;if(null!=c&&c!==a&&(A(c)?(u[c]=null,S(p,c)&&(p[c]=null)):tk(c)&&(c.value=null)),E(a))tP(a,o,12,[s,u]);else{let t=A(a),r=tk(a);if(t||r){let o=()=>{if(e.f){let n=t?S(p,a)?p[a]:u[a]:a.value;i?x(n)&&b(n,l):x(n)?n.includes(l)||n.push(l):t?(u[a]=[l],S(p,a)&&(p[a]=u[a])):(a.value=[l],e.k&&(u[e.k]=a.value))}else t?(u[a]=s,S(p,a)&&(p[a]=s)):r&&(a.value=s,e.k&&(u[e.k]=s))};s?(o.id=-1,rw(o,n)):o()}}}let ru=Symbol("_vte"),rd=e=>e.__isTeleport,rp=e=>e&&(e.disabled||""===e.disabled),rh=e=>"undefined"!=typeof SVGElement&&e instanceof SVGElement,rf=e=>"function"==typeof MathMLElement&&e instanceof MathMLElement,rm=(e,t)=>{let n=e&&e.to;return A(n)?t?t(n):null:n};function rg(e,t,n,{o:{insert:r},m:i},l=2){0===l&&r(e.targetAnchor,t,n);let{el:s,anchor:o,shapeFlag:a,children:c,props:u}=e,d=2===l;if(d&&r(s,t,n),(!d||rp(u))&&16&a)for(let e=0;e<c.length;e++)i(c[e],t,n,2);d&&r(o,t,n)}function ry(e){let t=e.ctx;if(t&&t.ut){let n=e.children[0].el;for(;n&&n!==e.targetAnchor;)1===n.nodeType&&n.setAttribute("data-v-owner",t.uid),n=n.nextSibling;t.ut()}}function rv(e,t,n,r){let i=t.targetStart=n(""),l=t.targetAnchor=n("");return i[ru]=l,e&&(r(i,e),r(l,e)),l}let rb=!1,r_=()=>{rb||(console.error("Hydration completed but contains mismatches."),rb=!0)},rS=e=>e.namespaceURI.includes("svg")&&"foreignObject"!==e.tagName,rx=e=>e.namespaceURI.includes("MathML"),rC=e=>rS(e)?"svg":rx(e)?"mathml":void 0,rk=e=>8===e.nodeType;function rT(e){let{mt:t,p:n,o:{patchProp:r,createText:i,nextSibling:l,parentNode:s,remove:o,insert:a,createComment:c}}=e,u=(n,r,o,c,m,_=!1)=>{_=_||!!r.dynamicChildren;let S=rk(n)&&"["===n.data,x=()=>f(n,r,o,c,m,S),{type:C,ref:k,shapeFlag:T,patchFlag:w}=r,E=n.nodeType;r.el=n,-2===w&&(_=!1,r.dynamicChildren=null);let A=null;switch(C){case r6:3!==E?""===r.children?(a(r.el=i(""),s(n),n),A=n):A=x():(n.data!==r.children&&(r_(),n.data=r.children),A=l(n));break;case r4:b(n)?(A=l(n),y(r.el=n.content.firstChild,n,o)):A=8!==E||S?x():l(n);break;case r8:if(S&&(E=(n=l(n)).nodeType),1===E||3===E){A=n;let e=!r.children.length;for(let t=0;t<r.staticCount;t++)e&&(r.children+=1===A.nodeType?A.outerHTML:A.data),t===r.staticCount-1&&(r.anchor=A),A=l(A);return S?l(A):A}x();break;case r3:A=S?h(n,r,o,c,m,_):x();break;default:if(1&T)A=1===E&&r.type.toLowerCase()===n.tagName.toLowerCase()||b(n)?d(n,r,o,c,m,_):x();else if(6&T){r.slotScopeIds=m;let e=s(n);if(A=S?g(n):rk(n)&&"teleport start"===n.data?g(n,n.data,"teleport end"):l(n),t(r,e,null,o,c,rC(e),_),nd(r)){let t;S?(t=id(r3)).anchor=A?A.previousSibling:e.lastChild:t=3===n.nodeType?im(""):id("div"),t.el=n,r.component.subTree=t}}else 64&T?A=8!==E?x():r.type.hydrate(n,r,o,c,m,_,e,p):128&T&&(A=r.type.hydrate(n,r,o,c,rC(s(n)),m,_,e,u))}return null!=k&&rc(k,null,c,r),A},d=(e,t,n,i,l,s)=>{s=s||!!t.dynamicChildren;let{type:a,props:c,patchFlag:u,shapeFlag:d,dirs:h,transition:f}=t,g="input"===a||"option"===a;if(g||-1!==u){let a;h&&t8(t,null,n,"created");let _=!1;if(b(e)){_=rR(i,f)&&n&&n.vnode.props&&n.vnode.props.appear;let r=e.content.firstChild;_&&f.beforeEnter(r),y(r,e,n),t.el=e=r}if(16&d&&!(c&&(c.innerHTML||c.textContent))){let r=p(e.firstChild,t,e,n,i,l,s);for(;r;){r_();let e=r;r=r.nextSibling,o(e)}}else 8&d&&e.textContent!==t.children&&(r_(),e.textContent=t.children);if(c){if(g||!s||48&u){let t=e.tagName.includes("-");for(let i in c)(g&&(i.endsWith("value")||"indeterminate"===i)||m(i)&&!F(i)||"."===i[0]||t)&&r(e,i,null,c[i],void 0,n)}else if(c.onClick)r(e,"onClick",null,c.onClick,void 0,n);else if(4&u&&th(c.style))for(let e in c.style)c.style[e]}(a=c&&c.onVnodeBeforeMount)&&i_(a,n,t),h&&t8(t,null,n,"beforeMount"),((a=c&&c.onVnodeMounted)||h||_)&&r1(()=>{a&&i_(a,n,t),_&&f.enter(e),h&&t8(t,null,n,"mounted")},i)}return e.nextSibling},p=(e,t,r,s,o,c,d)=>{d=d||!!t.dynamicChildren;let p=t.children,h=p.length;for(let t=0;t<h;t++){let h=d?p[t]:p[t]=ig(p[t]),f=h.type===r6;if(e){if(f&&!d){let n=p[t+1];n&&(n=ig(n)).type===r6&&(a(i(e.data.slice(h.children.length)),r,l(e)),e.data=h.children)}e=u(e,h,s,o,c,d)}else f&&!h.children?a(h.el=i(""),r):(r_(),n(null,h,r,null,s,o,rC(r),c))}return e},h=(e,t,n,r,i,o)=>{let{slotScopeIds:u}=t;u&&(i=i?i.concat(u):u);let d=s(e),h=p(l(e),t,d,n,r,i,o);return h&&rk(h)&&"]"===h.data?l(t.anchor=h):(r_(),a(t.anchor=c("]"),d,h),h)},f=(e,t,r,i,a,c)=>{if(r_(),t.el=null,c){let t=g(e);for(;;){let n=l(e);if(n&&n!==t)o(n);else break}}let u=l(e),d=s(e);return o(e),n(null,t,d,u,r,i,rC(d),a),u},g=(e,t="[",n="]")=>{let r=0;for(;e;)if((e=l(e))&&rk(e)&&(e.data===t&&r++,e.data===n)){if(0===r)return l(e);r--}return e},y=(e,t,n)=>{let r=t.parentNode;r&&r.replaceChild(e,t);let i=n;for(;i;)i.vnode.el===t&&(i.vnode.el=i.subTree.el=e),i=i.parent},b=e=>1===e.nodeType&&"template"===e.tagName.toLowerCase();return[(e,t)=>{if(!t.hasChildNodes()){n(null,e,t),tY(),t._vnode=e;return}u(t.firstChild,e,null,null,null),tY(),t._vnode=e},u]}let rw=r1;function rE(e){return rA(e,rT)}function rA(e,t){var n;let r,i;Q().__VUE__=!0;let{insert:s,remove:o,patchProp:a,createElement:c,createText:u,createComment:f,setText:m,setElementText:g,parentNode:b,nextSibling:_,setScopeId:C=h,insertStaticContent:k}=e,T=(e,t,n,r=null,i=null,l=null,s,o=null,a=!!t.dynamicChildren)=>{if(e===t)return;e&&!io(e,t)&&(r=eo(e),en(e,i,l,!0),e=null),-2===t.patchFlag&&(a=!1,t.dynamicChildren=null);let{type:c,ref:u,shapeFlag:d}=t;switch(c){case r6:w(e,t,n,r);break;case r4:A(e,t,n,r);break;case r8:null==e&&N(t,n,r,s);break;case r3:q(e,t,n,r,i,l,s,o,a);break;default:1&d?M(e,t,n,r,i,l,s,o,a):6&d?W(e,t,n,r,i,l,s,o,a):64&d?c.process(e,t,n,r,i,l,s,o,a,eu):128&d&&c.process(e,t,n,r,i,l,s,o,a,eu)}null!=u&&i&&rc(u,e&&e.ref,l,t||e,!t)},w=(e,t,n,r)=>{if(null==e)s(t.el=u(t.children),n,r);else{let n=t.el=e.el;t.children!==e.children&&m(n,t.children)}},A=(e,t,n,r)=>{null==e?s(t.el=f(t.children||""),n,r):t.el=e.el},N=(e,t,n,r)=>{[e.el,e.anchor]=k(e.children,t,n,r,e.el,e.anchor)},O=({el:e,anchor:t},n,r)=>{let i;for(;e&&e!==t;)i=_(e),s(e,n,r),e=i;s(t,n,r)},L=({el:e,anchor:t})=>{let n;for(;e&&e!==t;)n=_(e),o(e),e=n;o(t)},M=(e,t,n,r,i,l,s,o,a)=>{"svg"===t.type?s="svg":"math"===t.type&&(s="mathml"),null==e?$(t,n,r,i,l,s,o,a):V(e,t,i,l,s,o,a)},$=(e,t,n,r,i,l,o,u)=>{let d,p;let{props:h,shapeFlag:f,transition:m,dirs:y}=e;if(d=e.el=c(e.type,l,h&&h.is,h),8&f?g(d,e.children):16&f&&D(e.children,d,null,r,i,rN(e,l),o,u),y&&t8(e,null,r,"created"),P(d,e,e.scopeId,o,r),h){for(let e in h)"value"===e||F(e)||a(d,e,null,h[e],l,r);"value"in h&&a(d,"value",null,h.value,l),(p=h.onVnodeBeforeMount)&&i_(p,r,e)}y&&t8(e,null,r,"beforeMount");let b=rR(i,m);b&&m.beforeEnter(d),s(d,t,n),((p=h&&h.onVnodeMounted)||b||y)&&rw(()=>{p&&i_(p,r,e),b&&m.enter(d),y&&t8(e,null,r,"mounted")},i)},P=(e,t,n,r,i)=>{if(n&&C(e,n),r)for(let t=0;t<r.length;t++)C(e,r[t]);if(i&&t===i.subTree){let t=i.vnode;P(e,t,t.scopeId,t.slotScopeIds,i.parent)}},D=(e,t,n,r,i,l,s,o,a=0)=>{for(let c=a;c<e.length;c++)T(null,e[c]=o?iy(e[c]):ig(e[c]),t,n,r,i,l,s,o)},V=(e,t,n,r,i,l,s)=>{let o;let c=t.el=e.el,{patchFlag:u,dynamicChildren:p,dirs:h}=t;u|=16&e.patchFlag;let f=e.props||d,m=t.props||d;if(n&&rI(n,!1),(o=m.onVnodeBeforeUpdate)&&i_(o,n,t,e),h&&t8(t,e,n,"beforeUpdate"),n&&rI(n,!0),(f.innerHTML&&null==m.innerHTML||f.textContent&&null==m.textContent)&&g(c,""),p?B(e.dynamicChildren,p,c,n,r,rN(t,i),l):s||Z(e,t,c,null,n,r,rN(t,i),l,!1),u>0){if(16&u)j(c,f,m,n,i);else if(2&u&&f.class!==m.class&&a(c,"class",null,m.class,i),4&u&&a(c,"style",f.style,m.style,i),8&u){let e=t.dynamicProps;for(let t=0;t<e.length;t++){let r=e[t],l=f[r],s=m[r];(s!==l||"value"===r)&&a(c,r,l,s,i,n)}}1&u&&e.children!==t.children&&g(c,t.children)}else s||null!=p||j(c,f,m,n,i);((o=m.onVnodeUpdated)||h)&&rw(()=>{o&&i_(o,n,t,e),h&&t8(t,e,n,"updated")},r)},B=(e,t,n,r,i,l,s)=>{for(let o=0;o<t.length;o++){let a=e[o],c=t[o],u=a.el&&(a.type===r3||!io(a,c)||70&a.shapeFlag)?b(a.el):n;T(a,c,u,null,r,i,l,s,!0)}},j=(e,t,n,r,i)=>{if(t!==n){if(t!==d)for(let l in t)F(l)||l in n||a(e,l,t[l],null,i,r);for(let l in n){if(F(l))continue;let s=n[l],o=t[l];s!==o&&"value"!==l&&a(e,l,o,s,i,r)}"value"in n&&a(e,"value",t.value,n.value,i)}},q=(e,t,n,r,i,l,o,a,c)=>{let d=t.el=e?e.el:u(""),p=t.anchor=e?e.anchor:u(""),{patchFlag:h,dynamicChildren:f,slotScopeIds:m}=t;m&&(a=a?a.concat(m):m),null==e?(s(d,n,r),s(p,n,r),D(t.children||[],n,p,i,l,o,a,c)):h>0&&64&h&&f&&e.dynamicChildren?(B(e.dynamicChildren,f,n,i,l,o,a),(null!=t.key||i&&t===i.subTree)&&rO(e,t,!0)):Z(e,t,n,p,i,l,o,a,c)},W=(e,t,n,r,i,l,s,o,a)=>{t.slotScopeIds=o,null==e?512&t.shapeFlag?i.ctx.activate(t,n,r,s,a):K(t,n,r,i,l,s,a):G(e,t,a)},K=(e,t,n,r,i,s,o)=>{let a=e.component=function(e,t,n){let r=e.type,i=(t?t.appContext:e.appContext)||iS,l={uid:ix++,vnode:e,type:r,parent:t,appContext:i,root:null,next:null,subTree:null,effect:null,update:null,scope:new eg(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:t?t.provides:Object.create(i.provides),accessCache:null,renderCache:[],components:null,directives:null,propsOptions:function e(t,n,r=!1){let i=r?n7:n.propsCache,l=i.get(t);if(l)return l;let s=t.props,o={},a=[],c=!1;if(!E(t)){let i=t=>{c=!0;let[r,i]=e(t,n,!0);y(o,r),i&&a.push(...i)};!r&&n.mixins.length&&n.mixins.forEach(i),t.extends&&i(t.extends),t.mixins&&t.mixins.forEach(i)}if(!s&&!c)return I(t)&&i.set(t,p),p;if(x(s))for(let e=0;e<s.length;e++){let t=U(s[e]);re(t)&&(o[t]=d)}else if(s)for(let e in s){let t=U(e);if(re(t)){let n=s[e],r=o[t]=x(n)||E(n)?{type:n}:y({},n),i=r.type,l=!1,c=!0;if(x(i))for(let e=0;e<i.length;++e){let t=i[e],n=E(t)&&t.name;if("Boolean"===n){l=!0;break}"String"===n&&(c=!1)}else l=E(i)&&"Boolean"===i.name;r[0]=l,r[1]=c,(l||S(r,"default"))&&a.push(t)}}let u=[o,a];return I(t)&&i.set(t,u),u}(r,i),emitsOptions:function e(t,n,r=!1){let i=n.emitsCache,l=i.get(t);if(void 0!==l)return l;let s=t.emits,o={},a=!1;if(!E(t)){let i=t=>{let r=e(t,n,!0);r&&(a=!0,y(o,r))};!r&&n.mixins.length&&n.mixins.forEach(i),t.extends&&i(t.extends),t.mixins&&t.mixins.forEach(i)}return s||a?(x(s)?s.forEach(e=>o[e]=null):y(o,s),I(t)&&i.set(t,o),o):(I(t)&&i.set(t,null),null)}(r,i),emit:null,emitted:null,propsDefaults:d,inheritAttrs:r.inheritAttrs,ctx:d,data:d,props:d,attrs:d,slots:d,refs:d,setupState:d,setupContext:null,suspense:n,suspenseId:n?n.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return l.ctx={_:l},l.root=t?t.root:l,l.emit=rH.bind(null,l),e.ce&&e.ce(l),l}(e,r,i);nh(e)&&(a.ctx.renderer=eu),function(e,t=!1,n=!1){t&&l(t);let{props:r,children:i}=e.vnode,s=iE(e);(function(e,t,n,r=!1){let i={},l=n4();for(let n in e.propsDefaults=Object.create(null),n5(e,t,i,l),e.propsOptions[0])n in i||(i[n]=void 0);n?e.props=r?i:tu(i):e.type.props?e.props=i:e.props=l,e.attrs=l})(e,r,s,t),ro(e,i,n),s&&function(e,t){let n=e.type;e.accessCache=Object.create(null),e.proxy=new Proxy(e.ctx,nV);let{setup:r}=n;if(r){let n=e.setupContext=r.length>1?iL(e):null,i=iT(e);eT();let l=tP(r,e,0,[e.props,n]);if(ew(),i(),R(l)){if(l.then(iw,iw),t)return l.then(n=>{iN(e,n,t)}).catch(t=>{tD(t,e,0)});e.asyncDep=l}else iN(e,l,t)}else iR(e,t)}(e,t),t&&l(!1)}(a,!1,o),a.asyncDep?(i&&i.registerDep(a,J,o),e.el||A(null,a.subTree=id(r4),t,n)):J(a,e,t,n,i,s,o)},G=(e,t,n)=>{let r=t.component=e.component;if(function(e,t,n){let{props:r,children:i,component:l}=e,{props:s,children:o,patchFlag:a}=t,c=l.emitsOptions;if(t.dirs||t.transition)return!0;if(!n||!(a>=0))return(!!i||!!o)&&(!o||!o.$stable)||r!==s&&(r?!s||rG(r,s,c):!!s);if(1024&a)return!0;if(16&a)return r?rG(r,s,c):!!s;if(8&a){let e=t.dynamicProps;for(let t=0;t<e.length;t++){let n=e[t];if(s[n]!==r[n]&&!rq(c,n))return!0}}return!1}(e,t,n)){if(r.asyncDep&&!r.asyncResolved){X(r,t,n);return}r.next=t,function(e){let t=tU.indexOf(e);t>tj&&tU.splice(t,1)}(r.update),r.effect.dirty=!0,r.update()}else t.el=e.el,r.vnode=t},J=(e,t,n,r,l,s,o)=>{let a=()=>{if(e.isMounted){let t,{next:n,bu:r,u:i,parent:c,vnode:u}=e;{let t=function e(t){let n=t.subTree.component;if(n)return n.asyncDep&&!n.asyncResolved?n:e(n)}(e);if(t){n&&(n.el=u.el,X(e,n,o)),t.asyncDep.then(()=>{e.isUnmounted||a()});return}}let d=n;rI(e,!1),n?(n.el=u.el,X(e,n,o)):n=u,r&&z(r),(t=n.props&&n.props.onVnodeBeforeUpdate)&&i_(t,c,n,u),rI(e,!0);let p=rW(e),h=e.subTree;e.subTree=p,T(h,p,b(h.el),eo(h),e,l,s),n.el=p.el,null===d&&rJ(e,p.el),i&&rw(i,l),(t=n.props&&n.props.onVnodeUpdated)&&rw(()=>i_(t,c,n,u),l)}else{let o;let{el:a,props:c}=t,{bm:u,m:d,parent:p}=e,h=nd(t);if(rI(e,!1),u&&z(u),!h&&(o=c&&c.onVnodeBeforeMount)&&i_(o,p,t),rI(e,!0),a&&i){let n=()=>{e.subTree=rW(e),i(a,e.subTree,e,l,null)};h?t.type.__asyncLoader().then(()=>!e.isUnmounted&&n()):n()}else{let i=e.subTree=rW(e);T(null,i,n,r,e,l,s),t.el=i.el}if(d&&rw(d,l),!h&&(o=c&&c.onVnodeMounted)){let e=t;rw(()=>i_(o,p,e),l)}(256&t.shapeFlag||p&&nd(p.vnode)&&256&p.vnode.shapeFlag)&&e.a&&rw(e.a,l),e.isMounted=!0,t=n=r=null}},c=e.effect=new ev(a,h,()=>tJ(u),e.scope),u=e.update=()=>{c.dirty&&c.run()};u.i=e,u.id=e.uid,rI(e,!0),u()},X=(e,t,n)=>{t.component=e;let r=e.vnode.props;e.vnode=t,e.next=null,function(e,t,n,r){let{props:i,attrs:l,vnode:{patchFlag:s}}=e,o=ty(i),[a]=e.propsOptions,c=!1;if((r||s>0)&&!(16&s)){if(8&s){let n=e.vnode.dynamicProps;for(let r=0;r<n.length;r++){let s=n[r];if(rq(e.emitsOptions,s))continue;let u=t[s];if(a){if(S(l,s))u!==l[s]&&(l[s]=u,c=!0);else{let t=U(s);i[t]=n9(a,o,t,u,e,!1)}}else u!==l[s]&&(l[s]=u,c=!0)}}}else{let r;for(let s in n5(e,t,i,l)&&(c=!0),o)t&&(S(t,s)||(r=H(s))!==s&&S(t,r))||(a?n&&(void 0!==n[s]||void 0!==n[r])&&(i[s]=n9(a,o,s,void 0,e,!0)):delete i[s]);if(l!==o)for(let e in l)t&&S(t,e)||(delete l[e],c=!0)}c&&eP(e.attrs,"set","")}(e,t.props,r,n),ra(e,t.children,n),eT(),tZ(e),ew()},Z=(e,t,n,r,i,l,s,o,a=!1)=>{let c=e&&e.children,u=e?e.shapeFlag:0,d=t.children,{patchFlag:p,shapeFlag:h}=t;if(p>0){if(128&p){ee(c,d,n,r,i,l,s,o,a);return}if(256&p){Y(c,d,n,r,i,l,s,o,a);return}}8&h?(16&u&&es(c,i,l),d!==c&&g(n,d)):16&u?16&h?ee(c,d,n,r,i,l,s,o,a):es(c,i,l,!0):(8&u&&g(n,""),16&h&&D(d,n,r,i,l,s,o,a))},Y=(e,t,n,r,i,l,s,o,a)=>{let c;e=e||p,t=t||p;let u=e.length,d=t.length,h=Math.min(u,d);for(c=0;c<h;c++){let r=t[c]=a?iy(t[c]):ig(t[c]);T(e[c],r,n,null,i,l,s,o,a)}u>d?es(e,i,l,!0,!1,h):D(t,n,r,i,l,s,o,a,h)},ee=(e,t,n,r,i,l,s,o,a)=>{let c=0,u=t.length,d=e.length-1,h=u-1;for(;c<=d&&c<=h;){let r=e[c],u=t[c]=a?iy(t[c]):ig(t[c]);if(io(r,u))T(r,u,n,null,i,l,s,o,a);else break;c++}for(;c<=d&&c<=h;){let r=e[d],c=t[h]=a?iy(t[h]):ig(t[h]);if(io(r,c))T(r,c,n,null,i,l,s,o,a);else break;d--,h--}if(c>d){if(c<=h){let e=h+1,d=e<u?t[e].el:r;for(;c<=h;)T(null,t[c]=a?iy(t[c]):ig(t[c]),n,d,i,l,s,o,a),c++}}else if(c>h)for(;c<=d;)en(e[c],i,l,!0),c++;else{let f;let m=c,g=c,y=new Map;for(c=g;c<=h;c++){let e=t[c]=a?iy(t[c]):ig(t[c]);null!=e.key&&y.set(e.key,c)}let b=0,_=h-g+1,S=!1,x=0,C=Array(_);for(c=0;c<_;c++)C[c]=0;for(c=m;c<=d;c++){let r;let u=e[c];if(b>=_){en(u,i,l,!0);continue}if(null!=u.key)r=y.get(u.key);else for(f=g;f<=h;f++)if(0===C[f-g]&&io(u,t[f])){r=f;break}void 0===r?en(u,i,l,!0):(C[r-g]=c+1,r>=x?x=r:S=!0,T(u,t[r],n,null,i,l,s,o,a),b++)}let k=S?function(e){let t,n,r,i,l;let s=e.slice(),o=[0],a=e.length;for(t=0;t<a;t++){let a=e[t];if(0!==a){if(e[n=o[o.length-1]]<a){s[t]=n,o.push(t);continue}for(r=0,i=o.length-1;r<i;)e[o[l=r+i>>1]]<a?r=l+1:i=l;a<e[o[r]]&&(r>0&&(s[t]=o[r-1]),o[r]=t)}}for(r=o.length,i=o[r-1];r-- >0;)o[r]=i,i=s[i];return o}(C):p;for(f=k.length-1,c=_-1;c>=0;c--){let e=g+c,d=t[e],p=e+1<u?t[e+1].el:r;0===C[c]?T(null,d,n,p,i,l,s,o,a):S&&(f<0||c!==k[f]?et(d,n,p,2):f--)}}},et=(e,t,n,r,i=null)=>{let{el:l,type:o,transition:a,children:c,shapeFlag:u}=e;if(6&u){et(e.component.subTree,t,n,r);return}if(128&u){e.suspense.move(t,n,r);return}if(64&u){o.move(e,t,n,eu);return}if(o===r3){s(l,t,n);for(let e=0;e<c.length;e++)et(c[e],t,n,r);s(e.anchor,t,n);return}if(o===r8){O(e,t,n);return}if(2!==r&&1&u&&a){if(0===r)a.beforeEnter(l),s(l,t,n),rw(()=>a.enter(l),i);else{let{leave:e,delayLeave:r,afterLeave:i}=a,o=()=>s(l,t,n),c=()=>{e(l,()=>{o(),i&&i()})};r?r(l,o,c):c()}}else s(l,t,n)},en=(e,t,n,r=!1,i=!1)=>{let l;let{type:s,props:o,ref:a,children:c,dynamicChildren:u,shapeFlag:d,patchFlag:p,dirs:h,cacheIndex:f}=e;if(-2===p&&(i=!1),null!=a&&rc(a,null,n,e,!0),null!=f&&(t.renderCache[f]=void 0),256&d){t.ctx.deactivate(e);return}let m=1&d&&h,g=!nd(e);if(g&&(l=o&&o.onVnodeBeforeUnmount)&&i_(l,t,e),6&d)el(e.component,n,r);else{if(128&d){e.suspense.unmount(n,r);return}m&&t8(e,null,t,"beforeUnmount"),64&d?e.type.remove(e,t,n,eu,r):u&&!u.hasOnce&&(s!==r3||p>0&&64&p)?es(u,t,n,!1,!0):(s===r3&&384&p||!i&&16&d)&&es(c,t,n),r&&er(e)}(g&&(l=o&&o.onVnodeUnmounted)||m)&&rw(()=>{l&&i_(l,t,e),m&&t8(e,null,t,"unmounted")},n)},er=e=>{let{type:t,el:n,anchor:r,transition:i}=e;if(t===r3){ei(n,r);return}if(t===r8){L(e);return}let l=()=>{o(n),i&&!i.persisted&&i.afterLeave&&i.afterLeave()};if(1&e.shapeFlag&&i&&!i.persisted){let{leave:t,delayLeave:r}=i,s=()=>t(n,l);r?r(e.el,l,s):s()}else l()},ei=(e,t)=>{let n;for(;e!==t;)n=_(e),o(e),e=n;o(t)},el=(e,t,n)=>{let{bum:r,scope:i,update:l,subTree:s,um:o,m:a,a:c}=e;rL(a),rL(c),r&&z(r),i.stop(),l&&(l.active=!1,en(s,e,t,n)),o&&rw(o,t),rw(()=>{e.isUnmounted=!0},t),t&&t.pendingBranch&&!t.isUnmounted&&e.asyncDep&&!e.asyncResolved&&e.suspenseId===t.pendingId&&(t.deps--,0===t.deps&&t.resolve())},es=(e,t,n,r=!1,i=!1,l=0)=>{for(let s=l;s<e.length;s++)en(e[s],t,n,r,i)},eo=e=>{if(6&e.shapeFlag)return eo(e.component.subTree);if(128&e.shapeFlag)return e.suspense.next();let t=_(e.anchor||e.el),n=t&&t[ru];return n?_(n):t},ea=!1,ec=(e,t,n)=>{null==e?t._vnode&&en(t._vnode,null,null,!0):T(t._vnode||null,e,t,null,null,null,n),t._vnode=e,ea||(ea=!0,tZ(),tY(),ea=!1)},eu={p:T,um:en,m:et,r:er,mt:K,mc:D,pc:Z,pbc:B,n:eo,o:e};return t&&([r,i]=t(eu)),{render:ec,hydrate:r,createApp:(n=r,function(e,t=null){E(e)||(e=y({},e)),null==t||I(t)||(t=null);let r=nY(),i=new WeakSet,l=!1,s=r.app={_uid:n0++,_component:e,_props:t,_container:null,_context:r,_instance:null,version:iV,get config(){return r.config},set config(v){},use:(e,...t)=>(i.has(e)||(e&&E(e.install)?(i.add(e),e.install(s,...t)):E(e)&&(i.add(e),e(s,...t))),s),mixin:e=>(r.mixins.includes(e)||r.mixins.push(e),s),component:(e,t)=>t?(r.components[e]=t,s):r.components[e],directive:(e,t)=>t?(r.directives[e]=t,s):r.directives[e],mount(i,o,a){if(!l){let c=id(e,t);return c.appContext=r,!0===a?a="svg":!1===a&&(a=void 0),o&&n?n(c,i):ec(c,i,a),l=!0,s._container=i,i.__vue_app__=s,iM(c.component)}},unmount(){l&&(ec(null,s._container),delete s._container.__vue_app__)},provide:(e,t)=>(r.provides[e]=t,s),runWithContext(e){let t=n1;n1=s;try{return e()}finally{n1=t}}};return s})}}function rN({type:e,props:t},n){return"svg"===n&&"foreignObject"===e||"mathml"===n&&"annotation-xml"===e&&t&&t.encoding&&t.encoding.includes("html")?void 0:n}function rI({effect:e,update:t},n){e.allowRecurse=t.allowRecurse=n}function rR(e,t){return(!e||e&&!e.pendingBranch)&&t&&!t.persisted}function rO(e,t,n=!1){let r=e.children,i=t.children;if(x(r)&&x(i))for(let e=0;e<r.length;e++){let t=r[e],l=i[e];!(1&l.shapeFlag)||l.dynamicChildren||((l.patchFlag<=0||32===l.patchFlag)&&((l=i[e]=iy(i[e])).el=t.el),n||-2===l.patchFlag||rO(t,l)),l.type===r6&&(l.el=t.el)}}function rL(e){if(e)for(let t=0;t<e.length;t++)e[t].active=!1}let rM=Symbol.for("v-scx");function r$(e,t){return rD(e,null,{flush:"post"})}function rP(e,t){return rD(e,null,{flush:"sync"})}let rF={};function rD(e,t,{immediate:r,deep:i,flush:l,once:s,onTrack:o,onTrigger:a}=d){let c,u,p;if(t&&s){let e=t;t=(...t)=>{e(...t),w()}}let f=iC,m=e=>!0===i?e:rU(e,!1===i?1:void 0),g=!1,y=!1;if(tk(e)?(c=()=>e.value,g=tm(e)):th(e)?(c=()=>m(e),g=!0):x(e)?(y=!0,g=e.some(e=>th(e)||tm(e)),c=()=>e.map(e=>tk(e)?e.value:th(e)?m(e):E(e)?tP(e,f,2):void 0)):c=E(e)?t?()=>tP(e,f,2):()=>(u&&u(),tF(e,f,3,[_])):h,t&&i){let e=c;c=()=>rU(e())}let _=e=>{u=k.onStop=()=>{tP(e,f,4),u=k.onStop=void 0}},S=y?Array(e.length).fill(rF):rF,C=()=>{if(k.active&&k.dirty){if(t){let e=k.run();(i||g||(y?e.some((e,t)=>K(e,S[t])):K(e,S)))&&(u&&u(),tF(t,f,3,[e,S===rF?void 0:y&&S[0]===rF?[]:S,_]),S=e)}else k.run()}};C.allowRecurse=!!t,"sync"===l?p=C:"post"===l?p=()=>rw(C,f&&f.suspense):(C.pre=!0,f&&(C.id=f.uid),p=()=>tJ(C));let k=new ev(c,h,p),T=n,w=()=>{k.stop(),T&&b(T.effects,k)};return t?r?C():S=k.run():"post"===l?rw(k.run.bind(k),f&&f.suspense):k.run(),w}function rV(e,t,n){let r;let i=this.proxy,l=A(e)?e.includes(".")?rB(i,e):()=>i[e]:e.bind(i,i);E(t)?r=t:(r=t.handler,n=t);let s=iT(this),o=rD(l,r.bind(i),n);return s(),o}function rB(e,t){let n=t.split(".");return()=>{let t=e;for(let e=0;e<n.length&&t;e++)t=t[n[e]];return t}}function rU(e,t=1/0,n){if(t<=0||!I(e)||e.__v_skip||(n=n||new Set).has(e))return e;if(n.add(e),t--,tk(e))rU(e.value,t,n);else if(x(e))for(let r=0;r<e.length;r++)rU(e[r],t,n);else if(k(e)||C(e))e.forEach(e=>{rU(e,t,n)});else if($(e)){for(let r in e)rU(e[r],t,n);for(let r of Object.getOwnPropertySymbols(e))Object.prototype.propertyIsEnumerable.call(e,r)&&rU(e[r],t,n)}return e}let rj=(e,t)=>"modelValue"===t||"model-value"===t?e.modelModifiers:e[`${t}Modifiers`]||e[`${U(t)}Modifiers`]||e[`${H(t)}Modifiers`];function rH(e,t,...n){let r;if(e.isUnmounted)return;let i=e.vnode.props||d,l=n,s=t.startsWith("update:"),o=s&&rj(i,t.slice(7));o&&(o.trim&&(l=n.map(e=>A(e)?e.trim():e)),o.number&&(l=n.map(J)));let a=i[r=W(t)]||i[r=W(U(t))];!a&&s&&(a=i[r=W(H(t))]),a&&tF(a,e,6,l);let c=i[r+"Once"];if(c){if(e.emitted){if(e.emitted[r])return}else e.emitted={};e.emitted[r]=!0,tF(c,e,6,l)}}function rq(e,t){return!!(e&&m(t))&&(S(e,(t=t.slice(2).replace(/Once$/,""))[0].toLowerCase()+t.slice(1))||S(e,H(t))||S(e,t))}function rW(e){let t,n;let{type:r,vnode:i,proxy:l,withProxy:s,propsOptions:[o],slots:a,attrs:c,emit:u,render:d,renderCache:p,props:h,data:f,setupState:m,ctx:y,inheritAttrs:b}=e,_=t6(e);try{if(4&i.shapeFlag){let e=s||l;t=ig(d.call(e,e,p,h,m,f,y)),n=c}else t=ig(r.length>1?r(h,{attrs:c,slots:a,emit:u}):r(h,null)),n=r.props?c:rK(c)}catch(n){r5.length=0,tD(n,e,1),t=id(r4)}let S=t;if(n&&!1!==b){let e=Object.keys(n),{shapeFlag:t}=S;e.length&&7&t&&(o&&e.some(g)&&(n=rz(n,o)),S=ih(S,n,!1,!0))}return i.dirs&&((S=ih(S,null,!1,!0)).dirs=S.dirs?S.dirs.concat(i.dirs):i.dirs),i.transition&&(S.transition=i.transition),t=S,t6(_),t}let rK=e=>{let t;for(let n in e)("class"===n||"style"===n||m(n))&&((t||(t={}))[n]=e[n]);return t},rz=(e,t)=>{let n={};for(let r in e)g(r)&&r.slice(9) in t||(n[r]=e[r]);return n};function rG(e,t,n){let r=Object.keys(t);if(r.length!==Object.keys(e).length)return!0;for(let i=0;i<r.length;i++){let l=r[i];if(t[l]!==e[l]&&!rq(n,l))return!0}return!1}function rJ({vnode:e,parent:t},n){for(;t;){let r=t.subTree;if(r.suspense&&r.suspense.activeBranch===e&&(r.el=e.el),r===e)(e=t.vnode).el=n,t=t.parent;else break}}let rX=e=>e.__isSuspense,rQ=0;function rZ(e,t){let n=e.props&&e.props[t];E(n)&&n()}function rY(e,t,n,r,i,l,s,o,a,c,u=!1){let d;let{p:p,m:h,um:f,n:m,o:{parentNode:g,remove:y}}=c,b=function(e){let t=e.props&&e.props.suspensible;return null!=t&&!1!==t}(e);b&&t&&t.pendingBranch&&(d=t.pendingId,t.deps++);let _=e.props?X(e.props.timeout):void 0,S=l,x={vnode:e,parent:t,parentComponent:n,namespace:s,container:r,hiddenContainer:i,deps:0,pendingId:rQ++,timeout:"number"==typeof _?_:-1,activeBranch:null,pendingBranch:null,isInFallback:!u,isHydrating:u,isUnmounted:!1,effects:[],resolve(e=!1,n=!1){let{vnode:r,activeBranch:i,pendingBranch:s,pendingId:o,effects:a,parentComponent:c,container:u}=x,p=!1;x.isHydrating?x.isHydrating=!1:e||((p=i&&s.transition&&"out-in"===s.transition.mode)&&(i.transition.afterLeave=()=>{o===x.pendingId&&(h(s,u,l===S?m(i):l,0),tQ(a))}),i&&(g(i.el)!==x.hiddenContainer&&(l=m(i)),f(i,c,x,!0)),p||h(s,u,l,0)),r2(x,s),x.pendingBranch=null,x.isInFallback=!1;let y=x.parent,_=!1;for(;y;){if(y.pendingBranch){y.effects.push(...a),_=!0;break}y=y.parent}_||p||tQ(a),x.effects=[],b&&t&&t.pendingBranch&&d===t.pendingId&&(t.deps--,0!==t.deps||n||t.resolve()),rZ(r,"onResolve")},fallback(e){if(!x.pendingBranch)return;let{vnode:t,activeBranch:n,parentComponent:r,container:i,namespace:l}=x;rZ(t,"onFallback");let s=m(n),c=()=>{x.isInFallback&&(p(null,e,i,s,r,null,l,o,a),r2(x,e))},u=e.transition&&"out-in"===e.transition.mode;u&&(n.transition.afterLeave=c),x.isInFallback=!0,f(n,r,null,!0),u||c()},move(e,t,n){x.activeBranch&&h(x.activeBranch,e,t,n),x.container=e},next:()=>x.activeBranch&&m(x.activeBranch),registerDep(e,t,n){let r=!!x.pendingBranch;r&&x.deps++;let i=e.vnode.el;e.asyncDep.catch(t=>{tD(t,e,0)}).then(l=>{if(e.isUnmounted||x.isUnmounted||x.pendingId!==e.suspenseId)return;e.asyncResolved=!0;let{vnode:o}=e;iN(e,l,!1),i&&(o.el=i);let a=!i&&e.subTree.el;t(e,o,g(i||e.subTree.el),i?null:m(e.subTree),x,s,n),a&&y(a),rJ(e,o.el),r&&0==--x.deps&&x.resolve()})},unmount(e,t){x.isUnmounted=!0,x.activeBranch&&f(x.activeBranch,n,e,t),x.pendingBranch&&f(x.pendingBranch,n,e,t)}};return x}function r0(e){let t;if(E(e)){let n=it&&e._c;n&&(e._d=!1,r7()),e=e(),n&&(e._d=!0,t=r9,ie())}return x(e)&&(e=function(e,t=!0){let n;for(let t=0;t<e.length;t++){let r=e[t];if(!is(r))return;if(r.type!==r4||"v-if"===r.children){if(n)return;n=r}}return n}(e)),e=ig(e),t&&!e.dynamicChildren&&(e.dynamicChildren=t.filter(t=>t!==e)),e}function r1(e,t){t&&t.pendingBranch?x(e)?t.effects.push(...e):t.effects.push(e):tQ(e)}function r2(e,t){e.activeBranch=t;let{vnode:n,parentComponent:r}=e,i=t.el;for(;!i&&t.component;)i=(t=t.component.subTree).el;n.el=i,r&&r.subTree===n&&(r.vnode.el=i,rJ(r,i))}let r3=Symbol.for("v-fgt"),r6=Symbol.for("v-txt"),r4=Symbol.for("v-cmt"),r8=Symbol.for("v-stc"),r5=[],r9=null;function r7(e=!1){r5.push(r9=e?null:[])}function ie(){r5.pop(),r9=r5[r5.length-1]||null}let it=1;function ir(e){it+=e,e<0&&r9&&(r9.hasOnce=!0)}function ii(e){return e.dynamicChildren=it>0?r9||p:null,ie(),it>0&&r9&&r9.push(e),e}function il(e,t,n,r,i){return ii(id(e,t,n,r,i,!0))}function is(e){return!!e&&!0===e.__v_isVNode}function io(e,t){return e.type===t.type&&e.key===t.key}let ia=({key:e})=>null!=e?e:null,ic=({ref:e,ref_key:t,ref_for:n})=>("number"==typeof e&&(e=""+e),null!=e?A(e)||tk(e)||E(e)?{i:t2,r:e,k:t,f:!!n}:e:null);function iu(e,t=null,n=null,r=0,i=null,l=e===r3?0:1,s=!1,o=!1){let a={__v_isVNode:!0,__v_skip:!0,type:e,props:t,key:t&&ia(t),ref:t&&ic(t),scopeId:t3,slotScopeIds:null,children:n,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetStart:null,targetAnchor:null,staticCount:0,shapeFlag:l,patchFlag:r,dynamicProps:i,dynamicChildren:null,appContext:null,ctx:t2};return o?(iv(a,n),128&l&&e.normalize(a)):n&&(a.shapeFlag|=A(n)?8:16),it>0&&!s&&r9&&(a.patchFlag>0||6&l)&&32!==a.patchFlag&&r9.push(a),a}let id=function(e,t=null,n=null,r=0,i=null,l=!1){var s;if(e&&e!==nL||(e=r4),is(e)){let r=ih(e,t,!0);return n&&iv(r,n),it>0&&!l&&r9&&(6&r.shapeFlag?r9[r9.indexOf(e)]=r:r9.push(r)),r.patchFlag=-2,r}if(E(s=e)&&"__vccOpts"in s&&(e=e.__vccOpts),t){let{class:e,style:n}=t=ip(t);e&&!A(e)&&(t.class=ei(e)),I(n)&&(tg(n)&&!x(n)&&(n=y({},n)),t.style=Y(n))}let o=A(e)?1:rX(e)?128:rd(e)?64:I(e)?4:E(e)?2:0;return iu(e,t,n,r,i,o,l,!0)};function ip(e){return e?tg(e)||n8(e)?y({},e):e:null}function ih(e,t,n=!1,r=!1){let{props:i,ref:l,patchFlag:s,children:o,transition:a}=e,c=t?ib(i||{},t):i,u={__v_isVNode:!0,__v_skip:!0,type:e.type,props:c,key:c&&ia(c),ref:t&&t.ref?n&&l?x(l)?l.concat(ic(t)):[l,ic(t)]:ic(t):l,scopeId:e.scopeId,slotScopeIds:e.slotScopeIds,children:o,target:e.target,targetStart:e.targetStart,targetAnchor:e.targetAnchor,staticCount:e.staticCount,shapeFlag:e.shapeFlag,patchFlag:t&&e.type!==r3?-1===s?16:16|s:s,dynamicProps:e.dynamicProps,dynamicChildren:e.dynamicChildren,appContext:e.appContext,dirs:e.dirs,transition:a,component:e.component,suspense:e.suspense,ssContent:e.ssContent&&ih(e.ssContent),ssFallback:e.ssFallback&&ih(e.ssFallback),el:e.el,anchor:e.anchor,ctx:e.ctx,ce:e.ce};return a&&r&&na(u,a.clone(u)),u}function im(e=" ",t=0){return id(r6,null,e,t)}function ig(e){return null==e||"boolean"==typeof e?id(r4):x(e)?id(r3,null,e.slice()):"object"==typeof e?iy(e):id(r6,null,String(e))}function iy(e){return null===e.el&&-1!==e.patchFlag||e.memo?e:ih(e)}function iv(e,t){let n=0,{shapeFlag:r}=e;if(null==t)t=null;else if(x(t))n=16;else if("object"==typeof t){if(65&r){let n=t.default;n&&(n._c&&(n._d=!1),iv(e,n()),n._c&&(n._d=!0));return}{n=32;let r=t._;r||n8(t)?3===r&&t2&&(1===t2.slots._?t._=1:(t._=2,e.patchFlag|=1024)):t._ctx=t2}}else E(t)?(t={default:t,_ctx:t2},n=32):(t=String(t),64&r?(n=16,t=[im(t)]):n=8);e.children=t,e.shapeFlag|=n}function ib(...e){let t={};for(let n=0;n<e.length;n++){let r=e[n];for(let e in r)if("class"===e)t.class!==r.class&&(t.class=ei([t.class,r.class]));else if("style"===e)t.style=Y([t.style,r.style]);else if(m(e)){let n=t[e],i=r[e];i&&n!==i&&!(x(n)&&n.includes(i))&&(t[e]=n?[].concat(n,i):i)}else""!==e&&(t[e]=r[e])}return t}function i_(e,t,n,r=null){tF(e,t,7,[n,r])}let iS=nY(),ix=0,iC=null,ik=()=>iC||t2;i=e=>{iC=e},l=e=>{iA=e};let iT=e=>{let t=iC;return i(e),e.scope.on(),()=>{e.scope.off(),i(t)}},iw=()=>{iC&&iC.scope.off(),i(null)};function iE(e){return 4&e.vnode.shapeFlag}let iA=!1;function iN(e,t,n){E(t)?e.render=t:I(t)&&(e.setupState=tI(t)),iR(e,n)}function iI(e){s=e,o=e=>{e.render._rc&&(e.withProxy=new Proxy(e.ctx,nB))}}function iR(e,t,n){let r=e.type;if(!e.render){if(!t&&s&&!r.render){let t=r.template||nW(e).template;if(t){let{isCustomElement:n,compilerOptions:i}=e.appContext.config,{delimiters:l,compilerOptions:o}=r,a=y(y({isCustomElement:n,delimiters:l},i),o);r.render=s(t,a)}}e.render=r.render||h,o&&o(e)}{let t=iT(e);eT();try{!function(e){let t=nW(e),n=e.proxy,r=e.ctx;nH=!1,t.beforeCreate&&nq(t.beforeCreate,e,"bc");let{data:i,computed:l,methods:s,watch:o,provide:a,inject:c,created:u,beforeMount:d,mounted:p,beforeUpdate:f,updated:m,activated:g,deactivated:y,beforeDestroy:b,beforeUnmount:_,destroyed:S,unmounted:C,render:k,renderTracked:T,renderTriggered:w,errorCaptured:N,serverPrefetch:R,expose:O,inheritAttrs:L,components:M,directives:$,filters:P}=t;if(c&&function(e,t,n=h){for(let n in x(e)&&(e=nJ(e)),e){let r;let i=e[n];tk(r=I(i)?"default"in i?n3(i.from||n,i.default,!0):n3(i.from||n):n3(i))?Object.defineProperty(t,n,{enumerable:!0,configurable:!0,get:()=>r.value,set:e=>r.value=e}):t[n]=r}}(c,r,null),s)for(let e in s){let t=s[e];E(t)&&(r[e]=t.bind(n))}if(i){let t=i.call(n,n);I(t)&&(e.data=tc(t))}if(nH=!0,l)for(let e in l){let t=l[e],i=E(t)?t.bind(n,n):E(t.get)?t.get.bind(n,n):h,s=iP({get:i,set:!E(t)&&E(t.set)?t.set.bind(n):h});Object.defineProperty(r,e,{enumerable:!0,configurable:!0,get:()=>s.value,set:e=>s.value=e})}if(o)for(let e in o)!function e(t,n,r,i){let l=i.includes(".")?rB(r,i):()=>r[i];if(A(t)){let e=n[t];E(e)&&rD(l,e,void 0)}else if(E(t)){var s;s=t.bind(r),rD(l,s,void 0)}else if(I(t)){if(x(t))t.forEach(t=>e(t,n,r,i));else{let e=E(t.handler)?t.handler.bind(r):n[t.handler];E(e)&&rD(l,e,t)}}}(o[e],r,n,e);if(a){let e=E(a)?a.call(n):a;Reflect.ownKeys(e).forEach(t=>{n2(t,e[t])})}function F(e,t){x(t)?t.forEach(t=>e(t.bind(n))):t&&e(t.bind(n))}if(u&&nq(u,e,"c"),F(nx,d),F(nC,p),F(nk,f),F(nT,m),F(nm,g),F(ng,y),F(nR,N),F(nI,T),F(nN,w),F(nw,_),F(nE,C),F(nA,R),x(O)){if(O.length){let t=e.exposed||(e.exposed={});O.forEach(e=>{Object.defineProperty(t,e,{get:()=>n[e],set:t=>n[e]=t})})}else e.exposed||(e.exposed={})}k&&e.render===h&&(e.render=k),null!=L&&(e.inheritAttrs=L),M&&(e.components=M),$&&(e.directives=$)}(e)}finally{ew(),t()}}}let iO={get:(e,t)=>(e$(e,"get",""),e[t])};function iL(e){return{attrs:new Proxy(e.attrs,iO),slots:e.slots,emit:e.emit,expose:t=>{e.exposed=t||{}}}}function iM(e){return e.exposed?e.exposeProxy||(e.exposeProxy=new Proxy(tI(tv(e.exposed)),{get:(t,n)=>n in t?t[n]:n in nF?nF[n](e):void 0,has:(e,t)=>t in e||t in nF})):e.proxy}function i$(e,t=!0){return E(e)?e.displayName||e.name:e.name||t&&e.__name}let iP=(e,t)=>(function(e,t,n=!1){let r,i;let l=E(e);return l?(r=e,i=h):(r=e.get,i=e.set),new tS(r,i,l||!i,n)})(e,0,iA);function iF(e,t,n){let r=arguments.length;return 2!==r?(r>3?n=Array.prototype.slice.call(arguments,2):3===r&&is(n)&&(n=[n]),id(e,t,n)):!I(t)||x(t)?id(e,null,t):is(t)?id(e,null,[t]):id(e,t)}function iD(e,t){let n=e.memo;if(n.length!=t.length)return!1;for(let e=0;e<n.length;e++)if(K(n[e],t[e]))return!1;return it>0&&r9&&r9.push(e),!0}let iV="3.4.38",iB="undefined"!=typeof document?document:null,iU=iB&&iB.createElement("template"),ij="transition",iH="animation",iq=Symbol("_vtc"),iW=(e,{slots:t})=>iF(nr,iX(e),t);iW.displayName="Transition";let iK={name:String,type:String,css:{type:Boolean,default:!0},duration:[String,Number,Object],enterFromClass:String,enterActiveClass:String,enterToClass:String,appearFromClass:String,appearActiveClass:String,appearToClass:String,leaveFromClass:String,leaveActiveClass:String,leaveToClass:String},iz=iW.props=y({},nt,iK),iG=(e,t=[])=>{x(e)?e.forEach(e=>e(...t)):e&&e(...t)},iJ=e=>!!e&&(x(e)?e.some(e=>e.length>1):e.length>1);function iX(e){let t={};for(let n in e)n in iK||(t[n]=e[n]);if(!1===e.css)return t;let{name:n="v",type:r,duration:i,enterFromClass:l=`${n}-enter-from`,enterActiveClass:s=`${n}-enter-active`,enterToClass:o=`${n}-enter-to`,appearFromClass:a=l,appearActiveClass:c=s,appearToClass:u=o,leaveFromClass:d=`${n}-leave-from`,leaveActiveClass:p=`${n}-leave-active`,leaveToClass:h=`${n}-leave-to`}=e,f=function(e){if(null==e)return null;if(I(e))return[X(e.enter),X(e.leave)];{let t=X(e);return[t,t]}}(i),m=f&&f[0],g=f&&f[1],{onBeforeEnter:b,onEnter:_,onEnterCancelled:S,onLeave:x,onLeaveCancelled:C,onBeforeAppear:k=b,onAppear:T=_,onAppearCancelled:w=S}=t,E=(e,t,n)=>{iZ(e,t?u:o),iZ(e,t?c:s),n&&n()},A=(e,t)=>{e._isLeaving=!1,iZ(e,d),iZ(e,h),iZ(e,p),t&&t()},N=e=>(t,n)=>{let i=e?T:_,s=()=>E(t,e,n);iG(i,[t,s]),iY(()=>{iZ(t,e?a:l),iQ(t,e?u:o),iJ(i)||i1(t,r,m,s)})};return y(t,{onBeforeEnter(e){iG(b,[e]),iQ(e,l),iQ(e,s)},onBeforeAppear(e){iG(k,[e]),iQ(e,a),iQ(e,c)},onEnter:N(!1),onAppear:N(!0),onLeave(e,t){e._isLeaving=!0;let n=()=>A(e,t);iQ(e,d),iQ(e,p),i4(),iY(()=>{e._isLeaving&&(iZ(e,d),iQ(e,h),iJ(x)||i1(e,r,g,n))}),iG(x,[e,n])},onEnterCancelled(e){E(e,!1),iG(S,[e])},onAppearCancelled(e){E(e,!0),iG(w,[e])},onLeaveCancelled(e){A(e),iG(C,[e])}})}function iQ(e,t){t.split(/\s+/).forEach(t=>t&&e.classList.add(t)),(e[iq]||(e[iq]=new Set)).add(t)}function iZ(e,t){t.split(/\s+/).forEach(t=>t&&e.classList.remove(t));let n=e[iq];n&&(n.delete(t),n.size||(e[iq]=void 0))}function iY(e){requestAnimationFrame(()=>{requestAnimationFrame(e)})}let i0=0;function i1(e,t,n,r){let i=e._endId=++i0,l=()=>{i===e._endId&&r()};if(n)return setTimeout(l,n);let{type:s,timeout:o,propCount:a}=i2(e,t);if(!s)return r();let c=s+"end",u=0,d=()=>{e.removeEventListener(c,p),l()},p=t=>{t.target===e&&++u>=a&&d()};setTimeout(()=>{u<a&&d()},o+1),e.addEventListener(c,p)}function i2(e,t){let n=window.getComputedStyle(e),r=e=>(n[e]||"").split(", "),i=r(`${ij}Delay`),l=r(`${ij}Duration`),s=i3(i,l),o=r(`${iH}Delay`),a=r(`${iH}Duration`),c=i3(o,a),u=null,d=0,p=0;t===ij?s>0&&(u=ij,d=s,p=l.length):t===iH?c>0&&(u=iH,d=c,p=a.length):p=(u=(d=Math.max(s,c))>0?s>c?ij:iH:null)?u===ij?l.length:a.length:0;let h=u===ij&&/\b(transform|all)(,|$)/.test(r(`${ij}Property`).toString());return{type:u,timeout:d,propCount:p,hasTransform:h}}function i3(e,t){for(;e.length<t.length;)e=e.concat(e);return Math.max(...t.map((t,n)=>i6(t)+i6(e[n])))}function i6(e){return"auto"===e?0:1e3*Number(e.slice(0,-1).replace(",","."))}function i4(){return document.body.offsetHeight}let i8=Symbol("_vod"),i5=Symbol("_vsh");function i9(e,t){e.style.display=t?e[i8]:"none",e[i5]=!t}let i7=Symbol("");function le(e,t){if(1===e.nodeType){let n=e.style,r="";for(let e in t)n.setProperty(`--${e}`,t[e]),r+=`--${e}: ${t[e]};`;n[i7]=r}}let lt=/(^|;)\s*display\s*:/,ln=/\s*!important$/;function lr(e,t,n){if(x(n))n.forEach(n=>lr(e,t,n));else if(null==n&&(n=""),t.startsWith("--"))e.setProperty(t,n);else{let r=function(e,t){let n=ll[t];if(n)return n;let r=U(t);if("filter"!==r&&r in e)return ll[t]=r;r=q(r);for(let n=0;n<li.length;n++){let i=li[n]+r;if(i in e)return ll[t]=i}return t}(e,t);ln.test(n)?e.setProperty(H(r),n.replace(ln,""),"important"):e[r]=n}}let li=["Webkit","Moz","ms"],ll={},ls="http://www.w3.org/1999/xlink";function lo(e,t,n,r,i,l=ec(t)){r&&t.startsWith("xlink:")?null==n?e.removeAttributeNS(ls,t.slice(6,t.length)):e.setAttributeNS(ls,t,n):null==n||l&&!(n||""===n)?e.removeAttribute(t):e.setAttribute(t,l?"":N(n)?String(n):n)}function la(e,t,n,r){e.addEventListener(t,n,r)}let lc=Symbol("_vei"),lu=/(?:Once|Passive|Capture)$/,ld=0,lp=Promise.resolve(),lh=()=>ld||(lp.then(()=>ld=0),ld=Date.now()),lf=e=>111===e.charCodeAt(0)&&110===e.charCodeAt(1)&&e.charCodeAt(2)>96&&123>e.charCodeAt(2);/*! #__NO_SIDE_EFFECTS__ */function lm(e,t,n){let r=nu(e,t);class i extends ly{constructor(e){super(r,e,n)}}return i.def=r,i}let lg="undefined"!=typeof HTMLElement?HTMLElement:class{};class ly extends lg{constructor(e,t={},n){super(),this._def=e,this._props=t,this._instance=null,this._connected=!1,this._resolved=!1,this._numberProps=null,this._ob=null,this.shadowRoot&&n?n(this._createVNode(),this.shadowRoot):(this.attachShadow({mode:"open"}),this._def.__asyncLoader||this._resolveProps(this._def))}connectedCallback(){this._connected=!0,this._instance||(this._resolved?this._update():this._resolveDef())}disconnectedCallback(){this._connected=!1,tG(()=>{this._connected||(this._ob&&(this._ob.disconnect(),this._ob=null),lW(null,this.shadowRoot),this._instance=null)})}_resolveDef(){this._resolved=!0;for(let e=0;e<this.attributes.length;e++)this._setAttr(this.attributes[e].name);this._ob=new MutationObserver(e=>{for(let t of e)this._setAttr(t.attributeName)}),this._ob.observe(this,{attributes:!0});let e=(e,t=!1)=>{let n;let{props:r,styles:i}=e;if(r&&!x(r))for(let e in r){let t=r[e];(t===Number||t&&t.type===Number)&&(e in this._props&&(this._props[e]=X(this._props[e])),(n||(n=Object.create(null)))[U(e)]=!0)}this._numberProps=n,t&&this._resolveProps(e),this._applyStyles(i),this._update()},t=this._def.__asyncLoader;t?t().then(t=>e(t,!0)):e(this._def)}_resolveProps(e){let{props:t}=e,n=x(t)?t:Object.keys(t||{});for(let e of Object.keys(this))"_"!==e[0]&&n.includes(e)&&this._setProp(e,this[e],!0,!1);for(let e of n.map(U))Object.defineProperty(this,e,{get(){return this._getProp(e)},set(t){this._setProp(e,t)}})}_setAttr(e){let t=this.hasAttribute(e)?this.getAttribute(e):void 0,n=U(e);this._numberProps&&this._numberProps[n]&&(t=X(t)),this._setProp(n,t,!1)}_getProp(e){return this._props[e]}_setProp(e,t,n=!0,r=!0){t!==this._props[e]&&(this._props[e]=t,r&&this._instance&&this._update(),n&&(!0===t?this.setAttribute(H(e),""):"string"==typeof t||"number"==typeof t?this.setAttribute(H(e),t+""):t||this.removeAttribute(H(e))))}_update(){lW(this._createVNode(),this.shadowRoot)}_createVNode(){let e=id(this._def,y({},this._props));return this._instance||(e.ce=e=>{this._instance=e,e.isCE=!0;let t=(e,t)=>{this.dispatchEvent(new CustomEvent(e,{detail:t}))};e.emit=(e,...n)=>{t(e,n),H(e)!==e&&t(H(e),n)};let n=this;for(;n=n&&(n.parentNode||n.host);)if(n instanceof ly){e.parent=n._instance,e.provides=n._instance.provides;break}}),e}_applyStyles(e){e&&e.forEach(e=>{let t=document.createElement("style");t.textContent=e,this.shadowRoot.appendChild(t)})}}let lv=new WeakMap,lb=new WeakMap,l_=Symbol("_moveCb"),lS=Symbol("_enterCb"),lx={name:"TransitionGroup",props:y({},iz,{tag:String,moveClass:String}),setup(e,{slots:t}){let n,r;let i=ik(),l=t7();return nT(()=>{if(!n.length)return;let t=e.moveClass||`${e.name||"v"}-move`;if(!function(e,t,n){let r=e.cloneNode(),i=e[iq];i&&i.forEach(e=>{e.split(/\s+/).forEach(e=>e&&r.classList.remove(e))}),n.split(/\s+/).forEach(e=>e&&r.classList.add(e)),r.style.display="none";let l=1===t.nodeType?t:t.parentNode;l.appendChild(r);let{hasTransform:s}=i2(r);return l.removeChild(r),s}(n[0].el,i.vnode.el,t))return;n.forEach(lC),n.forEach(lk);let r=n.filter(lT);i4(),r.forEach(e=>{let n=e.el,r=n.style;iQ(n,t),r.transform=r.webkitTransform=r.transitionDuration="";let i=n[l_]=e=>{(!e||e.target===n)&&(!e||/transform$/.test(e.propertyName))&&(n.removeEventListener("transitionend",i),n[l_]=null,iZ(n,t))};n.addEventListener("transitionend",i)})}),()=>{let s=ty(e),o=iX(s),a=s.tag||r3;if(n=[],r)for(let e=0;e<r.length;e++){let t=r[e];t.el&&t.el instanceof Element&&(n.push(t),na(t,nl(t,o,l,i)),lv.set(t,t.el.getBoundingClientRect()))}r=t.default?nc(t.default()):[];for(let e=0;e<r.length;e++){let t=r[e];null!=t.key&&na(t,nl(t,o,l,i))}return id(a,null,r)}}};function lC(e){let t=e.el;t[l_]&&t[l_](),t[lS]&&t[lS]()}function lk(e){lb.set(e,e.el.getBoundingClientRect())}function lT(e){let t=lv.get(e),n=lb.get(e),r=t.left-n.left,i=t.top-n.top;if(r||i){let t=e.el.style;return t.transform=t.webkitTransform=`translate(${r}px,${i}px)`,t.transitionDuration="0s",e}}lx.props;let lw=e=>{let t=e.props["onUpdate:modelValue"]||!1;return x(t)?e=>z(t,e):t};function lE(e){e.target.composing=!0}function lA(e){let t=e.target;t.composing&&(t.composing=!1,t.dispatchEvent(new Event("input")))}let lN=Symbol("_assign"),lI={created(e,{modifiers:{lazy:t,trim:n,number:r}},i){e[lN]=lw(i);let l=r||i.props&&"number"===i.props.type;la(e,t?"change":"input",t=>{if(t.target.composing)return;let r=e.value;n&&(r=r.trim()),l&&(r=J(r)),e[lN](r)}),n&&la(e,"change",()=>{e.value=e.value.trim()}),t||(la(e,"compositionstart",lE),la(e,"compositionend",lA),la(e,"change",lA))},mounted(e,{value:t}){e.value=null==t?"":t},beforeUpdate(e,{value:t,oldValue:n,modifiers:{lazy:r,trim:i,number:l}},s){if(e[lN]=lw(s),e.composing)return;let o=(l||"number"===e.type)&&!/^0\d/.test(e.value)?J(e.value):e.value,a=null==t?"":t;o===a||document.activeElement===e&&"range"!==e.type&&(r&&t===n||i&&e.value.trim()===a)||(e.value=a)}},lR={deep:!0,created(e,t,n){e[lN]=lw(n),la(e,"change",()=>{let t=e._modelValue,n=lP(e),r=e.checked,i=e[lN];if(x(t)){let e=ed(t,n),l=-1!==e;if(r&&!l)i(t.concat(n));else if(!r&&l){let n=[...t];n.splice(e,1),i(n)}}else if(k(t)){let e=new Set(t);r?e.add(n):e.delete(n),i(e)}else i(lF(e,r))})},mounted:lO,beforeUpdate(e,t,n){e[lN]=lw(n),lO(e,t,n)}};function lO(e,{value:t,oldValue:n},r){e._modelValue=t,x(t)?e.checked=ed(t,r.props.value)>-1:k(t)?e.checked=t.has(r.props.value):t!==n&&(e.checked=eu(t,lF(e,!0)))}let lL={created(e,{value:t},n){e.checked=eu(t,n.props.value),e[lN]=lw(n),la(e,"change",()=>{e[lN](lP(e))})},beforeUpdate(e,{value:t,oldValue:n},r){e[lN]=lw(r),t!==n&&(e.checked=eu(t,r.props.value))}},lM={deep:!0,created(e,{value:t,modifiers:{number:n}},r){let i=k(t);la(e,"change",()=>{let t=Array.prototype.filter.call(e.options,e=>e.selected).map(e=>n?J(lP(e)):lP(e));e[lN](e.multiple?i?new Set(t):t:t[0]),e._assigning=!0,tG(()=>{e._assigning=!1})}),e[lN]=lw(r)},mounted(e,{value:t}){l$(e,t)},beforeUpdate(e,t,n){e[lN]=lw(n)},updated(e,{value:t}){e._assigning||l$(e,t)}};function l$(e,t,n){let r=e.multiple,i=x(t);if(!r||i||k(t)){for(let n=0,l=e.options.length;n<l;n++){let l=e.options[n],s=lP(l);if(r){if(i){let e=typeof s;"string"===e||"number"===e?l.selected=t.some(e=>String(e)===String(s)):l.selected=ed(t,s)>-1}else l.selected=t.has(s)}else if(eu(lP(l),t)){e.selectedIndex!==n&&(e.selectedIndex=n);return}}r||-1===e.selectedIndex||(e.selectedIndex=-1)}}function lP(e){return"_value"in e?e._value:e.value}function lF(e,t){let n=t?"_trueValue":"_falseValue";return n in e?e[n]:t}function lD(e,t,n,r,i){let l=function(e,t){switch(e){case"SELECT":return lM;case"TEXTAREA":return lI;default:switch(t){case"checkbox":return lR;case"radio":return lL;default:return lI}}}(e.tagName,n.props&&n.props.type)[i];l&&l(e,t,n,r)}let lV=["ctrl","shift","alt","meta"],lB={stop:e=>e.stopPropagation(),prevent:e=>e.preventDefault(),self:e=>e.target!==e.currentTarget,ctrl:e=>!e.ctrlKey,shift:e=>!e.shiftKey,alt:e=>!e.altKey,meta:e=>!e.metaKey,left:e=>"button"in e&&0!==e.button,middle:e=>"button"in e&&1!==e.button,right:e=>"button"in e&&2!==e.button,exact:(e,t)=>lV.some(n=>e[`${n}Key`]&&!t.includes(n))},lU={esc:"escape",space:" ",up:"arrow-up",left:"arrow-left",right:"arrow-right",down:"arrow-down",delete:"backspace"},lj=y({patchProp:(e,t,n,r,i,l)=>{let s="svg"===i;"class"===t?function(e,t,n){let r=e[iq];r&&(t=(t?[t,...r]:[...r]).join(" ")),null==t?e.removeAttribute("class"):n?e.setAttribute("class",t):e.className=t}(e,r,s):"style"===t?function(e,t,n){let r=e.style,i=A(n),l=!1;if(n&&!i){if(t){if(A(t))for(let e of t.split(";")){let t=e.slice(0,e.indexOf(":")).trim();null==n[t]&&lr(r,t,"")}else for(let e in t)null==n[e]&&lr(r,e,"")}for(let e in n)"display"===e&&(l=!0),lr(r,e,n[e])}else if(i){if(t!==n){let e=r[i7];e&&(n+=";"+e),r.cssText=n,l=lt.test(n)}}else t&&e.removeAttribute("style");i8 in e&&(e[i8]=l?r.display:"",e[i5]&&(r.display="none"))}(e,n,r):m(t)?g(t)||function(e,t,n,r,i=null){let l=e[lc]||(e[lc]={}),s=l[t];if(r&&s)s.value=r;else{let[n,o]=function(e){let t;if(lu.test(e)){let n;for(t={};n=e.match(lu);)e=e.slice(0,e.length-n[0].length),t[n[0].toLowerCase()]=!0}return[":"===e[2]?e.slice(3):H(e.slice(2)),t]}(t);r?la(e,n,l[t]=function(e,t){let n=e=>{if(e._vts){if(e._vts<=n.attached)return}else e._vts=Date.now();tF(function(e,t){if(!x(t))return t;{let n=e.stopImmediatePropagation;return e.stopImmediatePropagation=()=>{n.call(e),e._stopped=!0},t.map(e=>t=>!t._stopped&&e&&e(t))}}(e,n.value),t,5,[e])};return n.value=e,n.attached=lh(),n}(r,i),o):s&&(!function(e,t,n,r){e.removeEventListener(t,n,r)}(e,n,s,o),l[t]=void 0)}}(e,t,0,r,l):("."===t[0]?(t=t.slice(1),0):"^"===t[0]?(t=t.slice(1),1):!function(e,t,n,r){if(r)return!!("innerHTML"===t||"textContent"===t||t in e&&lf(t)&&E(n));if("spellcheck"===t||"draggable"===t||"translate"===t||"form"===t||"list"===t&&"INPUT"===e.tagName||"type"===t&&"TEXTAREA"===e.tagName)return!1;if("width"===t||"height"===t){let t=e.tagName;if("IMG"===t||"VIDEO"===t||"CANVAS"===t||"SOURCE"===t)return!1}return!(lf(t)&&A(n))&&t in e}(e,t,r,s))?("true-value"===t?e._trueValue=r:"false-value"===t&&(e._falseValue=r),lo(e,t,r,s)):(!function(e,t,n,r){if("innerHTML"===t||"textContent"===t){if(null==n)return;e[t]=n;return}let i=e.tagName;if("value"===t&&"PROGRESS"!==i&&!i.includes("-")){let r="OPTION"===i?e.getAttribute("value")||"":e.value,l=null==n?"":String(n);r===l&&"_value"in e||(e.value=l),null==n&&e.removeAttribute(t),e._value=n;return}let l=!1;if(""===n||null==n){let r=typeof e[t];if("boolean"===r){var s;n=!!(s=n)||""===s}else null==n&&"string"===r?(n="",l=!0):"number"===r&&(n=0,l=!0)}try{e[t]=n}catch(e){}l&&e.removeAttribute(t)}(e,t,r),e.tagName.includes("-")||"value"!==t&&"checked"!==t&&"selected"!==t||lo(e,t,r,s,l,"value"!==t))}},{insert:(e,t,n)=>{t.insertBefore(e,n||null)},remove:e=>{let t=e.parentNode;t&&t.removeChild(e)},createElement:(e,t,n,r)=>{let i="svg"===t?iB.createElementNS("http://www.w3.org/2000/svg",e):"mathml"===t?iB.createElementNS("http://www.w3.org/1998/Math/MathML",e):n?iB.createElement(e,{is:n}):iB.createElement(e);return"select"===e&&r&&null!=r.multiple&&i.setAttribute("multiple",r.multiple),i},createText:e=>iB.createTextNode(e),createComment:e=>iB.createComment(e),setText:(e,t)=>{e.nodeValue=t},setElementText:(e,t)=>{e.textContent=t},parentNode:e=>e.parentNode,nextSibling:e=>e.nextSibling,querySelector:e=>iB.querySelector(e),setScopeId(e,t){e.setAttribute(t,"")},insertStaticContent(e,t,n,r,i,l){let s=n?n.previousSibling:t.lastChild;if(i&&(i===l||i.nextSibling))for(;t.insertBefore(i.cloneNode(!0),n),i!==l&&(i=i.nextSibling););else{iU.innerHTML="svg"===r?`<svg>${e}</svg>`:"mathml"===r?`<math>${e}</math>`:e;let i=iU.content;if("svg"===r||"mathml"===r){let e=i.firstChild;for(;e.firstChild;)i.appendChild(e.firstChild);i.removeChild(e)}t.insertBefore(i,n)}return[s?s.nextSibling:t.firstChild,n?n.previousSibling:t.lastChild]}}),lH=!1;function lq(){return a=lH?a:rE(lj),lH=!0,a}let lW=(...e)=>{(a||(a=rA(lj))).render(...e)},lK=(...e)=>{lq().hydrate(...e)};function lz(e){return e instanceof SVGElement?"svg":"function"==typeof MathMLElement&&e instanceof MathMLElement?"mathml":void 0}function lG(e){return A(e)?document.querySelector(e):e}let lJ=Symbol(""),lX=Symbol(""),lQ=Symbol(""),lZ=Symbol(""),lY=Symbol(""),l0=Symbol(""),l1=Symbol(""),l2=Symbol(""),l3=Symbol(""),l6=Symbol(""),l4=Symbol(""),l8=Symbol(""),l5=Symbol(""),l9=Symbol(""),l7=Symbol(""),se=Symbol(""),st=Symbol(""),sn=Symbol(""),sr=Symbol(""),si=Symbol(""),sl=Symbol(""),ss=Symbol(""),so=Symbol(""),sa=Symbol(""),sc=Symbol(""),su=Symbol(""),sd=Symbol(""),sp=Symbol(""),sh=Symbol(""),sf=Symbol(""),sm=Symbol(""),sg=Symbol(""),sy=Symbol(""),sv=Symbol(""),sb=Symbol(""),s_=Symbol(""),sS=Symbol(""),sx=Symbol(""),sC=Symbol(""),sk={[lJ]:"Fragment",[lX]:"Teleport",[lQ]:"Suspense",[lZ]:"KeepAlive",[lY]:"BaseTransition",[l0]:"openBlock",[l1]:"createBlock",[l2]:"createElementBlock",[l3]:"createVNode",[l6]:"createElementVNode",[l4]:"createCommentVNode",[l8]:"createTextVNode",[l5]:"createStaticVNode",[l9]:"resolveComponent",[l7]:"resolveDynamicComponent",[se]:"resolveDirective",[st]:"resolveFilter",[sn]:"withDirectives",[sr]:"renderList",[si]:"renderSlot",[sl]:"createSlots",[ss]:"toDisplayString",[so]:"mergeProps",[sa]:"normalizeClass",[sc]:"normalizeStyle",[su]:"normalizeProps",[sd]:"guardReactiveProps",[sp]:"toHandlers",[sh]:"camelize",[sf]:"capitalize",[sm]:"toHandlerKey",[sg]:"setBlockTracking",[sy]:"pushScopeId",[sv]:"popScopeId",[sb]:"withCtx",[s_]:"unref",[sS]:"isRef",[sx]:"withMemo",[sC]:"isMemoSame"},sT={start:{line:1,column:1,offset:0},end:{line:1,column:1,offset:0},source:""};function sw(e,t,n,r,i,l,s,o=!1,a=!1,c=!1,u=sT){return e&&(o?(e.helper(l0),e.helper(e.inSSR||c?l1:l2)):e.helper(e.inSSR||c?l3:l6),s&&e.helper(sn)),{type:13,tag:t,props:n,children:r,patchFlag:i,dynamicProps:l,directives:s,isBlock:o,disableTracking:a,isComponent:c,loc:u}}function sE(e,t=sT){return{type:17,loc:t,elements:e}}function sA(e,t=sT){return{type:15,loc:t,properties:e}}function sN(e,t){return{type:16,loc:sT,key:A(e)?sI(e,!0):e,value:t}}function sI(e,t=!1,n=sT,r=0){return{type:4,loc:n,content:e,isStatic:t,constType:t?3:r}}function sR(e,t=sT){return{type:8,loc:t,children:e}}function sO(e,t=[],n=sT){return{type:14,loc:n,callee:e,arguments:t}}function sL(e,t,n=!1,r=!1,i=sT){return{type:18,params:e,returns:t,newline:n,isSlot:r,loc:i}}function sM(e,t,n,r=!0){return{type:19,test:e,consequent:t,alternate:n,newline:r,loc:sT}}function s$(e,{helper:t,removeHelper:n,inSSR:r}){if(!e.isBlock){var i,l;e.isBlock=!0,n((i=e.isComponent,r||i?l3:l6)),t(l0),t((l=e.isComponent,r||l?l1:l2))}}let sP=new Uint8Array([123,123]),sF=new Uint8Array([125,125]);function sD(e){return e>=97&&e<=122||e>=65&&e<=90}function sV(e){return 32===e||10===e||9===e||12===e||13===e}function sB(e){return 47===e||62===e||sV(e)}function sU(e){let t=new Uint8Array(e.length);for(let n=0;n<e.length;n++)t[n]=e.charCodeAt(n);return t}let sj={Cdata:new Uint8Array([67,68,65,84,65,91]),CdataEnd:new Uint8Array([93,93,62]),CommentEnd:new Uint8Array([45,45,62]),ScriptEnd:new Uint8Array([60,47,115,99,114,105,112,116]),StyleEnd:new Uint8Array([60,47,115,116,121,108,101]),TitleEnd:new Uint8Array([60,47,116,105,116,108,101]),TextareaEnd:new Uint8Array([60,47,116,101,120,116,97,114,101,97])};function sH(e){throw e}function sq(e){}function sW(e,t,n,r){let i=SyntaxError(String(`https://vuejs.org/error-reference/#compiler-${e}`));return i.code=e,i.loc=t,i}let sK=e=>4===e.type&&e.isStatic;function sz(e){switch(e){case"Teleport":case"teleport":return lX;case"Suspense":case"suspense":return lQ;case"KeepAlive":case"keep-alive":return lZ;case"BaseTransition":case"base-transition":return lY}}let sG=/^\d|[^\$\w\xA0-\uFFFF]/,sJ=e=>!sG.test(e),sX=/[A-Za-z_$\xA0-\uFFFF]/,sQ=/[\.\?\w$\xA0-\uFFFF]/,sZ=/\s+[.[]\s*|\s*[.[]\s+/g,sY=e=>4===e.type?e.content:e.loc.source,s0=e=>{let t=sY(e).trim().replace(sZ,e=>e.trim()),n=0,r=[],i=0,l=0,s=null;for(let e=0;e<t.length;e++){let o=t.charAt(e);switch(n){case 0:if("["===o)r.push(n),n=1,i++;else if("("===o)r.push(n),n=2,l++;else if(!(0===e?sX:sQ).test(o))return!1;break;case 1:"'"===o||'"'===o||"`"===o?(r.push(n),n=3,s=o):"["===o?i++:"]"!==o||--i||(n=r.pop());break;case 2:if("'"===o||'"'===o||"`"===o)r.push(n),n=3,s=o;else if("("===o)l++;else if(")"===o){if(e===t.length-1)return!1;--l||(n=r.pop())}break;case 3:o===s&&(n=r.pop(),s=null)}}return!i&&!l},s1=/^\s*(async\s*)?(\([^)]*?\)|[\w$_]+)\s*(:[^=]+)?=>|^\s*(async\s+)?function(?:\s+[\w$]+)?\s*\(/,s2=e=>s1.test(sY(e));function s3(e,t,n=!1){for(let r=0;r<e.props.length;r++){let i=e.props[r];if(7===i.type&&(n||i.exp)&&(A(t)?i.name===t:t.test(i.name)))return i}}function s6(e,t,n=!1,r=!1){for(let i=0;i<e.props.length;i++){let l=e.props[i];if(6===l.type){if(n)continue;if(l.name===t&&(l.value||r))return l}else if("bind"===l.name&&(l.exp||r)&&s4(l.arg,t))return l}}function s4(e,t){return!!(e&&sK(e)&&e.content===t)}function s8(e){return 5===e.type||2===e.type}function s5(e){return 7===e.type&&"slot"===e.name}function s9(e){return 1===e.type&&3===e.tagType}function s7(e){return 1===e.type&&2===e.tagType}let oe=new Set([su,sd]);function ot(e,t,n){let r,i;let l=13===e.type?e.props:e.arguments[2],s=[];if(l&&!A(l)&&14===l.type){let e=function e(t,n=[]){if(t&&!A(t)&&14===t.type){let r=t.callee;if(!A(r)&&oe.has(r))return e(t.arguments[0],n.concat(t))}return[t,n]}(l);l=e[0],i=(s=e[1])[s.length-1]}if(null==l||A(l))r=sA([t]);else if(14===l.type){let e=l.arguments[0];A(e)||15!==e.type?l.callee===sp?r=sO(n.helper(so),[sA([t]),l]):l.arguments.unshift(sA([t])):on(t,e)||e.properties.unshift(t),r||(r=l)}else 15===l.type?(on(t,l)||l.properties.unshift(t),r=l):(r=sO(n.helper(so),[sA([t]),l]),i&&i.callee===sd&&(i=s[s.length-2]));13===e.type?i?i.arguments[0]=r:e.props=r:i?i.arguments[0]=r:e.arguments[2]=r}function on(e,t){let n=!1;if(4===e.key.type){let r=e.key.content;n=t.properties.some(e=>4===e.key.type&&e.key.content===r)}return n}function or(e,t){return`_${t}_${e.replace(/[^\w]/g,(t,n)=>"-"===t?"_":e.charCodeAt(n).toString())}`}let oi=/([\s\S]*?)\s+(?:in|of)\s+(\S[\s\S]*)/,ol={parseMode:"base",ns:0,delimiters:["{{","}}"],getNamespace:()=>0,isVoidTag:f,isPreTag:f,isCustomElement:f,onError:sH,onWarn:sq,comments:!1,prefixIdentifiers:!1},os=ol,oo=null,oa="",oc=null,ou=null,od="",op=-1,oh=-1,of=0,om=!1,og=null,oy=[],ov=new class{constructor(e,t){this.stack=e,this.cbs=t,this.state=1,this.buffer="",this.sectionStart=0,this.index=0,this.entityStart=0,this.baseState=1,this.inRCDATA=!1,this.inXML=!1,this.inVPre=!1,this.newlines=[],this.mode=0,this.delimiterOpen=sP,this.delimiterClose=sF,this.delimiterIndex=-1,this.currentSequence=void 0,this.sequenceIndex=0}get inSFCRoot(){return 2===this.mode&&0===this.stack.length}reset(){this.state=1,this.mode=0,this.buffer="",this.sectionStart=0,this.index=0,this.baseState=1,this.inRCDATA=!1,this.currentSequence=void 0,this.newlines.length=0,this.delimiterOpen=sP,this.delimiterClose=sF}getPos(e){let t=1,n=e+1;for(let r=this.newlines.length-1;r>=0;r--){let i=this.newlines[r];if(e>i){t=r+2,n=e-i;break}}return{column:n,line:t,offset:e}}peek(){return this.buffer.charCodeAt(this.index+1)}stateText(e){60===e?(this.index>this.sectionStart&&this.cbs.ontext(this.sectionStart,this.index),this.state=5,this.sectionStart=this.index):this.inVPre||e!==this.delimiterOpen[0]||(this.state=2,this.delimiterIndex=0,this.stateInterpolationOpen(e))}stateInterpolationOpen(e){if(e===this.delimiterOpen[this.delimiterIndex]){if(this.delimiterIndex===this.delimiterOpen.length-1){let e=this.index+1-this.delimiterOpen.length;e>this.sectionStart&&this.cbs.ontext(this.sectionStart,e),this.state=3,this.sectionStart=e}else this.delimiterIndex++}else this.inRCDATA?(this.state=32,this.stateInRCDATA(e)):(this.state=1,this.stateText(e))}stateInterpolation(e){e===this.delimiterClose[0]&&(this.state=4,this.delimiterIndex=0,this.stateInterpolationClose(e))}stateInterpolationClose(e){e===this.delimiterClose[this.delimiterIndex]?this.delimiterIndex===this.delimiterClose.length-1?(this.cbs.oninterpolation(this.sectionStart,this.index+1),this.inRCDATA?this.state=32:this.state=1,this.sectionStart=this.index+1):this.delimiterIndex++:(this.state=3,this.stateInterpolation(e))}stateSpecialStartSequence(e){let t=this.sequenceIndex===this.currentSequence.length;if(t?sB(e):(32|e)===this.currentSequence[this.sequenceIndex]){if(!t){this.sequenceIndex++;return}}else this.inRCDATA=!1;this.sequenceIndex=0,this.state=6,this.stateInTagName(e)}stateInRCDATA(e){if(this.sequenceIndex===this.currentSequence.length){if(62===e||sV(e)){let t=this.index-this.currentSequence.length;if(this.sectionStart<t){let e=this.index;this.index=t,this.cbs.ontext(this.sectionStart,t),this.index=e}this.sectionStart=t+2,this.stateInClosingTagName(e),this.inRCDATA=!1;return}this.sequenceIndex=0}(32|e)===this.currentSequence[this.sequenceIndex]?this.sequenceIndex+=1:0===this.sequenceIndex?this.currentSequence!==sj.TitleEnd&&(this.currentSequence!==sj.TextareaEnd||this.inSFCRoot)?this.fastForwardTo(60)&&(this.sequenceIndex=1):e===this.delimiterOpen[0]&&(this.state=2,this.delimiterIndex=0,this.stateInterpolationOpen(e)):this.sequenceIndex=Number(60===e)}stateCDATASequence(e){e===sj.Cdata[this.sequenceIndex]?++this.sequenceIndex===sj.Cdata.length&&(this.state=28,this.currentSequence=sj.CdataEnd,this.sequenceIndex=0,this.sectionStart=this.index+1):(this.sequenceIndex=0,this.state=23,this.stateInDeclaration(e))}fastForwardTo(e){for(;++this.index<this.buffer.length;){let t=this.buffer.charCodeAt(this.index);if(10===t&&this.newlines.push(this.index),t===e)return!0}return this.index=this.buffer.length-1,!1}stateInCommentLike(e){e===this.currentSequence[this.sequenceIndex]?++this.sequenceIndex===this.currentSequence.length&&(this.currentSequence===sj.CdataEnd?this.cbs.oncdata(this.sectionStart,this.index-2):this.cbs.oncomment(this.sectionStart,this.index-2),this.sequenceIndex=0,this.sectionStart=this.index+1,this.state=1):0===this.sequenceIndex?this.fastForwardTo(this.currentSequence[0])&&(this.sequenceIndex=1):e!==this.currentSequence[this.sequenceIndex-1]&&(this.sequenceIndex=0)}startSpecial(e,t){this.enterRCDATA(e,t),this.state=31}enterRCDATA(e,t){this.inRCDATA=!0,this.currentSequence=e,this.sequenceIndex=t}stateBeforeTagName(e){33===e?(this.state=22,this.sectionStart=this.index+1):63===e?(this.state=24,this.sectionStart=this.index+1):sD(e)?(this.sectionStart=this.index,0===this.mode?this.state=6:this.inSFCRoot?this.state=34:this.inXML?this.state=6:116===e?this.state=30:this.state=115===e?29:6):47===e?this.state=8:(this.state=1,this.stateText(e))}stateInTagName(e){sB(e)&&this.handleTagName(e)}stateInSFCRootTagName(e){if(sB(e)){let t=this.buffer.slice(this.sectionStart,this.index);"template"!==t&&this.enterRCDATA(sU("</"+t),0),this.handleTagName(e)}}handleTagName(e){this.cbs.onopentagname(this.sectionStart,this.index),this.sectionStart=-1,this.state=11,this.stateBeforeAttrName(e)}stateBeforeClosingTagName(e){sV(e)||(62===e?(this.state=1,this.sectionStart=this.index+1):(this.state=sD(e)?9:27,this.sectionStart=this.index))}stateInClosingTagName(e){(62===e||sV(e))&&(this.cbs.onclosetag(this.sectionStart,this.index),this.sectionStart=-1,this.state=10,this.stateAfterClosingTagName(e))}stateAfterClosingTagName(e){62===e&&(this.state=1,this.sectionStart=this.index+1)}stateBeforeAttrName(e){62===e?(this.cbs.onopentagend(this.index),this.inRCDATA?this.state=32:this.state=1,this.sectionStart=this.index+1):47===e?this.state=7:60===e&&47===this.peek()?(this.cbs.onopentagend(this.index),this.state=5,this.sectionStart=this.index):sV(e)||this.handleAttrStart(e)}handleAttrStart(e){118===e&&45===this.peek()?(this.state=13,this.sectionStart=this.index):46===e||58===e||64===e||35===e?(this.cbs.ondirname(this.index,this.index+1),this.state=14,this.sectionStart=this.index+1):(this.state=12,this.sectionStart=this.index)}stateInSelfClosingTag(e){62===e?(this.cbs.onselfclosingtag(this.index),this.state=1,this.sectionStart=this.index+1,this.inRCDATA=!1):sV(e)||(this.state=11,this.stateBeforeAttrName(e))}stateInAttrName(e){(61===e||sB(e))&&(this.cbs.onattribname(this.sectionStart,this.index),this.handleAttrNameEnd(e))}stateInDirName(e){61===e||sB(e)?(this.cbs.ondirname(this.sectionStart,this.index),this.handleAttrNameEnd(e)):58===e?(this.cbs.ondirname(this.sectionStart,this.index),this.state=14,this.sectionStart=this.index+1):46===e&&(this.cbs.ondirname(this.sectionStart,this.index),this.state=16,this.sectionStart=this.index+1)}stateInDirArg(e){61===e||sB(e)?(this.cbs.ondirarg(this.sectionStart,this.index),this.handleAttrNameEnd(e)):91===e?this.state=15:46===e&&(this.cbs.ondirarg(this.sectionStart,this.index),this.state=16,this.sectionStart=this.index+1)}stateInDynamicDirArg(e){93===e?this.state=14:(61===e||sB(e))&&(this.cbs.ondirarg(this.sectionStart,this.index+1),this.handleAttrNameEnd(e))}stateInDirModifier(e){61===e||sB(e)?(this.cbs.ondirmodifier(this.sectionStart,this.index),this.handleAttrNameEnd(e)):46===e&&(this.cbs.ondirmodifier(this.sectionStart,this.index),this.sectionStart=this.index+1)}handleAttrNameEnd(e){this.sectionStart=this.index,this.state=17,this.cbs.onattribnameend(this.index),this.stateAfterAttrName(e)}stateAfterAttrName(e){61===e?this.state=18:47===e||62===e?(this.cbs.onattribend(0,this.sectionStart),this.sectionStart=-1,this.state=11,this.stateBeforeAttrName(e)):sV(e)||(this.cbs.onattribend(0,this.sectionStart),this.handleAttrStart(e))}stateBeforeAttrValue(e){34===e?(this.state=19,this.sectionStart=this.index+1):39===e?(this.state=20,this.sectionStart=this.index+1):sV(e)||(this.sectionStart=this.index,this.state=21,this.stateInAttrValueNoQuotes(e))}handleInAttrValue(e,t){(e===t||this.fastForwardTo(t))&&(this.cbs.onattribdata(this.sectionStart,this.index),this.sectionStart=-1,this.cbs.onattribend(34===t?3:2,this.index+1),this.state=11)}stateInAttrValueDoubleQuotes(e){this.handleInAttrValue(e,34)}stateInAttrValueSingleQuotes(e){this.handleInAttrValue(e,39)}stateInAttrValueNoQuotes(e){sV(e)||62===e?(this.cbs.onattribdata(this.sectionStart,this.index),this.sectionStart=-1,this.cbs.onattribend(1,this.index),this.state=11,this.stateBeforeAttrName(e)):(39===e||60===e||61===e||96===e)&&this.cbs.onerr(18,this.index)}stateBeforeDeclaration(e){91===e?(this.state=26,this.sequenceIndex=0):this.state=45===e?25:23}stateInDeclaration(e){(62===e||this.fastForwardTo(62))&&(this.state=1,this.sectionStart=this.index+1)}stateInProcessingInstruction(e){(62===e||this.fastForwardTo(62))&&(this.cbs.onprocessinginstruction(this.sectionStart,this.index),this.state=1,this.sectionStart=this.index+1)}stateBeforeComment(e){45===e?(this.state=28,this.currentSequence=sj.CommentEnd,this.sequenceIndex=2,this.sectionStart=this.index+1):this.state=23}stateInSpecialComment(e){(62===e||this.fastForwardTo(62))&&(this.cbs.oncomment(this.sectionStart,this.index),this.state=1,this.sectionStart=this.index+1)}stateBeforeSpecialS(e){e===sj.ScriptEnd[3]?this.startSpecial(sj.ScriptEnd,4):e===sj.StyleEnd[3]?this.startSpecial(sj.StyleEnd,4):(this.state=6,this.stateInTagName(e))}stateBeforeSpecialT(e){e===sj.TitleEnd[3]?this.startSpecial(sj.TitleEnd,4):e===sj.TextareaEnd[3]?this.startSpecial(sj.TextareaEnd,4):(this.state=6,this.stateInTagName(e))}startEntity(){}stateInEntity(){}parse(e){for(this.buffer=e;this.index<this.buffer.length;){let e=this.buffer.charCodeAt(this.index);switch(10===e&&this.newlines.push(this.index),this.state){case 1:this.stateText(e);break;case 2:this.stateInterpolationOpen(e);break;case 3:this.stateInterpolation(e);break;case 4:this.stateInterpolationClose(e);break;case 31:this.stateSpecialStartSequence(e);break;case 32:this.stateInRCDATA(e);break;case 26:this.stateCDATASequence(e);break;case 19:this.stateInAttrValueDoubleQuotes(e);break;case 12:this.stateInAttrName(e);break;case 13:this.stateInDirName(e);break;case 14:this.stateInDirArg(e);break;case 15:this.stateInDynamicDirArg(e);break;case 16:this.stateInDirModifier(e);break;case 28:this.stateInCommentLike(e);break;case 27:this.stateInSpecialComment(e);break;case 11:this.stateBeforeAttrName(e);break;case 6:this.stateInTagName(e);break;case 34:this.stateInSFCRootTagName(e);break;case 9:this.stateInClosingTagName(e);break;case 5:this.stateBeforeTagName(e);break;case 17:this.stateAfterAttrName(e);break;case 20:this.stateInAttrValueSingleQuotes(e);break;case 18:this.stateBeforeAttrValue(e);break;case 8:this.stateBeforeClosingTagName(e);break;case 10:this.stateAfterClosingTagName(e);break;case 29:this.stateBeforeSpecialS(e);break;case 30:this.stateBeforeSpecialT(e);break;case 21:this.stateInAttrValueNoQuotes(e);break;case 7:this.stateInSelfClosingTag(e);break;case 23:this.stateInDeclaration(e);break;case 22:this.stateBeforeDeclaration(e);break;case 25:this.stateBeforeComment(e);break;case 24:this.stateInProcessingInstruction(e);break;case 33:this.stateInEntity()}this.index++}this.cleanup(),this.finish()}cleanup(){this.sectionStart!==this.index&&(1===this.state||32===this.state&&0===this.sequenceIndex?(this.cbs.ontext(this.sectionStart,this.index),this.sectionStart=this.index):(19===this.state||20===this.state||21===this.state)&&(this.cbs.onattribdata(this.sectionStart,this.index),this.sectionStart=this.index))}finish(){this.handleTrailingData(),this.cbs.onend()}handleTrailingData(){let e=this.buffer.length;this.sectionStart>=e||(28===this.state?this.currentSequence===sj.CdataEnd?this.cbs.oncdata(this.sectionStart,e):this.cbs.oncomment(this.sectionStart,e):6===this.state||11===this.state||18===this.state||17===this.state||12===this.state||13===this.state||14===this.state||15===this.state||16===this.state||20===this.state||19===this.state||21===this.state||9===this.state||this.cbs.ontext(this.sectionStart,e))}emitCodePoint(e,t){}}(oy,{onerr:oM,ontext(e,t){oC(oS(e,t),e,t)},ontextentity(e,t,n){oC(e,t,n)},oninterpolation(e,t){if(om)return oC(oS(e,t),e,t);let n=e+ov.delimiterOpen.length,r=t-ov.delimiterClose.length;for(;sV(oa.charCodeAt(n));)n++;for(;sV(oa.charCodeAt(r-1));)r--;let i=oS(n,r);i.includes("&")&&(i=os.decodeEntities(i,!1)),oI({type:5,content:oL(i,!1,oR(n,r)),loc:oR(e,t)})},onopentagname(e,t){let n=oS(e,t);oc={type:1,tag:n,ns:os.getNamespace(n,oy[0],os.ns),tagType:0,props:[],children:[],loc:oR(e-1,t),codegenNode:void 0}},onopentagend(e){ox(e)},onclosetag(e,t){let n=oS(e,t);if(!os.isVoidTag(n)){let r=!1;for(let e=0;e<oy.length;e++)if(oy[e].tag.toLowerCase()===n.toLowerCase()){r=!0,e>0&&oy[0].loc.start.offset;for(let n=0;n<=e;n++)ok(oy.shift(),t,n<e);break}r||oT(e,60)}},onselfclosingtag(e){let t=oc.tag;oc.isSelfClosing=!0,ox(e),oy[0]&&oy[0].tag===t&&ok(oy.shift(),e)},onattribname(e,t){ou={type:6,name:oS(e,t),nameLoc:oR(e,t),value:void 0,loc:oR(e)}},ondirname(e,t){let n=oS(e,t),r="."===n||":"===n?"bind":"@"===n?"on":"#"===n?"slot":n.slice(2);if(om||""===r)ou={type:6,name:n,nameLoc:oR(e,t),value:void 0,loc:oR(e)};else if(ou={type:7,name:r,rawName:n,exp:void 0,arg:void 0,modifiers:"."===n?["prop"]:[],loc:oR(e)},"pre"===r){om=ov.inVPre=!0,og=oc;let e=oc.props;for(let t=0;t<e.length;t++)7===e[t].type&&(e[t]=function(e){let t={type:6,name:e.rawName,nameLoc:oR(e.loc.start.offset,e.loc.start.offset+e.rawName.length),value:void 0,loc:e.loc};if(e.exp){let n=e.exp.loc;n.end.offset<e.loc.end.offset&&(n.start.offset--,n.start.column--,n.end.offset++,n.end.column++),t.value={type:2,content:e.exp.content,loc:n}}return t}(e[t]))}},ondirarg(e,t){if(e===t)return;let n=oS(e,t);if(om)ou.name+=n,oO(ou.nameLoc,t);else{let r="["!==n[0];ou.arg=oL(r?n:n.slice(1,-1),r,oR(e,t),r?3:0)}},ondirmodifier(e,t){let n=oS(e,t);if(om)ou.name+="."+n,oO(ou.nameLoc,t);else if("slot"===ou.name){let e=ou.arg;e&&(e.content+="."+n,oO(e.loc,t))}else ou.modifiers.push(n)},onattribdata(e,t){od+=oS(e,t),op<0&&(op=e),oh=t},onattribentity(e,t,n){od+=e,op<0&&(op=t),oh=n},onattribnameend(e){let t=oS(ou.loc.start.offset,e);7===ou.type&&(ou.rawName=t),oc.props.some(e=>(7===e.type?e.rawName:e.name)===t)},onattribend(e,t){oc&&ou&&(oO(ou.loc,t),0!==e&&(od.includes("&")&&(od=os.decodeEntities(od,!0)),6===ou.type?("class"===ou.name&&(od=oN(od).trim()),ou.value={type:2,content:od,loc:1===e?oR(op,oh):oR(op-1,oh+1)},ov.inSFCRoot&&"template"===oc.tag&&"lang"===ou.name&&od&&"html"!==od&&ov.enterRCDATA(sU("</template"),0)):(ou.exp=oL(od,!1,oR(op,oh),0,0),"for"===ou.name&&(ou.forParseResult=function(e){let t=e.loc,n=e.content,r=n.match(oi);if(!r)return;let[,i,l]=r,s=(e,n,r=!1)=>{let i=t.start.offset+n,l=i+e.length;return oL(e,!1,oR(i,l),0,r?1:0)},o={source:s(l.trim(),n.indexOf(l,i.length)),value:void 0,key:void 0,index:void 0,finalized:!1},a=i.trim().replace(o_,"").trim(),c=i.indexOf(a),u=a.match(ob);if(u){let e;a=a.replace(ob,"").trim();let t=u[1].trim();if(t&&(e=n.indexOf(t,c+a.length),o.key=s(t,e,!0)),u[2]){let r=u[2].trim();r&&(o.index=s(r,n.indexOf(r,o.key?e+t.length:c+a.length),!0))}}return a&&(o.value=s(a,c,!0)),o}(ou.exp)))),(7!==ou.type||"pre"!==ou.name)&&oc.props.push(ou)),od="",op=oh=-1},oncomment(e,t){os.comments&&oI({type:3,content:oS(e,t),loc:oR(e-4,t+3)})},onend(){let e=oa.length;for(let t=0;t<oy.length;t++)ok(oy[t],e-1),oy[t].loc.start.offset},oncdata(e,t){0!==oy[0].ns&&oC(oS(e,t),e,t)},onprocessinginstruction(e){(oy[0]?oy[0].ns:os.ns)===0&&oM(21,e-1)}}),ob=/,([^,\}\]]*)(?:,([^,\}\]]*))?$/,o_=/^\(|\)$/g;function oS(e,t){return oa.slice(e,t)}function ox(e){ov.inSFCRoot&&(oc.innerLoc=oR(e+1,e+1)),oI(oc);let{tag:t,ns:n}=oc;0===n&&os.isPreTag(t)&&of++,os.isVoidTag(t)?ok(oc,e):(oy.unshift(oc),(1===n||2===n)&&(ov.inXML=!0)),oc=null}function oC(e,t,n){{let t=oy[0]&&oy[0].tag;"script"!==t&&"style"!==t&&e.includes("&")&&(e=os.decodeEntities(e,!1))}let r=oy[0]||oo,i=r.children[r.children.length-1];i&&2===i.type?(i.content+=e,oO(i.loc,n)):r.children.push({type:2,content:e,loc:oR(t,n)})}function ok(e,t,n=!1){n?oO(e.loc,oT(t,60)):oO(e.loc,function(e,t){let n=e;for(;62!==oa.charCodeAt(n)&&n<oa.length-1;)n++;return n}(t,0)+1),ov.inSFCRoot&&(e.children.length?e.innerLoc.end=y({},e.children[e.children.length-1].loc.end):e.innerLoc.end=y({},e.innerLoc.start),e.innerLoc.source=oS(e.innerLoc.start.offset,e.innerLoc.end.offset));let{tag:r,ns:i}=e;!om&&("slot"===r?e.tagType=2:function({tag:e,props:t}){if("template"===e){for(let e=0;e<t.length;e++)if(7===t[e].type&&ow.has(t[e].name))return!0}return!1}(e)?e.tagType=3:function({tag:e,props:t}){var n;if(os.isCustomElement(e))return!1;if("component"===e||(n=e.charCodeAt(0))>64&&n<91||sz(e)||os.isBuiltInComponent&&os.isBuiltInComponent(e)||os.isNativeTag&&!os.isNativeTag(e))return!0;for(let e=0;e<t.length;e++){let n=t[e];if(6===n.type&&"is"===n.name&&n.value&&n.value.content.startsWith("vue:"))return!0}return!1}(e)&&(e.tagType=1)),ov.inRCDATA||(e.children=oA(e.children,e.tag)),0===i&&os.isPreTag(r)&&of--,og===e&&(om=ov.inVPre=!1,og=null),ov.inXML&&(oy[0]?oy[0].ns:os.ns)===0&&(ov.inXML=!1)}function oT(e,t){let n=e;for(;oa.charCodeAt(n)!==t&&n>=0;)n--;return n}let ow=new Set(["if","else","else-if","for","slot"]),oE=/\r\n/g;function oA(e,t){let n="preserve"!==os.whitespace,r=!1;for(let t=0;t<e.length;t++){let i=e[t];if(2===i.type){if(of)i.content=i.content.replace(oE,"\n");else if(function(e){for(let t=0;t<e.length;t++)if(!sV(e.charCodeAt(t)))return!1;return!0}(i.content)){let l=e[t-1]&&e[t-1].type,s=e[t+1]&&e[t+1].type;!l||!s||n&&(3===l&&(3===s||1===s)||1===l&&(3===s||1===s&&function(e){for(let t=0;t<e.length;t++){let n=e.charCodeAt(t);if(10===n||13===n)return!0}return!1}(i.content)))?(r=!0,e[t]=null):i.content=" "}else n&&(i.content=oN(i.content))}}if(of&&t&&os.isPreTag(t)){let t=e[0];t&&2===t.type&&(t.content=t.content.replace(/^\r?\n/,""))}return r?e.filter(Boolean):e}function oN(e){let t="",n=!1;for(let r=0;r<e.length;r++)sV(e.charCodeAt(r))?n||(t+=" ",n=!0):(t+=e[r],n=!1);return t}function oI(e){(oy[0]||oo).children.push(e)}function oR(e,t){return{start:ov.getPos(e),end:null==t?t:ov.getPos(t),source:null==t?t:oS(e,t)}}function oO(e,t){e.end=ov.getPos(t),e.source=oS(e.start.offset,t)}function oL(e,t=!1,n,r=0,i=0){return sI(e,t,n,r)}function oM(e,t,n){os.onError(sW(e,oR(t,t)))}function o$(e,t){let{children:n}=e;return 1===n.length&&1===t.type&&!s7(t)}function oP(e,t){let{constantCache:n}=t;switch(e.type){case 1:if(0!==e.tagType)return 0;let r=n.get(e);if(void 0!==r)return r;let i=e.codegenNode;if(13!==i.type||i.isBlock&&"svg"!==e.tag&&"foreignObject"!==e.tag&&"math"!==e.tag)return 0;if(void 0!==i.patchFlag)return n.set(e,0),0;{let r=3,c=oD(e,t);if(0===c)return n.set(e,0),0;c<r&&(r=c);for(let i=0;i<e.children.length;i++){let l=oP(e.children[i],t);if(0===l)return n.set(e,0),0;l<r&&(r=l)}if(r>1)for(let i=0;i<e.props.length;i++){let l=e.props[i];if(7===l.type&&"bind"===l.name&&l.exp){let i=oP(l.exp,t);if(0===i)return n.set(e,0),0;i<r&&(r=i)}}if(i.isBlock){var l,s,o,a;for(let t=0;t<e.props.length;t++)if(7===e.props[t].type)return n.set(e,0),0;t.removeHelper(l0),t.removeHelper((l=t.inSSR,s=i.isComponent,l||s?l1:l2)),i.isBlock=!1,t.helper((o=t.inSSR,a=i.isComponent,o||a?l3:l6))}return n.set(e,r),r}case 2:case 3:return 3;case 9:case 11:case 10:default:return 0;case 5:case 12:return oP(e.content,t);case 4:return e.constType;case 8:let c=3;for(let n=0;n<e.children.length;n++){let r=e.children[n];if(A(r)||N(r))continue;let i=oP(r,t);if(0===i)return 0;i<c&&(c=i)}return c}}let oF=new Set([sa,sc,su,sd]);function oD(e,t){let n=3,r=oV(e);if(r&&15===r.type){let{properties:e}=r;for(let r=0;r<e.length;r++){let i;let{key:l,value:s}=e[r],o=oP(l,t);if(0===o)return o;if(o<n&&(n=o),0===(i=4===s.type?oP(s,t):14===s.type?function e(t,n){if(14===t.type&&!A(t.callee)&&oF.has(t.callee)){let r=t.arguments[0];if(4===r.type)return oP(r,n);if(14===r.type)return e(r,n)}return 0}(s,t):0))return i;i<n&&(n=i)}}return n}function oV(e){let t=e.codegenNode;if(13===t.type)return t.props}function oB(e,t){t.currentNode=e;let{nodeTransforms:n}=t,r=[];for(let i=0;i<n.length;i++){let l=n[i](e,t);if(l&&(x(l)?r.push(...l):r.push(l)),!t.currentNode)return;e=t.currentNode}switch(e.type){case 3:t.ssr||t.helper(l4);break;case 5:t.ssr||t.helper(ss);break;case 9:for(let n=0;n<e.branches.length;n++)oB(e.branches[n],t);break;case 10:case 11:case 1:case 0:!function(e,t){let n=0,r=()=>{n--};for(;n<e.children.length;n++){let i=e.children[n];A(i)||(t.grandParent=t.parent,t.parent=e,t.childIndex=n,t.onNodeRemoved=r,oB(i,t))}}(e,t)}t.currentNode=e;let i=r.length;for(;i--;)r[i]()}function oU(e,t){let n=A(e)?t=>t===e:t=>e.test(t);return(e,r)=>{if(1===e.type){let{props:i}=e;if(3===e.tagType&&i.some(s5))return;let l=[];for(let s=0;s<i.length;s++){let o=i[s];if(7===o.type&&n(o.name)){i.splice(s,1),s--;let n=t(e,o,r);n&&l.push(n)}}return l}}}let oj="/*#__PURE__*/",oH=e=>`${sk[e]}: _${sk[e]}`;function oq(e,t,{helper:n,push:r,newline:i,isTS:l}){let s=n("component"===t?l9:se);for(let n=0;n<e.length;n++){let o=e[n],a=o.endsWith("__self");a&&(o=o.slice(0,-6)),r(`const ${or(o,t)} = ${s}(${JSON.stringify(o)}${a?", true":""})${l?"!":""}`),n<e.length-1&&i()}}function oW(e,t){let n=e.length>3;t.push("["),n&&t.indent(),oK(e,t,n),n&&t.deindent(),t.push("]")}function oK(e,t,n=!1,r=!0){let{push:i,newline:l}=t;for(let s=0;s<e.length;s++){let o=e[s];A(o)?i(o,-3):x(o)?oW(o,t):oz(o,t),s<e.length-1&&(n?(r&&i(","),l()):r&&i(", "))}}function oz(e,t){if(A(e)){t.push(e,-3);return}if(N(e)){t.push(t.helper(e));return}switch(e.type){case 1:case 9:case 11:case 12:oz(e.codegenNode,t);break;case 2:!function(e,t){t.push(JSON.stringify(e.content),-3,e)}(e,t);break;case 4:oG(e,t);break;case 5:!function(e,t){let{push:n,helper:r,pure:i}=t;i&&n(oj),n(`${r(ss)}(`),oz(e.content,t),n(")")}(e,t);break;case 8:oJ(e,t);break;case 3:!function(e,t){let{push:n,helper:r,pure:i}=t;i&&n(oj),n(`${r(l4)}(${JSON.stringify(e.content)})`,-3,e)}(e,t);break;case 13:!function(e,t){let n;let{push:r,helper:i,pure:l}=t,{tag:s,props:o,children:a,patchFlag:c,dynamicProps:u,directives:d,isBlock:p,disableTracking:h,isComponent:f}=e;c&&(n=String(c)),d&&r(i(sn)+"("),p&&r(`(${i(l0)}(${h?"true":""}), `),l&&r(oj),r(i(p?t.inSSR||f?l1:l2:t.inSSR||f?l3:l6)+"(",-2,e),oK(function(e){let t=e.length;for(;t--&&null==e[t];);return e.slice(0,t+1).map(e=>e||"null")}([s,o,a,n,u]),t),r(")"),p&&r(")"),d&&(r(", "),oz(d,t),r(")"))}(e,t);break;case 14:!function(e,t){let{push:n,helper:r,pure:i}=t,l=A(e.callee)?e.callee:r(e.callee);i&&n(oj),n(l+"(",-2,e),oK(e.arguments,t),n(")")}(e,t);break;case 15:!function(e,t){let{push:n,indent:r,deindent:i,newline:l}=t,{properties:s}=e;if(!s.length){n("{}",-2,e);return}let o=s.length>1;n(o?"{":"{ "),o&&r();for(let e=0;e<s.length;e++){let{key:r,value:i}=s[e];!function(e,t){let{push:n}=t;8===e.type?(n("["),oJ(e,t),n("]")):e.isStatic?n(sJ(e.content)?e.content:JSON.stringify(e.content),-2,e):n(`[${e.content}]`,-3,e)}(r,t),n(": "),oz(i,t),e<s.length-1&&(n(","),l())}o&&i(),n(o?"}":" }")}(e,t);break;case 17:oW(e.elements,t);break;case 18:!function(e,t){let{push:n,indent:r,deindent:i}=t,{params:l,returns:s,body:o,newline:a,isSlot:c}=e;c&&n(`_${sk[sb]}(`),n("(",-2,e),x(l)?oK(l,t):l&&oz(l,t),n(") => "),(a||o)&&(n("{"),r()),s?(a&&n("return "),x(s)?oW(s,t):oz(s,t)):o&&oz(o,t),(a||o)&&(i(),n("}")),c&&n(")")}(e,t);break;case 19:!function(e,t){let{test:n,consequent:r,alternate:i,newline:l}=e,{push:s,indent:o,deindent:a,newline:c}=t;if(4===n.type){let e=!sJ(n.content);e&&s("("),oG(n,t),e&&s(")")}else s("("),oz(n,t),s(")");l&&o(),t.indentLevel++,l||s(" "),s("? "),oz(r,t),t.indentLevel--,l&&c(),l||s(" "),s(": ");let u=19===i.type;!u&&t.indentLevel++,oz(i,t),!u&&t.indentLevel--,l&&a(!0)}(e,t);break;case 20:!function(e,t){let{push:n,helper:r,indent:i,deindent:l,newline:s}=t;n(`_cache[${e.index}] || (`),e.isVOnce&&(i(),n(`${r(sg)}(-1),`),s(),n("(")),n(`_cache[${e.index}] = `),oz(e.value,t),e.isVOnce&&(n(`).cacheIndex = ${e.index},`),s(),n(`${r(sg)}(1),`),s(),n(`_cache[${e.index}]`),l()),n(")")}(e,t);break;case 21:oK(e.body,t,!0,!1)}}function oG(e,t){let{content:n,isStatic:r}=e;t.push(r?JSON.stringify(n):n,-3,e)}function oJ(e,t){for(let n=0;n<e.children.length;n++){let r=e.children[n];A(r)?t.push(r,-3):oz(r,t)}}let oX=oU(/^(if|else|else-if)$/,(e,t,n)=>(function(e,t,n,r){if("else"!==t.name&&(!t.exp||!t.exp.content.trim())){let r=t.exp?t.exp.loc:e.loc;n.onError(sW(28,t.loc)),t.exp=sI("true",!1,r)}if("if"===t.name){let i=oQ(e,t),l={type:9,loc:e.loc,branches:[i]};if(n.replaceNode(l),r)return r(l,i,!0)}else{let i=n.parent.children,l=i.indexOf(e);for(;l-- >=-1;){let s=i[l];if(s&&3===s.type||s&&2===s.type&&!s.content.trim().length){n.removeNode(s);continue}if(s&&9===s.type){"else-if"===t.name&&void 0===s.branches[s.branches.length-1].condition&&n.onError(sW(30,e.loc)),n.removeNode();let i=oQ(e,t);s.branches.push(i);let l=r&&r(s,i,!1);oB(i,n),l&&l(),n.currentNode=null}else n.onError(sW(30,e.loc));break}}})(e,t,n,(e,t,r)=>{let i=n.parent.children,l=i.indexOf(e),s=0;for(;l-- >=0;){let e=i[l];e&&9===e.type&&(s+=e.branches.length)}return()=>{r?e.codegenNode=oZ(t,s,n):function(e){for(;;)if(19===e.type){if(19!==e.alternate.type)return e;e=e.alternate}else 20===e.type&&(e=e.value)}(e.codegenNode).alternate=oZ(t,s+e.branches.length-1,n)}}));function oQ(e,t){let n=3===e.tagType;return{type:10,loc:e.loc,condition:"else"===t.name?void 0:t.exp,children:n&&!s3(e,"for")?e.children:[e],userKey:s6(e,"key"),isTemplateIf:n}}function oZ(e,t,n){return e.condition?sM(e.condition,oY(e,t,n),sO(n.helper(l4),['""',"true"])):oY(e,t,n)}function oY(e,t,n){let{helper:r}=n,i=sN("key",sI(`${t}`,!1,sT,2)),{children:l}=e,s=l[0];if(1!==l.length||1!==s.type){if(1!==l.length||11!==s.type)return sw(n,r(lJ),sA([i]),l,64,void 0,void 0,!0,!1,!1,e.loc);{let e=s.codegenNode;return ot(e,i,n),e}}{let e=s.codegenNode,t=14===e.type&&e.callee===sx?e.arguments[1].returns:e;return 13===t.type&&s$(t,n),ot(t,i,n),e}}let o0=(e,t,n)=>{let{modifiers:r,loc:i}=e,l=e.arg,{exp:s}=e;if(s&&4===s.type&&!s.content.trim()&&(s=void 0),!s){if(4!==l.type||!l.isStatic)return n.onError(sW(52,l.loc)),{props:[sN(l,sI("",!0,i))]};o1(e),s=e.exp}return 4!==l.type?(l.children.unshift("("),l.children.push(') || ""')):l.isStatic||(l.content=`${l.content} || ""`),r.includes("camel")&&(4===l.type?l.isStatic?l.content=U(l.content):l.content=`${n.helperString(sh)}(${l.content})`:(l.children.unshift(`${n.helperString(sh)}(`),l.children.push(")"))),!n.inSSR&&(r.includes("prop")&&o2(l,"."),r.includes("attr")&&o2(l,"^")),{props:[sN(l,s)]}},o1=(e,t)=>{let n=e.arg,r=U(n.content);e.exp=sI(r,!1,n.loc)},o2=(e,t)=>{4===e.type?e.isStatic?e.content=t+e.content:e.content=`\`${t}\${${e.content}}\``:(e.children.unshift(`'${t}' + (`),e.children.push(")"))},o3=oU("for",(e,t,n)=>{let{helper:r,removeHelper:i}=n;return function(e,t,n,r){if(!t.exp){n.onError(sW(31,t.loc));return}let i=t.forParseResult;if(!i){n.onError(sW(32,t.loc));return}o6(i);let{addIdentifiers:l,removeIdentifiers:s,scopes:o}=n,{source:a,value:c,key:u,index:d}=i,p={type:11,loc:t.loc,source:a,valueAlias:c,keyAlias:u,objectIndexAlias:d,parseResult:i,children:s9(e)?e.children:[e]};n.replaceNode(p),o.vFor++;let h=r&&r(p);return()=>{o.vFor--,h&&h()}}(e,t,n,t=>{let l=sO(r(sr),[t.source]),s=s9(e),o=s3(e,"memo"),a=s6(e,"key",!1,!0);a&&7===a.type&&!a.exp&&o1(a);let c=a&&(6===a.type?a.value?sI(a.value.content,!0):void 0:a.exp),u=a&&c?sN("key",c):null,d=4===t.source.type&&t.source.constType>0,p=d?64:a?128:256;return t.codegenNode=sw(n,r(lJ),void 0,l,p,void 0,void 0,!0,!d,!1,e.loc),()=>{let a;let{children:p}=t,h=1!==p.length||1!==p[0].type,f=s7(e)?e:s&&1===e.children.length&&s7(e.children[0])?e.children[0]:null;if(f)a=f.codegenNode,s&&u&&ot(a,u,n);else if(h)a=sw(n,r(lJ),u?sA([u]):void 0,e.children,64,void 0,void 0,!0,void 0,!1);else{var m,g,y,b,_,S,x,C;a=p[0].codegenNode,s&&u&&ot(a,u,n),!d!==a.isBlock&&(a.isBlock?(i(l0),i((m=n.inSSR,g=a.isComponent,m||g?l1:l2))):i((y=n.inSSR,b=a.isComponent,y||b?l3:l6))),(a.isBlock=!d,a.isBlock)?(r(l0),r((_=n.inSSR,S=a.isComponent,_||S?l1:l2))):r((x=n.inSSR,C=a.isComponent,x||C?l3:l6))}if(o){let e=sL(o4(t.parseResult,[sI("_cached")]));e.body={type:21,body:[sR(["const _memo = (",o.exp,")"]),sR(["if (_cached",...c?[" && _cached.key === ",c]:[],` && ${n.helperString(sC)}(_cached, _memo)) return _cached`]),sR(["const _item = ",a]),sI("_item.memo = _memo"),sI("return _item")],loc:sT},l.arguments.push(e,sI("_cache"),sI(String(n.cached++)))}else l.arguments.push(sL(o4(t.parseResult),a,!0))}})});function o6(e,t){e.finalized||(e.finalized=!0)}function o4({value:e,key:t,index:n},r=[]){return function(e){let t=e.length;for(;t--&&!e[t];);return e.slice(0,t+1).map((e,t)=>e||sI("_".repeat(t+1),!1))}([e,t,n,...r])}let o8=sI("undefined",!1),o5=(e,t)=>{if(1===e.type&&(1===e.tagType||3===e.tagType)){let n=s3(e,"slot");if(n)return n.exp,t.scopes.vSlot++,()=>{t.scopes.vSlot--}}},o9=(e,t,n,r)=>sL(e,n,!1,!0,n.length?n[0].loc:r);function o7(e,t,n){let r=[sN("name",e),sN("fn",t)];return null!=n&&r.push(sN("key",sI(String(n),!0))),sA(r)}let ae=new WeakMap,at=(e,t)=>function(){let n,r,i,l,s;if(!(1===(e=t.currentNode).type&&(0===e.tagType||1===e.tagType)))return;let{tag:o,props:a}=e,c=1===e.tagType,u=c?function(e,t,n=!1){let{tag:r}=e,i=ai(r),l=s6(e,"is",!1,!0);if(l){if(i){let e;if(6===l.type?e=l.value&&sI(l.value.content,!0):(e=l.exp)||(e=sI("is",!1,l.arg.loc)),e)return sO(t.helper(l7),[e])}else 6===l.type&&l.value.content.startsWith("vue:")&&(r=l.value.content.slice(4))}let s=sz(r)||t.isBuiltInComponent(r);return s?(n||t.helper(s),s):(t.helper(l9),t.components.add(r),or(r,"component"))}(e,t):`"${o}"`,d=I(u)&&u.callee===l7,p=0,h=d||u===lX||u===lQ||!c&&("svg"===o||"foreignObject"===o||"math"===o);if(a.length>0){let r=an(e,t,void 0,c,d);n=r.props,p=r.patchFlag,l=r.dynamicPropNames;let i=r.directives;s=i&&i.length?sE(i.map(e=>(function(e,t){let n=[],r=ae.get(e);r?n.push(t.helperString(r)):(t.helper(se),t.directives.add(e.name),n.push(or(e.name,"directive")));let{loc:i}=e;if(e.exp&&n.push(e.exp),e.arg&&(e.exp||n.push("void 0"),n.push(e.arg)),Object.keys(e.modifiers).length){e.arg||(e.exp||n.push("void 0"),n.push("void 0"));let t=sI("true",!1,i);n.push(sA(e.modifiers.map(e=>sN(e,t)),i))}return sE(n,e.loc)})(e,t))):void 0,r.shouldUseBlock&&(h=!0)}if(e.children.length>0){if(u===lZ&&(h=!0,p|=1024),c&&u!==lX&&u!==lZ){let{slots:n,hasDynamicSlots:i}=function(e,t,n=o9){t.helper(sb);let{children:r,loc:i}=e,l=[],s=[],o=t.scopes.vSlot>0||t.scopes.vFor>0,a=s3(e,"slot",!0);if(a){let{arg:e,exp:t}=a;e&&!sK(e)&&(o=!0),l.push(sN(e||sI("default",!0),n(t,void 0,r,i)))}let c=!1,u=!1,d=[],p=new Set,h=0;for(let e=0;e<r.length;e++){let i,f,m,g;let y=r[e];if(!s9(y)||!(i=s3(y,"slot",!0))){3!==y.type&&d.push(y);continue}if(a){t.onError(sW(37,i.loc));break}c=!0;let{children:b,loc:_}=y,{arg:S=sI("default",!0),exp:x,loc:C}=i;sK(S)?f=S?S.content:"default":o=!0;let k=s3(y,"for"),T=n(x,k,b,_);if(m=s3(y,"if"))o=!0,s.push(sM(m.exp,o7(S,T,h++),o8));else if(g=s3(y,/^else(-if)?$/,!0)){let n,i=e;for(;i--&&3===(n=r[i]).type;);if(n&&s9(n)&&s3(n,/^(else-)?if$/)){let e=s[s.length-1];for(;19===e.alternate.type;)e=e.alternate;e.alternate=g.exp?sM(g.exp,o7(S,T,h++),o8):o7(S,T,h++)}else t.onError(sW(30,g.loc))}else if(k){o=!0;let e=k.forParseResult;e?(o6(e),s.push(sO(t.helper(sr),[e.source,sL(o4(e),o7(S,T),!0)]))):t.onError(sW(32,k.loc))}else{if(f){if(p.has(f)){t.onError(sW(38,C));continue}p.add(f),"default"===f&&(u=!0)}l.push(sN(S,T))}}if(!a){let e=(e,t)=>sN("default",n(e,void 0,t,i));c?d.length&&d.some(e=>(function e(t){return 2!==t.type&&12!==t.type||(2===t.type?!!t.content.trim():e(t.content))})(e))&&(u?t.onError(sW(39,d[0].loc)):l.push(e(void 0,d))):l.push(e(void 0,r))}let f=o?2:!function e(t){for(let n=0;n<t.length;n++){let r=t[n];switch(r.type){case 1:if(2===r.tagType||e(r.children))return!0;break;case 9:if(e(r.branches))return!0;break;case 10:case 11:if(e(r.children))return!0}}return!1}(e.children)?1:3,m=sA(l.concat(sN("_",sI(f+"",!1))),i);return s.length&&(m=sO(t.helper(sl),[m,sE(s)])),{slots:m,hasDynamicSlots:o}}(e,t);r=n,i&&(p|=1024)}else if(1===e.children.length&&u!==lX){let n=e.children[0],i=n.type,l=5===i||8===i;l&&0===oP(n,t)&&(p|=1),r=l||2===i?n:e.children}else r=e.children}l&&l.length&&(i=function(e){let t="[";for(let n=0,r=e.length;n<r;n++)t+=JSON.stringify(e[n]),n<r-1&&(t+=", ");return t+"]"}(l)),e.codegenNode=sw(t,u,n,r,0===p?void 0:p,i,s,!!h,!1,c,e.loc)};function an(e,t,n=e.props,r,i,l=!1){let s;let{tag:o,loc:a,children:c}=e,u=[],d=[],p=[],h=c.length>0,f=!1,g=0,y=!1,b=!1,_=!1,S=!1,x=!1,C=!1,k=[],T=e=>{u.length&&(d.push(sA(ar(u),a)),u=[]),e&&d.push(e)},w=()=>{t.scopes.vFor>0&&u.push(sN(sI("ref_for",!0),sI("true")))},E=({key:e,value:n})=>{if(sK(e)){let l=e.content,s=m(l);s&&(!r||i)&&"onclick"!==l.toLowerCase()&&"onUpdate:modelValue"!==l&&!F(l)&&(S=!0),s&&F(l)&&(C=!0),s&&14===n.type&&(n=n.arguments[0]),20===n.type||(4===n.type||8===n.type)&&oP(n,t)>0||("ref"===l?y=!0:"class"===l?b=!0:"style"===l?_=!0:"key"===l||k.includes(l)||k.push(l),r&&("class"===l||"style"===l)&&!k.includes(l)&&k.push(l))}else x=!0};for(let i=0;i<n.length;i++){let s=n[i];if(6===s.type){let{loc:e,name:t,nameLoc:n,value:r}=s;if("ref"===t&&(y=!0,w()),"is"===t&&(ai(o)||r&&r.content.startsWith("vue:")))continue;u.push(sN(sI(t,!0,n),sI(r?r.content:"",!0,r?r.loc:e)))}else{let{name:n,arg:i,exp:c,loc:m,modifiers:y}=s,b="bind"===n,_="on"===n;if("slot"===n){r||t.onError(sW(40,m));continue}if("once"===n||"memo"===n||"is"===n||b&&s4(i,"is")&&ai(o)||_&&l)continue;if((b&&s4(i,"key")||_&&h&&s4(i,"vue:before-update"))&&(f=!0),b&&s4(i,"ref")&&w(),!i&&(b||_)){x=!0,c?b?(w(),T(),d.push(c)):T({type:14,loc:m,callee:t.helper(sp),arguments:r?[c]:[c,"true"]}):t.onError(sW(b?34:35,m));continue}b&&y.includes("prop")&&(g|=32);let S=t.directiveTransforms[n];if(S){let{props:n,needRuntime:r}=S(s,e,t);l||n.forEach(E),_&&i&&!sK(i)?T(sA(n,a)):u.push(...n),r&&(p.push(s),N(r)&&ae.set(s,r))}else!D(n)&&(p.push(s),h&&(f=!0))}}if(d.length?(T(),s=d.length>1?sO(t.helper(so),d,a):d[0]):u.length&&(s=sA(ar(u),a)),x?g|=16:(b&&!r&&(g|=2),_&&!r&&(g|=4),k.length&&(g|=8),S&&(g|=32)),!f&&(0===g||32===g)&&(y||C||p.length>0)&&(g|=512),!t.inSSR&&s)switch(s.type){case 15:let A=-1,I=-1,R=!1;for(let e=0;e<s.properties.length;e++){let t=s.properties[e].key;sK(t)?"class"===t.content?A=e:"style"===t.content&&(I=e):t.isHandlerKey||(R=!0)}let O=s.properties[A],L=s.properties[I];R?s=sO(t.helper(su),[s]):(O&&!sK(O.value)&&(O.value=sO(t.helper(sa),[O.value])),L&&(_||4===L.value.type&&"["===L.value.content.trim()[0]||17===L.value.type)&&(L.value=sO(t.helper(sc),[L.value])));break;case 14:break;default:s=sO(t.helper(su),[sO(t.helper(sd),[s])])}return{props:s,directives:p,patchFlag:g,dynamicPropNames:k,shouldUseBlock:f}}function ar(e){let t=new Map,n=[];for(let r=0;r<e.length;r++){let i=e[r];if(8===i.key.type||!i.key.isStatic){n.push(i);continue}let l=i.key.content,s=t.get(l);s?("style"===l||"class"===l||m(l))&&(17===s.value.type?s.value.elements.push(i.value):s.value=sE([s.value,i.value],s.loc)):(t.set(l,i),n.push(i))}return n}function ai(e){return"component"===e||"Component"===e}let al=(e,t)=>{if(s7(e)){let{children:n,loc:r}=e,{slotName:i,slotProps:l}=function(e,t){let n,r='"default"',i=[];for(let t=0;t<e.props.length;t++){let n=e.props[t];if(6===n.type)n.value&&("name"===n.name?r=JSON.stringify(n.value.content):(n.name=U(n.name),i.push(n)));else if("bind"===n.name&&s4(n.arg,"name")){if(n.exp)r=n.exp;else if(n.arg&&4===n.arg.type){let e=U(n.arg.content);r=n.exp=sI(e,!1,n.arg.loc)}}else"bind"===n.name&&n.arg&&sK(n.arg)&&(n.arg.content=U(n.arg.content)),i.push(n)}if(i.length>0){let{props:r,directives:l}=an(e,t,i,!1,!1);n=r,l.length&&t.onError(sW(36,l[0].loc))}return{slotName:r,slotProps:n}}(e,t),s=[t.prefixIdentifiers?"_ctx.$slots":"$slots",i,"{}","undefined","true"],o=2;l&&(s[2]=l,o=3),n.length&&(s[3]=sL([],n,!1,!1,r),o=4),t.scopeId&&!t.slotted&&(o=5),s.splice(o),e.codegenNode=sO(t.helper(si),s,r)}},as=(e,t,n,r)=>{let i;let{loc:l,modifiers:s,arg:o}=e;if(e.exp||s.length,4===o.type){if(o.isStatic){let e=o.content;e.startsWith("vue:")&&(e=`vnode-${e.slice(4)}`),i=sI(0!==t.tagType||e.startsWith("vnode")||!/[A-Z]/.test(e)?W(U(e)):`on:${e}`,!0,o.loc)}else i=sR([`${n.helperString(sm)}(`,o,")"])}else(i=o).children.unshift(`${n.helperString(sm)}(`),i.children.push(")");let a=e.exp;a&&!a.content.trim()&&(a=void 0);let c=n.cacheHandlers&&!a&&!n.inVOnce;if(a){let e=s0(a),t=!(e||s2(a)),n=a.content.includes(";");(t||c&&e)&&(a=sR([`${t?"$event":"(...args)"} => ${n?"{":"("}`,a,n?"}":")"]))}let u={props:[sN(i,a||sI("() => {}",!1,l))]};return r&&(u=r(u)),c&&(u.props[0].value=n.cache(u.props[0].value)),u.props.forEach(e=>e.key.isHandlerKey=!0),u},ao=(e,t)=>{if(0===e.type||1===e.type||11===e.type||10===e.type)return()=>{let n;let r=e.children,i=!1;for(let e=0;e<r.length;e++){let t=r[e];if(s8(t)){i=!0;for(let i=e+1;i<r.length;i++){let l=r[i];if(s8(l))n||(n=r[e]=sR([t],t.loc)),n.children.push(" + ",l),r.splice(i,1),i--;else{n=void 0;break}}}}if(i&&(1!==r.length||0!==e.type&&(1!==e.type||0!==e.tagType||e.props.find(e=>7===e.type&&!t.directiveTransforms[e.name]))))for(let e=0;e<r.length;e++){let n=r[e];if(s8(n)||8===n.type){let i=[];(2!==n.type||" "!==n.content)&&i.push(n),t.ssr||0!==oP(n,t)||i.push("1"),r[e]={type:12,content:n,loc:n.loc,codegenNode:sO(t.helper(l8),i)}}}}},aa=new WeakSet,ac=(e,t)=>{if(1===e.type&&s3(e,"once",!0)&&!aa.has(e)&&!t.inVOnce&&!t.inSSR)return aa.add(e),t.inVOnce=!0,t.helper(sg),()=>{t.inVOnce=!1;let e=t.currentNode;e.codegenNode&&(e.codegenNode=t.cache(e.codegenNode,!0))}},au=(e,t,n)=>{let r;let{exp:i,arg:l}=e;if(!i)return n.onError(sW(41,e.loc)),ad();let s=i.loc.source,o=4===i.type?i.content:s,a=n.bindingMetadata[s];if("props"===a||"props-aliased"===a)return i.loc,ad();if(!o.trim()||!s0(i))return n.onError(sW(42,i.loc)),ad();let c=l||sI("modelValue",!0),u=l?sK(l)?`onUpdate:${U(l.content)}`:sR(['"onUpdate:" + ',l]):"onUpdate:modelValue",d=n.isTS?"($event: any)":"$event";r=sR([`${d} => ((`,i,") = $event)"]);let p=[sN(c,e.exp),sN(u,r)];if(e.modifiers.length&&1===t.tagType){let t=e.modifiers.map(e=>(sJ(e)?e:JSON.stringify(e))+": true").join(", "),n=l?sK(l)?`${l.content}Modifiers`:sR([l,' + "Modifiers"']):"modelModifiers";p.push(sN(n,sI(`{ ${t} }`,!1,e.loc,2)))}return ad(p)};function ad(e=[]){return{props:e}}let ap=new WeakSet,ah=(e,t)=>{if(1===e.type){let n=s3(e,"memo");if(!(!n||ap.has(e)))return ap.add(e),()=>{let r=e.codegenNode||t.currentNode.codegenNode;r&&13===r.type&&(1!==e.tagType&&s$(r,t),e.codegenNode=sO(t.helper(sx),[n.exp,sL(void 0,r),"_cache",String(t.cached++)]))}}},af=Symbol(""),am=Symbol(""),ag=Symbol(""),ay=Symbol(""),av=Symbol(""),ab=Symbol(""),a_=Symbol(""),aS=Symbol(""),ax=Symbol(""),aC=Symbol("");!function(e){Object.getOwnPropertySymbols(e).forEach(t=>{sk[t]=e[t]})}({[af]:"vModelRadio",[am]:"vModelCheckbox",[ag]:"vModelText",[ay]:"vModelSelect",[av]:"vModelDynamic",[ab]:"withModifiers",[a_]:"withKeys",[aS]:"vShow",[ax]:"Transition",[aC]:"TransitionGroup"});let ak={parseMode:"html",isVoidTag:ea,isNativeTag:e=>el(e)||es(e)||eo(e),isPreTag:e=>"pre"===e,decodeEntities:function(e,t=!1){return(c||(c=document.createElement("div")),t)?(c.innerHTML=`<div foo="${e.replace(/"/g,"&quot;")}">`,c.children[0].getAttribute("foo")):(c.innerHTML=e,c.textContent)},isBuiltInComponent:e=>"Transition"===e||"transition"===e?ax:"TransitionGroup"===e||"transition-group"===e?aC:void 0,getNamespace(e,t,n){let r=t?t.ns:n;if(t&&2===r){if("annotation-xml"===t.tag){if("svg"===e)return 1;t.props.some(e=>6===e.type&&"encoding"===e.name&&null!=e.value&&("text/html"===e.value.content||"application/xhtml+xml"===e.value.content))&&(r=0)}else/^m(?:[ions]|text)$/.test(t.tag)&&"mglyph"!==e&&"malignmark"!==e&&(r=0)}else t&&1===r&&("foreignObject"===t.tag||"desc"===t.tag||"title"===t.tag)&&(r=0);if(0===r){if("svg"===e)return 1;if("math"===e)return 2}return r}},aT=(e,t)=>sI(JSON.stringify(er(e)),!1,t,3),aw=u("passive,once,capture"),aE=u("stop,prevent,self,ctrl,shift,alt,meta,exact,middle"),aA=u("left,right"),aN=u("onkeyup,onkeydown,onkeypress",!0),aI=(e,t,n,r)=>{let i=[],l=[],s=[];for(let n=0;n<t.length;n++){let r=t[n];aw(r)?s.push(r):aA(r)?sK(e)?aN(e.content)?i.push(r):l.push(r):(i.push(r),l.push(r)):aE(r)?l.push(r):i.push(r)}return{keyModifiers:i,nonKeyModifiers:l,eventOptionModifiers:s}},aR=(e,t)=>sK(e)&&"onclick"===e.content.toLowerCase()?sI(t,!0):4!==e.type?sR(["(",e,`) === "onClick" ? "${t}" : (`,e,")"]):e,aO=(e,t)=>{1===e.type&&0===e.tagType&&("script"===e.tag||"style"===e.tag)&&t.removeNode()},aL=[e=>{1===e.type&&e.props.forEach((t,n)=>{6===t.type&&"style"===t.name&&t.value&&(e.props[n]={type:7,name:"bind",arg:sI("style",!0,t.loc),exp:aT(t.value.content,t.loc),modifiers:[],loc:t.loc})})}],aM={cloak:()=>({props:[]}),html:(e,t,n)=>{let{exp:r,loc:i}=e;return r||n.onError(sW(53,i)),t.children.length&&(n.onError(sW(54,i)),t.children.length=0),{props:[sN(sI("innerHTML",!0,i),r||sI("",!0))]}},text:(e,t,n)=>{let{exp:r,loc:i}=e;return r||n.onError(sW(55,i)),t.children.length&&(n.onError(sW(56,i)),t.children.length=0),{props:[sN(sI("textContent",!0),r?oP(r,n)>0?r:sO(n.helperString(ss),[r],i):sI("",!0))]}},model:(e,t,n)=>{let r=au(e,t,n);if(!r.props.length||1===t.tagType)return r;e.arg&&n.onError(sW(58,e.arg.loc));let{tag:i}=t,l=n.isCustomElement(i);if("input"===i||"textarea"===i||"select"===i||l){let s=ag,o=!1;if("input"===i||l){let r=s6(t,"type");if(r){if(7===r.type)s=av;else if(r.value)switch(r.value.content){case"radio":s=af;break;case"checkbox":s=am;break;case"file":o=!0,n.onError(sW(59,e.loc))}}else t.props.some(e=>7===e.type&&"bind"===e.name&&(!e.arg||4!==e.arg.type||!e.arg.isStatic))&&(s=av)}else"select"===i&&(s=ay);o||(r.needRuntime=n.helper(s))}else n.onError(sW(57,e.loc));return r.props=r.props.filter(e=>!(4===e.key.type&&"modelValue"===e.key.content)),r},on:(e,t,n)=>as(e,t,n,t=>{let{modifiers:r}=e;if(!r.length)return t;let{key:i,value:l}=t.props[0],{keyModifiers:s,nonKeyModifiers:o,eventOptionModifiers:a}=aI(i,r,n,e.loc);if(o.includes("right")&&(i=aR(i,"onContextmenu")),o.includes("middle")&&(i=aR(i,"onMouseup")),o.length&&(l=sO(n.helper(ab),[l,JSON.stringify(o)])),s.length&&(!sK(i)||aN(i.content))&&(l=sO(n.helper(a_),[l,JSON.stringify(s)])),a.length){let e=a.map(q).join("");i=sK(i)?sI(`${i.content}${e}`,!0):sR(["(",i,`) + "${e}"`])}return{props:[sN(i,l)]}}),show:(e,t,n)=>{let{exp:r,loc:i}=e;return!r&&n.onError(sW(61,i)),{props:[],needRuntime:n.helper(aS)}}},a$=new WeakMap;function aP(e,t){let n;if(!A(e)){if(!e.nodeType)return h;e=e.innerHTML}let r=e,i=((n=a$.get(null!=t?t:d))||(n=Object.create(null),a$.set(null!=t?t:d,n)),n),l=i[r];if(l)return l;if("#"===e[0]){let t=document.querySelector(e);e=t?t.innerHTML:""}let s=y({hoistStatic:!0,onError:void 0,onWarn:h},t);s.isCustomElement||"undefined"==typeof customElements||(s.isCustomElement=e=>!!customElements.get(e));let{code:o}=function(e,t={}){return function(e,t={}){let n=t.onError||sH,r="module"===t.mode;!0===t.prefixIdentifiers?n(sW(47)):r&&n(sW(48)),t.cacheHandlers&&n(sW(49)),t.scopeId&&!r&&n(sW(50));let i=y({},t,{prefixIdentifiers:!1}),l=A(e)?function(e,t){if(ov.reset(),oc=null,ou=null,od="",op=-1,oh=-1,oy.length=0,oa=e,os=y({},ol),t){let e;for(e in t)null!=t[e]&&(os[e]=t[e])}ov.mode="html"===os.parseMode?1:"sfc"===os.parseMode?2:0,ov.inXML=1===os.ns||2===os.ns;let n=t&&t.delimiters;n&&(ov.delimiterOpen=sU(n[0]),ov.delimiterClose=sU(n[1]));let r=oo=function(e,t=""){return{type:0,source:t,children:e,helpers:new Set,components:[],directives:[],hoists:[],imports:[],cached:0,temps:0,codegenNode:void 0,loc:sT}}([],e);return ov.parse(oa),r.loc=oR(0,e.length),r.children=oA(r.children),oo=null,r}(e,i):e,[s,o]=[[ac,oX,ah,o3,al,at,o5,ao],{on:as,bind:o0,model:au}];return!function(e,t){let n=function(e,{filename:t="",prefixIdentifiers:n=!1,hoistStatic:r=!1,hmr:i=!1,cacheHandlers:l=!1,nodeTransforms:s=[],directiveTransforms:o={},transformHoist:a=null,isBuiltInComponent:c=h,isCustomElement:u=h,expressionPlugins:p=[],scopeId:f=null,slotted:m=!0,ssr:g=!1,inSSR:y=!1,ssrCssVars:b="",bindingMetadata:_=d,inline:S=!1,isTS:x=!1,onError:C=sH,onWarn:k=sq,compatConfig:T}){let w=t.replace(/\?.*$/,"").match(/([^/\\]+)\.\w+$/),E={filename:t,selfName:w&&q(U(w[1])),prefixIdentifiers:n,hoistStatic:r,hmr:i,cacheHandlers:l,nodeTransforms:s,directiveTransforms:o,transformHoist:a,isBuiltInComponent:c,isCustomElement:u,expressionPlugins:p,scopeId:f,slotted:m,ssr:g,inSSR:y,ssrCssVars:b,bindingMetadata:_,inline:S,isTS:x,onError:C,onWarn:k,compatConfig:T,root:e,helpers:new Map,components:new Set,directives:new Set,hoists:[],imports:[],constantCache:new WeakMap,temps:0,cached:0,identifiers:Object.create(null),scopes:{vFor:0,vSlot:0,vPre:0,vOnce:0},parent:null,grandParent:null,currentNode:e,childIndex:0,inVOnce:!1,helper(e){let t=E.helpers.get(e)||0;return E.helpers.set(e,t+1),e},removeHelper(e){let t=E.helpers.get(e);if(t){let n=t-1;n?E.helpers.set(e,n):E.helpers.delete(e)}},helperString:e=>`_${sk[E.helper(e)]}`,replaceNode(e){E.parent.children[E.childIndex]=E.currentNode=e},removeNode(e){let t=E.parent.children,n=e?t.indexOf(e):E.currentNode?E.childIndex:-1;e&&e!==E.currentNode?E.childIndex>n&&(E.childIndex--,E.onNodeRemoved()):(E.currentNode=null,E.onNodeRemoved()),E.parent.children.splice(n,1)},onNodeRemoved:h,addIdentifiers(e){},removeIdentifiers(e){},hoist(e){A(e)&&(e=sI(e)),E.hoists.push(e);let t=sI(`_hoisted_${E.hoists.length}`,!1,e.loc,2);return t.hoisted=e,t},cache:(e,t=!1)=>(function(e,t,n=!1){return{type:20,index:e,value:t,isVOnce:n,loc:sT}})(E.cached++,e,t)};return E}(e,t);oB(e,n),t.hoistStatic&&function e(t,n,r=!1){let{children:i}=t,l=i.length,s=0;for(let t=0;t<i.length;t++){let l=i[t];if(1===l.type&&0===l.tagType){let e=r?0:oP(l,n);if(e>0){if(e>=2){l.codegenNode.patchFlag=-1,l.codegenNode=n.hoist(l.codegenNode),s++;continue}}else{let e=l.codegenNode;if(13===e.type){let t=e.patchFlag;if((void 0===t||512===t||1===t)&&oD(l,n)>=2){let t=oV(l);t&&(e.props=n.hoist(t))}e.dynamicProps&&(e.dynamicProps=n.hoist(e.dynamicProps))}}}if(1===l.type){let t=1===l.tagType;t&&n.scopes.vSlot++,e(l,n),t&&n.scopes.vSlot--}else if(11===l.type)e(l,n,1===l.children.length);else if(9===l.type)for(let t=0;t<l.branches.length;t++)e(l.branches[t],n,1===l.branches[t].children.length)}if(s&&n.transformHoist&&n.transformHoist(i,n,t),s&&s===l&&1===t.type&&0===t.tagType&&t.codegenNode&&13===t.codegenNode.type&&x(t.codegenNode.children)){let e=n.hoist(sE(t.codegenNode.children));n.hmr&&(e.content=`[...${e.content}]`),t.codegenNode.children=e}}(e,n,o$(e,e.children[0])),t.ssr||function(e,t){let{helper:n}=t,{children:r}=e;if(1===r.length){let n=r[0];if(o$(e,n)&&n.codegenNode){let r=n.codegenNode;13===r.type&&s$(r,t),e.codegenNode=r}else e.codegenNode=n}else r.length>1&&(e.codegenNode=sw(t,n(lJ),void 0,e.children,64,void 0,void 0,!0,void 0,!1))}(e,n),e.helpers=new Set([...n.helpers.keys()]),e.components=[...n.components],e.directives=[...n.directives],e.imports=n.imports,e.hoists=n.hoists,e.temps=n.temps,e.cached=n.cached,e.transformed=!0}(l,y({},i,{nodeTransforms:[...s,...t.nodeTransforms||[]],directiveTransforms:y({},o,t.directiveTransforms||{})})),function(e,t={}){let n=function(e,{mode:t="function",prefixIdentifiers:n="module"===t,sourceMap:r=!1,filename:i="template.vue.html",scopeId:l=null,optimizeImports:s=!1,runtimeGlobalName:o="Vue",runtimeModuleName:a="vue",ssrRuntimeModuleName:c="vue/server-renderer",ssr:u=!1,isTS:d=!1,inSSR:p=!1}){let h={mode:t,prefixIdentifiers:n,sourceMap:r,filename:i,scopeId:l,optimizeImports:s,runtimeGlobalName:o,runtimeModuleName:a,ssrRuntimeModuleName:c,ssr:u,isTS:d,inSSR:p,source:e.source,code:"",column:1,line:1,offset:0,indentLevel:0,pure:!1,map:void 0,helper:e=>`_${sk[e]}`,push(e,t=-2,n){h.code+=e},indent(){f(++h.indentLevel)},deindent(e=!1){e?--h.indentLevel:f(--h.indentLevel)},newline(){f(h.indentLevel)}};function f(e){h.push("\n"+"  ".repeat(e),0)}return h}(e,t);t.onContextCreated&&t.onContextCreated(n);let{mode:r,push:i,prefixIdentifiers:l,indent:s,deindent:o,newline:a,scopeId:c,ssr:u}=n,d=Array.from(e.helpers),p=d.length>0,h=!l&&"module"!==r;(function(e,t){let{ssr:n,prefixIdentifiers:r,push:i,newline:l,runtimeModuleName:s,runtimeGlobalName:o,ssrRuntimeModuleName:a}=t,c=Array.from(e.helpers);if(c.length>0&&(i(`const _Vue = ${o}
+`,-1),e.hoists.length)){let e=[l3,l6,l4,l8,l5].filter(e=>c.includes(e)).map(oH).join(", ");i(`const { ${e} } = _Vue
+`,-1)}(function(e,t){if(!e.length)return;t.pure=!0;let{push:n,newline:r,helper:i,scopeId:l,mode:s}=t;r();for(let i=0;i<e.length;i++){let l=e[i];l&&(n(`const _hoisted_${i+1} = `),oz(l,t),r())}t.pure=!1})(e.hoists,t),l(),i("return ")})(e,n);let f=(u?["_ctx","_push","_parent","_attrs"]:["_ctx","_cache"]).join(", ");if(i(`function ${u?"ssrRender":"render"}(${f}) {`),s(),h&&(i("with (_ctx) {"),s(),p&&(i(`const { ${d.map(oH).join(", ")} } = _Vue
+`,-1),a())),e.components.length&&(oq(e.components,"component",n),(e.directives.length||e.temps>0)&&a()),e.directives.length&&(oq(e.directives,"directive",n),e.temps>0&&a()),e.temps>0){i("let ");for(let t=0;t<e.temps;t++)i(`${t>0?", ":""}_temp${t}`)}return(e.components.length||e.directives.length||e.temps)&&(i(`
+`,0),a()),u||i("return "),e.codegenNode?oz(e.codegenNode,n):i("null"),h&&(o(),i("}")),o(),i("}"),{ast:e,code:n.code,preamble:"",map:n.map?n.map.toJSON():void 0}}(l,i)}(e,y({},ak,t,{nodeTransforms:[aO,...aL,...t.nodeTransforms||[]],directiveTransforms:y({},aM,t.directiveTransforms||{}),transformHoist:null}))}(e,s),a=Function(o)();return a._rc=!0,i[r]=a}return iI(aP),e.BaseTransition=nr,e.BaseTransitionPropsValidators=nt,e.Comment=r4,e.DeprecationTypes=null,e.EffectScope=eg,e.ErrorCodes={SETUP_FUNCTION:0,0:"SETUP_FUNCTION",RENDER_FUNCTION:1,1:"RENDER_FUNCTION",WATCH_GETTER:2,2:"WATCH_GETTER",WATCH_CALLBACK:3,3:"WATCH_CALLBACK",WATCH_CLEANUP:4,4:"WATCH_CLEANUP",NATIVE_EVENT_HANDLER:5,5:"NATIVE_EVENT_HANDLER",COMPONENT_EVENT_HANDLER:6,6:"COMPONENT_EVENT_HANDLER",VNODE_HOOK:7,7:"VNODE_HOOK",DIRECTIVE_HOOK:8,8:"DIRECTIVE_HOOK",TRANSITION_HOOK:9,9:"TRANSITION_HOOK",APP_ERROR_HANDLER:10,10:"APP_ERROR_HANDLER",APP_WARN_HANDLER:11,11:"APP_WARN_HANDLER",FUNCTION_REF:12,12:"FUNCTION_REF",ASYNC_COMPONENT_LOADER:13,13:"ASYNC_COMPONENT_LOADER",SCHEDULER:14,14:"SCHEDULER",COMPONENT_UPDATE:15,15:"COMPONENT_UPDATE"},e.ErrorTypeStrings=null,e.Fragment=r3,e.KeepAlive={name:"KeepAlive",__isKeepAlive:!0,props:{include:[String,RegExp,Array],exclude:[String,RegExp,Array],max:[String,Number]},setup(e,{slots:t}){let n=ik(),r=n.ctx,i=new Map,l=new Set,s=null,o=n.suspense,{renderer:{p:a,m:c,um:u,o:{createElement:d}}}=r,p=d("div");function h(e){nv(e),u(e,n,o,!0)}function f(e){i.forEach((t,n)=>{let r=i$(t.type);!r||e&&e(r)||m(n)})}function m(e){let t=i.get(e);!t||s&&io(t,s)?s&&nv(s):h(t),i.delete(e),l.delete(e)}r.activate=(e,t,n,r,i)=>{let l=e.component;c(e,t,n,0,o),a(l.vnode,e,t,n,l,o,r,e.slotScopeIds,i),rw(()=>{l.isDeactivated=!1,l.a&&z(l.a);let t=e.props&&e.props.onVnodeMounted;t&&i_(t,l.parent,e)},o)},r.deactivate=e=>{let t=e.component;rL(t.m),rL(t.a),c(e,p,null,1,o),rw(()=>{t.da&&z(t.da);let n=e.props&&e.props.onVnodeUnmounted;n&&i_(n,t.parent,e),t.isDeactivated=!0},o)},rD(()=>[e.include,e.exclude],([e,t])=>{e&&f(t=>nf(e,t)),t&&f(e=>!nf(t,e))},{flush:"post",deep:!0});let g=null,y=()=>{null!=g&&(rX(n.subTree.type)?rw(()=>{i.set(g,nb(n.subTree))},n.subTree.suspense):i.set(g,nb(n.subTree)))};return nC(y),nT(y),nw(()=>{i.forEach(e=>{let{subTree:t,suspense:r}=n,i=nb(t);if(e.type===i.type&&e.key===i.key){nv(i);let e=i.component.da;e&&rw(e,r);return}h(e)})}),()=>{if(g=null,!t.default)return null;let n=t.default(),r=n[0];if(n.length>1)return s=null,n;if(!is(r)||!(4&r.shapeFlag)&&!(128&r.shapeFlag))return s=null,r;let o=nb(r);if(o.type===r4)return s=null,o;let a=o.type,c=i$(nd(o)?o.type.__asyncResolved||{}:a),{include:u,exclude:d,max:p}=e;if(u&&(!c||!nf(u,c))||d&&c&&nf(d,c))return s=o,r;let h=null==o.key?a:o.key,f=i.get(h);return o.el&&(o=ih(o),128&r.shapeFlag&&(r.ssContent=o)),g=h,f?(o.el=f.el,o.component=f.component,o.transition&&na(o,o.transition),o.shapeFlag|=512,l.delete(h),l.add(h)):(l.add(h),p&&l.size>parseInt(p,10)&&m(l.values().next().value)),o.shapeFlag|=256,s=o,rX(r.type)?r:o}}},e.ReactiveEffect=ev,e.Static=r8,e.Suspense={name:"Suspense",__isSuspense:!0,process(e,t,n,r,i,l,s,o,a,c){if(null==e)(function(e,t,n,r,i,l,s,o,a){let{p:c,o:{createElement:u}}=a,d=u("div"),p=e.suspense=rY(e,i,r,t,d,n,l,s,o,a);c(null,p.pendingBranch=e.ssContent,d,null,r,p,l,s),p.deps>0?(rZ(e,"onPending"),rZ(e,"onFallback"),c(null,e.ssFallback,t,n,r,null,l,s),r2(p,e.ssFallback)):p.resolve(!1,!0)})(t,n,r,i,l,s,o,a,c);else{if(l&&l.deps>0&&!e.suspense.isInFallback){t.suspense=e.suspense,t.suspense.vnode=t,t.el=e.el;return}(function(e,t,n,r,i,l,s,o,{p:a,um:c,o:{createElement:u}}){let d=t.suspense=e.suspense;d.vnode=t,t.el=e.el;let p=t.ssContent,h=t.ssFallback,{activeBranch:f,pendingBranch:m,isInFallback:g,isHydrating:y}=d;if(m)d.pendingBranch=p,io(p,m)?(a(m,p,d.hiddenContainer,null,i,d,l,s,o),d.deps<=0?d.resolve():g&&!y&&(a(f,h,n,r,i,null,l,s,o),r2(d,h))):(d.pendingId=rQ++,y?(d.isHydrating=!1,d.activeBranch=m):c(m,i,d),d.deps=0,d.effects.length=0,d.hiddenContainer=u("div"),g?(a(null,p,d.hiddenContainer,null,i,d,l,s,o),d.deps<=0?d.resolve():(a(f,h,n,r,i,null,l,s,o),r2(d,h))):f&&io(p,f)?(a(f,p,n,r,i,d,l,s,o),d.resolve(!0)):(a(null,p,d.hiddenContainer,null,i,d,l,s,o),d.deps<=0&&d.resolve()));else if(f&&io(p,f))a(f,p,n,r,i,d,l,s,o),r2(d,p);else if(rZ(t,"onPending"),d.pendingBranch=p,512&p.shapeFlag?d.pendingId=p.component.suspenseId:d.pendingId=rQ++,a(null,p,d.hiddenContainer,null,i,d,l,s,o),d.deps<=0)d.resolve();else{let{timeout:e,pendingId:t}=d;e>0?setTimeout(()=>{d.pendingId===t&&d.fallback(h)},e):0===e&&d.fallback(h)}})(e,t,n,r,i,s,o,a,c)}},hydrate:function(e,t,n,r,i,l,s,o,a){let c=t.suspense=rY(t,r,n,e.parentNode,document.createElement("div"),null,i,l,s,o,!0),u=a(e,c.pendingBranch=t.ssContent,n,c,l,s);return 0===c.deps&&c.resolve(!1,!0),u},normalize:function(e){let{shapeFlag:t,children:n}=e,r=32&t;e.ssContent=r0(r?n.default:n),e.ssFallback=r?r0(n.fallback):id(r4)}},e.Teleport={name:"Teleport",__isTeleport:!0,process(e,t,n,r,i,l,s,o,a,c){let{mc:u,pc:d,pbc:p,o:{insert:h,querySelector:f,createText:m,createComment:g}}=c,y=rp(t.props),{shapeFlag:b,children:_,dynamicChildren:S}=t;if(null==e){let e=t.el=m(""),c=t.anchor=m("");h(e,n,r),h(c,n,r);let d=t.target=rm(t.props,f),p=rv(d,t,m,h);d&&("svg"===s||rh(d)?s="svg":("mathml"===s||rf(d))&&(s="mathml"));let g=(e,t)=>{16&b&&u(_,e,t,i,l,s,o,a)};y?g(n,c):d&&g(d,p)}else{t.el=e.el,t.targetStart=e.targetStart;let r=t.anchor=e.anchor,u=t.target=e.target,h=t.targetAnchor=e.targetAnchor,m=rp(e.props),g=m?n:u;if("svg"===s||rh(u)?s="svg":("mathml"===s||rf(u))&&(s="mathml"),S?(p(e.dynamicChildren,S,g,i,l,s,o),rO(e,t,!0)):a||d(e,t,g,m?r:h,i,l,s,o,!1),y)m?t.props&&e.props&&t.props.to!==e.props.to&&(t.props.to=e.props.to):rg(t,n,r,c,1);else if((t.props&&t.props.to)!==(e.props&&e.props.to)){let e=t.target=rm(t.props,f);e&&rg(t,e,null,c,0)}else m&&rg(t,u,h,c,1)}ry(t)},remove(e,t,n,{um:r,o:{remove:i}},l){let{shapeFlag:s,children:o,anchor:a,targetStart:c,targetAnchor:u,target:d,props:p}=e;if(d&&(i(c),i(u)),l&&i(a),16&s){let e=l||!rp(p);for(let i=0;i<o.length;i++){let l=o[i];r(l,t,n,e,!!l.dynamicChildren)}}},move:rg,hydrate:function(e,t,n,r,i,l,{o:{nextSibling:s,parentNode:o,querySelector:a,insert:c,createText:u}},d){let p=t.target=rm(t.props,a);if(p){let a=p._lpa||p.firstChild;if(16&t.shapeFlag){if(rp(t.props))t.anchor=d(s(e),t,o(e),n,r,i,l),t.targetStart=a,t.targetAnchor=a&&s(a);else{t.anchor=s(e);let o=a;for(;o;){if(o&&8===o.nodeType){if("teleport start anchor"===o.data)t.targetStart=o;else if("teleport anchor"===o.data){t.targetAnchor=o,p._lpa=t.targetAnchor&&s(t.targetAnchor);break}}o=s(o)}t.targetAnchor||rv(p,t,u,c),d(a&&s(a),t,p,n,r,i,l)}}ry(t)}return t.anchor&&s(t.anchor)}},e.Text=r6,e.TrackOpTypes={GET:"get",HAS:"has",ITERATE:"iterate"},e.Transition=iW,e.TransitionGroup=lx,e.TriggerOpTypes={SET:"set",ADD:"add",DELETE:"delete",CLEAR:"clear"},e.VueElement=ly,e.assertNumber=function(e,t){},e.callWithAsyncErrorHandling=tF,e.callWithErrorHandling=tP,e.camelize=U,e.capitalize=q,e.cloneVNode=ih,e.compatUtils=null,e.compile=aP,e.computed=iP,e.createApp=(...e)=>{let t=(a||(a=rA(lj))).createApp(...e),{mount:n}=t;return t.mount=e=>{let r=lG(e);if(!r)return;let i=t._component;E(i)||i.render||i.template||(i.template=r.innerHTML),r.innerHTML="";let l=n(r,!1,lz(r));return r instanceof Element&&(r.removeAttribute("v-cloak"),r.setAttribute("data-v-app","")),l},t},e.createBlock=il,e.createCommentVNode=function(e="",t=!1){return t?(r7(),il(r4,null,e)):id(r4,null,e)},e.createElementBlock=function(e,t,n,r,i,l){return ii(iu(e,t,n,r,i,l,!0))},e.createElementVNode=iu,e.createHydrationRenderer=rE,e.createPropsRestProxy=function(e,t){let n={};for(let r in e)t.includes(r)||Object.defineProperty(n,r,{enumerable:!0,get:()=>e[r]});return n},e.createRenderer=function(e){return rA(e)},e.createSSRApp=(...e)=>{let t=lq().createApp(...e),{mount:n}=t;return t.mount=e=>{let t=lG(e);if(t)return n(t,!0,lz(t))},t},e.createSlots=function(e,t){for(let n=0;n<t.length;n++){let r=t[n];if(x(r))for(let t=0;t<r.length;t++)e[r[t].name]=r[t].fn;else r&&(e[r.name]=r.key?(...e)=>{let t=r.fn(...e);return t&&(t.key=r.key),t}:r.fn)}return e},e.createStaticVNode=function(e,t){let n=id(r8,null,e);return n.staticCount=t,n},e.createTextVNode=im,e.createVNode=id,e.customRef=tO,e.defineAsyncComponent=/*! #__NO_SIDE_EFFECTS__ */function(e){let t;E(e)&&(e={loader:e});let{loader:n,loadingComponent:r,errorComponent:i,delay:l=200,timeout:s,suspensible:o=!0,onError:a}=e,c=null,u=0,d=()=>(u++,c=null,p()),p=()=>{let e;return c||(e=c=n().catch(e=>{if(e=e instanceof Error?e:Error(String(e)),a)return new Promise((t,n)=>{a(e,()=>t(d()),()=>n(e),u+1)});throw e}).then(n=>e!==c&&c?c:(n&&(n.__esModule||"Module"===n[Symbol.toStringTag])&&(n=n.default),t=n,n)))};return nu({name:"AsyncComponentWrapper",__asyncLoader:p,get __asyncResolved(){return t},setup(){let e=iC;if(t)return()=>np(t,e);let n=t=>{c=null,tD(t,e,13,!i)};if(o&&e.suspense)return p().then(t=>()=>np(t,e)).catch(e=>(n(e),()=>i?id(i,{error:e}):null));let a=tT(!1),u=tT(),d=tT(!!l);return l&&setTimeout(()=>{d.value=!1},l),null!=s&&setTimeout(()=>{if(!a.value&&!u.value){let e=Error(`Async component timed out after ${s}ms.`);n(e),u.value=e}},s),p().then(()=>{a.value=!0,e.parent&&nh(e.parent.vnode)&&(e.parent.effect.dirty=!0,tJ(e.parent.update))}).catch(e=>{n(e),u.value=e}),()=>a.value&&t?np(t,e):u.value&&i?id(i,{error:u.value}):r&&!d.value?id(r):void 0}})},e.defineComponent=nu,e.defineCustomElement=lm,e.defineEmits=function(){return null},e.defineExpose=function(e){},e.defineModel=function(){},e.defineOptions=function(e){},e.defineProps=function(){return null},e.defineSSRCustomElement=(e,t)=>lm(e,t,lK),e.defineSlots=function(){return null},e.devtools=void 0,e.effect=function(e,t){e.effect instanceof ev&&(e=e.effect.fn);let n=new ev(e,h,()=>{n.dirty&&n.run()});t&&(y(n,t),t.scope&&ey(n,t.scope)),t&&t.lazy||n.run();let r=n.run.bind(n);return r.effect=n,r},e.effectScope=function(e){return new eg(e)},e.getCurrentInstance=ik,e.getCurrentScope=function(){return n},e.getTransitionRawChildren=nc,e.guardReactiveProps=ip,e.h=iF,e.handleError=tD,e.hasInjectionContext=function(){return!!(iC||t2||n1)},e.hydrate=lK,e.initCustomFormatter=function(){},e.initDirectivesForSSR=h,e.inject=n3,e.isMemoSame=iD,e.isProxy=tg,e.isReactive=th,e.isReadonly=tf,e.isRef=tk,e.isRuntimeOnly=()=>!s,e.isShallow=tm,e.isVNode=is,e.markRaw=tv,e.mergeDefaults=function(e,t){let n=nj(e);for(let e in t){if(e.startsWith("__skip"))continue;let r=n[e];r?x(r)||E(r)?r=n[e]={type:r,default:t[e]}:r.default=t[e]:null===r&&(r=n[e]={default:t[e]}),r&&t[`__skip_${e}`]&&(r.skipFactory=!0)}return n},e.mergeModels=function(e,t){return e&&t?x(e)&&x(t)?e.concat(t):y({},nj(e),nj(t)):e||t},e.mergeProps=ib,e.nextTick=tG,e.normalizeClass=ei,e.normalizeProps=function(e){if(!e)return null;let{class:t,style:n}=e;return t&&!A(t)&&(e.class=ei(t)),n&&(e.style=Y(n)),e},e.normalizeStyle=Y,e.onActivated=nm,e.onBeforeMount=nx,e.onBeforeUnmount=nw,e.onBeforeUpdate=nk,e.onDeactivated=ng,e.onErrorCaptured=nR,e.onMounted=nC,e.onRenderTracked=nI,e.onRenderTriggered=nN,e.onScopeDispose=function(e){n&&n.cleanups.push(e)},e.onServerPrefetch=nA,e.onUnmounted=nE,e.onUpdated=nT,e.openBlock=r7,e.popScopeId=function(){t3=null},e.provide=n2,e.proxyRefs=tI,e.pushScopeId=function(e){t3=e},e.queuePostFlushCb=tQ,e.reactive=tc,e.readonly=td,e.ref=tT,e.registerRuntimeCompiler=iI,e.render=lW,e.renderList=function(e,t,n,r){let i;let l=n&&n[r];if(x(e)||A(e)){i=Array(e.length);for(let n=0,r=e.length;n<r;n++)i[n]=t(e[n],n,void 0,l&&l[n])}else if("number"==typeof e){i=Array(e);for(let n=0;n<e;n++)i[n]=t(n+1,n,void 0,l&&l[n])}else if(I(e)){if(e[Symbol.iterator])i=Array.from(e,(e,n)=>t(e,n,void 0,l&&l[n]));else{let n=Object.keys(e);i=Array(n.length);for(let r=0,s=n.length;r<s;r++){let s=n[r];i[r]=t(e[s],s,r,l&&l[r])}}}else i=[];return n&&(n[r]=i),i},e.renderSlot=function(e,t,n={},r,i){if(t2.isCE||t2.parent&&nd(t2.parent)&&t2.parent.isCE)return"default"!==t&&(n.name=t),id("slot",n,r&&r());let l=e[t];l&&l._c&&(l._d=!1),r7();let s=l&&function e(t){return t.some(t=>!is(t)||!!(t.type!==r4&&(t.type!==r3||e(t.children))))?t:null}(l(n)),o=il(r3,{key:(n.key||s&&s.key||`_${t}`)+(!s&&r?"_fb":"")},s||(r?r():[]),s&&1===e._?64:-2);return!i&&o.scopeId&&(o.slotScopeIds=[o.scopeId+"-s"]),l&&l._c&&(l._d=!0),o},e.resolveComponent=function(e,t){return nM(nO,e,!0,t)||e},e.resolveDirective=function(e){return nM("directives",e)},e.resolveDynamicComponent=function(e){return A(e)?nM(nO,e,!1)||e:e||nL},e.resolveFilter=null,e.resolveTransitionHooks=nl,e.setBlockTracking=ir,e.setDevtoolsHook=h,e.setTransitionHooks=na,e.shallowReactive=tu,e.shallowReadonly=function(e){return tp(e,!0,ez,ti,ta)},e.shallowRef=function(e){return tw(e,!0)},e.ssrContextKey=rM,e.ssrUtils=null,e.stop=function(e){e.effect.stop()},e.toDisplayString=eh,e.toHandlerKey=W,e.toHandlers=function(e,t){let n={};for(let r in e)n[t&&/[A-Z]/.test(r)?`on:${r}`:W(r)]=e[r];return n},e.toRaw=ty,e.toRef=function(e,t,n){return tk(e)?e:E(e)?new tM(e):I(e)&&arguments.length>1?t$(e,t,n):tT(e)},e.toRefs=function(e){let t=x(e)?Array(e.length):{};for(let n in e)t[n]=t$(e,n);return t},e.toValue=function(e){return E(e)?e():tA(e)},e.transformVNodeArgs=function(e){},e.triggerRef=function(e){tC(e,4)},e.unref=tA,e.useAttrs=function(){return nU().attrs},e.useCssModule=function(e="$style"){return d},e.useCssVars=function(e){let t=ik();if(!t)return;let n=t.ut=(n=e(t.proxy))=>{Array.from(document.querySelectorAll(`[data-v-owner="${t.uid}"]`)).forEach(e=>le(e,n))},r=()=>{let r=e(t.proxy);(function e(t,n){if(128&t.shapeFlag){let r=t.suspense;t=r.activeBranch,r.pendingBranch&&!r.isHydrating&&r.effects.push(()=>{e(r.activeBranch,n)})}for(;t.component;)t=t.component.subTree;if(1&t.shapeFlag&&t.el)le(t.el,n);else if(t.type===r3)t.children.forEach(t=>e(t,n));else if(t.type===r8){let{el:e,anchor:r}=t;for(;e&&(le(e,n),e!==r);)e=e.nextSibling}})(t.subTree,r),n(r)};nx(()=>{r$(r)}),nC(()=>{let e=new MutationObserver(r);e.observe(t.subTree.el.parentNode,{childList:!0}),nE(()=>e.disconnect())})},e.useModel=function(e,t,n=d){let r=ik(),i=U(t),l=H(t),s=rj(e,t),o=tO((s,o)=>{let a,c;let u=d;return rP(()=>{let n=e[t];K(a,n)&&(a=n,o())}),{get:()=>(s(),n.get?n.get(a):a),set(e){let s=n.set?n.set(e):e;if(!K(s,a)&&!(u!==d&&K(e,u)))return;let p=r.vnode.props;p&&(t in p||i in p||l in p)&&(`onUpdate:${t}` in p||`onUpdate:${i}` in p||`onUpdate:${l}` in p)||(a=e,o()),r.emit(`update:${t}`,s),K(e,s)&&K(e,u)&&!K(s,c)&&o(),u=e,c=s}}});return o[Symbol.iterator]=()=>{let e=0;return{next:()=>e<2?{value:e++?s||d:o,done:!1}:{done:!0}}},o},e.useSSRContext=()=>{},e.useSlots=function(){return nU().slots},e.useTransitionState=t7,e.vModelCheckbox=lR,e.vModelDynamic={created(e,t,n){lD(e,t,n,null,"created")},mounted(e,t,n){lD(e,t,n,null,"mounted")},beforeUpdate(e,t,n,r){lD(e,t,n,r,"beforeUpdate")},updated(e,t,n,r){lD(e,t,n,r,"updated")}},e.vModelRadio=lL,e.vModelSelect=lM,e.vModelText=lI,e.vShow={beforeMount(e,{value:t},{transition:n}){e[i8]="none"===e.style.display?"":e.style.display,n&&t?n.beforeEnter(e):i9(e,t)},mounted(e,{value:t},{transition:n}){n&&t&&n.enter(e)},updated(e,{value:t,oldValue:n},{transition:r}){!t!=!n&&(r?t?(r.beforeEnter(e),i9(e,!0),r.enter(e)):r.leave(e,()=>{i9(e,!1)}):i9(e,t))},beforeUnmount(e,{value:t}){i9(e,t)}},e.version=iV,e.warn=h,e.watch=function(e,t,n){return rD(e,t,n)},e.watchEffect=function(e,t){return rD(e,null,t)},e.watchPostEffect=r$,e.watchSyncEffect=rP,e.withAsyncContext=function(e){let t=ik(),n=e();return iw(),R(n)&&(n=n.catch(e=>{throw iT(t),e})),[n,()=>iT(t)]},e.withCtx=t4,e.withDefaults=function(e,t){return null},e.withDirectives=function(e,t){if(null===t2)return e;let n=iM(t2),r=e.dirs||(e.dirs=[]);for(let e=0;e<t.length;e++){let[i,l,s,o=d]=t[e];i&&(E(i)&&(i={mounted:i,updated:i}),i.deep&&rU(l),r.push({dir:i,instance:n,value:l,oldValue:void 0,arg:s,modifiers:o}))}return e},e.withKeys=(e,t)=>{let n=e._withKeys||(e._withKeys={}),r=t.join(".");return n[r]||(n[r]=n=>{if(!("key"in n))return;let r=H(n.key);if(t.some(e=>e===r||lU[e]===r))return e(n)})},e.withMemo=function(e,t,n,r){let i=n[r];if(i&&iD(i,e))return i;let l=t();return l.memo=e.slice(),l.cacheIndex=r,n[r]=l},e.withModifiers=(e,t)=>{let n=e._withMods||(e._withMods={}),r=t.join(".");return n[r]||(n[r]=(n,...r)=>{for(let e=0;e<t.length;e++){let r=lB[t[e]];if(r&&r(n,t))return}return e(n,...r)})},e.withScopeId=e=>t4,e}({});
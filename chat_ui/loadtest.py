@@ -0,0 +1,329 @@
+""" simulated users driving the whole stack, from submitting a job to seeing it finish """
+
+import asyncio
+from collections import Counter
+from datetime import UTC, datetime
+from enum import StrEnum
+import json
+import random
+import time
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from loguru import logger
+from pydantic import BaseModel, Field
+import websockets
+
+from chat_ui.asyncclient import AsyncChatUIClient
+from chat_ui.models import Job, JobDetail, JobEventType, JobStatus, WebSocketMessageType, WebSocketProtocol
+
+# the percentiles in each latency summary
+PERCENTILES = (50, 90, 95, 99)
+
+
+class LoadTestMode(StrEnum):
+    """how the simulated users find out their jobs are done"""
+
+    # server-sent events from /jobs/{userid}/{job_id}/events
+    Http = "http"
+    # polling /ws for the session's jobs, the way the web UI does
+    Websocket = "websocket"
+    # half the users do each
+    Mixed = "mixed"
+
+
+class LoadTestSettings(BaseModel):
+    users: int = 10
+    jobs_per_user: int = 5
+    # mean seconds between a user's jobs, the actual gaps are exponentially distributed around it
+    think_time: float = 1.0
+    mode: LoadTestMode = LoadTestMode.Mixed
+    prompt: str = "Tell me a short story about a load test."
+    # give up on a job that hasn't finished after this long
+    job_timeout: float = 300.0
+    # how often websocket users ask for their jobs, matches the web UI
+    websocket_poll_interval: float = 2.5
+    max_concurrency: int = 1000
+
+
+class JobSample(BaseModel):
+    """what happened to one job, the times are seconds from when it was submitted"""
+
+    mode: LoadTestMode
+    job_id: Optional[UUID] = None
+    submit: Optional[float] = None
+    first_update: Optional[float] = None
+    complete: Optional[float] = None
+    # from the server's timings, created until the poller picked it up
+    queue_wait: Optional[float] = None
+    status: Optional[str] = None
+    error: Optional[str] = None
+
+
+class LatencySummary(BaseModel):
+    count: int = 0
+    mean: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    percentiles: Dict[str, float] = Field(default_factory=dict)
+
+    @classmethod
+    def from_values(cls, values: Sequence[Optional[float]]) -> "LatencySummary":
+        present = sorted(value for value in values if value is not None)
+        if not present:
+            return cls()
+        return cls(
+            count=len(present),
+            mean=sum(present) / len(present),
+            min=present[0],
+            max=present[-1],
+            percentiles={f"p{percentile}": percentile_of(present, percentile) for percentile in PERCENTILES},
+        )
+
+
+def percentile_of(ordered: Sequence[float], percentile: float) -> float:
+    """linear interpolation between the closest ranks, ordered has to be sorted and not empty"""
+    position = (len(ordered) - 1) * percentile / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class LoadTestReport(BaseModel):
+    """the results of a run, written out as JSON so runs can be compared"""
+
+    settings: LoadTestSettings
+    base_url: str
+    started: datetime
+    duration: float
+    jobs_submitted: int
+    jobs_completed: int
+    jobs_failed: int
+    errors: Dict[str, int]
+    error_rate: float
+    # completed jobs per second over the whole run
+    throughput: float
+    submit: LatencySummary
+    queue_wait: LatencySummary
+    time_to_first_update: LatencySummary
+    time_to_complete: LatencySummary
+
+    @classmethod
+    def from_samples(
+        cls,
+        settings: LoadTestSettings,
+        base_url: str,
+        started: datetime,
+        duration: float,
+        samples: List[JobSample],
+    ) -> "LoadTestReport":
+        completed = [sample for sample in samples if sample.status == JobStatus.Complete]
+        errors = Counter(sample.error for sample in samples if sample.error is not None)
+        errors.update("job status error" for sample in samples if sample.status == JobStatus.Error)
+        failed = len([sample for sample in samples if sample.error is not None or sample.status == JobStatus.Error])
+        return cls(
+            settings=settings,
+            base_url=base_url,
+            started=started,
+            duration=duration,
+            jobs_submitted=len([sample for sample in samples if sample.job_id is not None]),
+            jobs_completed=len(completed),
+            jobs_failed=failed,
+            errors=dict(errors),
+            error_rate=failed / len(samples) if samples else 0.0,
+            throughput=len(completed) / duration if duration > 0 else 0.0,
+            submit=LatencySummary.from_values([sample.submit for sample in samples]),
+            queue_wait=LatencySummary.from_values([sample.queue_wait for sample in samples]),
+            time_to_first_update=LatencySummary.from_values([sample.first_update for sample in samples]),
+            time_to_complete=LatencySummary.from_values([sample.complete for sample in completed]),
+        )
+
+    def summary(self) -> str:
+        """a human-readable table of the results"""
+        lines = [
+            f"{self.jobs_submitted} jobs from {self.settings.users} users in {self.duration:.1f}s, "
+            f"{self.throughput:.2f} jobs/s, {self.jobs_failed} failed ({self.error_rate:.1%})",
+        ]
+        for name in ("submit", "queue_wait", "time_to_first_update", "time_to_complete"):
+            latency: LatencySummary = getattr(self, name)
+            if latency.count == 0:
+                lines.append(f"{name:>22}: no samples")
+                continue
+            percentiles = " ".join(f"{key}={value:.3f}" for key, value in latency.percentiles.items())
+            lines.append(f"{name:>22}: n={latency.count} mean={latency.mean:.3f} {percentiles} max={latency.max:.3f}")
+        for error, count in self.errors.items():
+            lines.append(f"{'error':>22}: {count} x {error}")
+        return "\n".join(lines)
+
+
+def queue_wait_from(detail: JobDetail) -> Optional[float]:
+    """the poller stores how long the job queued in its metadata"""
+    if detail.metadata is None:
+        return None
+    try:
+        value = json.loads(detail.metadata).get("timings", {}).get("queue_wait")
+    except (ValueError, AttributeError):
+        return None
+    return float(value) if value is not None else None
+
+
+class LoadTest:
+    """runs the simulated users against a server and collects what happened to their jobs"""
+
+    def __init__(self, client: AsyncChatUIClient, settings: LoadTestSettings) -> None:
+        self.client = client
+        self.settings = settings
+        self.samples: List[JobSample] = []
+
+    def websocket_url(self) -> str:
+        return f"ws{self.client.base_url.removeprefix('http')}/ws"
+
+    def user_mode(self, user_number: int) -> LoadTestMode:
+        if self.settings.mode == LoadTestMode.Mixed:
+            return LoadTestMode.Http if user_number % 2 == 0 else LoadTestMode.Websocket
+        return self.settings.mode
+
+    async def run(self) -> LoadTestReport:
+        started = datetime.now(UTC)
+        start = time.perf_counter()
+        await asyncio.gather(*(self.run_user(user_number) for user_number in range(self.settings.users)))
+        return LoadTestReport.from_samples(
+            self.settings, self.client.base_url, started, time.perf_counter() - start, self.samples
+        )
+
+    async def think(self) -> None:
+        if self.settings.think_time > 0:
+            await asyncio.sleep(random.expovariate(1 / self.settings.think_time))
+
+    async def run_user(self, user_number: int) -> None:
+        """one user, submitting jobs one after the other and waiting for each to finish"""
+        mode = self.user_mode(user_number)
+        userid = uuid4()
+        try:
+            await self.client.create_or_update_user(userid, f"loadtest-{user_number}")
+            chat_session = await self.client.create_session(userid)
+            if chat_session is None:
+                raise ValueError("no session was created")
+        except Exception as error:
+            logger.error("Failed to set up load test user", user_number=user_number, error=str(error))
+            self.samples.extend(JobSample(mode=mode, error="user setup") for _ in range(self.settings.jobs_per_user))
+            return
+
+        websocket: Optional[websockets.ClientConnection] = None
+        try:
+            if mode == LoadTestMode.Websocket:
+                websocket = await websockets.connect(
+                    self.websocket_url(), subprotocols=[websockets.Subprotocol(WebSocketProtocol.Json.value)]
+                )
+            for _ in range(self.settings.jobs_per_user):
+                await self.think()
+                sample = JobSample(mode=mode)
+                self.samples.append(sample)
+                await self.run_job(sample, userid, chat_session.sessionid, websocket)
+        except Exception as error:
+            logger.error("Load test user failed", user_number=user_number, error=str(error))
+        finally:
+            if websocket is not None:
+                await websocket.close()
+
+    async def run_job(
+        self,
+        sample: JobSample,
+        userid: UUID,
+        sessionid: UUID,
+        websocket: Optional[websockets.ClientConnection],
+    ) -> None:
+        submitted = time.perf_counter()
+        try:
+            job = await self.client.create_job(self.settings.prompt, sessionid, userid)
+        except Exception as error:
+            sample.error = f"submit: {type(error).__name__}"
+            return
+        sample.submit = time.perf_counter() - submitted
+        if job is None:
+            sample.error = "submit rejected"
+            return
+        sample.job_id = job.id
+
+        try:
+            if websocket is None:
+                follow = self.follow_events(sample, userid, job.id, submitted)
+            else:
+                follow = self.follow_websocket(sample, websocket, userid, sessionid, job.id, submitted)
+            detail = await asyncio.wait_for(follow, timeout=self.settings.job_timeout)
+        except asyncio.TimeoutError:
+            sample.error = "timed out"
+            return
+        except Exception as error:
+            sample.error = f"follow: {type(error).__name__}"
+            return
+        sample.status = detail.status
+        sample.queue_wait = queue_wait_from(detail)
+
+    async def follow_events(self, sample: JobSample, userid: UUID, job_id: UUID, submitted: float) -> JobDetail:
+        """the http path, following the job's server-sent events"""
+        async for event in self.client.stream_job(userid, job_id):
+            if isinstance(event, JobDetail):
+                sample.complete = time.perf_counter() - submitted
+                if sample.first_update is None:
+                    sample.first_update = sample.complete
+                return event
+            # the first event's the status when we connected, which is probably still created
+            if sample.first_update is None and (event.event == JobEventType.Token or event.status != JobStatus.Created):
+                sample.first_update = time.perf_counter() - submitted
+        raise ValueError("event stream ended before the job finished")
+
+    async def follow_websocket(
+        self,
+        sample: JobSample,
+        websocket: websockets.ClientConnection,
+        userid: UUID,
+        sessionid: UUID,
+        job_id: UUID,
+        submitted: float,
+    ) -> JobDetail:
+        """the web UI's path, asking for the session's jobs every websocket_poll_interval"""
+        request = json.dumps(
+            {
+                "userid": str(userid),
+                "message": WebSocketMessageType.Jobs.value,
+                "payload": json.dumps({"sessionid": str(sessionid)}),
+            }
+        )
+        while True:
+            await websocket.send(request)
+            job = await self.receive_job(websocket, userid, job_id)
+            if job is not None and job.status != JobStatus.Created and sample.first_update is None:
+                sample.first_update = time.perf_counter() - submitted
+            if job is not None and JobStatus(job.status).is_terminal():
+                sample.complete = time.perf_counter() - submitted
+                # the websocket only has the summary, the timings are in the detail
+                return await self.client.get_job(userid, job_id)
+            await asyncio.sleep(self.settings.websocket_poll_interval)
+
+    async def receive_job(self, websocket: websockets.ClientConnection, userid: UUID, job_id: UUID) -> Optional[Job]:
+        """wait for the answer to a jobs request, skipping pings"""
+        while True:
+            message = json.loads(await websocket.recv())
+            if message.get("message") == WebSocketMessageType.Ping:
+                await websocket.send(json.dumps({"userid": str(userid), "message": WebSocketMessageType.Pong.value}))
+                continue
+            if message.get("message") == WebSocketMessageType.Error:
+                raise ValueError(f"websocket error: {message.get('payload')}")
+            if message.get("message") != WebSocketMessageType.Jobs:
+                continue
+            for job in message.get("payload") or []:
+                if job.get("id") == str(job_id):
+                    return Job.model_validate(job)
+            return None
+
+
+async def run_loadtest(
+    hostname: str,
+    port: int,
+    settings: LoadTestSettings,
+    skip_tls: bool = False,
+) -> LoadTestReport:
+    """run the whole thing against a server"""
+    async with AsyncChatUIClient(hostname, port, skip_tls=skip_tls, max_concurrency=settings.max_concurrency) as client:
+        return await LoadTest(client, settings).run()
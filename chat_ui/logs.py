@@ -1,9 +1,29 @@
-import json
+import atexit
 import logging as logging
-from typing import Any, Dict
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, TextIO
 
+from loguru import logger
+import orjson
+from opentelemetry.metrics import get_meter_provider
 
-def serialize(record: Dict[str, Any]) -> str:
+from chat_ui.config import Config, get_config
+
+meter = get_meter_provider().get_meter("chat_ui", os.getenv("CHATUI_APP_VERSION", "latest"))
+
+dropped_meter = meter.create_counter(
+    "chatui.log.dropped",
+    unit="records",
+    description="Log records thrown away because the log queue was full",
+)
+
+
+def serialize(record: Dict[str, Any]) -> bytes:
     """serializes the loguru record"""
     level = record["level"].name
     subset = {
@@ -19,10 +39,186 @@ def serialize(record: Dict[str, Any]) -> str:
 
     for key, value in record["extra"].items():
         subset[key] = value
-    # print(f"original: {json.dumps(record, indent=2, default=str)}")
-    return json.dumps(subset, default=str, ensure_ascii=False)
+    return orjson.dumps(subset, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def log_enabled(level: str) -> bool:
+    """whether records at this level get written anywhere, check it before building expensive log fields"""
+    return logger.level(level).no >= sink.level_no
+
+
+def truncate(value: Any, max_length: int) -> Any:
+    """cuts down long strings, including the ones inside lists and dicts, 0 leaves them alone"""
+    if max_length <= 0:
+        return value
+    if isinstance(value, str):
+        if len(value) > max_length:
+            return f"{value[:max_length]}... ({len(value) - max_length} more characters)"
+        return value
+    if isinstance(value, dict):
+        return {key: truncate(item, max_length) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [truncate(item, max_length) for item in value]
+    return value
+
+
+def log_payload(value: Any) -> Any:
+    """a job's fields for its info records, only cut down if log_job_record_max_length is set"""
+    return truncate(value, get_config().log_job_record_max_length)
+
+
+def payload_fields(**fields: Any) -> Dict[str, Any]:
+    """large fields (prompts, responses, history) for a log record, cut down to
+    log_max_field_length, and left out entirely unless the record's in the log_payload_sample_rate"""
+    config = get_config()
+    if config.log_payload_sample_rate < 1 and random.random() >= config.log_payload_sample_rate:
+        return {}
+    return truncate(fields, config.log_max_field_length)  # type: ignore[no-any-return]
+
+
+class BufferedSink:
+    """a loguru sink that hands records to a writer thread, so a slow stdout can't hold up the
+    event loop or the poller
+
+    records are serialized on the calling thread (the extras can change after the call returns),
+    then written out in batches. If the queue's full they're dropped and counted, unless block is
+    set, in which case the caller waits for space"""
+
+    def __init__(
+        self,
+        max_queue: int = 10000,
+        batch_size: int = 256,
+        block: bool = False,
+        stream: Optional[TextIO] = None,
+    ) -> None:
+        self.batch_size = batch_size
+        self.block = block
+        # None means whatever sys.stdout is when we write, so redirecting it still works
+        self.stream = stream
+        self.queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self._unreported = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        # the lowest level this sink's added at, anything below it isn't written
+        self.level_no = 0
+
+    @classmethod
+    def from_config(cls, config: Config) -> "BufferedSink":
+        return cls(
+            max_queue=config.log_queue_size,
+            batch_size=config.log_batch_size,
+            block=config.log_queue_full == "block",
+        )
+
+    def __call__(self, message: Any) -> None:
+        serialized = serialize(message.record)
+        if self._closed:
+            # shutting down, nothing's left to write it for us
+            self.write_batch([serialized])
+            return
+        self.start()
+        try:
+            self.queue.put(serialized, block=self.block)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                self._unreported += 1
+            dropped_meter.add(1)
+
+    def start(self) -> None:
+        """starts the writer thread if it's not running, it's started lazily so forked workers get their own"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self.run, name="chatui-log-writer", daemon=True)
+                self._thread.start()
+
+    def run(self) -> None:
+        stopping = False
+        while not stopping:
+            # wait for something, then take whatever else is already there
+            records = [self.queue.get()]
+            while len(records) < self.batch_size:
+                try:
+                    records.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            batch = [record for record in records if record is not None]
+            stopping = len(batch) != len(records)
+            self.write_batch(batch + self.dropped_report())
+            for _ in records:
+                self.queue.task_done()
+
+    def dropped_report(self) -> List[bytes]:
+        """a record saying how many were dropped since we last said so"""
+        with self._lock:
+            dropped, self._unreported = self._unreported, 0
+        if dropped == 0:
+            return []
+        return [
+            orjson.dumps(
+                {
+                    "timestamp": time.time(),
+                    "message": "Dropped log records because the log queue was full",
+                    "level": "WARNING",
+                    "logger": __name__,
+                    "dropped": dropped,
+                }
+            )
+        ]
+
+    def write_batch(self, batch: List[bytes]) -> None:
+        if not batch:
+            return
+        stream = self.stream or sys.stdout
+        try:
+            stream.write(b"\n".join(batch).decode("utf-8") + "\n")
+            stream.flush()
+        except Exception as error:
+            # there's nowhere to log this to, so don't try
+            logging.debug("Failed to write log records: %s", error)
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """waits until everything queued so far has been written"""
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks and time.monotonic() < deadline:
+            if self._thread is None or not self._thread.is_alive():
+                return
+            time.sleep(0.01)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """writes out whatever's queued and stops the writer"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is None or not self._thread.is_alive():
+            return
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+        # anything that slipped in behind the stop marker
+        leftover: List[bytes] = []
+        while True:
+            try:
+                record = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is not None:
+                leftover.append(record)
+        self.write_batch(leftover + self.dropped_report())
+
+
+def configure_logging(config: Config) -> None:
+    """send everything at log_level and above to the buffered sink"""
+    logger.remove()
+    logger.add(sink=sink, level=config.log_level)
+    sink.level_no = logger.level(config.log_level).no
 
 
-def sink(message: Any) -> None:
-    serialized = serialize(message.record)
-    print(serialized)
+sink = BufferedSink.from_config(get_config())
+atexit.register(sink.close)
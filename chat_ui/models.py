@@ -1,15 +1,21 @@
-from datetime import datetime
-from enum import StrEnum
-import json
-from typing import Annotated, Any, List, Optional, Union
+from datetime import datetime, UTC
+from enum import IntEnum, StrEnum
+from typing import Annotated, Any, Dict, List, Optional, Union
 from uuid import UUID
 
+import msgpack  # type: ignore
+import orjson
 from pydantic import AfterValidator, BaseModel, ConfigDict
 from sqlmodel import SQLModel
 
 from opentelemetry.trace.status import StatusCode
 
 
+def dump_json(content: Any) -> bytes:
+    """serialize with orjson, formatted the same way pydantic does it"""
+    return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+
 class JobStatus(StrEnum):
     Created = "created"
     Running = "running"
@@ -26,6 +32,10 @@ class JobStatus(StrEnum):
             return StatusCode.OK
         raise ValueError(f"Invalid job status {self}")
 
+    def is_terminal(self) -> bool:
+        """the job's not going to change again unless someone resubmits it"""
+        return self in [JobStatus.Complete, JobStatus.Error, JobStatus.Hidden]
+
 
 class RequestType(StrEnum):
     DOS = "dos"
@@ -43,6 +53,41 @@ class WebSocketMessageType(StrEnum):
     Feedback = "feedback"
     Waiting = "waiting"
     NewChat = "newchat"
+    Batch = "batch"
+    Ping = "ping"
+    Pong = "pong"
+
+
+class WebSocketProtocol(StrEnum):
+    """the websocket subprotocols a client can ask for when connecting to /ws"""
+
+    Json = "chatui.json"
+    MsgPack = "chatui.msgpack"
+
+
+class MsgPackExtType(IntEnum):
+    """msgpack extension type codes, timestamps use the msgpack-native -1 type"""
+
+    UUID = 1
+
+
+def msgpack_default(value: Any) -> Any:
+    """encode the types msgpack doesn't know about natively"""
+    if isinstance(value, UUID):
+        return msgpack.ExtType(MsgPackExtType.UUID, value.bytes)
+    if isinstance(value, datetime):
+        # the database hands back naive datetimes, but they're all stored as UTC
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return msgpack.Timestamp.from_datetime(value)
+    return str(value)
+
+
+def msgpack_ext_hook(code: int, data: bytes) -> Any:
+    """decode the extension types we send"""
+    if code == MsgPackExtType.UUID:
+        return UUID(bytes=data)
+    return msgpack.ExtType(code, data)
 
 
 def validate_uuid(v: Union[str, UUID]) -> Union[str, UUID]:
@@ -98,15 +143,26 @@ class Job(BaseModel):
         jobs_object: Any,
         jobsfeedback: Optional[SQLModel],
     ) -> "Job":
-        newobject = {
-            "id": jobs_object.id.hex,
+        # rows from the database are already valid, so skip validating them again
+        return cls.model_construct(
+            id=jobs_object.id,
+            status=jobs_object.status,
+            created=jobs_object.created,
+            updated=jobs_object.updated,
+            # request_type=jobs_object.request_type,
+            sessionid=jobs_object.sessionid,
+        )
+
+    @classmethod
+    def dict_from_jobs(cls, jobs_object: Any) -> Dict[str, Any]:
+        """what from_jobs(...).model_dump() gives you, without building the model, for long lists"""
+        return {
+            "id": jobs_object.id,
             "status": jobs_object.status,
             "created": jobs_object.created,
             "updated": jobs_object.updated,
-            # "request_type": jobs_object.request_type,
             "sessionid": jobs_object.sessionid,
         }
-        return cls(**newobject)
 
 
 class JobDetail(Job):
@@ -129,23 +185,37 @@ class JobDetail(Job):
         jobs_object: Any,
         jobsfeedback: Optional[Any],
     ) -> "JobDetail":
-        newobject = {
-            "id": jobs_object.id.hex,
-            "userid": jobs_object.userid.hex,
-            "status": jobs_object.status,
-            "created": jobs_object.created,
-            "updated": jobs_object.updated,
-            "prompt": jobs_object.prompt,
-            "response": jobs_object.response,
-            "runtime": jobs_object.runtime,
-            "metadata": jobs_object.job_metadata,
-            "request_type": jobs_object.request_type,
-            "sessionid": jobs_object.sessionid,
-        }
-        if jobsfeedback is not None:
-            newobject["feedback_comment"] = jobsfeedback.comment
-            newobject["feedback_success"] = jobsfeedback.success
-        return cls(**newobject)
+        # rows from the database are already valid, so skip validating them again
+        return cls.model_construct(
+            id=jobs_object.id,
+            status=jobs_object.status,
+            created=jobs_object.created,
+            updated=jobs_object.updated,
+            prompt=jobs_object.prompt,
+            response=jobs_object.response,
+            runtime=jobs_object.runtime,
+            metadata=jobs_object.job_metadata,
+            sessionid=jobs_object.sessionid,
+            feedback_comment=jobsfeedback.comment if jobsfeedback is not None else None,
+            feedback_success=jobsfeedback.success if jobsfeedback is not None else None,
+        )
+
+
+class JobEventType(StrEnum):
+    Status = "status"
+    # a chunk of the response as the backend streams it
+    Token = "token"
+    # the finished job, only sent by the events endpoint
+    Complete = "complete"
+
+
+class JobEvent(BaseModel):
+    """something happened to a job, see chat_ui.jobevents"""
+
+    event: JobEventType
+    job_id: UUID
+    status: Optional[str] = None
+    text: Optional[str] = None
 
 
 def validate_websocket_message(v: str) -> str:
@@ -161,32 +231,77 @@ class WebSocketMessage(BaseModel):
     payload: Optional[str] = None
     message: Annotated[str, AfterValidator(validate_websocket_message)]
 
+    @classmethod
+    def from_frame(cls, frame: dict[str, Any]) -> "WebSocketMessage":
+        """parse a received websocket frame, binary frames are msgpack and text frames are JSON"""
+        if frame.get("bytes") is not None:
+            return cls.model_validate(
+                msgpack.unpackb(frame["bytes"], ext_hook=msgpack_ext_hook, timestamp=3)
+            )
+        return cls.model_validate_json(frame.get("text") or "")
+
+
+class WebSocketBatchOperation(BaseModel):
+    """one of the operations in a batch message, runs as the userid of the batch"""
+
+    payload: Optional[str] = None
+    message: Annotated[str, AfterValidator(validate_websocket_message)]
+
 
 class WebSocketResponse(BaseModel):
     """what we send back across the websocket to the client"""
 
     message: Annotated[str, AfterValidator(validate_websocket_message)]
-    payload: Union[List[Job], Job, str]
+    payload: Union[List[Job], Job, int, str, List["WebSocketResponse"]]
 
     def as_message(self) -> str:
-        """convert to a string"""
-        return json.dumps(self.model_dump(), default=str)
+        """convert to a JSON string"""
+        return dump_json(self.model_dump()).decode("utf-8")
+
+    def as_msgpack(self) -> bytes:
+        """convert to msgpack bytes, UUIDs and timestamps are sent as extension types"""
+        res: bytes = msgpack.packb(self.model_dump(), default=msgpack_default)
+        return res
+
+
+class WebSocketStats(BaseModel):
+    """the websocket connections open on a worker process"""
+
+    connections: int
+    users: int
+    # connections that haven't sent a message with a userid yet
+    unidentified: int
+    per_user: Dict[UUID, int]
+    max_connections: int
+    max_per_user: int
 
 
 class LogMessages(StrEnum):
+    AnalysisJob = "analysis job"
     AnalysisJobMetadata = "analysis job metadata"
     AnalysisJobStarting = "analysis job starting"
     AnalysisJobCompletionOutput = "analysis completion output"
     BackgroundPollerShutdown = "Background poller is stopping"
+    BackendCircuitClosed = "backend is back, closing the circuit"
+    BackendCircuitOpened = "backend keeps failing, opening the circuit"
+    BackendProbeFailed = "backend is still unavailable"
+    BackendRetrying = "backend call failed, retrying"
+    BackgroundPollerDrainTimeout = "Background poller didn't finish its job in time, requeueing it"
     DeleteNotFound = "delete but not found"
+    JobAbandoned = "running jobs failed too many times, setting to error"
+    JobClaimedElsewhere = "job claimed by another poller"
     JobCompleted = "job completed"
     JobCompletionOutput = "completion output"
     JobDeleted = "job deleted"
     JobFeedback = "job feedback"
+    JobLostClaim = "job was requeued while running, dropping the result"
     JobHistory = "job history"
     JobMetadata = "job metadata"
     JobNew = "new job"
+    JobRequeued = "running jobs put back in the queue"
+    JobRequeuedBackendUnavailable = "backend unavailable, putting the job back in the queue"
     JobStarted = "starting job"
+    JobTimings = "job timings"
     NoJobs = "no jobs found"
     PendingJobs = "pending jobs"
     RejectedResubmit = "rejected resubmit due to job status"
@@ -197,6 +312,8 @@ class LogMessages(StrEnum):
     UserUpdate = "user update"
     WebsocketError = "websocket error"
     WebsocketDisconnected = "websocket disconnected"
+    WebsocketEvicted = "websocket evicted"
+    WebsocketRejected = "websocket rejected"
 
 
 class AnalysisType(StrEnum):
@@ -0,0 +1,162 @@
+""" retries and a circuit breaker around the backend, so a blip doesn't fail every job in the queue """
+
+import asyncio
+from enum import StrEnum
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+from loguru import logger
+import openai
+from pydantic import BaseModel
+
+from chat_ui.models import LogMessages
+
+T = TypeVar("T")
+
+
+class BackendUnavailable(Exception):
+    """the circuit's open, so the backend wasn't even asked"""
+
+
+def is_transient(error: BaseException) -> bool:
+    """errors worth trying again, the backend being down, slow, overloaded or falling over"""
+    if isinstance(error, BackendUnavailable):
+        return True
+    # APITimeoutError is a connection error too
+    if isinstance(error, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)):
+        return True
+    return isinstance(error, httpx.TransportError)
+
+
+class RetryPolicy(BaseModel):
+    # tries in total, including the first one
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+    def delay(self, retry: int, rng: random.Random) -> float:
+        """exponential backoff with full jitter, so pollers that failed together don't retry together"""
+        return rng.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+
+class CircuitState(StrEnum):
+    # calls go through
+    Closed = "closed"
+    # calls fail straight away until reset_timeout's passed
+    Open = "open"
+    # checking whether the backend's back
+    HalfOpen = "half_open"
+
+
+class CircuitBreaker:
+    """opens after failure_threshold failures in a row, then waits reset_timeout before probing the backend"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        name: str = "backend",
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CircuitState.Closed
+        self.failures = 0
+        self.opened_at = 0.0
+        self.lock = threading.Lock()
+
+    def record_success(self) -> None:
+        with self.lock:
+            if self.state != CircuitState.Closed:
+                logger.info(LogMessages.BackendCircuitClosed, backend=self.name, failures=self.failures)
+            self.state = CircuitState.Closed
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            if self.state == CircuitState.HalfOpen or self.failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        if self.state != CircuitState.Open:
+            logger.warning(
+                LogMessages.BackendCircuitOpened,
+                backend=self.name,
+                failures=self.failures,
+                reset_timeout=self.reset_timeout,
+            )
+        self.state = CircuitState.Open
+        self.opened_at = self.clock()
+
+    def allow_request(self) -> bool:
+        """True if calls can go to the backend, an open circuit turns half-open once reset_timeout's up"""
+        with self.lock:
+            if self.state == CircuitState.Open and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = CircuitState.HalfOpen
+            return self.state != CircuitState.Open
+
+
+class BackendResilience:
+    """the retry policy and the circuit breaker together, for everything sent to one backend
+
+    probe is how a half-open circuit checks the backend's back, it should raise if it isn't"""
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        probe: Optional[Callable[[], object]] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.probe = probe
+        self.rng = rng or random.Random()
+
+    def ready(self) -> bool:
+        """whether to claim more work, probing the backend if the circuit's half-open"""
+        if not self.breaker.allow_request():
+            return False
+        if self.breaker.state != CircuitState.HalfOpen:
+            return True
+        if self.probe is None:
+            # nothing to probe with, so the next real call is the probe
+            return True
+        try:
+            self.probe()
+        except Exception as error:
+            logger.warning(LogMessages.BackendProbeFailed, backend=self.breaker.name, error=str(error))
+            self.breaker.record_failure()
+            return False
+        self.breaker.record_success()
+        return True
+
+    async def call(self, func: Callable[[], Awaitable[T]], **log_fields: object) -> T:
+        """await func, retrying transient errors with backoff until the attempts run out or the circuit opens"""
+        retry = 0
+        while True:
+            if not self.breaker.allow_request():
+                raise BackendUnavailable("The backend is unavailable, the circuit breaker is open")
+            try:
+                result = await func()
+            except Exception as error:
+                if not is_transient(error):
+                    raise
+                self.breaker.record_failure()
+                retry += 1
+                if retry >= self.policy.attempts or self.breaker.state == CircuitState.Open:
+                    raise
+                delay = self.policy.delay(retry - 1, self.rng)
+                logger.warning(
+                    LogMessages.BackendRetrying, error=str(error), retry=retry, delay=round(delay, 3), **log_fields
+                )
+                await asyncio.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
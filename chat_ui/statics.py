@@ -0,0 +1,133 @@
+""" static assets, loaded and compressed once at startup so serving them costs almost nothing """
+
+import gzip
+import hashlib
+import mimetypes
+from pathlib import Path
+import re
+from typing import Dict, Optional, Set, Tuple
+
+from fastapi import HTTPException, Request, Response
+from loguru import logger
+
+from chat_ui.utils import etag_matches
+
+try:
+    import brotli  # type: ignore
+
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+STATIC_DIRS = ("css", "img", "js")
+# content-hashed URLs never change, so browsers and proxies can keep them forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# anything else has to be checked with the ETag each time
+REVALIDATE_CACHE_CONTROL = "no-cache"
+# don't bother keeping a compressed copy unless it saves at least this much
+MIN_COMPRESSION_RATIO = 0.9
+
+LOCAL_ASSET_RE = re.compile(r'(?P<attr>src|href)="(?P<url>/(?:css|img|js)/[^"?#]+)"')
+
+
+class StaticAsset:
+    """a file's content, its compressed variants and the validators for it"""
+
+    def __init__(self, content: bytes, media_type: str) -> None:
+        self.content = content
+        self.media_type = media_type
+        digest = hashlib.sha256(content).hexdigest()
+        self.version = digest[:12]
+        self.etag = f'"{digest[:32]}"'
+        # encoding -> (content, etag), each representation gets its own strong ETag
+        self.variants: Dict[str, Tuple[bytes, str]] = {}
+        compressed = gzip.compress(content, compresslevel=9, mtime=0)
+        if len(compressed) < len(content) * MIN_COMPRESSION_RATIO:
+            self.variants["gzip"] = (compressed, f'"{digest[:32]}-gzip"')
+        if HAS_BROTLI:
+            compressed = brotli.compress(content)
+            if len(compressed) < len(content) * MIN_COMPRESSION_RATIO:
+                self.variants["br"] = (compressed, f'"{digest[:32]}-br"')
+
+    def etags(self) -> Set[str]:
+        return {self.etag} | {etag for _, etag in self.variants.values()}
+
+    def pick_encoding(self, accept_encoding: str) -> Optional[str]:
+        """the best variant the client accepts, None means send it as-is"""
+        accepted = {
+            encoding.split(";")[0].strip().lower()
+            for encoding in accept_encoding.split(",")
+            if not encoding.strip().endswith(";q=0")
+        }
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and encoding in accepted:
+                return encoding
+        return None
+
+    def response(self, request: Request, immutable: bool) -> Response:
+        """the right representation for the request, or a 304 if they've already got it"""
+        headers = {
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+        encoding = self.pick_encoding(request.headers.get("accept-encoding", ""))
+        if encoding is None:
+            content, etag = self.content, self.etag
+            # stops GZipMiddleware compressing it again on every request
+            headers["Content-Encoding"] = "identity"
+        else:
+            content, etag = self.variants[encoding]
+            headers["Content-Encoding"] = encoding
+        headers["ETag"] = etag
+
+        if etag_matches(request.headers.get("if-none-match"), self.etags()):
+            del headers["Content-Encoding"]
+            return Response(status_code=304, headers=headers)
+        return Response(content=content, media_type=self.media_type, headers=headers)
+
+
+class StaticAssets:
+    """every file in the static directories, plus index.html with versioned URLs for them"""
+
+    def __init__(self, base_dir: Path) -> None:
+        self.base_dir = base_dir
+        self.assets: Dict[str, StaticAsset] = {}
+        for dirname in STATIC_DIRS:
+            directory = base_dir / dirname
+            if not directory.is_dir():
+                continue
+            for filepath in sorted(directory.iterdir()):
+                if not filepath.is_file():
+                    continue
+                media_type = mimetypes.guess_type(filepath.name)[0] or "application/octet-stream"
+                self.assets[f"/{dirname}/{filepath.name}"] = StaticAsset(filepath.read_bytes(), media_type)
+        self.index = StaticAsset(self.render_index(), "text/html; charset=utf-8")
+        logger.debug(
+            "Loaded static assets",
+            count=len(self.assets),
+            brotli=HAS_BROTLI,
+            size=sum(len(asset.content) for asset in self.assets.values()),
+        )
+
+    def versioned_url(self, url: str) -> str:
+        """the cache-busting URL for an asset, unchanged if we don't know about it"""
+        asset = self.assets.get(url)
+        if asset is None:
+            return url
+        return f"{url}?v={asset.version}"
+
+    def render_index(self) -> bytes:
+        """index.html, with the local asset URLs pointing at their current versions"""
+        html = (self.base_dir / "html" / "index.html").read_text(encoding="utf-8")
+        html = LOCAL_ASSET_RE.sub(
+            lambda match: f'{match.group("attr")}="{self.versioned_url(match.group("url"))}"',
+            html,
+        )
+        return html.encode("utf-8")
+
+    def response(self, request: Request, url: str) -> Response:
+        """serve an asset, it's only cached forever if the request's for the current version"""
+        asset = self.assets.get(url)
+        if asset is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+        return asset.response(request, immutable=request.query_params.get("v") == asset.version)
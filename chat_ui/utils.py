@@ -1,8 +1,13 @@
+from collections import OrderedDict
 from datetime import datetime, UTC
 from functools import lru_cache
-from typing import Tuple, Union
+import hashlib
+import threading
+from typing import Any, Optional, Set, Tuple, Union
+from uuid import UUID
 
 from fastapi import Request, WebSocket
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 from openai import AsyncOpenAI
 import requests
@@ -12,9 +17,9 @@ from sqlmodel import Session, or_, select
 import cmarkgfm  # type: ignore
 import cmarkgfm.cmark  # type: ignore
 
-from chat_ui.config import Config
+from chat_ui.config import get_config
 from chat_ui.db import Jobs
-from chat_ui.models import JobStatus, LogMessages
+from chat_ui.models import JobStatus, LogMessages, dump_json
 
 
 from opentelemetry import trace
@@ -32,11 +37,14 @@ def get_client_ip(request: Union[Request, WebSocket]) -> str:
     return client_ip
 
 
-def get_backend_client() -> AsyncOpenAI:
-    """returns the backend client to the LLM API"""
+def get_backend_client(base_url: Optional[str] = None, api_key: Optional[str] = None) -> AsyncOpenAI:
+    """returns the backend client to the LLM API, backend_url unless it's for another of the pool's backends"""
+    config = get_config()
     return AsyncOpenAI(
-        api_key=Config().backend_api_key,
-        base_url=Config().backend_url,
+        api_key=api_key or config.backend_api_key,
+        base_url=base_url or config.backend_url,
+        # chat_ui.resilience does the retrying
+        max_retries=0,
     )
 
 
@@ -63,6 +71,17 @@ def get_waiting_jobs(session: Session) -> Tuple[datetime, int]:
         return (datetime.now(UTC), 0)
 
 
+class FastJSONResponse(ORJSONResponse):
+    """an orjson response that matches pydantic's JSON, for big lists that don't need validating again"""
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+# bump this whenever html_from_response's output changes, so stored HTML gets re-rendered
+RENDERER_VERSION = 1
+
+
 def html_from_response(input: str) -> str:
     """turn a markdown/HTML response into a HTML string"""
 
@@ -80,15 +99,85 @@ def html_from_response(input: str) -> str:
         return input
 
 
+def render_job_response(job: Jobs) -> None:
+    """store the rendered response on the job, so it doesn't have to be done on every view"""
+    if job.response is None:
+        job.response_html = None
+        job.response_html_version = None
+    else:
+        job.response_html = html_from_response(job.response)
+        job.response_html_version = RENDERER_VERSION
+
+
+class ResponseHTMLCache:
+    """a small LRU of rendered responses for jobs that are being viewed a lot
+
+    keys include the job's updated time, so a resubmitted job won't get an old answer
+    even if another process changed it"""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._items: OrderedDict[Tuple[UUID, Optional[datetime], int], str] = OrderedDict()
+
+    @staticmethod
+    def key(job: Jobs) -> Tuple[UUID, Optional[datetime], int]:
+        return (job.id, job.updated, RENDERER_VERSION)
+
+    def get(self, job: Jobs) -> Optional[str]:
+        key = self.key(job)
+        with self._lock:
+            html = self._items.get(key)
+            if html is not None:
+                self._items.move_to_end(key)
+            return html
+
+    def put(self, job: Jobs, html: str) -> None:
+        key = self.key(job)
+        with self._lock:
+            self._items[key] = html
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+response_html_cache = ResponseHTMLCache(get_config().response_html_cache_size)
+
+
+def get_backend_models(timeout: Optional[float] = None, base_url: Optional[str] = None) -> Any:
+    """the backend's model list, raises if the backend's not answering properly
+
+    base_url picks one of the pool's backends, it's backend_url otherwise"""
+    if base_url is None:
+        base_url = get_config().backend_url
+    response = requests.get(f"{base_url}/models", timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+def first_backend_models() -> Any:
+    """the model list from the first backend in the pool that answers, raises if none of them do"""
+    backends = get_config().backend_pool()
+    if not backends:
+        raise ValueError("No backends are configured")
+    for backend in backends[:-1]:
+        try:
+            return get_backend_models(base_url=backend.url)
+        except Exception as error:
+            logger.warning("Failed to get models from backend", backend=backend.name or backend.url, error=error)
+    return get_backend_models(base_url=backends[-1].url)
+
+
 @trace.get_tracer(__name__).start_as_current_span("get_model_name")
 def get_model_name() -> str:
-    """pulls the model name from the configured llama-cpp-python instance"""
-    base_url = Config().backend_url
-    model_url = f"{base_url}/models"
+    """pulls the model name from the configured llama-cpp-python instance, the first backend that answers"""
     res = "unknown_model"
     try:
-        response = requests.get(model_url)
-        data = response.json()
+        data = first_backend_models()
         if "data" in data:
             data_array = data.get("data", [])
             if len(data_array) != 0:
@@ -100,3 +189,22 @@ def get_model_name() -> str:
         logger.error("Failed to get model name", error=error)
     trace.get_current_span().set_attribute("model_name", res)
     return res
+
+
+def sse_message(event: str, data: str) -> str:
+    """format a server-sent event, data can't contain newlines so send it as JSON"""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def make_etag(*parts: Any) -> str:
+    """a strong ETag from whatever identifies the version of a response"""
+    digest = hashlib.sha256(":".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etags: Set[str]) -> bool:
+    """check an If-None-Match header against the current ETag(s)"""
+    if if_none_match is None:
+        return False
+    requested = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in requested or bool(requested & etags)
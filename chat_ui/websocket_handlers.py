@@ -1,33 +1,82 @@
 from datetime import datetime, UTC, timedelta
 import json
 import traceback
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from fastapi import WebSocket
 from loguru import logger
 
-from pydantic import BaseModel
-from sqlmodel import Session, or_, select
+from pydantic import BaseModel, TypeAdapter
+from sqlmodel import SQLModel, Session, or_, select
 
 from sqlalchemy.exc import NoResultFound
 from chat_ui.db import JobFeedback, Jobs
+from chat_ui.jobevents import jobevents
 
 from chat_ui.models import (
     Job,
     JobStatus,
     LogMessages,
+    WebSocketBatchOperation,
     WebSocketMessage,
     WebSocketMessageType,
+    WebSocketProtocol,
     WebSocketResponse,
     validate_uuid,
 )
 from chat_ui.utils import get_client_ip, get_waiting_jobs
 
+# the most operations we'll run from a single batch message
+WEBSOCKET_MAX_BATCH = 32
+
+
+def negotiate_protocol(websocket: WebSocket) -> Optional[WebSocketProtocol]:
+    """pick the first subprotocol the client offered that we support, None if they didn't offer any we know"""
+    for offered in websocket.scope.get("subprotocols", []):
+        try:
+            return WebSocketProtocol(offered)
+        except ValueError:
+            continue
+    return None
+
+
+async def websocket_send(
+    websocket: WebSocket,
+    response: WebSocketResponse,
+    protocol: Optional[WebSocketProtocol],
+) -> None:
+    """send a response in the encoding the client negotiated, JSON text frames by default"""
+    if protocol == WebSocketProtocol.MsgPack:
+        await websocket.send_bytes(response.as_msgpack())
+    else:
+        await websocket.send_text(response.as_message())
+
+
+def _save(session: Session, item: SQLModel, commit: bool) -> None:
+    """store a change, batches flush and leave the commit until all their operations are done"""
+    session.add(item)
+    if commit:
+        session.commit()
+    else:
+        session.flush()
+    session.refresh(item)
+
+
+def _publish_job_changes(responses: List[WebSocketResponse]) -> None:
+    """tell anything waiting on the jobs that were deleted or resubmitted, once they're committed"""
+    for response in responses:
+        if response.message in (
+            WebSocketMessageType.Delete.value,
+            WebSocketMessageType.Resubmit.value,
+        ) and isinstance(response.payload, Job):
+            jobevents.publish_status(response.payload.id, response.payload.status)
+
 
 async def websocket_resubmit(
     data: WebSocketMessage,
     session: Session,
     websocket: WebSocket,
+    commit: bool = True,
 ) -> WebSocketResponse:
     try:
 
@@ -37,10 +86,14 @@ async def websocket_resubmit(
         if res.status == JobStatus.Error.value:
             res.status = JobStatus.Created.value
             res.response = ""
+            res.response_html = None
+            res.response_html_version = None
             res.updated = datetime.now(UTC)
-            session.add(res)
-            session.commit()
-            session.refresh(res)
+            # it's a fresh start, so it gets all its attempts again
+            res.attempts = None
+            res.claimed_by = None
+            res.lease_expires = None
+            _save(session, res, commit)
             logger.debug(
                 LogMessages.Resubmitted,
                 src_ip=get_client_ip(websocket),
@@ -48,7 +101,7 @@ async def websocket_resubmit(
             )
             response = WebSocketResponse(
                 message=WebSocketMessageType.Resubmit.value,
-                payload=res.model_dump_json(),
+                payload=Job.from_jobs(res, None),
             )
         else:
             logger.debug(
@@ -98,7 +151,7 @@ async def websocket_waiting(
 
         response = WebSocketResponse(
             message=WebSocketMessageType.Waiting.value,
-            payload=json.dumps(waiting, default=str),
+            payload=waiting,
         )
 
     except Exception as error:
@@ -116,7 +169,7 @@ async def websocket_waiting(
 
 
 async def websocket_feedback(
-    data: WebSocketMessage, session: Session, websocket: WebSocket
+    data: WebSocketMessage, session: Session, websocket: WebSocket, commit: bool = True
 ) -> WebSocketResponse:
     """handle a user's feedback response"""
     if data.payload is None:
@@ -126,8 +179,9 @@ async def websocket_feedback(
         )
         return response
     try:
-        feedback = JobFeedback(
-            **json.loads(data.payload or ""), src_ip=get_client_ip(websocket)
+        # table models don't validate on __init__, so the jobid would stay a string
+        feedback = JobFeedback.model_validate(
+            {**json.loads(data.payload or ""), "src_ip": get_client_ip(websocket)}
         )
     except Exception as error:
         logger.error(
@@ -151,9 +205,7 @@ async def websocket_feedback(
                     if field in feedback.model_fields:
                         setattr(existing_feedback, field, getattr(feedback, field))
                 existing_feedback.created = datetime.now(UTC)
-                session.add(existing_feedback)
-                session.commit()
-                session.refresh(existing_feedback)
+                _save(session, existing_feedback, commit)
                 response = WebSocketResponse(
                     message=WebSocketMessageType.Feedback.value, payload="OK"
                 )
@@ -173,9 +225,7 @@ async def websocket_feedback(
                 )
 
         else:
-            session.add(feedback)
-            session.commit()
-            session.refresh(feedback)
+            _save(session, feedback, commit)
             logger.info(
                 LogMessages.JobFeedback,
                 **feedback.model_dump(warnings=False, round_trip=True),
@@ -193,7 +243,7 @@ async def websocket_feedback(
 
 
 async def websocket_delete(
-    data: WebSocketMessage, session: Session, websocket: WebSocket
+    data: WebSocketMessage, session: Session, websocket: WebSocket, commit: bool = True
 ) -> WebSocketResponse:
     if data.payload is not None:
         job_id = validate_uuid(data.payload)
@@ -202,16 +252,14 @@ async def websocket_delete(
             res = session.exec(query).one()
             res.status = JobStatus.Hidden.value
             res.updated = datetime.now(UTC)
-            session.add(res)
-            session.commit()
-            session.refresh(res)
+            _save(session, res, commit)
             logger.info(
                 LogMessages.JobDeleted,
                 src_ip=get_client_ip(websocket),
                 **data.model_dump(),
             )
             response = WebSocketResponse(
-                message=WebSocketMessageType.Delete, payload=res.model_dump_json()
+                message=WebSocketMessageType.Delete, payload=Job.from_jobs(res, None)
             )
         except NoResultFound:
             logger.info(
@@ -277,3 +325,96 @@ async def websocket_jobs(
             message=WebSocketMessageType.Error.value, payload="Failed to get job list!"
         )
     return response
+
+
+async def websocket_batch(
+    data: WebSocketMessage, session: Session, websocket: WebSocket
+) -> WebSocketResponse:
+    """run a list of operations and send all their responses back in one message
+
+    writes are flushed as they happen and committed together at the end, so if the commit fails
+    the whole batch is reported as an error"""
+    try:
+        operations = TypeAdapter(List[WebSocketBatchOperation]).validate_json(
+            data.payload or ""
+        )
+    except Exception as error:
+        logger.error(
+            LogMessages.WebsocketError,
+            error=str(error),
+            src_ip=get_client_ip(websocket),
+            **data.model_dump(),
+        )
+        return WebSocketResponse(
+            message=WebSocketMessageType.Error.value,
+            payload="Failed to parse batch payload!",
+        )
+    if len(operations) > WEBSOCKET_MAX_BATCH:
+        return WebSocketResponse(
+            message=WebSocketMessageType.Error.value,
+            payload=f"Too many operations in batch, maximum is {WEBSOCKET_MAX_BATCH}",
+        )
+
+    responses: List[WebSocketResponse] = []
+    for operation in operations:
+        if operation.message == WebSocketMessageType.Batch.value:
+            responses.append(
+                WebSocketResponse(
+                    message=WebSocketMessageType.Error.value,
+                    payload="Batches can't be nested!",
+                )
+            )
+            continue
+        responses.append(
+            await websocket_dispatch(
+                WebSocketMessage(
+                    userid=data.userid,
+                    message=operation.message,
+                    payload=operation.payload,
+                ),
+                session,
+                websocket,
+                commit=False,
+            )
+        )
+    try:
+        session.commit()
+    except Exception as error:
+        session.rollback()
+        logger.error(
+            LogMessages.WebsocketError,
+            error=str(error),
+            src_ip=get_client_ip(websocket),
+            **data.model_dump(),
+        )
+        return WebSocketResponse(
+            message=WebSocketMessageType.Error.value,
+            payload="Failed to save batch, please try again!",
+        )
+    _publish_job_changes(responses)
+    return WebSocketResponse(message=WebSocketMessageType.Batch.value, payload=responses)
+
+
+async def websocket_dispatch(
+    data: WebSocketMessage, session: Session, websocket: WebSocket, commit: bool = True
+) -> WebSocketResponse:
+    """hand the message off to the handler for its type"""
+    if data.message == WebSocketMessageType.Jobs.value:
+        response = await websocket_jobs(data, session, websocket)
+    elif data.message == WebSocketMessageType.Delete.value:
+        response = await websocket_delete(data, session, websocket, commit=commit)
+    elif data.message == WebSocketMessageType.Resubmit.value:
+        response = await websocket_resubmit(data, session, websocket, commit=commit)
+    elif data.message == WebSocketMessageType.Waiting.value:
+        response = await websocket_waiting(data, session, websocket)
+    elif data.message == WebSocketMessageType.Feedback.value:
+        response = await websocket_feedback(data, session, websocket, commit=commit)
+    elif data.message == WebSocketMessageType.Batch.value:
+        response = await websocket_batch(data, session, websocket)
+    else:
+        response = WebSocketResponse(
+            message=WebSocketMessageType.Error.value, payload="unknown message"
+        )
+    if commit:
+        _publish_job_changes([response])
+    return response
@@ -0,0 +1,210 @@
+""" keeps track of the open websocket connections, enforces limits and drops dead ones """
+
+import asyncio
+import os
+import time
+from typing import Dict, Optional, Set
+from uuid import UUID
+
+from fastapi import WebSocket
+from loguru import logger
+from opentelemetry.metrics import get_meter_provider
+from starlette.websockets import WebSocketState
+
+from chat_ui.config import Config
+from chat_ui.models import (
+    LogMessages,
+    WebSocketMessageType,
+    WebSocketProtocol,
+    WebSocketResponse,
+    WebSocketStats,
+)
+from chat_ui.utils import get_client_ip
+from chat_ui.websocket_handlers import websocket_send
+
+meter = get_meter_provider().get_meter(
+    "chat_ui", os.getenv("CHATUI_APP_VERSION", "latest")
+)
+
+connections_meter = meter.create_up_down_counter(
+    "chatui.websocket.connections",
+    unit="connections",
+    description="Open websocket connections",
+)
+rejected_meter = meter.create_counter(
+    "chatui.websocket.rejected",
+    unit="connections",
+    description="Websocket connections refused because of connection limits",
+)
+evicted_meter = meter.create_counter(
+    "chatui.websocket.evicted",
+    unit="connections",
+    description="Websocket connections dropped for being idle or half-open",
+)
+
+
+class WebSocketConnection:
+    """an accepted websocket and what we know about it"""
+
+    def __init__(
+        self, websocket: WebSocket, protocol: Optional[WebSocketProtocol]
+    ) -> None:
+        self.websocket = websocket
+        self.protocol = protocol
+        self.src_ip = get_client_ip(websocket)
+        self.userid: Optional[UUID] = None
+        self.connected = time.monotonic()
+        self.last_seen = self.connected
+        self.evicted = False
+        # the task running the endpoint, so eviction can interrupt a receive that'll never return
+        self.task = asyncio.current_task()
+        # the heartbeat and the endpoint both send, and frames mustn't interleave
+        self.send_lock = asyncio.Lock()
+
+    def touch(self) -> None:
+        """we've heard from the client"""
+        self.last_seen = time.monotonic()
+
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self.last_seen
+
+    async def send(self, response: WebSocketResponse) -> None:
+        """send in the negotiated encoding, one sender at a time"""
+        async with self.send_lock:
+            await websocket_send(self.websocket, response, self.protocol)
+
+
+class WebSocketManager:
+    """registry of the websockets connected to this worker process"""
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_per_user: int,
+        heartbeat_interval: float,
+        idle_timeout: float,
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_per_user = max_per_user
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+        self.connections: Set[WebSocketConnection] = set()
+        self.users: Dict[UUID, Set[WebSocketConnection]] = {}
+
+    @classmethod
+    def from_config(cls, config: Config) -> "WebSocketManager":
+        return cls(
+            max_connections=config.websocket_max_connections,
+            max_per_user=config.websocket_max_per_user,
+            heartbeat_interval=config.websocket_heartbeat_interval,
+            idle_timeout=config.websocket_idle_timeout,
+        )
+
+    async def connect(
+        self, websocket: WebSocket, protocol: Optional[WebSocketProtocol]
+    ) -> Optional[WebSocketConnection]:
+        """accept the websocket, or refuse it if we're full, returns None if it was refused"""
+        if len(self.connections) >= self.max_connections:
+            rejected_meter.add(1, attributes={"reason": "global"})
+            logger.warning(
+                LogMessages.WebsocketRejected,
+                src_ip=get_client_ip(websocket),
+                reason="global connection limit",
+                connections=len(self.connections),
+            )
+            # closing before accepting sends the client a HTTP 403
+            await websocket.close()
+            return None
+        await websocket.accept(
+            subprotocol=protocol.value if protocol is not None else None
+        )
+        connection = WebSocketConnection(websocket, protocol)
+        self.connections.add(connection)
+        connections_meter.add(1)
+        return connection
+
+    def identify(self, connection: WebSocketConnection, userid: UUID) -> bool:
+        """record who owns the connection the first time we see a userid on it,
+        returns False if that takes the user over their connection limit"""
+        if connection.userid is not None:
+            return True
+        user_connections = self.users.setdefault(userid, set())
+        if len(user_connections) >= self.max_per_user:
+            rejected_meter.add(1, attributes={"reason": "user"})
+            logger.warning(
+                LogMessages.WebsocketRejected,
+                src_ip=connection.src_ip,
+                userid=userid,
+                reason="per-user connection limit",
+                connections=len(user_connections),
+            )
+            return False
+        connection.userid = userid
+        user_connections.add(connection)
+        return True
+
+    def disconnect(self, connection: WebSocketConnection) -> None:
+        """forget about a connection, safe to call more than once"""
+        if connection not in self.connections:
+            return
+        self.connections.discard(connection)
+        if connection.userid is not None:
+            user_connections = self.users.get(connection.userid, set())
+            user_connections.discard(connection)
+            if not user_connections:
+                self.users.pop(connection.userid, None)
+        connections_meter.add(-1)
+
+    async def evict(self, connection: WebSocketConnection, reason: str) -> None:
+        """close the connection and interrupt whatever the endpoint is waiting on"""
+        connection.evicted = True
+        evicted_meter.add(1, attributes={"reason": reason})
+        logger.info(
+            LogMessages.WebsocketEvicted,
+            src_ip=connection.src_ip,
+            userid=connection.userid,
+            reason=reason,
+            idle_seconds=connection.idle_seconds(),
+        )
+        self.disconnect(connection)
+        try:
+            if connection.websocket.application_state == WebSocketState.CONNECTED:
+                await connection.websocket.close(code=1001)
+        except Exception as error:
+            logger.debug("Failed to close evicted websocket", error=str(error))
+        if connection.task is not None:
+            connection.task.cancel()
+
+    async def heartbeat(self, connection: WebSocketConnection) -> None:
+        """pings the client every heartbeat_interval and evicts it if it's been quiet
+        for longer than idle_timeout or the ping can't be sent"""
+        while connection in self.connections:
+            await asyncio.sleep(self.heartbeat_interval)
+            if connection not in self.connections:
+                return
+            if connection.idle_seconds() > self.idle_timeout:
+                await self.evict(connection, "idle")
+                return
+            try:
+                await connection.send(
+                    WebSocketResponse(
+                        message=WebSocketMessageType.Ping.value, payload=int(time.time())
+                    )
+                )
+            except Exception as error:
+                logger.debug("Failed to ping websocket", error=str(error))
+                await self.evict(connection, "half-open")
+                return
+
+    def stats(self) -> WebSocketStats:
+        """counts of the current connections"""
+        return WebSocketStats(
+            connections=len(self.connections),
+            users=len(self.users),
+            unidentified=len([c for c in self.connections if c.userid is None]),
+            per_user={
+                userid: len(connections) for userid, connections in self.users.items()
+            },
+            max_connections=self.max_connections,
+            max_per_user=self.max_per_user,
+        )
@@ -0,0 +1,61 @@
+""" runs the job and analysis poller in its own process, so it can scale separately from the web servers """
+
+import signal
+import threading
+from types import FrameType
+from typing import Optional
+
+import sqlmodel
+from sqlalchemy import Engine
+from loguru import logger
+
+from chat_ui.backgroundpoller import BackgroundPoller
+from chat_ui.config import get_config
+from chat_ui.db import migrate_database
+from chat_ui.utils import get_model_name
+
+
+def start_worker(engine: Engine, model_name: Optional[str] = None) -> BackgroundPoller:
+    """get the database ready and start polling it"""
+    # imported here because importing the package builds the web app
+    from chat_ui import startup_check_outstanding_jobs
+
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    migrate_database(engine)
+    startup_check_outstanding_jobs(engine)
+    poller = BackgroundPoller(engine, model_name or get_model_name())
+    poller.start()
+    return poller
+
+
+def stop_worker(poller: BackgroundPoller, timeout: Optional[float] = None) -> None:
+    """ask the poller to stop, it gets timeout seconds to finish the job it's on before that's requeued"""
+    poller.stop(get_config().shutdown_drain_timeout if timeout is None else timeout)
+
+
+def run_worker() -> None:
+    """run a worker until it gets SIGINT or SIGTERM"""
+    from chat_ui import engine
+
+    config = get_config()
+    if config.enable_background_poller:
+        logger.warning(
+            "enable_background_poller is on, so the web servers are polling for jobs too"
+        )
+    stop = threading.Event()
+
+    def handle_signal(signum: int, frame: Optional[FrameType]) -> None:
+        logger.info("Worker got a signal, stopping", signal=signal.Signals(signum).name)
+        stop.set()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    poller = start_worker(engine)
+    logger.info("Worker started", db_path=config.db_path, backend_url=config.backend_url)
+    # wait in short steps so the signal handler gets a chance to run
+    while not stop.wait(1.0):
+        if not poller.is_alive():
+            logger.error("Background poller died, stopping the worker")
+            break
+    stop_worker(poller)
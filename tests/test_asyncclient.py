@@ -0,0 +1,101 @@
+import asyncio
+import time
+from typing import Any
+from uuid import uuid4
+
+import httpx
+import sqlmodel
+
+from chat_ui import app, get_session
+from chat_ui.asyncclient import AsyncChatUIClient
+from chat_ui.forms import NewJobForm
+from chat_ui.models import JobStatus, RequestType
+
+from . import get_test_session  # noqa: E402,F401
+
+
+class CountingTransport(httpx.ASGITransport):
+    """keeps track of the most requests it's had in flight at once"""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        try:
+            # give the other tasks a chance to pile up
+            await asyncio.sleep(0.01)
+            return await super().handle_async_request(request)
+        finally:
+            self.in_flight -= 1
+
+
+def test_async_client(session: sqlmodel.Session) -> None:
+    """the async client does what the sync one does, without going over its concurrency limit"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    transport = CountingTransport(app=app)
+
+    async def run() -> None:
+        async with AsyncChatUIClient(
+            "testserver",
+            80,
+            skip_tls=True,
+            max_concurrency=4,
+            client=httpx.AsyncClient(transport=transport),
+        ) as client:
+            userids = [uuid4() for _ in range(10)]
+            await client.fan_out(lambda userid: client.create_or_update_user(userid, "async"), userids)
+            chat_sessions = await client.fan_out(client.create_session, userids)
+            assert transport.most_in_flight == 4
+
+            jobs = await client.gather(
+                client.create_job(f"hello {chat_session.userid}", chat_session.sessionid, chat_session.userid)
+                for chat_session in chat_sessions
+                if chat_session is not None
+            )
+            assert all(job is not None and job.status == JobStatus.Created for job in jobs)
+
+            for chat_session in chat_sessions:
+                assert chat_session is not None
+                found = await client.get_jobs(chat_session.userid)
+                assert len(found) == 1
+                # unchanged, so it comes from the ETag cache
+                assert await client.get_jobs(chat_session.userid) == found
+                job = await client.get_job(chat_session.userid, found[0].id)
+                assert job.prompt == f"hello {chat_session.userid}"
+                waited = await client.wait_for_job(chat_session.userid, found[0].id, timeout=0)
+                assert waited.status == JobStatus.Created
+                sessions = await client.get_sessions(chat_session.userid)
+                assert chat_session.sessionid in [found_session.sessionid for found_session in sessions]
+
+            first = chat_sessions[0]
+            assert first is not None
+            forms = [
+                NewJobForm(
+                    userid=first.userid, sessionid=first.sessionid, prompt=f"bulk {i}", request_type=RequestType.Plain
+                )
+                for i in range(5)
+            ]
+            assert len(await client.create_jobs(forms, chunk_size=2)) == 5
+            assert len(await client.get_jobs(first.userid, first.sessionid)) == 6
+            assert transport.most_in_flight <= 4
+
+            # jobs that are being waited on don't take up the slots the other calls need
+            job_id = (await client.get_jobs(first.userid, first.sessionid))[0].id
+            waiters = [
+                asyncio.create_task(client.wait_for_job(first.userid, job_id, timeout=1.0)) for _ in range(8)
+            ]
+            await asyncio.sleep(0.1)
+            start = time.monotonic()
+            await client.get_sessions(first.userid)
+            assert time.monotonic() - start < 0.5
+            assert all(job.status == JobStatus.Created for job in await asyncio.gather(*waiters))
+
+    asyncio.run(run())
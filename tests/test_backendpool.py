@@ -0,0 +1,315 @@
+import asyncio
+import contextlib
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Tuple
+from uuid import uuid4
+
+import openai
+from openai import AsyncOpenAI
+import pytest
+from sqlalchemy import Engine
+import sqlmodel
+
+from chat_ui import backendpool, config, utils
+from chat_ui.backendpool import Backend, BackendPool
+from chat_ui.backgroundpoller import BackgroundPoller
+from chat_ui.config import BackendConfig, Config, ConfigCache
+from chat_ui.db import Jobs
+from chat_ui.fakebackend import FakeBackendServer, FakeBackendSettings
+from chat_ui.models import JobStatus, RequestType
+from chat_ui.resilience import BackendUnavailable, CircuitState
+
+
+@pytest.fixture(name="fakebackends", scope="module")
+def get_fake_backends() -> Iterator[Tuple[FakeBackendServer, FakeBackendServer]]:
+    with FakeBackendServer() as first, FakeBackendServer() as second:
+        yield first, second
+
+
+def pool_config(servers: Tuple[FakeBackendServer, ...], **settings: object) -> Config:
+    return Config(
+        backends=[
+            BackendConfig(url=server.base_url, name=f"fake-{number}", max_concurrency=2)
+            for number, server in enumerate(servers)
+        ],
+        backend_retry_base_delay=0,
+        **settings,  # type: ignore[arg-type]
+    )
+
+
+async def complete(client: AsyncOpenAI, extra_body: Dict[str, Any]) -> str:
+    completion = await client.chat.completions.create(
+        model="fake-model", messages=[{"role": "user", "content": "hello"}], max_tokens=4, extra_body=extra_body
+    )
+    return completion.choices[0].message.content or ""
+
+
+def test_backend_pool_config() -> None:
+    """backend_url's a pool of one unless backends is set"""
+    assert Config(backend_url="http://one/v1", backend_max_concurrency=3).backend_pool() == [
+        BackendConfig(url="http://one/v1", max_concurrency=3)
+    ]
+    backends = [BackendConfig(url="http://one/v1", weight=2), BackendConfig(url="http://two/v1")]
+    assert Config(backend_url="http://one/v1", backends=backends).backend_pool() == backends
+    assert Config(backend_url=None).backend_pool() == []
+
+
+def test_least_outstanding(fakebackends: Tuple[FakeBackendServer, FakeBackendServer]) -> None:
+    """calls go to whichever backend has the fewest in flight, and never more than it can take"""
+    for server in fakebackends:
+        server.backend.reset(FakeBackendSettings(time_to_first_token=0.1, tokens_per_second=0, slots=2))
+    pool = BackendPool.from_config(pool_config(fakebackends))
+
+    async def run() -> List[str]:
+        return await asyncio.gather(*(pool.call(complete) for _ in range(12)))
+
+    assert all(asyncio.run(run()))
+    for server, stats in zip(fakebackends, pool.stats()):
+        assert server.backend.stats.completions == stats.requests == 6
+        assert server.backend.stats.max_in_flight == 2
+        assert stats.outstanding == 0
+        assert stats.mean_seconds is not None and stats.mean_seconds >= 0.1
+
+    # a busy backend gets passed over
+    first, second = pool.backends
+    first.outstanding = 1
+    backend = pool.acquire(set())
+    assert backend is second
+    pool.release(backend)
+    first.outstanding = 0
+
+
+def test_weights(fakebackends: Tuple[FakeBackendServer, FakeBackendServer]) -> None:
+    pool = BackendPool.from_config(pool_config(fakebackends))
+    first, second = pool.backends
+    first.settings = first.settings.model_copy(update={"weight": 3.0, "max_concurrency": 8})
+    second.settings = second.settings.model_copy(update={"max_concurrency": 8})
+    picked = [pool.acquire(set()) for _ in range(8)]
+    assert picked.count(first) == 6
+    assert picked.count(second) == 2
+
+
+def test_ejection(fakebackends: Tuple[FakeBackendServer, FakeBackendServer]) -> None:
+    """a failing backend's taken out of the pool, its calls go to the other one, and it comes back once it's fixed"""
+    broken, working = fakebackends
+    broken.backend.reset(FakeBackendSettings(time_to_first_token=0, tokens_per_second=0, error_rate=1.0))
+    working.backend.reset(FakeBackendSettings(time_to_first_token=0, tokens_per_second=0))
+    pool = BackendPool.from_config(pool_config(fakebackends, backend_circuit_failure_threshold=2))
+    ejected = pool.backends[0]
+
+    async def run(calls: int) -> None:
+        for _ in range(calls):
+            assert await pool.call(complete)
+
+    asyncio.run(run(6))
+    assert broken.backend.stats.errors == 2
+    assert ejected.resilience.breaker.state == CircuitState.Open
+    assert working.backend.stats.completions == 6
+    assert pool.capacity() == 2
+    stats = pool.stats()[0]
+    assert (stats.requests, stats.errors) == (2, 2)
+
+    broken.backend.settings.error_rate = 0.0
+    ejected.resilience.breaker.opened_at -= 60
+    assert pool.capacity() == 4
+    asyncio.run(run(4))
+    assert broken.backend.stats.completions > 0
+
+    # with both of them down the calls fail until both circuits open, then there's nowhere to send them
+    for server in fakebackends:
+        server.backend.settings.error_rate = 1.0
+
+    async def run_failing(calls: int) -> None:
+        for _ in range(calls):
+            with contextlib.suppress(openai.InternalServerError):
+                await pool.call(complete)
+
+    with pytest.raises(BackendUnavailable):
+        asyncio.run(run_failing(10))
+    assert not pool.ready()
+
+
+def test_session_affinity(fakebackends: Tuple[FakeBackendServer, FakeBackendServer]) -> None:
+    """a session sticks to its backend and slot while that backend has room"""
+    config = pool_config(fakebackends, backend_routing="session_affinity")
+    config.backends[0].slots = 4
+    pool = BackendPool.from_config(config)
+    first, second = pool.backends
+    sessions = [str(uuid4()) for _ in range(40)]
+
+    def route(affinity: str) -> Backend:
+        backend = pool.acquire(set(), affinity)
+        assert backend is not None
+        pool.release(backend)
+        return backend
+
+    placed = {affinity: route(affinity) for affinity in sessions}
+    assert all(route(affinity) is backend for affinity, backend in placed.items())
+    assert 10 < sum(backend is first for backend in placed.values()) < 30
+
+    # llama.cpp gets the same slot every time, the other one doesn't take id_slot
+    with first.extra_body(sessions[0]) as extra_body:
+        assert extra_body["cache_prompt"] is True and 0 <= extra_body["id_slot"] < 4
+        # while it's busy another call for the session takes whichever slot's free rather than wait for it
+        with first.extra_body(sessions[0]) as busy:
+            assert busy == {"cache_prompt": True, "id_slot": -1}
+    with first.extra_body(sessions[0]) as again:
+        assert again == extra_body
+    with second.extra_body(sessions[0]) as unslotted, first.extra_body(None) as unaffine:
+        assert unslotted == {} == unaffine
+
+    # when a backend's full or ejected its sessions go to the next one along
+    first.outstanding = 2
+    assert all(route(affinity) is second for affinity in sessions)
+    first.outstanding = 0
+    for _ in range(second.resilience.breaker.failure_threshold):
+        second.resilience.breaker.record_failure()
+    assert all(route(affinity) is first for affinity in sessions)
+    second.resilience.breaker.record_success()
+
+    # least_outstanding ignores it
+    pool.routing = "least_outstanding"
+    assert {route(affinity) for affinity in sessions} == {first}
+
+
+def test_session_affinity_reuses_prompt_cache(fakebackends: Tuple[FakeBackendServer, FakeBackendServer]) -> None:
+    """a conversation that stays on one slot only has its new turns read, spread around it's read over and over"""
+
+    async def converse(pool: BackendPool, affinities: List[str], turns: int) -> None:
+        histories: Dict[str, List[Any]] = {affinity: [] for affinity in affinities}
+        for turn in range(turns):
+            for affinity, history in histories.items():
+                history.append({"role": "user", "content": f"turn {turn} " + "word " * 50})
+
+                async def chat(client: AsyncOpenAI, extra_body: Dict[str, Any]) -> str:
+                    completion = await client.chat.completions.create(
+                        model="fake-model", messages=history, max_tokens=16, extra_body=extra_body
+                    )
+                    return completion.choices[0].message.content or ""
+
+                history.append({"role": "assistant", "content": await pool.call(chat, affinity=affinity)})
+
+    def prompt_tokens_processed(routing: str) -> int:
+        for server in fakebackends:
+            server.backend.reset(FakeBackendSettings(time_to_first_token=0, tokens_per_second=0, slots=4))
+        config = pool_config(fakebackends, backend_routing=routing)
+        for backend in config.backends:
+            backend.slots = 4
+        asyncio.run(converse(BackendPool.from_config(config), [str(uuid4()) for _ in range(4)], 6))
+        return sum(server.backend.stats.prompt_tokens_processed for server in fakebackends)
+
+    spread = prompt_tokens_processed("least_outstanding")
+    pinned = prompt_tokens_processed("session_affinity")
+    assert pinned < spread / 2
+    assert sum(server.backend.stats.prompt_tokens_cached for server in fakebackends) > pinned
+
+
+def test_session_affinity_busy_slot(fakebackends: Tuple[FakeBackendServer, FakeBackendServer]) -> None:
+    """two calls for one session at once don't queue up behind each other on its slot"""
+    fakebackends[0].backend.reset(FakeBackendSettings(time_to_first_token=0.3, tokens_per_second=0, slots=2))
+    config = pool_config(fakebackends[:1], backend_routing="session_affinity")
+    config.backends[0].slots = 2
+    pool = BackendPool.from_config(config)
+    affinity = str(uuid4())
+
+    async def both() -> float:
+        start = time.perf_counter()
+        await asyncio.gather(pool.call(complete, affinity=affinity), pool.call(complete, affinity=affinity))
+        await pool.close_clients()
+        return time.perf_counter() - start
+
+    assert asyncio.run(both()) < 0.55
+    assert fakebackends[0].backend.stats.max_in_flight == 2
+    assert pool.backends[0].busy_slots == set()
+
+
+def run_jobs(engine: Engine, poller: BackgroundPoller, count: int) -> float:
+    """how long the poller takes to get through count jobs"""
+    with sqlmodel.Session(engine) as session:
+        for _ in range(count):
+            session.add(
+                Jobs(
+                    userid=uuid4(),
+                    sessionid=uuid4(),
+                    client_ip="127.0.0.1",
+                    prompt="Hello world",
+                    request_type=RequestType.Plain,
+                )
+            )
+        session.commit()
+    start = time.perf_counter()
+    deadline = start + 30
+    while time.perf_counter() < deadline:
+        with sqlmodel.Session(engine) as session:
+            poller.process_outstanding_prompts(session)
+            if session.exec(sqlmodel.select(Jobs).where(Jobs.status != JobStatus.Complete.value)).first() is None:
+                break
+    return time.perf_counter() - start
+
+
+def test_poller_scales_with_backends(
+    fakebackends: Tuple[FakeBackendServer, FakeBackendServer], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """the poller runs a job for every backend slot at once, so two backends get through the queue twice as fast"""
+    for server in fakebackends:
+        server.backend.reset(FakeBackendSettings(time_to_first_token=0.2, tokens_per_second=0, slots=1))
+    monkeypatch.setattr(config, "config_cache", ConfigCache())
+    monkeypatch.setenv("CHATUI_BACKEND_URL", fakebackends[0].base_url)
+    engine = sqlmodel.create_engine(f"sqlite:///{tmp_path / 'scaling.sqlite3'}")
+    sqlmodel.SQLModel.metadata.create_all(engine)
+
+    one = run_jobs(engine, BackgroundPoller(engine, "fake-model"), 6)
+    monkeypatch.setenv("CHATUI_BACKENDS", json.dumps([{"url": server.base_url} for server in fakebackends]))
+    two = run_jobs(engine, BackgroundPoller(engine, "fake-model"), 6)
+
+    assert one >= 6 * 0.2
+    assert two < one * 0.75
+    assert all(server.backend.stats.max_in_flight == 1 for server in fakebackends)
+    assert fakebackends[1].backend.stats.completions >= 2
+
+
+def test_poller_closes_clients(
+    fakebackends: Tuple[FakeBackendServer, FakeBackendServer], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """every job has its own event loop, so its clients are closed when it's done rather than piling up"""
+    fakebackends[0].backend.reset(FakeBackendSettings(time_to_first_token=0, tokens_per_second=0))
+    monkeypatch.setattr(config, "config_cache", ConfigCache())
+    monkeypatch.setenv("CHATUI_BACKEND_URL", fakebackends[0].base_url)
+    made: List[AsyncOpenAI] = []
+
+    def get_backend_client(**kwargs: Any) -> AsyncOpenAI:
+        made.append(utils.get_backend_client(**kwargs))
+        return made[-1]
+
+    monkeypatch.setattr(backendpool, "get_backend_client", get_backend_client)
+    engine = sqlmodel.create_engine(f"sqlite:///{tmp_path / 'clients.sqlite3'}")
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    poller = BackgroundPoller(engine, "fake-model")
+
+    run_jobs(engine, poller, 6)
+    assert len(made) == 6
+    assert all(client.is_closed() for client in made)
+    assert len(poller.pool.backends[0].clients) == 0
+
+
+def test_stats_from_threads(fakebackends: Tuple[FakeBackendServer, FakeBackendServer]) -> None:
+    """every prompt thread counts its calls on the same backend, and none of them are lost"""
+    fakebackends[0].backend.reset(FakeBackendSettings(time_to_first_token=0, tokens_per_second=0))
+    pool = BackendPool.from_config(pool_config(fakebackends[:1]))
+
+    async def calls() -> None:
+        for _ in range(5):
+            await pool.call(complete)
+        await pool.close_clients()
+
+    threads = [threading.Thread(target=asyncio.run, args=(calls(),)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = pool.stats()[0]
+    assert (stats.requests, stats.errors, stats.outstanding) == (20, 0, 0)
+    assert stats.mean_seconds is not None
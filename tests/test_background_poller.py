@@ -1,12 +1,19 @@
-from datetime import UTC, datetime
-from uuid import uuid4
+from datetime import UTC, datetime, timedelta
+import time
+from uuid import UUID, uuid4
 import pytest
 import requests
 from sqlmodel import Session
-from chat_ui.backgroundpoller import BackgroundPoller
+from chat_ui.backgroundpoller import (
+    HISTORY_TOKEN_LIMIT,
+    BackgroundJob,
+    BackgroundPoller,
+    JobTimer,
+    queue_wait,
+)
 from chat_ui.config import Config
 from chat_ui.db import JobAnalysis, Jobs
-from chat_ui.models import AnalysisType, RequestType
+from chat_ui.models import AnalysisType, JobStatus, RequestType
 from . import get_test_session  # noqa: E402,F401
 
 
@@ -61,3 +68,84 @@ def test_log_JobAnalysis() -> None:
 
     testobject.log()
     testobject.model_dump(mode="json")
+
+
+def test_job_timer() -> None:
+    """phases add up, and come out rounded for the metadata"""
+    timer = JobTimer()
+    with timer.phase("history_load"):
+        time.sleep(0.01)
+    timer.record("generation", 0.25)
+    timer.record("generation", 0.5)
+    timings = timer.as_metadata()
+    assert timings["history_load"] >= 0.01
+    assert timings["generation"] == 0.75
+    timer.observe()
+
+    # sqlite gives us naive datetimes
+    created = datetime.now(UTC) - timedelta(seconds=30)
+    assert 29 < queue_wait(created.replace(tzinfo=None)) < 60
+    assert queue_wait(datetime.now(UTC) + timedelta(seconds=30)) == 0
+
+
+def test_job_created_default() -> None:
+    """each job gets its own created time, not the one from when the module was imported"""
+    job = Jobs(
+        userid=uuid4(),
+        sessionid=uuid4(),
+        client_ip="127.0.0.1",
+        prompt="Hello world",
+        request_type=RequestType.Plain,
+    )
+    assert datetime.now(UTC) - job.created < timedelta(seconds=5)
+
+
+def make_turn(userid: UUID, sessionid: UUID, number: int, words: int = 50) -> Jobs:
+    return Jobs(
+        userid=userid,
+        sessionid=sessionid,
+        client_ip="127.0.0.1",
+        prompt=f"turn {number} " + "word " * words,
+        response="answer " * words,
+        request_type=RequestType.Plain,
+        status=JobStatus.Complete.value,
+        created=datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=number),
+    )
+
+
+def test_check_history_tokens_prefix_stable() -> None:
+    """the history's trimmed to the limit, and as the session grows it starts with the same job for a while"""
+    userid, sessionid = uuid4(), uuid4()
+    turns = [make_turn(userid, sessionid, number) for number in range(40)]
+    firsts = []
+    for length in range(1, len(turns)):
+        job = BackgroundJob.from_jobs(turns[length])
+        job.history = turns[:length]
+        job, history_tokens, total = BackgroundPoller.check_history_tokens(job)
+        assert total == sum(tokens for _, tokens in history_tokens) <= HISTORY_TOKEN_LIMIT
+        # only ever the oldest ones go
+        assert job.history == turns[length - len(job.history) : length]
+        firsts.append(job.history[0].id)
+    # each turn's about 400 tokens, so the cut moves every two or three turns rather than every turn
+    assert len(set(firsts)) < len(firsts) / 2
+
+
+def test_add_related_jobs(session: Session) -> None:
+    """the history's the finished jobs from earlier in the same session, oldest first"""
+    userid, sessionid = uuid4(), uuid4()
+    turns = [make_turn(userid, sessionid, number) for number in range(5)]
+    other_session = make_turn(userid, uuid4(), 1)
+    unfinished = make_turn(userid, sessionid, 5)
+    unfinished.status = JobStatus.Error.value
+    current = make_turn(userid, sessionid, 6)
+    current.status = JobStatus.Running.value
+    later = make_turn(userid, sessionid, 7)
+    # inserted out of order, so it's the sort doing it
+    for job in [*reversed(turns), other_session, unfinished, current, later]:
+        session.add(job)
+    session.commit()
+
+    backgroundjob = BackgroundJob.from_jobs(current)
+    bgp = BackgroundPoller(engine=None, model_name="testing")  # type: ignore
+    bgp.add_related_jobs(session, backgroundjob)
+    assert [job.id for job in backgroundjob.history] == [job.id for job in turns]
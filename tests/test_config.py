@@ -1,4 +1,11 @@
+import json
 import os
+from pathlib import Path
+import time
+
+import pytest
+
+from chat_ui import config
 from chat_ui.config import Config
 
 
@@ -23,3 +30,35 @@ def test_config_admin_password() -> None:
     testconfig = Config()
 
     assert testconfig.admin_password is None
+
+
+def test_get_config_reloads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """the shared config is reused until the environment or the config file changes"""
+    config_file = tmp_path / "chat-ui.json"
+    config_file.write_text(json.dumps({"backend_url": "http://first/v1", "config_reload_interval": 0.01}))
+    monkeypatch.setattr(config, "CONFIG_FILENAME", str(config_file))
+    monkeypatch.delenv("CHATUI_BACKEND_URL", raising=False)
+    monkeypatch.setattr(config, "config_cache", config.ConfigCache())
+
+    first = config.get_config()
+    assert first.backend_url == "http://first/v1"
+    assert config.get_config() is first
+
+    monkeypatch.setenv("CHATUI_BACKEND_TEMPERATURE", "0.1")
+    changed = config.get_config()
+    assert changed is not first
+    assert changed.backend_temperature == 0.1
+
+    config_file.write_text(json.dumps({"backend_url": "http://second/v1", "config_reload_interval": 0.01}))
+    os.utime(config_file, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+    time.sleep(0.05)
+    assert config.get_config().backend_url == "http://second/v1"
+
+    # with reloading turned off, file changes are ignored
+    config_file.write_text(json.dumps({"backend_url": "http://third/v1", "config_reload_interval": 0}))
+    os.utime(config_file, ns=(time.time_ns(), time.time_ns() + 2_000_000_000))
+    time.sleep(0.05)
+    assert config.get_config().backend_url == "http://third/v1"
+    config_file.write_text(json.dumps({"backend_url": "http://fourth/v1", "config_reload_interval": 0}))
+    os.utime(config_file, ns=(time.time_ns(), time.time_ns() + 3_000_000_000))
+    assert config.get_config().backend_url == "http://third/v1"
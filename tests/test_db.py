@@ -3,12 +3,15 @@ from fastapi.testclient import TestClient
 from loguru import logger
 
 import pytest
+import sqlalchemy
 import sqlmodel
 from chat_ui.db import (
     ChatUiDBSession,
     JobFeedback,
     FeedbackSuccess,
     Jobs,
+    add_missing_columns,
+    add_missing_indexes,
     migrate_database,
 )
 
@@ -126,3 +129,46 @@ def test_migrate_database() -> None:
     sqlmodel.SQLModel.metadata.create_all(engine)
     migrate_database(engine)
     startup_check_outstanding_jobs(engine)
+
+
+def test_add_missing_columns() -> None:
+    """columns added to the models turn up in existing tables"""
+    engine = sqlmodel.create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=sqlmodel.StaticPool,
+    )
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(sqlalchemy.text("ALTER TABLE jobs DROP COLUMN response_html"))
+        connection.execute(
+            sqlalchemy.text("ALTER TABLE jobs DROP COLUMN response_html_version")
+        )
+
+    add_missing_columns(engine)
+    columns = {
+        column["name"] for column in sqlalchemy.inspect(engine).get_columns("jobs")
+    }
+    assert {"response_html", "response_html_version"} <= columns
+    # and again is fine
+    add_missing_columns(engine)
+
+
+def test_add_missing_indexes() -> None:
+    """indexes added to the models get created on existing tables"""
+    engine = sqlmodel.create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=sqlmodel.StaticPool,
+    )
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(sqlalchemy.text("DROP INDEX ix_jobs_status"))
+        connection.execute(sqlalchemy.text("DROP INDEX ix_jobfeedback_jobid"))
+
+    add_missing_indexes(engine)
+    inspector = sqlalchemy.inspect(engine)
+    assert "ix_jobs_status" in {index["name"] for index in inspector.get_indexes("jobs")}
+    assert "ix_jobfeedback_jobid" in {index["name"] for index in inspector.get_indexes("jobfeedback")}
+    # and again is fine
+    add_missing_indexes(engine)
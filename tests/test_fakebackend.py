@@ -0,0 +1,171 @@
+import asyncio
+import json
+import time
+from typing import Any, Generator
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from openai import AsyncOpenAI, InternalServerError
+import pytest
+import sqlmodel
+
+from chat_ui import config
+from chat_ui.backgroundpoller import BackgroundPoller
+from chat_ui.config import ConfigCache
+from chat_ui.db import Jobs
+from chat_ui.fakebackend import FakeBackend, FakeBackendServer, FakeBackendSettings
+from chat_ui.models import JobStatus, RequestType
+
+from . import get_test_session  # noqa: E402,F401
+
+
+@pytest.fixture(name="fakebackend", scope="module")
+def get_fake_backend() -> Generator[FakeBackendServer, None, None]:
+    with FakeBackendServer(FakeBackendSettings(time_to_first_token=0.1, tokens_per_second=200, slots=2)) as server:
+        yield server
+
+
+def test_fake_backend_api() -> None:
+    """the OpenAI-ish endpoints answer, and the same prompt gets the same answer"""
+    backend = FakeBackend(FakeBackendSettings(time_to_first_token=0, tokens_per_second=0, response_tokens=8))
+    client = TestClient(backend.app)
+
+    res = client.get("/v1/models")
+    assert res.json()["data"][0]["id"] == "fake-model"
+
+    body = {"model": "fake-model", "messages": [{"role": "user", "content": "hello there"}]}
+    first = client.post("/v1/chat/completions", json=body).json()
+    second = client.post("/v1/chat/completions", json=body).json()
+    assert first["choices"][0]["message"]["content"] == second["choices"][0]["message"]["content"]
+    assert first["usage"] == {"prompt_tokens": 2, "completion_tokens": 8, "total_tokens": 10}
+    assert client.post("/v1/chat/completions", json={**body, "max_tokens": 3}).json()["usage"]["completion_tokens"] == 3
+
+    tokens = client.post("/extras/tokenize", json={"input": "hello there"}).json()["tokens"]
+    assert len(tokens) == 2
+    assert client.post("/extras/tokenize/count", json={"input": "hello there"}).json() == {"count": 2}
+
+    # a slot only reads what's after the prompt it's got cached, and only when it's asked to cache,
+    # slot 0 hasn't been used yet
+    cached = {**body, "cache_prompt": True, "id_slot": 0}
+    assert client.post("/v1/chat/completions", json=cached).json()["timings"]["prompt_n"] == 2
+    longer = {**cached, "messages": [*body["messages"], {"role": "user", "content": "and again"}]}
+    assert client.post("/v1/chat/completions", json=longer).json()["timings"] == {
+        "id_slot": 0,
+        "cache_n": 2,
+        "prompt_n": 2,
+    }
+    assert client.post("/v1/chat/completions", json={**longer, "cache_prompt": False}).json()["timings"]["cache_n"] == 0
+
+    # injected errors
+    backend.reset(FakeBackendSettings(error_rate=1.0))
+    assert client.post("/v1/chat/completions", json=body).status_code == 500
+    assert client.get("/fake/stats").json()["errors"] == 1
+
+
+def test_fake_backend_streaming(fakebackend: FakeBackendServer) -> None:
+    """the openai client can stream from it, and the timings and slots are what we asked for"""
+    fakebackend.backend.reset()
+
+    async def stream() -> tuple[float, str, int]:
+        client = AsyncOpenAI(base_url=fakebackend.base_url, api_key="none")
+        start = time.perf_counter()
+        first_token = None
+        text = []
+        usage = 0
+        response = await client.chat.completions.create(
+            model="fake-model",
+            messages=[{"role": "user", "content": "hello"}],
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        async for chunk in response:
+            if chunk.usage is not None:
+                usage = chunk.usage.completion_tokens
+            for choice in chunk.choices:
+                if choice.delta.content:
+                    first_token = first_token or time.perf_counter()
+                    text.append(choice.delta.content)
+        assert first_token is not None
+        return first_token - start, "".join(text), usage
+
+    async def run() -> list[tuple[float, str, int]]:
+        return list(await asyncio.gather(*(stream() for _ in range(4))))
+
+    results = asyncio.run(run())
+    for time_to_first_token, text, usage in results:
+        assert time_to_first_token >= 0.1
+        assert len(text.split()) == usage == 32
+    # only two at once, so half of them waited for a whole completion before starting
+    assert sorted(result[0] for result in results)[-1] >= 0.1 + 31 / 200
+    assert fakebackend.backend.stats.max_in_flight == 2
+    assert fakebackend.backend.stats.completions == 4
+
+    fakebackend.backend.reset(FakeBackendSettings(error_rate=1.0))
+
+    async def fail() -> None:
+        client = AsyncOpenAI(base_url=fakebackend.base_url, api_key="none", max_retries=0)
+        await client.chat.completions.create(model="fake-model", messages=[{"role": "user", "content": "hello"}])
+
+    with pytest.raises(InternalServerError):
+        asyncio.run(fail())
+
+
+def test_fake_backend_slots(fakebackend: FakeBackendServer) -> None:
+    """like llama.cpp, a completion that asks for a busy slot waits for it, even with another slot free"""
+    fakebackend.backend.reset(FakeBackendSettings(time_to_first_token=0.2, tokens_per_second=0, slots=2))
+
+    async def complete(id_slot: int) -> int:
+        client = AsyncOpenAI(base_url=fakebackend.base_url, api_key="none")
+        completion: Any = await client.chat.completions.create(
+            model="fake-model", messages=[{"role": "user", "content": "hello"}], extra_body={"id_slot": id_slot}
+        )
+        await client.close()
+        return int(completion.timings["id_slot"])
+
+    async def run(*id_slots: int) -> tuple[float, list[int]]:
+        start = time.perf_counter()
+        slots = await asyncio.gather(*(complete(id_slot) for id_slot in id_slots))
+        return time.perf_counter() - start, list(slots)
+
+    seconds, slots = asyncio.run(run(0, 0))
+    assert seconds >= 0.4 and slots == [0, 0]
+    assert fakebackend.backend.stats.max_in_flight == 1
+    # -1 is any free slot
+    seconds, slots = asyncio.run(run(0, -1))
+    assert seconds < 0.35 and sorted(slots) == [0, 1]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_poller_with_fake_backend(
+    fakebackend: FakeBackendServer, session: sqlmodel.Session, monkeypatch: pytest.MonkeyPatch, stream: bool
+) -> None:
+    """a job goes all the way through the background poller"""
+    fakebackend.backend.reset(FakeBackendSettings(time_to_first_token=0.05, tokens_per_second=500))
+    monkeypatch.setattr(config, "config_cache", ConfigCache())
+    monkeypatch.setenv("CHATUI_BACKEND_URL", fakebackend.base_url)
+    monkeypatch.setenv("CHATUI_BACKEND_STREAM", str(stream).lower())
+
+    job = Jobs(
+        userid=uuid4(),
+        sessionid=uuid4(),
+        client_ip="127.0.0.1",
+        prompt="Hello world",
+        request_type=RequestType.Plain,
+    )
+    session.add(job)
+    session.commit()
+    poller = BackgroundPoller(engine=session.get_bind(), model_name="fake-model")  # type: ignore[arg-type]
+    poller.process_prompt(job, session)
+
+    assert job.status == JobStatus.Complete
+    assert job.response is not None and len(job.response.split()) == 32
+    assert job.job_metadata is not None
+    metadata = json.loads(job.job_metadata)
+    assert metadata["usage"]["completion_tokens"] == 32
+    timings = metadata["timings"]
+    for phase in ("queue_wait", "claim", "history_load", "token_budget", "generation"):
+        assert phase in timings
+    if stream:
+        assert timings["time_to_first_token"] >= 0.05
+    else:
+        assert timings["generation"] >= 0.05
@@ -0,0 +1,212 @@
+import asyncio
+import threading
+import time
+from typing import Any
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+import pytest
+import sqlmodel
+
+import chat_ui
+from chat_ui import app, get_session
+from chat_ui.db import ChatUiDBSession, Jobs, Users
+from chat_ui.enums import Urls
+from chat_ui.jobevents import JobEventBroker, jobevents
+from chat_ui.models import JobDetail, JobEvent, JobEventType, JobStatus, RequestType
+
+from . import get_test_session  # noqa: E402,F401
+
+
+def make_job(session: sqlmodel.Session, status: JobStatus) -> Jobs:
+    user = Users(userid=uuid4(), name="waiter")
+    chat_session = ChatUiDBSession(userid=user.userid, name="waiting")
+    job = Jobs(
+        userid=user.userid,
+        sessionid=chat_session.sessionid,
+        client_ip="127.0.0.1",
+        prompt="hello world",
+        request_type=RequestType.Plain,
+        status=status.value,
+    )
+    session.add(user)
+    session.add(chat_session)
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    return job
+
+
+def test_broker_publish_from_thread() -> None:
+    """events published from another thread turn up on the subscriber's loop"""
+    broker = JobEventBroker()
+    job_id = uuid4()
+
+    async def wait_for_event() -> str:
+        with broker.subscription(job_id) as events:
+            assert broker.subscriber_count(job_id) == 1
+            threading.Timer(
+                0.05, broker.publish_status, (job_id, JobStatus.Complete.value)
+            ).start()
+            event = await asyncio.wait_for(events.get(), timeout=5)
+        assert event.event == JobEventType.Status
+        assert event.status is not None
+        return event.status
+
+    assert asyncio.run(wait_for_event()) == JobStatus.Complete
+    assert broker.subscriber_count(job_id) == 0
+    # nobody's listening, this shouldn't do anything
+    broker.publish_status(job_id, JobStatus.Complete.value)
+
+
+def test_job_wait(session: sqlmodel.Session) -> None:
+    """long-polling a job returns when it's done, or when the time's up"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+
+    # finished jobs come straight back
+    job = make_job(session, JobStatus.Complete)
+    res = client.get(f"{Urls.Jobs}/{job.userid}/{job.id}/wait?timeout=30")
+    assert res.status_code == 200
+    assert JobDetail.model_validate(res.json()).status == JobStatus.Complete
+
+    # so does anything if you don't want to wait
+    job = make_job(session, JobStatus.Created)
+    start = time.monotonic()
+    res = client.get(f"{Urls.Jobs}/{job.userid}/{job.id}/wait?timeout=0")
+    assert res.status_code == 200
+    assert JobDetail.model_validate(res.json()).status == JobStatus.Created
+    assert time.monotonic() - start < 5
+
+    res = client.get(f"{Urls.Jobs}/{job.userid}/{job.id}/wait?timeout=-1")
+    assert res.status_code == 422
+    res = client.get(f"{Urls.Jobs}/{job.userid}/{uuid4()}/wait?timeout=0")
+    assert res.status_code == 404
+
+    # something else finishes the job while we're waiting
+    def finish_job() -> None:
+        with sqlmodel.Session(session.get_bind()) as other_session:
+            other_job = other_session.exec(
+                sqlmodel.select(Jobs).where(Jobs.id == job.id)
+            ).one()
+            other_job.status = JobStatus.Complete.value
+            other_job.response = "done!"
+            other_session.add(other_job)
+            other_session.commit()
+        jobevents.publish_status(job.id, JobStatus.Complete.value)
+
+    threading.Timer(0.3, finish_job).start()
+    start = time.monotonic()
+    res = client.get(f"{Urls.Jobs}/{job.userid}/{job.id}/wait?timeout=30")
+    assert res.status_code == 200
+    detail = JobDetail.model_validate(res.json())
+    assert detail.status == JobStatus.Complete
+    assert detail.response is not None
+    assert time.monotonic() - start < 5
+
+
+def test_job_wait_ignores_tokens(session: sqlmodel.Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    """a streaming job's tokens don't make the long-poll read the job again, only it finishing does"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+    reads: list[float] = []
+    read_job_detail = chat_ui.get_job_detail
+
+    def get_job_detail(*args: Any) -> JobDetail:
+        reads.append(time.monotonic())
+        return read_job_detail(*args)
+
+    monkeypatch.setattr(chat_ui, "get_job_detail", get_job_detail)
+    job = make_job(session, JobStatus.Running)
+
+    def stream_job() -> None:
+        jobevents.publish_status(job.id, JobStatus.Running.value)
+        for number in range(50):
+            jobevents.publish_token(job.id, f"token {number}")
+            time.sleep(0.005)
+        with sqlmodel.Session(session.get_bind()) as other_session:
+            other_job = other_session.get_one(Jobs, job.id)
+            other_job.status = JobStatus.Complete.value
+            other_job.response = "done!"
+            other_session.add(other_job)
+            other_session.commit()
+        jobevents.publish_status(job.id, JobStatus.Complete.value)
+
+    threading.Timer(0.3, stream_job).start()
+    res = client.get(f"{Urls.Jobs}/{job.userid}/{job.id}/wait?timeout=30")
+    assert JobDetail.model_validate(res.json()).status == JobStatus.Complete
+    # the first look, and the one when it finished
+    assert len(reads) == 2
+
+
+def read_events(client: TestClient, url: str) -> list[tuple[str, str]]:
+    """pull the (event, data) pairs out of an event stream"""
+    events = []
+    with client.stream("GET", url) as res:
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("text/event-stream")
+        event = None
+        for line in res.iter_lines():
+            if line.startswith("event: "):
+                event = line.removeprefix("event: ")
+            elif line.startswith("data: ") and event is not None:
+                events.append((event, line.removeprefix("data: ")))
+    return events
+
+
+def test_job_events(session: sqlmodel.Session) -> None:
+    """the event stream sends status changes and tokens, then the finished job"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+
+    res = client.get(f"{Urls.Jobs}/{uuid4()}/{uuid4()}/events")
+    assert res.status_code == 404
+
+    job = make_job(session, JobStatus.Complete)
+    events = read_events(client, f"{Urls.Jobs}/{job.userid}/{job.id}/events")
+    assert [event for event, _ in events] == [JobEventType.Status, JobEventType.Complete]
+    assert JobDetail.model_validate_json(events[-1][1]).id == job.id
+
+    job = make_job(session, JobStatus.Created)
+
+    def run_job() -> None:
+        jobevents.publish_status(job.id, JobStatus.Running.value)
+        for text in ["hello ", "**world**"]:
+            jobevents.publish_token(job.id, text)
+        with sqlmodel.Session(session.get_bind()) as other_session:
+            other_job = other_session.exec(
+                sqlmodel.select(Jobs).where(Jobs.id == job.id)
+            ).one()
+            other_job.status = JobStatus.Complete.value
+            other_job.response = "hello **world**"
+            other_session.add(other_job)
+            other_session.commit()
+        jobevents.publish_status(job.id, JobStatus.Complete.value)
+
+    threading.Timer(0.3, run_job).start()
+    events = read_events(client, f"{Urls.Jobs}/{job.userid}/{job.id}/events")
+    assert [event for event, _ in events] == [
+        JobEventType.Status,
+        JobEventType.Status,
+        JobEventType.Token,
+        JobEventType.Token,
+        JobEventType.Status,
+        JobEventType.Complete,
+    ]
+    tokens = [JobEvent.model_validate_json(data).text for event, data in events[2:4]]
+    assert tokens == ["hello ", "**world**"]
+    detail = JobDetail.model_validate_json(events[-1][1])
+    assert detail.status == JobStatus.Complete
+    assert detail.response is not None and "<strong>world</strong>" in detail.response
@@ -1,14 +1,18 @@
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID, uuid4
 
 from fastapi.testclient import TestClient
+import sqlalchemy
 import sqlmodel
 
 from chat_ui import app, get_session
-from chat_ui.db import ChatUiDBSession
+from chat_ui.client import ChatUIClient, ETagCache
+from chat_ui.db import ChatUiDBSession, FeedbackSuccess, JobFeedback, Jobs, Users
 from chat_ui.enums import Urls
 from chat_ui.forms import NewJobForm
-from chat_ui.models import Job, RequestType
+from chat_ui.models import Job, JobDetail, JobStatus, RequestType
+from chat_ui.utils import RENDERER_VERSION, response_html_cache
 
 from . import get_test_session  # noqa: E402,F401
 
@@ -110,3 +114,298 @@ def test_jobs(session: sqlmodel.Session) -> None:
         f"{Urls.Jobs}/{userid}/{jobinfo.id.hex.replace('f', 'e').replace('e', '1')}"
     )
     assert res.status_code == 404
+
+
+def test_job_detail_rendering(session: sqlmodel.Session) -> None:
+    """responses are rendered once, stored, and re-rendered when the renderer changes"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+    response_html_cache.clear()
+
+    userid = uuid4()
+    chat_session = ChatUiDBSession(userid=userid)
+    job = Jobs(
+        userid=userid,
+        sessionid=chat_session.sessionid,
+        client_ip="127.0.0.1",
+        prompt="hello world",
+        response="hello **world**",
+        request_type=RequestType.Plain,
+        status=JobStatus.Complete.value,
+        updated=datetime.now(UTC),
+    )
+    session.add(Users(userid=userid, name="renderer"))
+    session.add(chat_session)
+    session.add(job)
+    session.commit()
+    job_id = job.id
+    assert job.response_html is None
+
+    # the first view renders it and saves it
+    res = client.get(f"{Urls.Jobs}/{userid}/{job_id}")
+    assert res.status_code == 200
+    detail = JobDetail.model_validate(res.json())
+    assert detail.response is not None and "<strong>world</strong>" in detail.response
+    stored = session.exec(sqlmodel.select(Jobs).where(Jobs.id == job_id)).one()
+    assert stored.response_html is not None
+    assert stored.response_html_version == RENDERER_VERSION
+
+    # the next one comes out of the cache
+    stored.response_html = "not this"
+    session.add(stored)
+    session.commit()
+    res = client.get(f"{Urls.Jobs}/{userid}/{job_id}")
+    assert "<strong>world</strong>" in res.json()["response"]
+
+    # an old renderer version gets re-rendered
+    response_html_cache.clear()
+    stored = session.exec(sqlmodel.select(Jobs).where(Jobs.id == job_id)).one()
+    stored.response_html_version = RENDERER_VERSION - 1
+    session.add(stored)
+    session.commit()
+    res = client.get(f"{Urls.Jobs}/{userid}/{job_id}")
+    assert "<strong>world</strong>" in res.json()["response"]
+
+    # if the job changes, the cache doesn't get in the way
+    stored = session.exec(sqlmodel.select(Jobs).where(Jobs.id == job_id)).one()
+    stored.response = "goodbye _world_"
+    stored.response_html = None
+    stored.updated = datetime.now(UTC)
+    session.add(stored)
+    session.commit()
+    res = client.get(f"{Urls.Jobs}/{userid}/{job_id}")
+    assert "<em>world</em>" in res.json()["response"]
+
+
+def test_job_details_batch(session: sqlmodel.Session) -> None:
+    """a session's jobs and their feedback come back in one request, with a fixed number of queries"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+
+    userid = uuid4()
+    chat_session = ChatUiDBSession(userid=userid)
+    other_session = ChatUiDBSession(userid=userid)
+    session.add(Users(userid=userid, name="batcher"))
+    session.add(chat_session)
+    session.add(other_session)
+    job_ids = []
+    for index in range(10):
+        job = Jobs(
+            userid=userid,
+            sessionid=chat_session.sessionid,
+            client_ip="127.0.0.1",
+            prompt=f"prompt {index}",
+            response=f"response **{index}**",
+            request_type=RequestType.Plain,
+            status=JobStatus.Complete.value,
+            created=datetime.now(UTC),
+            updated=datetime.now(UTC),
+        )
+        session.add(job)
+        job_ids.append(job.id)
+    session.add(
+        Jobs(
+            userid=userid,
+            sessionid=other_session.sessionid,
+            client_ip="127.0.0.1",
+            prompt="somewhere else",
+            request_type=RequestType.Plain,
+        )
+    )
+    session.add(
+        JobFeedback(
+            jobid=job_ids[3], success=FeedbackSuccess.Yes, comment="nice", src_ip="127.0.0.1"
+        )
+    )
+    session.commit()
+    sessionid = chat_session.sessionid
+    response_html_cache.clear()
+    # render them all once, so the stored HTML gets used below
+    res = client.get(f"{Urls.Jobs}/{userid}?sessionid={sessionid}")
+    assert res.status_code == 200
+    response_html_cache.clear()
+
+    statements = []
+
+    def count_statements(*args: Any) -> None:
+        statements.append(args[2])
+
+    engine = session.get_bind()
+    sqlalchemy.event.listen(engine, "before_cursor_execute", count_statements)
+    try:
+        res = client.get(f"{Urls.Jobs}/{userid}?sessionid={sessionid}")
+    finally:
+        sqlalchemy.event.remove(engine, "before_cursor_execute", count_statements)
+    assert res.status_code == 200
+    details = [JobDetail.model_validate(job) for job in res.json()]
+    assert [detail.id for detail in details] == job_ids
+    assert details[3].feedback_comment == "nice"
+    assert details[0].response is not None and "<strong>0</strong>" in details[0].response
+    # the joined query, then loading each job's stored HTML since the cache is empty
+    assert len(statements) <= 1 + len(job_ids)
+
+    # now it's cached it's just the one query
+    statements.clear()
+    sqlalchemy.event.listen(engine, "before_cursor_execute", count_statements)
+    try:
+        res = client.get(f"{Urls.Jobs}/{userid}?sessionid={sessionid}")
+    finally:
+        sqlalchemy.event.remove(engine, "before_cursor_execute", count_statements)
+    assert len(statements) == 1
+
+    # by id, and sparse
+    res = client.get(
+        f"{Urls.Jobs}/{userid}",
+        params={"job_ids": [job_ids[1].hex, job_ids[2].hex], "fields": "status,prompt"},
+    )
+    assert res.status_code == 200
+    assert res.json() == [
+        {"id": str(job_ids[1]), "status": "complete", "prompt": "prompt 1"},
+        {"id": str(job_ids[2]), "status": "complete", "prompt": "prompt 2"},
+    ]
+
+    # someone else's jobs don't show up
+    res = client.get(f"{Urls.Jobs}/{uuid4()}", params={"job_ids": [job_ids[1].hex]})
+    assert res.json() == []
+
+    assert client.get(f"{Urls.Jobs}/{userid}").status_code == 422
+    res = client.get(f"{Urls.Jobs}/{userid}", params={"job_ids": [job_ids[1].hex], "fields": "nope"})
+    assert res.status_code == 422
+
+
+def test_conditional_get(session: sqlmodel.Session) -> None:
+    """unchanged jobs and sessions get a 304, and the client serves them from its cache"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+
+    userid = uuid4()
+    assert client.post(Urls.User, json={"userid": userid.hex, "name": "poller"}).status_code == 200
+    sessionid = ChatUiDBSession.model_validate(client.post(f"/session/new/{userid}").json()).sessionid
+    res = client.post(
+        "/job",
+        json=NewJobForm(
+            userid=userid, sessionid=sessionid, prompt="hello", request_type=RequestType.Plain
+        ).model_dump(mode="json"),
+    )
+    job_id = Job.model_validate(res.json()).id
+
+    for url in [
+        f"{Urls.Jobs}?userid={userid}",
+        f"{Urls.Jobs}?userid={userid}&sessionid={sessionid}",
+        f"{Urls.Sessions}/{userid}",
+        f"{Urls.Jobs}/{userid}/{job_id}",
+    ]:
+        res = client.get(url)
+        assert res.status_code == 200, url
+        assert res.headers["cache-control"] == "no-cache"
+        etag = res.headers["etag"]
+        res = client.get(url, headers={"if-none-match": etag})
+        assert res.status_code == 304, url
+        assert res.content == b""
+        assert res.headers["etag"] == etag
+
+    # changing things changes the validators
+    etag = client.get(f"{Urls.Jobs}?userid={userid}").headers["etag"]
+    job = session.exec(sqlmodel.select(Jobs).where(Jobs.id == job_id)).one()
+    job.status = JobStatus.Complete.value
+    job.response = "done"
+    job.updated = datetime.now(UTC)
+    session.add(job)
+    session.commit()
+    assert client.get(f"{Urls.Jobs}?userid={userid}", headers={"if-none-match": etag}).status_code == 200
+
+    etag = client.get(f"{Urls.Sessions}/{userid}").headers["etag"]
+    res = client.post(f"/session/{userid}/{sessionid}", json={"name": "renamed"})
+    assert res.status_code == 200
+    res = client.get(f"{Urls.Sessions}/{userid}", headers={"if-none-match": etag})
+    assert res.status_code == 200
+    assert res.json()[0]["name"] == "renamed"
+
+    # the client remembers the ETags
+    chatui_client = ChatUIClient("testserver", 80, skip_tls=True, session=client)  # type: ignore[arg-type]
+    first = chatui_client.get_jobs(userid)
+    assert len(chatui_client.etag_cache) == 1
+    assert chatui_client.get_jobs(userid) == first
+    assert chatui_client.get_job(userid, job_id).response == "<p>done</p>\n"
+    assert chatui_client.get_job(userid, job_id).status == JobStatus.Complete
+    assert len(chatui_client.etag_cache) == 2
+
+    # and only as many as it's allowed
+    chatui_client = ChatUIClient(
+        "testserver", 80, skip_tls=True, session=client, etag_cache_size=1  # type: ignore[arg-type]
+    )
+    chatui_client.get_jobs(userid)
+    chatui_client.get_job(userid, job_id)
+    assert len(chatui_client.etag_cache) == 1
+
+
+def test_etag_cache() -> None:
+    """the least recently used url goes first"""
+    cache = ETagCache(maxsize=2)
+    cache.put("/a", '"a"', 1)
+    cache.put("/b", '"b"', 2)
+    assert cache.get("/a") == ('"a"', 1)
+    cache.put("/c", '"c"', 3)
+    assert cache.get("/b") is None
+    assert cache.get("/a") == ('"a"', 1)
+    assert len(cache) == 2
+
+
+def test_bulk_jobs(session: sqlmodel.Session) -> None:
+    """lots of jobs in one request, all or nothing"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+
+    userid = uuid4()
+    assert client.post(Urls.User, json={"userid": userid.hex, "name": "bulk"}).status_code == 200
+    sessionid = ChatUiDBSession.model_validate(client.post(f"/session/new/{userid}").json()).sessionid
+    forms = [
+        NewJobForm(userid=userid, sessionid=sessionid, prompt=f"prompt {i}", request_type=RequestType.Plain)
+        for i in range(5)
+    ]
+
+    res = client.post(Urls.JobBulk, json=[form.model_dump(mode="json") for form in forms])
+    assert res.status_code == 200
+    created = [Job.model_validate(job) for job in res.json()]
+    assert len(created) == len(forms)
+    assert all(job.status == JobStatus.Created and job.sessionid == sessionid for job in created)
+    bulk_created = res.json()[0]["created"]
+
+    res = client.get(f"{Urls.Jobs}?userid={userid}")
+    assert {job["id"] for job in res.json()} == {str(job.id) for job in created}
+
+    # one bad job and none of them get created
+    payload = [form.model_dump(mode="json") for form in forms]
+    payload[2]["request_type"] = "nonsense"
+    assert client.post(Urls.JobBulk, json=payload).status_code == 422
+    assert len(client.get(f"{Urls.Jobs}?userid={userid}").json()) == len(forms)
+
+    # too many at once
+    res = client.post(Urls.JobBulk, json=[forms[0].model_dump(mode="json")] * 1001)
+    assert res.status_code == 422
+
+    # the client splits them up
+    chatui_client = ChatUIClient("testserver", 80, skip_tls=True, session=client)  # type: ignore[arg-type]
+    created = chatui_client.create_jobs(forms, chunk_size=2)
+    assert len(created) == len(forms)
+    assert len(client.get(f"{Urls.Jobs}?userid={userid}").json()) == len(forms) * 2
+
+    # the timestamps come out the same way as they do from the single job endpoint
+    single = client.post(Urls.Job, json=forms[0].model_dump(mode="json")).json()
+    assert datetime.fromisoformat(single["created"]).tzinfo == datetime.fromisoformat(bulk_created).tzinfo
@@ -0,0 +1,110 @@
+import asyncio
+from datetime import UTC, datetime
+import json
+
+import httpx
+import pytest
+from sqlalchemy import Engine
+import sqlmodel
+
+from chat_ui import app, get_session
+from chat_ui.asyncclient import AsyncChatUIClient
+from chat_ui.db import Jobs
+from chat_ui.jobevents import jobevents
+from chat_ui.loadtest import (
+    JobSample,
+    LatencySummary,
+    LoadTest,
+    LoadTestMode,
+    LoadTestReport,
+    LoadTestSettings,
+    percentile_of,
+)
+from chat_ui.models import JobStatus
+
+from . import get_test_session  # noqa: E402,F401
+
+
+def test_latency_summary() -> None:
+    """percentiles interpolate between ranks and ignore missing values"""
+    assert percentile_of([1.0], 99) == 1.0
+    assert percentile_of([1.0, 2.0, 3.0, 4.0, 5.0], 50) == 3.0
+    assert percentile_of([0.0, 10.0], 90) == pytest.approx(9.0)
+
+    summary = LatencySummary.from_values([None, 3.0, 1.0, 2.0])
+    assert summary.count == 3
+    assert summary.mean == 2.0
+    assert (summary.min, summary.max) == (1.0, 3.0)
+    assert summary.percentiles["p50"] == 2.0
+    assert LatencySummary.from_values([None]).count == 0
+
+    report = LoadTestReport.from_samples(
+        LoadTestSettings(),
+        "http://localhost",
+        datetime.now(UTC),
+        2.0,
+        [
+            JobSample(mode=LoadTestMode.Http, submit=0.1, complete=1.0, status=JobStatus.Complete),
+            JobSample(mode=LoadTestMode.Http, submit=0.2, status=JobStatus.Error),
+            JobSample(mode=LoadTestMode.Websocket, error="timed out"),
+        ],
+    )
+    assert report.jobs_completed == 1
+    assert report.jobs_failed == 2
+    assert report.errors == {"timed out": 1, "job status error": 1}
+    assert report.throughput == 0.5
+    assert report.time_to_complete.count == 1
+    assert "timed out" in report.summary()
+
+
+async def fake_poller(engine: Engine, stop: asyncio.Event) -> None:
+    """does what the background poller would, without a backend"""
+    while not stop.is_set():
+        with sqlmodel.Session(engine) as session:
+            for job in session.exec(sqlmodel.select(Jobs).where(Jobs.status == JobStatus.Created.value)).all():
+                job.status = JobStatus.Running.value
+                session.add(job)
+                session.commit()
+                jobevents.publish_status(job.id, job.status)
+                await asyncio.sleep(0.01)
+                job.status = JobStatus.Complete.value
+                job.response = "done"
+                job.updated = datetime.now(UTC)
+                job.job_metadata = json.dumps({"timings": {"queue_wait": 0.25}})
+                session.add(job)
+                session.commit()
+                jobevents.publish_status(job.id, job.status)
+        await asyncio.sleep(0.01)
+
+
+def test_loadtest_http(session: sqlmodel.Session) -> None:
+    """simulated users following their jobs with server-sent events"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    settings = LoadTestSettings(users=4, jobs_per_user=2, think_time=0.01, mode=LoadTestMode.Http, job_timeout=10)
+
+    async def run() -> LoadTestReport:
+        stop = asyncio.Event()
+        poller = asyncio.create_task(fake_poller(session.get_bind(), stop))  # type: ignore[arg-type]
+        async with AsyncChatUIClient(
+            "testserver", 80, skip_tls=True, client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+        ) as client:
+            report = await LoadTest(client, settings).run()
+        stop.set()
+        await poller
+        return report
+
+    report = asyncio.run(run())
+    assert report.jobs_submitted == 8
+    assert report.jobs_completed == 8, report.errors
+    assert report.error_rate == 0
+    assert report.submit.count == 8
+    assert report.time_to_first_update.count == 8
+    assert report.queue_wait.percentiles["p50"] == 0.25
+    time_to_complete = report.time_to_complete
+    assert time_to_complete.min is not None and report.submit.min is not None
+    assert time_to_complete.min >= report.submit.min
+    LoadTestReport.model_validate_json(report.model_dump_json())
@@ -0,0 +1,111 @@
+import io
+import json
+import threading
+from uuid import uuid4
+
+from loguru import logger
+import pytest
+
+from chat_ui import config
+from chat_ui.config import ConfigCache
+from chat_ui.logs import BufferedSink, log_enabled, log_payload, payload_fields, sink, truncate
+
+
+class StuckStream(io.StringIO):
+    """a stream that doesn't take anything until it's released, like a full pipe"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.released = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.released.wait(10)
+        return super().write(text)
+
+
+def test_buffered_sink() -> None:
+    """records turn up as JSON lines, in order, once they're flushed"""
+    stream = io.StringIO()
+    sink = BufferedSink(batch_size=4, stream=stream)
+    handler = logger.add(sink)
+    userid = uuid4()
+    try:
+        for number in range(10):
+            logger.info("hello", number=number, userid=userid)
+        sink.flush()
+    finally:
+        logger.remove(handler)
+        sink.close()
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [record["number"] for record in records] == list(range(10))
+    assert records[0]["userid"] == str(userid)
+    assert sink.dropped == 0
+
+
+def test_buffered_sink_drops() -> None:
+    """a stuck stream doesn't stop the caller, the overflow is dropped and reported"""
+    stream = StuckStream()
+    sink = BufferedSink(max_queue=5, batch_size=1, stream=stream)
+    handler = logger.add(sink)
+    try:
+        for number in range(50):
+            logger.info("hello", number=number)
+        assert sink.dropped > 0
+        stream.released.set()
+    finally:
+        logger.remove(handler)
+        sink.close()
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    written = [record for record in records if "number" in record]
+    reported = sum(record.get("dropped", 0) for record in records)
+    assert len(written) + sink.dropped == 50
+    assert reported == sink.dropped
+
+    # once it's closed, records are written straight away
+    handler = logger.add(sink)
+    try:
+        logger.info("after close")
+    finally:
+        logger.remove(handler)
+    assert json.loads(stream.getvalue().splitlines()[-1])["message"] == "after close"
+
+
+def test_truncate() -> None:
+    """long strings get cut down wherever they are"""
+    assert truncate("a" * 10, 4) == "aaaa... (6 more characters)"
+    assert truncate("a" * 10, 0) == "a" * 10
+    assert truncate({"history": [{"content": "b" * 10, "role": "user"}], "tokens": 5}, 4) == {
+        "history": [{"content": "bbbb... (6 more characters)", "role": "user"}],
+        "tokens": 5,
+    }
+
+
+def test_payload_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    """big fields are truncated, and sampling can drop them"""
+    monkeypatch.setattr(config, "config_cache", ConfigCache())
+    monkeypatch.setenv("CHATUI_LOG_MAX_FIELD_LENGTH", "5")
+    monkeypatch.setenv("CHATUI_LOG_PAYLOAD_SAMPLE_RATE", "1")
+    assert payload_fields(response="hello world") == {"response": "hello... (6 more characters)"}
+    monkeypatch.setenv("CHATUI_LOG_PAYLOAD_SAMPLE_RATE", "0")
+    assert payload_fields(response="hello world") == {}
+
+
+def test_log_payload(monkeypatch: pytest.MonkeyPatch) -> None:
+    """the info job records are left alone unless they're asked to be cut down"""
+    monkeypatch.setattr(config, "config_cache", ConfigCache())
+    monkeypatch.setenv("CHATUI_LOG_MAX_FIELD_LENGTH", "5")
+    assert log_payload({"response": "hello world"}) == {"response": "hello world"}
+    monkeypatch.setenv("CHATUI_LOG_JOB_RECORD_MAX_LENGTH", "5")
+    assert log_payload({"response": "hello world"}) == {"response": "hello... (6 more characters)"}
+
+
+def test_log_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """the level check follows what the sink was added at"""
+    monkeypatch.setattr(sink, "level_no", logger.level("INFO").no)
+    assert not log_enabled("DEBUG")
+    assert log_enabled("INFO")
+    assert log_enabled("ERROR")
+    monkeypatch.setattr(sink, "level_no", logger.level("DEBUG").no)
+    assert log_enabled("DEBUG")
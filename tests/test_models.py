@@ -1,10 +1,22 @@
+from datetime import UTC, datetime
 import os
+from typing import List
 from uuid import uuid4
 
+from pydantic import TypeAdapter
 import pytest
 from chat_ui.backgroundpoller import BackgroundJob
 from chat_ui.db import Jobs
-from chat_ui.models import Job, JobDetail, JobStatus, RequestType, WebSocketMessage
+from chat_ui.models import (
+    Job,
+    JobDetail,
+    JobStatus,
+    RequestType,
+    WebSocketMessage,
+    WebSocketMessageType,
+    WebSocketResponse,
+)
+from chat_ui.utils import FastJSONResponse
 
 os.environ["CHATUI_BACKEND_URL"] = "test"
 
@@ -66,6 +78,28 @@ def test_job_from_jobs() -> None:
     jobdetail = Job.from_jobs(jobs, None)
     assert jobdetail.sessionid == sessionid
     assert jobdetail.id == id
+    # the fast path for lists has to match
+    assert Job.dict_from_jobs(jobs) == jobdetail.model_dump()
+
+
+def test_fast_json_matches_pydantic() -> None:
+    """the orjson output is the same JSON pydantic would produce"""
+    jobs = Jobs(
+        client_ip="1.2.3.4",
+        sessionid=uuid4(),
+        userid=uuid4(),
+        request_type=RequestType.Plain.value,
+        prompt="hello world",
+        created=datetime.now(UTC),
+        updated=datetime.now(UTC).replace(tzinfo=None),
+    )
+    response = WebSocketResponse(
+        message=WebSocketMessageType.Jobs.value, payload=[Job.from_jobs(jobs, None)]
+    )
+    assert response.as_message() == response.model_dump_json()
+    assert FastJSONResponse([Job.dict_from_jobs(jobs)]).body == TypeAdapter(
+        List[Job]
+    ).dump_json([Job.from_jobs(jobs, None)])
 
 
 def test_end_to_end_backgroundjob() -> None:
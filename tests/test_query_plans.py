@@ -0,0 +1,220 @@
+import asyncio
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any, Dict, Generator, Iterator, List, Tuple
+from uuid import UUID, uuid4
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+import pytest
+from sqlalchemy import Engine, event, func
+import sqlmodel
+
+from chat_ui import app, config, get_session, startup_check_outstanding_jobs
+from chat_ui.backgroundpoller import BackgroundJob, BackgroundPoller
+from chat_ui.config import ConfigCache
+from chat_ui.datagen import DataGenSettings, generate_data
+from chat_ui.db import ChatUiDBSession, JobAnalysis, JobFeedback, Jobs, Users
+from chat_ui.enums import Urls
+from chat_ui.models import AnalysisType, JobStatus, WebSocketMessageType
+from chat_ui.utils import get_waiting_jobs
+
+# slowest any single query can be on the test database, in seconds, timings flake on busy CI runners so
+# it's only checked when this is set, the scans always are
+QUERY_BUDGET = float(os.getenv("CHATUI_TEST_QUERY_BUDGET", "0"))
+ADMIN_PASSWORD = "query-plans"
+
+
+class RecordedQuery(BaseModel):
+    statement: str
+    parameters: Any
+    seconds: float
+    plan: List[str] = []
+
+
+class QueryRecorder:
+    """keeps every query that goes through the engine, with how long it took"""
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.queries: List[RecordedQuery] = []
+        self.started: Dict[int, float] = {}
+
+    def before(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        self.started[id(cursor)] = time.perf_counter()
+
+    def after(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        seconds = time.perf_counter() - self.started.pop(id(cursor), time.perf_counter())
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            self.queries.append(RecordedQuery(statement=statement, parameters=parameters, seconds=seconds))
+
+    @contextmanager
+    def recording(self) -> Iterator["QueryRecorder"]:
+        event.listen(self.engine, "before_cursor_execute", self.before)
+        event.listen(self.engine, "after_cursor_execute", self.after)
+        try:
+            yield self
+        finally:
+            event.remove(self.engine, "before_cursor_execute", self.before)
+            event.remove(self.engine, "after_cursor_execute", self.after)
+
+    def explain(self) -> None:
+        with self.engine.connect() as connection:
+            for query in self.queries:
+                rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {query.statement}", query.parameters).all()
+                query.plan = [row[-1] for row in rows]
+
+
+def table_scans(plan: List[str]) -> List[str]:
+    """the steps that read a whole table, SEARCH means it used an index"""
+    return [step for step in plan if step.startswith("SCAN") and step != "SCAN CONSTANT ROW"]
+
+
+@pytest.fixture(name="large_engine", scope="module")
+def get_large_engine(tmp_path_factory: pytest.TempPathFactory) -> Generator[Engine, None, None]:
+    path: Path = tmp_path_factory.mktemp("query_plans") / "chatui.sqlite3"
+    engine = sqlmodel.create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    generate_data(engine, DataGenSettings(users=200, seed=45))
+    yield engine
+    engine.dispose()
+
+
+def test_generate_data(large_engine: Engine) -> None:
+    """the generated data's linked up and has the shape we asked for"""
+    with sqlmodel.Session(large_engine) as session:
+        users = session.scalar(sqlmodel.select(func.count(sqlmodel.col(Users.userid))))
+        sessions = session.scalar(sqlmodel.select(func.count(ChatUiDBSession.sessionid)))  # type: ignore[arg-type]
+        jobs = session.scalar(sqlmodel.select(func.count(Jobs.id)))
+        assert users == 200
+        assert sessions is not None and sessions >= users
+        assert jobs is not None and jobs >= sessions
+        statuses = dict(session.exec(sqlmodel.select(Jobs.status, func.count(Jobs.id)).group_by(Jobs.status)).all())
+        assert statuses[JobStatus.Created.value] == 10
+        assert statuses[JobStatus.Complete.value] > statuses[JobStatus.Hidden.value] > 0
+        orphans = session.scalar(
+            sqlmodel.select(func.count(JobFeedback.id)).where(  # type: ignore[arg-type]
+                ~sqlmodel.col(JobFeedback.jobid).in_(sqlmodel.select(Jobs.id))
+            )
+        )
+        assert orphans == 0
+        assert session.exec(sqlmodel.select(JobAnalysis)).first() is not None
+
+
+def busiest_session(engine: Engine) -> Tuple[UUID, UUID, UUID]:
+    """the userid, sessionid and the last finished job of the session with the most jobs"""
+    with sqlmodel.Session(engine) as session:
+        sessionid, _ = session.exec(
+            sqlmodel.select(Jobs.sessionid, func.count(Jobs.id))
+            .group_by(sqlmodel.col(Jobs.sessionid))
+            .order_by(func.count(Jobs.id).desc())
+        ).first() or (None, 0)
+        job = session.exec(
+            sqlmodel.select(Jobs)
+            .where(Jobs.sessionid == sessionid, Jobs.status == JobStatus.Complete.value)
+            .order_by(sqlmodel.col(Jobs.created).desc())
+        ).first()
+        assert job is not None
+        return job.userid, job.sessionid, job.id
+
+
+def run_everything(engine: Engine, userid: UUID, sessionid: UUID, jobid: UUID) -> None:
+    """make every request the web UI, the client and the poller would"""
+
+    def get_session_override() -> Generator[sqlmodel.Session, None, None]:
+        with sqlmodel.Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+    admin = {"admin-password": ADMIN_PASSWORD}
+    try:
+        assert client.post(Urls.User, json={"userid": userid.hex, "name": "renamed"}).status_code == 200
+        assert client.post(Urls.User, json={"userid": uuid4().hex, "name": "new"}).status_code == 200
+        assert client.get(f"{Urls.Sessions}/{userid}").status_code == 200
+        assert client.post(f"/session/{userid}/{sessionid}", json={"name": "renamed"}).status_code == 200
+        assert client.get(Urls.Jobs, params={"userid": userid.hex, "sessionid": sessionid.hex}).status_code == 200
+        assert client.get(Urls.Jobs, params={"userid": userid.hex, "since": time.time() - 3600}).status_code == 200
+        assert client.get(f"{Urls.Jobs}/{userid}", params={"sessionid": sessionid.hex}).status_code == 200
+        assert client.get(f"{Urls.Jobs}/{userid}", params={"job_ids": [jobid.hex]}).status_code == 200
+        assert client.get(f"{Urls.Jobs}/{userid}/{jobid}").status_code == 200
+        assert client.get(f"{Urls.Jobs}/{userid}/{jobid}/wait", params={"timeout": 0}).status_code == 200
+        assert client.get(f"{Urls.Jobs}/{userid}/{jobid}/events").status_code == 200
+        assert client.get(Urls.Analyses, params={"userid": userid.hex}).status_code == 200
+        assert client.get(Urls.AdminJobs, params={"userid": userid.hex}, headers=admin).status_code == 200
+        assert client.get(Urls.AdminJobs, params={"sessionid": sessionid.hex}, headers=admin).status_code == 200
+        assert client.get(Urls.AdminSessions, params={"userid": userid.hex}, headers=admin).status_code == 200
+        assert client.get(Urls.AdminUsers, params={"userid": userid.hex}, headers=admin).status_code == 200
+        assert client.get(Urls.AdminAnalyses, params={"userid": userid.hex}, headers=admin).status_code == 200
+
+        with client.websocket_connect("/ws") as websocket:
+            for message, payload, expected in (
+                (WebSocketMessageType.Jobs, json.dumps({"sessionid": str(sessionid)}), WebSocketMessageType.Jobs),
+                (WebSocketMessageType.Waiting, None, WebSocketMessageType.Waiting),
+                (
+                    WebSocketMessageType.Feedback,
+                    json.dumps({"jobid": str(jobid), "success": 1, "comment": "good"}),
+                    WebSocketMessageType.Feedback,
+                ),
+                (
+                    WebSocketMessageType.Feedback,
+                    json.dumps({"jobid": str(jobid), "success": 0, "comment": "ok"}),
+                    WebSocketMessageType.Feedback,
+                ),
+                # it's finished, so this gets turned down after looking it up
+                (WebSocketMessageType.Resubmit, str(jobid), WebSocketMessageType.Error),
+                (WebSocketMessageType.Delete, str(jobid), WebSocketMessageType.Delete),
+            ):
+                websocket.send_json({"userid": str(userid), "message": message.value, "payload": payload})
+                assert websocket.receive_json()["message"] == expected
+
+        poller = BackgroundPoller(engine=engine, model_name="query-plans")
+        with sqlmodel.Session(engine) as session:
+            get_waiting_jobs(session)
+            assert asyncio.run(poller.process_outstanding_analyses(session)) is None
+            found: List[Jobs] = []
+            poller.process_prompt = lambda job, session: found.append(job)  # type: ignore[method-assign]
+            poller.process_outstanding_prompts(session)
+            assert found
+            backgroundjob = BackgroundJob.from_jobs(found[0])
+            poller.add_related_jobs(session, backgroundjob)
+        startup_check_outstanding_jobs(engine)
+
+        assert (
+            client.post(
+                Urls.Analyse,
+                json={
+                    "jobid": str(jobid),
+                    "userid": str(userid),
+                    "analysis_type": AnalysisType.Prompt.value,
+                    "preprompt": "Analyse this",
+                },
+            ).status_code
+            == 200
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_query_plans(large_engine: Engine, monkeypatch: pytest.MonkeyPatch) -> None:
+    """every query the app makes uses an index, and none of them blow the time budget if there is one"""
+    monkeypatch.setattr(config, "config_cache", ConfigCache())
+    monkeypatch.setenv("CHATUI_ADMIN_PASSWORD", ADMIN_PASSWORD)
+    userid, sessionid, jobid = busiest_session(large_engine)
+
+    recorder = QueryRecorder(large_engine)
+    with recorder.recording():
+        run_everything(large_engine, userid, sessionid, jobid)
+    recorder.explain()
+    assert len(recorder.queries) > 20
+
+    problems = []
+    for query in recorder.queries:
+        scans = table_scans(query.plan)
+        if scans:
+            problems.append(f"{scans} in {query.statement}")
+        if QUERY_BUDGET and query.seconds > QUERY_BUDGET:
+            problems.append(f"{query.seconds:.3f}s for {query.statement} ({query.plan})")
+    assert not problems, "\n".join(problems)
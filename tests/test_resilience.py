@@ -0,0 +1,291 @@
+import asyncio
+from pathlib import Path
+import random
+import time
+from typing import Any, Awaitable, Callable, List
+from uuid import uuid4
+
+import httpx
+import openai
+import pytest
+import sqlmodel
+
+from chat_ui import config
+from chat_ui.backgroundpoller import BackgroundPoller
+from chat_ui.config import ConfigCache
+from chat_ui.db import JobAnalysis, Jobs
+from chat_ui.fakebackend import FakeBackendServer, FakeBackendSettings
+from chat_ui.models import AnalysisType, JobStatus, RequestType
+from chat_ui.resilience import (
+    BackendResilience,
+    BackendUnavailable,
+    CircuitBreaker,
+    CircuitState,
+    RetryPolicy,
+    is_transient,
+)
+
+REQUEST: Any = httpx.Request("POST", "http://backend/v1/chat/completions")
+
+
+def api_error(status_code: int) -> openai.APIStatusError:
+    response: Any = httpx.Response(status_code, request=REQUEST)
+    error_class = {400: openai.BadRequestError, 429: openai.RateLimitError, 500: openai.InternalServerError}
+    return error_class[status_code]("failed", response=response, body=None)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_retry_policy() -> None:
+    """the backoff doubles up to the cap, and the jitter keeps it under that"""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    rng = random.Random(48)
+    for retry, cap in ((0, 1.0), (1, 2.0), (2, 4.0), (5, 5.0)):
+        delays = [policy.delay(retry, rng) for _ in range(50)]
+        assert all(0 <= delay <= cap for delay in delays)
+        assert max(delays) > cap / 2
+
+
+def test_is_transient() -> None:
+    assert is_transient(openai.APIConnectionError(request=REQUEST))
+    assert is_transient(openai.APITimeoutError(request=REQUEST))
+    assert is_transient(api_error(429))
+    assert is_transient(api_error(500))
+    assert is_transient(httpx.ConnectError("refused"))
+    assert is_transient(BackendUnavailable())
+    assert not is_transient(api_error(400))
+    assert not is_transient(ValueError("bad prompt"))
+
+
+def test_circuit_breaker() -> None:
+    """opens after the threshold, waits out the reset timeout, then one failure opens it again"""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.failures == 0
+
+    for _ in range(3):
+        breaker.record_failure()
+    assert not breaker.allow_request()
+    clock.now = 10
+    assert breaker.allow_request()
+    assert breaker.state == CircuitState.HalfOpen
+    # half-open only needs the one failure
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    clock.now = 20
+    assert breaker.allow_request()
+    breaker.record_success()
+    clock.now = 21
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.allow_request()
+
+
+def test_backend_resilience() -> None:
+    """transient errors are retried, others aren't, and an open circuit doesn't call the backend at all"""
+    clock = FakeClock()
+    probes: List[bool] = []
+
+    def probe() -> None:
+        probes.append(True)
+        if len(probes) == 1:
+            raise httpx.ConnectError("still down")
+
+    resilience = BackendResilience(
+        policy=RetryPolicy(attempts=3, base_delay=0),
+        breaker=CircuitBreaker(failure_threshold=4, reset_timeout=10, clock=clock),
+        probe=probe,
+    )
+    calls: List[int] = []
+
+    def failing(errors: List[Exception]) -> Callable[[], Awaitable[str]]:
+        async def call() -> str:
+            calls.append(1)
+            if errors:
+                raise errors.pop(0)
+            return "ok"
+
+        return call
+
+    assert asyncio.run(resilience.call(failing([api_error(500), api_error(429)]))) == "ok"
+    assert len(calls) == 3
+    assert resilience.breaker.failures == 0
+
+    calls.clear()
+    with pytest.raises(openai.BadRequestError):
+        asyncio.run(resilience.call(failing([api_error(400)])))
+    assert len(calls) == 1
+
+    # three failures uses up the attempts, the fourth opens the circuit part way through the next call
+    calls.clear()
+    with pytest.raises(openai.InternalServerError):
+        asyncio.run(resilience.call(failing([api_error(500)] * 3)))
+    with pytest.raises(openai.InternalServerError):
+        asyncio.run(resilience.call(failing([api_error(500)] * 3)))
+    assert len(calls) == 4
+    assert resilience.breaker.state == CircuitState.Open
+    with pytest.raises(BackendUnavailable):
+        asyncio.run(resilience.call(failing([])))
+    assert not resilience.ready()
+    assert probes == []
+
+    # the first probe fails and it opens again, the second gets it going
+    clock.now = 10
+    assert not resilience.ready()
+    assert resilience.breaker.state == CircuitState.Open
+    clock.now = 20
+    assert resilience.ready()
+    assert len(probes) == 2
+    assert resilience.breaker.failures == 0
+
+
+def test_poller_waits_out_backend_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """a job that hits a failing backend goes back in the queue, and runs once the backend's back"""
+    engine = sqlmodel.create_engine(f"sqlite:///{tmp_path / 'resilience.sqlite3'}")
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    job = Jobs(
+        userid=uuid4(),
+        sessionid=uuid4(),
+        client_ip="127.0.0.1",
+        prompt="Hello world",
+        request_type=RequestType.Plain,
+    )
+    job_id = job.id
+    with sqlmodel.Session(engine) as session:
+        session.add(job)
+        session.commit()
+
+    with FakeBackendServer(FakeBackendSettings(time_to_first_token=0, tokens_per_second=0, error_rate=1.0)) as server:
+        monkeypatch.setattr(config, "config_cache", ConfigCache())
+        monkeypatch.setenv("CHATUI_BACKEND_URL", server.base_url)
+        monkeypatch.setenv("CHATUI_BACKEND_RETRY_BASE_DELAY", "0")
+        monkeypatch.setenv("CHATUI_BACKEND_CIRCUIT_FAILURE_THRESHOLD", "2")
+        monkeypatch.setenv("CHATUI_BACKEND_CIRCUIT_RESET_TIMEOUT", "60")
+        poller = BackgroundPoller(engine, "fake-model")
+
+        with sqlmodel.Session(engine) as session:
+            poller.process_outstanding_prompts(session)
+        assert server.backend.stats.errors == 2
+        assert poller.pool.backends[0].resilience.breaker.state == CircuitState.Open
+        with sqlmodel.Session(engine) as session:
+            requeued = session.get_one(Jobs, job_id)
+            assert requeued.status == JobStatus.Created
+            assert requeued.claimed_by is None
+
+        # the circuit's open, so it doesn't even try
+        with sqlmodel.Session(engine) as session:
+            poller.process_outstanding_prompts(session)
+        assert server.backend.stats.requests == 2
+
+        # a minute later it's back, and the probe finds that out
+        server.backend.settings.error_rate = 0.0
+        poller.pool.backends[0].resilience.breaker.opened_at -= 60
+        with sqlmodel.Session(engine) as session:
+            poller.process_outstanding_prompts(session)
+        assert poller.pool.backends[0].resilience.breaker.failures == 0
+        with sqlmodel.Session(engine) as session:
+            finished = session.get_one(Jobs, job_id)
+            assert finished.status == JobStatus.Complete
+            assert finished.attempts == 2
+
+
+def test_poller_gives_up_on_failing_jobs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """a job that keeps hitting backend errors is set to error after job_max_attempts tries, and so's its analysis"""
+    engine = sqlmodel.create_engine(f"sqlite:///{tmp_path / 'failing.sqlite3'}")
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    job = Jobs(
+        userid=uuid4(),
+        sessionid=uuid4(),
+        client_ip="127.0.0.1",
+        prompt="Hello world",
+        request_type=RequestType.Plain,
+    )
+    analysis = JobAnalysis(jobid=job.id, userid=job.userid, preprompt="check this", analysis_type=AnalysisType.Prompt)
+    job_id, analysis_id = job.id, analysis.analysisid
+    with sqlmodel.Session(engine) as session:
+        session.add(job)
+        session.add(analysis)
+        session.commit()
+
+    with FakeBackendServer(FakeBackendSettings(time_to_first_token=0, tokens_per_second=0, error_rate=1.0)) as server:
+        monkeypatch.setattr(config, "config_cache", ConfigCache())
+        monkeypatch.setenv("CHATUI_BACKEND_URL", server.base_url)
+        monkeypatch.setenv("CHATUI_BACKEND_RETRY_BASE_DELAY", "0")
+        # keep the circuit closed so it's the attempts that stop it
+        monkeypatch.setenv("CHATUI_BACKEND_CIRCUIT_FAILURE_THRESHOLD", "1000")
+        monkeypatch.setenv("CHATUI_JOB_MAX_ATTEMPTS", "3")
+        poller = BackgroundPoller(engine, "fake-model")
+
+        for _ in range(5):
+            with sqlmodel.Session(engine) as session:
+                poller.process_outstanding_prompts(session)
+                poller.event_loop.run_until_complete(poller.process_outstanding_analyses(session))
+
+    with sqlmodel.Session(engine) as session:
+        failed = session.get_one(Jobs, job_id)
+        assert failed.status == JobStatus.Error
+        assert failed.attempts == 3
+        assert failed.response == "This failed 3 times, please try this again"
+        failed_analysis = session.get_one(JobAnalysis, analysis_id)
+        assert failed_analysis.status == JobStatus.Error
+        assert failed_analysis.attempts == 3
+
+
+def test_poller_requeues_only_the_failing_job(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """a backend error on one job doesn't requeue the ones running alongside it under the same poller"""
+    engine = sqlmodel.create_engine(
+        f"sqlite:///{tmp_path / 'alongside.sqlite3'}", connect_args={"check_same_thread": False}
+    )
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    jobs = [
+        Jobs(
+            userid=uuid4(),
+            sessionid=uuid4(),
+            client_ip="127.0.0.1",
+            prompt="Hello world",
+            request_type=RequestType.Plain,
+        )
+        for _ in range(2)
+    ]
+    running_id, failing_id = (job.id for job in jobs)
+
+    with FakeBackendServer(FakeBackendSettings(time_to_first_token=1.0, tokens_per_second=0)) as server:
+        monkeypatch.setattr(config, "config_cache", ConfigCache())
+        monkeypatch.setenv("CHATUI_BACKEND_URL", server.base_url)
+        monkeypatch.setenv("CHATUI_BACKEND_MAX_CONCURRENCY", "2")
+        monkeypatch.setenv("CHATUI_BACKEND_RETRY_BASE_DELAY", "0")
+        monkeypatch.setenv("CHATUI_BACKEND_CIRCUIT_FAILURE_THRESHOLD", "1000")
+        poller = BackgroundPoller(engine, "fake-model")
+
+        # the first one's got past the error roll before the backend starts failing
+        with sqlmodel.Session(engine) as session:
+            session.add(jobs[0])
+            session.commit()
+            poller.process_outstanding_prompts(session, wait=False)
+        deadline = time.monotonic() + 10
+        while server.backend.stats.in_flight == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        server.backend.settings.error_rate = 1.0
+        with sqlmodel.Session(engine) as session:
+            session.add(jobs[1])
+            session.commit()
+            poller.process_outstanding_prompts(session)
+
+    with sqlmodel.Session(engine) as session:
+        running = session.get_one(Jobs, running_id)
+        assert running.status == JobStatus.Complete
+        assert running.attempts == 1
+        assert running.response
+        failing = session.get_one(Jobs, failing_id)
+        assert failing.status == JobStatus.Created
+        assert (failing.attempts, failing.claimed_by) == (1, None)
@@ -1,7 +1,17 @@
+import base64
+import hashlib
 import os
+from pathlib import Path
+import re
 from fastapi.testclient import TestClient
-from chat_ui import app
+from chat_ui import app, staticassets
 from chat_ui.enums import Urls
+from chat_ui.statics import (
+    HAS_BROTLI,
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    StaticAsset,
+)
 
 
 def file_test(dir: str) -> None:
@@ -29,3 +39,80 @@ def test_img() -> None:
 def test_js() -> None:
     """test pulling a file from the /js directory"""
     file_test("js")
+
+
+def test_static_caching() -> None:
+    """assets come precompressed, with ETags and versioned URLs"""
+    client = TestClient(app)
+
+    res = client.get("/js/chatui.js", headers={"accept-encoding": "gzip"})
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    assert res.content == Path("chat_ui/js/chatui.js").read_bytes()
+    etag = res.headers["etag"]
+
+    res = client.get("/js/chatui.js", headers={"accept-encoding": "gzip", "if-none-match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+
+    # no compression if they don't want it
+    res = client.get("/js/chatui.js", headers={"accept-encoding": "identity"})
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "identity"
+    assert res.headers["etag"] != etag
+
+    # the page points at the versioned URLs, and they're cached forever
+    res = client.get("/")
+    assert res.status_code == 200
+    assert "etag" in res.headers
+    versioned_url = staticassets.versioned_url("/js/chatui.js")
+    assert versioned_url in res.text
+    assert "/js/vue.global.prod.js?v=" in res.text
+    res = client.get(versioned_url)
+    assert res.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    # an old version isn't
+    res = client.get("/js/chatui.js?v=123456789012")
+    assert res.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+
+def test_static_asset_encodings() -> None:
+    """things that don't compress well are only kept as-is"""
+    asset = StaticAsset(os.urandom(2048), "application/octet-stream")
+    assert asset.variants == {}
+    assert asset.pick_encoding("gzip, br") is None
+
+    asset = StaticAsset(b"hello world " * 1000, "text/plain")
+    assert "gzip" in asset.variants
+    assert asset.pick_encoding("gzip;q=0") is None
+    assert asset.pick_encoding("deflate, gzip") == "gzip"
+    if HAS_BROTLI:
+        assert asset.pick_encoding("gzip, br") == "br"
+
+
+def test_index_integrity() -> None:
+    """the subresource integrity hashes of our own assets match the files, or the browser won't load them"""
+    index = Path("chat_ui/html/index.html").read_text(encoding="utf-8")
+    checked = 0
+    for tag in re.findall(r"<(?:script|link)\b[^>]*>", index):
+        integrity = re.search(r'integrity="(sha\d+)-([^"]+)"', tag)
+        path = re.search(r'(?:src|href)="(/[^"?]+)', tag)
+        if integrity is None or path is None:
+            continue
+        algorithm, expected = integrity.groups()
+        content = Path(f"chat_ui{path.group(1)}").read_bytes()
+        assert base64.b64encode(hashlib.new(algorithm, content).digest()).decode() == expected, path.group(1)
+        checked += 1
+    assert checked
+
+
+
+def test_vue_builds_match() -> None:
+    """the dev build's for debugging what production runs, so they have to be the same release"""
+    versions = set()
+    for build in ("vue.global.js", "vue.global.prod.js"):
+        banner = Path(f"chat_ui/js/{build}").read_text(encoding="utf-8")[:100]
+        version = re.search(r"vue v(\S+)", banner)
+        assert version is not None, build
+        versions.add(version.group(1))
+    assert len(versions) == 1
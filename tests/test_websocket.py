@@ -2,13 +2,20 @@ from datetime import UTC, datetime
 import json
 from uuid import uuid4
 from fastapi.testclient import TestClient
+import msgpack  # type: ignore
 import pytest
 import sqlmodel
 from chat_ui.db import ChatUiDBSession
 from chat_ui.enums import Urls
 from chat_ui.forms import NewJobForm
 
-from chat_ui.models import RequestType, WebSocketMessage, WebSocketMessageType
+from chat_ui.models import (
+    RequestType,
+    WebSocketMessage,
+    WebSocketMessageType,
+    WebSocketProtocol,
+    msgpack_ext_hook,
+)
 
 from . import get_test_session  # noqa: E402,F401
 from chat_ui import app, get_session
@@ -77,3 +84,137 @@ async def test_websocket_jobs(session: sqlmodel.Session) -> None:
     assert jobs.message == WebSocketMessageType.Jobs
     assert isinstance(jobs.payload, list)
     assert len(jobs.payload) == 0
+
+
+def test_websocket_protocol_negotiation(session: sqlmodel.Session) -> None:
+    """test the JSON and msgpack encodings of the websocket"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+
+    client = TestClient(app)
+    userid = uuid4()
+
+    res = client.post(Urls.User, json={"userid": userid.hex, "name": "testuser"})
+    assert res.status_code == 200
+    res = client.post(f"/session/new/{userid}")
+    assert res.status_code == 200
+    sessionid = ChatUiDBSession.model_validate(res.json()).sessionid
+    res = client.post(
+        Urls.Job,
+        json=NewJobForm(
+            userid=userid,
+            sessionid=sessionid,
+            prompt="hello world",
+            request_type=RequestType.Plain,
+        ).model_dump(mode="json"),
+    )
+    assert res.status_code == 200
+
+    request = {
+        "userid": userid.hex,
+        "message": WebSocketMessageType.Jobs.value,
+        "payload": json.dumps({"sessionid": sessionid.hex}),
+    }
+
+    # no subprotocol asked for, so it's plain JSON
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_json(request)
+        response = websocket.receive_json()
+        assert response["message"] == WebSocketMessageType.Jobs
+        assert response["payload"][0]["sessionid"] == str(sessionid)
+
+    with client.websocket_connect(
+        "/ws", subprotocols=["something-else", WebSocketProtocol.MsgPack.value]
+    ) as websocket:
+        assert websocket.accepted_subprotocol == WebSocketProtocol.MsgPack
+        # requests can be sent as either encoding
+        for _ in range(2):
+            websocket.send_bytes(msgpack.packb(request))
+            frame = websocket.receive_bytes()
+            response = msgpack.unpackb(frame, ext_hook=msgpack_ext_hook, timestamp=3)
+            assert response["message"] == WebSocketMessageType.Jobs
+            assert response["payload"][0]["sessionid"] == sessionid
+            assert response["payload"][0]["created"].tzinfo is not None
+            websocket.send_json(request)
+            assert websocket.receive_bytes() == frame
+
+
+def test_websocket_batch(session: sqlmodel.Session) -> None:
+    """test sending multiple operations in one message"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+
+    client = TestClient(app)
+    userid = uuid4()
+
+    res = client.post(Urls.User, json={"userid": userid.hex, "name": "testuser"})
+    assert res.status_code == 200
+    res = client.post(f"/session/new/{userid}")
+    assert res.status_code == 200
+    sessionid = ChatUiDBSession.model_validate(res.json()).sessionid
+    res = client.post(
+        Urls.Job,
+        json=NewJobForm(
+            userid=userid,
+            sessionid=sessionid,
+            prompt="hello world",
+            request_type=RequestType.Plain,
+        ).model_dump(mode="json"),
+    )
+    assert res.status_code == 200
+    job_id = res.json()["id"]
+
+    operations = [
+        {
+            "message": WebSocketMessageType.Jobs.value,
+            "payload": json.dumps({"sessionid": sessionid.hex}),
+        },
+        {"message": WebSocketMessageType.Waiting.value},
+        {"message": WebSocketMessageType.Delete.value, "payload": job_id},
+        {"message": WebSocketMessageType.Batch.value, "payload": "[]"},
+        {
+            "message": WebSocketMessageType.Jobs.value,
+            "payload": json.dumps({"sessionid": sessionid.hex}),
+        },
+    ]
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_json(
+            {
+                "userid": userid.hex,
+                "message": WebSocketMessageType.Batch.value,
+                "payload": json.dumps(operations),
+            }
+        )
+        response = websocket.receive_json()
+        assert response["message"] == WebSocketMessageType.Batch
+        assert [item["message"] for item in response["payload"]] == [
+            WebSocketMessageType.Jobs,
+            WebSocketMessageType.Waiting,
+            WebSocketMessageType.Delete,
+            WebSocketMessageType.Error,
+            WebSocketMessageType.Jobs,
+        ]
+        assert len(response["payload"][0]["payload"]) == 1
+        assert response["payload"][2]["payload"]["status"] == "hidden"
+        # the delete is visible to the later operations in the same batch
+        assert response["payload"][4]["payload"] == []
+
+        websocket.send_json(
+            {
+                "userid": userid.hex,
+                "message": WebSocketMessageType.Batch.value,
+                "payload": json.dumps([{"message": "jobs"}] * 100),
+            }
+        )
+        response = websocket.receive_json()
+        assert response["message"] == WebSocketMessageType.Error
+
+    # and the delete was committed
+    res = client.get(f"{Urls.Jobs}/{userid}/{job_id}")
+    assert res.json()["status"] == "hidden"
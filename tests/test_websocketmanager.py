@@ -0,0 +1,163 @@
+import asyncio
+import json
+import os
+from typing import Any, Generator, List
+from uuid import UUID, uuid4
+
+from fastapi.testclient import TestClient
+from fastapi.websockets import WebSocketDisconnect
+import pytest
+import sqlmodel
+
+from chat_ui import app, get_session, websocketmanager
+from chat_ui.enums import Urls
+from chat_ui.models import WebSocketMessageType, WebSocketResponse, WebSocketStats
+from chat_ui.websocketmanager import WebSocketConnection
+
+from . import get_test_session  # noqa: E402,F401
+
+
+@pytest.fixture(name="client")
+def get_test_client(session: sqlmodel.Session) -> Generator[TestClient, None, None]:
+    """a client with the websocket limits restored afterwards"""
+
+    def get_session_override() -> sqlmodel.Session:
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    limits = (
+        websocketmanager.max_connections,
+        websocketmanager.max_per_user,
+        websocketmanager.heartbeat_interval,
+        websocketmanager.idle_timeout,
+    )
+    yield TestClient(app)
+    (
+        websocketmanager.max_connections,
+        websocketmanager.max_per_user,
+        websocketmanager.heartbeat_interval,
+        websocketmanager.idle_timeout,
+    ) = limits
+
+
+def waiting_message(userid: str) -> dict[str, str]:
+    return {"userid": userid, "message": WebSocketMessageType.Waiting.value}
+
+
+def test_websocket_per_user_limit(client: TestClient) -> None:
+    """a user can't open more than max_per_user sockets"""
+    websocketmanager.max_per_user = 1
+    userid = uuid4().hex
+
+    with client.websocket_connect("/ws") as first:
+        first.send_json(waiting_message(userid))
+        assert first.receive_json()["message"] == WebSocketMessageType.Waiting
+        assert websocketmanager.stats().per_user == {UUID(userid): 1}
+
+        with client.websocket_connect("/ws") as second:
+            second.send_json(waiting_message(userid))
+            assert second.receive_json()["message"] == WebSocketMessageType.Error
+            with pytest.raises(WebSocketDisconnect):
+                second.receive_json()
+
+        # someone else is fine
+        with client.websocket_connect("/ws") as other:
+            other.send_json(waiting_message(uuid4().hex))
+            assert other.receive_json()["message"] == WebSocketMessageType.Waiting
+
+    assert websocketmanager.stats().connections == 0
+
+
+def test_websocket_global_limit(client: TestClient) -> None:
+    """connections past max_connections are refused"""
+    websocketmanager.max_connections = 1
+
+    with client.websocket_connect("/ws") as first:
+        first.send_json(waiting_message(uuid4().hex))
+        assert first.receive_json()["message"] == WebSocketMessageType.Waiting
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/ws"):
+                pass
+
+
+def test_websocket_heartbeat_eviction(client: TestClient) -> None:
+    """clients get pinged, and dropped if they don't answer"""
+    websocketmanager.heartbeat_interval = 0.05
+    websocketmanager.idle_timeout = 0.3
+    userid = uuid4().hex
+
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_json(waiting_message(userid))
+        assert websocket.receive_json()["message"] == WebSocketMessageType.Waiting
+
+        # answering the pings keeps us around
+        for _ in range(8):
+            ping = websocket.receive_json()
+            assert ping["message"] == WebSocketMessageType.Ping
+            websocket.send_json({"userid": userid, "message": WebSocketMessageType.Pong.value})
+
+        # and stopping gets us dropped
+        with pytest.raises(WebSocketDisconnect):
+            while True:
+                assert websocket.receive_json()["message"] == WebSocketMessageType.Ping
+
+    assert websocketmanager.stats().connections == 0
+
+
+def test_admin_websockets(client: TestClient) -> None:
+    """the admin endpoint shows the live counts"""
+    temp_admin_password = os.getenv("CHATUI_ADMIN_PASSWORD") or "admin12345"
+    os.environ["CHATUI_ADMIN_PASSWORD"] = temp_admin_password
+
+    response = client.get(Urls.AdminWebsockets, headers={"admin-password": uuid4().hex})
+    assert response.status_code == 403
+
+    userid = uuid4()
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_text(json.dumps(waiting_message(userid.hex)))
+        websocket.receive_json()
+        response = client.get(
+            Urls.AdminWebsockets, headers={"admin-password": temp_admin_password}
+        )
+        assert response.status_code == 200
+        stats = WebSocketStats.model_validate(response.json())
+        assert stats.connections == 1
+        assert stats.per_user == {userid: 1}
+
+
+class SlowWebSocket:
+    """a websocket that notices if a second send starts before the first one's finished"""
+
+    client = None
+
+    def __init__(self) -> None:
+        self.sending = 0
+        self.overlapped = False
+        self.sent: List[str] = []
+
+    async def send_text(self, text: str) -> None:
+        self.sending += 1
+        self.overlapped = self.overlapped or self.sending > 1
+        await asyncio.sleep(0.01)
+        self.sent.append(text)
+        self.sending -= 1
+
+
+def test_websocket_sends_serialized() -> None:
+    """the heartbeat's pings and the endpoint's responses go out one at a time"""
+
+    async def send_all() -> SlowWebSocket:
+        websocket = SlowWebSocket()
+        websocket_any: Any = websocket
+        connection = WebSocketConnection(websocket_any, None)
+        await asyncio.gather(
+            *(
+                connection.send(WebSocketResponse(message=WebSocketMessageType.Ping.value, payload=number))
+                for number in range(5)
+            )
+        )
+        return websocket
+
+    websocket = asyncio.run(send_all())
+    assert len(websocket.sent) == 5
+    assert not websocket.overlapped
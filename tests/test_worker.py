@@ -0,0 +1,250 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+import time
+from uuid import uuid4
+
+from click.testing import CliRunner
+import pytest
+import sqlmodel
+
+from chat_ui import config
+from chat_ui.__main__ import main
+from chat_ui.config import ConfigCache
+from chat_ui.db import JobAnalysis, Jobs, requeue_jobs
+from chat_ui.fakebackend import FakeBackendServer, FakeBackendSettings
+from chat_ui.models import AnalysisType, JobStatus, RequestType, WebSocketMessage, WebSocketMessageType
+from chat_ui.websocket_handlers import websocket_resubmit
+from chat_ui.worker import start_worker, stop_worker
+
+
+def make_job(status: JobStatus = JobStatus.Created) -> Jobs:
+    return Jobs(
+        userid=uuid4(),
+        sessionid=uuid4(),
+        client_ip="127.0.0.1",
+        prompt="Hello world",
+        request_type=RequestType.Plain,
+        status=status.value,
+    )
+
+
+def test_claim(tmp_path: Path) -> None:
+    """only one poller gets to run each job"""
+    engine = sqlmodel.create_engine(f"sqlite:///{tmp_path / 'claim.sqlite3'}")
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    job = make_job()
+    analysis = JobAnalysis(jobid=job.id, userid=job.userid, preprompt="check this", analysis_type=AnalysisType.Prompt)
+    job_id, analysis_id = job.id, analysis.analysisid
+    with sqlmodel.Session(engine) as session:
+        session.add(job)
+        session.add(analysis)
+        session.commit()
+
+    with sqlmodel.Session(engine) as first, sqlmodel.Session(engine) as second:
+        first_job = first.get_one(Jobs, job_id)
+        second_job = second.get_one(Jobs, job_id)
+        assert first_job.claim(first, "first", 60)
+        assert first_job.status == JobStatus.Running
+        assert (first_job.attempts, first_job.claimed_by) == (1, "first")
+        assert not second_job.claim(second, "second", 60)
+        assert second_job.status == JobStatus.Running
+        assert second_job.claimed_by == "first"
+
+        first_analysis = first.get_one(JobAnalysis, analysis_id)
+        second_analysis = second.get_one(JobAnalysis, analysis_id)
+        assert first_analysis.claim(first)
+        assert not second_analysis.claim(second)
+        assert second_analysis.status == JobStatus.Running
+
+
+def test_requeue_jobs(tmp_path: Path) -> None:
+    """running jobs go back in the queue, and the poller that lost one can't save over it"""
+    engine = sqlmodel.create_engine(f"sqlite:///{tmp_path / 'requeue.sqlite3'}")
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    job = make_job()
+    job_id = job.id
+    with sqlmodel.Session(engine) as session:
+        assert job.claim(session, "first", 60)
+        # it's not expired, so only asking for the owner's jobs gets it back
+        assert requeue_jobs(session, max_attempts=3) == 0
+        assert requeue_jobs(session, owner="second") == 0
+        assert requeue_jobs(session, owner="first") == 1
+
+    with sqlmodel.Session(engine) as first, sqlmodel.Session(engine) as second:
+        first_job = first.get_one(Jobs, job_id)
+        assert first_job.status == JobStatus.Created
+        assert first_job.claimed_by is None
+        assert first_job.claim(first, "first", 60)
+        assert first_job.attempts == 2
+        assert requeue_jobs(second, owner="first") == 1
+        assert second.get_one(Jobs, job_id).claim(second, "second", 60)
+
+        first_job.status = JobStatus.Complete.value
+        first_job.response = "too late"
+        assert not first_job.hold_claim(first, "first")
+        assert first.get_one(Jobs, job_id).status == JobStatus.Running
+
+        second_job = second.get_one(Jobs, job_id)
+        assert second_job.hold_claim(second, "second")
+        second_job.status = JobStatus.Complete.value
+        second.add(second_job)
+        second.commit()
+        assert (second_job.attempts, second_job.claimed_by, second_job.lease_expires) == (3, None, None)
+
+
+def test_renew_lease(tmp_path: Path) -> None:
+    """only the poller holding a job can push its lease out"""
+    engine = sqlmodel.create_engine(f"sqlite:///{tmp_path / 'renew.sqlite3'}")
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    job = make_job()
+    job_id = job.id
+    with sqlmodel.Session(engine) as session:
+        assert job.claim(session, "first", 1)
+        assert not job.renew_lease(session, "second", 60)
+        assert job.renew_lease(session, "first", 60)
+    with sqlmodel.Session(engine) as session:
+        renewed = session.get_one(Jobs, job_id)
+        assert renewed.lease_expires is not None
+        assert renewed.lease_expires.replace(tzinfo=UTC) > datetime.now(UTC) + timedelta(seconds=30)
+        # so it's not abandoned yet
+        assert requeue_jobs(session) == 0
+
+
+@pytest.mark.asyncio()
+async def test_resubmit_resets_claim(tmp_path: Path) -> None:
+    """a resubmitted job gets all its attempts back"""
+    engine = sqlmodel.create_engine(f"sqlite:///{tmp_path / 'resubmit.sqlite3'}")
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    job = make_job(JobStatus.Error)
+    job.attempts = 3
+    job.claimed_by = "gone"
+    job.lease_expires = datetime.now(UTC)
+    job_id, userid = job.id, job.userid
+    with sqlmodel.Session(engine) as session:
+        session.add(job)
+        session.commit()
+        data = WebSocketMessage(userid=userid, message=WebSocketMessageType.Resubmit, payload=job_id.hex)
+        response = await websocket_resubmit(data, session, None)  # type: ignore
+        assert response.message == WebSocketMessageType.Resubmit
+    with sqlmodel.Session(engine) as session:
+        resubmitted = session.get_one(Jobs, job_id)
+        assert resubmitted.status == JobStatus.Created
+        assert (resubmitted.attempts, resubmitted.claimed_by, resubmitted.lease_expires) == (None, None, None)
+
+
+def test_worker(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """a worker runs the jobs on its own, and requeues the ones a previous worker left running"""
+    engine = sqlmodel.create_engine(
+        f"sqlite:///{tmp_path / 'worker.sqlite3'}", connect_args={"check_same_thread": False}
+    )
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    waiting = make_job()
+    abandoned = make_job(JobStatus.Running)
+    # another worker's still on this one
+    held = make_job(JobStatus.Running)
+    held.claimed_by = "elsewhere"
+    held.lease_expires = datetime.now(UTC) + timedelta(minutes=5)
+    # and this one's killed too many workers already
+    poisoned = make_job(JobStatus.Running)
+    poisoned.attempts = 3
+    job_ids = [job.id for job in (waiting, abandoned, held, poisoned)]
+    with sqlmodel.Session(engine) as session:
+        session.add_all([waiting, abandoned, held, poisoned])
+        session.commit()
+
+    with FakeBackendServer(FakeBackendSettings(time_to_first_token=0, tokens_per_second=0)) as server:
+        monkeypatch.setattr(config, "config_cache", ConfigCache())
+        monkeypatch.setenv("CHATUI_BACKEND_URL", server.base_url)
+        poller = start_worker(engine, "fake-model")
+        try:
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                with sqlmodel.Session(engine) as session:
+                    if all(session.get_one(Jobs, job_id).status == JobStatus.Complete for job_id in job_ids[:2]):
+                        break
+                time.sleep(0.05)
+        finally:
+            stop_worker(poller)
+    assert not poller.is_alive()
+
+    with sqlmodel.Session(engine) as session:
+        waiting, abandoned, held, poisoned = (session.get_one(Jobs, job_id) for job_id in job_ids)
+        assert waiting.status == JobStatus.Complete
+        assert waiting.attempts == 1
+        assert abandoned.status == JobStatus.Complete
+        assert held.status == JobStatus.Running
+        assert poisoned.status == JobStatus.Error
+
+
+def test_worker_drain(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """a job that doesn't finish before the drain timeout is requeued, and the late result's thrown away"""
+    engine = sqlmodel.create_engine(
+        f"sqlite:///{tmp_path / 'drain.sqlite3'}", connect_args={"check_same_thread": False}
+    )
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    job = make_job()
+    job_id = job.id
+    with sqlmodel.Session(engine) as session:
+        session.add(job)
+        session.commit()
+
+    with FakeBackendServer(FakeBackendSettings(time_to_first_token=1.0)) as server:
+        monkeypatch.setattr(config, "config_cache", ConfigCache())
+        monkeypatch.setenv("CHATUI_BACKEND_URL", server.base_url)
+        poller = start_worker(engine, "fake-model")
+        deadline = time.monotonic() + 10
+        while server.backend.stats.in_flight == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stop_worker(poller, timeout=0.1)
+        with sqlmodel.Session(engine) as session:
+            requeued = session.get_one(Jobs, job_id)
+            assert requeued.status == JobStatus.Created
+            assert (requeued.attempts, requeued.claimed_by) == (1, None)
+        # it's still going, but it won't pick up anything else or save what it finishes
+        poller.join(10)
+        assert not poller.is_alive()
+        assert server.backend.stats.completions == 1
+
+    with sqlmodel.Session(engine) as session:
+        assert session.get_one(Jobs, job_id).status == JobStatus.Created
+
+
+def test_worker_lease_renewal(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """a job that runs longer than the lease isn't taken back off the worker that's running it"""
+    engine = sqlmodel.create_engine(
+        f"sqlite:///{tmp_path / 'lease.sqlite3'}", connect_args={"check_same_thread": False}
+    )
+    sqlmodel.SQLModel.metadata.create_all(engine)
+    job = make_job()
+    job_id = job.id
+    with sqlmodel.Session(engine) as session:
+        session.add(job)
+        session.commit()
+
+    with FakeBackendServer(FakeBackendSettings(time_to_first_token=1.5)) as server:
+        monkeypatch.setattr(config, "config_cache", ConfigCache())
+        monkeypatch.setenv("CHATUI_BACKEND_URL", server.base_url)
+        monkeypatch.setenv("CHATUI_JOB_LEASE_TIMEOUT", "0.3")
+        monkeypatch.setenv("CHATUI_JOB_LEASE_CHECK_INTERVAL", "0.05")
+        poller = start_worker(engine, "fake-model")
+        try:
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                with sqlmodel.Session(engine) as session:
+                    if session.get_one(Jobs, job_id).status == JobStatus.Complete:
+                        break
+                time.sleep(0.05)
+        finally:
+            stop_worker(poller)
+        assert server.backend.stats.completions == 1
+
+    with sqlmodel.Session(engine) as session:
+        finished = session.get_one(Jobs, job_id)
+        assert finished.status == JobStatus.Complete
+        assert finished.attempts == 1
+
+
+def test_worker_command() -> None:
+    result = CliRunner().invoke(main, ["--help"])
+    assert result.exit_code == 0
+    assert "worker" in result.output